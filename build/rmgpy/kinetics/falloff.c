@@ -0,0 +1,16538 @@
+/* Generated by Cython 0.29.37 */
+
+/* BEGIN: Cython Metadata
+{
+    "distutils": {
+        "depends": [],
+        "name": "rmgpy.kinetics.falloff",
+        "sources": [
+            "rmgpy/kinetics/falloff.pyx"
+        ]
+    },
+    "module_name": "rmgpy.kinetics.falloff"
+}
+END: Cython Metadata */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.6+ or Python 3.3+.
+#else
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
+#define CYTHON_FUTURE_DIVISION 1
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #if PY_VERSION_HEX >= 0x02070000
+    #define HAVE_LONG_LONG
+  #endif
+#endif
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#ifdef PYPY_VERSION
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PYSTON_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #elif !defined(CYTHON_USE_PYTYPE_LOOKUP)
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
+  #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+#endif
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_MAYBE_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_MAYBE_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+           typedef unsigned char     uint8_t;
+           typedef unsigned int      uint32_t;
+        #else
+           typedef unsigned __int8   uint8_t;
+           typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
+#else
+   #include <stdint.h>
+#endif
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus) && __cplusplus >= 201103L
+    #if __has_cpp_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH [[fallthrough]]
+    #elif __has_cpp_attribute(clang::fallthrough)
+      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+    #elif __has_cpp_attribute(gnu::fallthrough)
+      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__ ) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyClass_Type
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+  #define __Pyx_DefaultClassType PyType_Type
+#endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+#endif
+#if CYTHON_FAST_PYCCALL
+#define __Pyx_PyFastCFunction_Check(func)\
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
+#else
+#define __Pyx_PyFastCFunction_Check(func) 0
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
+#if CYTHON_COMPILING_IN_PYSTON
+  #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if !CYTHON_FAST_THREAD_STATE || PY_VERSION_HEX < 0x02070000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0;
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStr(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+#else
+#define __Pyx_PyDict_GetItemStr(dict, name)  PyDict_GetItem(dict, name)
+#endif
+#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
+  #define CYTHON_PEP393_ENABLED 1
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+#else
+  #define CYTHON_PEP393_ENABLED 0
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
+  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
+  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyByteArray_Check)
+  #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
+  #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
+#else
+  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
+#endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyStringObject               PyUnicodeObject
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_Check               PyUnicode_Check
+  #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
+  #define PyObject_Unicode             PyObject_Str
+#endif
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
+  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
+#else
+  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
+  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
+#endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+#else
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyIntObject                  PyLongObject
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define PyNumber_Int                 PyNumber_Long
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBoolObject                 PyLongObject
+#endif
+#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
+  #ifndef PyUnicode_InternFromString
+    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+  #endif
+#endif
+#if PY_VERSION_HEX < 0x030200A4
+  typedef long Py_hash_t;
+  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
+#else
+  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
+#else
+  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
+#endif
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #else
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #endif
+#else
+  #define __Pyx_PyType_AsAsync(obj) NULL
+#endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
+#endif
+
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#ifdef NAN
+#define __PYX_NAN() ((float) NAN)
+#else
+static CYTHON_INLINE float __PYX_NAN() {
+  float value;
+  memset(&value, 0xFF, sizeof(value));
+  return value;
+}
+#endif
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifndef __PYX_EXTERN_C
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#define __PYX_HAVE__rmgpy__kinetics__falloff
+#define __PYX_HAVE_API__rmgpy__kinetics__falloff
+/* Early includes */
+#include <string.h>
+#include <stdio.h>
+#include "numpy/arrayobject.h"
+#include "numpy/ndarrayobject.h"
+#include "numpy/ndarraytypes.h"
+#include "numpy/arrayscalars.h"
+#include "numpy/ufuncobject.h"
+
+    /* NumPy API declarations from "numpy/__init__.pxd" */
+    
+#include <math.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
+                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
+
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#else
+    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
+#endif
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
+    const Py_UNICODE *u_end = u;
+    while (*u_end++) ;
+    return (size_t)(u_end - u - 1);
+}
+#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
+#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#else
+#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#endif
+#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#define __Pyx_PyNumber_Float(x) (PyFloat_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Float(x))
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+static int __Pyx_sys_getdefaultencoding_not_ascii;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    PyObject* ascii_chars_u = NULL;
+    PyObject* ascii_chars_b = NULL;
+    const char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    if (strcmp(default_encoding_c, "ascii") == 0) {
+        __Pyx_sys_getdefaultencoding_not_ascii = 0;
+    } else {
+        char ascii_chars[128];
+        int c;
+        for (c = 0; c < 128; c++) {
+            ascii_chars[c] = c;
+        }
+        __Pyx_sys_getdefaultencoding_not_ascii = 1;
+        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
+        if (!ascii_chars_u) goto bad;
+        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
+        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
+                default_encoding_c);
+            goto bad;
+        }
+        Py_DECREF(ascii_chars_u);
+        Py_DECREF(ascii_chars_b);
+    }
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    Py_XDECREF(ascii_chars_u);
+    Py_XDECREF(ascii_chars_b);
+    return -1;
+}
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#else
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+static char* __PYX_DEFAULT_STRING_ENCODING;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
+    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
+    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    return -1;
+}
+#endif
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+
+static PyObject *__pyx_m = NULL;
+static PyObject *__pyx_d;
+static PyObject *__pyx_b;
+static PyObject *__pyx_cython_runtime = NULL;
+static PyObject *__pyx_empty_tuple;
+static PyObject *__pyx_empty_bytes;
+static PyObject *__pyx_empty_unicode;
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm= __FILE__;
+static const char *__pyx_filename;
+
+/* Header.proto */
+#if !defined(CYTHON_CCOMPLEX)
+  #if defined(__cplusplus)
+    #define CYTHON_CCOMPLEX 1
+  #elif (defined(_Complex_I) && !defined(_MSC_VER))
+    #define CYTHON_CCOMPLEX 1
+  #else
+    #define CYTHON_CCOMPLEX 0
+  #endif
+#endif
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    #include <complex>
+  #else
+    #include <complex.h>
+  #endif
+#endif
+#if CYTHON_CCOMPLEX && !defined(__cplusplus) && defined(__sun__) && defined(__GNUC__)
+  #undef _Complex_I
+  #define _Complex_I 1.0fj
+#endif
+
+
+static const char *__pyx_f[] = {
+  "rmgpy/kinetics/falloff.pyx",
+  "rmgpy/kinetics/falloff.pxd",
+  "__init__.pxd",
+  "type.pxd",
+  "rmgpy/rmgobject.pxd",
+  "rmgpy/quantity.pxd",
+  "rmgpy/kinetics/uncertainties.pxd",
+  "rmgpy/kinetics/model.pxd",
+  "rmgpy/kinetics/arrhenius.pxd",
+};
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":688
+ * # in Cython to enable them only on the right systems.
+ * 
+ * ctypedef npy_int8       int8_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_int16      int16_t
+ * ctypedef npy_int32      int32_t
+ */
+typedef npy_int8 __pyx_t_5numpy_int8_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":689
+ * 
+ * ctypedef npy_int8       int8_t
+ * ctypedef npy_int16      int16_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_int32      int32_t
+ * ctypedef npy_int64      int64_t
+ */
+typedef npy_int16 __pyx_t_5numpy_int16_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":690
+ * ctypedef npy_int8       int8_t
+ * ctypedef npy_int16      int16_t
+ * ctypedef npy_int32      int32_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_int64      int64_t
+ * #ctypedef npy_int96      int96_t
+ */
+typedef npy_int32 __pyx_t_5numpy_int32_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":691
+ * ctypedef npy_int16      int16_t
+ * ctypedef npy_int32      int32_t
+ * ctypedef npy_int64      int64_t             # <<<<<<<<<<<<<<
+ * #ctypedef npy_int96      int96_t
+ * #ctypedef npy_int128     int128_t
+ */
+typedef npy_int64 __pyx_t_5numpy_int64_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":695
+ * #ctypedef npy_int128     int128_t
+ * 
+ * ctypedef npy_uint8      uint8_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uint16     uint16_t
+ * ctypedef npy_uint32     uint32_t
+ */
+typedef npy_uint8 __pyx_t_5numpy_uint8_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":696
+ * 
+ * ctypedef npy_uint8      uint8_t
+ * ctypedef npy_uint16     uint16_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uint32     uint32_t
+ * ctypedef npy_uint64     uint64_t
+ */
+typedef npy_uint16 __pyx_t_5numpy_uint16_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":697
+ * ctypedef npy_uint8      uint8_t
+ * ctypedef npy_uint16     uint16_t
+ * ctypedef npy_uint32     uint32_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uint64     uint64_t
+ * #ctypedef npy_uint96     uint96_t
+ */
+typedef npy_uint32 __pyx_t_5numpy_uint32_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":698
+ * ctypedef npy_uint16     uint16_t
+ * ctypedef npy_uint32     uint32_t
+ * ctypedef npy_uint64     uint64_t             # <<<<<<<<<<<<<<
+ * #ctypedef npy_uint96     uint96_t
+ * #ctypedef npy_uint128    uint128_t
+ */
+typedef npy_uint64 __pyx_t_5numpy_uint64_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":702
+ * #ctypedef npy_uint128    uint128_t
+ * 
+ * ctypedef npy_float32    float32_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_float64    float64_t
+ * #ctypedef npy_float80    float80_t
+ */
+typedef npy_float32 __pyx_t_5numpy_float32_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":703
+ * 
+ * ctypedef npy_float32    float32_t
+ * ctypedef npy_float64    float64_t             # <<<<<<<<<<<<<<
+ * #ctypedef npy_float80    float80_t
+ * #ctypedef npy_float128   float128_t
+ */
+typedef npy_float64 __pyx_t_5numpy_float64_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":712
+ * # The int types are mapped a bit surprising --
+ * # numpy.int corresponds to 'l' and numpy.long to 'q'
+ * ctypedef npy_long       int_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_longlong   longlong_t
+ * 
+ */
+typedef npy_long __pyx_t_5numpy_int_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":713
+ * # numpy.int corresponds to 'l' and numpy.long to 'q'
+ * ctypedef npy_long       int_t
+ * ctypedef npy_longlong   longlong_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_ulong      uint_t
+ */
+typedef npy_longlong __pyx_t_5numpy_longlong_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":715
+ * ctypedef npy_longlong   longlong_t
+ * 
+ * ctypedef npy_ulong      uint_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_ulonglong  ulonglong_t
+ * 
+ */
+typedef npy_ulong __pyx_t_5numpy_uint_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":716
+ * 
+ * ctypedef npy_ulong      uint_t
+ * ctypedef npy_ulonglong  ulonglong_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_intp       intp_t
+ */
+typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":718
+ * ctypedef npy_ulonglong  ulonglong_t
+ * 
+ * ctypedef npy_intp       intp_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uintp      uintp_t
+ * 
+ */
+typedef npy_intp __pyx_t_5numpy_intp_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":719
+ * 
+ * ctypedef npy_intp       intp_t
+ * ctypedef npy_uintp      uintp_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_double     float_t
+ */
+typedef npy_uintp __pyx_t_5numpy_uintp_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":721
+ * ctypedef npy_uintp      uintp_t
+ * 
+ * ctypedef npy_double     float_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_double     double_t
+ * ctypedef npy_longdouble longdouble_t
+ */
+typedef npy_double __pyx_t_5numpy_float_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":722
+ * 
+ * ctypedef npy_double     float_t
+ * ctypedef npy_double     double_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_longdouble longdouble_t
+ * 
+ */
+typedef npy_double __pyx_t_5numpy_double_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":723
+ * ctypedef npy_double     float_t
+ * ctypedef npy_double     double_t
+ * ctypedef npy_longdouble longdouble_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_cfloat      cfloat_t
+ */
+typedef npy_longdouble __pyx_t_5numpy_longdouble_t;
+/* Declarations.proto */
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    typedef ::std::complex< float > __pyx_t_float_complex;
+  #else
+    typedef float _Complex __pyx_t_float_complex;
+  #endif
+#else
+    typedef struct { float real, imag; } __pyx_t_float_complex;
+#endif
+static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float, float);
+
+/* Declarations.proto */
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    typedef ::std::complex< double > __pyx_t_double_complex;
+  #else
+    typedef double _Complex __pyx_t_double_complex;
+  #endif
+#else
+    typedef struct { double real, imag; } __pyx_t_double_complex;
+#endif
+static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double, double);
+
+
+/*--- Type declarations ---*/
+struct __pyx_obj_5rmgpy_9rmgobject_RMGObject;
+struct __pyx_obj_5rmgpy_8quantity_Units;
+struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity;
+struct __pyx_obj_5rmgpy_8quantity_ArrayQuantity;
+struct __pyx_obj_5rmgpy_8kinetics_13uncertainties_RateUncertainty;
+struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel;
+struct __pyx_obj_5rmgpy_8kinetics_5model_PDepKineticsModel;
+struct __pyx_obj_5rmgpy_8kinetics_5model_TunnelingModel;
+struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius;
+struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_ArrheniusEP;
+struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_ArrheniusBM;
+struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_PDepArrhenius;
+struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_MultiArrhenius;
+struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_MultiPDepArrhenius;
+struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody;
+struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann;
+struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":725
+ * ctypedef npy_longdouble longdouble_t
+ * 
+ * ctypedef npy_cfloat      cfloat_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_cdouble     cdouble_t
+ * ctypedef npy_clongdouble clongdouble_t
+ */
+typedef npy_cfloat __pyx_t_5numpy_cfloat_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":726
+ * 
+ * ctypedef npy_cfloat      cfloat_t
+ * ctypedef npy_cdouble     cdouble_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_clongdouble clongdouble_t
+ * 
+ */
+typedef npy_cdouble __pyx_t_5numpy_cdouble_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":727
+ * ctypedef npy_cfloat      cfloat_t
+ * ctypedef npy_cdouble     cdouble_t
+ * ctypedef npy_clongdouble clongdouble_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_cdouble     complex_t
+ */
+typedef npy_clongdouble __pyx_t_5numpy_clongdouble_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":729
+ * ctypedef npy_clongdouble clongdouble_t
+ * 
+ * ctypedef npy_cdouble     complex_t             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):
+ */
+typedef npy_cdouble __pyx_t_5numpy_complex_t;
+struct __pyx_opt_args_5rmgpy_8kinetics_5model_13KineticsModel_get_rate_coefficient;
+struct __pyx_opt_args_5rmgpy_8kinetics_5model_17PDepKineticsModel_get_rate_coefficient;
+
+/* "rmgpy/kinetics/model.pxd":53
+ *     cpdef bint is_temperature_valid(self, double T) except -2
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=?) except -1             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef to_html(self)
+ */
+struct __pyx_opt_args_5rmgpy_8kinetics_5model_13KineticsModel_get_rate_coefficient {
+  int __pyx_n;
+  double P;
+};
+
+/* "rmgpy/kinetics/model.pxd":77
+ *     cpdef np.ndarray get_effective_collider_efficiencies(self, list species)
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=?) except -1             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef to_html(self)
+ */
+struct __pyx_opt_args_5rmgpy_8kinetics_5model_17PDepKineticsModel_get_rate_coefficient {
+  int __pyx_n;
+  double P;
+};
+struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_9Arrhenius_get_rate_coefficient;
+struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_9Arrhenius_fit_to_data;
+struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_9Arrhenius_to_arrhenius_ep;
+struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_11ArrheniusEP_get_rate_coefficient;
+struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_11ArrheniusBM_get_rate_coefficient;
+struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_13PDepArrhenius_get_rate_coefficient;
+struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_13PDepArrhenius_fit_to_data;
+struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_14MultiArrhenius_get_rate_coefficient;
+struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_14MultiArrhenius_to_arrhenius;
+struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_18MultiPDepArrhenius_get_rate_coefficient;
+
+/* "rmgpy/kinetics/arrhenius.pxd":42
+ *     cdef public ScalarQuantity _T0
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=?) except -1             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef change_t0(self, double T0)
+ */
+struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_9Arrhenius_get_rate_coefficient {
+  int __pyx_n;
+  double P;
+};
+
+/* "rmgpy/kinetics/arrhenius.pxd":46
+ *     cpdef change_t0(self, double T0)
+ * 
+ *     cpdef fit_to_data(self, np.ndarray Tlist, np.ndarray klist, str kunits, double T0=?, np.ndarray weights=?, bint three_params=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2
+ */
+struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_9Arrhenius_fit_to_data {
+  int __pyx_n;
+  double T0;
+  PyArrayObject *weights;
+  int three_params;
+};
+
+/* "rmgpy/kinetics/arrhenius.pxd":52
+ *     cpdef change_rate(self, double factor)
+ * 
+ *     cpdef ArrheniusEP to_arrhenius_ep(self, double alpha=?, double dHrxn=?)             # <<<<<<<<<<<<<<
+ * 
+ * ################################################################################
+ */
+struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_9Arrhenius_to_arrhenius_ep {
+  int __pyx_n;
+  double alpha;
+  double dHrxn;
+};
+
+/* "rmgpy/kinetics/arrhenius.pxd":63
+ *     cdef public ScalarQuantity _E0
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double dHrxn=?) except -1             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef double get_activation_energy(self, double dHrxn) except -1
+ */
+struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_11ArrheniusEP_get_rate_coefficient {
+  int __pyx_n;
+  double dHrxn;
+};
+
+/* "rmgpy/kinetics/arrhenius.pxd":81
+ *     cdef public ScalarQuantity _E0
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double dHrxn=?) except -1             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef double get_activation_energy(self, double dHrxn) except -1
+ */
+struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_11ArrheniusBM_get_rate_coefficient {
+  int __pyx_n;
+  double dHrxn;
+};
+
+/* "rmgpy/kinetics/arrhenius.pxd":99
+ *     cdef get_adjacent_expressions(self, double P)
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=?) except -1             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef fit_to_data(self, np.ndarray Tlist, np.ndarray Plist, np.ndarray K, str kunits, double T0=?)
+ */
+struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_13PDepArrhenius_get_rate_coefficient {
+  int __pyx_n;
+  double P;
+};
+
+/* "rmgpy/kinetics/arrhenius.pxd":101
+ *     cpdef double get_rate_coefficient(self, double T, double P=?) except -1
+ * 
+ *     cpdef fit_to_data(self, np.ndarray Tlist, np.ndarray Plist, np.ndarray K, str kunits, double T0=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2
+ */
+struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_13PDepArrhenius_fit_to_data {
+  int __pyx_n;
+  double T0;
+};
+
+/* "rmgpy/kinetics/arrhenius.pxd":113
+ *     cdef public list arrhenius
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=?) except -1             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2
+ */
+struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_14MultiArrhenius_get_rate_coefficient {
+  int __pyx_n;
+  double P;
+};
+
+/* "rmgpy/kinetics/arrhenius.pxd":117
+ *     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2
+ * 
+ *     cpdef Arrhenius to_arrhenius(self, double Tmin=?, double Tmax=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef change_rate(self, double factor)
+ */
+struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_14MultiArrhenius_to_arrhenius {
+  int __pyx_n;
+  double Tmin;
+  double Tmax;
+};
+
+/* "rmgpy/kinetics/arrhenius.pxd":127
+ *     cdef public list arrhenius
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=?) except -1             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2
+ */
+struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_18MultiPDepArrhenius_get_rate_coefficient {
+  int __pyx_n;
+  double P;
+};
+struct __pyx_opt_args_5rmgpy_8kinetics_7falloff_9ThirdBody_get_rate_coefficient;
+struct __pyx_opt_args_5rmgpy_8kinetics_7falloff_9Lindemann_get_rate_coefficient;
+struct __pyx_opt_args_5rmgpy_8kinetics_7falloff_4Troe_get_rate_coefficient;
+
+/* "rmgpy/kinetics/falloff.pxd":38
+ *     cdef public Arrhenius arrheniusLow
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=?) except -1             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2
+ */
+struct __pyx_opt_args_5rmgpy_8kinetics_7falloff_9ThirdBody_get_rate_coefficient {
+  int __pyx_n;
+  double P;
+};
+
+/* "rmgpy/kinetics/falloff.pxd":51
+ *     cdef public Arrhenius arrheniusLow
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=?) except -1             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2
+ */
+struct __pyx_opt_args_5rmgpy_8kinetics_7falloff_9Lindemann_get_rate_coefficient {
+  int __pyx_n;
+  double P;
+};
+
+/* "rmgpy/kinetics/falloff.pxd":66
+ *     cdef public ScalarQuantity _T1, _T2, _T3
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=?) except -1             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2
+ */
+struct __pyx_opt_args_5rmgpy_8kinetics_7falloff_4Troe_get_rate_coefficient {
+  int __pyx_n;
+  double P;
+};
+
+/* "rmgpy/rmgobject.pxd":29
+ * 
+ * 
+ * cdef class RMGObject(object):             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef dict as_dict(self)
+ */
+struct __pyx_obj_5rmgpy_9rmgobject_RMGObject {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_5rmgpy_9rmgobject_RMGObject *__pyx_vtab;
+};
+
+
+/* "rmgpy/quantity.pxd":37
+ * ################################################################################
+ * 
+ * cdef class Units(RMGObject):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public str units
+ */
+struct __pyx_obj_5rmgpy_8quantity_Units {
+  struct __pyx_obj_5rmgpy_9rmgobject_RMGObject __pyx_base;
+  PyObject *units;
+};
+
+
+/* "rmgpy/quantity.pxd":49
+ * ################################################################################
+ * 
+ * cdef class ScalarQuantity(Units):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public double value_si
+ */
+struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity {
+  struct __pyx_obj_5rmgpy_8quantity_Units __pyx_base;
+  double value_si;
+  PyObject *_uncertainty_type;
+  double uncertainty_si;
+};
+
+
+/* "rmgpy/quantity.pxd":65
+ * ################################################################################
+ * 
+ * cdef class ArrayQuantity(Units):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public np.ndarray value_si
+ */
+struct __pyx_obj_5rmgpy_8quantity_ArrayQuantity {
+  struct __pyx_obj_5rmgpy_8quantity_Units __pyx_base;
+  PyArrayObject *value_si;
+  PyObject *_uncertainty_type;
+  PyArrayObject *uncertainty_si;
+};
+
+
+/* "rmgpy/kinetics/uncertainties.pxd":32
+ * ################################################################################
+ * 
+ * cdef class RateUncertainty(object):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public double Tref
+ */
+struct __pyx_obj_5rmgpy_8kinetics_13uncertainties_RateUncertainty {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_5rmgpy_8kinetics_13uncertainties_RateUncertainty *__pyx_vtab;
+  double Tref;
+  double mu;
+  double var;
+  int N;
+  PyObject *correlation;
+};
+
+
+/* "rmgpy/kinetics/model.pxd":41
+ * ################################################################################
+ * 
+ * cdef class KineticsModel:             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public ScalarQuantity _Tmin, _Tmax
+ */
+struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_KineticsModel *__pyx_vtab;
+  struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *_Tmin;
+  struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *_Tmax;
+  struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *_Pmin;
+  struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *_Pmax;
+  struct __pyx_obj_5rmgpy_8kinetics_13uncertainties_RateUncertainty *uncertainty;
+  PyObject *comment;
+};
+
+
+/* "rmgpy/kinetics/model.pxd":64
+ * 
+ * 
+ * cdef class PDepKineticsModel(KineticsModel):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public dict efficiencies
+ */
+struct __pyx_obj_5rmgpy_8kinetics_5model_PDepKineticsModel {
+  struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel __pyx_base;
+  PyObject *efficiencies;
+  struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *highPlimit;
+};
+
+
+/* "rmgpy/kinetics/model.pxd":87
+ * ################################################################################
+ * 
+ * cdef class TunnelingModel:             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public ScalarQuantity _frequency
+ */
+struct __pyx_obj_5rmgpy_8kinetics_5model_TunnelingModel {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_TunnelingModel *__pyx_vtab;
+  struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *_frequency;
+};
+
+
+/* "rmgpy/kinetics/arrhenius.pxd":35
+ * ################################################################################
+ * 
+ * cdef class Arrhenius(KineticsModel):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public ScalarQuantity _A
+ */
+struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius {
+  struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel __pyx_base;
+  struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *_A;
+  struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *_n;
+  struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *_Ea;
+  struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *_T0;
+};
+
+
+/* "rmgpy/kinetics/arrhenius.pxd":56
+ * ################################################################################
+ * 
+ * cdef class ArrheniusEP(KineticsModel):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public ScalarQuantity _A
+ */
+struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_ArrheniusEP {
+  struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel __pyx_base;
+  struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *_A;
+  struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *_n;
+  struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *_alpha;
+  struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *_E0;
+};
+
+
+/* "rmgpy/kinetics/arrhenius.pxd":74
+ * ################################################################################
+ * 
+ * cdef class ArrheniusBM(KineticsModel):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public ScalarQuantity _A
+ */
+struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_ArrheniusBM {
+  struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel __pyx_base;
+  struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *_A;
+  struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *_n;
+  struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *_w0;
+  struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *_E0;
+};
+
+
+/* "rmgpy/kinetics/arrhenius.pxd":92
+ * ################################################################################
+ * 
+ * cdef class PDepArrhenius(PDepKineticsModel):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public ArrayQuantity _pressures
+ */
+struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_PDepArrhenius {
+  struct __pyx_obj_5rmgpy_8kinetics_5model_PDepKineticsModel __pyx_base;
+  struct __pyx_obj_5rmgpy_8quantity_ArrayQuantity *_pressures;
+  PyObject *arrhenius;
+};
+
+
+/* "rmgpy/kinetics/arrhenius.pxd":109
+ * ################################################################################
+ * 
+ * cdef class MultiArrhenius(KineticsModel):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public list arrhenius
+ */
+struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_MultiArrhenius {
+  struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel __pyx_base;
+  PyObject *arrhenius;
+};
+
+
+/* "rmgpy/kinetics/arrhenius.pxd":123
+ * ################################################################################
+ * 
+ * cdef class MultiPDepArrhenius(PDepKineticsModel):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public list arrhenius
+ */
+struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_MultiPDepArrhenius {
+  struct __pyx_obj_5rmgpy_8kinetics_5model_PDepKineticsModel __pyx_base;
+  PyObject *arrhenius;
+};
+
+
+/* "rmgpy/kinetics/falloff.pxd":34
+ * ################################################################################
+ * 
+ * cdef class ThirdBody(PDepKineticsModel):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public Arrhenius arrheniusLow
+ */
+struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody {
+  struct __pyx_obj_5rmgpy_8kinetics_5model_PDepKineticsModel __pyx_base;
+  struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *arrheniusLow;
+};
+
+
+/* "rmgpy/kinetics/falloff.pxd":46
+ * ################################################################################
+ * 
+ * cdef class Lindemann(PDepKineticsModel):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public Arrhenius arrheniusHigh
+ */
+struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann {
+  struct __pyx_obj_5rmgpy_8kinetics_5model_PDepKineticsModel __pyx_base;
+  struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *arrheniusHigh;
+  struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *arrheniusLow;
+};
+
+
+/* "rmgpy/kinetics/falloff.pxd":59
+ * ################################################################################
+ * 
+ * cdef class Troe(PDepKineticsModel):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public Arrhenius arrheniusHigh
+ */
+struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe {
+  struct __pyx_obj_5rmgpy_8kinetics_5model_PDepKineticsModel __pyx_base;
+  struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *arrheniusHigh;
+  struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *arrheniusLow;
+  double alpha;
+  struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *_T1;
+  struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *_T2;
+  struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *_T3;
+};
+
+
+
+/* "rmgpy/rmgobject.pxd":29
+ * 
+ * 
+ * cdef class RMGObject(object):             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef dict as_dict(self)
+ */
+
+struct __pyx_vtabstruct_5rmgpy_9rmgobject_RMGObject {
+  PyObject *(*as_dict)(struct __pyx_obj_5rmgpy_9rmgobject_RMGObject *, int __pyx_skip_dispatch);
+  PyObject *(*make_object)(struct __pyx_obj_5rmgpy_9rmgobject_RMGObject *, PyObject *, PyObject *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_9rmgobject_RMGObject *__pyx_vtabptr_5rmgpy_9rmgobject_RMGObject;
+
+
+/* "rmgpy/quantity.pxd":37
+ * ################################################################################
+ * 
+ * cdef class Units(RMGObject):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public str units
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8quantity_Units {
+  struct __pyx_vtabstruct_5rmgpy_9rmgobject_RMGObject __pyx_base;
+  double (*get_conversion_factor_to_si)(struct __pyx_obj_5rmgpy_8quantity_Units *, int __pyx_skip_dispatch);
+  double (*get_conversion_factor_from_si)(struct __pyx_obj_5rmgpy_8quantity_Units *, int __pyx_skip_dispatch);
+  double (*get_conversion_factor_from_si_to_cm_mol_s)(struct __pyx_obj_5rmgpy_8quantity_Units *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8quantity_Units *__pyx_vtabptr_5rmgpy_8quantity_Units;
+
+
+/* "rmgpy/quantity.pxd":49
+ * ################################################################################
+ * 
+ * cdef class ScalarQuantity(Units):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public double value_si
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8quantity_ScalarQuantity {
+  struct __pyx_vtabstruct_5rmgpy_8quantity_Units __pyx_base;
+  int (*is_uncertainty_additive)(struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *, int __pyx_skip_dispatch);
+  int (*is_uncertainty_multiplicative)(struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *, int __pyx_skip_dispatch);
+  struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *(*copy)(struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8quantity_ScalarQuantity *__pyx_vtabptr_5rmgpy_8quantity_ScalarQuantity;
+
+
+/* "rmgpy/quantity.pxd":65
+ * ################################################################################
+ * 
+ * cdef class ArrayQuantity(Units):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public np.ndarray value_si
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8quantity_ArrayQuantity {
+  struct __pyx_vtabstruct_5rmgpy_8quantity_Units __pyx_base;
+  int (*is_uncertainty_additive)(struct __pyx_obj_5rmgpy_8quantity_ArrayQuantity *, int __pyx_skip_dispatch);
+  int (*is_uncertainty_multiplicative)(struct __pyx_obj_5rmgpy_8quantity_ArrayQuantity *, int __pyx_skip_dispatch);
+  struct __pyx_obj_5rmgpy_8quantity_ArrayQuantity *(*copy)(struct __pyx_obj_5rmgpy_8quantity_ArrayQuantity *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8quantity_ArrayQuantity *__pyx_vtabptr_5rmgpy_8quantity_ArrayQuantity;
+
+
+/* "rmgpy/kinetics/uncertainties.pxd":32
+ * ################################################################################
+ * 
+ * cdef class RateUncertainty(object):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public double Tref
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8kinetics_13uncertainties_RateUncertainty {
+  double (*get_expected_log_uncertainty)(struct __pyx_obj_5rmgpy_8kinetics_13uncertainties_RateUncertainty *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8kinetics_13uncertainties_RateUncertainty *__pyx_vtabptr_5rmgpy_8kinetics_13uncertainties_RateUncertainty;
+
+
+/* "rmgpy/kinetics/model.pxd":41
+ * ################################################################################
+ * 
+ * cdef class KineticsModel:             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public ScalarQuantity _Tmin, _Tmax
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_KineticsModel {
+  int (*is_pressure_dependent)(struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *, int __pyx_skip_dispatch);
+  int (*is_temperature_valid)(struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *, double, int __pyx_skip_dispatch);
+  double (*get_rate_coefficient)(struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *, double, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8kinetics_5model_13KineticsModel_get_rate_coefficient *__pyx_optional_args);
+  PyObject *(*to_html)(struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *, int __pyx_skip_dispatch);
+  int (*is_similar_to)(struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *, struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *, int __pyx_skip_dispatch);
+  int (*is_identical_to)(struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *, struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *, int __pyx_skip_dispatch);
+  double (*discrepancy)(struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *, struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_KineticsModel *__pyx_vtabptr_5rmgpy_8kinetics_5model_KineticsModel;
+
+
+/* "rmgpy/kinetics/model.pxd":64
+ * 
+ * 
+ * cdef class PDepKineticsModel(KineticsModel):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public dict efficiencies
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_PDepKineticsModel {
+  struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_KineticsModel __pyx_base;
+  int (*is_pressure_valid)(struct __pyx_obj_5rmgpy_8kinetics_5model_PDepKineticsModel *, double, int __pyx_skip_dispatch);
+  double (*get_effective_pressure)(struct __pyx_obj_5rmgpy_8kinetics_5model_PDepKineticsModel *, double, PyObject *, PyArrayObject *, int __pyx_skip_dispatch);
+  PyArrayObject *(*get_effective_collider_efficiencies)(struct __pyx_obj_5rmgpy_8kinetics_5model_PDepKineticsModel *, PyObject *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_PDepKineticsModel *__pyx_vtabptr_5rmgpy_8kinetics_5model_PDepKineticsModel;
+
+
+/* "rmgpy/kinetics/model.pxd":87
+ * ################################################################################
+ * 
+ * cdef class TunnelingModel:             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public ScalarQuantity _frequency
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_TunnelingModel {
+  double (*calculate_tunneling_factor)(struct __pyx_obj_5rmgpy_8kinetics_5model_TunnelingModel *, double, int __pyx_skip_dispatch);
+  PyArrayObject *(*calculate_tunneling_function)(struct __pyx_obj_5rmgpy_8kinetics_5model_TunnelingModel *, PyArrayObject *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_TunnelingModel *__pyx_vtabptr_5rmgpy_8kinetics_5model_TunnelingModel;
+
+
+/* "rmgpy/kinetics/arrhenius.pxd":35
+ * ################################################################################
+ * 
+ * cdef class Arrhenius(KineticsModel):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public ScalarQuantity _A
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_Arrhenius {
+  struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_KineticsModel __pyx_base;
+  PyObject *(*change_t0)(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *, double, int __pyx_skip_dispatch);
+  PyObject *(*fit_to_data)(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *, PyArrayObject *, PyArrayObject *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_9Arrhenius_fit_to_data *__pyx_optional_args);
+  PyObject *(*change_rate)(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *, double, int __pyx_skip_dispatch);
+  struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_ArrheniusEP *(*to_arrhenius_ep)(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_9Arrhenius_to_arrhenius_ep *__pyx_optional_args);
+};
+static struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_Arrhenius *__pyx_vtabptr_5rmgpy_8kinetics_9arrhenius_Arrhenius;
+
+
+/* "rmgpy/kinetics/arrhenius.pxd":56
+ * ################################################################################
+ * 
+ * cdef class ArrheniusEP(KineticsModel):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public ScalarQuantity _A
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_ArrheniusEP {
+  struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_KineticsModel __pyx_base;
+  double (*get_activation_energy)(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_ArrheniusEP *, double, int __pyx_skip_dispatch);
+  struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *(*to_arrhenius)(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_ArrheniusEP *, double, int __pyx_skip_dispatch);
+  PyObject *(*change_rate)(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_ArrheniusEP *, double, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_ArrheniusEP *__pyx_vtabptr_5rmgpy_8kinetics_9arrhenius_ArrheniusEP;
+
+
+/* "rmgpy/kinetics/arrhenius.pxd":74
+ * ################################################################################
+ * 
+ * cdef class ArrheniusBM(KineticsModel):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public ScalarQuantity _A
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_ArrheniusBM {
+  struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_KineticsModel __pyx_base;
+  double (*get_activation_energy)(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_ArrheniusBM *, double, int __pyx_skip_dispatch);
+  struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *(*to_arrhenius)(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_ArrheniusBM *, double, int __pyx_skip_dispatch);
+  PyObject *(*change_rate)(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_ArrheniusBM *, double, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_ArrheniusBM *__pyx_vtabptr_5rmgpy_8kinetics_9arrhenius_ArrheniusBM;
+
+
+/* "rmgpy/kinetics/arrhenius.pxd":92
+ * ################################################################################
+ * 
+ * cdef class PDepArrhenius(PDepKineticsModel):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public ArrayQuantity _pressures
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_PDepArrhenius {
+  struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_PDepKineticsModel __pyx_base;
+  PyObject *(*get_adjacent_expressions)(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_PDepArrhenius *, double);
+  PyObject *(*fit_to_data)(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_PDepArrhenius *, PyArrayObject *, PyArrayObject *, PyArrayObject *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_13PDepArrhenius_fit_to_data *__pyx_optional_args);
+  PyObject *(*change_rate)(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_PDepArrhenius *, double, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_PDepArrhenius *__pyx_vtabptr_5rmgpy_8kinetics_9arrhenius_PDepArrhenius;
+
+
+/* "rmgpy/kinetics/arrhenius.pxd":109
+ * ################################################################################
+ * 
+ * cdef class MultiArrhenius(KineticsModel):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public list arrhenius
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_MultiArrhenius {
+  struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_KineticsModel __pyx_base;
+  struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *(*to_arrhenius)(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_MultiArrhenius *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8kinetics_9arrhenius_14MultiArrhenius_to_arrhenius *__pyx_optional_args);
+  PyObject *(*change_rate)(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_MultiArrhenius *, double, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_MultiArrhenius *__pyx_vtabptr_5rmgpy_8kinetics_9arrhenius_MultiArrhenius;
+
+
+/* "rmgpy/kinetics/arrhenius.pxd":123
+ * ################################################################################
+ * 
+ * cdef class MultiPDepArrhenius(PDepKineticsModel):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public list arrhenius
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_MultiPDepArrhenius {
+  struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_PDepKineticsModel __pyx_base;
+  PyObject *(*change_rate)(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_MultiPDepArrhenius *, double, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_MultiPDepArrhenius *__pyx_vtabptr_5rmgpy_8kinetics_9arrhenius_MultiPDepArrhenius;
+
+
+/* "rmgpy/kinetics/falloff.pyx":42
+ * ################################################################################
+ * 
+ * cdef class ThirdBody(PDepKineticsModel):             # <<<<<<<<<<<<<<
+ *     """
+ *     A kinetic model of a phenomenological rate coefficient :math:`k(T, P)`
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8kinetics_7falloff_ThirdBody {
+  struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_PDepKineticsModel __pyx_base;
+  PyObject *(*change_rate)(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *, double, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_vtabptr_5rmgpy_8kinetics_7falloff_ThirdBody;
+
+
+/* "rmgpy/kinetics/falloff.pyx":134
+ * ################################################################################
+ * 
+ * cdef class Lindemann(PDepKineticsModel):             # <<<<<<<<<<<<<<
+ *     """
+ *     A kinetic model of a phenomenological rate coefficient :math:`k(T, P)`
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8kinetics_7falloff_Lindemann {
+  struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_PDepKineticsModel __pyx_base;
+  PyObject *(*change_rate)(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *, double, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_vtabptr_5rmgpy_8kinetics_7falloff_Lindemann;
+
+
+/* "rmgpy/kinetics/falloff.pyx":237
+ * ################################################################################
+ * 
+ * cdef class Troe(PDepKineticsModel):             # <<<<<<<<<<<<<<
+ *     """
+ *     A kinetic model of a phenomenological rate coefficient :math:`k(T, P)`
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8kinetics_7falloff_Troe {
+  struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_PDepKineticsModel __pyx_base;
+  PyObject *(*change_rate)(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *, double, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8kinetics_7falloff_Troe *__pyx_vtabptr_5rmgpy_8kinetics_7falloff_Troe;
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, int);
+    void (*DECREF)(void*, PyObject*, int);
+    void (*GOTREF)(void*, PyObject*, int);
+    void (*GIVEREF)(void*, PyObject*, int);
+    void* (*SetupContext)(const char*, int, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+#ifdef WITH_THREAD
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+          }
+#else
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
+#endif
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* RaiseDoubleKeywords.proto */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
+
+/* ParseKeywords.proto */
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
+    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
+    const char* function_name);
+
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* ExtTypeTest.proto */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
+#endif
+
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* IncludeStringH.proto */
+#include <string.h>
+
+/* BytesEquals.proto */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals);
+
+/* UnicodeEquals.proto */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals);
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* ArgTypeTest.proto */
+#define __Pyx_ArgTypeTest(obj, type, none_allowed, name, exact)\
+    ((likely((Py_TYPE(obj) == type) | (none_allowed && (obj == Py_None)))) ? 1 :\
+        __Pyx__ArgTypeTest(obj, type, name, exact))
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact);
+
+/* Import.proto */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
+
+/* AssertionsEnabled.proto */
+#define __Pyx_init_assertions_enabled()
+#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x02070600 && !defined(Py_OptimizeFlag)
+  #define __pyx_assertions_enabled() (1)
+#elif PY_VERSION_HEX < 0x03080000  ||  CYTHON_COMPILING_IN_PYPY  ||  defined(Py_LIMITED_API)
+  #define __pyx_assertions_enabled() (!Py_OptimizeFlag)
+#elif CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030900A6
+  static int __pyx_assertions_enabled_flag;
+  #define __pyx_assertions_enabled() (__pyx_assertions_enabled_flag)
+  #undef __Pyx_init_assertions_enabled
+  static void __Pyx_init_assertions_enabled(void) {
+    __pyx_assertions_enabled_flag = ! _PyInterpreterState_GetConfig(__Pyx_PyThreadState_Current->interp)->optimization_level;
+  }
+#else
+  #define __pyx_assertions_enabled() (!Py_OptimizeFlag)
+#endif
+
+/* PyObjectSetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+#define __Pyx_PyObject_DelAttrStr(o,n) __Pyx_PyObject_SetAttrStr(o, n, NULL)
+static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value);
+#else
+#define __Pyx_PyObject_DelAttrStr(o,n)   PyObject_DelAttr(o,n)
+#define __Pyx_PyObject_SetAttrStr(o,n,v) PyObject_SetAttr(o,n,v)
+#endif
+
+/* PyObjectCallNoArg.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+#else
+#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
+#endif
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* WriteUnraisableException.proto */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil);
+
+/* GetTopmostException.proto */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
+#endif
+
+/* SaveResetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+#else
+#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
+#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
+#endif
+
+/* PyErrExceptionMatches.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* GetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* CallNextTpDealloc.proto */
+static void __Pyx_call_next_tp_dealloc(PyObject* obj, destructor current_tp_dealloc);
+
+/* CallNextTpTraverse.proto */
+static int __Pyx_call_next_tp_traverse(PyObject* obj, visitproc v, void *a, traverseproc current_tp_traverse);
+
+/* CallNextTpClear.proto */
+static void __Pyx_call_next_tp_clear(PyObject* obj, inquiry current_tp_dealloc);
+
+/* TypeImport.proto */
+#ifndef __PYX_HAVE_RT_ImportType_proto_0_29_37
+#define __PYX_HAVE_RT_ImportType_proto_0_29_37
+#if __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if __STDC_VERSION__ >= 201112L || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize_0_29_37 {
+   __Pyx_ImportType_CheckSize_Error_0_29_37 = 0,
+   __Pyx_ImportType_CheckSize_Warn_0_29_37 = 1,
+   __Pyx_ImportType_CheckSize_Ignore_0_29_37 = 2
+};
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size);
+#endif
+
+/* GetVTable.proto */
+static void* __Pyx_GetVtable(PyObject *dict);
+
+/* PyObject_GenericGetAttrNoDict.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttrNoDict PyObject_GenericGetAttr
+#endif
+
+/* PyObject_GenericGetAttr.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttr PyObject_GenericGetAttr
+#endif
+
+/* SetVTable.proto */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable);
+
+/* FetchCommonType.proto */
+static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type);
+
+/* CythonFunctionShared.proto */
+#define __Pyx_CyFunction_USED 1
+#define __Pyx_CYFUNCTION_STATICMETHOD  0x01
+#define __Pyx_CYFUNCTION_CLASSMETHOD   0x02
+#define __Pyx_CYFUNCTION_CCLASS        0x04
+#define __Pyx_CyFunction_GetClosure(f)\
+    (((__pyx_CyFunctionObject *) (f))->func_closure)
+#define __Pyx_CyFunction_GetClassObj(f)\
+    (((__pyx_CyFunctionObject *) (f))->func_classobj)
+#define __Pyx_CyFunction_Defaults(type, f)\
+    ((type *)(((__pyx_CyFunctionObject *) (f))->defaults))
+#define __Pyx_CyFunction_SetDefaultsGetter(f, g)\
+    ((__pyx_CyFunctionObject *) (f))->defaults_getter = (g)
+typedef struct {
+    PyCFunctionObject func;
+#if PY_VERSION_HEX < 0x030500A0
+    PyObject *func_weakreflist;
+#endif
+    PyObject *func_dict;
+    PyObject *func_name;
+    PyObject *func_qualname;
+    PyObject *func_doc;
+    PyObject *func_globals;
+    PyObject *func_code;
+    PyObject *func_closure;
+    PyObject *func_classobj;
+    void *defaults;
+    int defaults_pyobjects;
+    size_t defaults_size;  // used by FusedFunction for copying defaults
+    int flags;
+    PyObject *defaults_tuple;
+    PyObject *defaults_kwdict;
+    PyObject *(*defaults_getter)(PyObject *);
+    PyObject *func_annotations;
+} __pyx_CyFunctionObject;
+static PyTypeObject *__pyx_CyFunctionType = 0;
+#define __Pyx_CyFunction_Check(obj)  (__Pyx_TypeCheck(obj, __pyx_CyFunctionType))
+static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject* op, PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *self,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
+static CYTHON_INLINE void *__Pyx_CyFunction_InitDefaults(PyObject *m,
+                                                         size_t size,
+                                                         int pyobjects);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *m,
+                                                            PyObject *tuple);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *m,
+                                                             PyObject *dict);
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *m,
+                                                              PyObject *dict);
+static int __pyx_CyFunction_init(void);
+
+/* CythonFunction.proto */
+static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *closure,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
+
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
+
+/* CodeObjectCache.proto */
+typedef struct {
+    PyCodeObject* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+};
+static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static PyCodeObject *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* RealImag.proto */
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    #define __Pyx_CREAL(z) ((z).real())
+    #define __Pyx_CIMAG(z) ((z).imag())
+  #else
+    #define __Pyx_CREAL(z) (__real__(z))
+    #define __Pyx_CIMAG(z) (__imag__(z))
+  #endif
+#else
+    #define __Pyx_CREAL(z) ((z).real)
+    #define __Pyx_CIMAG(z) ((z).imag)
+#endif
+#if defined(__cplusplus) && CYTHON_CCOMPLEX\
+        && (defined(_WIN32) || defined(__clang__) || (defined(__GNUC__) && (__GNUC__ >= 5 || __GNUC__ == 4 && __GNUC_MINOR__ >= 4 )) || __cplusplus >= 201103)
+    #define __Pyx_SET_CREAL(z,x) ((z).real(x))
+    #define __Pyx_SET_CIMAG(z,y) ((z).imag(y))
+#else
+    #define __Pyx_SET_CREAL(z,x) __Pyx_CREAL(z) = (x)
+    #define __Pyx_SET_CIMAG(z,y) __Pyx_CIMAG(z) = (y)
+#endif
+
+/* Arithmetic.proto */
+#if CYTHON_CCOMPLEX
+    #define __Pyx_c_eq_float(a, b)   ((a)==(b))
+    #define __Pyx_c_sum_float(a, b)  ((a)+(b))
+    #define __Pyx_c_diff_float(a, b) ((a)-(b))
+    #define __Pyx_c_prod_float(a, b) ((a)*(b))
+    #define __Pyx_c_quot_float(a, b) ((a)/(b))
+    #define __Pyx_c_neg_float(a)     (-(a))
+  #ifdef __cplusplus
+    #define __Pyx_c_is_zero_float(z) ((z)==(float)0)
+    #define __Pyx_c_conj_float(z)    (::std::conj(z))
+    #if 1
+        #define __Pyx_c_abs_float(z)     (::std::abs(z))
+        #define __Pyx_c_pow_float(a, b)  (::std::pow(a, b))
+    #endif
+  #else
+    #define __Pyx_c_is_zero_float(z) ((z)==0)
+    #define __Pyx_c_conj_float(z)    (conjf(z))
+    #if 1
+        #define __Pyx_c_abs_float(z)     (cabsf(z))
+        #define __Pyx_c_pow_float(a, b)  (cpowf(a, b))
+    #endif
+ #endif
+#else
+    static CYTHON_INLINE int __Pyx_c_eq_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_sum_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_diff_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_prod_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_quot_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_neg_float(__pyx_t_float_complex);
+    static CYTHON_INLINE int __Pyx_c_is_zero_float(__pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_conj_float(__pyx_t_float_complex);
+    #if 1
+        static CYTHON_INLINE float __Pyx_c_abs_float(__pyx_t_float_complex);
+        static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_pow_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    #endif
+#endif
+
+/* Arithmetic.proto */
+#if CYTHON_CCOMPLEX
+    #define __Pyx_c_eq_double(a, b)   ((a)==(b))
+    #define __Pyx_c_sum_double(a, b)  ((a)+(b))
+    #define __Pyx_c_diff_double(a, b) ((a)-(b))
+    #define __Pyx_c_prod_double(a, b) ((a)*(b))
+    #define __Pyx_c_quot_double(a, b) ((a)/(b))
+    #define __Pyx_c_neg_double(a)     (-(a))
+  #ifdef __cplusplus
+    #define __Pyx_c_is_zero_double(z) ((z)==(double)0)
+    #define __Pyx_c_conj_double(z)    (::std::conj(z))
+    #if 1
+        #define __Pyx_c_abs_double(z)     (::std::abs(z))
+        #define __Pyx_c_pow_double(a, b)  (::std::pow(a, b))
+    #endif
+  #else
+    #define __Pyx_c_is_zero_double(z) ((z)==0)
+    #define __Pyx_c_conj_double(z)    (conj(z))
+    #if 1
+        #define __Pyx_c_abs_double(z)     (cabs(z))
+        #define __Pyx_c_pow_double(a, b)  (cpow(a, b))
+    #endif
+ #endif
+#else
+    static CYTHON_INLINE int __Pyx_c_eq_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_sum_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_diff_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_prod_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_quot_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_neg_double(__pyx_t_double_complex);
+    static CYTHON_INLINE int __Pyx_c_is_zero_double(__pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_conj_double(__pyx_t_double_complex);
+    #if 1
+        static CYTHON_INLINE double __Pyx_c_abs_double(__pyx_t_double_complex);
+        static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_pow_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    #endif
+#endif
+
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(void);
+
+/* VoidPtrImport.proto */
+static int __Pyx_ImportVoidPtr_0_29_37(PyObject *module, const char *name, void **p, const char *sig);
+
+/* InitStrings.proto */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+
+static double __pyx_f_5rmgpy_8kinetics_7falloff_9ThirdBody_get_rate_coefficient(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self, double __pyx_v_T, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8kinetics_7falloff_9ThirdBody_get_rate_coefficient *__pyx_optional_args); /* proto*/
+static int __pyx_f_5rmgpy_8kinetics_7falloff_9ThirdBody_is_identical_to(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self, struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *__pyx_v_other_kinetics, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_5rmgpy_8kinetics_7falloff_9ThirdBody_change_rate(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self, double __pyx_v_factor, int __pyx_skip_dispatch); /* proto*/
+static double __pyx_f_5rmgpy_8kinetics_7falloff_9Lindemann_get_rate_coefficient(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self, double __pyx_v_T, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8kinetics_7falloff_9Lindemann_get_rate_coefficient *__pyx_optional_args); /* proto*/
+static int __pyx_f_5rmgpy_8kinetics_7falloff_9Lindemann_is_identical_to(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self, struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *__pyx_v_other_kinetics, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_5rmgpy_8kinetics_7falloff_9Lindemann_change_rate(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self, double __pyx_v_factor, int __pyx_skip_dispatch); /* proto*/
+static double __pyx_f_5rmgpy_8kinetics_7falloff_4Troe_get_rate_coefficient(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, double __pyx_v_T, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8kinetics_7falloff_4Troe_get_rate_coefficient *__pyx_optional_args); /* proto*/
+static int __pyx_f_5rmgpy_8kinetics_7falloff_4Troe_is_identical_to(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *__pyx_v_other_kinetics, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_5rmgpy_8kinetics_7falloff_4Troe_change_rate(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, double __pyx_v_factor, int __pyx_skip_dispatch); /* proto*/
+
+/* Module declarations from 'cpython.buffer' */
+
+/* Module declarations from 'libc.string' */
+
+/* Module declarations from 'libc.stdio' */
+
+/* Module declarations from '__builtin__' */
+
+/* Module declarations from 'cpython.type' */
+static PyTypeObject *__pyx_ptype_7cpython_4type_type = 0;
+
+/* Module declarations from 'cpython' */
+
+/* Module declarations from 'cpython.object' */
+
+/* Module declarations from 'cpython.ref' */
+
+/* Module declarations from 'cpython.mem' */
+
+/* Module declarations from 'numpy' */
+
+/* Module declarations from 'numpy' */
+static PyTypeObject *__pyx_ptype_5numpy_dtype = 0;
+static PyTypeObject *__pyx_ptype_5numpy_flatiter = 0;
+static PyTypeObject *__pyx_ptype_5numpy_broadcast = 0;
+static PyTypeObject *__pyx_ptype_5numpy_ndarray = 0;
+static PyTypeObject *__pyx_ptype_5numpy_generic = 0;
+static PyTypeObject *__pyx_ptype_5numpy_number = 0;
+static PyTypeObject *__pyx_ptype_5numpy_integer = 0;
+static PyTypeObject *__pyx_ptype_5numpy_signedinteger = 0;
+static PyTypeObject *__pyx_ptype_5numpy_unsignedinteger = 0;
+static PyTypeObject *__pyx_ptype_5numpy_inexact = 0;
+static PyTypeObject *__pyx_ptype_5numpy_floating = 0;
+static PyTypeObject *__pyx_ptype_5numpy_complexfloating = 0;
+static PyTypeObject *__pyx_ptype_5numpy_flexible = 0;
+static PyTypeObject *__pyx_ptype_5numpy_character = 0;
+static PyTypeObject *__pyx_ptype_5numpy_ufunc = 0;
+
+/* Module declarations from 'rmgpy.rmgobject' */
+static PyTypeObject *__pyx_ptype_5rmgpy_9rmgobject_RMGObject = 0;
+
+/* Module declarations from 'rmgpy.quantity' */
+static PyTypeObject *__pyx_ptype_5rmgpy_8quantity_Units = 0;
+static PyTypeObject *__pyx_ptype_5rmgpy_8quantity_ScalarQuantity = 0;
+static PyTypeObject *__pyx_ptype_5rmgpy_8quantity_ArrayQuantity = 0;
+static PyObject **__pyx_vp_5rmgpy_8quantity_NOT_IMPLEMENTED_UNITS = 0;
+#define __pyx_v_5rmgpy_8quantity_NOT_IMPLEMENTED_UNITS (*__pyx_vp_5rmgpy_8quantity_NOT_IMPLEMENTED_UNITS)
+
+/* Module declarations from 'rmgpy.kinetics.uncertainties' */
+static PyTypeObject *__pyx_ptype_5rmgpy_8kinetics_13uncertainties_RateUncertainty = 0;
+
+/* Module declarations from 'rmgpy.kinetics.model' */
+static PyTypeObject *__pyx_ptype_5rmgpy_8kinetics_5model_KineticsModel = 0;
+static PyTypeObject *__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel = 0;
+static PyTypeObject *__pyx_ptype_5rmgpy_8kinetics_5model_TunnelingModel = 0;
+
+/* Module declarations from 'rmgpy.kinetics.arrhenius' */
+static PyTypeObject *__pyx_ptype_5rmgpy_8kinetics_9arrhenius_Arrhenius = 0;
+static PyTypeObject *__pyx_ptype_5rmgpy_8kinetics_9arrhenius_ArrheniusEP = 0;
+static PyTypeObject *__pyx_ptype_5rmgpy_8kinetics_9arrhenius_ArrheniusBM = 0;
+static PyTypeObject *__pyx_ptype_5rmgpy_8kinetics_9arrhenius_PDepArrhenius = 0;
+static PyTypeObject *__pyx_ptype_5rmgpy_8kinetics_9arrhenius_MultiArrhenius = 0;
+static PyTypeObject *__pyx_ptype_5rmgpy_8kinetics_9arrhenius_MultiPDepArrhenius = 0;
+
+/* Module declarations from 'libc.math' */
+
+/* Module declarations from 'rmgpy.constants' */
+static double *__pyx_vp_5rmgpy_9constants_pi = 0;
+#define __pyx_v_5rmgpy_9constants_pi (*__pyx_vp_5rmgpy_9constants_pi)
+static double *__pyx_vp_5rmgpy_9constants_Na = 0;
+#define __pyx_v_5rmgpy_9constants_Na (*__pyx_vp_5rmgpy_9constants_Na)
+static double *__pyx_vp_5rmgpy_9constants_kB = 0;
+#define __pyx_v_5rmgpy_9constants_kB (*__pyx_vp_5rmgpy_9constants_kB)
+static double *__pyx_vp_5rmgpy_9constants_R = 0;
+#define __pyx_v_5rmgpy_9constants_R (*__pyx_vp_5rmgpy_9constants_R)
+static double *__pyx_vp_5rmgpy_9constants_h = 0;
+#define __pyx_v_5rmgpy_9constants_h (*__pyx_vp_5rmgpy_9constants_h)
+static double *__pyx_vp_5rmgpy_9constants_hbar = 0;
+#define __pyx_v_5rmgpy_9constants_hbar (*__pyx_vp_5rmgpy_9constants_hbar)
+static double *__pyx_vp_5rmgpy_9constants_c = 0;
+#define __pyx_v_5rmgpy_9constants_c (*__pyx_vp_5rmgpy_9constants_c)
+static double *__pyx_vp_5rmgpy_9constants_e = 0;
+#define __pyx_v_5rmgpy_9constants_e (*__pyx_vp_5rmgpy_9constants_e)
+static double *__pyx_vp_5rmgpy_9constants_m_e = 0;
+#define __pyx_v_5rmgpy_9constants_m_e (*__pyx_vp_5rmgpy_9constants_m_e)
+static double *__pyx_vp_5rmgpy_9constants_m_p = 0;
+#define __pyx_v_5rmgpy_9constants_m_p (*__pyx_vp_5rmgpy_9constants_m_p)
+static double *__pyx_vp_5rmgpy_9constants_m_n = 0;
+#define __pyx_v_5rmgpy_9constants_m_n (*__pyx_vp_5rmgpy_9constants_m_n)
+static double *__pyx_vp_5rmgpy_9constants_amu = 0;
+#define __pyx_v_5rmgpy_9constants_amu (*__pyx_vp_5rmgpy_9constants_amu)
+static double *__pyx_vp_5rmgpy_9constants_a0 = 0;
+#define __pyx_v_5rmgpy_9constants_a0 (*__pyx_vp_5rmgpy_9constants_a0)
+static double *__pyx_vp_5rmgpy_9constants_E_h = 0;
+#define __pyx_v_5rmgpy_9constants_E_h (*__pyx_vp_5rmgpy_9constants_E_h)
+
+/* Module declarations from 'rmgpy.kinetics.falloff' */
+static PyTypeObject *__pyx_ptype_5rmgpy_8kinetics_7falloff_ThirdBody = 0;
+static PyTypeObject *__pyx_ptype_5rmgpy_8kinetics_7falloff_Lindemann = 0;
+static PyTypeObject *__pyx_ptype_5rmgpy_8kinetics_7falloff_Troe = 0;
+#define __Pyx_MODULE_NAME "rmgpy.kinetics.falloff"
+extern int __pyx_module_is_main_rmgpy__kinetics__falloff;
+int __pyx_module_is_main_rmgpy__kinetics__falloff = 0;
+
+/* Implementation of 'rmgpy.kinetics.falloff' */
+static PyObject *__pyx_builtin_ImportError;
+static const char __pyx_k_[] = "";
+static const char __pyx_k_A[] = "A";
+static const char __pyx_k_P[] = "P";
+static const char __pyx_k_T[] = "T";
+static const char __pyx_k_T1[] = "T1";
+static const char __pyx_k_T2[] = "T2";
+static const char __pyx_k_T3[] = "T3";
+static const char __pyx_k__2[] = ")";
+static const char __pyx_k__5[] = "*";
+static const char __pyx_k_ct[] = "ct";
+static const char __pyx_k_Pmax[] = "Pmax";
+static const char __pyx_k_Pmin[] = "Pmin";
+static const char __pyx_k_Tmax[] = "Tmax";
+static const char __pyx_k_Tmin[] = "Tmin";
+static const char __pyx_k_Troe[] = "Troe";
+static const char __pyx_k_init[] = "__init__";
+static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_name[] = "__name__";
+static const char __pyx_k_self[] = "self";
+static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_alpha[] = "alpha";
+static const char __pyx_k_T1_0_r[] = ", T1={0!r}";
+static const char __pyx_k_T2_0_r[] = ", T2={0!r}";
+static const char __pyx_k_T3_0_r[] = ", T3={0!r}";
+static const char __pyx_k_equals[] = "equals";
+static const char __pyx_k_factor[] = "factor";
+static const char __pyx_k_format[] = "format";
+static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_params[] = "params";
+static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_Falloff[] = "Falloff";
+static const char __pyx_k_cantera[] = "cantera";
+static const char __pyx_k_comment[] = "comment";
+static const char __pyx_k_falloff[] = "falloff";
+static const char __pyx_k_Pmax_0_r[] = ", Pmax={0!r}";
+static const char __pyx_k_Pmin_0_r[] = ", Pmin={0!r}";
+static const char __pyx_k_Tmax_0_r[] = ", Tmax={0!r}";
+static const char __pyx_k_Tmin_0_r[] = ", Tmin={0!r}";
+static const char __pyx_k_low_rate[] = "low_rate";
+static const char __pyx_k_quantity[] = "quantity";
+static const char __pyx_k_value_si[] = "value_si";
+static const char __pyx_k_Lindemann[] = "Lindemann";
+static const char __pyx_k_ThirdBody[] = "ThirdBody";
+static const char __pyx_k_alpha_0_g[] = ", alpha={0:g}";
+static const char __pyx_k_comment_0[] = ", comment=\"\"\"{0}\"\"\"";
+static const char __pyx_k_high_rate[] = "high_rate";
+static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_ImportError[] = "ImportError";
+static const char __pyx_k_Temperature[] = "Temperature";
+static const char __pyx_k_TroeFalloff[] = "TroeFalloff";
+static const char __pyx_k_change_rate[] = "change_rate";
+static const char __pyx_k_ct_reaction[] = "ct_reaction";
+static const char __pyx_k_arrheniusLow[] = "arrheniusLow";
+static const char __pyx_k_efficiencies[] = "efficiencies";
+static const char __pyx_k_species_list[] = "species_list";
+static const char __pyx_k_Troe___reduce[] = "Troe.__reduce__";
+static const char __pyx_k_arrheniusHigh[] = "arrheniusHigh";
+static const char __pyx_k_other_kinetics[] = "other_kinetics";
+static const char __pyx_k_rmgpy_quantity[] = "rmgpy.quantity";
+static const char __pyx_k_FalloffReaction[] = "FalloffReaction";
+static const char __pyx_k_is_identical_to[] = "is_identical_to";
+static const char __pyx_k_Troe_change_rate[] = "Troe.change_rate";
+static const char __pyx_k_efficiencies_0_r[] = ", efficiencies={0!r}";
+static const char __pyx_k_ThreeBodyReaction[] = "ThreeBodyReaction";
+static const char __pyx_k_Lindemann___reduce[] = "Lindemann.__reduce__";
+static const char __pyx_k_ThirdBody___reduce[] = "ThirdBody.__reduce__";
+static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_to_cantera_kinetics[] = "to_cantera_kinetics";
+static const char __pyx_k_Troe_is_identical_to[] = "Troe.is_identical_to";
+static const char __pyx_k_get_rate_coefficient[] = "get_rate_coefficient";
+static const char __pyx_k_set_cantera_kinetics[] = "set_cantera_kinetics";
+static const char __pyx_k_Lindemann_change_rate[] = "Lindemann.change_rate";
+static const char __pyx_k_ThirdBody_change_rate[] = "ThirdBody.change_rate";
+static const char __pyx_k_rmgpy_kinetics_falloff[] = "rmgpy.kinetics.falloff";
+static const char __pyx_k_get_cantera_efficiencies[] = "get_cantera_efficiencies";
+static const char __pyx_k_Lindemann_is_identical_to[] = "Lindemann.is_identical_to";
+static const char __pyx_k_ThirdBody_is_identical_to[] = "ThirdBody.is_identical_to";
+static const char __pyx_k_Troe_get_rate_coefficient[] = "Troe.get_rate_coefficient";
+static const char __pyx_k_Troe_set_cantera_kinetics[] = "Troe.set_cantera_kinetics";
+static const char __pyx_k_ThirdBody_arrheniusLow_0_r[] = "ThirdBody(arrheniusLow={0!r}";
+static const char __pyx_k_rmgpy_kinetics_falloff_pyx[] = "rmgpy/kinetics/falloff.pyx";
+static const char __pyx_k_Lindemann_get_rate_coefficient[] = "Lindemann.get_rate_coefficient";
+static const char __pyx_k_Lindemann_set_cantera_kinetics[] = "Lindemann.set_cantera_kinetics";
+static const char __pyx_k_ThirdBody_get_rate_coefficient[] = "ThirdBody.get_rate_coefficient";
+static const char __pyx_k_ThirdBody_set_cantera_kinetics[] = "ThirdBody.set_cantera_kinetics";
+static const char __pyx_k_This_module_contains_classes_re[] = "\nThis module contains classes representing pressure-dependent kinetics models\nof \"standard\" falloff.\n";
+static const char __pyx_k_numpy_core_multiarray_failed_to[] = "numpy.core.multiarray failed to import";
+static const char __pyx_k_Lindemann_arrheniusHigh_0_r_arrh[] = "Lindemann(arrheniusHigh={0!r}, arrheniusLow={1!r}";
+static const char __pyx_k_Must_be_a_Cantera_FalloffReactio[] = "Must be a Cantera FalloffReaction object";
+static const char __pyx_k_Must_be_a_Cantera_ThreeBodyReact[] = "Must be a Cantera ThreeBodyReaction object";
+static const char __pyx_k_Troe_arrheniusHigh_0_r_arrhenius[] = "Troe(arrheniusHigh={0!r}, arrheniusLow={1!r}";
+static const char __pyx_k_numpy_core_umath_failed_to_impor[] = "numpy.core.umath failed to import";
+static PyObject *__pyx_kp_u_;
+static PyObject *__pyx_n_s_A;
+static PyObject *__pyx_n_s_Falloff;
+static PyObject *__pyx_n_s_FalloffReaction;
+static PyObject *__pyx_n_s_ImportError;
+static PyObject *__pyx_n_s_Lindemann;
+static PyObject *__pyx_n_s_Lindemann___reduce;
+static PyObject *__pyx_kp_u_Lindemann_arrheniusHigh_0_r_arrh;
+static PyObject *__pyx_n_s_Lindemann_change_rate;
+static PyObject *__pyx_n_s_Lindemann_get_rate_coefficient;
+static PyObject *__pyx_n_s_Lindemann_is_identical_to;
+static PyObject *__pyx_n_s_Lindemann_set_cantera_kinetics;
+static PyObject *__pyx_kp_u_Must_be_a_Cantera_FalloffReactio;
+static PyObject *__pyx_kp_u_Must_be_a_Cantera_ThreeBodyReact;
+static PyObject *__pyx_n_s_P;
+static PyObject *__pyx_n_s_Pmax;
+static PyObject *__pyx_kp_u_Pmax_0_r;
+static PyObject *__pyx_n_s_Pmin;
+static PyObject *__pyx_kp_u_Pmin_0_r;
+static PyObject *__pyx_n_s_T;
+static PyObject *__pyx_n_s_T1;
+static PyObject *__pyx_kp_u_T1_0_r;
+static PyObject *__pyx_n_s_T2;
+static PyObject *__pyx_kp_u_T2_0_r;
+static PyObject *__pyx_n_s_T3;
+static PyObject *__pyx_kp_u_T3_0_r;
+static PyObject *__pyx_n_s_Temperature;
+static PyObject *__pyx_n_s_ThirdBody;
+static PyObject *__pyx_n_s_ThirdBody___reduce;
+static PyObject *__pyx_kp_u_ThirdBody_arrheniusLow_0_r;
+static PyObject *__pyx_n_s_ThirdBody_change_rate;
+static PyObject *__pyx_n_s_ThirdBody_get_rate_coefficient;
+static PyObject *__pyx_n_s_ThirdBody_is_identical_to;
+static PyObject *__pyx_n_s_ThirdBody_set_cantera_kinetics;
+static PyObject *__pyx_n_s_ThreeBodyReaction;
+static PyObject *__pyx_n_s_Tmax;
+static PyObject *__pyx_kp_u_Tmax_0_r;
+static PyObject *__pyx_n_s_Tmin;
+static PyObject *__pyx_kp_u_Tmin_0_r;
+static PyObject *__pyx_n_s_Troe;
+static PyObject *__pyx_n_s_TroeFalloff;
+static PyObject *__pyx_n_s_Troe___reduce;
+static PyObject *__pyx_kp_u_Troe_arrheniusHigh_0_r_arrhenius;
+static PyObject *__pyx_n_s_Troe_change_rate;
+static PyObject *__pyx_n_s_Troe_get_rate_coefficient;
+static PyObject *__pyx_n_s_Troe_is_identical_to;
+static PyObject *__pyx_n_s_Troe_set_cantera_kinetics;
+static PyObject *__pyx_kp_u__2;
+static PyObject *__pyx_n_s__5;
+static PyObject *__pyx_n_s_alpha;
+static PyObject *__pyx_kp_u_alpha_0_g;
+static PyObject *__pyx_n_s_arrheniusHigh;
+static PyObject *__pyx_n_s_arrheniusLow;
+static PyObject *__pyx_n_s_cantera;
+static PyObject *__pyx_n_s_change_rate;
+static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_comment;
+static PyObject *__pyx_kp_u_comment_0;
+static PyObject *__pyx_n_s_ct;
+static PyObject *__pyx_n_s_ct_reaction;
+static PyObject *__pyx_n_s_efficiencies;
+static PyObject *__pyx_kp_u_efficiencies_0_r;
+static PyObject *__pyx_n_s_equals;
+static PyObject *__pyx_n_s_factor;
+static PyObject *__pyx_n_s_falloff;
+static PyObject *__pyx_n_s_format;
+static PyObject *__pyx_n_s_get_cantera_efficiencies;
+static PyObject *__pyx_n_s_get_rate_coefficient;
+static PyObject *__pyx_n_s_high_rate;
+static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_init;
+static PyObject *__pyx_n_s_is_identical_to;
+static PyObject *__pyx_n_s_low_rate;
+static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_name;
+static PyObject *__pyx_kp_u_numpy_core_multiarray_failed_to;
+static PyObject *__pyx_kp_u_numpy_core_umath_failed_to_impor;
+static PyObject *__pyx_n_s_other_kinetics;
+static PyObject *__pyx_n_s_params;
+static PyObject *__pyx_n_s_pyx_vtable;
+static PyObject *__pyx_n_s_quantity;
+static PyObject *__pyx_n_s_reduce;
+static PyObject *__pyx_n_s_rmgpy_kinetics_falloff;
+static PyObject *__pyx_kp_s_rmgpy_kinetics_falloff_pyx;
+static PyObject *__pyx_n_s_rmgpy_quantity;
+static PyObject *__pyx_n_s_self;
+static PyObject *__pyx_n_s_set_cantera_kinetics;
+static PyObject *__pyx_n_s_species_list;
+static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_n_s_to_cantera_kinetics;
+static PyObject *__pyx_n_s_value_si;
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody___init__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self, PyObject *__pyx_v_arrheniusLow, PyObject *__pyx_v_Tmin, PyObject *__pyx_v_Tmax, PyObject *__pyx_v_Pmin, PyObject *__pyx_v_Pmax, PyObject *__pyx_v_efficiencies, PyObject *__pyx_v_comment); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_2__repr__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_4__reduce__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_6get_rate_coefficient(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self, double __pyx_v_T, double __pyx_v_P); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_8is_identical_to(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self, struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *__pyx_v_other_kinetics); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_10change_rate(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self, double __pyx_v_factor); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_12set_cantera_kinetics(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self, PyObject *__pyx_v_ct_reaction, PyObject *__pyx_v_species_list); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_12arrheniusLow___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self); /* proto */
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_12arrheniusLow_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_12arrheniusLow_4__del__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self); /* proto */
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann___init__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self, PyObject *__pyx_v_arrheniusHigh, PyObject *__pyx_v_arrheniusLow, PyObject *__pyx_v_Tmin, PyObject *__pyx_v_Tmax, PyObject *__pyx_v_Pmin, PyObject *__pyx_v_Pmax, PyObject *__pyx_v_efficiencies, PyObject *__pyx_v_comment); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_2__repr__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_4__reduce__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_6get_rate_coefficient(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self, double __pyx_v_T, double __pyx_v_P); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_8is_identical_to(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self, struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *__pyx_v_other_kinetics); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_10change_rate(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self, double __pyx_v_factor); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_12set_cantera_kinetics(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self, PyObject *__pyx_v_ct_reaction, PyObject *__pyx_v_species_list); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_13arrheniusHigh___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self); /* proto */
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_13arrheniusHigh_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_13arrheniusHigh_4__del__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_12arrheniusLow___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self); /* proto */
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_12arrheniusLow_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_12arrheniusLow_4__del__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self); /* proto */
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe___init__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, PyObject *__pyx_v_arrheniusHigh, PyObject *__pyx_v_arrheniusLow, PyObject *__pyx_v_alpha, PyObject *__pyx_v_T3, PyObject *__pyx_v_T1, PyObject *__pyx_v_T2, PyObject *__pyx_v_Tmin, PyObject *__pyx_v_Tmax, PyObject *__pyx_v_Pmin, PyObject *__pyx_v_Pmax, PyObject *__pyx_v_efficiencies, PyObject *__pyx_v_comment); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_2__repr__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_4__reduce__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_2T1___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self); /* proto */
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_2T1_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_2T2___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self); /* proto */
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_2T2_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_2T3___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self); /* proto */
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_2T3_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_6get_rate_coefficient(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, double __pyx_v_T, double __pyx_v_P); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_8is_identical_to(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *__pyx_v_other_kinetics); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_10change_rate(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, double __pyx_v_factor); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_12set_cantera_kinetics(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, PyObject *__pyx_v_ct_reaction, PyObject *__pyx_v_species_list); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_13arrheniusHigh___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self); /* proto */
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_13arrheniusHigh_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_13arrheniusHigh_4__del__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_12arrheniusLow___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self); /* proto */
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_12arrheniusLow_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_12arrheniusLow_4__del__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_5alpha___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self); /* proto */
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_5alpha_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T1___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self); /* proto */
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T1_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T1_4__del__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T2___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self); /* proto */
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T2_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T2_4__del__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T3___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self); /* proto */
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T3_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T3_4__del__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self); /* proto */
+static PyObject *__pyx_tp_new_5rmgpy_8kinetics_7falloff_ThirdBody(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_5rmgpy_8kinetics_7falloff_Lindemann(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_5rmgpy_8kinetics_7falloff_Troe(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_float_0_0;
+static PyObject *__pyx_tuple__3;
+static PyObject *__pyx_tuple__4;
+static PyObject *__pyx_tuple__6;
+static PyObject *__pyx_tuple__8;
+static PyObject *__pyx_tuple__10;
+static PyObject *__pyx_tuple__12;
+static PyObject *__pyx_tuple__14;
+static PyObject *__pyx_tuple__16;
+static PyObject *__pyx_tuple__18;
+static PyObject *__pyx_tuple__20;
+static PyObject *__pyx_tuple__22;
+static PyObject *__pyx_tuple__24;
+static PyObject *__pyx_tuple__26;
+static PyObject *__pyx_tuple__28;
+static PyObject *__pyx_tuple__30;
+static PyObject *__pyx_tuple__32;
+static PyObject *__pyx_tuple__34;
+static PyObject *__pyx_codeobj__7;
+static PyObject *__pyx_codeobj__9;
+static PyObject *__pyx_codeobj__11;
+static PyObject *__pyx_codeobj__13;
+static PyObject *__pyx_codeobj__15;
+static PyObject *__pyx_codeobj__17;
+static PyObject *__pyx_codeobj__19;
+static PyObject *__pyx_codeobj__21;
+static PyObject *__pyx_codeobj__23;
+static PyObject *__pyx_codeobj__25;
+static PyObject *__pyx_codeobj__27;
+static PyObject *__pyx_codeobj__29;
+static PyObject *__pyx_codeobj__31;
+static PyObject *__pyx_codeobj__33;
+static PyObject *__pyx_codeobj__35;
+/* Late includes */
+
+/* "rmgpy/kinetics/falloff.pyx":61
+ *     """
+ * 
+ *     def __init__(self, arrheniusLow=None, Tmin=None, Tmax=None, Pmin=None, Pmax=None, efficiencies=None, comment=''):             # <<<<<<<<<<<<<<
+ *         PDepKineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, efficiencies=efficiencies,
+ *                                    comment=comment)
+ */
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_arrheniusLow = 0;
+  PyObject *__pyx_v_Tmin = 0;
+  PyObject *__pyx_v_Tmax = 0;
+  PyObject *__pyx_v_Pmin = 0;
+  PyObject *__pyx_v_Pmax = 0;
+  PyObject *__pyx_v_efficiencies = 0;
+  PyObject *__pyx_v_comment = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_arrheniusLow,&__pyx_n_s_Tmin,&__pyx_n_s_Tmax,&__pyx_n_s_Pmin,&__pyx_n_s_Pmax,&__pyx_n_s_efficiencies,&__pyx_n_s_comment,0};
+    PyObject* values[7] = {0,0,0,0,0,0,0};
+    values[0] = ((PyObject *)Py_None);
+    values[1] = ((PyObject *)Py_None);
+    values[2] = ((PyObject *)Py_None);
+    values[3] = ((PyObject *)Py_None);
+    values[4] = ((PyObject *)Py_None);
+    values[5] = ((PyObject *)Py_None);
+    values[6] = ((PyObject *)__pyx_kp_u_);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_arrheniusLow);
+          if (value) { values[0] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_Tmin);
+          if (value) { values[1] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_Tmax);
+          if (value) { values[2] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_Pmin);
+          if (value) { values[3] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_Pmax);
+          if (value) { values[4] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_efficiencies);
+          if (value) { values[5] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_comment);
+          if (value) { values[6] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 61, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_arrheniusLow = values[0];
+    __pyx_v_Tmin = values[1];
+    __pyx_v_Tmax = values[2];
+    __pyx_v_Pmin = values[3];
+    __pyx_v_Pmax = values[4];
+    __pyx_v_efficiencies = values[5];
+    __pyx_v_comment = values[6];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 0, 7, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 61, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.ThirdBody.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody___init__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *)__pyx_v_self), __pyx_v_arrheniusLow, __pyx_v_Tmin, __pyx_v_Tmax, __pyx_v_Pmin, __pyx_v_Pmax, __pyx_v_efficiencies, __pyx_v_comment);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody___init__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self, PyObject *__pyx_v_arrheniusLow, PyObject *__pyx_v_Tmin, PyObject *__pyx_v_Tmax, PyObject *__pyx_v_Pmin, PyObject *__pyx_v_Pmax, PyObject *__pyx_v_efficiencies, PyObject *__pyx_v_comment) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "rmgpy/kinetics/falloff.pyx":62
+ * 
+ *     def __init__(self, arrheniusLow=None, Tmin=None, Tmax=None, Pmin=None, Pmax=None, efficiencies=None, comment=''):
+ *         PDepKineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, efficiencies=efficiencies,             # <<<<<<<<<<<<<<
+ *                                    comment=comment)
+ *         self.arrheniusLow = arrheniusLow
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel), __pyx_n_s_init); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 62, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 62, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self));
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 62, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_Tmin, __pyx_v_Tmin) < 0) __PYX_ERR(0, 62, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_Tmax, __pyx_v_Tmax) < 0) __PYX_ERR(0, 62, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_Pmin, __pyx_v_Pmin) < 0) __PYX_ERR(0, 62, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_Pmax, __pyx_v_Pmax) < 0) __PYX_ERR(0, 62, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_efficiencies, __pyx_v_efficiencies) < 0) __PYX_ERR(0, 62, __pyx_L1_error)
+
+  /* "rmgpy/kinetics/falloff.pyx":63
+ *     def __init__(self, arrheniusLow=None, Tmin=None, Tmax=None, Pmin=None, Pmax=None, efficiencies=None, comment=''):
+ *         PDepKineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, efficiencies=efficiencies,
+ *                                    comment=comment)             # <<<<<<<<<<<<<<
+ *         self.arrheniusLow = arrheniusLow
+ * 
+ */
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_comment, __pyx_v_comment) < 0) __PYX_ERR(0, 62, __pyx_L1_error)
+
+  /* "rmgpy/kinetics/falloff.pyx":62
+ * 
+ *     def __init__(self, arrheniusLow=None, Tmin=None, Tmax=None, Pmin=None, Pmax=None, efficiencies=None, comment=''):
+ *         PDepKineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, efficiencies=efficiencies,             # <<<<<<<<<<<<<<
+ *                                    comment=comment)
+ *         self.arrheniusLow = arrheniusLow
+ */
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 62, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":64
+ *         PDepKineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, efficiencies=efficiencies,
+ *                                    comment=comment)
+ *         self.arrheniusLow = arrheniusLow             # <<<<<<<<<<<<<<
+ * 
+ *     def __repr__(self):
+ */
+  if (!(likely(((__pyx_v_arrheniusLow) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_arrheniusLow, __pyx_ptype_5rmgpy_8kinetics_9arrhenius_Arrhenius))))) __PYX_ERR(0, 64, __pyx_L1_error)
+  __pyx_t_4 = __pyx_v_arrheniusLow;
+  __Pyx_INCREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_4);
+  __Pyx_GOTREF(__pyx_v_self->arrheniusLow);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->arrheniusLow));
+  __pyx_v_self->arrheniusLow = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":61
+ *     """
+ * 
+ *     def __init__(self, arrheniusLow=None, Tmin=None, Tmax=None, Pmin=None, Pmax=None, efficiencies=None, comment=''):             # <<<<<<<<<<<<<<
+ *         PDepKineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, efficiencies=efficiencies,
+ *                                    comment=comment)
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.ThirdBody.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":66
+ *         self.arrheniusLow = arrheniusLow
+ * 
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Return a string representation that can be used to reconstruct the
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_3__repr__(PyObject *__pyx_v_self); /*proto*/
+static char __pyx_doc_5rmgpy_8kinetics_7falloff_9ThirdBody_2__repr__[] = "\n        Return a string representation that can be used to reconstruct the\n        ThirdBody object.\n        ";
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_5rmgpy_8kinetics_7falloff_9ThirdBody_2__repr__;
+#endif
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_3__repr__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__repr__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_2__repr__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_2__repr__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self) {
+  PyObject *__pyx_v_string = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__repr__", 0);
+
+  /* "rmgpy/kinetics/falloff.pyx":71
+ *         ThirdBody object.
+ *         """
+ *         string = 'ThirdBody(arrheniusLow={0!r}'.format(self.arrheniusLow)             # <<<<<<<<<<<<<<
+ *         if self.efficiencies is not None: string += ', efficiencies={0!r}'.format(self.efficiencies)
+ *         if self.Tmin is not None: string += ', Tmin={0!r}'.format(self.Tmin)
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_ThirdBody_arrheniusLow_0_r, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 71, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, ((PyObject *)__pyx_v_self->arrheniusLow)) : __Pyx_PyObject_CallOneArg(__pyx_t_2, ((PyObject *)__pyx_v_self->arrheniusLow));
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 71, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_string = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":72
+ *         """
+ *         string = 'ThirdBody(arrheniusLow={0!r}'.format(self.arrheniusLow)
+ *         if self.efficiencies is not None: string += ', efficiencies={0!r}'.format(self.efficiencies)             # <<<<<<<<<<<<<<
+ *         if self.Tmin is not None: string += ', Tmin={0!r}'.format(self.Tmin)
+ *         if self.Tmax is not None: string += ', Tmax={0!r}'.format(self.Tmax)
+ */
+  __pyx_t_4 = (__pyx_v_self->__pyx_base.efficiencies != ((PyObject*)Py_None));
+  __pyx_t_5 = (__pyx_t_4 != 0);
+  if (__pyx_t_5) {
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_efficiencies_0_r, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 72, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_v_self->__pyx_base.efficiencies) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_self->__pyx_base.efficiencies);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 72, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 72, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_2);
+    __pyx_t_2 = 0;
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":73
+ *         string = 'ThirdBody(arrheniusLow={0!r}'.format(self.arrheniusLow)
+ *         if self.efficiencies is not None: string += ', efficiencies={0!r}'.format(self.efficiencies)
+ *         if self.Tmin is not None: string += ', Tmin={0!r}'.format(self.Tmin)             # <<<<<<<<<<<<<<
+ *         if self.Tmax is not None: string += ', Tmax={0!r}'.format(self.Tmax)
+ *         if self.Pmin is not None: string += ', Pmin={0!r}'.format(self.Pmin)
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Tmin); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 73, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = (__pyx_t_2 != Py_None);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_4 = (__pyx_t_5 != 0);
+  if (__pyx_t_4) {
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Tmin_0_r, __pyx_n_s_format); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 73, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Tmin); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 73, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_6, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 73, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 73, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_1);
+    __pyx_t_1 = 0;
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":74
+ *         if self.efficiencies is not None: string += ', efficiencies={0!r}'.format(self.efficiencies)
+ *         if self.Tmin is not None: string += ', Tmin={0!r}'.format(self.Tmin)
+ *         if self.Tmax is not None: string += ', Tmax={0!r}'.format(self.Tmax)             # <<<<<<<<<<<<<<
+ *         if self.Pmin is not None: string += ', Pmin={0!r}'.format(self.Pmin)
+ *         if self.Pmax is not None: string += ', Pmax={0!r}'.format(self.Pmax)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Tmax); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 74, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = (__pyx_t_1 != Py_None);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_5 = (__pyx_t_4 != 0);
+  if (__pyx_t_5) {
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Tmax_0_r, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 74, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Tmax); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 74, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_6, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 74, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 74, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_2);
+    __pyx_t_2 = 0;
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":75
+ *         if self.Tmin is not None: string += ', Tmin={0!r}'.format(self.Tmin)
+ *         if self.Tmax is not None: string += ', Tmax={0!r}'.format(self.Tmax)
+ *         if self.Pmin is not None: string += ', Pmin={0!r}'.format(self.Pmin)             # <<<<<<<<<<<<<<
+ *         if self.Pmax is not None: string += ', Pmax={0!r}'.format(self.Pmax)
+ *         if self.comment != '': string += ', comment="""{0}"""'.format(self.comment)
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Pmin); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 75, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = (__pyx_t_2 != Py_None);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_4 = (__pyx_t_5 != 0);
+  if (__pyx_t_4) {
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Pmin_0_r, __pyx_n_s_format); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 75, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Pmin); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 75, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_6, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 75, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 75, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_1);
+    __pyx_t_1 = 0;
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":76
+ *         if self.Tmax is not None: string += ', Tmax={0!r}'.format(self.Tmax)
+ *         if self.Pmin is not None: string += ', Pmin={0!r}'.format(self.Pmin)
+ *         if self.Pmax is not None: string += ', Pmax={0!r}'.format(self.Pmax)             # <<<<<<<<<<<<<<
+ *         if self.comment != '': string += ', comment="""{0}"""'.format(self.comment)
+ *         string += ')'
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Pmax); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = (__pyx_t_1 != Py_None);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_5 = (__pyx_t_4 != 0);
+  if (__pyx_t_5) {
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Pmax_0_r, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 76, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Pmax); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 76, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_6, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 76, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 76, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_2);
+    __pyx_t_2 = 0;
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":77
+ *         if self.Pmin is not None: string += ', Pmin={0!r}'.format(self.Pmin)
+ *         if self.Pmax is not None: string += ', Pmax={0!r}'.format(self.Pmax)
+ *         if self.comment != '': string += ', comment="""{0}"""'.format(self.comment)             # <<<<<<<<<<<<<<
+ *         string += ')'
+ *         return string
+ */
+  __pyx_t_5 = (__Pyx_PyUnicode_Equals(__pyx_v_self->__pyx_base.__pyx_base.comment, __pyx_kp_u_, Py_NE)); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __pyx_t_4 = (__pyx_t_5 != 0);
+  if (__pyx_t_4) {
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_comment_0, __pyx_n_s_format); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 77, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_3, __pyx_v_self->__pyx_base.__pyx_base.comment) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_self->__pyx_base.__pyx_base.comment);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 77, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 77, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_1);
+    __pyx_t_1 = 0;
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":78
+ *         if self.Pmax is not None: string += ', Pmax={0!r}'.format(self.Pmax)
+ *         if self.comment != '': string += ', comment="""{0}"""'.format(self.comment)
+ *         string += ')'             # <<<<<<<<<<<<<<
+ *         return string
+ * 
+ */
+  __pyx_t_1 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_kp_u__2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 78, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":79
+ *         if self.comment != '': string += ', comment="""{0}"""'.format(self.comment)
+ *         string += ')'
+ *         return string             # <<<<<<<<<<<<<<
+ * 
+ *     def __reduce__(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_string);
+  __pyx_r = __pyx_v_string;
+  goto __pyx_L0;
+
+  /* "rmgpy/kinetics/falloff.pyx":66
+ *         self.arrheniusLow = arrheniusLow
+ * 
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Return a string representation that can be used to reconstruct the
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.ThirdBody.__repr__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_string);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":81
+ *         return string
+ * 
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         A helper function used when pickling a ThirdBody object.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_5__reduce__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_5rmgpy_8kinetics_7falloff_9ThirdBody_4__reduce__[] = "ThirdBody.__reduce__(self)\n\n        A helper function used when pickling a ThirdBody object.\n        ";
+static PyMethodDef __pyx_mdef_5rmgpy_8kinetics_7falloff_9ThirdBody_5__reduce__ = {"__reduce__", (PyCFunction)__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_5__reduce__, METH_NOARGS, __pyx_doc_5rmgpy_8kinetics_7falloff_9ThirdBody_4__reduce__};
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_5__reduce__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_4__reduce__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_4__reduce__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce__", 0);
+
+  /* "rmgpy/kinetics/falloff.pyx":85
+ *         A helper function used when pickling a ThirdBody object.
+ *         """
+ *         return (ThirdBody, (self.arrheniusLow, self.Tmin, self.Tmax, self.Pmin, self.Pmax,             # <<<<<<<<<<<<<<
+ *                             self.efficiencies, self.comment))
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Tmin); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Tmax); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Pmin); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Pmax); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+
+  /* "rmgpy/kinetics/falloff.pyx":86
+ *         """
+ *         return (ThirdBody, (self.arrheniusLow, self.Tmin, self.Tmax, self.Pmin, self.Pmax,
+ *                             self.efficiencies, self.comment))             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=0.0) except -1:
+ */
+  __pyx_t_5 = PyTuple_New(7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->arrheniusLow));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self->arrheniusLow));
+  PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_v_self->arrheniusLow));
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_5, 2, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_5, 3, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_5, 4, __pyx_t_4);
+  __Pyx_INCREF(__pyx_v_self->__pyx_base.efficiencies);
+  __Pyx_GIVEREF(__pyx_v_self->__pyx_base.efficiencies);
+  PyTuple_SET_ITEM(__pyx_t_5, 5, __pyx_v_self->__pyx_base.efficiencies);
+  __Pyx_INCREF(__pyx_v_self->__pyx_base.__pyx_base.comment);
+  __Pyx_GIVEREF(__pyx_v_self->__pyx_base.__pyx_base.comment);
+  PyTuple_SET_ITEM(__pyx_t_5, 6, __pyx_v_self->__pyx_base.__pyx_base.comment);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_4 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":85
+ *         A helper function used when pickling a ThirdBody object.
+ *         """
+ *         return (ThirdBody, (self.arrheniusLow, self.Tmin, self.Tmax, self.Pmin, self.Pmax,             # <<<<<<<<<<<<<<
+ *                             self.efficiencies, self.comment))
+ * 
+ */
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_ThirdBody));
+  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_ThirdBody));
+  PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_ThirdBody));
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "rmgpy/kinetics/falloff.pyx":81
+ *         return string
+ * 
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         A helper function used when pickling a ThirdBody object.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.ThirdBody.__reduce__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":88
+ *                             self.efficiencies, self.comment))
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=0.0) except -1:             # <<<<<<<<<<<<<<
+ *         """
+ *         Return the value of the rate coefficient :math:`k(T)` in units of m^3,
+ */
+
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_7get_rate_coefficient(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static double __pyx_f_5rmgpy_8kinetics_7falloff_9ThirdBody_get_rate_coefficient(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self, double __pyx_v_T, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8kinetics_7falloff_9ThirdBody_get_rate_coefficient *__pyx_optional_args) {
+  double __pyx_v_P = ((double)0.0);
+  double __pyx_v_C;
+  double __pyx_v_k0;
+  double __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  double __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_rate_coefficient", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_P = __pyx_optional_args->P;
+    }
+  }
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get_rate_coefficient); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 88, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_7get_rate_coefficient)) {
+        __pyx_t_3 = PyFloat_FromDouble(__pyx_v_T); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 88, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_4 = PyFloat_FromDouble(__pyx_v_P); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 88, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_5 = __pyx_t_1; __pyx_t_6 = NULL;
+        __pyx_t_7 = 0;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+          __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+          if (likely(__pyx_t_6)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+            __Pyx_INCREF(__pyx_t_6);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_5, function);
+            __pyx_t_7 = 1;
+          }
+        }
+        #if CYTHON_FAST_PYCALL
+        if (PyFunction_Check(__pyx_t_5)) {
+          PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_3, __pyx_t_4};
+          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 88, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        } else
+        #endif
+        #if CYTHON_FAST_PYCCALL
+        if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
+          PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_3, __pyx_t_4};
+          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 88, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        } else
+        #endif
+        {
+          __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 88, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          if (__pyx_t_6) {
+            __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6); __pyx_t_6 = NULL;
+          }
+          __Pyx_GIVEREF(__pyx_t_3);
+          PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_7, __pyx_t_3);
+          __Pyx_GIVEREF(__pyx_t_4);
+          PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_4);
+          __pyx_t_3 = 0;
+          __pyx_t_4 = 0;
+          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_8, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 88, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        }
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __pyx_t_9 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_9 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 88, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __pyx_r = __pyx_t_9;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":98
+ *         cdef double C, k0
+ * 
+ *         C = P / constants.R / T  # bath gas concentration in mol/m^3             # <<<<<<<<<<<<<<
+ *         k0 = self.arrheniusLow.get_rate_coefficient(T)
+ * 
+ */
+  __pyx_v_C = ((__pyx_v_P / __pyx_v_5rmgpy_9constants_R) / __pyx_v_T);
+
+  /* "rmgpy/kinetics/falloff.pyx":99
+ * 
+ *         C = P / constants.R / T  # bath gas concentration in mol/m^3
+ *         k0 = self.arrheniusLow.get_rate_coefficient(T)             # <<<<<<<<<<<<<<
+ * 
+ *         return k0 * C
+ */
+  __pyx_t_9 = ((struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_v_self->arrheniusLow->__pyx_base.__pyx_vtab)->__pyx_base.get_rate_coefficient(((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_v_self->arrheniusLow), __pyx_v_T, 0, NULL); if (unlikely(__pyx_t_9 == ((double)-1.0))) __PYX_ERR(0, 99, __pyx_L1_error)
+  __pyx_v_k0 = __pyx_t_9;
+
+  /* "rmgpy/kinetics/falloff.pyx":101
+ *         k0 = self.arrheniusLow.get_rate_coefficient(T)
+ * 
+ *         return k0 * C             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:
+ */
+  __pyx_r = (__pyx_v_k0 * __pyx_v_C);
+  goto __pyx_L0;
+
+  /* "rmgpy/kinetics/falloff.pyx":88
+ *                             self.efficiencies, self.comment))
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=0.0) except -1:             # <<<<<<<<<<<<<<
+ *         """
+ *         Return the value of the rate coefficient :math:`k(T)` in units of m^3,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.ThirdBody.get_rate_coefficient", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1.0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_7get_rate_coefficient(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5rmgpy_8kinetics_7falloff_9ThirdBody_6get_rate_coefficient[] = "ThirdBody.get_rate_coefficient(self, double T, double P=0.0) -> double\n\n        Return the value of the rate coefficient :math:`k(T)` in units of m^3,\n        mol, and s at the specified temperature `T` in K and pressure `P` in\n        Pa. If you wish to consider collision efficiencies, then you should\n        first use :meth:`get_effective_pressure()` to compute the effective\n        pressure, and pass that value as the pressure to this method.\n        ";
+static PyMethodDef __pyx_mdef_5rmgpy_8kinetics_7falloff_9ThirdBody_7get_rate_coefficient = {"get_rate_coefficient", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_7get_rate_coefficient, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5rmgpy_8kinetics_7falloff_9ThirdBody_6get_rate_coefficient};
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_7get_rate_coefficient(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  double __pyx_v_T;
+  double __pyx_v_P;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("get_rate_coefficient (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_T,&__pyx_n_s_P,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_T)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_P);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "get_rate_coefficient") < 0)) __PYX_ERR(0, 88, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_T = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_T == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 88, __pyx_L3_error)
+    if (values[1]) {
+      __pyx_v_P = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_P == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 88, __pyx_L3_error)
+    } else {
+      __pyx_v_P = ((double)0.0);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("get_rate_coefficient", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 88, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.ThirdBody.get_rate_coefficient", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_6get_rate_coefficient(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *)__pyx_v_self), __pyx_v_T, __pyx_v_P);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_6get_rate_coefficient(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self, double __pyx_v_T, double __pyx_v_P) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  double __pyx_t_1;
+  struct __pyx_opt_args_5rmgpy_8kinetics_5model_13KineticsModel_get_rate_coefficient __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_rate_coefficient", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2.__pyx_n = 1;
+  __pyx_t_2.P = __pyx_v_P;
+  __pyx_t_1 = __pyx_vtabptr_5rmgpy_8kinetics_7falloff_ThirdBody->__pyx_base.__pyx_base.get_rate_coefficient(((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_v_self), __pyx_v_T, 1, &__pyx_t_2); if (unlikely(__pyx_t_1 == ((double)-1.0))) __PYX_ERR(0, 88, __pyx_L1_error)
+  __pyx_t_3 = PyFloat_FromDouble(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 88, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.ThirdBody.get_rate_coefficient", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":103
+ *         return k0 * C
+ * 
+ *     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:             # <<<<<<<<<<<<<<
+ *         """
+ *         Checks to see if kinetics matches that of other kinetics and returns ``True``
+ */
+
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_9is_identical_to(PyObject *__pyx_v_self, PyObject *__pyx_v_other_kinetics); /*proto*/
+static int __pyx_f_5rmgpy_8kinetics_7falloff_9ThirdBody_is_identical_to(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self, struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *__pyx_v_other_kinetics, int __pyx_skip_dispatch) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("is_identical_to", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_is_identical_to); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 103, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_9is_identical_to)) {
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, ((PyObject *)__pyx_v_other_kinetics)) : __Pyx_PyObject_CallOneArg(__pyx_t_3, ((PyObject *)__pyx_v_other_kinetics));
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 103, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 103, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __pyx_r = __pyx_t_5;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":108
+ *         if coeffs, kunits, Tmin,
+ *         """
+ *         if not isinstance(other_kinetics, ThirdBody):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):
+ */
+  __pyx_t_5 = __Pyx_TypeCheck(((PyObject *)__pyx_v_other_kinetics), __pyx_ptype_5rmgpy_8kinetics_7falloff_ThirdBody); 
+  __pyx_t_6 = ((!(__pyx_t_5 != 0)) != 0);
+  if (__pyx_t_6) {
+
+    /* "rmgpy/kinetics/falloff.pyx":109
+ *         """
+ *         if not isinstance(other_kinetics, ThirdBody):
+ *             return False             # <<<<<<<<<<<<<<
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):
+ *             return False
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "rmgpy/kinetics/falloff.pyx":108
+ *         if coeffs, kunits, Tmin,
+ *         """
+ *         if not isinstance(other_kinetics, ThirdBody):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):
+ */
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":110
+ *         if not isinstance(other_kinetics, ThirdBody):
+ *             return False
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if not self.arrheniusLow.is_identical_to(other_kinetics.arrheniusLow):
+ */
+  __pyx_t_6 = __pyx_vtabptr_5rmgpy_8kinetics_5model_KineticsModel->is_identical_to(((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_v_self), __pyx_v_other_kinetics, 1); if (unlikely(__pyx_t_6 == ((int)-2))) __PYX_ERR(0, 110, __pyx_L1_error)
+  __pyx_t_5 = ((!(__pyx_t_6 != 0)) != 0);
+  if (__pyx_t_5) {
+
+    /* "rmgpy/kinetics/falloff.pyx":111
+ *             return False
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):
+ *             return False             # <<<<<<<<<<<<<<
+ *         if not self.arrheniusLow.is_identical_to(other_kinetics.arrheniusLow):
+ *             return False
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "rmgpy/kinetics/falloff.pyx":110
+ *         if not isinstance(other_kinetics, ThirdBody):
+ *             return False
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if not self.arrheniusLow.is_identical_to(other_kinetics.arrheniusLow):
+ */
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":112
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):
+ *             return False
+ *         if not self.arrheniusLow.is_identical_to(other_kinetics.arrheniusLow):             # <<<<<<<<<<<<<<
+ *             return False
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_other_kinetics), __pyx_n_s_arrheniusLow); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 112, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5rmgpy_8kinetics_5model_KineticsModel))))) __PYX_ERR(0, 112, __pyx_L1_error)
+  __pyx_t_5 = ((struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_v_self->arrheniusLow->__pyx_base.__pyx_vtab)->__pyx_base.is_identical_to(((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_v_self->arrheniusLow), ((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_t_1), 0); if (unlikely(__pyx_t_5 == ((int)-2))) __PYX_ERR(0, 112, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_6 = ((!(__pyx_t_5 != 0)) != 0);
+  if (__pyx_t_6) {
+
+    /* "rmgpy/kinetics/falloff.pyx":113
+ *             return False
+ *         if not self.arrheniusLow.is_identical_to(other_kinetics.arrheniusLow):
+ *             return False             # <<<<<<<<<<<<<<
+ * 
+ *         return True
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "rmgpy/kinetics/falloff.pyx":112
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):
+ *             return False
+ *         if not self.arrheniusLow.is_identical_to(other_kinetics.arrheniusLow):             # <<<<<<<<<<<<<<
+ *             return False
+ * 
+ */
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":115
+ *             return False
+ * 
+ *         return True             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef change_rate(self, double factor):
+ */
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "rmgpy/kinetics/falloff.pyx":103
+ *         return k0 * C
+ * 
+ *     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:             # <<<<<<<<<<<<<<
+ *         """
+ *         Checks to see if kinetics matches that of other kinetics and returns ``True``
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.ThirdBody.is_identical_to", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -2;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_9is_identical_to(PyObject *__pyx_v_self, PyObject *__pyx_v_other_kinetics); /*proto*/
+static char __pyx_doc_5rmgpy_8kinetics_7falloff_9ThirdBody_8is_identical_to[] = "ThirdBody.is_identical_to(self, KineticsModel other_kinetics) -> bool\n\n        Checks to see if kinetics matches that of other kinetics and returns ``True``\n        if coeffs, kunits, Tmin,\n        ";
+static PyMethodDef __pyx_mdef_5rmgpy_8kinetics_7falloff_9ThirdBody_9is_identical_to = {"is_identical_to", (PyCFunction)__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_9is_identical_to, METH_O, __pyx_doc_5rmgpy_8kinetics_7falloff_9ThirdBody_8is_identical_to};
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_9is_identical_to(PyObject *__pyx_v_self, PyObject *__pyx_v_other_kinetics) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("is_identical_to (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_other_kinetics), __pyx_ptype_5rmgpy_8kinetics_5model_KineticsModel, 1, "other_kinetics", 0))) __PYX_ERR(0, 103, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_8is_identical_to(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *)__pyx_v_self), ((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_v_other_kinetics));
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_8is_identical_to(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self, struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *__pyx_v_other_kinetics) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("is_identical_to", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_5rmgpy_8kinetics_7falloff_9ThirdBody_is_identical_to(__pyx_v_self, __pyx_v_other_kinetics, 1); if (unlikely(__pyx_t_1 == ((int)-2))) __PYX_ERR(0, 103, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 103, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.ThirdBody.is_identical_to", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":117
+ *         return True
+ * 
+ *     cpdef change_rate(self, double factor):             # <<<<<<<<<<<<<<
+ *         """
+ *         Changes kinetics rate by a multiple ``factor``.
+ */
+
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_11change_rate(PyObject *__pyx_v_self, PyObject *__pyx_arg_factor); /*proto*/
+static PyObject *__pyx_f_5rmgpy_8kinetics_7falloff_9ThirdBody_change_rate(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self, double __pyx_v_factor, int __pyx_skip_dispatch) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("change_rate", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_change_rate); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 117, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_11change_rate)) {
+        __Pyx_XDECREF(__pyx_r);
+        __pyx_t_3 = PyFloat_FromDouble(__pyx_v_factor); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 117, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_4 = __pyx_t_1; __pyx_t_5 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+          __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+          if (likely(__pyx_t_5)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+            __Pyx_INCREF(__pyx_t_5);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_4, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 117, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":121
+ *         Changes kinetics rate by a multiple ``factor``.
+ *         """
+ *         self.arrheniusLow.change_rate(factor)             # <<<<<<<<<<<<<<
+ * 
+ *     def set_cantera_kinetics(self, ct_reaction, species_list):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_v_self->arrheniusLow->__pyx_base.__pyx_vtab)->change_rate(__pyx_v_self->arrheniusLow, __pyx_v_factor, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 121, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":117
+ *         return True
+ * 
+ *     cpdef change_rate(self, double factor):             # <<<<<<<<<<<<<<
+ *         """
+ *         Changes kinetics rate by a multiple ``factor``.
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.ThirdBody.change_rate", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_11change_rate(PyObject *__pyx_v_self, PyObject *__pyx_arg_factor); /*proto*/
+static char __pyx_doc_5rmgpy_8kinetics_7falloff_9ThirdBody_10change_rate[] = "ThirdBody.change_rate(self, double factor)\n\n        Changes kinetics rate by a multiple ``factor``.\n        ";
+static PyMethodDef __pyx_mdef_5rmgpy_8kinetics_7falloff_9ThirdBody_11change_rate = {"change_rate", (PyCFunction)__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_11change_rate, METH_O, __pyx_doc_5rmgpy_8kinetics_7falloff_9ThirdBody_10change_rate};
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_11change_rate(PyObject *__pyx_v_self, PyObject *__pyx_arg_factor) {
+  double __pyx_v_factor;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("change_rate (wrapper)", 0);
+  assert(__pyx_arg_factor); {
+    __pyx_v_factor = __pyx_PyFloat_AsDouble(__pyx_arg_factor); if (unlikely((__pyx_v_factor == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 117, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.ThirdBody.change_rate", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_10change_rate(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *)__pyx_v_self), ((double)__pyx_v_factor));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_10change_rate(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self, double __pyx_v_factor) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("change_rate", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_5rmgpy_8kinetics_7falloff_9ThirdBody_change_rate(__pyx_v_self, __pyx_v_factor, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.ThirdBody.change_rate", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":123
+ *         self.arrheniusLow.change_rate(factor)
+ * 
+ *     def set_cantera_kinetics(self, ct_reaction, species_list):             # <<<<<<<<<<<<<<
+ *         """
+ *         Sets the kinetics and efficiencies for a cantera `ThreeBodyReaction` object
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_13set_cantera_kinetics(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5rmgpy_8kinetics_7falloff_9ThirdBody_12set_cantera_kinetics[] = "ThirdBody.set_cantera_kinetics(self, ct_reaction, species_list)\n\n        Sets the kinetics and efficiencies for a cantera `ThreeBodyReaction` object\n        ";
+static PyMethodDef __pyx_mdef_5rmgpy_8kinetics_7falloff_9ThirdBody_13set_cantera_kinetics = {"set_cantera_kinetics", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_13set_cantera_kinetics, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5rmgpy_8kinetics_7falloff_9ThirdBody_12set_cantera_kinetics};
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_13set_cantera_kinetics(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_ct_reaction = 0;
+  PyObject *__pyx_v_species_list = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("set_cantera_kinetics (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_ct_reaction,&__pyx_n_s_species_list,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ct_reaction)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_species_list)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("set_cantera_kinetics", 1, 2, 2, 1); __PYX_ERR(0, 123, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "set_cantera_kinetics") < 0)) __PYX_ERR(0, 123, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_ct_reaction = values[0];
+    __pyx_v_species_list = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("set_cantera_kinetics", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 123, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.ThirdBody.set_cantera_kinetics", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_12set_cantera_kinetics(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *)__pyx_v_self), __pyx_v_ct_reaction, __pyx_v_species_list);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_12set_cantera_kinetics(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self, PyObject *__pyx_v_ct_reaction, PyObject *__pyx_v_species_list) {
+  PyObject *__pyx_v_ct = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("set_cantera_kinetics", 0);
+
+  /* "rmgpy/kinetics/falloff.pyx":127
+ *         Sets the kinetics and efficiencies for a cantera `ThreeBodyReaction` object
+ *         """
+ *         import cantera as ct             # <<<<<<<<<<<<<<
+ *         assert isinstance(ct_reaction, ct.ThreeBodyReaction), "Must be a Cantera ThreeBodyReaction object"
+ *         ct_reaction.efficiencies = PDepKineticsModel.get_cantera_efficiencies(self, species_list)
+ */
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_cantera, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 127, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_ct = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":128
+ *         """
+ *         import cantera as ct
+ *         assert isinstance(ct_reaction, ct.ThreeBodyReaction), "Must be a Cantera ThreeBodyReaction object"             # <<<<<<<<<<<<<<
+ *         ct_reaction.efficiencies = PDepKineticsModel.get_cantera_efficiencies(self, species_list)
+ *         self.arrheniusLow.set_cantera_kinetics(ct_reaction, species_list)
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_ct, __pyx_n_s_ThreeBodyReaction); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 128, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyObject_IsInstance(__pyx_v_ct_reaction, __pyx_t_1); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 128, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(!(__pyx_t_2 != 0))) {
+      PyErr_SetObject(PyExc_AssertionError, __pyx_kp_u_Must_be_a_Cantera_ThreeBodyReact);
+      __PYX_ERR(0, 128, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "rmgpy/kinetics/falloff.pyx":129
+ *         import cantera as ct
+ *         assert isinstance(ct_reaction, ct.ThreeBodyReaction), "Must be a Cantera ThreeBodyReaction object"
+ *         ct_reaction.efficiencies = PDepKineticsModel.get_cantera_efficiencies(self, species_list)             # <<<<<<<<<<<<<<
+ *         self.arrheniusLow.set_cantera_kinetics(ct_reaction, species_list)
+ * 
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel), __pyx_n_s_get_cantera_efficiencies); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 129, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = NULL;
+  __pyx_t_5 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_5 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, ((PyObject *)__pyx_v_self), __pyx_v_species_list};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 129, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, ((PyObject *)__pyx_v_self), __pyx_v_species_list};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 129, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  {
+    __pyx_t_6 = PyTuple_New(2+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 129, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    if (__pyx_t_4) {
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    }
+    __Pyx_INCREF(((PyObject *)__pyx_v_self));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+    PyTuple_SET_ITEM(__pyx_t_6, 0+__pyx_t_5, ((PyObject *)__pyx_v_self));
+    __Pyx_INCREF(__pyx_v_species_list);
+    __Pyx_GIVEREF(__pyx_v_species_list);
+    PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_5, __pyx_v_species_list);
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 129, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_ct_reaction, __pyx_n_s_efficiencies, __pyx_t_1) < 0) __PYX_ERR(0, 129, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":130
+ *         assert isinstance(ct_reaction, ct.ThreeBodyReaction), "Must be a Cantera ThreeBodyReaction object"
+ *         ct_reaction.efficiencies = PDepKineticsModel.get_cantera_efficiencies(self, species_list)
+ *         self.arrheniusLow.set_cantera_kinetics(ct_reaction, species_list)             # <<<<<<<<<<<<<<
+ * 
+ * ################################################################################
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self->arrheniusLow), __pyx_n_s_set_cantera_kinetics); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 130, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = NULL;
+  __pyx_t_5 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_5 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_v_ct_reaction, __pyx_v_species_list};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 130, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_v_ct_reaction, __pyx_v_species_list};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 130, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  {
+    __pyx_t_4 = PyTuple_New(2+__pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 130, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    if (__pyx_t_6) {
+      __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_6); __pyx_t_6 = NULL;
+    }
+    __Pyx_INCREF(__pyx_v_ct_reaction);
+    __Pyx_GIVEREF(__pyx_v_ct_reaction);
+    PyTuple_SET_ITEM(__pyx_t_4, 0+__pyx_t_5, __pyx_v_ct_reaction);
+    __Pyx_INCREF(__pyx_v_species_list);
+    __Pyx_GIVEREF(__pyx_v_species_list);
+    PyTuple_SET_ITEM(__pyx_t_4, 1+__pyx_t_5, __pyx_v_species_list);
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 130, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":123
+ *         self.arrheniusLow.change_rate(factor)
+ * 
+ *     def set_cantera_kinetics(self, ct_reaction, species_list):             # <<<<<<<<<<<<<<
+ *         """
+ *         Sets the kinetics and efficiencies for a cantera `ThreeBodyReaction` object
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.ThirdBody.set_cantera_kinetics", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_ct);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pxd":36
+ * cdef class ThirdBody(PDepKineticsModel):
+ * 
+ *     cdef public Arrhenius arrheniusLow             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=?) except -1
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_12arrheniusLow_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_12arrheniusLow_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_12arrheniusLow___get__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_12arrheniusLow___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->arrheniusLow));
+  __pyx_r = ((PyObject *)__pyx_v_self->arrheniusLow);
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_12arrheniusLow_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_12arrheniusLow_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_12arrheniusLow_2__set__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_12arrheniusLow_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  if (!(likely(((__pyx_v_value) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_value, __pyx_ptype_5rmgpy_8kinetics_9arrhenius_Arrhenius))))) __PYX_ERR(1, 36, __pyx_L1_error)
+  __pyx_t_1 = __pyx_v_value;
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_self->arrheniusLow);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->arrheniusLow));
+  __pyx_v_self->arrheniusLow = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.ThirdBody.arrheniusLow.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_12arrheniusLow_5__del__(PyObject *__pyx_v_self); /*proto*/
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_12arrheniusLow_5__del__(PyObject *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_12arrheniusLow_4__del__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_9ThirdBody_12arrheniusLow_4__del__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__", 0);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->arrheniusLow);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->arrheniusLow));
+  __pyx_v_self->arrheniusLow = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)Py_None);
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":154
+ *     """
+ * 
+ *     def __init__(self, arrheniusHigh=None, arrheniusLow=None, Tmin=None, Tmax=None, Pmin=None, Pmax=None,             # <<<<<<<<<<<<<<
+ *                  efficiencies=None, comment=''):
+ *         PDepKineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, efficiencies=efficiencies,
+ */
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_arrheniusHigh = 0;
+  PyObject *__pyx_v_arrheniusLow = 0;
+  PyObject *__pyx_v_Tmin = 0;
+  PyObject *__pyx_v_Tmax = 0;
+  PyObject *__pyx_v_Pmin = 0;
+  PyObject *__pyx_v_Pmax = 0;
+  PyObject *__pyx_v_efficiencies = 0;
+  PyObject *__pyx_v_comment = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_arrheniusHigh,&__pyx_n_s_arrheniusLow,&__pyx_n_s_Tmin,&__pyx_n_s_Tmax,&__pyx_n_s_Pmin,&__pyx_n_s_Pmax,&__pyx_n_s_efficiencies,&__pyx_n_s_comment,0};
+    PyObject* values[8] = {0,0,0,0,0,0,0,0};
+    values[0] = ((PyObject *)Py_None);
+    values[1] = ((PyObject *)Py_None);
+    values[2] = ((PyObject *)Py_None);
+    values[3] = ((PyObject *)Py_None);
+    values[4] = ((PyObject *)Py_None);
+    values[5] = ((PyObject *)Py_None);
+
+    /* "rmgpy/kinetics/falloff.pyx":155
+ * 
+ *     def __init__(self, arrheniusHigh=None, arrheniusLow=None, Tmin=None, Tmax=None, Pmin=None, Pmax=None,
+ *                  efficiencies=None, comment=''):             # <<<<<<<<<<<<<<
+ *         PDepKineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, efficiencies=efficiencies,
+ *                                    comment=comment)
+ */
+    values[6] = ((PyObject *)Py_None);
+    values[7] = ((PyObject *)__pyx_kp_u_);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_arrheniusHigh);
+          if (value) { values[0] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_arrheniusLow);
+          if (value) { values[1] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_Tmin);
+          if (value) { values[2] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_Tmax);
+          if (value) { values[3] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_Pmin);
+          if (value) { values[4] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_Pmax);
+          if (value) { values[5] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_efficiencies);
+          if (value) { values[6] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_comment);
+          if (value) { values[7] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 154, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_arrheniusHigh = values[0];
+    __pyx_v_arrheniusLow = values[1];
+    __pyx_v_Tmin = values[2];
+    __pyx_v_Tmax = values[3];
+    __pyx_v_Pmin = values[4];
+    __pyx_v_Pmax = values[5];
+    __pyx_v_efficiencies = values[6];
+    __pyx_v_comment = values[7];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 0, 8, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 154, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Lindemann.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann___init__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *)__pyx_v_self), __pyx_v_arrheniusHigh, __pyx_v_arrheniusLow, __pyx_v_Tmin, __pyx_v_Tmax, __pyx_v_Pmin, __pyx_v_Pmax, __pyx_v_efficiencies, __pyx_v_comment);
+
+  /* "rmgpy/kinetics/falloff.pyx":154
+ *     """
+ * 
+ *     def __init__(self, arrheniusHigh=None, arrheniusLow=None, Tmin=None, Tmax=None, Pmin=None, Pmax=None,             # <<<<<<<<<<<<<<
+ *                  efficiencies=None, comment=''):
+ *         PDepKineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, efficiencies=efficiencies,
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann___init__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self, PyObject *__pyx_v_arrheniusHigh, PyObject *__pyx_v_arrheniusLow, PyObject *__pyx_v_Tmin, PyObject *__pyx_v_Tmax, PyObject *__pyx_v_Pmin, PyObject *__pyx_v_Pmax, PyObject *__pyx_v_efficiencies, PyObject *__pyx_v_comment) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "rmgpy/kinetics/falloff.pyx":156
+ *     def __init__(self, arrheniusHigh=None, arrheniusLow=None, Tmin=None, Tmax=None, Pmin=None, Pmax=None,
+ *                  efficiencies=None, comment=''):
+ *         PDepKineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, efficiencies=efficiencies,             # <<<<<<<<<<<<<<
+ *                                    comment=comment)
+ *         self.arrheniusHigh = arrheniusHigh
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel), __pyx_n_s_init); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 156, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self));
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 156, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_Tmin, __pyx_v_Tmin) < 0) __PYX_ERR(0, 156, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_Tmax, __pyx_v_Tmax) < 0) __PYX_ERR(0, 156, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_Pmin, __pyx_v_Pmin) < 0) __PYX_ERR(0, 156, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_Pmax, __pyx_v_Pmax) < 0) __PYX_ERR(0, 156, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_efficiencies, __pyx_v_efficiencies) < 0) __PYX_ERR(0, 156, __pyx_L1_error)
+
+  /* "rmgpy/kinetics/falloff.pyx":157
+ *                  efficiencies=None, comment=''):
+ *         PDepKineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, efficiencies=efficiencies,
+ *                                    comment=comment)             # <<<<<<<<<<<<<<
+ *         self.arrheniusHigh = arrheniusHigh
+ *         self.arrheniusLow = arrheniusLow
+ */
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_comment, __pyx_v_comment) < 0) __PYX_ERR(0, 156, __pyx_L1_error)
+
+  /* "rmgpy/kinetics/falloff.pyx":156
+ *     def __init__(self, arrheniusHigh=None, arrheniusLow=None, Tmin=None, Tmax=None, Pmin=None, Pmax=None,
+ *                  efficiencies=None, comment=''):
+ *         PDepKineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, efficiencies=efficiencies,             # <<<<<<<<<<<<<<
+ *                                    comment=comment)
+ *         self.arrheniusHigh = arrheniusHigh
+ */
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 156, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":158
+ *         PDepKineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, efficiencies=efficiencies,
+ *                                    comment=comment)
+ *         self.arrheniusHigh = arrheniusHigh             # <<<<<<<<<<<<<<
+ *         self.arrheniusLow = arrheniusLow
+ * 
+ */
+  if (!(likely(((__pyx_v_arrheniusHigh) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_arrheniusHigh, __pyx_ptype_5rmgpy_8kinetics_9arrhenius_Arrhenius))))) __PYX_ERR(0, 158, __pyx_L1_error)
+  __pyx_t_4 = __pyx_v_arrheniusHigh;
+  __Pyx_INCREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_4);
+  __Pyx_GOTREF(__pyx_v_self->arrheniusHigh);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->arrheniusHigh));
+  __pyx_v_self->arrheniusHigh = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":159
+ *                                    comment=comment)
+ *         self.arrheniusHigh = arrheniusHigh
+ *         self.arrheniusLow = arrheniusLow             # <<<<<<<<<<<<<<
+ * 
+ *     def __repr__(self):
+ */
+  if (!(likely(((__pyx_v_arrheniusLow) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_arrheniusLow, __pyx_ptype_5rmgpy_8kinetics_9arrhenius_Arrhenius))))) __PYX_ERR(0, 159, __pyx_L1_error)
+  __pyx_t_4 = __pyx_v_arrheniusLow;
+  __Pyx_INCREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_4);
+  __Pyx_GOTREF(__pyx_v_self->arrheniusLow);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->arrheniusLow));
+  __pyx_v_self->arrheniusLow = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":154
+ *     """
+ * 
+ *     def __init__(self, arrheniusHigh=None, arrheniusLow=None, Tmin=None, Tmax=None, Pmin=None, Pmax=None,             # <<<<<<<<<<<<<<
+ *                  efficiencies=None, comment=''):
+ *         PDepKineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, efficiencies=efficiencies,
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Lindemann.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":161
+ *         self.arrheniusLow = arrheniusLow
+ * 
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Return a string representation that can be used to reconstruct the
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_3__repr__(PyObject *__pyx_v_self); /*proto*/
+static char __pyx_doc_5rmgpy_8kinetics_7falloff_9Lindemann_2__repr__[] = "\n        Return a string representation that can be used to reconstruct the\n        Lindemann object.\n        ";
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_5rmgpy_8kinetics_7falloff_9Lindemann_2__repr__;
+#endif
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_3__repr__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__repr__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_2__repr__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_2__repr__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self) {
+  PyObject *__pyx_v_string = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__repr__", 0);
+
+  /* "rmgpy/kinetics/falloff.pyx":166
+ *         Lindemann object.
+ *         """
+ *         string = 'Lindemann(arrheniusHigh={0!r}, arrheniusLow={1!r}'.format(self.arrheniusHigh, self.arrheniusLow)             # <<<<<<<<<<<<<<
+ *         if self.efficiencies is not None: string += ', efficiencies={0!r}'.format(self.efficiencies)
+ *         if self.Tmin is not None: string += ', Tmin={0!r}'.format(self.Tmin)
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Lindemann_arrheniusHigh_0_r_arrh, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 166, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = NULL;
+  __pyx_t_4 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_4 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_3, ((PyObject *)__pyx_v_self->arrheniusHigh), ((PyObject *)__pyx_v_self->arrheniusLow)};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 166, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_3, ((PyObject *)__pyx_v_self->arrheniusHigh), ((PyObject *)__pyx_v_self->arrheniusLow)};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 166, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  {
+    __pyx_t_5 = PyTuple_New(2+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 166, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (__pyx_t_3) {
+      __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3); __pyx_t_3 = NULL;
+    }
+    __Pyx_INCREF(((PyObject *)__pyx_v_self->arrheniusHigh));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_self->arrheniusHigh));
+    PyTuple_SET_ITEM(__pyx_t_5, 0+__pyx_t_4, ((PyObject *)__pyx_v_self->arrheniusHigh));
+    __Pyx_INCREF(((PyObject *)__pyx_v_self->arrheniusLow));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_self->arrheniusLow));
+    PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_4, ((PyObject *)__pyx_v_self->arrheniusLow));
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 166, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_string = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":167
+ *         """
+ *         string = 'Lindemann(arrheniusHigh={0!r}, arrheniusLow={1!r}'.format(self.arrheniusHigh, self.arrheniusLow)
+ *         if self.efficiencies is not None: string += ', efficiencies={0!r}'.format(self.efficiencies)             # <<<<<<<<<<<<<<
+ *         if self.Tmin is not None: string += ', Tmin={0!r}'.format(self.Tmin)
+ *         if self.Tmax is not None: string += ', Tmax={0!r}'.format(self.Tmax)
+ */
+  __pyx_t_6 = (__pyx_v_self->__pyx_base.efficiencies != ((PyObject*)Py_None));
+  __pyx_t_7 = (__pyx_t_6 != 0);
+  if (__pyx_t_7) {
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_efficiencies_0_r, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 167, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_5, __pyx_v_self->__pyx_base.efficiencies) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_self->__pyx_base.efficiencies);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 167, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 167, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_2);
+    __pyx_t_2 = 0;
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":168
+ *         string = 'Lindemann(arrheniusHigh={0!r}, arrheniusLow={1!r}'.format(self.arrheniusHigh, self.arrheniusLow)
+ *         if self.efficiencies is not None: string += ', efficiencies={0!r}'.format(self.efficiencies)
+ *         if self.Tmin is not None: string += ', Tmin={0!r}'.format(self.Tmin)             # <<<<<<<<<<<<<<
+ *         if self.Tmax is not None: string += ', Tmax={0!r}'.format(self.Tmax)
+ *         if self.Pmin is not None: string += ', Pmin={0!r}'.format(self.Pmin)
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Tmin); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_7 = (__pyx_t_2 != Py_None);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_6 = (__pyx_t_7 != 0);
+  if (__pyx_t_6) {
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Tmin_0_r, __pyx_n_s_format); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 168, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Tmin); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 168, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_3, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 168, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 168, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_1);
+    __pyx_t_1 = 0;
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":169
+ *         if self.efficiencies is not None: string += ', efficiencies={0!r}'.format(self.efficiencies)
+ *         if self.Tmin is not None: string += ', Tmin={0!r}'.format(self.Tmin)
+ *         if self.Tmax is not None: string += ', Tmax={0!r}'.format(self.Tmax)             # <<<<<<<<<<<<<<
+ *         if self.Pmin is not None: string += ', Pmin={0!r}'.format(self.Pmin)
+ *         if self.Pmax is not None: string += ', Pmax={0!r}'.format(self.Pmax)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Tmax); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 169, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_6 = (__pyx_t_1 != Py_None);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_7 = (__pyx_t_6 != 0);
+  if (__pyx_t_7) {
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Tmax_0_r, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 169, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Tmax); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 169, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 169, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 169, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_2);
+    __pyx_t_2 = 0;
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":170
+ *         if self.Tmin is not None: string += ', Tmin={0!r}'.format(self.Tmin)
+ *         if self.Tmax is not None: string += ', Tmax={0!r}'.format(self.Tmax)
+ *         if self.Pmin is not None: string += ', Pmin={0!r}'.format(self.Pmin)             # <<<<<<<<<<<<<<
+ *         if self.Pmax is not None: string += ', Pmax={0!r}'.format(self.Pmax)
+ *         if self.comment != '': string += ', comment="""{0}"""'.format(self.comment)
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Pmin); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 170, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_7 = (__pyx_t_2 != Py_None);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_6 = (__pyx_t_7 != 0);
+  if (__pyx_t_6) {
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Pmin_0_r, __pyx_n_s_format); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 170, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Pmin); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 170, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_3, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 170, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 170, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_1);
+    __pyx_t_1 = 0;
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":171
+ *         if self.Tmax is not None: string += ', Tmax={0!r}'.format(self.Tmax)
+ *         if self.Pmin is not None: string += ', Pmin={0!r}'.format(self.Pmin)
+ *         if self.Pmax is not None: string += ', Pmax={0!r}'.format(self.Pmax)             # <<<<<<<<<<<<<<
+ *         if self.comment != '': string += ', comment="""{0}"""'.format(self.comment)
+ *         string += ')'
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Pmax); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 171, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_6 = (__pyx_t_1 != Py_None);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_7 = (__pyx_t_6 != 0);
+  if (__pyx_t_7) {
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Pmax_0_r, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 171, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Pmax); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 171, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 171, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 171, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_2);
+    __pyx_t_2 = 0;
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":172
+ *         if self.Pmin is not None: string += ', Pmin={0!r}'.format(self.Pmin)
+ *         if self.Pmax is not None: string += ', Pmax={0!r}'.format(self.Pmax)
+ *         if self.comment != '': string += ', comment="""{0}"""'.format(self.comment)             # <<<<<<<<<<<<<<
+ *         string += ')'
+ *         return string
+ */
+  __pyx_t_7 = (__Pyx_PyUnicode_Equals(__pyx_v_self->__pyx_base.__pyx_base.comment, __pyx_kp_u_, Py_NE)); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 172, __pyx_L1_error)
+  __pyx_t_6 = (__pyx_t_7 != 0);
+  if (__pyx_t_6) {
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_comment_0, __pyx_n_s_format); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 172, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_5, __pyx_v_self->__pyx_base.__pyx_base.comment) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_self->__pyx_base.__pyx_base.comment);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 172, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 172, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_1);
+    __pyx_t_1 = 0;
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":173
+ *         if self.Pmax is not None: string += ', Pmax={0!r}'.format(self.Pmax)
+ *         if self.comment != '': string += ', comment="""{0}"""'.format(self.comment)
+ *         string += ')'             # <<<<<<<<<<<<<<
+ *         return string
+ * 
+ */
+  __pyx_t_1 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_kp_u__2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 173, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":174
+ *         if self.comment != '': string += ', comment="""{0}"""'.format(self.comment)
+ *         string += ')'
+ *         return string             # <<<<<<<<<<<<<<
+ * 
+ *     def __reduce__(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_string);
+  __pyx_r = __pyx_v_string;
+  goto __pyx_L0;
+
+  /* "rmgpy/kinetics/falloff.pyx":161
+ *         self.arrheniusLow = arrheniusLow
+ * 
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Return a string representation that can be used to reconstruct the
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Lindemann.__repr__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_string);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":176
+ *         return string
+ * 
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         A helper function used when pickling a Lindemann object.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_5__reduce__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_5rmgpy_8kinetics_7falloff_9Lindemann_4__reduce__[] = "Lindemann.__reduce__(self)\n\n        A helper function used when pickling a Lindemann object.\n        ";
+static PyMethodDef __pyx_mdef_5rmgpy_8kinetics_7falloff_9Lindemann_5__reduce__ = {"__reduce__", (PyCFunction)__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_5__reduce__, METH_NOARGS, __pyx_doc_5rmgpy_8kinetics_7falloff_9Lindemann_4__reduce__};
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_5__reduce__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_4__reduce__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_4__reduce__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce__", 0);
+
+  /* "rmgpy/kinetics/falloff.pyx":180
+ *         A helper function used when pickling a Lindemann object.
+ *         """
+ *         return (Lindemann, (self.arrheniusHigh, self.arrheniusLow, self.Tmin, self.Tmax, self.Pmin, self.Pmax,             # <<<<<<<<<<<<<<
+ *                             self.efficiencies, self.comment))
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Tmin); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 180, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Tmax); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 180, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Pmin); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 180, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Pmax); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 180, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+
+  /* "rmgpy/kinetics/falloff.pyx":181
+ *         """
+ *         return (Lindemann, (self.arrheniusHigh, self.arrheniusLow, self.Tmin, self.Tmax, self.Pmin, self.Pmax,
+ *                             self.efficiencies, self.comment))             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=0.0) except -1:
+ */
+  __pyx_t_5 = PyTuple_New(8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 180, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->arrheniusHigh));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self->arrheniusHigh));
+  PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_v_self->arrheniusHigh));
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->arrheniusLow));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self->arrheniusLow));
+  PyTuple_SET_ITEM(__pyx_t_5, 1, ((PyObject *)__pyx_v_self->arrheniusLow));
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_5, 2, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_5, 3, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_5, 4, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_5, 5, __pyx_t_4);
+  __Pyx_INCREF(__pyx_v_self->__pyx_base.efficiencies);
+  __Pyx_GIVEREF(__pyx_v_self->__pyx_base.efficiencies);
+  PyTuple_SET_ITEM(__pyx_t_5, 6, __pyx_v_self->__pyx_base.efficiencies);
+  __Pyx_INCREF(__pyx_v_self->__pyx_base.__pyx_base.comment);
+  __Pyx_GIVEREF(__pyx_v_self->__pyx_base.__pyx_base.comment);
+  PyTuple_SET_ITEM(__pyx_t_5, 7, __pyx_v_self->__pyx_base.__pyx_base.comment);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_4 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":180
+ *         A helper function used when pickling a Lindemann object.
+ *         """
+ *         return (Lindemann, (self.arrheniusHigh, self.arrheniusLow, self.Tmin, self.Tmax, self.Pmin, self.Pmax,             # <<<<<<<<<<<<<<
+ *                             self.efficiencies, self.comment))
+ * 
+ */
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 180, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_Lindemann));
+  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_Lindemann));
+  PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_Lindemann));
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "rmgpy/kinetics/falloff.pyx":176
+ *         return string
+ * 
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         A helper function used when pickling a Lindemann object.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Lindemann.__reduce__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":183
+ *                             self.efficiencies, self.comment))
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=0.0) except -1:             # <<<<<<<<<<<<<<
+ *         """
+ *         Return the value of the rate coefficient :math:`k(T)` in units of m^3,
+ */
+
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_7get_rate_coefficient(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static double __pyx_f_5rmgpy_8kinetics_7falloff_9Lindemann_get_rate_coefficient(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self, double __pyx_v_T, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8kinetics_7falloff_9Lindemann_get_rate_coefficient *__pyx_optional_args) {
+  double __pyx_v_P = ((double)0.0);
+  double __pyx_v_C;
+  double __pyx_v_k0;
+  double __pyx_v_kinf;
+  double __pyx_v_Pr;
+  double __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  double __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_rate_coefficient", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_P = __pyx_optional_args->P;
+    }
+  }
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get_rate_coefficient); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 183, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_7get_rate_coefficient)) {
+        __pyx_t_3 = PyFloat_FromDouble(__pyx_v_T); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 183, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_4 = PyFloat_FromDouble(__pyx_v_P); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 183, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_5 = __pyx_t_1; __pyx_t_6 = NULL;
+        __pyx_t_7 = 0;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+          __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+          if (likely(__pyx_t_6)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+            __Pyx_INCREF(__pyx_t_6);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_5, function);
+            __pyx_t_7 = 1;
+          }
+        }
+        #if CYTHON_FAST_PYCALL
+        if (PyFunction_Check(__pyx_t_5)) {
+          PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_3, __pyx_t_4};
+          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 183, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        } else
+        #endif
+        #if CYTHON_FAST_PYCCALL
+        if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
+          PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_3, __pyx_t_4};
+          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 183, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        } else
+        #endif
+        {
+          __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 183, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          if (__pyx_t_6) {
+            __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6); __pyx_t_6 = NULL;
+          }
+          __Pyx_GIVEREF(__pyx_t_3);
+          PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_7, __pyx_t_3);
+          __Pyx_GIVEREF(__pyx_t_4);
+          PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_4);
+          __pyx_t_3 = 0;
+          __pyx_t_4 = 0;
+          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_8, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 183, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        }
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __pyx_t_9 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_9 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 183, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __pyx_r = __pyx_t_9;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":193
+ *         cdef double C, k0, kinf, Pr
+ * 
+ *         C = P / constants.R / T  # bath gas concentration in mol/m^3             # <<<<<<<<<<<<<<
+ *         k0 = self.arrheniusLow.get_rate_coefficient(T)
+ *         kinf = self.arrheniusHigh.get_rate_coefficient(T)
+ */
+  __pyx_v_C = ((__pyx_v_P / __pyx_v_5rmgpy_9constants_R) / __pyx_v_T);
+
+  /* "rmgpy/kinetics/falloff.pyx":194
+ * 
+ *         C = P / constants.R / T  # bath gas concentration in mol/m^3
+ *         k0 = self.arrheniusLow.get_rate_coefficient(T)             # <<<<<<<<<<<<<<
+ *         kinf = self.arrheniusHigh.get_rate_coefficient(T)
+ *         Pr = k0 * C / kinf
+ */
+  __pyx_t_9 = ((struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_v_self->arrheniusLow->__pyx_base.__pyx_vtab)->__pyx_base.get_rate_coefficient(((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_v_self->arrheniusLow), __pyx_v_T, 0, NULL); if (unlikely(__pyx_t_9 == ((double)-1.0))) __PYX_ERR(0, 194, __pyx_L1_error)
+  __pyx_v_k0 = __pyx_t_9;
+
+  /* "rmgpy/kinetics/falloff.pyx":195
+ *         C = P / constants.R / T  # bath gas concentration in mol/m^3
+ *         k0 = self.arrheniusLow.get_rate_coefficient(T)
+ *         kinf = self.arrheniusHigh.get_rate_coefficient(T)             # <<<<<<<<<<<<<<
+ *         Pr = k0 * C / kinf
+ * 
+ */
+  __pyx_t_9 = ((struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_v_self->arrheniusHigh->__pyx_base.__pyx_vtab)->__pyx_base.get_rate_coefficient(((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_v_self->arrheniusHigh), __pyx_v_T, 0, NULL); if (unlikely(__pyx_t_9 == ((double)-1.0))) __PYX_ERR(0, 195, __pyx_L1_error)
+  __pyx_v_kinf = __pyx_t_9;
+
+  /* "rmgpy/kinetics/falloff.pyx":196
+ *         k0 = self.arrheniusLow.get_rate_coefficient(T)
+ *         kinf = self.arrheniusHigh.get_rate_coefficient(T)
+ *         Pr = k0 * C / kinf             # <<<<<<<<<<<<<<
+ * 
+ *         return kinf * (Pr / (1 + Pr))
+ */
+  __pyx_v_Pr = ((__pyx_v_k0 * __pyx_v_C) / __pyx_v_kinf);
+
+  /* "rmgpy/kinetics/falloff.pyx":198
+ *         Pr = k0 * C / kinf
+ * 
+ *         return kinf * (Pr / (1 + Pr))             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:
+ */
+  __pyx_r = (__pyx_v_kinf * (__pyx_v_Pr / (1.0 + __pyx_v_Pr)));
+  goto __pyx_L0;
+
+  /* "rmgpy/kinetics/falloff.pyx":183
+ *                             self.efficiencies, self.comment))
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=0.0) except -1:             # <<<<<<<<<<<<<<
+ *         """
+ *         Return the value of the rate coefficient :math:`k(T)` in units of m^3,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Lindemann.get_rate_coefficient", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1.0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_7get_rate_coefficient(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5rmgpy_8kinetics_7falloff_9Lindemann_6get_rate_coefficient[] = "Lindemann.get_rate_coefficient(self, double T, double P=0.0) -> double\n\n        Return the value of the rate coefficient :math:`k(T)` in units of m^3,\n        mol, and s at the specified temperature `T` in K and pressure `P` in\n        Pa. If you wish to consider collision efficiencies, then you should\n        first use :meth:`get_effective_pressure()` to compute the effective\n        pressure, and pass that value as the pressure to this method.\n        ";
+static PyMethodDef __pyx_mdef_5rmgpy_8kinetics_7falloff_9Lindemann_7get_rate_coefficient = {"get_rate_coefficient", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_7get_rate_coefficient, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5rmgpy_8kinetics_7falloff_9Lindemann_6get_rate_coefficient};
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_7get_rate_coefficient(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  double __pyx_v_T;
+  double __pyx_v_P;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("get_rate_coefficient (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_T,&__pyx_n_s_P,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_T)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_P);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "get_rate_coefficient") < 0)) __PYX_ERR(0, 183, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_T = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_T == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 183, __pyx_L3_error)
+    if (values[1]) {
+      __pyx_v_P = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_P == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 183, __pyx_L3_error)
+    } else {
+      __pyx_v_P = ((double)0.0);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("get_rate_coefficient", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 183, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Lindemann.get_rate_coefficient", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_6get_rate_coefficient(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *)__pyx_v_self), __pyx_v_T, __pyx_v_P);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_6get_rate_coefficient(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self, double __pyx_v_T, double __pyx_v_P) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  double __pyx_t_1;
+  struct __pyx_opt_args_5rmgpy_8kinetics_5model_13KineticsModel_get_rate_coefficient __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_rate_coefficient", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2.__pyx_n = 1;
+  __pyx_t_2.P = __pyx_v_P;
+  __pyx_t_1 = __pyx_vtabptr_5rmgpy_8kinetics_7falloff_Lindemann->__pyx_base.__pyx_base.get_rate_coefficient(((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_v_self), __pyx_v_T, 1, &__pyx_t_2); if (unlikely(__pyx_t_1 == ((double)-1.0))) __PYX_ERR(0, 183, __pyx_L1_error)
+  __pyx_t_3 = PyFloat_FromDouble(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 183, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Lindemann.get_rate_coefficient", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":200
+ *         return kinf * (Pr / (1 + Pr))
+ * 
+ *     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:             # <<<<<<<<<<<<<<
+ *         """
+ *         Checks to see if kinetics matches that of other kinetics and returns ``True``
+ */
+
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_9is_identical_to(PyObject *__pyx_v_self, PyObject *__pyx_v_other_kinetics); /*proto*/
+static int __pyx_f_5rmgpy_8kinetics_7falloff_9Lindemann_is_identical_to(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self, struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *__pyx_v_other_kinetics, int __pyx_skip_dispatch) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("is_identical_to", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_is_identical_to); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 200, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_9is_identical_to)) {
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, ((PyObject *)__pyx_v_other_kinetics)) : __Pyx_PyObject_CallOneArg(__pyx_t_3, ((PyObject *)__pyx_v_other_kinetics));
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 200, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 200, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __pyx_r = __pyx_t_5;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":205
+ *         if coeffs, kunits, Tmin,
+ *         """
+ *         if not isinstance(other_kinetics, Lindemann):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):
+ */
+  __pyx_t_5 = __Pyx_TypeCheck(((PyObject *)__pyx_v_other_kinetics), __pyx_ptype_5rmgpy_8kinetics_7falloff_Lindemann); 
+  __pyx_t_6 = ((!(__pyx_t_5 != 0)) != 0);
+  if (__pyx_t_6) {
+
+    /* "rmgpy/kinetics/falloff.pyx":206
+ *         """
+ *         if not isinstance(other_kinetics, Lindemann):
+ *             return False             # <<<<<<<<<<<<<<
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):
+ *             return False
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "rmgpy/kinetics/falloff.pyx":205
+ *         if coeffs, kunits, Tmin,
+ *         """
+ *         if not isinstance(other_kinetics, Lindemann):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):
+ */
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":207
+ *         if not isinstance(other_kinetics, Lindemann):
+ *             return False
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if not self.arrheniusLow.is_identical_to(other_kinetics.arrheniusLow):
+ */
+  __pyx_t_6 = __pyx_vtabptr_5rmgpy_8kinetics_5model_KineticsModel->is_identical_to(((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_v_self), __pyx_v_other_kinetics, 1); if (unlikely(__pyx_t_6 == ((int)-2))) __PYX_ERR(0, 207, __pyx_L1_error)
+  __pyx_t_5 = ((!(__pyx_t_6 != 0)) != 0);
+  if (__pyx_t_5) {
+
+    /* "rmgpy/kinetics/falloff.pyx":208
+ *             return False
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):
+ *             return False             # <<<<<<<<<<<<<<
+ *         if not self.arrheniusLow.is_identical_to(other_kinetics.arrheniusLow):
+ *             return False
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "rmgpy/kinetics/falloff.pyx":207
+ *         if not isinstance(other_kinetics, Lindemann):
+ *             return False
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if not self.arrheniusLow.is_identical_to(other_kinetics.arrheniusLow):
+ */
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":209
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):
+ *             return False
+ *         if not self.arrheniusLow.is_identical_to(other_kinetics.arrheniusLow):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if not self.arrheniusHigh.is_identical_to(other_kinetics.arrheniusHigh):
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_other_kinetics), __pyx_n_s_arrheniusLow); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 209, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5rmgpy_8kinetics_5model_KineticsModel))))) __PYX_ERR(0, 209, __pyx_L1_error)
+  __pyx_t_5 = ((struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_v_self->arrheniusLow->__pyx_base.__pyx_vtab)->__pyx_base.is_identical_to(((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_v_self->arrheniusLow), ((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_t_1), 0); if (unlikely(__pyx_t_5 == ((int)-2))) __PYX_ERR(0, 209, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_6 = ((!(__pyx_t_5 != 0)) != 0);
+  if (__pyx_t_6) {
+
+    /* "rmgpy/kinetics/falloff.pyx":210
+ *             return False
+ *         if not self.arrheniusLow.is_identical_to(other_kinetics.arrheniusLow):
+ *             return False             # <<<<<<<<<<<<<<
+ *         if not self.arrheniusHigh.is_identical_to(other_kinetics.arrheniusHigh):
+ *             return False
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "rmgpy/kinetics/falloff.pyx":209
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):
+ *             return False
+ *         if not self.arrheniusLow.is_identical_to(other_kinetics.arrheniusLow):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if not self.arrheniusHigh.is_identical_to(other_kinetics.arrheniusHigh):
+ */
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":211
+ *         if not self.arrheniusLow.is_identical_to(other_kinetics.arrheniusLow):
+ *             return False
+ *         if not self.arrheniusHigh.is_identical_to(other_kinetics.arrheniusHigh):             # <<<<<<<<<<<<<<
+ *             return False
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_other_kinetics), __pyx_n_s_arrheniusHigh); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 211, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5rmgpy_8kinetics_5model_KineticsModel))))) __PYX_ERR(0, 211, __pyx_L1_error)
+  __pyx_t_6 = ((struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_v_self->arrheniusHigh->__pyx_base.__pyx_vtab)->__pyx_base.is_identical_to(((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_v_self->arrheniusHigh), ((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_t_1), 0); if (unlikely(__pyx_t_6 == ((int)-2))) __PYX_ERR(0, 211, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_5 = ((!(__pyx_t_6 != 0)) != 0);
+  if (__pyx_t_5) {
+
+    /* "rmgpy/kinetics/falloff.pyx":212
+ *             return False
+ *         if not self.arrheniusHigh.is_identical_to(other_kinetics.arrheniusHigh):
+ *             return False             # <<<<<<<<<<<<<<
+ * 
+ *         return True
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "rmgpy/kinetics/falloff.pyx":211
+ *         if not self.arrheniusLow.is_identical_to(other_kinetics.arrheniusLow):
+ *             return False
+ *         if not self.arrheniusHigh.is_identical_to(other_kinetics.arrheniusHigh):             # <<<<<<<<<<<<<<
+ *             return False
+ * 
+ */
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":214
+ *             return False
+ * 
+ *         return True             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef change_rate(self, double factor):
+ */
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "rmgpy/kinetics/falloff.pyx":200
+ *         return kinf * (Pr / (1 + Pr))
+ * 
+ *     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:             # <<<<<<<<<<<<<<
+ *         """
+ *         Checks to see if kinetics matches that of other kinetics and returns ``True``
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Lindemann.is_identical_to", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -2;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_9is_identical_to(PyObject *__pyx_v_self, PyObject *__pyx_v_other_kinetics); /*proto*/
+static char __pyx_doc_5rmgpy_8kinetics_7falloff_9Lindemann_8is_identical_to[] = "Lindemann.is_identical_to(self, KineticsModel other_kinetics) -> bool\n\n        Checks to see if kinetics matches that of other kinetics and returns ``True``\n        if coeffs, kunits, Tmin,\n        ";
+static PyMethodDef __pyx_mdef_5rmgpy_8kinetics_7falloff_9Lindemann_9is_identical_to = {"is_identical_to", (PyCFunction)__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_9is_identical_to, METH_O, __pyx_doc_5rmgpy_8kinetics_7falloff_9Lindemann_8is_identical_to};
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_9is_identical_to(PyObject *__pyx_v_self, PyObject *__pyx_v_other_kinetics) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("is_identical_to (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_other_kinetics), __pyx_ptype_5rmgpy_8kinetics_5model_KineticsModel, 1, "other_kinetics", 0))) __PYX_ERR(0, 200, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_8is_identical_to(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *)__pyx_v_self), ((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_v_other_kinetics));
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_8is_identical_to(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self, struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *__pyx_v_other_kinetics) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("is_identical_to", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_5rmgpy_8kinetics_7falloff_9Lindemann_is_identical_to(__pyx_v_self, __pyx_v_other_kinetics, 1); if (unlikely(__pyx_t_1 == ((int)-2))) __PYX_ERR(0, 200, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 200, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Lindemann.is_identical_to", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":216
+ *         return True
+ * 
+ *     cpdef change_rate(self, double factor):             # <<<<<<<<<<<<<<
+ *         """
+ *         Changes kinetics rate by a multiple ``factor``.
+ */
+
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_11change_rate(PyObject *__pyx_v_self, PyObject *__pyx_arg_factor); /*proto*/
+static PyObject *__pyx_f_5rmgpy_8kinetics_7falloff_9Lindemann_change_rate(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self, double __pyx_v_factor, int __pyx_skip_dispatch) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("change_rate", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_change_rate); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 216, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_11change_rate)) {
+        __Pyx_XDECREF(__pyx_r);
+        __pyx_t_3 = PyFloat_FromDouble(__pyx_v_factor); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 216, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_4 = __pyx_t_1; __pyx_t_5 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+          __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+          if (likely(__pyx_t_5)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+            __Pyx_INCREF(__pyx_t_5);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_4, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 216, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":220
+ *         Changes kinetics rate by a multiple ``factor``.
+ *         """
+ *         self.arrheniusLow.change_rate(factor)             # <<<<<<<<<<<<<<
+ *         self.arrheniusHigh.change_rate(factor)
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_v_self->arrheniusLow->__pyx_base.__pyx_vtab)->change_rate(__pyx_v_self->arrheniusLow, __pyx_v_factor, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 220, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":221
+ *         """
+ *         self.arrheniusLow.change_rate(factor)
+ *         self.arrheniusHigh.change_rate(factor)             # <<<<<<<<<<<<<<
+ * 
+ *     def set_cantera_kinetics(self, ct_reaction, species_list):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_v_self->arrheniusHigh->__pyx_base.__pyx_vtab)->change_rate(__pyx_v_self->arrheniusHigh, __pyx_v_factor, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 221, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":216
+ *         return True
+ * 
+ *     cpdef change_rate(self, double factor):             # <<<<<<<<<<<<<<
+ *         """
+ *         Changes kinetics rate by a multiple ``factor``.
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Lindemann.change_rate", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_11change_rate(PyObject *__pyx_v_self, PyObject *__pyx_arg_factor); /*proto*/
+static char __pyx_doc_5rmgpy_8kinetics_7falloff_9Lindemann_10change_rate[] = "Lindemann.change_rate(self, double factor)\n\n        Changes kinetics rate by a multiple ``factor``.\n        ";
+static PyMethodDef __pyx_mdef_5rmgpy_8kinetics_7falloff_9Lindemann_11change_rate = {"change_rate", (PyCFunction)__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_11change_rate, METH_O, __pyx_doc_5rmgpy_8kinetics_7falloff_9Lindemann_10change_rate};
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_11change_rate(PyObject *__pyx_v_self, PyObject *__pyx_arg_factor) {
+  double __pyx_v_factor;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("change_rate (wrapper)", 0);
+  assert(__pyx_arg_factor); {
+    __pyx_v_factor = __pyx_PyFloat_AsDouble(__pyx_arg_factor); if (unlikely((__pyx_v_factor == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 216, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Lindemann.change_rate", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_10change_rate(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *)__pyx_v_self), ((double)__pyx_v_factor));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_10change_rate(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self, double __pyx_v_factor) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("change_rate", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_5rmgpy_8kinetics_7falloff_9Lindemann_change_rate(__pyx_v_self, __pyx_v_factor, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Lindemann.change_rate", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":223
+ *         self.arrheniusHigh.change_rate(factor)
+ * 
+ *     def set_cantera_kinetics(self, ct_reaction, species_list):             # <<<<<<<<<<<<<<
+ *         """
+ *         Sets the efficiencies and kinetics for a cantera reaction.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_13set_cantera_kinetics(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5rmgpy_8kinetics_7falloff_9Lindemann_12set_cantera_kinetics[] = "Lindemann.set_cantera_kinetics(self, ct_reaction, species_list)\n\n        Sets the efficiencies and kinetics for a cantera reaction.\n        ";
+static PyMethodDef __pyx_mdef_5rmgpy_8kinetics_7falloff_9Lindemann_13set_cantera_kinetics = {"set_cantera_kinetics", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_13set_cantera_kinetics, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5rmgpy_8kinetics_7falloff_9Lindemann_12set_cantera_kinetics};
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_13set_cantera_kinetics(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_ct_reaction = 0;
+  PyObject *__pyx_v_species_list = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("set_cantera_kinetics (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_ct_reaction,&__pyx_n_s_species_list,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ct_reaction)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_species_list)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("set_cantera_kinetics", 1, 2, 2, 1); __PYX_ERR(0, 223, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "set_cantera_kinetics") < 0)) __PYX_ERR(0, 223, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_ct_reaction = values[0];
+    __pyx_v_species_list = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("set_cantera_kinetics", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 223, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Lindemann.set_cantera_kinetics", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_12set_cantera_kinetics(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *)__pyx_v_self), __pyx_v_ct_reaction, __pyx_v_species_list);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_12set_cantera_kinetics(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self, PyObject *__pyx_v_ct_reaction, PyObject *__pyx_v_species_list) {
+  PyObject *__pyx_v_ct = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("set_cantera_kinetics", 0);
+
+  /* "rmgpy/kinetics/falloff.pyx":227
+ *         Sets the efficiencies and kinetics for a cantera reaction.
+ *         """
+ *         import cantera as ct             # <<<<<<<<<<<<<<
+ *         assert isinstance(ct_reaction, ct.FalloffReaction), "Must be a Cantera FalloffReaction object"
+ * 
+ */
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_cantera, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 227, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_ct = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":228
+ *         """
+ *         import cantera as ct
+ *         assert isinstance(ct_reaction, ct.FalloffReaction), "Must be a Cantera FalloffReaction object"             # <<<<<<<<<<<<<<
+ * 
+ *         ct_reaction.efficiencies = PDepKineticsModel.get_cantera_efficiencies(self, species_list)
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_ct, __pyx_n_s_FalloffReaction); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 228, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyObject_IsInstance(__pyx_v_ct_reaction, __pyx_t_1); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 228, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(!(__pyx_t_2 != 0))) {
+      PyErr_SetObject(PyExc_AssertionError, __pyx_kp_u_Must_be_a_Cantera_FalloffReactio);
+      __PYX_ERR(0, 228, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "rmgpy/kinetics/falloff.pyx":230
+ *         assert isinstance(ct_reaction, ct.FalloffReaction), "Must be a Cantera FalloffReaction object"
+ * 
+ *         ct_reaction.efficiencies = PDepKineticsModel.get_cantera_efficiencies(self, species_list)             # <<<<<<<<<<<<<<
+ *         ct_reaction.high_rate = self.arrheniusHigh.to_cantera_kinetics()
+ *         ct_reaction.low_rate = self.arrheniusLow.to_cantera_kinetics()
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel), __pyx_n_s_get_cantera_efficiencies); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 230, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = NULL;
+  __pyx_t_5 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_5 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, ((PyObject *)__pyx_v_self), __pyx_v_species_list};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 230, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, ((PyObject *)__pyx_v_self), __pyx_v_species_list};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 230, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  {
+    __pyx_t_6 = PyTuple_New(2+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 230, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    if (__pyx_t_4) {
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    }
+    __Pyx_INCREF(((PyObject *)__pyx_v_self));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+    PyTuple_SET_ITEM(__pyx_t_6, 0+__pyx_t_5, ((PyObject *)__pyx_v_self));
+    __Pyx_INCREF(__pyx_v_species_list);
+    __Pyx_GIVEREF(__pyx_v_species_list);
+    PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_5, __pyx_v_species_list);
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 230, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_ct_reaction, __pyx_n_s_efficiencies, __pyx_t_1) < 0) __PYX_ERR(0, 230, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":231
+ * 
+ *         ct_reaction.efficiencies = PDepKineticsModel.get_cantera_efficiencies(self, species_list)
+ *         ct_reaction.high_rate = self.arrheniusHigh.to_cantera_kinetics()             # <<<<<<<<<<<<<<
+ *         ct_reaction.low_rate = self.arrheniusLow.to_cantera_kinetics()
+ *         ct_reaction.falloff = ct.Falloff()
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self->arrheniusHigh), __pyx_n_s_to_cantera_kinetics); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 231, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_6) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_6) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 231, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_ct_reaction, __pyx_n_s_high_rate, __pyx_t_1) < 0) __PYX_ERR(0, 231, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":232
+ *         ct_reaction.efficiencies = PDepKineticsModel.get_cantera_efficiencies(self, species_list)
+ *         ct_reaction.high_rate = self.arrheniusHigh.to_cantera_kinetics()
+ *         ct_reaction.low_rate = self.arrheniusLow.to_cantera_kinetics()             # <<<<<<<<<<<<<<
+ *         ct_reaction.falloff = ct.Falloff()
+ * 
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self->arrheniusLow), __pyx_n_s_to_cantera_kinetics); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 232, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_6) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_6) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 232, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_ct_reaction, __pyx_n_s_low_rate, __pyx_t_1) < 0) __PYX_ERR(0, 232, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":233
+ *         ct_reaction.high_rate = self.arrheniusHigh.to_cantera_kinetics()
+ *         ct_reaction.low_rate = self.arrheniusLow.to_cantera_kinetics()
+ *         ct_reaction.falloff = ct.Falloff()             # <<<<<<<<<<<<<<
+ * 
+ * ################################################################################
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_ct, __pyx_n_s_Falloff); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_6) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_6) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_ct_reaction, __pyx_n_s_falloff, __pyx_t_1) < 0) __PYX_ERR(0, 233, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":223
+ *         self.arrheniusHigh.change_rate(factor)
+ * 
+ *     def set_cantera_kinetics(self, ct_reaction, species_list):             # <<<<<<<<<<<<<<
+ *         """
+ *         Sets the efficiencies and kinetics for a cantera reaction.
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Lindemann.set_cantera_kinetics", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_ct);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pxd":48
+ * cdef class Lindemann(PDepKineticsModel):
+ * 
+ *     cdef public Arrhenius arrheniusHigh             # <<<<<<<<<<<<<<
+ *     cdef public Arrhenius arrheniusLow
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_13arrheniusHigh_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_13arrheniusHigh_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_13arrheniusHigh___get__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_13arrheniusHigh___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->arrheniusHigh));
+  __pyx_r = ((PyObject *)__pyx_v_self->arrheniusHigh);
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_13arrheniusHigh_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_13arrheniusHigh_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_13arrheniusHigh_2__set__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_13arrheniusHigh_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  if (!(likely(((__pyx_v_value) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_value, __pyx_ptype_5rmgpy_8kinetics_9arrhenius_Arrhenius))))) __PYX_ERR(1, 48, __pyx_L1_error)
+  __pyx_t_1 = __pyx_v_value;
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_self->arrheniusHigh);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->arrheniusHigh));
+  __pyx_v_self->arrheniusHigh = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Lindemann.arrheniusHigh.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_13arrheniusHigh_5__del__(PyObject *__pyx_v_self); /*proto*/
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_13arrheniusHigh_5__del__(PyObject *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_13arrheniusHigh_4__del__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_13arrheniusHigh_4__del__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__", 0);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->arrheniusHigh);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->arrheniusHigh));
+  __pyx_v_self->arrheniusHigh = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)Py_None);
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pxd":49
+ * 
+ *     cdef public Arrhenius arrheniusHigh
+ *     cdef public Arrhenius arrheniusLow             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=?) except -1
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_12arrheniusLow_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_12arrheniusLow_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_12arrheniusLow___get__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_12arrheniusLow___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->arrheniusLow));
+  __pyx_r = ((PyObject *)__pyx_v_self->arrheniusLow);
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_12arrheniusLow_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_12arrheniusLow_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_12arrheniusLow_2__set__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_12arrheniusLow_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  if (!(likely(((__pyx_v_value) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_value, __pyx_ptype_5rmgpy_8kinetics_9arrhenius_Arrhenius))))) __PYX_ERR(1, 49, __pyx_L1_error)
+  __pyx_t_1 = __pyx_v_value;
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_self->arrheniusLow);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->arrheniusLow));
+  __pyx_v_self->arrheniusLow = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Lindemann.arrheniusLow.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_12arrheniusLow_5__del__(PyObject *__pyx_v_self); /*proto*/
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_12arrheniusLow_5__del__(PyObject *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_12arrheniusLow_4__del__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_9Lindemann_12arrheniusLow_4__del__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__", 0);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->arrheniusLow);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->arrheniusLow));
+  __pyx_v_self->arrheniusLow = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)Py_None);
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":261
+ *     """
+ * 
+ *     def __init__(self, arrheniusHigh=None, arrheniusLow=None, alpha=0.0, T3=None, T1=None, T2=None, Tmin=None,             # <<<<<<<<<<<<<<
+ *                  Tmax=None, Pmin=None, Pmax=None, efficiencies=None, comment=''):
+ *         PDepKineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, efficiencies=efficiencies,
+ */
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_arrheniusHigh = 0;
+  PyObject *__pyx_v_arrheniusLow = 0;
+  PyObject *__pyx_v_alpha = 0;
+  PyObject *__pyx_v_T3 = 0;
+  PyObject *__pyx_v_T1 = 0;
+  PyObject *__pyx_v_T2 = 0;
+  PyObject *__pyx_v_Tmin = 0;
+  PyObject *__pyx_v_Tmax = 0;
+  PyObject *__pyx_v_Pmin = 0;
+  PyObject *__pyx_v_Pmax = 0;
+  PyObject *__pyx_v_efficiencies = 0;
+  PyObject *__pyx_v_comment = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_arrheniusHigh,&__pyx_n_s_arrheniusLow,&__pyx_n_s_alpha,&__pyx_n_s_T3,&__pyx_n_s_T1,&__pyx_n_s_T2,&__pyx_n_s_Tmin,&__pyx_n_s_Tmax,&__pyx_n_s_Pmin,&__pyx_n_s_Pmax,&__pyx_n_s_efficiencies,&__pyx_n_s_comment,0};
+    PyObject* values[12] = {0,0,0,0,0,0,0,0,0,0,0,0};
+    values[0] = ((PyObject *)Py_None);
+    values[1] = ((PyObject *)Py_None);
+    values[2] = ((PyObject *)__pyx_float_0_0);
+    values[3] = ((PyObject *)Py_None);
+    values[4] = ((PyObject *)Py_None);
+    values[5] = ((PyObject *)Py_None);
+    values[6] = ((PyObject *)Py_None);
+
+    /* "rmgpy/kinetics/falloff.pyx":262
+ * 
+ *     def __init__(self, arrheniusHigh=None, arrheniusLow=None, alpha=0.0, T3=None, T1=None, T2=None, Tmin=None,
+ *                  Tmax=None, Pmin=None, Pmax=None, efficiencies=None, comment=''):             # <<<<<<<<<<<<<<
+ *         PDepKineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, efficiencies=efficiencies,
+ *                                    comment=comment)
+ */
+    values[7] = ((PyObject *)Py_None);
+    values[8] = ((PyObject *)Py_None);
+    values[9] = ((PyObject *)Py_None);
+    values[10] = ((PyObject *)Py_None);
+    values[11] = ((PyObject *)__pyx_kp_u_);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 12: values[11] = PyTuple_GET_ITEM(__pyx_args, 11);
+        CYTHON_FALLTHROUGH;
+        case 11: values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+        CYTHON_FALLTHROUGH;
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_arrheniusHigh);
+          if (value) { values[0] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_arrheniusLow);
+          if (value) { values[1] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_alpha);
+          if (value) { values[2] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_T3);
+          if (value) { values[3] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_T1);
+          if (value) { values[4] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_T2);
+          if (value) { values[5] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_Tmin);
+          if (value) { values[6] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_Tmax);
+          if (value) { values[7] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_Pmin);
+          if (value) { values[8] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  9:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_Pmax);
+          if (value) { values[9] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case 10:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_efficiencies);
+          if (value) { values[10] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case 11:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_comment);
+          if (value) { values[11] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 261, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case 12: values[11] = PyTuple_GET_ITEM(__pyx_args, 11);
+        CYTHON_FALLTHROUGH;
+        case 11: values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+        CYTHON_FALLTHROUGH;
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_arrheniusHigh = values[0];
+    __pyx_v_arrheniusLow = values[1];
+    __pyx_v_alpha = values[2];
+    __pyx_v_T3 = values[3];
+    __pyx_v_T1 = values[4];
+    __pyx_v_T2 = values[5];
+    __pyx_v_Tmin = values[6];
+    __pyx_v_Tmax = values[7];
+    __pyx_v_Pmin = values[8];
+    __pyx_v_Pmax = values[9];
+    __pyx_v_efficiencies = values[10];
+    __pyx_v_comment = values[11];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 0, 12, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 261, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe___init__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self), __pyx_v_arrheniusHigh, __pyx_v_arrheniusLow, __pyx_v_alpha, __pyx_v_T3, __pyx_v_T1, __pyx_v_T2, __pyx_v_Tmin, __pyx_v_Tmax, __pyx_v_Pmin, __pyx_v_Pmax, __pyx_v_efficiencies, __pyx_v_comment);
+
+  /* "rmgpy/kinetics/falloff.pyx":261
+ *     """
+ * 
+ *     def __init__(self, arrheniusHigh=None, arrheniusLow=None, alpha=0.0, T3=None, T1=None, T2=None, Tmin=None,             # <<<<<<<<<<<<<<
+ *                  Tmax=None, Pmin=None, Pmax=None, efficiencies=None, comment=''):
+ *         PDepKineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, efficiencies=efficiencies,
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe___init__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, PyObject *__pyx_v_arrheniusHigh, PyObject *__pyx_v_arrheniusLow, PyObject *__pyx_v_alpha, PyObject *__pyx_v_T3, PyObject *__pyx_v_T1, PyObject *__pyx_v_T2, PyObject *__pyx_v_Tmin, PyObject *__pyx_v_Tmax, PyObject *__pyx_v_Pmin, PyObject *__pyx_v_Pmax, PyObject *__pyx_v_efficiencies, PyObject *__pyx_v_comment) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  double __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "rmgpy/kinetics/falloff.pyx":263
+ *     def __init__(self, arrheniusHigh=None, arrheniusLow=None, alpha=0.0, T3=None, T1=None, T2=None, Tmin=None,
+ *                  Tmax=None, Pmin=None, Pmax=None, efficiencies=None, comment=''):
+ *         PDepKineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, efficiencies=efficiencies,             # <<<<<<<<<<<<<<
+ *                                    comment=comment)
+ *         self.arrheniusHigh = arrheniusHigh
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel), __pyx_n_s_init); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 263, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 263, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_self));
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 263, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_Tmin, __pyx_v_Tmin) < 0) __PYX_ERR(0, 263, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_Tmax, __pyx_v_Tmax) < 0) __PYX_ERR(0, 263, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_Pmin, __pyx_v_Pmin) < 0) __PYX_ERR(0, 263, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_Pmax, __pyx_v_Pmax) < 0) __PYX_ERR(0, 263, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_efficiencies, __pyx_v_efficiencies) < 0) __PYX_ERR(0, 263, __pyx_L1_error)
+
+  /* "rmgpy/kinetics/falloff.pyx":264
+ *                  Tmax=None, Pmin=None, Pmax=None, efficiencies=None, comment=''):
+ *         PDepKineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, efficiencies=efficiencies,
+ *                                    comment=comment)             # <<<<<<<<<<<<<<
+ *         self.arrheniusHigh = arrheniusHigh
+ *         self.arrheniusLow = arrheniusLow
+ */
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_comment, __pyx_v_comment) < 0) __PYX_ERR(0, 263, __pyx_L1_error)
+
+  /* "rmgpy/kinetics/falloff.pyx":263
+ *     def __init__(self, arrheniusHigh=None, arrheniusLow=None, alpha=0.0, T3=None, T1=None, T2=None, Tmin=None,
+ *                  Tmax=None, Pmin=None, Pmax=None, efficiencies=None, comment=''):
+ *         PDepKineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, efficiencies=efficiencies,             # <<<<<<<<<<<<<<
+ *                                    comment=comment)
+ *         self.arrheniusHigh = arrheniusHigh
+ */
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 263, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":265
+ *         PDepKineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, efficiencies=efficiencies,
+ *                                    comment=comment)
+ *         self.arrheniusHigh = arrheniusHigh             # <<<<<<<<<<<<<<
+ *         self.arrheniusLow = arrheniusLow
+ *         self.alpha = alpha
+ */
+  if (!(likely(((__pyx_v_arrheniusHigh) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_arrheniusHigh, __pyx_ptype_5rmgpy_8kinetics_9arrhenius_Arrhenius))))) __PYX_ERR(0, 265, __pyx_L1_error)
+  __pyx_t_4 = __pyx_v_arrheniusHigh;
+  __Pyx_INCREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_4);
+  __Pyx_GOTREF(__pyx_v_self->arrheniusHigh);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->arrheniusHigh));
+  __pyx_v_self->arrheniusHigh = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":266
+ *                                    comment=comment)
+ *         self.arrheniusHigh = arrheniusHigh
+ *         self.arrheniusLow = arrheniusLow             # <<<<<<<<<<<<<<
+ *         self.alpha = alpha
+ *         self.T3 = T3
+ */
+  if (!(likely(((__pyx_v_arrheniusLow) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_arrheniusLow, __pyx_ptype_5rmgpy_8kinetics_9arrhenius_Arrhenius))))) __PYX_ERR(0, 266, __pyx_L1_error)
+  __pyx_t_4 = __pyx_v_arrheniusLow;
+  __Pyx_INCREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_4);
+  __Pyx_GOTREF(__pyx_v_self->arrheniusLow);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->arrheniusLow));
+  __pyx_v_self->arrheniusLow = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":267
+ *         self.arrheniusHigh = arrheniusHigh
+ *         self.arrheniusLow = arrheniusLow
+ *         self.alpha = alpha             # <<<<<<<<<<<<<<
+ *         self.T3 = T3
+ *         self.T1 = T1
+ */
+  __pyx_t_5 = __pyx_PyFloat_AsDouble(__pyx_v_alpha); if (unlikely((__pyx_t_5 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 267, __pyx_L1_error)
+  __pyx_v_self->alpha = __pyx_t_5;
+
+  /* "rmgpy/kinetics/falloff.pyx":268
+ *         self.arrheniusLow = arrheniusLow
+ *         self.alpha = alpha
+ *         self.T3 = T3             # <<<<<<<<<<<<<<
+ *         self.T1 = T1
+ *         self.T2 = T2
+ */
+  if (__Pyx_PyObject_SetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_T3, __pyx_v_T3) < 0) __PYX_ERR(0, 268, __pyx_L1_error)
+
+  /* "rmgpy/kinetics/falloff.pyx":269
+ *         self.alpha = alpha
+ *         self.T3 = T3
+ *         self.T1 = T1             # <<<<<<<<<<<<<<
+ *         self.T2 = T2
+ * 
+ */
+  if (__Pyx_PyObject_SetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_T1, __pyx_v_T1) < 0) __PYX_ERR(0, 269, __pyx_L1_error)
+
+  /* "rmgpy/kinetics/falloff.pyx":270
+ *         self.T3 = T3
+ *         self.T1 = T1
+ *         self.T2 = T2             # <<<<<<<<<<<<<<
+ * 
+ *     def __repr__(self):
+ */
+  if (__Pyx_PyObject_SetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_T2, __pyx_v_T2) < 0) __PYX_ERR(0, 270, __pyx_L1_error)
+
+  /* "rmgpy/kinetics/falloff.pyx":261
+ *     """
+ * 
+ *     def __init__(self, arrheniusHigh=None, arrheniusLow=None, alpha=0.0, T3=None, T1=None, T2=None, Tmin=None,             # <<<<<<<<<<<<<<
+ *                  Tmax=None, Pmin=None, Pmax=None, efficiencies=None, comment=''):
+ *         PDepKineticsModel.__init__(self, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin, Pmax=Pmax, efficiencies=efficiencies,
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":272
+ *         self.T2 = T2
+ * 
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Return a string representation that can be used to reconstruct the
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3__repr__(PyObject *__pyx_v_self); /*proto*/
+static char __pyx_doc_5rmgpy_8kinetics_7falloff_4Troe_2__repr__[] = "\n        Return a string representation that can be used to reconstruct the\n        Troe object.\n        ";
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_5rmgpy_8kinetics_7falloff_4Troe_2__repr__;
+#endif
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3__repr__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__repr__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_2__repr__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_2__repr__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self) {
+  PyObject *__pyx_v_string = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__repr__", 0);
+
+  /* "rmgpy/kinetics/falloff.pyx":277
+ *         Troe object.
+ *         """
+ *         string = 'Troe(arrheniusHigh={0!r}, arrheniusLow={1!r}'.format(self.arrheniusHigh, self.arrheniusLow)             # <<<<<<<<<<<<<<
+ *         if self.alpha != 0.0: string += ', alpha={0:g}'.format(self.alpha)
+ *         if self.T3 is not None: string += ', T3={0!r}'.format(self.T3)
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Troe_arrheniusHigh_0_r_arrhenius, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 277, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = NULL;
+  __pyx_t_4 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_4 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_3, ((PyObject *)__pyx_v_self->arrheniusHigh), ((PyObject *)__pyx_v_self->arrheniusLow)};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 277, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_3, ((PyObject *)__pyx_v_self->arrheniusHigh), ((PyObject *)__pyx_v_self->arrheniusLow)};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 277, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  {
+    __pyx_t_5 = PyTuple_New(2+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 277, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (__pyx_t_3) {
+      __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3); __pyx_t_3 = NULL;
+    }
+    __Pyx_INCREF(((PyObject *)__pyx_v_self->arrheniusHigh));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_self->arrheniusHigh));
+    PyTuple_SET_ITEM(__pyx_t_5, 0+__pyx_t_4, ((PyObject *)__pyx_v_self->arrheniusHigh));
+    __Pyx_INCREF(((PyObject *)__pyx_v_self->arrheniusLow));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_self->arrheniusLow));
+    PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_4, ((PyObject *)__pyx_v_self->arrheniusLow));
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 277, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_string = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":278
+ *         """
+ *         string = 'Troe(arrheniusHigh={0!r}, arrheniusLow={1!r}'.format(self.arrheniusHigh, self.arrheniusLow)
+ *         if self.alpha != 0.0: string += ', alpha={0:g}'.format(self.alpha)             # <<<<<<<<<<<<<<
+ *         if self.T3 is not None: string += ', T3={0!r}'.format(self.T3)
+ *         if self.T1 is not None: string += ', T1={0!r}'.format(self.T1)
+ */
+  __pyx_t_6 = ((__pyx_v_self->alpha != 0.0) != 0);
+  if (__pyx_t_6) {
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_alpha_0_g, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 278, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_5 = PyFloat_FromDouble(__pyx_v_self->alpha); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 278, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 278, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 278, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_2);
+    __pyx_t_2 = 0;
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":279
+ *         string = 'Troe(arrheniusHigh={0!r}, arrheniusLow={1!r}'.format(self.arrheniusHigh, self.arrheniusLow)
+ *         if self.alpha != 0.0: string += ', alpha={0:g}'.format(self.alpha)
+ *         if self.T3 is not None: string += ', T3={0!r}'.format(self.T3)             # <<<<<<<<<<<<<<
+ *         if self.T1 is not None: string += ', T1={0!r}'.format(self.T1)
+ *         if self.T2 is not None: string += ', T2={0!r}'.format(self.T2)
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_T3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 279, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_6 = (__pyx_t_2 != Py_None);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_7 = (__pyx_t_6 != 0);
+  if (__pyx_t_7) {
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_T3_0_r, __pyx_n_s_format); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 279, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_T3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 279, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_3, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 279, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 279, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_1);
+    __pyx_t_1 = 0;
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":280
+ *         if self.alpha != 0.0: string += ', alpha={0:g}'.format(self.alpha)
+ *         if self.T3 is not None: string += ', T3={0!r}'.format(self.T3)
+ *         if self.T1 is not None: string += ', T1={0!r}'.format(self.T1)             # <<<<<<<<<<<<<<
+ *         if self.T2 is not None: string += ', T2={0!r}'.format(self.T2)
+ *         if self.Tmin is not None: string += ', Tmin={0!r}'.format(self.Tmin)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_T1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 280, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_7 = (__pyx_t_1 != Py_None);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_6 = (__pyx_t_7 != 0);
+  if (__pyx_t_6) {
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_T1_0_r, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 280, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_T1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 280, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 280, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 280, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_2);
+    __pyx_t_2 = 0;
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":281
+ *         if self.T3 is not None: string += ', T3={0!r}'.format(self.T3)
+ *         if self.T1 is not None: string += ', T1={0!r}'.format(self.T1)
+ *         if self.T2 is not None: string += ', T2={0!r}'.format(self.T2)             # <<<<<<<<<<<<<<
+ *         if self.Tmin is not None: string += ', Tmin={0!r}'.format(self.Tmin)
+ *         if self.Tmax is not None: string += ', Tmax={0!r}'.format(self.Tmax)
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_T2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 281, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_6 = (__pyx_t_2 != Py_None);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_7 = (__pyx_t_6 != 0);
+  if (__pyx_t_7) {
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_T2_0_r, __pyx_n_s_format); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 281, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_T2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 281, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_3, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 281, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 281, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_1);
+    __pyx_t_1 = 0;
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":282
+ *         if self.T1 is not None: string += ', T1={0!r}'.format(self.T1)
+ *         if self.T2 is not None: string += ', T2={0!r}'.format(self.T2)
+ *         if self.Tmin is not None: string += ', Tmin={0!r}'.format(self.Tmin)             # <<<<<<<<<<<<<<
+ *         if self.Tmax is not None: string += ', Tmax={0!r}'.format(self.Tmax)
+ *         if self.Pmin is not None: string += ', Pmin={0!r}'.format(self.Pmin)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Tmin); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 282, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_7 = (__pyx_t_1 != Py_None);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_6 = (__pyx_t_7 != 0);
+  if (__pyx_t_6) {
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Tmin_0_r, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 282, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Tmin); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 282, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 282, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 282, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_2);
+    __pyx_t_2 = 0;
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":283
+ *         if self.T2 is not None: string += ', T2={0!r}'.format(self.T2)
+ *         if self.Tmin is not None: string += ', Tmin={0!r}'.format(self.Tmin)
+ *         if self.Tmax is not None: string += ', Tmax={0!r}'.format(self.Tmax)             # <<<<<<<<<<<<<<
+ *         if self.Pmin is not None: string += ', Pmin={0!r}'.format(self.Pmin)
+ *         if self.Pmax is not None: string += ', Pmax={0!r}'.format(self.Pmax)
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Tmax); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 283, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_6 = (__pyx_t_2 != Py_None);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_7 = (__pyx_t_6 != 0);
+  if (__pyx_t_7) {
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Tmax_0_r, __pyx_n_s_format); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 283, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Tmax); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 283, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_3, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 283, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 283, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_1);
+    __pyx_t_1 = 0;
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":284
+ *         if self.Tmin is not None: string += ', Tmin={0!r}'.format(self.Tmin)
+ *         if self.Tmax is not None: string += ', Tmax={0!r}'.format(self.Tmax)
+ *         if self.Pmin is not None: string += ', Pmin={0!r}'.format(self.Pmin)             # <<<<<<<<<<<<<<
+ *         if self.Pmax is not None: string += ', Pmax={0!r}'.format(self.Pmax)
+ *         if self.efficiencies is not None: string += ', efficiencies={0!r}'.format(self.efficiencies)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Pmin); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 284, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_7 = (__pyx_t_1 != Py_None);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_6 = (__pyx_t_7 != 0);
+  if (__pyx_t_6) {
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Pmin_0_r, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 284, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Pmin); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 284, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 284, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 284, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_2);
+    __pyx_t_2 = 0;
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":285
+ *         if self.Tmax is not None: string += ', Tmax={0!r}'.format(self.Tmax)
+ *         if self.Pmin is not None: string += ', Pmin={0!r}'.format(self.Pmin)
+ *         if self.Pmax is not None: string += ', Pmax={0!r}'.format(self.Pmax)             # <<<<<<<<<<<<<<
+ *         if self.efficiencies is not None: string += ', efficiencies={0!r}'.format(self.efficiencies)
+ *         if self.comment != '': string += ', comment="""{0}"""'.format(self.comment)
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Pmax); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 285, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_6 = (__pyx_t_2 != Py_None);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_7 = (__pyx_t_6 != 0);
+  if (__pyx_t_7) {
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_Pmax_0_r, __pyx_n_s_format); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 285, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Pmax); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 285, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_3, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 285, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 285, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_1);
+    __pyx_t_1 = 0;
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":286
+ *         if self.Pmin is not None: string += ', Pmin={0!r}'.format(self.Pmin)
+ *         if self.Pmax is not None: string += ', Pmax={0!r}'.format(self.Pmax)
+ *         if self.efficiencies is not None: string += ', efficiencies={0!r}'.format(self.efficiencies)             # <<<<<<<<<<<<<<
+ *         if self.comment != '': string += ', comment="""{0}"""'.format(self.comment)
+ *         string += ')'
+ */
+  __pyx_t_7 = (__pyx_v_self->__pyx_base.efficiencies != ((PyObject*)Py_None));
+  __pyx_t_6 = (__pyx_t_7 != 0);
+  if (__pyx_t_6) {
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_efficiencies_0_r, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 286, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_5, __pyx_v_self->__pyx_base.efficiencies) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_self->__pyx_base.efficiencies);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 286, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 286, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_2);
+    __pyx_t_2 = 0;
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":287
+ *         if self.Pmax is not None: string += ', Pmax={0!r}'.format(self.Pmax)
+ *         if self.efficiencies is not None: string += ', efficiencies={0!r}'.format(self.efficiencies)
+ *         if self.comment != '': string += ', comment="""{0}"""'.format(self.comment)             # <<<<<<<<<<<<<<
+ *         string += ')'
+ *         return string
+ */
+  __pyx_t_6 = (__Pyx_PyUnicode_Equals(__pyx_v_self->__pyx_base.__pyx_base.comment, __pyx_kp_u_, Py_NE)); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(0, 287, __pyx_L1_error)
+  __pyx_t_7 = (__pyx_t_6 != 0);
+  if (__pyx_t_7) {
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_comment_0, __pyx_n_s_format); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 287, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_5, __pyx_v_self->__pyx_base.__pyx_base.comment) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_self->__pyx_base.__pyx_base.comment);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 287, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 287, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_1);
+    __pyx_t_1 = 0;
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":288
+ *         if self.efficiencies is not None: string += ', efficiencies={0!r}'.format(self.efficiencies)
+ *         if self.comment != '': string += ', comment="""{0}"""'.format(self.comment)
+ *         string += ')'             # <<<<<<<<<<<<<<
+ *         return string
+ * 
+ */
+  __pyx_t_1 = PyNumber_InPlaceAdd(__pyx_v_string, __pyx_kp_u__2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 288, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF_SET(__pyx_v_string, __pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":289
+ *         if self.comment != '': string += ', comment="""{0}"""'.format(self.comment)
+ *         string += ')'
+ *         return string             # <<<<<<<<<<<<<<
+ * 
+ *     def __reduce__(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_string);
+  __pyx_r = __pyx_v_string;
+  goto __pyx_L0;
+
+  /* "rmgpy/kinetics/falloff.pyx":272
+ *         self.T2 = T2
+ * 
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Return a string representation that can be used to reconstruct the
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe.__repr__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_string);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":291
+ *         return string
+ * 
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         A helper function used when pickling a Troe object.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_5__reduce__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_5rmgpy_8kinetics_7falloff_4Troe_4__reduce__[] = "Troe.__reduce__(self)\n\n        A helper function used when pickling a Troe object.\n        ";
+static PyMethodDef __pyx_mdef_5rmgpy_8kinetics_7falloff_4Troe_5__reduce__ = {"__reduce__", (PyCFunction)__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_5__reduce__, METH_NOARGS, __pyx_doc_5rmgpy_8kinetics_7falloff_4Troe_4__reduce__};
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_5__reduce__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_4__reduce__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_4__reduce__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce__", 0);
+
+  /* "rmgpy/kinetics/falloff.pyx":295
+ *         A helper function used when pickling a Troe object.
+ *         """
+ *         return (Troe, (             # <<<<<<<<<<<<<<
+ *         self.arrheniusHigh, self.arrheniusLow, self.alpha, self.T3, self.T1, self.T2, self.Tmin, self.Tmax, self.Pmin,
+ *         self.Pmax, self.efficiencies, self.comment))
+ */
+  __Pyx_XDECREF(__pyx_r);
+
+  /* "rmgpy/kinetics/falloff.pyx":296
+ *         """
+ *         return (Troe, (
+ *         self.arrheniusHigh, self.arrheniusLow, self.alpha, self.T3, self.T1, self.T2, self.Tmin, self.Tmax, self.Pmin,             # <<<<<<<<<<<<<<
+ *         self.Pmax, self.efficiencies, self.comment))
+ * 
+ */
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->alpha); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 296, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_T3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 296, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_T1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 296, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_T2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 296, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Tmin); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 296, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Tmax); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 296, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Pmin); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 296, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+
+  /* "rmgpy/kinetics/falloff.pyx":297
+ *         return (Troe, (
+ *         self.arrheniusHigh, self.arrheniusLow, self.alpha, self.T3, self.T1, self.T2, self.Tmin, self.Tmax, self.Pmin,
+ *         self.Pmax, self.efficiencies, self.comment))             # <<<<<<<<<<<<<<
+ * 
+ *     property T1:
+ */
+  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_Pmax); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 297, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+
+  /* "rmgpy/kinetics/falloff.pyx":296
+ *         """
+ *         return (Troe, (
+ *         self.arrheniusHigh, self.arrheniusLow, self.alpha, self.T3, self.T1, self.T2, self.Tmin, self.Tmax, self.Pmin,             # <<<<<<<<<<<<<<
+ *         self.Pmax, self.efficiencies, self.comment))
+ * 
+ */
+  __pyx_t_9 = PyTuple_New(12); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 296, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->arrheniusHigh));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self->arrheniusHigh));
+  PyTuple_SET_ITEM(__pyx_t_9, 0, ((PyObject *)__pyx_v_self->arrheniusHigh));
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->arrheniusLow));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self->arrheniusLow));
+  PyTuple_SET_ITEM(__pyx_t_9, 1, ((PyObject *)__pyx_v_self->arrheniusLow));
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_9, 2, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_9, 3, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_9, 4, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_9, 5, __pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_9, 6, __pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_9, 7, __pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_9, 8, __pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_8);
+  PyTuple_SET_ITEM(__pyx_t_9, 9, __pyx_t_8);
+  __Pyx_INCREF(__pyx_v_self->__pyx_base.efficiencies);
+  __Pyx_GIVEREF(__pyx_v_self->__pyx_base.efficiencies);
+  PyTuple_SET_ITEM(__pyx_t_9, 10, __pyx_v_self->__pyx_base.efficiencies);
+  __Pyx_INCREF(__pyx_v_self->__pyx_base.__pyx_base.comment);
+  __Pyx_GIVEREF(__pyx_v_self->__pyx_base.__pyx_base.comment);
+  PyTuple_SET_ITEM(__pyx_t_9, 11, __pyx_v_self->__pyx_base.__pyx_base.comment);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_4 = 0;
+  __pyx_t_5 = 0;
+  __pyx_t_6 = 0;
+  __pyx_t_7 = 0;
+  __pyx_t_8 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":295
+ *         A helper function used when pickling a Troe object.
+ *         """
+ *         return (Troe, (             # <<<<<<<<<<<<<<
+ *         self.arrheniusHigh, self.arrheniusLow, self.alpha, self.T3, self.T1, self.T2, self.Tmin, self.Tmax, self.Pmin,
+ *         self.Pmax, self.efficiencies, self.comment))
+ */
+  __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 295, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_INCREF(((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_Troe));
+  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_Troe));
+  PyTuple_SET_ITEM(__pyx_t_8, 0, ((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_Troe));
+  __Pyx_GIVEREF(__pyx_t_9);
+  PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_9);
+  __pyx_t_9 = 0;
+  __pyx_r = __pyx_t_8;
+  __pyx_t_8 = 0;
+  goto __pyx_L0;
+
+  /* "rmgpy/kinetics/falloff.pyx":291
+ *         return string
+ * 
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         A helper function used when pickling a Troe object.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe.__reduce__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":301
+ *     property T1:
+ *         """The Troe :math:`T_1` parameter."""
+ *         def __get__(self):             # <<<<<<<<<<<<<<
+ *             return self._T1
+ *         def __set__(self, value):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_2T1_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_2T1_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_2T1___get__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_2T1___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+
+  /* "rmgpy/kinetics/falloff.pyx":302
+ *         """The Troe :math:`T_1` parameter."""
+ *         def __get__(self):
+ *             return self._T1             # <<<<<<<<<<<<<<
+ *         def __set__(self, value):
+ *             self._T1 = quantity.Temperature(value)
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->_T1));
+  __pyx_r = ((PyObject *)__pyx_v_self->_T1);
+  goto __pyx_L0;
+
+  /* "rmgpy/kinetics/falloff.pyx":301
+ *     property T1:
+ *         """The Troe :math:`T_1` parameter."""
+ *         def __get__(self):             # <<<<<<<<<<<<<<
+ *             return self._T1
+ *         def __set__(self, value):
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":303
+ *         def __get__(self):
+ *             return self._T1
+ *         def __set__(self, value):             # <<<<<<<<<<<<<<
+ *             self._T1 = quantity.Temperature(value)
+ * 
+ */
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_2T1_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_2T1_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_2T1_2__set__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_2T1_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
+
+  /* "rmgpy/kinetics/falloff.pyx":304
+ *             return self._T1
+ *         def __set__(self, value):
+ *             self._T1 = quantity.Temperature(value)             # <<<<<<<<<<<<<<
+ * 
+ *     property T2:
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_quantity); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 304, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_Temperature); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 304, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_2)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_2);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_2, __pyx_v_value) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_value);
+  __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 304, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5rmgpy_8quantity_ScalarQuantity))))) __PYX_ERR(0, 304, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_self->_T1);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->_T1));
+  __pyx_v_self->_T1 = ((struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":303
+ *         def __get__(self):
+ *             return self._T1
+ *         def __set__(self, value):             # <<<<<<<<<<<<<<
+ *             self._T1 = quantity.Temperature(value)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe.T1.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":308
+ *     property T2:
+ *         """The Troe :math:`T_2` parameter."""
+ *         def __get__(self):             # <<<<<<<<<<<<<<
+ *             return self._T2
+ *         def __set__(self, value):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_2T2_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_2T2_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_2T2___get__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_2T2___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+
+  /* "rmgpy/kinetics/falloff.pyx":309
+ *         """The Troe :math:`T_2` parameter."""
+ *         def __get__(self):
+ *             return self._T2             # <<<<<<<<<<<<<<
+ *         def __set__(self, value):
+ *             self._T2 = quantity.Temperature(value)
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->_T2));
+  __pyx_r = ((PyObject *)__pyx_v_self->_T2);
+  goto __pyx_L0;
+
+  /* "rmgpy/kinetics/falloff.pyx":308
+ *     property T2:
+ *         """The Troe :math:`T_2` parameter."""
+ *         def __get__(self):             # <<<<<<<<<<<<<<
+ *             return self._T2
+ *         def __set__(self, value):
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":310
+ *         def __get__(self):
+ *             return self._T2
+ *         def __set__(self, value):             # <<<<<<<<<<<<<<
+ *             self._T2 = quantity.Temperature(value)
+ * 
+ */
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_2T2_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_2T2_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_2T2_2__set__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_2T2_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
+
+  /* "rmgpy/kinetics/falloff.pyx":311
+ *             return self._T2
+ *         def __set__(self, value):
+ *             self._T2 = quantity.Temperature(value)             # <<<<<<<<<<<<<<
+ * 
+ *     property T3:
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_quantity); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 311, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_Temperature); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 311, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_2)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_2);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_2, __pyx_v_value) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_value);
+  __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 311, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5rmgpy_8quantity_ScalarQuantity))))) __PYX_ERR(0, 311, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_self->_T2);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->_T2));
+  __pyx_v_self->_T2 = ((struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":310
+ *         def __get__(self):
+ *             return self._T2
+ *         def __set__(self, value):             # <<<<<<<<<<<<<<
+ *             self._T2 = quantity.Temperature(value)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe.T2.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":315
+ *     property T3:
+ *         """The Troe :math:`T_3` parameter."""
+ *         def __get__(self):             # <<<<<<<<<<<<<<
+ *             return self._T3
+ *         def __set__(self, value):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_2T3_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_2T3_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_2T3___get__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_2T3___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+
+  /* "rmgpy/kinetics/falloff.pyx":316
+ *         """The Troe :math:`T_3` parameter."""
+ *         def __get__(self):
+ *             return self._T3             # <<<<<<<<<<<<<<
+ *         def __set__(self, value):
+ *             self._T3 = quantity.Temperature(value)
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->_T3));
+  __pyx_r = ((PyObject *)__pyx_v_self->_T3);
+  goto __pyx_L0;
+
+  /* "rmgpy/kinetics/falloff.pyx":315
+ *     property T3:
+ *         """The Troe :math:`T_3` parameter."""
+ *         def __get__(self):             # <<<<<<<<<<<<<<
+ *             return self._T3
+ *         def __set__(self, value):
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":317
+ *         def __get__(self):
+ *             return self._T3
+ *         def __set__(self, value):             # <<<<<<<<<<<<<<
+ *             self._T3 = quantity.Temperature(value)
+ * 
+ */
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_2T3_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_2T3_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_2T3_2__set__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_2T3_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
+
+  /* "rmgpy/kinetics/falloff.pyx":318
+ *             return self._T3
+ *         def __set__(self, value):
+ *             self._T3 = quantity.Temperature(value)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=0.0) except -1:
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_quantity); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_Temperature); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_2)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_2);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_2, __pyx_v_value) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_value);
+  __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5rmgpy_8quantity_ScalarQuantity))))) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_self->_T3);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->_T3));
+  __pyx_v_self->_T3 = ((struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":317
+ *         def __get__(self):
+ *             return self._T3
+ *         def __set__(self, value):             # <<<<<<<<<<<<<<
+ *             self._T3 = quantity.Temperature(value)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe.T3.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":320
+ *             self._T3 = quantity.Temperature(value)
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=0.0) except -1:             # <<<<<<<<<<<<<<
+ *         """
+ *         Return the value of the rate coefficient :math:`k(T)` in units of m^3,
+ */
+
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_7get_rate_coefficient(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static double __pyx_f_5rmgpy_8kinetics_7falloff_4Troe_get_rate_coefficient(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, double __pyx_v_T, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8kinetics_7falloff_4Troe_get_rate_coefficient *__pyx_optional_args) {
+  double __pyx_v_P = ((double)0.0);
+  double __pyx_v_C;
+  double __pyx_v_k0;
+  double __pyx_v_kinf;
+  double __pyx_v_Pr;
+  double __pyx_v_d;
+  double __pyx_v_n;
+  double __pyx_v_c;
+  double __pyx_v_Fcent;
+  double __pyx_v_F;
+  double __pyx_v_alpha;
+  double __pyx_v_T1;
+  double __pyx_v_T2;
+  double __pyx_v_T3;
+  double __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  double __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_rate_coefficient", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_P = __pyx_optional_args->P;
+    }
+  }
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get_rate_coefficient); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 320, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_7get_rate_coefficient)) {
+        __pyx_t_3 = PyFloat_FromDouble(__pyx_v_T); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 320, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_4 = PyFloat_FromDouble(__pyx_v_P); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 320, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_5 = __pyx_t_1; __pyx_t_6 = NULL;
+        __pyx_t_7 = 0;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+          __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+          if (likely(__pyx_t_6)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+            __Pyx_INCREF(__pyx_t_6);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_5, function);
+            __pyx_t_7 = 1;
+          }
+        }
+        #if CYTHON_FAST_PYCALL
+        if (PyFunction_Check(__pyx_t_5)) {
+          PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_3, __pyx_t_4};
+          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 320, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        } else
+        #endif
+        #if CYTHON_FAST_PYCCALL
+        if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
+          PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_3, __pyx_t_4};
+          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 320, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        } else
+        #endif
+        {
+          __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 320, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          if (__pyx_t_6) {
+            __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6); __pyx_t_6 = NULL;
+          }
+          __Pyx_GIVEREF(__pyx_t_3);
+          PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_7, __pyx_t_3);
+          __Pyx_GIVEREF(__pyx_t_4);
+          PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_4);
+          __pyx_t_3 = 0;
+          __pyx_t_4 = 0;
+          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_8, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 320, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        }
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __pyx_t_9 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_9 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 320, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __pyx_r = __pyx_t_9;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":332
+ *         cdef double alpha, T1, T2, T3
+ * 
+ *         C = P / constants.R / T  # bath gas concentration in mol/m^3             # <<<<<<<<<<<<<<
+ *         k0 = self.arrheniusLow.get_rate_coefficient(T)
+ *         kinf = self.arrheniusHigh.get_rate_coefficient(T)
+ */
+  __pyx_v_C = ((__pyx_v_P / __pyx_v_5rmgpy_9constants_R) / __pyx_v_T);
+
+  /* "rmgpy/kinetics/falloff.pyx":333
+ * 
+ *         C = P / constants.R / T  # bath gas concentration in mol/m^3
+ *         k0 = self.arrheniusLow.get_rate_coefficient(T)             # <<<<<<<<<<<<<<
+ *         kinf = self.arrheniusHigh.get_rate_coefficient(T)
+ *         Pr = k0 * C / kinf
+ */
+  __pyx_t_9 = ((struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_v_self->arrheniusLow->__pyx_base.__pyx_vtab)->__pyx_base.get_rate_coefficient(((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_v_self->arrheniusLow), __pyx_v_T, 0, NULL); if (unlikely(__pyx_t_9 == ((double)-1.0))) __PYX_ERR(0, 333, __pyx_L1_error)
+  __pyx_v_k0 = __pyx_t_9;
+
+  /* "rmgpy/kinetics/falloff.pyx":334
+ *         C = P / constants.R / T  # bath gas concentration in mol/m^3
+ *         k0 = self.arrheniusLow.get_rate_coefficient(T)
+ *         kinf = self.arrheniusHigh.get_rate_coefficient(T)             # <<<<<<<<<<<<<<
+ *         Pr = k0 * C / kinf
+ * 
+ */
+  __pyx_t_9 = ((struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_v_self->arrheniusHigh->__pyx_base.__pyx_vtab)->__pyx_base.get_rate_coefficient(((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_v_self->arrheniusHigh), __pyx_v_T, 0, NULL); if (unlikely(__pyx_t_9 == ((double)-1.0))) __PYX_ERR(0, 334, __pyx_L1_error)
+  __pyx_v_kinf = __pyx_t_9;
+
+  /* "rmgpy/kinetics/falloff.pyx":335
+ *         k0 = self.arrheniusLow.get_rate_coefficient(T)
+ *         kinf = self.arrheniusHigh.get_rate_coefficient(T)
+ *         Pr = k0 * C / kinf             # <<<<<<<<<<<<<<
+ * 
+ *         alpha = self.alpha
+ */
+  __pyx_v_Pr = ((__pyx_v_k0 * __pyx_v_C) / __pyx_v_kinf);
+
+  /* "rmgpy/kinetics/falloff.pyx":337
+ *         Pr = k0 * C / kinf
+ * 
+ *         alpha = self.alpha             # <<<<<<<<<<<<<<
+ *         T1 = self._T1.value_si if self._T1 is not None else 0.0
+ *         T2 = self._T2.value_si if self._T2 is not None else 0.0
+ */
+  __pyx_t_9 = __pyx_v_self->alpha;
+  __pyx_v_alpha = __pyx_t_9;
+
+  /* "rmgpy/kinetics/falloff.pyx":338
+ * 
+ *         alpha = self.alpha
+ *         T1 = self._T1.value_si if self._T1 is not None else 0.0             # <<<<<<<<<<<<<<
+ *         T2 = self._T2.value_si if self._T2 is not None else 0.0
+ *         T3 = self._T3.value_si if self._T3 is not None else 0.0
+ */
+  __pyx_t_10 = (((PyObject *)__pyx_v_self->_T1) != Py_None);
+  if ((__pyx_t_10 != 0)) {
+    __pyx_t_9 = __pyx_v_self->_T1->value_si;
+  } else {
+    __pyx_t_9 = 0.0;
+  }
+  __pyx_v_T1 = __pyx_t_9;
+
+  /* "rmgpy/kinetics/falloff.pyx":339
+ *         alpha = self.alpha
+ *         T1 = self._T1.value_si if self._T1 is not None else 0.0
+ *         T2 = self._T2.value_si if self._T2 is not None else 0.0             # <<<<<<<<<<<<<<
+ *         T3 = self._T3.value_si if self._T3 is not None else 0.0
+ * 
+ */
+  __pyx_t_10 = (((PyObject *)__pyx_v_self->_T2) != Py_None);
+  if ((__pyx_t_10 != 0)) {
+    __pyx_t_9 = __pyx_v_self->_T2->value_si;
+  } else {
+    __pyx_t_9 = 0.0;
+  }
+  __pyx_v_T2 = __pyx_t_9;
+
+  /* "rmgpy/kinetics/falloff.pyx":340
+ *         T1 = self._T1.value_si if self._T1 is not None else 0.0
+ *         T2 = self._T2.value_si if self._T2 is not None else 0.0
+ *         T3 = self._T3.value_si if self._T3 is not None else 0.0             # <<<<<<<<<<<<<<
+ * 
+ *         if T1 == 0 and T3 == 0:
+ */
+  __pyx_t_10 = (((PyObject *)__pyx_v_self->_T3) != Py_None);
+  if ((__pyx_t_10 != 0)) {
+    __pyx_t_9 = __pyx_v_self->_T3->value_si;
+  } else {
+    __pyx_t_9 = 0.0;
+  }
+  __pyx_v_T3 = __pyx_t_9;
+
+  /* "rmgpy/kinetics/falloff.pyx":342
+ *         T3 = self._T3.value_si if self._T3 is not None else 0.0
+ * 
+ *         if T1 == 0 and T3 == 0:             # <<<<<<<<<<<<<<
+ *             F = 1.0
+ *         else:
+ */
+  __pyx_t_11 = ((__pyx_v_T1 == 0.0) != 0);
+  if (__pyx_t_11) {
+  } else {
+    __pyx_t_10 = __pyx_t_11;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_11 = ((__pyx_v_T3 == 0.0) != 0);
+  __pyx_t_10 = __pyx_t_11;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_10) {
+
+    /* "rmgpy/kinetics/falloff.pyx":343
+ * 
+ *         if T1 == 0 and T3 == 0:
+ *             F = 1.0             # <<<<<<<<<<<<<<
+ *         else:
+ *             Fcent = (1 - alpha) * exp(-T / T3) + alpha * exp(-T / T1)
+ */
+    __pyx_v_F = 1.0;
+
+    /* "rmgpy/kinetics/falloff.pyx":342
+ *         T3 = self._T3.value_si if self._T3 is not None else 0.0
+ * 
+ *         if T1 == 0 and T3 == 0:             # <<<<<<<<<<<<<<
+ *             F = 1.0
+ *         else:
+ */
+    goto __pyx_L3;
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":345
+ *             F = 1.0
+ *         else:
+ *             Fcent = (1 - alpha) * exp(-T / T3) + alpha * exp(-T / T1)             # <<<<<<<<<<<<<<
+ *             if T2 != 0.0: Fcent += exp(-T2 / T)
+ *             d = 0.14
+ */
+  /*else*/ {
+    __pyx_v_Fcent = (((1.0 - __pyx_v_alpha) * exp(((-__pyx_v_T) / __pyx_v_T3))) + (__pyx_v_alpha * exp(((-__pyx_v_T) / __pyx_v_T1))));
+
+    /* "rmgpy/kinetics/falloff.pyx":346
+ *         else:
+ *             Fcent = (1 - alpha) * exp(-T / T3) + alpha * exp(-T / T1)
+ *             if T2 != 0.0: Fcent += exp(-T2 / T)             # <<<<<<<<<<<<<<
+ *             d = 0.14
+ *             n = 0.75 - 1.27 * log10(Fcent)
+ */
+    __pyx_t_10 = ((__pyx_v_T2 != 0.0) != 0);
+    if (__pyx_t_10) {
+      __pyx_v_Fcent = (__pyx_v_Fcent + exp(((-__pyx_v_T2) / __pyx_v_T)));
+    }
+
+    /* "rmgpy/kinetics/falloff.pyx":347
+ *             Fcent = (1 - alpha) * exp(-T / T3) + alpha * exp(-T / T1)
+ *             if T2 != 0.0: Fcent += exp(-T2 / T)
+ *             d = 0.14             # <<<<<<<<<<<<<<
+ *             n = 0.75 - 1.27 * log10(Fcent)
+ *             c = -0.4 - 0.67 * log10(Fcent)
+ */
+    __pyx_v_d = 0.14;
+
+    /* "rmgpy/kinetics/falloff.pyx":348
+ *             if T2 != 0.0: Fcent += exp(-T2 / T)
+ *             d = 0.14
+ *             n = 0.75 - 1.27 * log10(Fcent)             # <<<<<<<<<<<<<<
+ *             c = -0.4 - 0.67 * log10(Fcent)
+ *             F = 10.0 ** (log10(Fcent) / (1 + ((log10(Pr) + c) / (n - d * (log10(Pr)))) ** 2))
+ */
+    __pyx_v_n = (0.75 - (1.27 * log10(__pyx_v_Fcent)));
+
+    /* "rmgpy/kinetics/falloff.pyx":349
+ *             d = 0.14
+ *             n = 0.75 - 1.27 * log10(Fcent)
+ *             c = -0.4 - 0.67 * log10(Fcent)             # <<<<<<<<<<<<<<
+ *             F = 10.0 ** (log10(Fcent) / (1 + ((log10(Pr) + c) / (n - d * (log10(Pr)))) ** 2))
+ * 
+ */
+    __pyx_v_c = (-0.4 - (0.67 * log10(__pyx_v_Fcent)));
+
+    /* "rmgpy/kinetics/falloff.pyx":350
+ *             n = 0.75 - 1.27 * log10(Fcent)
+ *             c = -0.4 - 0.67 * log10(Fcent)
+ *             F = 10.0 ** (log10(Fcent) / (1 + ((log10(Pr) + c) / (n - d * (log10(Pr)))) ** 2))             # <<<<<<<<<<<<<<
+ * 
+ *         return kinf * (Pr / (1 + Pr)) * F
+ */
+    __pyx_v_F = pow(10.0, (log10(__pyx_v_Fcent) / (1.0 + pow(((log10(__pyx_v_Pr) + __pyx_v_c) / (__pyx_v_n - (__pyx_v_d * log10(__pyx_v_Pr)))), 2.0))));
+  }
+  __pyx_L3:;
+
+  /* "rmgpy/kinetics/falloff.pyx":352
+ *             F = 10.0 ** (log10(Fcent) / (1 + ((log10(Pr) + c) / (n - d * (log10(Pr)))) ** 2))
+ * 
+ *         return kinf * (Pr / (1 + Pr)) * F             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:
+ */
+  __pyx_r = ((__pyx_v_kinf * (__pyx_v_Pr / (1.0 + __pyx_v_Pr))) * __pyx_v_F);
+  goto __pyx_L0;
+
+  /* "rmgpy/kinetics/falloff.pyx":320
+ *             self._T3 = quantity.Temperature(value)
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=0.0) except -1:             # <<<<<<<<<<<<<<
+ *         """
+ *         Return the value of the rate coefficient :math:`k(T)` in units of m^3,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe.get_rate_coefficient", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1.0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_7get_rate_coefficient(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5rmgpy_8kinetics_7falloff_4Troe_6get_rate_coefficient[] = "Troe.get_rate_coefficient(self, double T, double P=0.0) -> double\n\n        Return the value of the rate coefficient :math:`k(T)` in units of m^3,\n        mol, and s at the specified temperature `T` in K and pressure `P` in\n        Pa. If you wish to consider collision efficiencies, then you should\n        first use :meth:`get_effective_pressure()` to compute the effective\n        pressure, and pass that value as the pressure to this method.\n        ";
+static PyMethodDef __pyx_mdef_5rmgpy_8kinetics_7falloff_4Troe_7get_rate_coefficient = {"get_rate_coefficient", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_7get_rate_coefficient, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5rmgpy_8kinetics_7falloff_4Troe_6get_rate_coefficient};
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_7get_rate_coefficient(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  double __pyx_v_T;
+  double __pyx_v_P;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("get_rate_coefficient (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_T,&__pyx_n_s_P,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_T)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_P);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "get_rate_coefficient") < 0)) __PYX_ERR(0, 320, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_T = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_T == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 320, __pyx_L3_error)
+    if (values[1]) {
+      __pyx_v_P = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_P == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 320, __pyx_L3_error)
+    } else {
+      __pyx_v_P = ((double)0.0);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("get_rate_coefficient", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 320, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe.get_rate_coefficient", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_6get_rate_coefficient(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self), __pyx_v_T, __pyx_v_P);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_6get_rate_coefficient(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, double __pyx_v_T, double __pyx_v_P) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  double __pyx_t_1;
+  struct __pyx_opt_args_5rmgpy_8kinetics_5model_13KineticsModel_get_rate_coefficient __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_rate_coefficient", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2.__pyx_n = 1;
+  __pyx_t_2.P = __pyx_v_P;
+  __pyx_t_1 = __pyx_vtabptr_5rmgpy_8kinetics_7falloff_Troe->__pyx_base.__pyx_base.get_rate_coefficient(((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_v_self), __pyx_v_T, 1, &__pyx_t_2); if (unlikely(__pyx_t_1 == ((double)-1.0))) __PYX_ERR(0, 320, __pyx_L1_error)
+  __pyx_t_3 = PyFloat_FromDouble(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe.get_rate_coefficient", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":354
+ *         return kinf * (Pr / (1 + Pr)) * F
+ * 
+ *     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:             # <<<<<<<<<<<<<<
+ *         """
+ *         Checks to see if kinetics matches that of other kinetics and returns ``True``
+ */
+
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_9is_identical_to(PyObject *__pyx_v_self, PyObject *__pyx_v_other_kinetics); /*proto*/
+static int __pyx_f_5rmgpy_8kinetics_7falloff_4Troe_is_identical_to(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *__pyx_v_other_kinetics, int __pyx_skip_dispatch) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("is_identical_to", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_is_identical_to); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 354, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_9is_identical_to)) {
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, ((PyObject *)__pyx_v_other_kinetics)) : __Pyx_PyObject_CallOneArg(__pyx_t_3, ((PyObject *)__pyx_v_other_kinetics));
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 354, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 354, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __pyx_r = __pyx_t_5;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":359
+ *         if coeffs, kunits, Tmin,
+ *         """
+ *         if not isinstance(other_kinetics, Troe):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):
+ */
+  __pyx_t_5 = __Pyx_TypeCheck(((PyObject *)__pyx_v_other_kinetics), __pyx_ptype_5rmgpy_8kinetics_7falloff_Troe); 
+  __pyx_t_6 = ((!(__pyx_t_5 != 0)) != 0);
+  if (__pyx_t_6) {
+
+    /* "rmgpy/kinetics/falloff.pyx":360
+ *         """
+ *         if not isinstance(other_kinetics, Troe):
+ *             return False             # <<<<<<<<<<<<<<
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):
+ *             return False
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "rmgpy/kinetics/falloff.pyx":359
+ *         if coeffs, kunits, Tmin,
+ *         """
+ *         if not isinstance(other_kinetics, Troe):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):
+ */
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":361
+ *         if not isinstance(other_kinetics, Troe):
+ *             return False
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if not self.arrheniusLow.is_identical_to(other_kinetics.arrheniusLow):
+ */
+  __pyx_t_6 = __pyx_vtabptr_5rmgpy_8kinetics_5model_KineticsModel->is_identical_to(((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_v_self), __pyx_v_other_kinetics, 1); if (unlikely(__pyx_t_6 == ((int)-2))) __PYX_ERR(0, 361, __pyx_L1_error)
+  __pyx_t_5 = ((!(__pyx_t_6 != 0)) != 0);
+  if (__pyx_t_5) {
+
+    /* "rmgpy/kinetics/falloff.pyx":362
+ *             return False
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):
+ *             return False             # <<<<<<<<<<<<<<
+ *         if not self.arrheniusLow.is_identical_to(other_kinetics.arrheniusLow):
+ *             return False
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "rmgpy/kinetics/falloff.pyx":361
+ *         if not isinstance(other_kinetics, Troe):
+ *             return False
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if not self.arrheniusLow.is_identical_to(other_kinetics.arrheniusLow):
+ */
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":363
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):
+ *             return False
+ *         if not self.arrheniusLow.is_identical_to(other_kinetics.arrheniusLow):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if not self.arrheniusHigh.is_identical_to(other_kinetics.arrheniusHigh):
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_other_kinetics), __pyx_n_s_arrheniusLow); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 363, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5rmgpy_8kinetics_5model_KineticsModel))))) __PYX_ERR(0, 363, __pyx_L1_error)
+  __pyx_t_5 = ((struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_v_self->arrheniusLow->__pyx_base.__pyx_vtab)->__pyx_base.is_identical_to(((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_v_self->arrheniusLow), ((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_t_1), 0); if (unlikely(__pyx_t_5 == ((int)-2))) __PYX_ERR(0, 363, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_6 = ((!(__pyx_t_5 != 0)) != 0);
+  if (__pyx_t_6) {
+
+    /* "rmgpy/kinetics/falloff.pyx":364
+ *             return False
+ *         if not self.arrheniusLow.is_identical_to(other_kinetics.arrheniusLow):
+ *             return False             # <<<<<<<<<<<<<<
+ *         if not self.arrheniusHigh.is_identical_to(other_kinetics.arrheniusHigh):
+ *             return False
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "rmgpy/kinetics/falloff.pyx":363
+ *         if not KineticsModel.is_identical_to(self, other_kinetics):
+ *             return False
+ *         if not self.arrheniusLow.is_identical_to(other_kinetics.arrheniusLow):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if not self.arrheniusHigh.is_identical_to(other_kinetics.arrheniusHigh):
+ */
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":365
+ *         if not self.arrheniusLow.is_identical_to(other_kinetics.arrheniusLow):
+ *             return False
+ *         if not self.arrheniusHigh.is_identical_to(other_kinetics.arrheniusHigh):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if not self.alpha == other_kinetics.alpha:
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_other_kinetics), __pyx_n_s_arrheniusHigh); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 365, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5rmgpy_8kinetics_5model_KineticsModel))))) __PYX_ERR(0, 365, __pyx_L1_error)
+  __pyx_t_6 = ((struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_v_self->arrheniusHigh->__pyx_base.__pyx_vtab)->__pyx_base.is_identical_to(((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_v_self->arrheniusHigh), ((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_t_1), 0); if (unlikely(__pyx_t_6 == ((int)-2))) __PYX_ERR(0, 365, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_5 = ((!(__pyx_t_6 != 0)) != 0);
+  if (__pyx_t_5) {
+
+    /* "rmgpy/kinetics/falloff.pyx":366
+ *             return False
+ *         if not self.arrheniusHigh.is_identical_to(other_kinetics.arrheniusHigh):
+ *             return False             # <<<<<<<<<<<<<<
+ *         if not self.alpha == other_kinetics.alpha:
+ *             return False
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "rmgpy/kinetics/falloff.pyx":365
+ *         if not self.arrheniusLow.is_identical_to(other_kinetics.arrheniusLow):
+ *             return False
+ *         if not self.arrheniusHigh.is_identical_to(other_kinetics.arrheniusHigh):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if not self.alpha == other_kinetics.alpha:
+ */
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":367
+ *         if not self.arrheniusHigh.is_identical_to(other_kinetics.arrheniusHigh):
+ *             return False
+ *         if not self.alpha == other_kinetics.alpha:             # <<<<<<<<<<<<<<
+ *             return False
+ *         if not self.T1.equals(other_kinetics.T1):
+ */
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->alpha); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 367, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_other_kinetics), __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 367, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyObject_RichCompare(__pyx_t_1, __pyx_t_2, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 367, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(0, 367, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_6 = ((!__pyx_t_5) != 0);
+  if (__pyx_t_6) {
+
+    /* "rmgpy/kinetics/falloff.pyx":368
+ *             return False
+ *         if not self.alpha == other_kinetics.alpha:
+ *             return False             # <<<<<<<<<<<<<<
+ *         if not self.T1.equals(other_kinetics.T1):
+ *             return False
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "rmgpy/kinetics/falloff.pyx":367
+ *         if not self.arrheniusHigh.is_identical_to(other_kinetics.arrheniusHigh):
+ *             return False
+ *         if not self.alpha == other_kinetics.alpha:             # <<<<<<<<<<<<<<
+ *             return False
+ *         if not self.T1.equals(other_kinetics.T1):
+ */
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":369
+ *         if not self.alpha == other_kinetics.alpha:
+ *             return False
+ *         if not self.T1.equals(other_kinetics.T1):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if not self.T3.equals(other_kinetics.T3):
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_T1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_equals); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_other_kinetics), __pyx_n_s_T1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_4, __pyx_t_2) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_5 = ((!__pyx_t_6) != 0);
+  if (__pyx_t_5) {
+
+    /* "rmgpy/kinetics/falloff.pyx":370
+ *             return False
+ *         if not self.T1.equals(other_kinetics.T1):
+ *             return False             # <<<<<<<<<<<<<<
+ *         if not self.T3.equals(other_kinetics.T3):
+ *             return False
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "rmgpy/kinetics/falloff.pyx":369
+ *         if not self.alpha == other_kinetics.alpha:
+ *             return False
+ *         if not self.T1.equals(other_kinetics.T1):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if not self.T3.equals(other_kinetics.T3):
+ */
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":371
+ *         if not self.T1.equals(other_kinetics.T1):
+ *             return False
+ *         if not self.T3.equals(other_kinetics.T3):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if self.T2 is not None and not self.T2.equals(other_kinetics.T2):
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_T3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_equals); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_other_kinetics), __pyx_n_s_T3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_4, __pyx_t_1) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_6 = ((!__pyx_t_5) != 0);
+  if (__pyx_t_6) {
+
+    /* "rmgpy/kinetics/falloff.pyx":372
+ *             return False
+ *         if not self.T3.equals(other_kinetics.T3):
+ *             return False             # <<<<<<<<<<<<<<
+ *         if self.T2 is not None and not self.T2.equals(other_kinetics.T2):
+ *             return False
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "rmgpy/kinetics/falloff.pyx":371
+ *         if not self.T1.equals(other_kinetics.T1):
+ *             return False
+ *         if not self.T3.equals(other_kinetics.T3):             # <<<<<<<<<<<<<<
+ *             return False
+ *         if self.T2 is not None and not self.T2.equals(other_kinetics.T2):
+ */
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":373
+ *         if not self.T3.equals(other_kinetics.T3):
+ *             return False
+ *         if self.T2 is not None and not self.T2.equals(other_kinetics.T2):             # <<<<<<<<<<<<<<
+ *             return False
+ * 
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_T2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 373, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = (__pyx_t_3 != Py_None);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_7 = (__pyx_t_5 != 0);
+  if (__pyx_t_7) {
+  } else {
+    __pyx_t_6 = __pyx_t_7;
+    goto __pyx_L11_bool_binop_done;
+  }
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_T2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 373, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_equals); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 373, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_other_kinetics), __pyx_n_s_T2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 373, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_4, __pyx_t_2) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 373, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 373, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_5 = ((!__pyx_t_7) != 0);
+  __pyx_t_6 = __pyx_t_5;
+  __pyx_L11_bool_binop_done:;
+  if (__pyx_t_6) {
+
+    /* "rmgpy/kinetics/falloff.pyx":374
+ *             return False
+ *         if self.T2 is not None and not self.T2.equals(other_kinetics.T2):
+ *             return False             # <<<<<<<<<<<<<<
+ * 
+ *         return True
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "rmgpy/kinetics/falloff.pyx":373
+ *         if not self.T3.equals(other_kinetics.T3):
+ *             return False
+ *         if self.T2 is not None and not self.T2.equals(other_kinetics.T2):             # <<<<<<<<<<<<<<
+ *             return False
+ * 
+ */
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":376
+ *             return False
+ * 
+ *         return True             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef change_rate(self, double factor):
+ */
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "rmgpy/kinetics/falloff.pyx":354
+ *         return kinf * (Pr / (1 + Pr)) * F
+ * 
+ *     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:             # <<<<<<<<<<<<<<
+ *         """
+ *         Checks to see if kinetics matches that of other kinetics and returns ``True``
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe.is_identical_to", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -2;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_9is_identical_to(PyObject *__pyx_v_self, PyObject *__pyx_v_other_kinetics); /*proto*/
+static char __pyx_doc_5rmgpy_8kinetics_7falloff_4Troe_8is_identical_to[] = "Troe.is_identical_to(self, KineticsModel other_kinetics) -> bool\n\n        Checks to see if kinetics matches that of other kinetics and returns ``True``\n        if coeffs, kunits, Tmin,\n        ";
+static PyMethodDef __pyx_mdef_5rmgpy_8kinetics_7falloff_4Troe_9is_identical_to = {"is_identical_to", (PyCFunction)__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_9is_identical_to, METH_O, __pyx_doc_5rmgpy_8kinetics_7falloff_4Troe_8is_identical_to};
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_9is_identical_to(PyObject *__pyx_v_self, PyObject *__pyx_v_other_kinetics) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("is_identical_to (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_other_kinetics), __pyx_ptype_5rmgpy_8kinetics_5model_KineticsModel, 1, "other_kinetics", 0))) __PYX_ERR(0, 354, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_8is_identical_to(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self), ((struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *)__pyx_v_other_kinetics));
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_8is_identical_to(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *__pyx_v_other_kinetics) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("is_identical_to", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_5rmgpy_8kinetics_7falloff_4Troe_is_identical_to(__pyx_v_self, __pyx_v_other_kinetics, 1); if (unlikely(__pyx_t_1 == ((int)-2))) __PYX_ERR(0, 354, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 354, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe.is_identical_to", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":378
+ *         return True
+ * 
+ *     cpdef change_rate(self, double factor):             # <<<<<<<<<<<<<<
+ *         """
+ *         Changes kinetics rate by a multiple ``factor``.
+ */
+
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_11change_rate(PyObject *__pyx_v_self, PyObject *__pyx_arg_factor); /*proto*/
+static PyObject *__pyx_f_5rmgpy_8kinetics_7falloff_4Troe_change_rate(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, double __pyx_v_factor, int __pyx_skip_dispatch) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("change_rate", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_change_rate); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 378, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_11change_rate)) {
+        __Pyx_XDECREF(__pyx_r);
+        __pyx_t_3 = PyFloat_FromDouble(__pyx_v_factor); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 378, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_4 = __pyx_t_1; __pyx_t_5 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+          __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+          if (likely(__pyx_t_5)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+            __Pyx_INCREF(__pyx_t_5);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_4, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 378, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "rmgpy/kinetics/falloff.pyx":382
+ *         Changes kinetics rate by a multiple ``factor``.
+ *         """
+ *         self.arrheniusLow.change_rate(factor)             # <<<<<<<<<<<<<<
+ *         self.arrheniusHigh.change_rate(factor)
+ * 
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_v_self->arrheniusLow->__pyx_base.__pyx_vtab)->change_rate(__pyx_v_self->arrheniusLow, __pyx_v_factor, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 382, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":383
+ *         """
+ *         self.arrheniusLow.change_rate(factor)
+ *         self.arrheniusHigh.change_rate(factor)             # <<<<<<<<<<<<<<
+ * 
+ *     def set_cantera_kinetics(self, ct_reaction, species_list):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_v_self->arrheniusHigh->__pyx_base.__pyx_vtab)->change_rate(__pyx_v_self->arrheniusHigh, __pyx_v_factor, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 383, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":378
+ *         return True
+ * 
+ *     cpdef change_rate(self, double factor):             # <<<<<<<<<<<<<<
+ *         """
+ *         Changes kinetics rate by a multiple ``factor``.
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe.change_rate", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_11change_rate(PyObject *__pyx_v_self, PyObject *__pyx_arg_factor); /*proto*/
+static char __pyx_doc_5rmgpy_8kinetics_7falloff_4Troe_10change_rate[] = "Troe.change_rate(self, double factor)\n\n        Changes kinetics rate by a multiple ``factor``.\n        ";
+static PyMethodDef __pyx_mdef_5rmgpy_8kinetics_7falloff_4Troe_11change_rate = {"change_rate", (PyCFunction)__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_11change_rate, METH_O, __pyx_doc_5rmgpy_8kinetics_7falloff_4Troe_10change_rate};
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_11change_rate(PyObject *__pyx_v_self, PyObject *__pyx_arg_factor) {
+  double __pyx_v_factor;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("change_rate (wrapper)", 0);
+  assert(__pyx_arg_factor); {
+    __pyx_v_factor = __pyx_PyFloat_AsDouble(__pyx_arg_factor); if (unlikely((__pyx_v_factor == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 378, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe.change_rate", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_10change_rate(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self), ((double)__pyx_v_factor));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_10change_rate(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, double __pyx_v_factor) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("change_rate", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_5rmgpy_8kinetics_7falloff_4Troe_change_rate(__pyx_v_self, __pyx_v_factor, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe.change_rate", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pyx":385
+ *         self.arrheniusHigh.change_rate(factor)
+ * 
+ *     def set_cantera_kinetics(self, ct_reaction, species_list):             # <<<<<<<<<<<<<<
+ *         """
+ *         Sets the efficiencies, kinetics, and troe falloff parameters
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_13set_cantera_kinetics(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5rmgpy_8kinetics_7falloff_4Troe_12set_cantera_kinetics[] = "Troe.set_cantera_kinetics(self, ct_reaction, species_list)\n\n        Sets the efficiencies, kinetics, and troe falloff parameters\n        for a cantera FalloffReaction.\n        ";
+static PyMethodDef __pyx_mdef_5rmgpy_8kinetics_7falloff_4Troe_13set_cantera_kinetics = {"set_cantera_kinetics", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_13set_cantera_kinetics, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5rmgpy_8kinetics_7falloff_4Troe_12set_cantera_kinetics};
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_13set_cantera_kinetics(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_ct_reaction = 0;
+  PyObject *__pyx_v_species_list = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("set_cantera_kinetics (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_ct_reaction,&__pyx_n_s_species_list,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ct_reaction)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_species_list)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("set_cantera_kinetics", 1, 2, 2, 1); __PYX_ERR(0, 385, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "set_cantera_kinetics") < 0)) __PYX_ERR(0, 385, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_ct_reaction = values[0];
+    __pyx_v_species_list = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("set_cantera_kinetics", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 385, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe.set_cantera_kinetics", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_12set_cantera_kinetics(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self), __pyx_v_ct_reaction, __pyx_v_species_list);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_12set_cantera_kinetics(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, PyObject *__pyx_v_ct_reaction, PyObject *__pyx_v_species_list) {
+  PyObject *__pyx_v_ct = NULL;
+  double __pyx_v_A;
+  PyObject *__pyx_v_T3 = NULL;
+  PyObject *__pyx_v_T1 = NULL;
+  PyObject *__pyx_v_T2 = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  double __pyx_t_7;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("set_cantera_kinetics", 0);
+
+  /* "rmgpy/kinetics/falloff.pyx":390
+ *         for a cantera FalloffReaction.
+ *         """
+ *         import cantera as ct             # <<<<<<<<<<<<<<
+ * 
+ *         assert isinstance(ct_reaction, ct.FalloffReaction), "Must be a Cantera FalloffReaction object"
+ */
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_cantera, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 390, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_ct = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":392
+ *         import cantera as ct
+ * 
+ *         assert isinstance(ct_reaction, ct.FalloffReaction), "Must be a Cantera FalloffReaction object"             # <<<<<<<<<<<<<<
+ *         ct_reaction.efficiencies = PDepKineticsModel.get_cantera_efficiencies(self, species_list)
+ *         ct_reaction.high_rate = self.arrheniusHigh.to_cantera_kinetics()
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_ct, __pyx_n_s_FalloffReaction); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 392, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyObject_IsInstance(__pyx_v_ct_reaction, __pyx_t_1); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 392, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(!(__pyx_t_2 != 0))) {
+      PyErr_SetObject(PyExc_AssertionError, __pyx_kp_u_Must_be_a_Cantera_FalloffReactio);
+      __PYX_ERR(0, 392, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "rmgpy/kinetics/falloff.pyx":393
+ * 
+ *         assert isinstance(ct_reaction, ct.FalloffReaction), "Must be a Cantera FalloffReaction object"
+ *         ct_reaction.efficiencies = PDepKineticsModel.get_cantera_efficiencies(self, species_list)             # <<<<<<<<<<<<<<
+ *         ct_reaction.high_rate = self.arrheniusHigh.to_cantera_kinetics()
+ *         ct_reaction.low_rate = self.arrheniusLow.to_cantera_kinetics()
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel), __pyx_n_s_get_cantera_efficiencies); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 393, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = NULL;
+  __pyx_t_5 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_5 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, ((PyObject *)__pyx_v_self), __pyx_v_species_list};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 393, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, ((PyObject *)__pyx_v_self), __pyx_v_species_list};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 393, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  {
+    __pyx_t_6 = PyTuple_New(2+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 393, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    if (__pyx_t_4) {
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    }
+    __Pyx_INCREF(((PyObject *)__pyx_v_self));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+    PyTuple_SET_ITEM(__pyx_t_6, 0+__pyx_t_5, ((PyObject *)__pyx_v_self));
+    __Pyx_INCREF(__pyx_v_species_list);
+    __Pyx_GIVEREF(__pyx_v_species_list);
+    PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_5, __pyx_v_species_list);
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 393, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_ct_reaction, __pyx_n_s_efficiencies, __pyx_t_1) < 0) __PYX_ERR(0, 393, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":394
+ *         assert isinstance(ct_reaction, ct.FalloffReaction), "Must be a Cantera FalloffReaction object"
+ *         ct_reaction.efficiencies = PDepKineticsModel.get_cantera_efficiencies(self, species_list)
+ *         ct_reaction.high_rate = self.arrheniusHigh.to_cantera_kinetics()             # <<<<<<<<<<<<<<
+ *         ct_reaction.low_rate = self.arrheniusLow.to_cantera_kinetics()
+ *         A = self.alpha
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self->arrheniusHigh), __pyx_n_s_to_cantera_kinetics); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 394, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_6) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_6) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 394, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_ct_reaction, __pyx_n_s_high_rate, __pyx_t_1) < 0) __PYX_ERR(0, 394, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":395
+ *         ct_reaction.efficiencies = PDepKineticsModel.get_cantera_efficiencies(self, species_list)
+ *         ct_reaction.high_rate = self.arrheniusHigh.to_cantera_kinetics()
+ *         ct_reaction.low_rate = self.arrheniusLow.to_cantera_kinetics()             # <<<<<<<<<<<<<<
+ *         A = self.alpha
+ *         T3 = self.T3.value_si
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self->arrheniusLow), __pyx_n_s_to_cantera_kinetics); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 395, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_6) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_6) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 395, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_ct_reaction, __pyx_n_s_low_rate, __pyx_t_1) < 0) __PYX_ERR(0, 395, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":396
+ *         ct_reaction.high_rate = self.arrheniusHigh.to_cantera_kinetics()
+ *         ct_reaction.low_rate = self.arrheniusLow.to_cantera_kinetics()
+ *         A = self.alpha             # <<<<<<<<<<<<<<
+ *         T3 = self.T3.value_si
+ *         T1 = self.T1.value_si
+ */
+  __pyx_t_7 = __pyx_v_self->alpha;
+  __pyx_v_A = __pyx_t_7;
+
+  /* "rmgpy/kinetics/falloff.pyx":397
+ *         ct_reaction.low_rate = self.arrheniusLow.to_cantera_kinetics()
+ *         A = self.alpha
+ *         T3 = self.T3.value_si             # <<<<<<<<<<<<<<
+ *         T1 = self.T1.value_si
+ *         T2 = self.T2.value_si
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_T3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 397, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_value_si); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 397, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_T3 = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":398
+ *         A = self.alpha
+ *         T3 = self.T3.value_si
+ *         T1 = self.T1.value_si             # <<<<<<<<<<<<<<
+ *         T2 = self.T2.value_si
+ *         ct_reaction.falloff = ct.TroeFalloff(params=[A, T3, T1, T2])
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_T1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 398, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_value_si); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 398, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_T1 = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":399
+ *         T3 = self.T3.value_si
+ *         T1 = self.T1.value_si
+ *         T2 = self.T2.value_si             # <<<<<<<<<<<<<<
+ *         ct_reaction.falloff = ct.TroeFalloff(params=[A, T3, T1, T2])
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_T2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 399, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_value_si); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 399, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_T2 = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":400
+ *         T1 = self.T1.value_si
+ *         T2 = self.T2.value_si
+ *         ct_reaction.falloff = ct.TroeFalloff(params=[A, T3, T1, T2])             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_ct, __pyx_n_s_TroeFalloff); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 400, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 400, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_v_A); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 400, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = PyList_New(4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 400, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyList_SET_ITEM(__pyx_t_4, 0, __pyx_t_6);
+  __Pyx_INCREF(__pyx_v_T3);
+  __Pyx_GIVEREF(__pyx_v_T3);
+  PyList_SET_ITEM(__pyx_t_4, 1, __pyx_v_T3);
+  __Pyx_INCREF(__pyx_v_T1);
+  __Pyx_GIVEREF(__pyx_v_T1);
+  PyList_SET_ITEM(__pyx_t_4, 2, __pyx_v_T1);
+  __Pyx_INCREF(__pyx_v_T2);
+  __Pyx_GIVEREF(__pyx_v_T2);
+  PyList_SET_ITEM(__pyx_t_4, 3, __pyx_v_T2);
+  __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_params, __pyx_t_4) < 0) __PYX_ERR(0, 400, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_empty_tuple, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 400, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_ct_reaction, __pyx_n_s_falloff, __pyx_t_4) < 0) __PYX_ERR(0, 400, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":385
+ *         self.arrheniusHigh.change_rate(factor)
+ * 
+ *     def set_cantera_kinetics(self, ct_reaction, species_list):             # <<<<<<<<<<<<<<
+ *         """
+ *         Sets the efficiencies, kinetics, and troe falloff parameters
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe.set_cantera_kinetics", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_ct);
+  __Pyx_XDECREF(__pyx_v_T3);
+  __Pyx_XDECREF(__pyx_v_T1);
+  __Pyx_XDECREF(__pyx_v_T2);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pxd":61
+ * cdef class Troe(PDepKineticsModel):
+ * 
+ *     cdef public Arrhenius arrheniusHigh             # <<<<<<<<<<<<<<
+ *     cdef public Arrhenius arrheniusLow
+ *     cdef public double alpha
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_13arrheniusHigh_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_13arrheniusHigh_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_13arrheniusHigh___get__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_13arrheniusHigh___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->arrheniusHigh));
+  __pyx_r = ((PyObject *)__pyx_v_self->arrheniusHigh);
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_13arrheniusHigh_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_13arrheniusHigh_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_13arrheniusHigh_2__set__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_13arrheniusHigh_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  if (!(likely(((__pyx_v_value) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_value, __pyx_ptype_5rmgpy_8kinetics_9arrhenius_Arrhenius))))) __PYX_ERR(1, 61, __pyx_L1_error)
+  __pyx_t_1 = __pyx_v_value;
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_self->arrheniusHigh);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->arrheniusHigh));
+  __pyx_v_self->arrheniusHigh = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe.arrheniusHigh.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_13arrheniusHigh_5__del__(PyObject *__pyx_v_self); /*proto*/
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_13arrheniusHigh_5__del__(PyObject *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_13arrheniusHigh_4__del__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_13arrheniusHigh_4__del__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__", 0);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->arrheniusHigh);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->arrheniusHigh));
+  __pyx_v_self->arrheniusHigh = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)Py_None);
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pxd":62
+ * 
+ *     cdef public Arrhenius arrheniusHigh
+ *     cdef public Arrhenius arrheniusLow             # <<<<<<<<<<<<<<
+ *     cdef public double alpha
+ *     cdef public ScalarQuantity _T1, _T2, _T3
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_12arrheniusLow_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_12arrheniusLow_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_12arrheniusLow___get__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_12arrheniusLow___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->arrheniusLow));
+  __pyx_r = ((PyObject *)__pyx_v_self->arrheniusLow);
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_12arrheniusLow_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_12arrheniusLow_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_12arrheniusLow_2__set__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_12arrheniusLow_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  if (!(likely(((__pyx_v_value) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_value, __pyx_ptype_5rmgpy_8kinetics_9arrhenius_Arrhenius))))) __PYX_ERR(1, 62, __pyx_L1_error)
+  __pyx_t_1 = __pyx_v_value;
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_self->arrheniusLow);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->arrheniusLow));
+  __pyx_v_self->arrheniusLow = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe.arrheniusLow.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_12arrheniusLow_5__del__(PyObject *__pyx_v_self); /*proto*/
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_12arrheniusLow_5__del__(PyObject *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_12arrheniusLow_4__del__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_12arrheniusLow_4__del__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__", 0);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->arrheniusLow);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->arrheniusLow));
+  __pyx_v_self->arrheniusLow = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)Py_None);
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pxd":63
+ *     cdef public Arrhenius arrheniusHigh
+ *     cdef public Arrhenius arrheniusLow
+ *     cdef public double alpha             # <<<<<<<<<<<<<<
+ *     cdef public ScalarQuantity _T1, _T2, _T3
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_5alpha_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_5alpha_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_5alpha___get__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_5alpha___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->alpha); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 63, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe.alpha.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_5alpha_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_5alpha_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_5alpha_2__set__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_5alpha_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  double __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  __pyx_t_1 = __pyx_PyFloat_AsDouble(__pyx_v_value); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 63, __pyx_L1_error)
+  __pyx_v_self->alpha = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe.alpha.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/kinetics/falloff.pxd":64
+ *     cdef public Arrhenius arrheniusLow
+ *     cdef public double alpha
+ *     cdef public ScalarQuantity _T1, _T2, _T3             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=?) except -1
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T1_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T1_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T1___get__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T1___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->_T1));
+  __pyx_r = ((PyObject *)__pyx_v_self->_T1);
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T1_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T1_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T1_2__set__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T1_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  if (!(likely(((__pyx_v_value) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_value, __pyx_ptype_5rmgpy_8quantity_ScalarQuantity))))) __PYX_ERR(1, 64, __pyx_L1_error)
+  __pyx_t_1 = __pyx_v_value;
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_self->_T1);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->_T1));
+  __pyx_v_self->_T1 = ((struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe._T1.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T1_5__del__(PyObject *__pyx_v_self); /*proto*/
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T1_5__del__(PyObject *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T1_4__del__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T1_4__del__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__", 0);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->_T1);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->_T1));
+  __pyx_v_self->_T1 = ((struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *)Py_None);
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T2_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T2_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T2___get__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T2___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->_T2));
+  __pyx_r = ((PyObject *)__pyx_v_self->_T2);
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T2_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T2_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T2_2__set__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T2_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  if (!(likely(((__pyx_v_value) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_value, __pyx_ptype_5rmgpy_8quantity_ScalarQuantity))))) __PYX_ERR(1, 64, __pyx_L1_error)
+  __pyx_t_1 = __pyx_v_value;
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_self->_T2);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->_T2));
+  __pyx_v_self->_T2 = ((struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe._T2.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T2_5__del__(PyObject *__pyx_v_self); /*proto*/
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T2_5__del__(PyObject *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T2_4__del__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T2_4__del__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__", 0);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->_T2);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->_T2));
+  __pyx_v_self->_T2 = ((struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *)Py_None);
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T3_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T3_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T3___get__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T3___get__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->_T3));
+  __pyx_r = ((PyObject *)__pyx_v_self->_T3);
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T3_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T3_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T3_2__set__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T3_2__set__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  if (!(likely(((__pyx_v_value) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_value, __pyx_ptype_5rmgpy_8quantity_ScalarQuantity))))) __PYX_ERR(1, 64, __pyx_L1_error)
+  __pyx_t_1 = __pyx_v_value;
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_self->_T3);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->_T3));
+  __pyx_v_self->_T3 = ((struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("rmgpy.kinetics.falloff.Troe._T3.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T3_5__del__(PyObject *__pyx_v_self); /*proto*/
+static int __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T3_5__del__(PyObject *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T3_4__del__(((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8kinetics_7falloff_4Troe_3_T3_4__del__(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__", 0);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->_T3);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->_T3));
+  __pyx_v_self->_T3 = ((struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *)Py_None);
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":731
+ * ctypedef npy_cdouble     complex_t
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__pyx_v_a) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew1", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":732
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):
+ *     return PyArray_MultiIterNew(1, <void*>a)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(1, ((void *)__pyx_v_a)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 732, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":731
+ * ctypedef npy_cdouble     complex_t
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew1", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":734
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__pyx_v_a, PyObject *__pyx_v_b) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew2", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":735
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(2, ((void *)__pyx_v_a), ((void *)__pyx_v_b)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":734
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew2", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":737
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew3", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":738
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(3, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 738, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":737
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew3", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":740
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c, PyObject *__pyx_v_d) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew4", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":741
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(4, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 741, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":740
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew4", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":743
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c, PyObject *__pyx_v_d, PyObject *__pyx_v_e) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew5", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":744
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(5, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d), ((void *)__pyx_v_e)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 744, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":743
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew5", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":746
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
+ *     if PyDataType_HASSUBARRAY(d):
+ *         return <tuple>d.subarray.shape
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__pyx_v_d) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("PyDataType_SHAPE", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":747
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
+ *         return <tuple>d.subarray.shape
+ *     else:
+ */
+  __pyx_t_1 = (PyDataType_HASSUBARRAY(__pyx_v_d) != 0);
+  if (__pyx_t_1) {
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":748
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ *     if PyDataType_HASSUBARRAY(d):
+ *         return <tuple>d.subarray.shape             # <<<<<<<<<<<<<<
+ *     else:
+ *         return ()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(((PyObject*)__pyx_v_d->subarray->shape));
+    __pyx_r = ((PyObject*)__pyx_v_d->subarray->shape);
+    goto __pyx_L0;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":747
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
+ *         return <tuple>d.subarray.shape
+ *     else:
+ */
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":750
+ *         return <tuple>d.subarray.shape
+ *     else:
+ *         return ()             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_empty_tuple);
+    __pyx_r = __pyx_empty_tuple;
+    goto __pyx_L0;
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":746
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
+ *     if PyDataType_HASSUBARRAY(d):
+ *         return <tuple>d.subarray.shape
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":926
+ *     int _import_umath() except -1
+ * 
+ * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
+ *     Py_INCREF(base) # important to do this before stealing the reference below!
+ *     PyArray_SetBaseObject(arr, base)
+ */
+
+static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_arr, PyObject *__pyx_v_base) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("set_array_base", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":927
+ * 
+ * cdef inline void set_array_base(ndarray arr, object base):
+ *     Py_INCREF(base) # important to do this before stealing the reference below!             # <<<<<<<<<<<<<<
+ *     PyArray_SetBaseObject(arr, base)
+ * 
+ */
+  Py_INCREF(__pyx_v_base);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":928
+ * cdef inline void set_array_base(ndarray arr, object base):
+ *     Py_INCREF(base) # important to do this before stealing the reference below!
+ *     PyArray_SetBaseObject(arr, base)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object get_array_base(ndarray arr):
+ */
+  __pyx_t_1 = PyArray_SetBaseObject(__pyx_v_arr, __pyx_v_base); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(2, 928, __pyx_L1_error)
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":926
+ *     int _import_umath() except -1
+ * 
+ * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
+ *     Py_INCREF(base) # important to do this before stealing the reference below!
+ *     PyArray_SetBaseObject(arr, base)
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("numpy.set_array_base", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":930
+ *     PyArray_SetBaseObject(arr, base)
+ * 
+ * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__pyx_v_arr) {
+  PyObject *__pyx_v_base;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("get_array_base", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":931
+ * 
+ * cdef inline object get_array_base(ndarray arr):
+ *     base = PyArray_BASE(arr)             # <<<<<<<<<<<<<<
+ *     if base is NULL:
+ *         return None
+ */
+  __pyx_v_base = PyArray_BASE(__pyx_v_arr);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":932
+ * cdef inline object get_array_base(ndarray arr):
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:             # <<<<<<<<<<<<<<
+ *         return None
+ *     return <object>base
+ */
+  __pyx_t_1 = ((__pyx_v_base == NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":933
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:
+ *         return None             # <<<<<<<<<<<<<<
+ *     return <object>base
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":932
+ * cdef inline object get_array_base(ndarray arr):
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:             # <<<<<<<<<<<<<<
+ *         return None
+ *     return <object>base
+ */
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":934
+ *     if base is NULL:
+ *         return None
+ *     return <object>base             # <<<<<<<<<<<<<<
+ * 
+ * # Versions of the import_* functions which are more suitable for
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_base));
+  __pyx_r = ((PyObject *)__pyx_v_base);
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":930
+ *     PyArray_SetBaseObject(arr, base)
+ * 
+ * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":938
+ * # Versions of the import_* functions which are more suitable for
+ * # Cython code.
+ * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         __pyx_import_array()
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("import_array", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":939
+ * # Cython code.
+ * cdef inline int import_array() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         __pyx_import_array()
+ *     except Exception:
+ */
+  {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
+    __Pyx_XGOTREF(__pyx_t_1);
+    __Pyx_XGOTREF(__pyx_t_2);
+    __Pyx_XGOTREF(__pyx_t_3);
+    /*try:*/ {
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":940
+ * cdef inline int import_array() except -1:
+ *     try:
+ *         __pyx_import_array()             # <<<<<<<<<<<<<<
+ *     except Exception:
+ *         raise ImportError("numpy.core.multiarray failed to import")
+ */
+      __pyx_t_4 = _import_array(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 940, __pyx_L3_error)
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":939
+ * # Cython code.
+ * cdef inline int import_array() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         __pyx_import_array()
+ *     except Exception:
+ */
+    }
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L8_try_end;
+    __pyx_L3_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":941
+ *     try:
+ *         __pyx_import_array()
+ *     except Exception:             # <<<<<<<<<<<<<<
+ *         raise ImportError("numpy.core.multiarray failed to import")
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
+    if (__pyx_t_4) {
+      __Pyx_AddTraceback("numpy.import_array", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 941, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GOTREF(__pyx_t_7);
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":942
+ *         __pyx_import_array()
+ *     except Exception:
+ *         raise ImportError("numpy.core.multiarray failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int import_umath() except -1:
+ */
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 942, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_Raise(__pyx_t_8, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __PYX_ERR(2, 942, __pyx_L5_except_error)
+    }
+    goto __pyx_L5_except_error;
+    __pyx_L5_except_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":939
+ * # Cython code.
+ * cdef inline int import_array() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         __pyx_import_array()
+ *     except Exception:
+ */
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L1_error;
+    __pyx_L8_try_end:;
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":938
+ * # Versions of the import_* functions which are more suitable for
+ * # Cython code.
+ * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         __pyx_import_array()
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("numpy.import_array", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":944
+ *         raise ImportError("numpy.core.multiarray failed to import")
+ * 
+ * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         _import_umath()
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("import_umath", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":945
+ * 
+ * cdef inline int import_umath() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+  {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
+    __Pyx_XGOTREF(__pyx_t_1);
+    __Pyx_XGOTREF(__pyx_t_2);
+    __Pyx_XGOTREF(__pyx_t_3);
+    /*try:*/ {
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":946
+ * cdef inline int import_umath() except -1:
+ *     try:
+ *         _import_umath()             # <<<<<<<<<<<<<<
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")
+ */
+      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 946, __pyx_L3_error)
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":945
+ * 
+ * cdef inline int import_umath() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+    }
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L8_try_end;
+    __pyx_L3_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":947
+ *     try:
+ *         _import_umath()
+ *     except Exception:             # <<<<<<<<<<<<<<
+ *         raise ImportError("numpy.core.umath failed to import")
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
+    if (__pyx_t_4) {
+      __Pyx_AddTraceback("numpy.import_umath", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 947, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GOTREF(__pyx_t_7);
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":948
+ *         _import_umath()
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int import_ufunc() except -1:
+ */
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 948, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_Raise(__pyx_t_8, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __PYX_ERR(2, 948, __pyx_L5_except_error)
+    }
+    goto __pyx_L5_except_error;
+    __pyx_L5_except_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":945
+ * 
+ * cdef inline int import_umath() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L1_error;
+    __pyx_L8_try_end:;
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":944
+ *         raise ImportError("numpy.core.multiarray failed to import")
+ * 
+ * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         _import_umath()
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("numpy.import_umath", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":950
+ *         raise ImportError("numpy.core.umath failed to import")
+ * 
+ * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         _import_umath()
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("import_ufunc", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":951
+ * 
+ * cdef inline int import_ufunc() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+  {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
+    __Pyx_XGOTREF(__pyx_t_1);
+    __Pyx_XGOTREF(__pyx_t_2);
+    __Pyx_XGOTREF(__pyx_t_3);
+    /*try:*/ {
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":952
+ * cdef inline int import_ufunc() except -1:
+ *     try:
+ *         _import_umath()             # <<<<<<<<<<<<<<
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")
+ */
+      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 952, __pyx_L3_error)
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":951
+ * 
+ * cdef inline int import_ufunc() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+    }
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L8_try_end;
+    __pyx_L3_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":953
+ *     try:
+ *         _import_umath()
+ *     except Exception:             # <<<<<<<<<<<<<<
+ *         raise ImportError("numpy.core.umath failed to import")
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
+    if (__pyx_t_4) {
+      __Pyx_AddTraceback("numpy.import_ufunc", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 953, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GOTREF(__pyx_t_7);
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":954
+ *         _import_umath()
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef extern from *:
+ */
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 954, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_Raise(__pyx_t_8, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __PYX_ERR(2, 954, __pyx_L5_except_error)
+    }
+    goto __pyx_L5_except_error;
+    __pyx_L5_except_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":951
+ * 
+ * cdef inline int import_ufunc() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L1_error;
+    __pyx_L8_try_end:;
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":950
+ *         raise ImportError("numpy.core.umath failed to import")
+ * 
+ * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         _import_umath()
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("numpy.import_ufunc", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":964
+ * 
+ * 
+ * cdef inline bint is_timedelta64_object(object obj):             # <<<<<<<<<<<<<<
+ *     """
+ *     Cython equivalent of `isinstance(obj, np.timedelta64)`
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_is_timedelta64_object(PyObject *__pyx_v_obj) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("is_timedelta64_object", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":976
+ *     bool
+ *     """
+ *     return PyObject_TypeCheck(obj, &PyTimedeltaArrType_Type)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = PyObject_TypeCheck(__pyx_v_obj, (&PyTimedeltaArrType_Type));
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":964
+ * 
+ * 
+ * cdef inline bint is_timedelta64_object(object obj):             # <<<<<<<<<<<<<<
+ *     """
+ *     Cython equivalent of `isinstance(obj, np.timedelta64)`
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":979
+ * 
+ * 
+ * cdef inline bint is_datetime64_object(object obj):             # <<<<<<<<<<<<<<
+ *     """
+ *     Cython equivalent of `isinstance(obj, np.datetime64)`
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_is_datetime64_object(PyObject *__pyx_v_obj) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("is_datetime64_object", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":991
+ *     bool
+ *     """
+ *     return PyObject_TypeCheck(obj, &PyDatetimeArrType_Type)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = PyObject_TypeCheck(__pyx_v_obj, (&PyDatetimeArrType_Type));
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":979
+ * 
+ * 
+ * cdef inline bint is_datetime64_object(object obj):             # <<<<<<<<<<<<<<
+ *     """
+ *     Cython equivalent of `isinstance(obj, np.datetime64)`
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":994
+ * 
+ * 
+ * cdef inline npy_datetime get_datetime64_value(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the int64 value underlying scalar numpy datetime64 object
+ */
+
+static CYTHON_INLINE npy_datetime __pyx_f_5numpy_get_datetime64_value(PyObject *__pyx_v_obj) {
+  npy_datetime __pyx_r;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1001
+ *     also needed.  That can be found using `get_datetime64_unit`.
+ *     """
+ *     return (<PyDatetimeScalarObject*>obj).obval             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = ((PyDatetimeScalarObject *)__pyx_v_obj)->obval;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":994
+ * 
+ * 
+ * cdef inline npy_datetime get_datetime64_value(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the int64 value underlying scalar numpy datetime64 object
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1004
+ * 
+ * 
+ * cdef inline npy_timedelta get_timedelta64_value(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the int64 value underlying scalar numpy timedelta64 object
+ */
+
+static CYTHON_INLINE npy_timedelta __pyx_f_5numpy_get_timedelta64_value(PyObject *__pyx_v_obj) {
+  npy_timedelta __pyx_r;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1008
+ *     returns the int64 value underlying scalar numpy timedelta64 object
+ *     """
+ *     return (<PyTimedeltaScalarObject*>obj).obval             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = ((PyTimedeltaScalarObject *)__pyx_v_obj)->obval;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1004
+ * 
+ * 
+ * cdef inline npy_timedelta get_timedelta64_value(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the int64 value underlying scalar numpy timedelta64 object
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1011
+ * 
+ * 
+ * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the unit part of the dtype for a numpy datetime64 object.
+ */
+
+static CYTHON_INLINE NPY_DATETIMEUNIT __pyx_f_5numpy_get_datetime64_unit(PyObject *__pyx_v_obj) {
+  NPY_DATETIMEUNIT __pyx_r;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1015
+ *     returns the unit part of the dtype for a numpy datetime64 object.
+ *     """
+ *     return <NPY_DATETIMEUNIT>(<PyDatetimeScalarObject*>obj).obmeta.base             # <<<<<<<<<<<<<<
+ */
+  __pyx_r = ((NPY_DATETIMEUNIT)((PyDatetimeScalarObject *)__pyx_v_obj)->obmeta.base);
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1011
+ * 
+ * 
+ * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the unit part of the dtype for a numpy datetime64 object.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+static struct __pyx_vtabstruct_5rmgpy_8kinetics_7falloff_ThirdBody __pyx_vtable_5rmgpy_8kinetics_7falloff_ThirdBody;
+
+static PyObject *__pyx_tp_new_5rmgpy_8kinetics_7falloff_ThirdBody(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *p;
+  PyObject *o = __pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel->tp_new(t, a, k);
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *)o);
+  p->__pyx_base.__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_KineticsModel*)__pyx_vtabptr_5rmgpy_8kinetics_7falloff_ThirdBody;
+  p->arrheniusLow = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)Py_None); Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_5rmgpy_8kinetics_7falloff_ThirdBody(PyObject *o) {
+  struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *p = (struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->arrheniusLow);
+  PyObject_GC_Track(o);
+  if (likely(__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel)) __pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel->tp_dealloc(o); else __Pyx_call_next_tp_dealloc(o, __pyx_tp_dealloc_5rmgpy_8kinetics_7falloff_ThirdBody);
+}
+
+static int __pyx_tp_traverse_5rmgpy_8kinetics_7falloff_ThirdBody(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *p = (struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *)o;
+  e = ((likely(__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel)) ? ((__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel->tp_traverse) ? __pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel->tp_traverse(o, v, a) : 0) : __Pyx_call_next_tp_traverse(o, v, a, __pyx_tp_traverse_5rmgpy_8kinetics_7falloff_ThirdBody)); if (e) return e;
+  if (p->arrheniusLow) {
+    e = (*v)(((PyObject *)p->arrheniusLow), a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_5rmgpy_8kinetics_7falloff_ThirdBody(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *p = (struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *)o;
+  if (likely(__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel)) { if (__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel->tp_clear) __pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel->tp_clear(o); } else __Pyx_call_next_tp_clear(o, __pyx_tp_clear_5rmgpy_8kinetics_7falloff_ThirdBody);
+  tmp = ((PyObject*)p->arrheniusLow);
+  p->arrheniusLow = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyObject *__pyx_getprop_5rmgpy_8kinetics_7falloff_9ThirdBody_arrheniusLow(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_12arrheniusLow_1__get__(o);
+}
+
+static int __pyx_setprop_5rmgpy_8kinetics_7falloff_9ThirdBody_arrheniusLow(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_12arrheniusLow_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_12arrheniusLow_5__del__(o);
+  }
+}
+
+static PyMethodDef __pyx_methods_5rmgpy_8kinetics_7falloff_ThirdBody[] = {
+  {"__reduce__", (PyCFunction)__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_5__reduce__, METH_NOARGS, __pyx_doc_5rmgpy_8kinetics_7falloff_9ThirdBody_4__reduce__},
+  {"set_cantera_kinetics", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_13set_cantera_kinetics, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5rmgpy_8kinetics_7falloff_9ThirdBody_12set_cantera_kinetics},
+  {0, 0, 0, 0}
+};
+
+static struct PyGetSetDef __pyx_getsets_5rmgpy_8kinetics_7falloff_ThirdBody[] = {
+  {(char *)"arrheniusLow", __pyx_getprop_5rmgpy_8kinetics_7falloff_9ThirdBody_arrheniusLow, __pyx_setprop_5rmgpy_8kinetics_7falloff_9ThirdBody_arrheniusLow, (char *)"arrheniusLow: rmgpy.kinetics.arrhenius.Arrhenius", 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_5rmgpy_8kinetics_7falloff_ThirdBody = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "rmgpy.kinetics.falloff.ThirdBody", /*tp_name*/
+  sizeof(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_5rmgpy_8kinetics_7falloff_ThirdBody, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  __pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_3__repr__, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  "ThirdBody(arrheniusLow=None, Tmin=None, Tmax=None, Pmin=None, Pmax=None, efficiencies=None, comment=u'')\n\n    A kinetic model of a phenomenological rate coefficient :math:`k(T, P)`\n    using third-body kinetics. The attributes are:\n\n    =================== ========================================================\n    Attribute           Description\n    =================== ========================================================\n    `arrheniusLow`         The Arrhenius kinetics at the low-pressure limit\n    `Tmin`              The minimum temperature at which the model is valid, or zero if unknown or undefined\n    `Tmax`              The maximum temperature at which the model is valid, or zero if unknown or undefined\n    `Pmin`              The minimum pressure at which the model is valid, or zero if unknown or undefined\n    `Pmax`              The maximum pressure at which the model is valid, or zero if unknown or undefined\n    `efficiencies`      A dict associating chemical species with associated efficiencies\n    `comment`           Information about the model (e.g. its source)\n    =================== ========================================================\n    \n    ", /*tp_doc*/
+  __pyx_tp_traverse_5rmgpy_8kinetics_7falloff_ThirdBody, /*tp_traverse*/
+  __pyx_tp_clear_5rmgpy_8kinetics_7falloff_ThirdBody, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_5rmgpy_8kinetics_7falloff_ThirdBody, /*tp_methods*/
+  0, /*tp_members*/
+  __pyx_getsets_5rmgpy_8kinetics_7falloff_ThirdBody, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_5rmgpy_8kinetics_7falloff_9ThirdBody_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_5rmgpy_8kinetics_7falloff_ThirdBody, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+static struct __pyx_vtabstruct_5rmgpy_8kinetics_7falloff_Lindemann __pyx_vtable_5rmgpy_8kinetics_7falloff_Lindemann;
+
+static PyObject *__pyx_tp_new_5rmgpy_8kinetics_7falloff_Lindemann(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *p;
+  PyObject *o = __pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel->tp_new(t, a, k);
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *)o);
+  p->__pyx_base.__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_KineticsModel*)__pyx_vtabptr_5rmgpy_8kinetics_7falloff_Lindemann;
+  p->arrheniusHigh = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)Py_None); Py_INCREF(Py_None);
+  p->arrheniusLow = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)Py_None); Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_5rmgpy_8kinetics_7falloff_Lindemann(PyObject *o) {
+  struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *p = (struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->arrheniusHigh);
+  Py_CLEAR(p->arrheniusLow);
+  PyObject_GC_Track(o);
+  if (likely(__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel)) __pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel->tp_dealloc(o); else __Pyx_call_next_tp_dealloc(o, __pyx_tp_dealloc_5rmgpy_8kinetics_7falloff_Lindemann);
+}
+
+static int __pyx_tp_traverse_5rmgpy_8kinetics_7falloff_Lindemann(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *p = (struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *)o;
+  e = ((likely(__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel)) ? ((__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel->tp_traverse) ? __pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel->tp_traverse(o, v, a) : 0) : __Pyx_call_next_tp_traverse(o, v, a, __pyx_tp_traverse_5rmgpy_8kinetics_7falloff_Lindemann)); if (e) return e;
+  if (p->arrheniusHigh) {
+    e = (*v)(((PyObject *)p->arrheniusHigh), a); if (e) return e;
+  }
+  if (p->arrheniusLow) {
+    e = (*v)(((PyObject *)p->arrheniusLow), a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_5rmgpy_8kinetics_7falloff_Lindemann(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *p = (struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *)o;
+  if (likely(__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel)) { if (__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel->tp_clear) __pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel->tp_clear(o); } else __Pyx_call_next_tp_clear(o, __pyx_tp_clear_5rmgpy_8kinetics_7falloff_Lindemann);
+  tmp = ((PyObject*)p->arrheniusHigh);
+  p->arrheniusHigh = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->arrheniusLow);
+  p->arrheniusLow = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyObject *__pyx_getprop_5rmgpy_8kinetics_7falloff_9Lindemann_arrheniusHigh(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_13arrheniusHigh_1__get__(o);
+}
+
+static int __pyx_setprop_5rmgpy_8kinetics_7falloff_9Lindemann_arrheniusHigh(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_13arrheniusHigh_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_13arrheniusHigh_5__del__(o);
+  }
+}
+
+static PyObject *__pyx_getprop_5rmgpy_8kinetics_7falloff_9Lindemann_arrheniusLow(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_12arrheniusLow_1__get__(o);
+}
+
+static int __pyx_setprop_5rmgpy_8kinetics_7falloff_9Lindemann_arrheniusLow(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_12arrheniusLow_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_12arrheniusLow_5__del__(o);
+  }
+}
+
+static PyMethodDef __pyx_methods_5rmgpy_8kinetics_7falloff_Lindemann[] = {
+  {"__reduce__", (PyCFunction)__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_5__reduce__, METH_NOARGS, __pyx_doc_5rmgpy_8kinetics_7falloff_9Lindemann_4__reduce__},
+  {"set_cantera_kinetics", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_13set_cantera_kinetics, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5rmgpy_8kinetics_7falloff_9Lindemann_12set_cantera_kinetics},
+  {0, 0, 0, 0}
+};
+
+static struct PyGetSetDef __pyx_getsets_5rmgpy_8kinetics_7falloff_Lindemann[] = {
+  {(char *)"arrheniusHigh", __pyx_getprop_5rmgpy_8kinetics_7falloff_9Lindemann_arrheniusHigh, __pyx_setprop_5rmgpy_8kinetics_7falloff_9Lindemann_arrheniusHigh, (char *)"arrheniusHigh: rmgpy.kinetics.arrhenius.Arrhenius", 0},
+  {(char *)"arrheniusLow", __pyx_getprop_5rmgpy_8kinetics_7falloff_9Lindemann_arrheniusLow, __pyx_setprop_5rmgpy_8kinetics_7falloff_9Lindemann_arrheniusLow, (char *)"arrheniusLow: rmgpy.kinetics.arrhenius.Arrhenius", 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_5rmgpy_8kinetics_7falloff_Lindemann = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "rmgpy.kinetics.falloff.Lindemann", /*tp_name*/
+  sizeof(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_5rmgpy_8kinetics_7falloff_Lindemann, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  __pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_3__repr__, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  "Lindemann(arrheniusHigh=None, arrheniusLow=None, Tmin=None, Tmax=None, Pmin=None, Pmax=None, efficiencies=None, comment=u'')\n\n    A kinetic model of a phenomenological rate coefficient :math:`k(T, P)`\n    using the Lindemann formulation. The attributes are:\n\n    =================== ========================================================\n    Attribute           Description\n    =================== ========================================================\n    `arrheniusHigh`     The Arrhenius kinetics at the high-pressure limit\n    `arrheniusLow`      The Arrhenius kinetics at the low-pressure limit\n    `Tmin`              The minimum temperature at which the model is valid, or zero if unknown or undefined\n    `Tmax`              The maximum temperature at which the model is valid, or zero if unknown or undefined\n    `Pmin`              The minimum pressure at which the model is valid, or zero if unknown or undefined\n    `Pmax`              The maximum pressure at which the model is valid, or zero if unknown or undefined\n    `efficiencies`      A dict associating chemical species with associated efficiencies\n    `comment`           Information about the model (e.g. its source)\n    =================== ========================================================\n    \n    ", /*tp_doc*/
+  __pyx_tp_traverse_5rmgpy_8kinetics_7falloff_Lindemann, /*tp_traverse*/
+  __pyx_tp_clear_5rmgpy_8kinetics_7falloff_Lindemann, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_5rmgpy_8kinetics_7falloff_Lindemann, /*tp_methods*/
+  0, /*tp_members*/
+  __pyx_getsets_5rmgpy_8kinetics_7falloff_Lindemann, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_5rmgpy_8kinetics_7falloff_9Lindemann_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_5rmgpy_8kinetics_7falloff_Lindemann, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+static struct __pyx_vtabstruct_5rmgpy_8kinetics_7falloff_Troe __pyx_vtable_5rmgpy_8kinetics_7falloff_Troe;
+
+static PyObject *__pyx_tp_new_5rmgpy_8kinetics_7falloff_Troe(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *p;
+  PyObject *o = __pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel->tp_new(t, a, k);
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)o);
+  p->__pyx_base.__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_KineticsModel*)__pyx_vtabptr_5rmgpy_8kinetics_7falloff_Troe;
+  p->arrheniusHigh = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)Py_None); Py_INCREF(Py_None);
+  p->arrheniusLow = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)Py_None); Py_INCREF(Py_None);
+  p->_T1 = ((struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *)Py_None); Py_INCREF(Py_None);
+  p->_T2 = ((struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *)Py_None); Py_INCREF(Py_None);
+  p->_T3 = ((struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *)Py_None); Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_5rmgpy_8kinetics_7falloff_Troe(PyObject *o) {
+  struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *p = (struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->arrheniusHigh);
+  Py_CLEAR(p->arrheniusLow);
+  Py_CLEAR(p->_T1);
+  Py_CLEAR(p->_T2);
+  Py_CLEAR(p->_T3);
+  PyObject_GC_Track(o);
+  if (likely(__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel)) __pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel->tp_dealloc(o); else __Pyx_call_next_tp_dealloc(o, __pyx_tp_dealloc_5rmgpy_8kinetics_7falloff_Troe);
+}
+
+static int __pyx_tp_traverse_5rmgpy_8kinetics_7falloff_Troe(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *p = (struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)o;
+  e = ((likely(__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel)) ? ((__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel->tp_traverse) ? __pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel->tp_traverse(o, v, a) : 0) : __Pyx_call_next_tp_traverse(o, v, a, __pyx_tp_traverse_5rmgpy_8kinetics_7falloff_Troe)); if (e) return e;
+  if (p->arrheniusHigh) {
+    e = (*v)(((PyObject *)p->arrheniusHigh), a); if (e) return e;
+  }
+  if (p->arrheniusLow) {
+    e = (*v)(((PyObject *)p->arrheniusLow), a); if (e) return e;
+  }
+  if (p->_T1) {
+    e = (*v)(((PyObject *)p->_T1), a); if (e) return e;
+  }
+  if (p->_T2) {
+    e = (*v)(((PyObject *)p->_T2), a); if (e) return e;
+  }
+  if (p->_T3) {
+    e = (*v)(((PyObject *)p->_T3), a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_5rmgpy_8kinetics_7falloff_Troe(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *p = (struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *)o;
+  if (likely(__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel)) { if (__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel->tp_clear) __pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel->tp_clear(o); } else __Pyx_call_next_tp_clear(o, __pyx_tp_clear_5rmgpy_8kinetics_7falloff_Troe);
+  tmp = ((PyObject*)p->arrheniusHigh);
+  p->arrheniusHigh = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->arrheniusLow);
+  p->arrheniusLow = ((struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->_T1);
+  p->_T1 = ((struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->_T2);
+  p->_T2 = ((struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->_T3);
+  p->_T3 = ((struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyObject *__pyx_getprop_5rmgpy_8kinetics_7falloff_4Troe_T1(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_2T1_1__get__(o);
+}
+
+static int __pyx_setprop_5rmgpy_8kinetics_7falloff_4Troe_T1(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_2T1_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_5rmgpy_8kinetics_7falloff_4Troe_T2(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_2T2_1__get__(o);
+}
+
+static int __pyx_setprop_5rmgpy_8kinetics_7falloff_4Troe_T2(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_2T2_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_5rmgpy_8kinetics_7falloff_4Troe_T3(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_2T3_1__get__(o);
+}
+
+static int __pyx_setprop_5rmgpy_8kinetics_7falloff_4Troe_T3(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_2T3_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_5rmgpy_8kinetics_7falloff_4Troe_arrheniusHigh(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_13arrheniusHigh_1__get__(o);
+}
+
+static int __pyx_setprop_5rmgpy_8kinetics_7falloff_4Troe_arrheniusHigh(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_13arrheniusHigh_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_13arrheniusHigh_5__del__(o);
+  }
+}
+
+static PyObject *__pyx_getprop_5rmgpy_8kinetics_7falloff_4Troe_arrheniusLow(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_12arrheniusLow_1__get__(o);
+}
+
+static int __pyx_setprop_5rmgpy_8kinetics_7falloff_4Troe_arrheniusLow(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_12arrheniusLow_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_12arrheniusLow_5__del__(o);
+  }
+}
+
+static PyObject *__pyx_getprop_5rmgpy_8kinetics_7falloff_4Troe_alpha(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_5alpha_1__get__(o);
+}
+
+static int __pyx_setprop_5rmgpy_8kinetics_7falloff_4Troe_alpha(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_5alpha_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_5rmgpy_8kinetics_7falloff_4Troe__T1(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T1_1__get__(o);
+}
+
+static int __pyx_setprop_5rmgpy_8kinetics_7falloff_4Troe__T1(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T1_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T1_5__del__(o);
+  }
+}
+
+static PyObject *__pyx_getprop_5rmgpy_8kinetics_7falloff_4Troe__T2(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T2_1__get__(o);
+}
+
+static int __pyx_setprop_5rmgpy_8kinetics_7falloff_4Troe__T2(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T2_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T2_5__del__(o);
+  }
+}
+
+static PyObject *__pyx_getprop_5rmgpy_8kinetics_7falloff_4Troe__T3(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T3_1__get__(o);
+}
+
+static int __pyx_setprop_5rmgpy_8kinetics_7falloff_4Troe__T3(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T3_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3_T3_5__del__(o);
+  }
+}
+
+static PyMethodDef __pyx_methods_5rmgpy_8kinetics_7falloff_Troe[] = {
+  {"__reduce__", (PyCFunction)__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_5__reduce__, METH_NOARGS, __pyx_doc_5rmgpy_8kinetics_7falloff_4Troe_4__reduce__},
+  {"set_cantera_kinetics", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_13set_cantera_kinetics, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5rmgpy_8kinetics_7falloff_4Troe_12set_cantera_kinetics},
+  {0, 0, 0, 0}
+};
+
+static struct PyGetSetDef __pyx_getsets_5rmgpy_8kinetics_7falloff_Troe[] = {
+  {(char *)"T1", __pyx_getprop_5rmgpy_8kinetics_7falloff_4Troe_T1, __pyx_setprop_5rmgpy_8kinetics_7falloff_4Troe_T1, (char *)"The Troe :math:`T_1` parameter.", 0},
+  {(char *)"T2", __pyx_getprop_5rmgpy_8kinetics_7falloff_4Troe_T2, __pyx_setprop_5rmgpy_8kinetics_7falloff_4Troe_T2, (char *)"The Troe :math:`T_2` parameter.", 0},
+  {(char *)"T3", __pyx_getprop_5rmgpy_8kinetics_7falloff_4Troe_T3, __pyx_setprop_5rmgpy_8kinetics_7falloff_4Troe_T3, (char *)"The Troe :math:`T_3` parameter.", 0},
+  {(char *)"arrheniusHigh", __pyx_getprop_5rmgpy_8kinetics_7falloff_4Troe_arrheniusHigh, __pyx_setprop_5rmgpy_8kinetics_7falloff_4Troe_arrheniusHigh, (char *)"arrheniusHigh: rmgpy.kinetics.arrhenius.Arrhenius", 0},
+  {(char *)"arrheniusLow", __pyx_getprop_5rmgpy_8kinetics_7falloff_4Troe_arrheniusLow, __pyx_setprop_5rmgpy_8kinetics_7falloff_4Troe_arrheniusLow, (char *)"arrheniusLow: rmgpy.kinetics.arrhenius.Arrhenius", 0},
+  {(char *)"alpha", __pyx_getprop_5rmgpy_8kinetics_7falloff_4Troe_alpha, __pyx_setprop_5rmgpy_8kinetics_7falloff_4Troe_alpha, (char *)"alpha: 'double'", 0},
+  {(char *)"_T1", __pyx_getprop_5rmgpy_8kinetics_7falloff_4Troe__T1, __pyx_setprop_5rmgpy_8kinetics_7falloff_4Troe__T1, (char *)"_T1: rmgpy.quantity.ScalarQuantity", 0},
+  {(char *)"_T2", __pyx_getprop_5rmgpy_8kinetics_7falloff_4Troe__T2, __pyx_setprop_5rmgpy_8kinetics_7falloff_4Troe__T2, (char *)"_T2: rmgpy.quantity.ScalarQuantity", 0},
+  {(char *)"_T3", __pyx_getprop_5rmgpy_8kinetics_7falloff_4Troe__T3, __pyx_setprop_5rmgpy_8kinetics_7falloff_4Troe__T3, (char *)"_T3: rmgpy.quantity.ScalarQuantity", 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_5rmgpy_8kinetics_7falloff_Troe = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "rmgpy.kinetics.falloff.Troe", /*tp_name*/
+  sizeof(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_5rmgpy_8kinetics_7falloff_Troe, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_3__repr__, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  "Troe(arrheniusHigh=None, arrheniusLow=None, alpha=0.0, T3=None, T1=None, T2=None, Tmin=None, Tmax=None, Pmin=None, Pmax=None, efficiencies=None, comment=u'')\n\n    A kinetic model of a phenomenological rate coefficient :math:`k(T, P)`\n    using the Troe formulation. The attributes are:\n\n    =================== ========================================================\n    Attribute           Description\n    =================== ========================================================\n    `arrheniusHigh`     The Arrhenius kinetics at the high-pressure limit\n    `arrheniusLow`      The Arrhenius kinetics at the low-pressure limit\n    `alpha`             The :math:`\\alpha` parameter\n    `T1`                The :math:`T_1` parameter\n    `T2`                The :math:`T_2` parameter\n    `T3`                The :math:`T_3` parameter\n    `Tmin`              The minimum temperature at which the model is valid, or zero if unknown or undefined\n    `Tmax`              The maximum temperature at which the model is valid, or zero if unknown or undefined\n    `Pmin`              The minimum pressure at which the model is valid, or zero if unknown or undefined\n    `Pmax`              The maximum pressure at which the model is valid, or zero if unknown or undefined\n    `efficiencies`      A dict associating chemical species with associated efficiencies\n    `comment`           Information about the model (e.g. its source)\n    =================== ========================================================\n    \n    ", /*tp_doc*/
+  __pyx_tp_traverse_5rmgpy_8kinetics_7falloff_Troe, /*tp_traverse*/
+  __pyx_tp_clear_5rmgpy_8kinetics_7falloff_Troe, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_5rmgpy_8kinetics_7falloff_Troe, /*tp_methods*/
+  0, /*tp_members*/
+  __pyx_getsets_5rmgpy_8kinetics_7falloff_Troe, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_5rmgpy_8kinetics_7falloff_4Troe_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_5rmgpy_8kinetics_7falloff_Troe, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec_falloff(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec_falloff},
+  {0, NULL}
+};
+#endif
+
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "falloff",
+    __pyx_k_This_module_contains_classes_re, /* m_doc */
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    0, /* m_size */
+  #else
+    -1, /* m_size */
+  #endif
+    __pyx_methods /* m_methods */,
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    __pyx_moduledef_slots, /* m_slots */
+  #else
+    NULL, /* m_reload */
+  #endif
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_kp_u_, __pyx_k_, sizeof(__pyx_k_), 0, 1, 0, 0},
+  {&__pyx_n_s_A, __pyx_k_A, sizeof(__pyx_k_A), 0, 0, 1, 1},
+  {&__pyx_n_s_Falloff, __pyx_k_Falloff, sizeof(__pyx_k_Falloff), 0, 0, 1, 1},
+  {&__pyx_n_s_FalloffReaction, __pyx_k_FalloffReaction, sizeof(__pyx_k_FalloffReaction), 0, 0, 1, 1},
+  {&__pyx_n_s_ImportError, __pyx_k_ImportError, sizeof(__pyx_k_ImportError), 0, 0, 1, 1},
+  {&__pyx_n_s_Lindemann, __pyx_k_Lindemann, sizeof(__pyx_k_Lindemann), 0, 0, 1, 1},
+  {&__pyx_n_s_Lindemann___reduce, __pyx_k_Lindemann___reduce, sizeof(__pyx_k_Lindemann___reduce), 0, 0, 1, 1},
+  {&__pyx_kp_u_Lindemann_arrheniusHigh_0_r_arrh, __pyx_k_Lindemann_arrheniusHigh_0_r_arrh, sizeof(__pyx_k_Lindemann_arrheniusHigh_0_r_arrh), 0, 1, 0, 0},
+  {&__pyx_n_s_Lindemann_change_rate, __pyx_k_Lindemann_change_rate, sizeof(__pyx_k_Lindemann_change_rate), 0, 0, 1, 1},
+  {&__pyx_n_s_Lindemann_get_rate_coefficient, __pyx_k_Lindemann_get_rate_coefficient, sizeof(__pyx_k_Lindemann_get_rate_coefficient), 0, 0, 1, 1},
+  {&__pyx_n_s_Lindemann_is_identical_to, __pyx_k_Lindemann_is_identical_to, sizeof(__pyx_k_Lindemann_is_identical_to), 0, 0, 1, 1},
+  {&__pyx_n_s_Lindemann_set_cantera_kinetics, __pyx_k_Lindemann_set_cantera_kinetics, sizeof(__pyx_k_Lindemann_set_cantera_kinetics), 0, 0, 1, 1},
+  {&__pyx_kp_u_Must_be_a_Cantera_FalloffReactio, __pyx_k_Must_be_a_Cantera_FalloffReactio, sizeof(__pyx_k_Must_be_a_Cantera_FalloffReactio), 0, 1, 0, 0},
+  {&__pyx_kp_u_Must_be_a_Cantera_ThreeBodyReact, __pyx_k_Must_be_a_Cantera_ThreeBodyReact, sizeof(__pyx_k_Must_be_a_Cantera_ThreeBodyReact), 0, 1, 0, 0},
+  {&__pyx_n_s_P, __pyx_k_P, sizeof(__pyx_k_P), 0, 0, 1, 1},
+  {&__pyx_n_s_Pmax, __pyx_k_Pmax, sizeof(__pyx_k_Pmax), 0, 0, 1, 1},
+  {&__pyx_kp_u_Pmax_0_r, __pyx_k_Pmax_0_r, sizeof(__pyx_k_Pmax_0_r), 0, 1, 0, 0},
+  {&__pyx_n_s_Pmin, __pyx_k_Pmin, sizeof(__pyx_k_Pmin), 0, 0, 1, 1},
+  {&__pyx_kp_u_Pmin_0_r, __pyx_k_Pmin_0_r, sizeof(__pyx_k_Pmin_0_r), 0, 1, 0, 0},
+  {&__pyx_n_s_T, __pyx_k_T, sizeof(__pyx_k_T), 0, 0, 1, 1},
+  {&__pyx_n_s_T1, __pyx_k_T1, sizeof(__pyx_k_T1), 0, 0, 1, 1},
+  {&__pyx_kp_u_T1_0_r, __pyx_k_T1_0_r, sizeof(__pyx_k_T1_0_r), 0, 1, 0, 0},
+  {&__pyx_n_s_T2, __pyx_k_T2, sizeof(__pyx_k_T2), 0, 0, 1, 1},
+  {&__pyx_kp_u_T2_0_r, __pyx_k_T2_0_r, sizeof(__pyx_k_T2_0_r), 0, 1, 0, 0},
+  {&__pyx_n_s_T3, __pyx_k_T3, sizeof(__pyx_k_T3), 0, 0, 1, 1},
+  {&__pyx_kp_u_T3_0_r, __pyx_k_T3_0_r, sizeof(__pyx_k_T3_0_r), 0, 1, 0, 0},
+  {&__pyx_n_s_Temperature, __pyx_k_Temperature, sizeof(__pyx_k_Temperature), 0, 0, 1, 1},
+  {&__pyx_n_s_ThirdBody, __pyx_k_ThirdBody, sizeof(__pyx_k_ThirdBody), 0, 0, 1, 1},
+  {&__pyx_n_s_ThirdBody___reduce, __pyx_k_ThirdBody___reduce, sizeof(__pyx_k_ThirdBody___reduce), 0, 0, 1, 1},
+  {&__pyx_kp_u_ThirdBody_arrheniusLow_0_r, __pyx_k_ThirdBody_arrheniusLow_0_r, sizeof(__pyx_k_ThirdBody_arrheniusLow_0_r), 0, 1, 0, 0},
+  {&__pyx_n_s_ThirdBody_change_rate, __pyx_k_ThirdBody_change_rate, sizeof(__pyx_k_ThirdBody_change_rate), 0, 0, 1, 1},
+  {&__pyx_n_s_ThirdBody_get_rate_coefficient, __pyx_k_ThirdBody_get_rate_coefficient, sizeof(__pyx_k_ThirdBody_get_rate_coefficient), 0, 0, 1, 1},
+  {&__pyx_n_s_ThirdBody_is_identical_to, __pyx_k_ThirdBody_is_identical_to, sizeof(__pyx_k_ThirdBody_is_identical_to), 0, 0, 1, 1},
+  {&__pyx_n_s_ThirdBody_set_cantera_kinetics, __pyx_k_ThirdBody_set_cantera_kinetics, sizeof(__pyx_k_ThirdBody_set_cantera_kinetics), 0, 0, 1, 1},
+  {&__pyx_n_s_ThreeBodyReaction, __pyx_k_ThreeBodyReaction, sizeof(__pyx_k_ThreeBodyReaction), 0, 0, 1, 1},
+  {&__pyx_n_s_Tmax, __pyx_k_Tmax, sizeof(__pyx_k_Tmax), 0, 0, 1, 1},
+  {&__pyx_kp_u_Tmax_0_r, __pyx_k_Tmax_0_r, sizeof(__pyx_k_Tmax_0_r), 0, 1, 0, 0},
+  {&__pyx_n_s_Tmin, __pyx_k_Tmin, sizeof(__pyx_k_Tmin), 0, 0, 1, 1},
+  {&__pyx_kp_u_Tmin_0_r, __pyx_k_Tmin_0_r, sizeof(__pyx_k_Tmin_0_r), 0, 1, 0, 0},
+  {&__pyx_n_s_Troe, __pyx_k_Troe, sizeof(__pyx_k_Troe), 0, 0, 1, 1},
+  {&__pyx_n_s_TroeFalloff, __pyx_k_TroeFalloff, sizeof(__pyx_k_TroeFalloff), 0, 0, 1, 1},
+  {&__pyx_n_s_Troe___reduce, __pyx_k_Troe___reduce, sizeof(__pyx_k_Troe___reduce), 0, 0, 1, 1},
+  {&__pyx_kp_u_Troe_arrheniusHigh_0_r_arrhenius, __pyx_k_Troe_arrheniusHigh_0_r_arrhenius, sizeof(__pyx_k_Troe_arrheniusHigh_0_r_arrhenius), 0, 1, 0, 0},
+  {&__pyx_n_s_Troe_change_rate, __pyx_k_Troe_change_rate, sizeof(__pyx_k_Troe_change_rate), 0, 0, 1, 1},
+  {&__pyx_n_s_Troe_get_rate_coefficient, __pyx_k_Troe_get_rate_coefficient, sizeof(__pyx_k_Troe_get_rate_coefficient), 0, 0, 1, 1},
+  {&__pyx_n_s_Troe_is_identical_to, __pyx_k_Troe_is_identical_to, sizeof(__pyx_k_Troe_is_identical_to), 0, 0, 1, 1},
+  {&__pyx_n_s_Troe_set_cantera_kinetics, __pyx_k_Troe_set_cantera_kinetics, sizeof(__pyx_k_Troe_set_cantera_kinetics), 0, 0, 1, 1},
+  {&__pyx_kp_u__2, __pyx_k__2, sizeof(__pyx_k__2), 0, 1, 0, 0},
+  {&__pyx_n_s__5, __pyx_k__5, sizeof(__pyx_k__5), 0, 0, 1, 1},
+  {&__pyx_n_s_alpha, __pyx_k_alpha, sizeof(__pyx_k_alpha), 0, 0, 1, 1},
+  {&__pyx_kp_u_alpha_0_g, __pyx_k_alpha_0_g, sizeof(__pyx_k_alpha_0_g), 0, 1, 0, 0},
+  {&__pyx_n_s_arrheniusHigh, __pyx_k_arrheniusHigh, sizeof(__pyx_k_arrheniusHigh), 0, 0, 1, 1},
+  {&__pyx_n_s_arrheniusLow, __pyx_k_arrheniusLow, sizeof(__pyx_k_arrheniusLow), 0, 0, 1, 1},
+  {&__pyx_n_s_cantera, __pyx_k_cantera, sizeof(__pyx_k_cantera), 0, 0, 1, 1},
+  {&__pyx_n_s_change_rate, __pyx_k_change_rate, sizeof(__pyx_k_change_rate), 0, 0, 1, 1},
+  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_comment, __pyx_k_comment, sizeof(__pyx_k_comment), 0, 0, 1, 1},
+  {&__pyx_kp_u_comment_0, __pyx_k_comment_0, sizeof(__pyx_k_comment_0), 0, 1, 0, 0},
+  {&__pyx_n_s_ct, __pyx_k_ct, sizeof(__pyx_k_ct), 0, 0, 1, 1},
+  {&__pyx_n_s_ct_reaction, __pyx_k_ct_reaction, sizeof(__pyx_k_ct_reaction), 0, 0, 1, 1},
+  {&__pyx_n_s_efficiencies, __pyx_k_efficiencies, sizeof(__pyx_k_efficiencies), 0, 0, 1, 1},
+  {&__pyx_kp_u_efficiencies_0_r, __pyx_k_efficiencies_0_r, sizeof(__pyx_k_efficiencies_0_r), 0, 1, 0, 0},
+  {&__pyx_n_s_equals, __pyx_k_equals, sizeof(__pyx_k_equals), 0, 0, 1, 1},
+  {&__pyx_n_s_factor, __pyx_k_factor, sizeof(__pyx_k_factor), 0, 0, 1, 1},
+  {&__pyx_n_s_falloff, __pyx_k_falloff, sizeof(__pyx_k_falloff), 0, 0, 1, 1},
+  {&__pyx_n_s_format, __pyx_k_format, sizeof(__pyx_k_format), 0, 0, 1, 1},
+  {&__pyx_n_s_get_cantera_efficiencies, __pyx_k_get_cantera_efficiencies, sizeof(__pyx_k_get_cantera_efficiencies), 0, 0, 1, 1},
+  {&__pyx_n_s_get_rate_coefficient, __pyx_k_get_rate_coefficient, sizeof(__pyx_k_get_rate_coefficient), 0, 0, 1, 1},
+  {&__pyx_n_s_high_rate, __pyx_k_high_rate, sizeof(__pyx_k_high_rate), 0, 0, 1, 1},
+  {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_init, __pyx_k_init, sizeof(__pyx_k_init), 0, 0, 1, 1},
+  {&__pyx_n_s_is_identical_to, __pyx_k_is_identical_to, sizeof(__pyx_k_is_identical_to), 0, 0, 1, 1},
+  {&__pyx_n_s_low_rate, __pyx_k_low_rate, sizeof(__pyx_k_low_rate), 0, 0, 1, 1},
+  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_kp_u_numpy_core_multiarray_failed_to, __pyx_k_numpy_core_multiarray_failed_to, sizeof(__pyx_k_numpy_core_multiarray_failed_to), 0, 1, 0, 0},
+  {&__pyx_kp_u_numpy_core_umath_failed_to_impor, __pyx_k_numpy_core_umath_failed_to_impor, sizeof(__pyx_k_numpy_core_umath_failed_to_impor), 0, 1, 0, 0},
+  {&__pyx_n_s_other_kinetics, __pyx_k_other_kinetics, sizeof(__pyx_k_other_kinetics), 0, 0, 1, 1},
+  {&__pyx_n_s_params, __pyx_k_params, sizeof(__pyx_k_params), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
+  {&__pyx_n_s_quantity, __pyx_k_quantity, sizeof(__pyx_k_quantity), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
+  {&__pyx_n_s_rmgpy_kinetics_falloff, __pyx_k_rmgpy_kinetics_falloff, sizeof(__pyx_k_rmgpy_kinetics_falloff), 0, 0, 1, 1},
+  {&__pyx_kp_s_rmgpy_kinetics_falloff_pyx, __pyx_k_rmgpy_kinetics_falloff_pyx, sizeof(__pyx_k_rmgpy_kinetics_falloff_pyx), 0, 0, 1, 0},
+  {&__pyx_n_s_rmgpy_quantity, __pyx_k_rmgpy_quantity, sizeof(__pyx_k_rmgpy_quantity), 0, 0, 1, 1},
+  {&__pyx_n_s_self, __pyx_k_self, sizeof(__pyx_k_self), 0, 0, 1, 1},
+  {&__pyx_n_s_set_cantera_kinetics, __pyx_k_set_cantera_kinetics, sizeof(__pyx_k_set_cantera_kinetics), 0, 0, 1, 1},
+  {&__pyx_n_s_species_list, __pyx_k_species_list, sizeof(__pyx_k_species_list), 0, 0, 1, 1},
+  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_n_s_to_cantera_kinetics, __pyx_k_to_cantera_kinetics, sizeof(__pyx_k_to_cantera_kinetics), 0, 0, 1, 1},
+  {&__pyx_n_s_value_si, __pyx_k_value_si, sizeof(__pyx_k_value_si), 0, 0, 1, 1},
+  {0, 0, 0, 0, 0, 0, 0}
+};
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(2, 942, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":942
+ *         __pyx_import_array()
+ *     except Exception:
+ *         raise ImportError("numpy.core.multiarray failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int import_umath() except -1:
+ */
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_u_numpy_core_multiarray_failed_to); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(2, 942, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":948
+ *         _import_umath()
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int import_ufunc() except -1:
+ */
+  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_u_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(2, 948, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+
+  /* "rmgpy/kinetics/falloff.pyx":81
+ *         return string
+ * 
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         A helper function used when pickling a ThirdBody object.
+ */
+  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 81, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+  __pyx_codeobj__7 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__6, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rmgpy_kinetics_falloff_pyx, __pyx_n_s_reduce, 81, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__7)) __PYX_ERR(0, 81, __pyx_L1_error)
+
+  /* "rmgpy/kinetics/falloff.pyx":88
+ *                             self.efficiencies, self.comment))
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=0.0) except -1:             # <<<<<<<<<<<<<<
+ *         """
+ *         Return the value of the rate coefficient :math:`k(T)` in units of m^3,
+ */
+  __pyx_tuple__8 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_T, __pyx_n_s_P); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 88, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
+  __pyx_codeobj__9 = (PyObject*)__Pyx_PyCode_New(3, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__8, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rmgpy_kinetics_falloff_pyx, __pyx_n_s_get_rate_coefficient, 88, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__9)) __PYX_ERR(0, 88, __pyx_L1_error)
+
+  /* "rmgpy/kinetics/falloff.pyx":103
+ *         return k0 * C
+ * 
+ *     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:             # <<<<<<<<<<<<<<
+ *         """
+ *         Checks to see if kinetics matches that of other kinetics and returns ``True``
+ */
+  __pyx_tuple__10 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_other_kinetics); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(0, 103, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
+  __pyx_codeobj__11 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__10, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rmgpy_kinetics_falloff_pyx, __pyx_n_s_is_identical_to, 103, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__11)) __PYX_ERR(0, 103, __pyx_L1_error)
+
+  /* "rmgpy/kinetics/falloff.pyx":117
+ *         return True
+ * 
+ *     cpdef change_rate(self, double factor):             # <<<<<<<<<<<<<<
+ *         """
+ *         Changes kinetics rate by a multiple ``factor``.
+ */
+  __pyx_tuple__12 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_factor, __pyx_n_s_factor); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
+  __pyx_codeobj__13 = (PyObject*)__Pyx_PyCode_New(2, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__12, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rmgpy_kinetics_falloff_pyx, __pyx_n_s_change_rate, 117, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__13)) __PYX_ERR(0, 117, __pyx_L1_error)
+
+  /* "rmgpy/kinetics/falloff.pyx":123
+ *         self.arrheniusLow.change_rate(factor)
+ * 
+ *     def set_cantera_kinetics(self, ct_reaction, species_list):             # <<<<<<<<<<<<<<
+ *         """
+ *         Sets the kinetics and efficiencies for a cantera `ThreeBodyReaction` object
+ */
+  __pyx_tuple__14 = PyTuple_Pack(4, __pyx_n_s_self, __pyx_n_s_ct_reaction, __pyx_n_s_species_list, __pyx_n_s_ct); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(0, 123, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__14);
+  __Pyx_GIVEREF(__pyx_tuple__14);
+  __pyx_codeobj__15 = (PyObject*)__Pyx_PyCode_New(3, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__14, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rmgpy_kinetics_falloff_pyx, __pyx_n_s_set_cantera_kinetics, 123, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__15)) __PYX_ERR(0, 123, __pyx_L1_error)
+
+  /* "rmgpy/kinetics/falloff.pyx":176
+ *         return string
+ * 
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         A helper function used when pickling a Lindemann object.
+ */
+  __pyx_tuple__16 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(0, 176, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__16);
+  __Pyx_GIVEREF(__pyx_tuple__16);
+  __pyx_codeobj__17 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__16, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rmgpy_kinetics_falloff_pyx, __pyx_n_s_reduce, 176, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__17)) __PYX_ERR(0, 176, __pyx_L1_error)
+
+  /* "rmgpy/kinetics/falloff.pyx":183
+ *                             self.efficiencies, self.comment))
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=0.0) except -1:             # <<<<<<<<<<<<<<
+ *         """
+ *         Return the value of the rate coefficient :math:`k(T)` in units of m^3,
+ */
+  __pyx_tuple__18 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_T, __pyx_n_s_P); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(0, 183, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__18);
+  __Pyx_GIVEREF(__pyx_tuple__18);
+  __pyx_codeobj__19 = (PyObject*)__Pyx_PyCode_New(3, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rmgpy_kinetics_falloff_pyx, __pyx_n_s_get_rate_coefficient, 183, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__19)) __PYX_ERR(0, 183, __pyx_L1_error)
+
+  /* "rmgpy/kinetics/falloff.pyx":200
+ *         return kinf * (Pr / (1 + Pr))
+ * 
+ *     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:             # <<<<<<<<<<<<<<
+ *         """
+ *         Checks to see if kinetics matches that of other kinetics and returns ``True``
+ */
+  __pyx_tuple__20 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_other_kinetics); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(0, 200, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__20);
+  __Pyx_GIVEREF(__pyx_tuple__20);
+  __pyx_codeobj__21 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__20, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rmgpy_kinetics_falloff_pyx, __pyx_n_s_is_identical_to, 200, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__21)) __PYX_ERR(0, 200, __pyx_L1_error)
+
+  /* "rmgpy/kinetics/falloff.pyx":216
+ *         return True
+ * 
+ *     cpdef change_rate(self, double factor):             # <<<<<<<<<<<<<<
+ *         """
+ *         Changes kinetics rate by a multiple ``factor``.
+ */
+  __pyx_tuple__22 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_factor, __pyx_n_s_factor); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__22);
+  __Pyx_GIVEREF(__pyx_tuple__22);
+  __pyx_codeobj__23 = (PyObject*)__Pyx_PyCode_New(2, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__22, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rmgpy_kinetics_falloff_pyx, __pyx_n_s_change_rate, 216, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__23)) __PYX_ERR(0, 216, __pyx_L1_error)
+
+  /* "rmgpy/kinetics/falloff.pyx":223
+ *         self.arrheniusHigh.change_rate(factor)
+ * 
+ *     def set_cantera_kinetics(self, ct_reaction, species_list):             # <<<<<<<<<<<<<<
+ *         """
+ *         Sets the efficiencies and kinetics for a cantera reaction.
+ */
+  __pyx_tuple__24 = PyTuple_Pack(4, __pyx_n_s_self, __pyx_n_s_ct_reaction, __pyx_n_s_species_list, __pyx_n_s_ct); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(0, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__24);
+  __Pyx_GIVEREF(__pyx_tuple__24);
+  __pyx_codeobj__25 = (PyObject*)__Pyx_PyCode_New(3, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__24, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rmgpy_kinetics_falloff_pyx, __pyx_n_s_set_cantera_kinetics, 223, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__25)) __PYX_ERR(0, 223, __pyx_L1_error)
+
+  /* "rmgpy/kinetics/falloff.pyx":291
+ *         return string
+ * 
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         A helper function used when pickling a Troe object.
+ */
+  __pyx_tuple__26 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__26)) __PYX_ERR(0, 291, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__26);
+  __Pyx_GIVEREF(__pyx_tuple__26);
+  __pyx_codeobj__27 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__26, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rmgpy_kinetics_falloff_pyx, __pyx_n_s_reduce, 291, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__27)) __PYX_ERR(0, 291, __pyx_L1_error)
+
+  /* "rmgpy/kinetics/falloff.pyx":320
+ *             self._T3 = quantity.Temperature(value)
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=0.0) except -1:             # <<<<<<<<<<<<<<
+ *         """
+ *         Return the value of the rate coefficient :math:`k(T)` in units of m^3,
+ */
+  __pyx_tuple__28 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_T, __pyx_n_s_P); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__28);
+  __Pyx_GIVEREF(__pyx_tuple__28);
+  __pyx_codeobj__29 = (PyObject*)__Pyx_PyCode_New(3, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__28, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rmgpy_kinetics_falloff_pyx, __pyx_n_s_get_rate_coefficient, 320, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__29)) __PYX_ERR(0, 320, __pyx_L1_error)
+
+  /* "rmgpy/kinetics/falloff.pyx":354
+ *         return kinf * (Pr / (1 + Pr)) * F
+ * 
+ *     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:             # <<<<<<<<<<<<<<
+ *         """
+ *         Checks to see if kinetics matches that of other kinetics and returns ``True``
+ */
+  __pyx_tuple__30 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_other_kinetics); if (unlikely(!__pyx_tuple__30)) __PYX_ERR(0, 354, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__30);
+  __Pyx_GIVEREF(__pyx_tuple__30);
+  __pyx_codeobj__31 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__30, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rmgpy_kinetics_falloff_pyx, __pyx_n_s_is_identical_to, 354, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__31)) __PYX_ERR(0, 354, __pyx_L1_error)
+
+  /* "rmgpy/kinetics/falloff.pyx":378
+ *         return True
+ * 
+ *     cpdef change_rate(self, double factor):             # <<<<<<<<<<<<<<
+ *         """
+ *         Changes kinetics rate by a multiple ``factor``.
+ */
+  __pyx_tuple__32 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_factor, __pyx_n_s_factor); if (unlikely(!__pyx_tuple__32)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__32);
+  __Pyx_GIVEREF(__pyx_tuple__32);
+  __pyx_codeobj__33 = (PyObject*)__Pyx_PyCode_New(2, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__32, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rmgpy_kinetics_falloff_pyx, __pyx_n_s_change_rate, 378, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__33)) __PYX_ERR(0, 378, __pyx_L1_error)
+
+  /* "rmgpy/kinetics/falloff.pyx":385
+ *         self.arrheniusHigh.change_rate(factor)
+ * 
+ *     def set_cantera_kinetics(self, ct_reaction, species_list):             # <<<<<<<<<<<<<<
+ *         """
+ *         Sets the efficiencies, kinetics, and troe falloff parameters
+ */
+  __pyx_tuple__34 = PyTuple_Pack(8, __pyx_n_s_self, __pyx_n_s_ct_reaction, __pyx_n_s_species_list, __pyx_n_s_ct, __pyx_n_s_A, __pyx_n_s_T3, __pyx_n_s_T1, __pyx_n_s_T2); if (unlikely(!__pyx_tuple__34)) __PYX_ERR(0, 385, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__34);
+  __Pyx_GIVEREF(__pyx_tuple__34);
+  __pyx_codeobj__35 = (PyObject*)__Pyx_PyCode_New(3, 0, 8, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__34, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rmgpy_kinetics_falloff_pyx, __pyx_n_s_set_cantera_kinetics, 385, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__35)) __PYX_ERR(0, 385, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  /* AssertionsEnabled.init */
+  __Pyx_init_assertions_enabled();
+
+if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_0 = PyFloat_FromDouble(0.0); if (unlikely(!__pyx_float_0_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  __pyx_t_1 = PyImport_ImportModule("rmgpy.kinetics.model"); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.kinetics.model", "PDepKineticsModel", sizeof(struct __pyx_obj_5rmgpy_8kinetics_5model_PDepKineticsModel), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8kinetics_5model_PDepKineticsModel),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8kinetics_5model_PDepKineticsModel = (struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_PDepKineticsModel*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_8kinetics_5model_PDepKineticsModel)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8kinetics_7falloff_ThirdBody = &__pyx_vtable_5rmgpy_8kinetics_7falloff_ThirdBody;
+  __pyx_vtable_5rmgpy_8kinetics_7falloff_ThirdBody.__pyx_base = *__pyx_vtabptr_5rmgpy_8kinetics_5model_PDepKineticsModel;
+  __pyx_vtable_5rmgpy_8kinetics_7falloff_ThirdBody.__pyx_base.__pyx_base.get_rate_coefficient = (double (*)(struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *, double, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8kinetics_5model_13KineticsModel_get_rate_coefficient *__pyx_optional_args))__pyx_f_5rmgpy_8kinetics_7falloff_9ThirdBody_get_rate_coefficient;
+  __pyx_vtable_5rmgpy_8kinetics_7falloff_ThirdBody.__pyx_base.__pyx_base.is_identical_to = (int (*)(struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *, struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *, int __pyx_skip_dispatch))__pyx_f_5rmgpy_8kinetics_7falloff_9ThirdBody_is_identical_to;
+  __pyx_vtable_5rmgpy_8kinetics_7falloff_ThirdBody.change_rate = (PyObject *(*)(struct __pyx_obj_5rmgpy_8kinetics_7falloff_ThirdBody *, double, int __pyx_skip_dispatch))__pyx_f_5rmgpy_8kinetics_7falloff_9ThirdBody_change_rate;
+  __pyx_type_5rmgpy_8kinetics_7falloff_ThirdBody.tp_base = __pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel;
+  if (PyType_Ready(&__pyx_type_5rmgpy_8kinetics_7falloff_ThirdBody) < 0) __PYX_ERR(0, 42, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_5rmgpy_8kinetics_7falloff_ThirdBody.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_5rmgpy_8kinetics_7falloff_ThirdBody.tp_dictoffset && __pyx_type_5rmgpy_8kinetics_7falloff_ThirdBody.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_5rmgpy_8kinetics_7falloff_ThirdBody.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_5rmgpy_8kinetics_7falloff_ThirdBody, "__repr__"); if (unlikely(!wrapper)) __PYX_ERR(0, 42, __pyx_L1_error)
+    if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
+      __pyx_wrapperbase_5rmgpy_8kinetics_7falloff_9ThirdBody_2__repr__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_5rmgpy_8kinetics_7falloff_9ThirdBody_2__repr__.doc = __pyx_doc_5rmgpy_8kinetics_7falloff_9ThirdBody_2__repr__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_5rmgpy_8kinetics_7falloff_9ThirdBody_2__repr__;
+    }
+  }
+  #endif
+  if (__Pyx_SetVtable(__pyx_type_5rmgpy_8kinetics_7falloff_ThirdBody.tp_dict, __pyx_vtabptr_5rmgpy_8kinetics_7falloff_ThirdBody) < 0) __PYX_ERR(0, 42, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_ThirdBody, (PyObject *)&__pyx_type_5rmgpy_8kinetics_7falloff_ThirdBody) < 0) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_ptype_5rmgpy_8kinetics_7falloff_ThirdBody = &__pyx_type_5rmgpy_8kinetics_7falloff_ThirdBody;
+  __pyx_vtabptr_5rmgpy_8kinetics_7falloff_Lindemann = &__pyx_vtable_5rmgpy_8kinetics_7falloff_Lindemann;
+  __pyx_vtable_5rmgpy_8kinetics_7falloff_Lindemann.__pyx_base = *__pyx_vtabptr_5rmgpy_8kinetics_5model_PDepKineticsModel;
+  __pyx_vtable_5rmgpy_8kinetics_7falloff_Lindemann.__pyx_base.__pyx_base.get_rate_coefficient = (double (*)(struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *, double, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8kinetics_5model_13KineticsModel_get_rate_coefficient *__pyx_optional_args))__pyx_f_5rmgpy_8kinetics_7falloff_9Lindemann_get_rate_coefficient;
+  __pyx_vtable_5rmgpy_8kinetics_7falloff_Lindemann.__pyx_base.__pyx_base.is_identical_to = (int (*)(struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *, struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *, int __pyx_skip_dispatch))__pyx_f_5rmgpy_8kinetics_7falloff_9Lindemann_is_identical_to;
+  __pyx_vtable_5rmgpy_8kinetics_7falloff_Lindemann.change_rate = (PyObject *(*)(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Lindemann *, double, int __pyx_skip_dispatch))__pyx_f_5rmgpy_8kinetics_7falloff_9Lindemann_change_rate;
+  __pyx_type_5rmgpy_8kinetics_7falloff_Lindemann.tp_base = __pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel;
+  if (PyType_Ready(&__pyx_type_5rmgpy_8kinetics_7falloff_Lindemann) < 0) __PYX_ERR(0, 134, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_5rmgpy_8kinetics_7falloff_Lindemann.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_5rmgpy_8kinetics_7falloff_Lindemann.tp_dictoffset && __pyx_type_5rmgpy_8kinetics_7falloff_Lindemann.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_5rmgpy_8kinetics_7falloff_Lindemann.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_5rmgpy_8kinetics_7falloff_Lindemann, "__repr__"); if (unlikely(!wrapper)) __PYX_ERR(0, 134, __pyx_L1_error)
+    if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
+      __pyx_wrapperbase_5rmgpy_8kinetics_7falloff_9Lindemann_2__repr__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_5rmgpy_8kinetics_7falloff_9Lindemann_2__repr__.doc = __pyx_doc_5rmgpy_8kinetics_7falloff_9Lindemann_2__repr__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_5rmgpy_8kinetics_7falloff_9Lindemann_2__repr__;
+    }
+  }
+  #endif
+  if (__Pyx_SetVtable(__pyx_type_5rmgpy_8kinetics_7falloff_Lindemann.tp_dict, __pyx_vtabptr_5rmgpy_8kinetics_7falloff_Lindemann) < 0) __PYX_ERR(0, 134, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Lindemann, (PyObject *)&__pyx_type_5rmgpy_8kinetics_7falloff_Lindemann) < 0) __PYX_ERR(0, 134, __pyx_L1_error)
+  __pyx_ptype_5rmgpy_8kinetics_7falloff_Lindemann = &__pyx_type_5rmgpy_8kinetics_7falloff_Lindemann;
+  __pyx_vtabptr_5rmgpy_8kinetics_7falloff_Troe = &__pyx_vtable_5rmgpy_8kinetics_7falloff_Troe;
+  __pyx_vtable_5rmgpy_8kinetics_7falloff_Troe.__pyx_base = *__pyx_vtabptr_5rmgpy_8kinetics_5model_PDepKineticsModel;
+  __pyx_vtable_5rmgpy_8kinetics_7falloff_Troe.__pyx_base.__pyx_base.get_rate_coefficient = (double (*)(struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *, double, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8kinetics_5model_13KineticsModel_get_rate_coefficient *__pyx_optional_args))__pyx_f_5rmgpy_8kinetics_7falloff_4Troe_get_rate_coefficient;
+  __pyx_vtable_5rmgpy_8kinetics_7falloff_Troe.__pyx_base.__pyx_base.is_identical_to = (int (*)(struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *, struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel *, int __pyx_skip_dispatch))__pyx_f_5rmgpy_8kinetics_7falloff_4Troe_is_identical_to;
+  __pyx_vtable_5rmgpy_8kinetics_7falloff_Troe.change_rate = (PyObject *(*)(struct __pyx_obj_5rmgpy_8kinetics_7falloff_Troe *, double, int __pyx_skip_dispatch))__pyx_f_5rmgpy_8kinetics_7falloff_4Troe_change_rate;
+  __pyx_type_5rmgpy_8kinetics_7falloff_Troe.tp_base = __pyx_ptype_5rmgpy_8kinetics_5model_PDepKineticsModel;
+  if (PyType_Ready(&__pyx_type_5rmgpy_8kinetics_7falloff_Troe) < 0) __PYX_ERR(0, 237, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_5rmgpy_8kinetics_7falloff_Troe.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_5rmgpy_8kinetics_7falloff_Troe.tp_dictoffset && __pyx_type_5rmgpy_8kinetics_7falloff_Troe.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_5rmgpy_8kinetics_7falloff_Troe.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_5rmgpy_8kinetics_7falloff_Troe, "__repr__"); if (unlikely(!wrapper)) __PYX_ERR(0, 237, __pyx_L1_error)
+    if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
+      __pyx_wrapperbase_5rmgpy_8kinetics_7falloff_4Troe_2__repr__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_5rmgpy_8kinetics_7falloff_4Troe_2__repr__.doc = __pyx_doc_5rmgpy_8kinetics_7falloff_4Troe_2__repr__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_5rmgpy_8kinetics_7falloff_4Troe_2__repr__;
+    }
+  }
+  #endif
+  if (__Pyx_SetVtable(__pyx_type_5rmgpy_8kinetics_7falloff_Troe.tp_dict, __pyx_vtabptr_5rmgpy_8kinetics_7falloff_Troe) < 0) __PYX_ERR(0, 237, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Troe, (PyObject *)&__pyx_type_5rmgpy_8kinetics_7falloff_Troe) < 0) __PYX_ERR(0, 237, __pyx_L1_error)
+  __pyx_ptype_5rmgpy_8kinetics_7falloff_Troe = &__pyx_type_5rmgpy_8kinetics_7falloff_Troe;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_7cpython_4type_type = __Pyx_ImportType_0_29_37(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type", 
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyTypeObject),
+  #else
+  sizeof(PyHeapTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyHeapTypeObject),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_7cpython_4type_type) __PYX_ERR(3, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("numpy"); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 199, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_5numpy_dtype = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "dtype", sizeof(PyArray_Descr), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyArray_Descr),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_dtype) __PYX_ERR(2, 199, __pyx_L1_error)
+  __pyx_ptype_5numpy_flatiter = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "flatiter", sizeof(PyArrayIterObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyArrayIterObject),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_flatiter) __PYX_ERR(2, 222, __pyx_L1_error)
+  __pyx_ptype_5numpy_broadcast = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "broadcast", sizeof(PyArrayMultiIterObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyArrayMultiIterObject),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_broadcast) __PYX_ERR(2, 226, __pyx_L1_error)
+  __pyx_ptype_5numpy_ndarray = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "ndarray", sizeof(PyArrayObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyArrayObject),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_ndarray) __PYX_ERR(2, 238, __pyx_L1_error)
+  __pyx_ptype_5numpy_generic = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "generic", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_generic) __PYX_ERR(2, 767, __pyx_L1_error)
+  __pyx_ptype_5numpy_number = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "number", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_number) __PYX_ERR(2, 769, __pyx_L1_error)
+  __pyx_ptype_5numpy_integer = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "integer", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_integer) __PYX_ERR(2, 771, __pyx_L1_error)
+  __pyx_ptype_5numpy_signedinteger = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "signedinteger", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_signedinteger) __PYX_ERR(2, 773, __pyx_L1_error)
+  __pyx_ptype_5numpy_unsignedinteger = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "unsignedinteger", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_unsignedinteger) __PYX_ERR(2, 775, __pyx_L1_error)
+  __pyx_ptype_5numpy_inexact = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "inexact", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_inexact) __PYX_ERR(2, 777, __pyx_L1_error)
+  __pyx_ptype_5numpy_floating = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "floating", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_floating) __PYX_ERR(2, 779, __pyx_L1_error)
+  __pyx_ptype_5numpy_complexfloating = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "complexfloating", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_complexfloating) __PYX_ERR(2, 781, __pyx_L1_error)
+  __pyx_ptype_5numpy_flexible = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "flexible", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_flexible) __PYX_ERR(2, 783, __pyx_L1_error)
+  __pyx_ptype_5numpy_character = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "character", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_character) __PYX_ERR(2, 785, __pyx_L1_error)
+  __pyx_ptype_5numpy_ufunc = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "ufunc", sizeof(PyUFuncObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyUFuncObject),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_ufunc) __PYX_ERR(2, 824, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("rmgpy.rmgobject"); if (unlikely(!__pyx_t_1)) __PYX_ERR(4, 29, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_5rmgpy_9rmgobject_RMGObject = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.rmgobject", "RMGObject", sizeof(struct __pyx_obj_5rmgpy_9rmgobject_RMGObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_9rmgobject_RMGObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_9rmgobject_RMGObject) __PYX_ERR(4, 29, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_9rmgobject_RMGObject = (struct __pyx_vtabstruct_5rmgpy_9rmgobject_RMGObject*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_9rmgobject_RMGObject->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_9rmgobject_RMGObject)) __PYX_ERR(4, 29, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("rmgpy.quantity"); if (unlikely(!__pyx_t_1)) __PYX_ERR(5, 37, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_5rmgpy_8quantity_Units = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.quantity", "Units", sizeof(struct __pyx_obj_5rmgpy_8quantity_Units), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8quantity_Units),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8quantity_Units) __PYX_ERR(5, 37, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8quantity_Units = (struct __pyx_vtabstruct_5rmgpy_8quantity_Units*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_8quantity_Units->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_8quantity_Units)) __PYX_ERR(5, 37, __pyx_L1_error)
+  __pyx_ptype_5rmgpy_8quantity_ScalarQuantity = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.quantity", "ScalarQuantity", sizeof(struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8quantity_ScalarQuantity),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8quantity_ScalarQuantity) __PYX_ERR(5, 49, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8quantity_ScalarQuantity = (struct __pyx_vtabstruct_5rmgpy_8quantity_ScalarQuantity*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_8quantity_ScalarQuantity->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_8quantity_ScalarQuantity)) __PYX_ERR(5, 49, __pyx_L1_error)
+  __pyx_ptype_5rmgpy_8quantity_ArrayQuantity = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.quantity", "ArrayQuantity", sizeof(struct __pyx_obj_5rmgpy_8quantity_ArrayQuantity), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8quantity_ArrayQuantity),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8quantity_ArrayQuantity) __PYX_ERR(5, 65, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8quantity_ArrayQuantity = (struct __pyx_vtabstruct_5rmgpy_8quantity_ArrayQuantity*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_8quantity_ArrayQuantity->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_8quantity_ArrayQuantity)) __PYX_ERR(5, 65, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("rmgpy.kinetics.uncertainties"); if (unlikely(!__pyx_t_1)) __PYX_ERR(6, 32, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_5rmgpy_8kinetics_13uncertainties_RateUncertainty = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.kinetics.uncertainties", "RateUncertainty", sizeof(struct __pyx_obj_5rmgpy_8kinetics_13uncertainties_RateUncertainty), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8kinetics_13uncertainties_RateUncertainty),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8kinetics_13uncertainties_RateUncertainty) __PYX_ERR(6, 32, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8kinetics_13uncertainties_RateUncertainty = (struct __pyx_vtabstruct_5rmgpy_8kinetics_13uncertainties_RateUncertainty*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_8kinetics_13uncertainties_RateUncertainty->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_8kinetics_13uncertainties_RateUncertainty)) __PYX_ERR(6, 32, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("rmgpy.kinetics.model"); if (unlikely(!__pyx_t_1)) __PYX_ERR(7, 41, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_5rmgpy_8kinetics_5model_KineticsModel = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.kinetics.model", "KineticsModel", sizeof(struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8kinetics_5model_KineticsModel),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8kinetics_5model_KineticsModel) __PYX_ERR(7, 41, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8kinetics_5model_KineticsModel = (struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_KineticsModel*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_8kinetics_5model_KineticsModel->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_8kinetics_5model_KineticsModel)) __PYX_ERR(7, 41, __pyx_L1_error)
+  __pyx_ptype_5rmgpy_8kinetics_5model_TunnelingModel = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.kinetics.model", "TunnelingModel", sizeof(struct __pyx_obj_5rmgpy_8kinetics_5model_TunnelingModel), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8kinetics_5model_TunnelingModel),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8kinetics_5model_TunnelingModel) __PYX_ERR(7, 87, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8kinetics_5model_TunnelingModel = (struct __pyx_vtabstruct_5rmgpy_8kinetics_5model_TunnelingModel*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_8kinetics_5model_TunnelingModel->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_8kinetics_5model_TunnelingModel)) __PYX_ERR(7, 87, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("rmgpy.kinetics.arrhenius"); if (unlikely(!__pyx_t_1)) __PYX_ERR(8, 35, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_5rmgpy_8kinetics_9arrhenius_Arrhenius = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.kinetics.arrhenius", "Arrhenius", sizeof(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_Arrhenius),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8kinetics_9arrhenius_Arrhenius) __PYX_ERR(8, 35, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8kinetics_9arrhenius_Arrhenius = (struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_Arrhenius*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_8kinetics_9arrhenius_Arrhenius->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_8kinetics_9arrhenius_Arrhenius)) __PYX_ERR(8, 35, __pyx_L1_error)
+  __pyx_ptype_5rmgpy_8kinetics_9arrhenius_ArrheniusEP = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.kinetics.arrhenius", "ArrheniusEP", sizeof(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_ArrheniusEP), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_ArrheniusEP),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8kinetics_9arrhenius_ArrheniusEP) __PYX_ERR(8, 56, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8kinetics_9arrhenius_ArrheniusEP = (struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_ArrheniusEP*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_8kinetics_9arrhenius_ArrheniusEP->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_8kinetics_9arrhenius_ArrheniusEP)) __PYX_ERR(8, 56, __pyx_L1_error)
+  __pyx_ptype_5rmgpy_8kinetics_9arrhenius_ArrheniusBM = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.kinetics.arrhenius", "ArrheniusBM", sizeof(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_ArrheniusBM), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_ArrheniusBM),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8kinetics_9arrhenius_ArrheniusBM) __PYX_ERR(8, 74, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8kinetics_9arrhenius_ArrheniusBM = (struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_ArrheniusBM*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_8kinetics_9arrhenius_ArrheniusBM->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_8kinetics_9arrhenius_ArrheniusBM)) __PYX_ERR(8, 74, __pyx_L1_error)
+  __pyx_ptype_5rmgpy_8kinetics_9arrhenius_PDepArrhenius = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.kinetics.arrhenius", "PDepArrhenius", sizeof(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_PDepArrhenius), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_PDepArrhenius),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8kinetics_9arrhenius_PDepArrhenius) __PYX_ERR(8, 92, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8kinetics_9arrhenius_PDepArrhenius = (struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_PDepArrhenius*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_8kinetics_9arrhenius_PDepArrhenius->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_8kinetics_9arrhenius_PDepArrhenius)) __PYX_ERR(8, 92, __pyx_L1_error)
+  __pyx_ptype_5rmgpy_8kinetics_9arrhenius_MultiArrhenius = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.kinetics.arrhenius", "MultiArrhenius", sizeof(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_MultiArrhenius), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_MultiArrhenius),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8kinetics_9arrhenius_MultiArrhenius) __PYX_ERR(8, 109, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8kinetics_9arrhenius_MultiArrhenius = (struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_MultiArrhenius*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_8kinetics_9arrhenius_MultiArrhenius->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_8kinetics_9arrhenius_MultiArrhenius)) __PYX_ERR(8, 109, __pyx_L1_error)
+  __pyx_ptype_5rmgpy_8kinetics_9arrhenius_MultiPDepArrhenius = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.kinetics.arrhenius", "MultiPDepArrhenius", sizeof(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_MultiPDepArrhenius), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8kinetics_9arrhenius_MultiPDepArrhenius),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8kinetics_9arrhenius_MultiPDepArrhenius) __PYX_ERR(8, 123, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8kinetics_9arrhenius_MultiPDepArrhenius = (struct __pyx_vtabstruct_5rmgpy_8kinetics_9arrhenius_MultiPDepArrhenius*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_8kinetics_9arrhenius_MultiPDepArrhenius->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_8kinetics_9arrhenius_MultiPDepArrhenius)) __PYX_ERR(8, 123, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __pyx_t_1 = PyImport_ImportModule("rmgpy.quantity"); if (!__pyx_t_1) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "NOT_IMPLEMENTED_UNITS", (void **)&__pyx_vp_5rmgpy_8quantity_NOT_IMPLEMENTED_UNITS, "PyObject *") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("rmgpy.constants"); if (!__pyx_t_1) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "pi", (void **)&__pyx_vp_5rmgpy_9constants_pi, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "Na", (void **)&__pyx_vp_5rmgpy_9constants_Na, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "kB", (void **)&__pyx_vp_5rmgpy_9constants_kB, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "R", (void **)&__pyx_vp_5rmgpy_9constants_R, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "h", (void **)&__pyx_vp_5rmgpy_9constants_h, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "hbar", (void **)&__pyx_vp_5rmgpy_9constants_hbar, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "c", (void **)&__pyx_vp_5rmgpy_9constants_c, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "e", (void **)&__pyx_vp_5rmgpy_9constants_e, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "m_e", (void **)&__pyx_vp_5rmgpy_9constants_m_e, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "m_p", (void **)&__pyx_vp_5rmgpy_9constants_m_p, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "m_n", (void **)&__pyx_vp_5rmgpy_9constants_m_n, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "amu", (void **)&__pyx_vp_5rmgpy_9constants_amu, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "a0", (void **)&__pyx_vp_5rmgpy_9constants_a0, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "E_h", (void **)&__pyx_vp_5rmgpy_9constants_E_h, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC initfalloff(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC initfalloff(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit_falloff(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit_falloff(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec_falloff(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module 'falloff' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit_falloff(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("falloff", __pyx_methods, __pyx_k_This_module_contains_classes_re, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_b);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_rmgpy__kinetics__falloff) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "rmgpy.kinetics.falloff")) {
+      if (unlikely(PyDict_SetItemString(modules, "rmgpy.kinetics.falloff", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  (void)__Pyx_modinit_function_export_code();
+  if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely(__Pyx_modinit_type_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely(__Pyx_modinit_variable_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_function_import_code();
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+
+  /* "rmgpy/kinetics/falloff.pyx":38
+ * 
+ * cimport rmgpy.constants as constants
+ * import rmgpy.quantity as quantity             # <<<<<<<<<<<<<<
+ * 
+ * ################################################################################
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s__5);
+  __Pyx_GIVEREF(__pyx_n_s__5);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s__5);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_rmgpy_quantity, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_quantity, __pyx_t_2) < 0) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "rmgpy/kinetics/falloff.pyx":81
+ *         return string
+ * 
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         A helper function used when pickling a ThirdBody object.
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5rmgpy_8kinetics_7falloff_9ThirdBody_5__reduce__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_ThirdBody___reduce, NULL, __pyx_n_s_rmgpy_kinetics_falloff, __pyx_d, ((PyObject *)__pyx_codeobj__7)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 81, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_ThirdBody->tp_dict, __pyx_n_s_reduce, __pyx_t_2) < 0) __PYX_ERR(0, 81, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_5rmgpy_8kinetics_7falloff_ThirdBody);
+
+  /* "rmgpy/kinetics/falloff.pyx":88
+ *                             self.efficiencies, self.comment))
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=0.0) except -1:             # <<<<<<<<<<<<<<
+ *         """
+ *         Return the value of the rate coefficient :math:`k(T)` in units of m^3,
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5rmgpy_8kinetics_7falloff_9ThirdBody_7get_rate_coefficient, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_ThirdBody_get_rate_coefficient, NULL, __pyx_n_s_rmgpy_kinetics_falloff, __pyx_d, ((PyObject *)__pyx_codeobj__9)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 88, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_ThirdBody->tp_dict, __pyx_n_s_get_rate_coefficient, __pyx_t_2) < 0) __PYX_ERR(0, 88, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_5rmgpy_8kinetics_7falloff_ThirdBody);
+
+  /* "rmgpy/kinetics/falloff.pyx":103
+ *         return k0 * C
+ * 
+ *     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:             # <<<<<<<<<<<<<<
+ *         """
+ *         Checks to see if kinetics matches that of other kinetics and returns ``True``
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5rmgpy_8kinetics_7falloff_9ThirdBody_9is_identical_to, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_ThirdBody_is_identical_to, NULL, __pyx_n_s_rmgpy_kinetics_falloff, __pyx_d, ((PyObject *)__pyx_codeobj__11)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 103, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_ThirdBody->tp_dict, __pyx_n_s_is_identical_to, __pyx_t_2) < 0) __PYX_ERR(0, 103, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_5rmgpy_8kinetics_7falloff_ThirdBody);
+
+  /* "rmgpy/kinetics/falloff.pyx":117
+ *         return True
+ * 
+ *     cpdef change_rate(self, double factor):             # <<<<<<<<<<<<<<
+ *         """
+ *         Changes kinetics rate by a multiple ``factor``.
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5rmgpy_8kinetics_7falloff_9ThirdBody_11change_rate, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_ThirdBody_change_rate, NULL, __pyx_n_s_rmgpy_kinetics_falloff, __pyx_d, ((PyObject *)__pyx_codeobj__13)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_ThirdBody->tp_dict, __pyx_n_s_change_rate, __pyx_t_2) < 0) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_5rmgpy_8kinetics_7falloff_ThirdBody);
+
+  /* "rmgpy/kinetics/falloff.pyx":123
+ *         self.arrheniusLow.change_rate(factor)
+ * 
+ *     def set_cantera_kinetics(self, ct_reaction, species_list):             # <<<<<<<<<<<<<<
+ *         """
+ *         Sets the kinetics and efficiencies for a cantera `ThreeBodyReaction` object
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5rmgpy_8kinetics_7falloff_9ThirdBody_13set_cantera_kinetics, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_ThirdBody_set_cantera_kinetics, NULL, __pyx_n_s_rmgpy_kinetics_falloff, __pyx_d, ((PyObject *)__pyx_codeobj__15)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 123, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_ThirdBody->tp_dict, __pyx_n_s_set_cantera_kinetics, __pyx_t_2) < 0) __PYX_ERR(0, 123, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_5rmgpy_8kinetics_7falloff_ThirdBody);
+
+  /* "rmgpy/kinetics/falloff.pyx":176
+ *         return string
+ * 
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         A helper function used when pickling a Lindemann object.
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5rmgpy_8kinetics_7falloff_9Lindemann_5__reduce__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Lindemann___reduce, NULL, __pyx_n_s_rmgpy_kinetics_falloff, __pyx_d, ((PyObject *)__pyx_codeobj__17)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 176, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_Lindemann->tp_dict, __pyx_n_s_reduce, __pyx_t_2) < 0) __PYX_ERR(0, 176, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_5rmgpy_8kinetics_7falloff_Lindemann);
+
+  /* "rmgpy/kinetics/falloff.pyx":183
+ *                             self.efficiencies, self.comment))
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=0.0) except -1:             # <<<<<<<<<<<<<<
+ *         """
+ *         Return the value of the rate coefficient :math:`k(T)` in units of m^3,
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5rmgpy_8kinetics_7falloff_9Lindemann_7get_rate_coefficient, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Lindemann_get_rate_coefficient, NULL, __pyx_n_s_rmgpy_kinetics_falloff, __pyx_d, ((PyObject *)__pyx_codeobj__19)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 183, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_Lindemann->tp_dict, __pyx_n_s_get_rate_coefficient, __pyx_t_2) < 0) __PYX_ERR(0, 183, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_5rmgpy_8kinetics_7falloff_Lindemann);
+
+  /* "rmgpy/kinetics/falloff.pyx":200
+ *         return kinf * (Pr / (1 + Pr))
+ * 
+ *     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:             # <<<<<<<<<<<<<<
+ *         """
+ *         Checks to see if kinetics matches that of other kinetics and returns ``True``
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5rmgpy_8kinetics_7falloff_9Lindemann_9is_identical_to, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Lindemann_is_identical_to, NULL, __pyx_n_s_rmgpy_kinetics_falloff, __pyx_d, ((PyObject *)__pyx_codeobj__21)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 200, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_Lindemann->tp_dict, __pyx_n_s_is_identical_to, __pyx_t_2) < 0) __PYX_ERR(0, 200, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_5rmgpy_8kinetics_7falloff_Lindemann);
+
+  /* "rmgpy/kinetics/falloff.pyx":216
+ *         return True
+ * 
+ *     cpdef change_rate(self, double factor):             # <<<<<<<<<<<<<<
+ *         """
+ *         Changes kinetics rate by a multiple ``factor``.
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5rmgpy_8kinetics_7falloff_9Lindemann_11change_rate, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Lindemann_change_rate, NULL, __pyx_n_s_rmgpy_kinetics_falloff, __pyx_d, ((PyObject *)__pyx_codeobj__23)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_Lindemann->tp_dict, __pyx_n_s_change_rate, __pyx_t_2) < 0) __PYX_ERR(0, 216, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_5rmgpy_8kinetics_7falloff_Lindemann);
+
+  /* "rmgpy/kinetics/falloff.pyx":223
+ *         self.arrheniusHigh.change_rate(factor)
+ * 
+ *     def set_cantera_kinetics(self, ct_reaction, species_list):             # <<<<<<<<<<<<<<
+ *         """
+ *         Sets the efficiencies and kinetics for a cantera reaction.
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5rmgpy_8kinetics_7falloff_9Lindemann_13set_cantera_kinetics, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Lindemann_set_cantera_kinetics, NULL, __pyx_n_s_rmgpy_kinetics_falloff, __pyx_d, ((PyObject *)__pyx_codeobj__25)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_Lindemann->tp_dict, __pyx_n_s_set_cantera_kinetics, __pyx_t_2) < 0) __PYX_ERR(0, 223, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_5rmgpy_8kinetics_7falloff_Lindemann);
+
+  /* "rmgpy/kinetics/falloff.pyx":291
+ *         return string
+ * 
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         A helper function used when pickling a Troe object.
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5rmgpy_8kinetics_7falloff_4Troe_5__reduce__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Troe___reduce, NULL, __pyx_n_s_rmgpy_kinetics_falloff, __pyx_d, ((PyObject *)__pyx_codeobj__27)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 291, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_Troe->tp_dict, __pyx_n_s_reduce, __pyx_t_2) < 0) __PYX_ERR(0, 291, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_5rmgpy_8kinetics_7falloff_Troe);
+
+  /* "rmgpy/kinetics/falloff.pyx":320
+ *             self._T3 = quantity.Temperature(value)
+ * 
+ *     cpdef double get_rate_coefficient(self, double T, double P=0.0) except -1:             # <<<<<<<<<<<<<<
+ *         """
+ *         Return the value of the rate coefficient :math:`k(T)` in units of m^3,
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5rmgpy_8kinetics_7falloff_4Troe_7get_rate_coefficient, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Troe_get_rate_coefficient, NULL, __pyx_n_s_rmgpy_kinetics_falloff, __pyx_d, ((PyObject *)__pyx_codeobj__29)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_Troe->tp_dict, __pyx_n_s_get_rate_coefficient, __pyx_t_2) < 0) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_5rmgpy_8kinetics_7falloff_Troe);
+
+  /* "rmgpy/kinetics/falloff.pyx":354
+ *         return kinf * (Pr / (1 + Pr)) * F
+ * 
+ *     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:             # <<<<<<<<<<<<<<
+ *         """
+ *         Checks to see if kinetics matches that of other kinetics and returns ``True``
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5rmgpy_8kinetics_7falloff_4Troe_9is_identical_to, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Troe_is_identical_to, NULL, __pyx_n_s_rmgpy_kinetics_falloff, __pyx_d, ((PyObject *)__pyx_codeobj__31)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 354, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_Troe->tp_dict, __pyx_n_s_is_identical_to, __pyx_t_2) < 0) __PYX_ERR(0, 354, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_5rmgpy_8kinetics_7falloff_Troe);
+
+  /* "rmgpy/kinetics/falloff.pyx":378
+ *         return True
+ * 
+ *     cpdef change_rate(self, double factor):             # <<<<<<<<<<<<<<
+ *         """
+ *         Changes kinetics rate by a multiple ``factor``.
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5rmgpy_8kinetics_7falloff_4Troe_11change_rate, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Troe_change_rate, NULL, __pyx_n_s_rmgpy_kinetics_falloff, __pyx_d, ((PyObject *)__pyx_codeobj__33)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_Troe->tp_dict, __pyx_n_s_change_rate, __pyx_t_2) < 0) __PYX_ERR(0, 378, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_5rmgpy_8kinetics_7falloff_Troe);
+
+  /* "rmgpy/kinetics/falloff.pyx":385
+ *         self.arrheniusHigh.change_rate(factor)
+ * 
+ *     def set_cantera_kinetics(self, ct_reaction, species_list):             # <<<<<<<<<<<<<<
+ *         """
+ *         Sets the efficiencies, kinetics, and troe falloff parameters
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_5rmgpy_8kinetics_7falloff_4Troe_13set_cantera_kinetics, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Troe_set_cantera_kinetics, NULL, __pyx_n_s_rmgpy_kinetics_falloff, __pyx_d, ((PyObject *)__pyx_codeobj__35)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 385, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_5rmgpy_8kinetics_7falloff_Troe->tp_dict, __pyx_n_s_set_cantera_kinetics, __pyx_t_2) < 0) __PYX_ERR(0, 385, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_5rmgpy_8kinetics_7falloff_Troe);
+
+  /* "rmgpy/kinetics/falloff.pyx":1
+ * # cython: embedsignature=True, cdivision=True             # <<<<<<<<<<<<<<
+ * 
+ * ###############################################################################
+ */
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1011
+ * 
+ * 
+ * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the unit part of the dtype for a numpy datetime64 object.
+ */
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  if (__pyx_m) {
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init rmgpy.kinetics.falloff", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    Py_CLEAR(__pyx_m);
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init rmgpy.kinetics.falloff");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+            continue;
+        }
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (**name == key) ? 0 :
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key);
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* ExtTypeTest */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    if (likely(__Pyx_TypeCheck(obj, type)))
+        return 1;
+    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
+                 Py_TYPE(obj)->tp_name, type->tp_name);
+    return 0;
+}
+
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* BytesEquals */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+    if (s1 == s2) {
+        return (equals == Py_EQ);
+    } else if (PyBytes_CheckExact(s1) & PyBytes_CheckExact(s2)) {
+        const char *ps1, *ps2;
+        Py_ssize_t length = PyBytes_GET_SIZE(s1);
+        if (length != PyBytes_GET_SIZE(s2))
+            return (equals == Py_NE);
+        ps1 = PyBytes_AS_STRING(s1);
+        ps2 = PyBytes_AS_STRING(s2);
+        if (ps1[0] != ps2[0]) {
+            return (equals == Py_NE);
+        } else if (length == 1) {
+            return (equals == Py_EQ);
+        } else {
+            int result;
+#if CYTHON_USE_UNICODE_INTERNALS && (PY_VERSION_HEX < 0x030B0000)
+            Py_hash_t hash1, hash2;
+            hash1 = ((PyBytesObject*)s1)->ob_shash;
+            hash2 = ((PyBytesObject*)s2)->ob_shash;
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                return (equals == Py_NE);
+            }
+#endif
+            result = memcmp(ps1, ps2, (size_t)length);
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & PyBytes_CheckExact(s2)) {
+        return (equals == Py_NE);
+    } else if ((s2 == Py_None) & PyBytes_CheckExact(s1)) {
+        return (equals == Py_NE);
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+#endif
+}
+
+/* UnicodeEquals */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+#if PY_MAJOR_VERSION < 3
+    PyObject* owned_ref = NULL;
+#endif
+    int s1_is_unicode, s2_is_unicode;
+    if (s1 == s2) {
+        goto return_eq;
+    }
+    s1_is_unicode = PyUnicode_CheckExact(s1);
+    s2_is_unicode = PyUnicode_CheckExact(s2);
+#if PY_MAJOR_VERSION < 3
+    if ((s1_is_unicode & (!s2_is_unicode)) && PyString_CheckExact(s2)) {
+        owned_ref = PyUnicode_FromObject(s2);
+        if (unlikely(!owned_ref))
+            return -1;
+        s2 = owned_ref;
+        s2_is_unicode = 1;
+    } else if ((s2_is_unicode & (!s1_is_unicode)) && PyString_CheckExact(s1)) {
+        owned_ref = PyUnicode_FromObject(s1);
+        if (unlikely(!owned_ref))
+            return -1;
+        s1 = owned_ref;
+        s1_is_unicode = 1;
+    } else if (((!s2_is_unicode) & (!s1_is_unicode))) {
+        return __Pyx_PyBytes_Equals(s1, s2, equals);
+    }
+#endif
+    if (s1_is_unicode & s2_is_unicode) {
+        Py_ssize_t length;
+        int kind;
+        void *data1, *data2;
+        if (unlikely(__Pyx_PyUnicode_READY(s1) < 0) || unlikely(__Pyx_PyUnicode_READY(s2) < 0))
+            return -1;
+        length = __Pyx_PyUnicode_GET_LENGTH(s1);
+        if (length != __Pyx_PyUnicode_GET_LENGTH(s2)) {
+            goto return_ne;
+        }
+#if CYTHON_USE_UNICODE_INTERNALS
+        {
+            Py_hash_t hash1, hash2;
+        #if CYTHON_PEP393_ENABLED
+            hash1 = ((PyASCIIObject*)s1)->hash;
+            hash2 = ((PyASCIIObject*)s2)->hash;
+        #else
+            hash1 = ((PyUnicodeObject*)s1)->hash;
+            hash2 = ((PyUnicodeObject*)s2)->hash;
+        #endif
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                goto return_ne;
+            }
+        }
+#endif
+        kind = __Pyx_PyUnicode_KIND(s1);
+        if (kind != __Pyx_PyUnicode_KIND(s2)) {
+            goto return_ne;
+        }
+        data1 = __Pyx_PyUnicode_DATA(s1);
+        data2 = __Pyx_PyUnicode_DATA(s2);
+        if (__Pyx_PyUnicode_READ(kind, data1, 0) != __Pyx_PyUnicode_READ(kind, data2, 0)) {
+            goto return_ne;
+        } else if (length == 1) {
+            goto return_eq;
+        } else {
+            int result = memcmp(data1, data2, (size_t)(length * kind));
+            #if PY_MAJOR_VERSION < 3
+            Py_XDECREF(owned_ref);
+            #endif
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & s2_is_unicode) {
+        goto return_ne;
+    } else if ((s2 == Py_None) & s1_is_unicode) {
+        goto return_ne;
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        #if PY_MAJOR_VERSION < 3
+        Py_XDECREF(owned_ref);
+        #endif
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+return_eq:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_EQ);
+return_ne:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_NE);
+#endif
+}
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* ArgTypeTest */
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
+{
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    else if (exact) {
+        #if PY_MAJOR_VERSION == 2
+        if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
+        #endif
+    }
+    else {
+        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%.200s' has incorrect type (expected %.200s, got %.200s)",
+        name, type->tp_name, Py_TYPE(obj)->tp_name);
+    return 0;
+}
+
+/* Import */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+    PyObject *empty_list = 0;
+    PyObject *module = 0;
+    PyObject *global_dict = 0;
+    PyObject *empty_dict = 0;
+    PyObject *list;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_import;
+    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
+    if (!py_import)
+        goto bad;
+    #endif
+    if (from_list)
+        list = from_list;
+    else {
+        empty_list = PyList_New(0);
+        if (!empty_list)
+            goto bad;
+        list = empty_list;
+    }
+    global_dict = PyModule_GetDict(__pyx_m);
+    if (!global_dict)
+        goto bad;
+    empty_dict = PyDict_New();
+    if (!empty_dict)
+        goto bad;
+    {
+        #if PY_MAJOR_VERSION >= 3
+        if (level == -1) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
+                module = PyImport_ImportModuleLevelObject(
+                    name, global_dict, empty_dict, list, 1);
+                if (!module) {
+                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
+                        goto bad;
+                    PyErr_Clear();
+                }
+            }
+            level = 0;
+        }
+        #endif
+        if (!module) {
+            #if PY_MAJOR_VERSION < 3
+            PyObject *py_level = PyInt_FromLong(level);
+            if (!py_level)
+                goto bad;
+            module = PyObject_CallFunctionObjArgs(py_import,
+                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
+            Py_DECREF(py_level);
+            #else
+            module = PyImport_ImportModuleLevelObject(
+                name, global_dict, empty_dict, list, level);
+            #endif
+        }
+    }
+bad:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_import);
+    #endif
+    Py_XDECREF(empty_list);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+/* PyObjectSetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_setattro))
+        return tp->tp_setattro(obj, attr_name, value);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_setattr))
+        return tp->tp_setattr(obj, PyString_AS_STRING(attr_name), value);
+#endif
+    return PyObject_SetAttr(obj, attr_name, value);
+}
+#endif
+
+/* PyObjectCallNoArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* WriteUnraisableException */
+static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
+                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
+                                  int full_traceback, CYTHON_UNUSED int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+    __Pyx_PyThreadState_declare
+#ifdef WITH_THREAD
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+    else state = (PyGILState_STATE)0;
+#endif
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(1);
+    }
+    #if PY_MAJOR_VERSION < 3
+    ctx = PyString_FromString(name);
+    #else
+    ctx = PyUnicode_FromString(name);
+    #endif
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+#ifdef WITH_THREAD
+    if (nogil)
+        PyGILState_Release(state);
+#endif
+}
+
+/* GetTopmostException */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem *
+__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
+{
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    while ((exc_info->exc_type == NULL || exc_info->exc_type == Py_None) &&
+           exc_info->previous_item != NULL)
+    {
+        exc_info = exc_info->previous_item;
+    }
+    return exc_info;
+}
+#endif
+
+/* SaveResetException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    *type = exc_info->exc_type;
+    *value = exc_info->exc_value;
+    *tb = exc_info->exc_traceback;
+    #else
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    #endif
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+}
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = type;
+    exc_info->exc_value = value;
+    exc_info->exc_traceback = tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+#endif
+
+/* PyErrExceptionMatches */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    PyObject *exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+    if (unlikely(PyTuple_Check(err)))
+        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+}
+#endif
+
+/* GetException */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
+#endif
+{
+    PyObject *local_type, *local_value, *local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    local_type = tstate->curexc_type;
+    local_value = tstate->curexc_value;
+    local_tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#else
+    PyErr_Fetch(&local_type, &local_value, &local_tb);
+#endif
+    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+#if CYTHON_FAST_THREAD_STATE
+    if (unlikely(tstate->curexc_type))
+#else
+    if (unlikely(PyErr_Occurred()))
+#endif
+        goto bad;
+    #if PY_MAJOR_VERSION >= 3
+    if (local_tb) {
+        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+            goto bad;
+    }
+    #endif
+    Py_XINCREF(local_tb);
+    Py_XINCREF(local_type);
+    Py_XINCREF(local_value);
+    *type = local_type;
+    *value = local_value;
+    *tb = local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_USE_EXC_INFO_STACK
+    {
+        _PyErr_StackItem *exc_info = tstate->exc_info;
+        tmp_type = exc_info->exc_type;
+        tmp_value = exc_info->exc_value;
+        tmp_tb = exc_info->exc_traceback;
+        exc_info->exc_type = local_type;
+        exc_info->exc_value = local_value;
+        exc_info->exc_traceback = local_tb;
+    }
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = local_type;
+    tstate->exc_value = local_value;
+    tstate->exc_traceback = local_tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#else
+    PyErr_SetExcInfo(local_type, local_value, local_tb);
+#endif
+    return 0;
+bad:
+    *type = 0;
+    *value = 0;
+    *tb = 0;
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_tb);
+    return -1;
+}
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
+                        CYTHON_UNUSED PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+#endif
+
+/* CallNextTpDealloc */
+static void __Pyx_call_next_tp_dealloc(PyObject* obj, destructor current_tp_dealloc) {
+    PyTypeObject* type = Py_TYPE(obj);
+    while (type && type->tp_dealloc != current_tp_dealloc)
+        type = type->tp_base;
+    while (type && type->tp_dealloc == current_tp_dealloc)
+        type = type->tp_base;
+    if (type)
+        type->tp_dealloc(obj);
+}
+
+/* CallNextTpTraverse */
+static int __Pyx_call_next_tp_traverse(PyObject* obj, visitproc v, void *a, traverseproc current_tp_traverse) {
+    PyTypeObject* type = Py_TYPE(obj);
+    while (type && type->tp_traverse != current_tp_traverse)
+        type = type->tp_base;
+    while (type && type->tp_traverse == current_tp_traverse)
+        type = type->tp_base;
+    if (type && type->tp_traverse)
+        return type->tp_traverse(obj, v, a);
+    return 0;
+}
+
+/* CallNextTpClear */
+static void __Pyx_call_next_tp_clear(PyObject* obj, inquiry current_tp_clear) {
+    PyTypeObject* type = Py_TYPE(obj);
+    while (type && type->tp_clear != current_tp_clear)
+        type = type->tp_base;
+    while (type && type->tp_clear == current_tp_clear)
+        type = type->tp_base;
+    if (type && type->tp_clear)
+        type->tp_clear(obj);
+}
+
+/* TypeImport */
+#ifndef __PYX_HAVE_RT_ImportType_0_29_37
+#define __PYX_HAVE_RT_ImportType_0_29_37
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size)
+{
+    PyObject *result = 0;
+    char warning[200];
+    Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
+#ifdef Py_LIMITED_API
+    PyObject *py_basicsize;
+    PyObject *py_itemsize;
+#endif
+    result = PyObject_GetAttrString(module, class_name);
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s.%.200s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+#ifndef Py_LIMITED_API
+    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
+#else
+    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
+    if (!py_basicsize)
+        goto bad;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = 0;
+    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+#endif
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    if (check_size == __Pyx_ImportType_CheckSize_Error_0_29_37 && (size_t)basicsize != size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn_0_29_37 && (size_t)basicsize > size) {
+        PyOS_snprintf(warning, sizeof(warning),
+            "%s.%s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(result);
+    return NULL;
+}
+#endif
+
+/* GetVTable */
+static void* __Pyx_GetVtable(PyObject *dict) {
+    void* ptr;
+    PyObject *ob = PyObject_GetItem(dict, __pyx_n_s_pyx_vtable);
+    if (!ob)
+        goto bad;
+#if PY_VERSION_HEX >= 0x02070000
+    ptr = PyCapsule_GetPointer(ob, 0);
+#else
+    ptr = PyCObject_AsVoidPtr(ob);
+#endif
+    if (!ptr && !PyErr_Occurred())
+        PyErr_SetString(PyExc_RuntimeError, "invalid vtable found for imported type");
+    Py_DECREF(ob);
+    return ptr;
+bad:
+    Py_XDECREF(ob);
+    return NULL;
+}
+
+/* PyObject_GenericGetAttrNoDict */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, attr_name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(attr_name));
+#endif
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name) {
+    PyObject *descr;
+    PyTypeObject *tp = Py_TYPE(obj);
+    if (unlikely(!PyString_Check(attr_name))) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    assert(!tp->tp_dictoffset);
+    descr = _PyType_Lookup(tp, attr_name);
+    if (unlikely(!descr)) {
+        return __Pyx_RaiseGenericGetAttributeError(tp, attr_name);
+    }
+    Py_INCREF(descr);
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_HAVE_CLASS)))
+    #endif
+    {
+        descrgetfunc f = Py_TYPE(descr)->tp_descr_get;
+        if (unlikely(f)) {
+            PyObject *res = f(descr, obj, (PyObject *)tp);
+            Py_DECREF(descr);
+            return res;
+        }
+    }
+    return descr;
+}
+#endif
+
+/* PyObject_GenericGetAttr */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
+    if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    return __Pyx_PyObject_GenericGetAttrNoDict(obj, attr_name);
+}
+#endif
+
+/* SetVTable */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
+#if PY_VERSION_HEX >= 0x02070000
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+#else
+    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
+#endif
+    if (!ob)
+        goto bad;
+    if (PyDict_SetItem(dict, __pyx_n_s_pyx_vtable, ob) < 0)
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
+/* FetchCommonType */
+static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type) {
+    PyObject* fake_module;
+    PyTypeObject* cached_type = NULL;
+    fake_module = PyImport_AddModule((char*) "_cython_" CYTHON_ABI);
+    if (!fake_module) return NULL;
+    Py_INCREF(fake_module);
+    cached_type = (PyTypeObject*) PyObject_GetAttrString(fake_module, type->tp_name);
+    if (cached_type) {
+        if (!PyType_Check((PyObject*)cached_type)) {
+            PyErr_Format(PyExc_TypeError,
+                "Shared Cython type %.200s is not a type object",
+                type->tp_name);
+            goto bad;
+        }
+        if (cached_type->tp_basicsize != type->tp_basicsize) {
+            PyErr_Format(PyExc_TypeError,
+                "Shared Cython type %.200s has the wrong size, try recompiling",
+                type->tp_name);
+            goto bad;
+        }
+    } else {
+        if (!PyErr_ExceptionMatches(PyExc_AttributeError)) goto bad;
+        PyErr_Clear();
+        if (PyType_Ready(type) < 0) goto bad;
+        if (PyObject_SetAttrString(fake_module, type->tp_name, (PyObject*) type) < 0)
+            goto bad;
+        Py_INCREF(type);
+        cached_type = type;
+    }
+done:
+    Py_DECREF(fake_module);
+    return cached_type;
+bad:
+    Py_XDECREF(cached_type);
+    cached_type = NULL;
+    goto done;
+}
+
+/* CythonFunctionShared */
+#include <structmember.h>
+static PyObject *
+__Pyx_CyFunction_get_doc(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *closure)
+{
+    if (unlikely(op->func_doc == NULL)) {
+        if (op->func.m_ml->ml_doc) {
+#if PY_MAJOR_VERSION >= 3
+            op->func_doc = PyUnicode_FromString(op->func.m_ml->ml_doc);
+#else
+            op->func_doc = PyString_FromString(op->func.m_ml->ml_doc);
+#endif
+            if (unlikely(op->func_doc == NULL))
+                return NULL;
+        } else {
+            Py_INCREF(Py_None);
+            return Py_None;
+        }
+    }
+    Py_INCREF(op->func_doc);
+    return op->func_doc;
+}
+static int
+__Pyx_CyFunction_set_doc(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp = op->func_doc;
+    if (value == NULL) {
+        value = Py_None;
+    }
+    Py_INCREF(value);
+    op->func_doc = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_name(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    if (unlikely(op->func_name == NULL)) {
+#if PY_MAJOR_VERSION >= 3
+        op->func_name = PyUnicode_InternFromString(op->func.m_ml->ml_name);
+#else
+        op->func_name = PyString_InternFromString(op->func.m_ml->ml_name);
+#endif
+        if (unlikely(op->func_name == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_name);
+    return op->func_name;
+}
+static int
+__Pyx_CyFunction_set_name(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp;
+#if PY_MAJOR_VERSION >= 3
+    if (unlikely(value == NULL || !PyUnicode_Check(value)))
+#else
+    if (unlikely(value == NULL || !PyString_Check(value)))
+#endif
+    {
+        PyErr_SetString(PyExc_TypeError,
+                        "__name__ must be set to a string object");
+        return -1;
+    }
+    tmp = op->func_name;
+    Py_INCREF(value);
+    op->func_name = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_qualname(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    Py_INCREF(op->func_qualname);
+    return op->func_qualname;
+}
+static int
+__Pyx_CyFunction_set_qualname(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp;
+#if PY_MAJOR_VERSION >= 3
+    if (unlikely(value == NULL || !PyUnicode_Check(value)))
+#else
+    if (unlikely(value == NULL || !PyString_Check(value)))
+#endif
+    {
+        PyErr_SetString(PyExc_TypeError,
+                        "__qualname__ must be set to a string object");
+        return -1;
+    }
+    tmp = op->func_qualname;
+    Py_INCREF(value);
+    op->func_qualname = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_self(__pyx_CyFunctionObject *m, CYTHON_UNUSED void *closure)
+{
+    PyObject *self;
+    self = m->func_closure;
+    if (self == NULL)
+        self = Py_None;
+    Py_INCREF(self);
+    return self;
+}
+static PyObject *
+__Pyx_CyFunction_get_dict(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    if (unlikely(op->func_dict == NULL)) {
+        op->func_dict = PyDict_New();
+        if (unlikely(op->func_dict == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_dict);
+    return op->func_dict;
+}
+static int
+__Pyx_CyFunction_set_dict(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp;
+    if (unlikely(value == NULL)) {
+        PyErr_SetString(PyExc_TypeError,
+               "function's dictionary may not be deleted");
+        return -1;
+    }
+    if (unlikely(!PyDict_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+               "setting function's dictionary to a non-dict");
+        return -1;
+    }
+    tmp = op->func_dict;
+    Py_INCREF(value);
+    op->func_dict = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_globals(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    Py_INCREF(op->func_globals);
+    return op->func_globals;
+}
+static PyObject *
+__Pyx_CyFunction_get_closure(CYTHON_UNUSED __pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+static PyObject *
+__Pyx_CyFunction_get_code(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    PyObject* result = (op->func_code) ? op->func_code : Py_None;
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_init_defaults(__pyx_CyFunctionObject *op) {
+    int result = 0;
+    PyObject *res = op->defaults_getter((PyObject *) op);
+    if (unlikely(!res))
+        return -1;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    op->defaults_tuple = PyTuple_GET_ITEM(res, 0);
+    Py_INCREF(op->defaults_tuple);
+    op->defaults_kwdict = PyTuple_GET_ITEM(res, 1);
+    Py_INCREF(op->defaults_kwdict);
+    #else
+    op->defaults_tuple = PySequence_ITEM(res, 0);
+    if (unlikely(!op->defaults_tuple)) result = -1;
+    else {
+        op->defaults_kwdict = PySequence_ITEM(res, 1);
+        if (unlikely(!op->defaults_kwdict)) result = -1;
+    }
+    #endif
+    Py_DECREF(res);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_defaults(__pyx_CyFunctionObject *op, PyObject* value, CYTHON_UNUSED void *context) {
+    PyObject* tmp;
+    if (!value) {
+        value = Py_None;
+    } else if (value != Py_None && !PyTuple_Check(value)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__defaults__ must be set to a tuple object");
+        return -1;
+    }
+    Py_INCREF(value);
+    tmp = op->defaults_tuple;
+    op->defaults_tuple = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_defaults(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context) {
+    PyObject* result = op->defaults_tuple;
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (__Pyx_CyFunction_init_defaults(op) < 0) return NULL;
+            result = op->defaults_tuple;
+        } else {
+            result = Py_None;
+        }
+    }
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_kwdefaults(__pyx_CyFunctionObject *op, PyObject* value, CYTHON_UNUSED void *context) {
+    PyObject* tmp;
+    if (!value) {
+        value = Py_None;
+    } else if (value != Py_None && !PyDict_Check(value)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__kwdefaults__ must be set to a dict object");
+        return -1;
+    }
+    Py_INCREF(value);
+    tmp = op->defaults_kwdict;
+    op->defaults_kwdict = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_kwdefaults(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context) {
+    PyObject* result = op->defaults_kwdict;
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (__Pyx_CyFunction_init_defaults(op) < 0) return NULL;
+            result = op->defaults_kwdict;
+        } else {
+            result = Py_None;
+        }
+    }
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_annotations(__pyx_CyFunctionObject *op, PyObject* value, CYTHON_UNUSED void *context) {
+    PyObject* tmp;
+    if (!value || value == Py_None) {
+        value = NULL;
+    } else if (!PyDict_Check(value)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__annotations__ must be set to a dict object");
+        return -1;
+    }
+    Py_XINCREF(value);
+    tmp = op->func_annotations;
+    op->func_annotations = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_annotations(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context) {
+    PyObject* result = op->func_annotations;
+    if (unlikely(!result)) {
+        result = PyDict_New();
+        if (unlikely(!result)) return NULL;
+        op->func_annotations = result;
+    }
+    Py_INCREF(result);
+    return result;
+}
+static PyGetSetDef __pyx_CyFunction_getsets[] = {
+    {(char *) "func_doc", (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {(char *) "__doc__",  (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {(char *) "func_name", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {(char *) "__name__", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {(char *) "__qualname__", (getter)__Pyx_CyFunction_get_qualname, (setter)__Pyx_CyFunction_set_qualname, 0, 0},
+    {(char *) "__self__", (getter)__Pyx_CyFunction_get_self, 0, 0, 0},
+    {(char *) "func_dict", (getter)__Pyx_CyFunction_get_dict, (setter)__Pyx_CyFunction_set_dict, 0, 0},
+    {(char *) "__dict__", (getter)__Pyx_CyFunction_get_dict, (setter)__Pyx_CyFunction_set_dict, 0, 0},
+    {(char *) "func_globals", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {(char *) "__globals__", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {(char *) "func_closure", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {(char *) "__closure__", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {(char *) "func_code", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {(char *) "__code__", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {(char *) "func_defaults", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {(char *) "__defaults__", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {(char *) "__kwdefaults__", (getter)__Pyx_CyFunction_get_kwdefaults, (setter)__Pyx_CyFunction_set_kwdefaults, 0, 0},
+    {(char *) "__annotations__", (getter)__Pyx_CyFunction_get_annotations, (setter)__Pyx_CyFunction_set_annotations, 0, 0},
+    {0, 0, 0, 0, 0}
+};
+static PyMemberDef __pyx_CyFunction_members[] = {
+    {(char *) "__module__", T_OBJECT, offsetof(PyCFunctionObject, m_module), PY_WRITE_RESTRICTED, 0},
+    {0, 0, 0,  0, 0}
+};
+static PyObject *
+__Pyx_CyFunction_reduce(__pyx_CyFunctionObject *m, CYTHON_UNUSED PyObject *args)
+{
+#if PY_MAJOR_VERSION >= 3
+    Py_INCREF(m->func_qualname);
+    return m->func_qualname;
+#else
+    return PyString_FromString(m->func.m_ml->ml_name);
+#endif
+}
+static PyMethodDef __pyx_CyFunction_methods[] = {
+    {"__reduce__", (PyCFunction)__Pyx_CyFunction_reduce, METH_VARARGS, 0},
+    {0, 0, 0, 0}
+};
+#if PY_VERSION_HEX < 0x030500A0
+#define __Pyx_CyFunction_weakreflist(cyfunc) ((cyfunc)->func_weakreflist)
+#else
+#define __Pyx_CyFunction_weakreflist(cyfunc) ((cyfunc)->func.m_weakreflist)
+#endif
+static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject *op, PyMethodDef *ml, int flags, PyObject* qualname,
+                                       PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    if (unlikely(op == NULL))
+        return NULL;
+    op->flags = flags;
+    __Pyx_CyFunction_weakreflist(op) = NULL;
+    op->func.m_ml = ml;
+    op->func.m_self = (PyObject *) op;
+    Py_XINCREF(closure);
+    op->func_closure = closure;
+    Py_XINCREF(module);
+    op->func.m_module = module;
+    op->func_dict = NULL;
+    op->func_name = NULL;
+    Py_INCREF(qualname);
+    op->func_qualname = qualname;
+    op->func_doc = NULL;
+    op->func_classobj = NULL;
+    op->func_globals = globals;
+    Py_INCREF(op->func_globals);
+    Py_XINCREF(code);
+    op->func_code = code;
+    op->defaults_pyobjects = 0;
+    op->defaults_size = 0;
+    op->defaults = NULL;
+    op->defaults_tuple = NULL;
+    op->defaults_kwdict = NULL;
+    op->defaults_getter = NULL;
+    op->func_annotations = NULL;
+    return (PyObject *) op;
+}
+static int
+__Pyx_CyFunction_clear(__pyx_CyFunctionObject *m)
+{
+    Py_CLEAR(m->func_closure);
+    Py_CLEAR(m->func.m_module);
+    Py_CLEAR(m->func_dict);
+    Py_CLEAR(m->func_name);
+    Py_CLEAR(m->func_qualname);
+    Py_CLEAR(m->func_doc);
+    Py_CLEAR(m->func_globals);
+    Py_CLEAR(m->func_code);
+    Py_CLEAR(m->func_classobj);
+    Py_CLEAR(m->defaults_tuple);
+    Py_CLEAR(m->defaults_kwdict);
+    Py_CLEAR(m->func_annotations);
+    if (m->defaults) {
+        PyObject **pydefaults = __Pyx_CyFunction_Defaults(PyObject *, m);
+        int i;
+        for (i = 0; i < m->defaults_pyobjects; i++)
+            Py_XDECREF(pydefaults[i]);
+        PyObject_Free(m->defaults);
+        m->defaults = NULL;
+    }
+    return 0;
+}
+static void __Pyx__CyFunction_dealloc(__pyx_CyFunctionObject *m)
+{
+    if (__Pyx_CyFunction_weakreflist(m) != NULL)
+        PyObject_ClearWeakRefs((PyObject *) m);
+    __Pyx_CyFunction_clear(m);
+    PyObject_GC_Del(m);
+}
+static void __Pyx_CyFunction_dealloc(__pyx_CyFunctionObject *m)
+{
+    PyObject_GC_UnTrack(m);
+    __Pyx__CyFunction_dealloc(m);
+}
+static int __Pyx_CyFunction_traverse(__pyx_CyFunctionObject *m, visitproc visit, void *arg)
+{
+    Py_VISIT(m->func_closure);
+    Py_VISIT(m->func.m_module);
+    Py_VISIT(m->func_dict);
+    Py_VISIT(m->func_name);
+    Py_VISIT(m->func_qualname);
+    Py_VISIT(m->func_doc);
+    Py_VISIT(m->func_globals);
+    Py_VISIT(m->func_code);
+    Py_VISIT(m->func_classobj);
+    Py_VISIT(m->defaults_tuple);
+    Py_VISIT(m->defaults_kwdict);
+    if (m->defaults) {
+        PyObject **pydefaults = __Pyx_CyFunction_Defaults(PyObject *, m);
+        int i;
+        for (i = 0; i < m->defaults_pyobjects; i++)
+            Py_VISIT(pydefaults[i]);
+    }
+    return 0;
+}
+static PyObject *__Pyx_CyFunction_descr_get(PyObject *func, PyObject *obj, PyObject *type)
+{
+#if PY_MAJOR_VERSION < 3
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    if (m->flags & __Pyx_CYFUNCTION_STATICMETHOD) {
+        Py_INCREF(func);
+        return func;
+    }
+    if (m->flags & __Pyx_CYFUNCTION_CLASSMETHOD) {
+        if (type == NULL)
+            type = (PyObject *)(Py_TYPE(obj));
+        return __Pyx_PyMethod_New(func, type, (PyObject *)(Py_TYPE(type)));
+    }
+    if (obj == Py_None)
+        obj = NULL;
+#endif
+    return __Pyx_PyMethod_New(func, obj, type);
+}
+static PyObject*
+__Pyx_CyFunction_repr(__pyx_CyFunctionObject *op)
+{
+#if PY_MAJOR_VERSION >= 3
+    return PyUnicode_FromFormat("<cyfunction %U at %p>",
+                                op->func_qualname, (void *)op);
+#else
+    return PyString_FromFormat("<cyfunction %s at %p>",
+                               PyString_AsString(op->func_qualname), (void *)op);
+#endif
+}
+static PyObject * __Pyx_CyFunction_CallMethod(PyObject *func, PyObject *self, PyObject *arg, PyObject *kw) {
+    PyCFunctionObject* f = (PyCFunctionObject*)func;
+    PyCFunction meth = f->m_ml->ml_meth;
+    Py_ssize_t size;
+    switch (f->m_ml->ml_flags & (METH_VARARGS | METH_KEYWORDS | METH_NOARGS | METH_O)) {
+    case METH_VARARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0))
+            return (*meth)(self, arg);
+        break;
+    case METH_VARARGS | METH_KEYWORDS:
+        return (*(PyCFunctionWithKeywords)(void*)meth)(self, arg, kw);
+    case METH_NOARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+            size = PyTuple_GET_SIZE(arg);
+            if (likely(size == 0))
+                return (*meth)(self, NULL);
+            PyErr_Format(PyExc_TypeError,
+                "%.200s() takes no arguments (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                f->m_ml->ml_name, size);
+            return NULL;
+        }
+        break;
+    case METH_O:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+            size = PyTuple_GET_SIZE(arg);
+            if (likely(size == 1)) {
+                PyObject *result, *arg0;
+                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                arg0 = PyTuple_GET_ITEM(arg, 0);
+                #else
+                arg0 = PySequence_ITEM(arg, 0); if (unlikely(!arg0)) return NULL;
+                #endif
+                result = (*meth)(self, arg0);
+                #if !(CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS)
+                Py_DECREF(arg0);
+                #endif
+                return result;
+            }
+            PyErr_Format(PyExc_TypeError,
+                "%.200s() takes exactly one argument (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                f->m_ml->ml_name, size);
+            return NULL;
+        }
+        break;
+    default:
+        PyErr_SetString(PyExc_SystemError, "Bad call flags in "
+                        "__Pyx_CyFunction_Call. METH_OLDARGS is no "
+                        "longer supported!");
+        return NULL;
+    }
+    PyErr_Format(PyExc_TypeError, "%.200s() takes no keyword arguments",
+                 f->m_ml->ml_name);
+    return NULL;
+}
+static CYTHON_INLINE PyObject *__Pyx_CyFunction_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    return __Pyx_CyFunction_CallMethod(func, ((PyCFunctionObject*)func)->m_self, arg, kw);
+}
+static PyObject *__Pyx_CyFunction_CallAsMethod(PyObject *func, PyObject *args, PyObject *kw) {
+    PyObject *result;
+    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *) func;
+    if ((cyfunc->flags & __Pyx_CYFUNCTION_CCLASS) && !(cyfunc->flags & __Pyx_CYFUNCTION_STATICMETHOD)) {
+        Py_ssize_t argc;
+        PyObject *new_args;
+        PyObject *self;
+        argc = PyTuple_GET_SIZE(args);
+        new_args = PyTuple_GetSlice(args, 1, argc);
+        if (unlikely(!new_args))
+            return NULL;
+        self = PyTuple_GetItem(args, 0);
+        if (unlikely(!self)) {
+            Py_DECREF(new_args);
+#if PY_MAJOR_VERSION > 2
+            PyErr_Format(PyExc_TypeError,
+                         "unbound method %.200S() needs an argument",
+                         cyfunc->func_qualname);
+#else
+            PyErr_SetString(PyExc_TypeError,
+                            "unbound method needs an argument");
+#endif
+            return NULL;
+        }
+        result = __Pyx_CyFunction_CallMethod(func, self, new_args, kw);
+        Py_DECREF(new_args);
+    } else {
+        result = __Pyx_CyFunction_Call(func, args, kw);
+    }
+    return result;
+}
+static PyTypeObject __pyx_CyFunctionType_type = {
+    PyVarObject_HEAD_INIT(0, 0)
+    "cython_function_or_method",
+    sizeof(__pyx_CyFunctionObject),
+    0,
+    (destructor) __Pyx_CyFunction_dealloc,
+    0,
+    0,
+    0,
+#if PY_MAJOR_VERSION < 3
+    0,
+#else
+    0,
+#endif
+    (reprfunc) __Pyx_CyFunction_repr,
+    0,
+    0,
+    0,
+    0,
+    __Pyx_CyFunction_CallAsMethod,
+    0,
+    0,
+    0,
+    0,
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,
+    0,
+    (traverseproc) __Pyx_CyFunction_traverse,
+    (inquiry) __Pyx_CyFunction_clear,
+    0,
+#if PY_VERSION_HEX < 0x030500A0
+    offsetof(__pyx_CyFunctionObject, func_weakreflist),
+#else
+    offsetof(PyCFunctionObject, m_weakreflist),
+#endif
+    0,
+    0,
+    __pyx_CyFunction_methods,
+    __pyx_CyFunction_members,
+    __pyx_CyFunction_getsets,
+    0,
+    0,
+    __Pyx_CyFunction_descr_get,
+    0,
+    offsetof(__pyx_CyFunctionObject, func_dict),
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+#if PY_VERSION_HEX >= 0x030400a1
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030C0000
+    0,
+#endif
+#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+    0,
+#endif
+};
+static int __pyx_CyFunction_init(void) {
+    __pyx_CyFunctionType = __Pyx_FetchCommonType(&__pyx_CyFunctionType_type);
+    if (unlikely(__pyx_CyFunctionType == NULL)) {
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_INLINE void *__Pyx_CyFunction_InitDefaults(PyObject *func, size_t size, int pyobjects) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults = PyObject_Malloc(size);
+    if (unlikely(!m->defaults))
+        return PyErr_NoMemory();
+    memset(m->defaults, 0, size);
+    m->defaults_pyobjects = pyobjects;
+    m->defaults_size = size;
+    return m->defaults;
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *func, PyObject *tuple) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults_tuple = tuple;
+    Py_INCREF(tuple);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults_kwdict = dict;
+    Py_INCREF(dict);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->func_annotations = dict;
+    Py_INCREF(dict);
+}
+
+/* CythonFunction */
+static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml, int flags, PyObject* qualname,
+                                      PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    PyObject *op = __Pyx_CyFunction_Init(
+        PyObject_GC_New(__pyx_CyFunctionObject, __pyx_CyFunctionType),
+        ml, flags, qualname, closure, module, globals, code
+    );
+    if (likely(op)) {
+        PyObject_GC_Track(op);
+    }
+    return op;
+}
+
+/* CLineInTraceback */
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
+    }
+    if (!use_cline) {
+        c_line = 0;
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+    }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
+    }
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
+    }
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
+}
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
+    py_srcfile = PyString_FromString(filename);
+    if (!py_srcfile) goto bad;
+    #endif
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        if (!py_funcname) goto bad;
+        #endif
+    }
+    #if PY_MAJOR_VERSION < 3
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+
+/* Declarations */
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
+      return ::std::complex< float >(x, y);
+    }
+  #else
+    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
+      return x + y*(__pyx_t_float_complex)_Complex_I;
+    }
+  #endif
+#else
+    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
+      __pyx_t_float_complex z;
+      z.real = x;
+      z.imag = y;
+      return z;
+    }
+#endif
+
+/* Arithmetic */
+#if CYTHON_CCOMPLEX
+#else
+    static CYTHON_INLINE int __Pyx_c_eq_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+       return (a.real == b.real) && (a.imag == b.imag);
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_sum_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        __pyx_t_float_complex z;
+        z.real = a.real + b.real;
+        z.imag = a.imag + b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_diff_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        __pyx_t_float_complex z;
+        z.real = a.real - b.real;
+        z.imag = a.imag - b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_prod_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        __pyx_t_float_complex z;
+        z.real = a.real * b.real - a.imag * b.imag;
+        z.imag = a.real * b.imag + a.imag * b.real;
+        return z;
+    }
+    #if 1
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_quot_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        if (b.imag == 0) {
+            return __pyx_t_float_complex_from_parts(a.real / b.real, a.imag / b.real);
+        } else if (fabsf(b.real) >= fabsf(b.imag)) {
+            if (b.real == 0 && b.imag == 0) {
+                return __pyx_t_float_complex_from_parts(a.real / b.real, a.imag / b.imag);
+            } else {
+                float r = b.imag / b.real;
+                float s = (float)(1.0) / (b.real + b.imag * r);
+                return __pyx_t_float_complex_from_parts(
+                    (a.real + a.imag * r) * s, (a.imag - a.real * r) * s);
+            }
+        } else {
+            float r = b.real / b.imag;
+            float s = (float)(1.0) / (b.imag + b.real * r);
+            return __pyx_t_float_complex_from_parts(
+                (a.real * r + a.imag) * s, (a.imag * r - a.real) * s);
+        }
+    }
+    #else
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_quot_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        if (b.imag == 0) {
+            return __pyx_t_float_complex_from_parts(a.real / b.real, a.imag / b.real);
+        } else {
+            float denom = b.real * b.real + b.imag * b.imag;
+            return __pyx_t_float_complex_from_parts(
+                (a.real * b.real + a.imag * b.imag) / denom,
+                (a.imag * b.real - a.real * b.imag) / denom);
+        }
+    }
+    #endif
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_neg_float(__pyx_t_float_complex a) {
+        __pyx_t_float_complex z;
+        z.real = -a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    static CYTHON_INLINE int __Pyx_c_is_zero_float(__pyx_t_float_complex a) {
+       return (a.real == 0) && (a.imag == 0);
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_conj_float(__pyx_t_float_complex a) {
+        __pyx_t_float_complex z;
+        z.real =  a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    #if 1
+        static CYTHON_INLINE float __Pyx_c_abs_float(__pyx_t_float_complex z) {
+          #if !defined(HAVE_HYPOT) || defined(_MSC_VER)
+            return sqrtf(z.real*z.real + z.imag*z.imag);
+          #else
+            return hypotf(z.real, z.imag);
+          #endif
+        }
+        static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_pow_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+            __pyx_t_float_complex z;
+            float r, lnr, theta, z_r, z_theta;
+            if (b.imag == 0 && b.real == (int)b.real) {
+                if (b.real < 0) {
+                    float denom = a.real * a.real + a.imag * a.imag;
+                    a.real = a.real / denom;
+                    a.imag = -a.imag / denom;
+                    b.real = -b.real;
+                }
+                switch ((int)b.real) {
+                    case 0:
+                        z.real = 1;
+                        z.imag = 0;
+                        return z;
+                    case 1:
+                        return a;
+                    case 2:
+                        return __Pyx_c_prod_float(a, a);
+                    case 3:
+                        z = __Pyx_c_prod_float(a, a);
+                        return __Pyx_c_prod_float(z, a);
+                    case 4:
+                        z = __Pyx_c_prod_float(a, a);
+                        return __Pyx_c_prod_float(z, z);
+                }
+            }
+            if (a.imag == 0) {
+                if (a.real == 0) {
+                    return a;
+                } else if ((b.imag == 0) && (a.real >= 0)) {
+                    z.real = powf(a.real, b.real);
+                    z.imag = 0;
+                    return z;
+                } else if (a.real > 0) {
+                    r = a.real;
+                    theta = 0;
+                } else {
+                    r = -a.real;
+                    theta = atan2f(0.0, -1.0);
+                }
+            } else {
+                r = __Pyx_c_abs_float(a);
+                theta = atan2f(a.imag, a.real);
+            }
+            lnr = logf(r);
+            z_r = expf(lnr * b.real - theta * b.imag);
+            z_theta = theta * b.real + lnr * b.imag;
+            z.real = z_r * cosf(z_theta);
+            z.imag = z_r * sinf(z_theta);
+            return z;
+        }
+    #endif
+#endif
+
+/* Declarations */
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
+      return ::std::complex< double >(x, y);
+    }
+  #else
+    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
+      return x + y*(__pyx_t_double_complex)_Complex_I;
+    }
+  #endif
+#else
+    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
+      __pyx_t_double_complex z;
+      z.real = x;
+      z.imag = y;
+      return z;
+    }
+#endif
+
+/* Arithmetic */
+#if CYTHON_CCOMPLEX
+#else
+    static CYTHON_INLINE int __Pyx_c_eq_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+       return (a.real == b.real) && (a.imag == b.imag);
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_sum_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        __pyx_t_double_complex z;
+        z.real = a.real + b.real;
+        z.imag = a.imag + b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_diff_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        __pyx_t_double_complex z;
+        z.real = a.real - b.real;
+        z.imag = a.imag - b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_prod_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        __pyx_t_double_complex z;
+        z.real = a.real * b.real - a.imag * b.imag;
+        z.imag = a.real * b.imag + a.imag * b.real;
+        return z;
+    }
+    #if 1
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_quot_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        if (b.imag == 0) {
+            return __pyx_t_double_complex_from_parts(a.real / b.real, a.imag / b.real);
+        } else if (fabs(b.real) >= fabs(b.imag)) {
+            if (b.real == 0 && b.imag == 0) {
+                return __pyx_t_double_complex_from_parts(a.real / b.real, a.imag / b.imag);
+            } else {
+                double r = b.imag / b.real;
+                double s = (double)(1.0) / (b.real + b.imag * r);
+                return __pyx_t_double_complex_from_parts(
+                    (a.real + a.imag * r) * s, (a.imag - a.real * r) * s);
+            }
+        } else {
+            double r = b.real / b.imag;
+            double s = (double)(1.0) / (b.imag + b.real * r);
+            return __pyx_t_double_complex_from_parts(
+                (a.real * r + a.imag) * s, (a.imag * r - a.real) * s);
+        }
+    }
+    #else
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_quot_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        if (b.imag == 0) {
+            return __pyx_t_double_complex_from_parts(a.real / b.real, a.imag / b.real);
+        } else {
+            double denom = b.real * b.real + b.imag * b.imag;
+            return __pyx_t_double_complex_from_parts(
+                (a.real * b.real + a.imag * b.imag) / denom,
+                (a.imag * b.real - a.real * b.imag) / denom);
+        }
+    }
+    #endif
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_neg_double(__pyx_t_double_complex a) {
+        __pyx_t_double_complex z;
+        z.real = -a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    static CYTHON_INLINE int __Pyx_c_is_zero_double(__pyx_t_double_complex a) {
+       return (a.real == 0) && (a.imag == 0);
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_conj_double(__pyx_t_double_complex a) {
+        __pyx_t_double_complex z;
+        z.real =  a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    #if 1
+        static CYTHON_INLINE double __Pyx_c_abs_double(__pyx_t_double_complex z) {
+          #if !defined(HAVE_HYPOT) || defined(_MSC_VER)
+            return sqrt(z.real*z.real + z.imag*z.imag);
+          #else
+            return hypot(z.real, z.imag);
+          #endif
+        }
+        static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_pow_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+            __pyx_t_double_complex z;
+            double r, lnr, theta, z_r, z_theta;
+            if (b.imag == 0 && b.real == (int)b.real) {
+                if (b.real < 0) {
+                    double denom = a.real * a.real + a.imag * a.imag;
+                    a.real = a.real / denom;
+                    a.imag = -a.imag / denom;
+                    b.real = -b.real;
+                }
+                switch ((int)b.real) {
+                    case 0:
+                        z.real = 1;
+                        z.imag = 0;
+                        return z;
+                    case 1:
+                        return a;
+                    case 2:
+                        return __Pyx_c_prod_double(a, a);
+                    case 3:
+                        z = __Pyx_c_prod_double(a, a);
+                        return __Pyx_c_prod_double(z, a);
+                    case 4:
+                        z = __Pyx_c_prod_double(a, a);
+                        return __Pyx_c_prod_double(z, z);
+                }
+            }
+            if (a.imag == 0) {
+                if (a.real == 0) {
+                    return a;
+                } else if ((b.imag == 0) && (a.real >= 0)) {
+                    z.real = pow(a.real, b.real);
+                    z.imag = 0;
+                    return z;
+                } else if (a.real > 0) {
+                    r = a.real;
+                    theta = 0;
+                } else {
+                    r = -a.real;
+                    theta = atan2(0.0, -1.0);
+                }
+            } else {
+                r = __Pyx_c_abs_double(a);
+                theta = atan2(a.imag, a.real);
+            }
+            lnr = log(r);
+            z_r = exp(lnr * b.real - theta * b.imag);
+            z_theta = theta * b.real + lnr * b.imag;
+            z.real = z_r * cos(z_theta);
+            z.imag = z_r * sin(z_theta);
+            return z;
+        }
+    #endif
+#endif
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            long val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (long) -1;
+        }
+    } else {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = a->tp_base;
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
+        }
+    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
+}
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    int res = exc_type1 ? __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type1) : 0;
+    if (!res) {
+        res = __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+    return res;
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
+        char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
+        PyOS_snprintf(message, sizeof(message),
+                      "compiletime version %s of module '%.100s' "
+                      "does not match runtime version %s",
+                      ctversion, __Pyx_MODULE_NAME, rtversion);
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+    return 0;
+}
+
+/* VoidPtrImport */
+#ifndef __PYX_HAVE_RT_ImportVoidPtr_0_29_37
+#define __PYX_HAVE_RT_ImportVoidPtr_0_29_37
+static int __Pyx_ImportVoidPtr_0_29_37(PyObject *module, const char *name, void **p, const char *sig) {
+    PyObject *d = 0;
+    PyObject *cobj = 0;
+    d = PyObject_GetAttrString(module, (char *)"__pyx_capi__");
+    if (!d)
+        goto bad;
+    cobj = PyDict_GetItemString(d, name);
+    if (!cobj) {
+        PyErr_Format(PyExc_ImportError,
+            "%.200s does not export expected C variable %.200s",
+                PyModule_GetName(module), name);
+        goto bad;
+    }
+#if PY_VERSION_HEX >= 0x02070000
+    if (!PyCapsule_IsValid(cobj, sig)) {
+        PyErr_Format(PyExc_TypeError,
+            "C variable %.200s.%.200s has wrong signature (expected %.500s, got %.500s)",
+             PyModule_GetName(module), name, sig, PyCapsule_GetName(cobj));
+        goto bad;
+    }
+    *p = PyCapsule_GetPointer(cobj, sig);
+#else
+    {const char *desc, *s1, *s2;
+    desc = (const char *)PyCObject_GetDesc(cobj);
+    if (!desc)
+        goto bad;
+    s1 = desc; s2 = sig;
+    while (*s1 != '\0' && *s1 == *s2) { s1++; s2++; }
+    if (*s1 != *s2) {
+        PyErr_Format(PyExc_TypeError,
+            "C variable %.200s.%.200s has wrong signature (expected %.500s, got %.500s)",
+             PyModule_GetName(module), name, sig, desc);
+        goto bad;
+    }
+    *p = PyCObject_AsVoidPtr(cobj);}
+#endif
+    if (!(*p))
+        goto bad;
+    Py_DECREF(d);
+    return 0;
+bad:
+    Py_XDECREF(d);
+    return -1;
+}
+#endif
+
+/* InitStrings */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+    while (t->p) {
+        #if PY_MAJOR_VERSION < 3
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        #else
+        if (t->is_unicode | t->is_str) {
+            if (t->intern) {
+                *t->p = PyUnicode_InternFromString(t->s);
+            } else if (t->encoding) {
+                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
+            } else {
+                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
+            }
+        } else {
+            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
+        }
+        #endif
+        if (!*t->p)
+            return -1;
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
+        ++t;
+    }
+    return 0;
+}
+
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
+            }
+        }
+    }
+#endif
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
+#else
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
+#endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    if (PyByteArray_Check(o)) {
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+    } else
+#endif
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type %.200s).  "
+                "The ability to return an instance of a strict subclass of int "
+                "is deprecated, and may be removed in a future version of Python.",
+                Py_TYPE(result)->tp_name)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type %.200s)",
+                 type_name, type_name, Py_TYPE(result)->tp_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
+#else
+  if (likely(PyLong_Check(x)))
+#endif
+    return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  #if PY_MAJOR_VERSION < 3
+  if (m && m->nb_int) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = m->nb_long(x);
+  }
+  #else
+  if (likely(m && m->nb_int)) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
+  }
+#endif
+  if (likely(res)) {
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
+#else
+    if (unlikely(!PyLong_CheckExact(res))) {
+#endif
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(b);
+  }
+#endif
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    const digit* digits = ((PyLongObject*)b)->ob_digit;
+    const Py_ssize_t size = Py_SIZE(b);
+    if (likely(__Pyx_sst_abs(size) <= 1)) {
+        ival = likely(size) ? digits[0] : 0;
+        if (size == -1) ival = -ival;
+        return ival;
+    } else {
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+    return PyInt_FromSize_t(ival);
+}
+
+
+#endif /* Py_PYTHON_H */
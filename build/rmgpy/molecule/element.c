@@ -0,0 +1,14532 @@
+/* Generated by Cython 0.29.37 */
+
+/* BEGIN: Cython Metadata
+{
+    "distutils": {
+        "include_dirs": [
+            "."
+        ],
+        "name": "rmgpy.molecule.element",
+        "sources": [
+            "rmgpy/molecule/element.py"
+        ]
+    },
+    "module_name": "rmgpy.molecule.element"
+}
+END: Cython Metadata */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.6+ or Python 3.3+.
+#else
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
+#define CYTHON_FUTURE_DIVISION 1
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #if PY_VERSION_HEX >= 0x02070000
+    #define HAVE_LONG_LONG
+  #endif
+#endif
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#ifdef PYPY_VERSION
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PYSTON_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #elif !defined(CYTHON_USE_PYTYPE_LOOKUP)
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
+  #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+#endif
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_MAYBE_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_MAYBE_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+           typedef unsigned char     uint8_t;
+           typedef unsigned int      uint32_t;
+        #else
+           typedef unsigned __int8   uint8_t;
+           typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
+#else
+   #include <stdint.h>
+#endif
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus) && __cplusplus >= 201103L
+    #if __has_cpp_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH [[fallthrough]]
+    #elif __has_cpp_attribute(clang::fallthrough)
+      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+    #elif __has_cpp_attribute(gnu::fallthrough)
+      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__ ) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyClass_Type
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+  #define __Pyx_DefaultClassType PyType_Type
+#endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+#endif
+#if CYTHON_FAST_PYCCALL
+#define __Pyx_PyFastCFunction_Check(func)\
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
+#else
+#define __Pyx_PyFastCFunction_Check(func) 0
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
+#if CYTHON_COMPILING_IN_PYSTON
+  #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if !CYTHON_FAST_THREAD_STATE || PY_VERSION_HEX < 0x02070000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0;
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStr(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+#else
+#define __Pyx_PyDict_GetItemStr(dict, name)  PyDict_GetItem(dict, name)
+#endif
+#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
+  #define CYTHON_PEP393_ENABLED 1
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+#else
+  #define CYTHON_PEP393_ENABLED 0
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
+  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
+  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyByteArray_Check)
+  #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
+  #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
+#else
+  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
+#endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyStringObject               PyUnicodeObject
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_Check               PyUnicode_Check
+  #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
+  #define PyObject_Unicode             PyObject_Str
+#endif
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
+  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
+#else
+  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
+  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
+#endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+#else
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyIntObject                  PyLongObject
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define PyNumber_Int                 PyNumber_Long
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBoolObject                 PyLongObject
+#endif
+#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
+  #ifndef PyUnicode_InternFromString
+    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+  #endif
+#endif
+#if PY_VERSION_HEX < 0x030200A4
+  typedef long Py_hash_t;
+  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
+#else
+  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
+#else
+  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
+#endif
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #else
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #endif
+#else
+  #define __Pyx_PyType_AsAsync(obj) NULL
+#endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
+#endif
+
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#ifdef NAN
+#define __PYX_NAN() ((float) NAN)
+#else
+static CYTHON_INLINE float __PYX_NAN() {
+  float value;
+  memset(&value, 0xFF, sizeof(value));
+  return value;
+}
+#endif
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifndef __PYX_EXTERN_C
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#define __PYX_HAVE__rmgpy__molecule__element
+#define __PYX_HAVE_API__rmgpy__molecule__element
+/* Early includes */
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
+                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
+
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#else
+    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
+#endif
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
+    const Py_UNICODE *u_end = u;
+    while (*u_end++) ;
+    return (size_t)(u_end - u - 1);
+}
+#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
+#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#else
+#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#endif
+#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#define __Pyx_PyNumber_Float(x) (PyFloat_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Float(x))
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+static int __Pyx_sys_getdefaultencoding_not_ascii;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    PyObject* ascii_chars_u = NULL;
+    PyObject* ascii_chars_b = NULL;
+    const char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    if (strcmp(default_encoding_c, "ascii") == 0) {
+        __Pyx_sys_getdefaultencoding_not_ascii = 0;
+    } else {
+        char ascii_chars[128];
+        int c;
+        for (c = 0; c < 128; c++) {
+            ascii_chars[c] = c;
+        }
+        __Pyx_sys_getdefaultencoding_not_ascii = 1;
+        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
+        if (!ascii_chars_u) goto bad;
+        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
+        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
+                default_encoding_c);
+            goto bad;
+        }
+        Py_DECREF(ascii_chars_u);
+        Py_DECREF(ascii_chars_b);
+    }
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    Py_XDECREF(ascii_chars_u);
+    Py_XDECREF(ascii_chars_b);
+    return -1;
+}
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#else
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+static char* __PYX_DEFAULT_STRING_ENCODING;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
+    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
+    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    return -1;
+}
+#endif
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+
+static PyObject *__pyx_m = NULL;
+static PyObject *__pyx_d;
+static PyObject *__pyx_b;
+static PyObject *__pyx_cython_runtime = NULL;
+static PyObject *__pyx_empty_tuple;
+static PyObject *__pyx_empty_bytes;
+static PyObject *__pyx_empty_unicode;
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm= __FILE__;
+static const char *__pyx_filename;
+
+
+static const char *__pyx_f[] = {
+  "rmgpy/molecule/element.py",
+  "rmgpy/molecule/element.pxd",
+};
+
+/*--- Type declarations ---*/
+struct __pyx_obj_5rmgpy_8molecule_7element_Element;
+struct __pyx_opt_args_5rmgpy_8molecule_7element_get_element;
+
+/* "rmgpy/molecule/element.pxd":38
+ *     cdef public str chemkin_name
+ * 
+ * cpdef Element get_element(value, int isotope=?)             # <<<<<<<<<<<<<<
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_7element_get_element {
+  int __pyx_n;
+  int isotope;
+};
+
+/* "rmgpy/molecule/element.pxd":28
+ * ###############################################################################
+ * 
+ * cdef class Element:             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public int number
+ */
+struct __pyx_obj_5rmgpy_8molecule_7element_Element {
+  PyObject_HEAD
+  int number;
+  PyObject *name;
+  PyObject *symbol;
+  float mass;
+  float cov_radius;
+  int isotope;
+  PyObject *chemkin_name;
+};
+
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, int);
+    void (*DECREF)(void*, PyObject*, int);
+    void (*GOTREF)(void*, PyObject*, int);
+    void (*GIVEREF)(void*, PyObject*, int);
+    void* (*SetupContext)(const char*, int, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+#ifdef WITH_THREAD
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+          }
+#else
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
+#endif
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* RaiseDoubleKeywords.proto */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
+
+/* ParseKeywords.proto */
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
+    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
+    const char* function_name);
+
+/* IncludeStringH.proto */
+#include <string.h>
+
+/* BytesEquals.proto */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals);
+
+/* UnicodeEquals.proto */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals);
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
+#endif
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* GetTopmostException.proto */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
+#endif
+
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* SaveResetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+#else
+#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
+#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
+#endif
+
+/* PyErrExceptionMatches.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* GetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* Import.proto */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
+
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* BuildPyUnicode.proto */
+static PyObject* __Pyx_PyUnicode_BuildFromAscii(Py_ssize_t ulength, char* chars, int clength,
+                                                int prepend_sign, char padding_char);
+
+/* CIntToPyUnicode.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_From_int(int value, Py_ssize_t width, char padding_char, char format_char);
+
+/* PyUnicode_Unicode.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_Unicode(PyObject *obj);
+
+/* PyObjectFormatAndDecref.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FormatSimpleAndDecref(PyObject* s, PyObject* f);
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FormatAndDecref(PyObject* s, PyObject* f);
+
+/* JoinPyUnicode.proto */
+static PyObject* __Pyx_PyUnicode_Join(PyObject* value_tuple, Py_ssize_t value_count, Py_ssize_t result_ulength,
+                                      Py_UCS4 max_char);
+
+/* ExtTypeTest.proto */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* PyObject_GenericGetAttrNoDict.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttrNoDict PyObject_GenericGetAttr
+#endif
+
+/* PyObject_GenericGetAttr.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttr PyObject_GenericGetAttr
+#endif
+
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+
+/* PyObjectCallNoArg.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+#else
+#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
+#endif
+
+/* FetchCommonType.proto */
+static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type);
+
+/* CythonFunctionShared.proto */
+#define __Pyx_CyFunction_USED 1
+#define __Pyx_CYFUNCTION_STATICMETHOD  0x01
+#define __Pyx_CYFUNCTION_CLASSMETHOD   0x02
+#define __Pyx_CYFUNCTION_CCLASS        0x04
+#define __Pyx_CyFunction_GetClosure(f)\
+    (((__pyx_CyFunctionObject *) (f))->func_closure)
+#define __Pyx_CyFunction_GetClassObj(f)\
+    (((__pyx_CyFunctionObject *) (f))->func_classobj)
+#define __Pyx_CyFunction_Defaults(type, f)\
+    ((type *)(((__pyx_CyFunctionObject *) (f))->defaults))
+#define __Pyx_CyFunction_SetDefaultsGetter(f, g)\
+    ((__pyx_CyFunctionObject *) (f))->defaults_getter = (g)
+typedef struct {
+    PyCFunctionObject func;
+#if PY_VERSION_HEX < 0x030500A0
+    PyObject *func_weakreflist;
+#endif
+    PyObject *func_dict;
+    PyObject *func_name;
+    PyObject *func_qualname;
+    PyObject *func_doc;
+    PyObject *func_globals;
+    PyObject *func_code;
+    PyObject *func_closure;
+    PyObject *func_classobj;
+    void *defaults;
+    int defaults_pyobjects;
+    size_t defaults_size;  // used by FusedFunction for copying defaults
+    int flags;
+    PyObject *defaults_tuple;
+    PyObject *defaults_kwdict;
+    PyObject *(*defaults_getter)(PyObject *);
+    PyObject *func_annotations;
+} __pyx_CyFunctionObject;
+static PyTypeObject *__pyx_CyFunctionType = 0;
+#define __Pyx_CyFunction_Check(obj)  (__Pyx_TypeCheck(obj, __pyx_CyFunctionType))
+static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject* op, PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *self,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
+static CYTHON_INLINE void *__Pyx_CyFunction_InitDefaults(PyObject *m,
+                                                         size_t size,
+                                                         int pyobjects);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *m,
+                                                            PyObject *tuple);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *m,
+                                                             PyObject *dict);
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *m,
+                                                              PyObject *dict);
+static int __pyx_CyFunction_init(void);
+
+/* CythonFunction.proto */
+static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *closure,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
+
+/* CalculateMetaclass.proto */
+static PyObject *__Pyx_CalculateMetaclass(PyTypeObject *metaclass, PyObject *bases);
+
+/* SetNameInClass.proto */
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+#define __Pyx_SetNameInClass(ns, name, value)\
+    (likely(PyDict_CheckExact(ns)) ? _PyDict_SetItem_KnownHash(ns, name, value, ((PyASCIIObject *) name)->hash) : PyObject_SetItem(ns, name, value))
+#elif CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_SetNameInClass(ns, name, value)\
+    (likely(PyDict_CheckExact(ns)) ? PyDict_SetItem(ns, name, value) : PyObject_SetItem(ns, name, value))
+#else
+#define __Pyx_SetNameInClass(ns, name, value)  PyObject_SetItem(ns, name, value)
+#endif
+
+/* Py3ClassCreate.proto */
+static PyObject *__Pyx_Py3MetaclassPrepare(PyObject *metaclass, PyObject *bases, PyObject *name, PyObject *qualname,
+                                           PyObject *mkw, PyObject *modname, PyObject *doc);
+static PyObject *__Pyx_Py3ClassCreate(PyObject *metaclass, PyObject *name, PyObject *bases, PyObject *dict,
+                                      PyObject *mkw, int calculate_metaclass, int allow_py2_metaclass);
+
+/* IterFinish.proto */
+static CYTHON_INLINE int __Pyx_IterFinish(void);
+
+/* PyObjectGetMethod.proto */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method);
+
+/* PyObjectCallMethod0.proto */
+static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name);
+
+/* RaiseNeedMoreValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
+
+/* RaiseTooManyValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
+
+/* UnpackItemEndCheck.proto */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected);
+
+/* RaiseNoneIterError.proto */
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void);
+
+/* UnpackTupleError.proto */
+static void __Pyx_UnpackTupleError(PyObject *, Py_ssize_t index);
+
+/* UnpackTuple2.proto */
+#define __Pyx_unpack_tuple2(tuple, value1, value2, is_tuple, has_known_size, decref_tuple)\
+    (likely(is_tuple || PyTuple_Check(tuple)) ?\
+        (likely(has_known_size || PyTuple_GET_SIZE(tuple) == 2) ?\
+            __Pyx_unpack_tuple2_exact(tuple, value1, value2, decref_tuple) :\
+            (__Pyx_UnpackTupleError(tuple, 2), -1)) :\
+        __Pyx_unpack_tuple2_generic(tuple, value1, value2, has_known_size, decref_tuple))
+static CYTHON_INLINE int __Pyx_unpack_tuple2_exact(
+    PyObject* tuple, PyObject** value1, PyObject** value2, int decref_tuple);
+static int __Pyx_unpack_tuple2_generic(
+    PyObject* tuple, PyObject** value1, PyObject** value2, int has_known_size, int decref_tuple);
+
+/* dict_iter.proto */
+static CYTHON_INLINE PyObject* __Pyx_dict_iterator(PyObject* dict, int is_dict, PyObject* method_name,
+                                                   Py_ssize_t* p_orig_length, int* p_is_dict);
+static CYTHON_INLINE int __Pyx_dict_iter_next(PyObject* dict_or_iter, Py_ssize_t orig_length, Py_ssize_t* ppos,
+                                              PyObject** pkey, PyObject** pvalue, PyObject** pitem, int is_dict);
+
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
+
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
+
+/* CodeObjectCache.proto */
+typedef struct {
+    PyCodeObject* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+};
+static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static PyCodeObject *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(void);
+
+/* FunctionExport.proto */
+static int __Pyx_ExportFunction(const char *name, void (*f)(void), const char *sig);
+
+/* InitStrings.proto */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+
+
+/* Module declarations from 'cython' */
+
+/* Module declarations from 'rmgpy.molecule.element' */
+static PyTypeObject *__pyx_ptype_5rmgpy_8molecule_7element_Element = 0;
+static struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_f_5rmgpy_8molecule_7element_get_element(PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_7element_get_element *__pyx_optional_args); /*proto*/
+#define __Pyx_MODULE_NAME "rmgpy.molecule.element"
+extern int __pyx_module_is_main_rmgpy__molecule__element;
+int __pyx_module_is_main_rmgpy__molecule__element = 0;
+
+/* Implementation of 'rmgpy.molecule.element' */
+static PyObject *__pyx_builtin_object;
+static PyObject *__pyx_builtin_RuntimeError;
+static const char __pyx_k_[] = ", '";
+static const char __pyx_k_B[] = "B";
+static const char __pyx_k_C[] = "C";
+static const char __pyx_k_D[] = "D";
+static const char __pyx_k_F[] = "F";
+static const char __pyx_k_H[] = "H";
+static const char __pyx_k_I[] = "I";
+static const char __pyx_k_K[] = "K";
+static const char __pyx_k_N[] = "N";
+static const char __pyx_k_O[] = "O";
+static const char __pyx_k_P[] = "P";
+static const char __pyx_k_S[] = "S";
+static const char __pyx_k_T[] = "T";
+static const char __pyx_k_U[] = "U";
+static const char __pyx_k_V[] = "V";
+static const char __pyx_k_W[] = "W";
+static const char __pyx_k_X[] = "X";
+static const char __pyx_k_Y[] = "Y";
+static const char __pyx_k_q[] = "q";
+static const char __pyx_k_Ac[] = "Ac";
+static const char __pyx_k_Ag[] = "Ag";
+static const char __pyx_k_Al[] = "Al";
+static const char __pyx_k_Am[] = "Am";
+static const char __pyx_k_Ar[] = "Ar";
+static const char __pyx_k_As[] = "As";
+static const char __pyx_k_At[] = "At";
+static const char __pyx_k_Au[] = "Au";
+static const char __pyx_k_Ba[] = "Ba";
+static const char __pyx_k_Be[] = "Be";
+static const char __pyx_k_Bh[] = "Bh";
+static const char __pyx_k_Bi[] = "Bi";
+static const char __pyx_k_Bk[] = "Bk";
+static const char __pyx_k_Br[] = "Br";
+static const char __pyx_k_CI[] = "CI";
+static const char __pyx_k_Ca[] = "Ca";
+static const char __pyx_k_Cd[] = "Cd";
+static const char __pyx_k_Ce[] = "Ce";
+static const char __pyx_k_Cf[] = "Cf";
+static const char __pyx_k_Cl[] = "Cl";
+static const char __pyx_k_Cm[] = "Cm";
+static const char __pyx_k_Cn[] = "Cn";
+static const char __pyx_k_Co[] = "Co";
+static const char __pyx_k_Cr[] = "Cr";
+static const char __pyx_k_Cs[] = "Cs";
+static const char __pyx_k_Cu[] = "Cu";
+static const char __pyx_k_Db[] = "Db";
+static const char __pyx_k_Ds[] = "Ds";
+static const char __pyx_k_Dy[] = "Dy";
+static const char __pyx_k_Er[] = "Er";
+static const char __pyx_k_Es[] = "Es";
+static const char __pyx_k_Eu[] = "Eu";
+static const char __pyx_k_Fe[] = "Fe";
+static const char __pyx_k_Fm[] = "Fm";
+static const char __pyx_k_Fr[] = "Fr";
+static const char __pyx_k_Ga[] = "Ga";
+static const char __pyx_k_Gd[] = "Gd";
+static const char __pyx_k_Ge[] = "Ge";
+static const char __pyx_k_He[] = "He";
+static const char __pyx_k_Hf[] = "Hf";
+static const char __pyx_k_Hg[] = "Hg";
+static const char __pyx_k_Ho[] = "Ho";
+static const char __pyx_k_Hs[] = "Hs";
+static const char __pyx_k_In[] = "In";
+static const char __pyx_k_Ir[] = "Ir";
+static const char __pyx_k_Kr[] = "Kr";
+static const char __pyx_k_La[] = "La";
+static const char __pyx_k_Li[] = "Li";
+static const char __pyx_k_Lr[] = "Lr";
+static const char __pyx_k_Lu[] = "Lu";
+static const char __pyx_k_Md[] = "Md";
+static const char __pyx_k_Mg[] = "Mg";
+static const char __pyx_k_Mn[] = "Mn";
+static const char __pyx_k_Mo[] = "Mo";
+static const char __pyx_k_Mt[] = "Mt";
+static const char __pyx_k_Na[] = "Na";
+static const char __pyx_k_Nb[] = "Nb";
+static const char __pyx_k_Nd[] = "Nd";
+static const char __pyx_k_Ne[] = "Ne";
+static const char __pyx_k_Ni[] = "Ni";
+static const char __pyx_k_No[] = "No";
+static const char __pyx_k_Np[] = "Np";
+static const char __pyx_k_OI[] = "OI";
+static const char __pyx_k_Os[] = "Os";
+static const char __pyx_k_Pa[] = "Pa";
+static const char __pyx_k_Pb[] = "Pb";
+static const char __pyx_k_Pd[] = "Pd";
+static const char __pyx_k_Pm[] = "Pm";
+static const char __pyx_k_Po[] = "Po";
+static const char __pyx_k_Pr[] = "Pr";
+static const char __pyx_k_Pt[] = "Pt";
+static const char __pyx_k_Pu[] = "Pu";
+static const char __pyx_k_Ra[] = "Ra";
+static const char __pyx_k_Rb[] = "Rb";
+static const char __pyx_k_Re[] = "Re";
+static const char __pyx_k_Rf[] = "Rf";
+static const char __pyx_k_Rg[] = "Rg";
+static const char __pyx_k_Rh[] = "Rh";
+static const char __pyx_k_Rn[] = "Rn";
+static const char __pyx_k_Ru[] = "Ru";
+static const char __pyx_k_Sb[] = "Sb";
+static const char __pyx_k_Sc[] = "Sc";
+static const char __pyx_k_Se[] = "Se";
+static const char __pyx_k_Sg[] = "Sg";
+static const char __pyx_k_Si[] = "Si";
+static const char __pyx_k_Sm[] = "Sm";
+static const char __pyx_k_Sn[] = "Sn";
+static const char __pyx_k_Sr[] = "Sr";
+static const char __pyx_k_Ta[] = "Ta";
+static const char __pyx_k_Tb[] = "Tb";
+static const char __pyx_k_Tc[] = "Tc";
+static const char __pyx_k_Te[] = "Te";
+static const char __pyx_k_Th[] = "Th";
+static const char __pyx_k_Ti[] = "Ti";
+static const char __pyx_k_Tl[] = "Tl";
+static const char __pyx_k_Tm[] = "Tm";
+static const char __pyx_k_Xe[] = "Xe";
+static const char __pyx_k_Yb[] = "Yb";
+static const char __pyx_k_Zn[] = "Zn";
+static const char __pyx_k_Zr[] = "Zr";
+static const char __pyx_k__2[] = "', '";
+static const char __pyx_k__3[] = "', ";
+static const char __pyx_k__4[] = ", ";
+static const char __pyx_k__5[] = ")";
+static const char __pyx_k_C13[] = "C13";
+static const char __pyx_k_O18[] = "O18";
+static const char __pyx_k_doc[] = "__doc__";
+static const char __pyx_k_key[] = "key";
+static const char __pyx_k_tin[] = "tin";
+static const char __pyx_k_None[] = "None";
+static const char __pyx_k_bdes[] = "bdes";
+static const char __pyx_k_gold[] = "gold";
+static const char __pyx_k_iron[] = "iron";
+static const char __pyx_k_lead[] = "lead";
+static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_mass[] = "mass";
+static const char __pyx_k_name[] = "name";
+static const char __pyx_k_neon[] = "neon";
+static const char __pyx_k_self[] = "self";
+static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_zinc[] = "zinc";
+static const char __pyx_k_argon[] = "argon";
+static const char __pyx_k_boron[] = "boron";
+static const char __pyx_k_error[] = "error";
+static const char __pyx_k_items[] = "items";
+static const char __pyx_k_radon[] = "radon";
+static const char __pyx_k_value[] = "value";
+static const char __pyx_k_xenon[] = "xenon";
+static const char __pyx_k_barium[] = "barium";
+static const char __pyx_k_carbon[] = "carbon";
+static const char __pyx_k_cerium[] = "cerium";
+static const char __pyx_k_cobalt[] = "cobalt";
+static const char __pyx_k_copper[] = "copper";
+static const char __pyx_k_curium[] = "curium";
+static const char __pyx_k_erbium[] = "erbium";
+static const char __pyx_k_format[] = "format";
+static const char __pyx_k_helium[] = "helium";
+static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_indium[] = "indium";
+static const char __pyx_k_iodine[] = "iodine";
+static const char __pyx_k_kJ_mol[] = "kJ/mol";
+static const char __pyx_k_module[] = "__module__";
+static const char __pyx_k_name_2[] = "__name__";
+static const char __pyx_k_nickel[] = "nickel";
+static const char __pyx_k_number[] = "number";
+static const char __pyx_k_object[] = "object";
+static const char __pyx_k_osmium[] = "osmium";
+static const char __pyx_k_oxygen[] = "oxygen";
+static const char __pyx_k_radium[] = "radium";
+static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_silver[] = "silver";
+static const char __pyx_k_sodium[] = "sodium";
+static const char __pyx_k_sulfur[] = "sulfur";
+static const char __pyx_k_symbol[] = "symbol";
+static const char __pyx_k_Element[] = "Element(";
+static const char __pyx_k_actinum[] = "actinum";
+static const char __pyx_k_arsenic[] = "arsenic";
+static const char __pyx_k_bismuth[] = "bismuth";
+static const char __pyx_k_bohrium[] = "bohrium";
+static const char __pyx_k_bromine[] = "bromine";
+static const char __pyx_k_cadmium[] = "cadmium";
+static const char __pyx_k_caesium[] = "caesium";
+static const char __pyx_k_calcium[] = "calcium";
+static const char __pyx_k_dubnium[] = "dubnium";
+static const char __pyx_k_fermium[] = "fermium";
+static const char __pyx_k_gallium[] = "gallium";
+static const char __pyx_k_hafnium[] = "hafnium";
+static const char __pyx_k_hassium[] = "hassium";
+static const char __pyx_k_holmium[] = "holmium";
+static const char __pyx_k_iridium[] = "iridium";
+static const char __pyx_k_isotope[] = "isotope";
+static const char __pyx_k_krypton[] = "krypton";
+static const char __pyx_k_lithium[] = "lithium";
+static const char __pyx_k_logging[] = "logging";
+static const char __pyx_k_mercury[] = "mercury";
+static const char __pyx_k_niobium[] = "niobium";
+static const char __pyx_k_prepare[] = "__prepare__";
+static const char __pyx_k_rhenium[] = "rhenium";
+static const char __pyx_k_rhodium[] = "rhodium";
+static const char __pyx_k_silicon[] = "silicon";
+static const char __pyx_k_terbium[] = "terbium";
+static const char __pyx_k_thorium[] = "thorium";
+static const char __pyx_k_thulium[] = "thulium";
+static const char __pyx_k_tritium[] = "tritium";
+static const char __pyx_k_uranium[] = "uranium";
+static const char __pyx_k_yttrium[] = "yttrium";
+static const char __pyx_k_Quantity[] = "Quantity";
+static const char __pyx_k_antimony[] = "antimony";
+static const char __pyx_k_astatine[] = "astatine";
+static const char __pyx_k_bde_dict[] = "bde_dict";
+static const char __pyx_k_chlorine[] = "chlorine";
+static const char __pyx_k_chromium[] = "chromium";
+static const char __pyx_k_europium[] = "europium";
+static const char __pyx_k_fluorine[] = "fluorine";
+static const char __pyx_k_francium[] = "francium";
+static const char __pyx_k_hydrogen[] = "hydrogen";
+static const char __pyx_k_lutetium[] = "lutetium";
+static const char __pyx_k_nitrogen[] = "nitrogen";
+static const char __pyx_k_nobelium[] = "nobelium";
+static const char __pyx_k_platinum[] = "platinum";
+static const char __pyx_k_polonium[] = "polonium";
+static const char __pyx_k_qualname[] = "__qualname__";
+static const char __pyx_k_rubidium[] = "rubidium";
+static const char __pyx_k_samarium[] = "samarium";
+static const char __pyx_k_scandium[] = "scandium";
+static const char __pyx_k_selenium[] = "selenium";
+static const char __pyx_k_tantalum[] = "tantalum";
+static const char __pyx_k_thallium[] = "thallium";
+static const char __pyx_k_titanium[] = "titanium";
+static const char __pyx_k_tungsten[] = "tungsten";
+static const char __pyx_k_valences[] = "valences";
+static const char __pyx_k_value_si[] = "value_si";
+static const char __pyx_k_vanadium[] = "vanadium";
+static const char __pyx_k_Element_2[] = "Element";
+static const char __pyx_k_aluminium[] = "aluminium";
+static const char __pyx_k_americium[] = "americium";
+static const char __pyx_k_berkelium[] = "berkelium";
+static const char __pyx_k_beryllium[] = "beryllium";
+static const char __pyx_k_carbon_13[] = "carbon-13";
+static const char __pyx_k_deuterium[] = "deuterium";
+static const char __pyx_k_germanium[] = "germanium";
+static const char __pyx_k_lanthanum[] = "lanthanum";
+static const char __pyx_k_magnesium[] = "magnesium";
+static const char __pyx_k_manganese[] = "manganese";
+static const char __pyx_k_metaclass[] = "__metaclass__";
+static const char __pyx_k_neodymium[] = "neodymium";
+static const char __pyx_k_neptunium[] = "neptunium";
+static const char __pyx_k_oxygen_18[] = "oxygen-18";
+static const char __pyx_k_palladium[] = "palladium";
+static const char __pyx_k_plutonium[] = "plutonium";
+static const char __pyx_k_potassium[] = "potassium";
+static const char __pyx_k_ruthenium[] = "ruthenium";
+static const char __pyx_k_strontium[] = "strontium";
+static const char __pyx_k_tellurium[] = "tellurium";
+static const char __pyx_k_ytterbium[] = "ytterbium";
+static const char __pyx_k_zirconium[] = "zirconium";
+static const char __pyx_k_copernicum[] = "copernicum";
+static const char __pyx_k_dysprosium[] = "dysprosium";
+static const char __pyx_k_gadolinium[] = "gadolinium";
+static const char __pyx_k_lawrencium[] = "lawrencium";
+static const char __pyx_k_lone_pairs[] = "lone_pairs";
+static const char __pyx_k_meitnerium[] = "meitnerium";
+static const char __pyx_k_molybdenum[] = "molybdenum";
+static const char __pyx_k_phosphorus[] = "phosphorus";
+static const char __pyx_k_promethium[] = "promethium";
+static const char __pyx_k_rdkit_Chem[] = "rdkit.Chem";
+static const char __pyx_k_seaborgium[] = "seaborgium";
+static const char __pyx_k_technetium[] = "technetium";
+static const char __pyx_k_californium[] = "californium";
+static const char __pyx_k_einsteinium[] = "einsteinium";
+static const char __pyx_k_get_element[] = "get_element";
+static const char __pyx_k_mendelevium[] = "mendelevium";
+static const char __pyx_k_protactinum[] = "protactinum";
+static const char __pyx_k_roentgenium[] = "roentgenium";
+static const char __pyx_k_ElementError[] = "ElementError";
+static const char __pyx_k_GetRcovalent[] = "GetRcovalent";
+static const char __pyx_k_RuntimeError[] = "RuntimeError";
+static const char __pyx_k_bde_elements[] = "bde_elements";
+static const char __pyx_k_chemkin_name[] = "chemkin_name";
+static const char __pyx_k_darmstadtium[] = "darmstadtium";
+static const char __pyx_k_element_list[] = "element_list";
+static const char __pyx_k_praesodymium[] = "praesodymium";
+static const char __pyx_k_surface_site[] = "surface_site";
+static const char __pyx_k_rutherfordium[] = "rutherfordium";
+static const char __pyx_k_PeriodicSystem[] = "PeriodicSystem";
+static const char __pyx_k_rmgpy_quantity[] = "rmgpy.quantity";
+static const char __pyx_k_Element___reduce[] = "Element.__reduce__";
+static const char __pyx_k_GetPeriodicTable[] = "GetPeriodicTable";
+static const char __pyx_k_rmgpy_exceptions[] = "rmgpy.exceptions";
+static const char __pyx_k_electronegativity[] = "electronegativity";
+static const char __pyx_k_valence_electrons[] = "valence_electrons";
+static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_rdkit_periodic_table[] = "_rdkit_periodic_table";
+static const char __pyx_k_rmgpy_molecule_element[] = "rmgpy.molecule.element";
+static const char __pyx_k_rmgpy_molecule_element_py[] = "rmgpy/molecule/element.py";
+static const char __pyx_k_Collects_hard_coded_information[] = "\n    Collects hard-coded information of elements in periodic table.\n\n    Currently it has static attributes:\n    `valences`: the number of bonds an element is able to form around it.\n    `valence_electrons`: the number of electrons in  the outermost shell of the element that can\n    participate in bond formation. for instance, `S` has 6 outermost electrons (valence_electrons)\n    but 4 of them form lone pairs, the remaining 2 electrons can form bonds so the normal valence\n    for `S` is 2.\n    `lone_pairs`: the number of lone pairs an element has\n    'electronegativity': The atom's electronegativity (how well can an atom attract electrons), taken from\n    https://sciencenotes.org/list-of-electronegativity-values-of-the-elements/\n    isotops of the same element may have slight different electronegativities, which is not reflected below\n    ";
+static const char __pyx_k_RDkit_doesn_t_know_element_0_so[] = "RDkit doesn't know element {0} so covalent radius unknown";
+static const char __pyx_k_This_module_defined_the_chemica[] = "\nThis module defined the chemical elements available in RMG. Information for\neach element is stored as attributes of an object of the :class:`Element`\nclass.\n\nElement objects for each chemical element (1-112) have also been declared as\nmodule-level variables, using each element's symbol as its variable name. The\n:meth:`get_element` method can also be used to retrieve the :class:`Element`\nobject associated with an atomic number or symbol. Generally applications will\nwant to use these objects, both to conserve memory and to make for easy\ncomparisons.\n";
+static const char __pyx_k_No_element_found_based_on_parame[] = "No element found based on parameter %s \"%r\", isotope: %i.";
+static const char __pyx_k_No_element_found_with_atomic_num[] = "No element found with atomic number %i, and isotope %i";
+static const char __pyx_k_No_element_found_with_symbol_s_a[] = "No element found with symbol %s, and isotope %i.";
+static PyObject *__pyx_kp_u_;
+static PyObject *__pyx_n_s_Ac;
+static PyObject *__pyx_n_u_Ac;
+static PyObject *__pyx_n_s_Ag;
+static PyObject *__pyx_n_u_Ag;
+static PyObject *__pyx_n_s_Al;
+static PyObject *__pyx_n_u_Al;
+static PyObject *__pyx_n_s_Am;
+static PyObject *__pyx_n_u_Am;
+static PyObject *__pyx_n_s_Ar;
+static PyObject *__pyx_n_u_Ar;
+static PyObject *__pyx_n_s_As;
+static PyObject *__pyx_n_u_As;
+static PyObject *__pyx_n_s_At;
+static PyObject *__pyx_n_u_At;
+static PyObject *__pyx_n_s_Au;
+static PyObject *__pyx_n_u_Au;
+static PyObject *__pyx_n_s_B;
+static PyObject *__pyx_n_u_B;
+static PyObject *__pyx_n_s_Ba;
+static PyObject *__pyx_n_u_Ba;
+static PyObject *__pyx_n_s_Be;
+static PyObject *__pyx_n_u_Be;
+static PyObject *__pyx_n_s_Bh;
+static PyObject *__pyx_n_u_Bh;
+static PyObject *__pyx_n_s_Bi;
+static PyObject *__pyx_n_u_Bi;
+static PyObject *__pyx_n_s_Bk;
+static PyObject *__pyx_n_u_Bk;
+static PyObject *__pyx_n_s_Br;
+static PyObject *__pyx_n_u_Br;
+static PyObject *__pyx_n_s_C;
+static PyObject *__pyx_n_u_C;
+static PyObject *__pyx_n_s_C13;
+static PyObject *__pyx_n_u_C13;
+static PyObject *__pyx_n_u_CI;
+static PyObject *__pyx_n_s_Ca;
+static PyObject *__pyx_n_u_Ca;
+static PyObject *__pyx_n_s_Cd;
+static PyObject *__pyx_n_u_Cd;
+static PyObject *__pyx_n_s_Ce;
+static PyObject *__pyx_n_u_Ce;
+static PyObject *__pyx_n_s_Cf;
+static PyObject *__pyx_n_u_Cf;
+static PyObject *__pyx_n_s_Cl;
+static PyObject *__pyx_n_u_Cl;
+static PyObject *__pyx_n_s_Cm;
+static PyObject *__pyx_n_u_Cm;
+static PyObject *__pyx_n_s_Cn;
+static PyObject *__pyx_n_u_Cn;
+static PyObject *__pyx_n_s_Co;
+static PyObject *__pyx_n_u_Co;
+static PyObject *__pyx_kp_s_Collects_hard_coded_information;
+static PyObject *__pyx_n_s_Cr;
+static PyObject *__pyx_n_u_Cr;
+static PyObject *__pyx_n_s_Cs;
+static PyObject *__pyx_n_u_Cs;
+static PyObject *__pyx_n_s_Cu;
+static PyObject *__pyx_n_u_Cu;
+static PyObject *__pyx_n_s_D;
+static PyObject *__pyx_n_u_D;
+static PyObject *__pyx_n_s_Db;
+static PyObject *__pyx_n_u_Db;
+static PyObject *__pyx_n_s_Ds;
+static PyObject *__pyx_n_u_Ds;
+static PyObject *__pyx_n_s_Dy;
+static PyObject *__pyx_n_u_Dy;
+static PyObject *__pyx_kp_u_Element;
+static PyObject *__pyx_n_s_ElementError;
+static PyObject *__pyx_n_s_Element_2;
+static PyObject *__pyx_n_s_Element___reduce;
+static PyObject *__pyx_n_s_Er;
+static PyObject *__pyx_n_u_Er;
+static PyObject *__pyx_n_s_Es;
+static PyObject *__pyx_n_u_Es;
+static PyObject *__pyx_n_s_Eu;
+static PyObject *__pyx_n_u_Eu;
+static PyObject *__pyx_n_s_F;
+static PyObject *__pyx_n_u_F;
+static PyObject *__pyx_n_s_Fe;
+static PyObject *__pyx_n_u_Fe;
+static PyObject *__pyx_n_s_Fm;
+static PyObject *__pyx_n_u_Fm;
+static PyObject *__pyx_n_s_Fr;
+static PyObject *__pyx_n_u_Fr;
+static PyObject *__pyx_n_s_Ga;
+static PyObject *__pyx_n_u_Ga;
+static PyObject *__pyx_n_s_Gd;
+static PyObject *__pyx_n_u_Gd;
+static PyObject *__pyx_n_s_Ge;
+static PyObject *__pyx_n_u_Ge;
+static PyObject *__pyx_n_s_GetPeriodicTable;
+static PyObject *__pyx_n_s_GetRcovalent;
+static PyObject *__pyx_n_s_H;
+static PyObject *__pyx_n_u_H;
+static PyObject *__pyx_n_s_He;
+static PyObject *__pyx_n_u_He;
+static PyObject *__pyx_n_s_Hf;
+static PyObject *__pyx_n_u_Hf;
+static PyObject *__pyx_n_s_Hg;
+static PyObject *__pyx_n_u_Hg;
+static PyObject *__pyx_n_s_Ho;
+static PyObject *__pyx_n_u_Ho;
+static PyObject *__pyx_n_s_Hs;
+static PyObject *__pyx_n_u_Hs;
+static PyObject *__pyx_n_s_I;
+static PyObject *__pyx_n_u_I;
+static PyObject *__pyx_n_s_In;
+static PyObject *__pyx_n_u_In;
+static PyObject *__pyx_n_s_Ir;
+static PyObject *__pyx_n_u_Ir;
+static PyObject *__pyx_n_s_K;
+static PyObject *__pyx_n_u_K;
+static PyObject *__pyx_n_s_Kr;
+static PyObject *__pyx_n_u_Kr;
+static PyObject *__pyx_n_s_La;
+static PyObject *__pyx_n_u_La;
+static PyObject *__pyx_n_s_Li;
+static PyObject *__pyx_n_u_Li;
+static PyObject *__pyx_n_s_Lr;
+static PyObject *__pyx_n_u_Lr;
+static PyObject *__pyx_n_s_Lu;
+static PyObject *__pyx_n_u_Lu;
+static PyObject *__pyx_n_s_Md;
+static PyObject *__pyx_n_u_Md;
+static PyObject *__pyx_n_s_Mg;
+static PyObject *__pyx_n_u_Mg;
+static PyObject *__pyx_n_s_Mn;
+static PyObject *__pyx_n_u_Mn;
+static PyObject *__pyx_n_s_Mo;
+static PyObject *__pyx_n_u_Mo;
+static PyObject *__pyx_n_s_Mt;
+static PyObject *__pyx_n_u_Mt;
+static PyObject *__pyx_n_s_N;
+static PyObject *__pyx_n_u_N;
+static PyObject *__pyx_n_s_Na;
+static PyObject *__pyx_n_u_Na;
+static PyObject *__pyx_n_s_Nb;
+static PyObject *__pyx_n_u_Nb;
+static PyObject *__pyx_n_s_Nd;
+static PyObject *__pyx_n_u_Nd;
+static PyObject *__pyx_n_s_Ne;
+static PyObject *__pyx_n_u_Ne;
+static PyObject *__pyx_n_s_Ni;
+static PyObject *__pyx_n_u_Ni;
+static PyObject *__pyx_n_s_No;
+static PyObject *__pyx_n_u_No;
+static PyObject *__pyx_kp_u_No_element_found_based_on_parame;
+static PyObject *__pyx_kp_u_No_element_found_with_atomic_num;
+static PyObject *__pyx_kp_u_No_element_found_with_symbol_s_a;
+static PyObject *__pyx_kp_u_None;
+static PyObject *__pyx_n_s_Np;
+static PyObject *__pyx_n_u_Np;
+static PyObject *__pyx_n_s_O;
+static PyObject *__pyx_n_u_O;
+static PyObject *__pyx_n_s_O18;
+static PyObject *__pyx_n_u_O18;
+static PyObject *__pyx_n_u_OI;
+static PyObject *__pyx_n_s_Os;
+static PyObject *__pyx_n_u_Os;
+static PyObject *__pyx_n_s_P;
+static PyObject *__pyx_n_u_P;
+static PyObject *__pyx_n_s_Pa;
+static PyObject *__pyx_n_u_Pa;
+static PyObject *__pyx_n_s_Pb;
+static PyObject *__pyx_n_u_Pb;
+static PyObject *__pyx_n_s_Pd;
+static PyObject *__pyx_n_u_Pd;
+static PyObject *__pyx_n_s_PeriodicSystem;
+static PyObject *__pyx_n_s_Pm;
+static PyObject *__pyx_n_u_Pm;
+static PyObject *__pyx_n_s_Po;
+static PyObject *__pyx_n_u_Po;
+static PyObject *__pyx_n_s_Pr;
+static PyObject *__pyx_n_u_Pr;
+static PyObject *__pyx_n_s_Pt;
+static PyObject *__pyx_n_u_Pt;
+static PyObject *__pyx_n_s_Pu;
+static PyObject *__pyx_n_u_Pu;
+static PyObject *__pyx_n_s_Quantity;
+static PyObject *__pyx_kp_u_RDkit_doesn_t_know_element_0_so;
+static PyObject *__pyx_n_s_Ra;
+static PyObject *__pyx_n_u_Ra;
+static PyObject *__pyx_n_s_Rb;
+static PyObject *__pyx_n_u_Rb;
+static PyObject *__pyx_n_s_Re;
+static PyObject *__pyx_n_u_Re;
+static PyObject *__pyx_n_s_Rf;
+static PyObject *__pyx_n_u_Rf;
+static PyObject *__pyx_n_s_Rg;
+static PyObject *__pyx_n_u_Rg;
+static PyObject *__pyx_n_s_Rh;
+static PyObject *__pyx_n_u_Rh;
+static PyObject *__pyx_n_s_Rn;
+static PyObject *__pyx_n_u_Rn;
+static PyObject *__pyx_n_s_Ru;
+static PyObject *__pyx_n_u_Ru;
+static PyObject *__pyx_n_s_RuntimeError;
+static PyObject *__pyx_n_s_S;
+static PyObject *__pyx_n_u_S;
+static PyObject *__pyx_n_s_Sb;
+static PyObject *__pyx_n_u_Sb;
+static PyObject *__pyx_n_s_Sc;
+static PyObject *__pyx_n_u_Sc;
+static PyObject *__pyx_n_s_Se;
+static PyObject *__pyx_n_u_Se;
+static PyObject *__pyx_n_s_Sg;
+static PyObject *__pyx_n_u_Sg;
+static PyObject *__pyx_n_s_Si;
+static PyObject *__pyx_n_u_Si;
+static PyObject *__pyx_n_s_Sm;
+static PyObject *__pyx_n_u_Sm;
+static PyObject *__pyx_n_s_Sn;
+static PyObject *__pyx_n_u_Sn;
+static PyObject *__pyx_n_s_Sr;
+static PyObject *__pyx_n_u_Sr;
+static PyObject *__pyx_n_s_T;
+static PyObject *__pyx_n_u_T;
+static PyObject *__pyx_n_s_Ta;
+static PyObject *__pyx_n_u_Ta;
+static PyObject *__pyx_n_s_Tb;
+static PyObject *__pyx_n_u_Tb;
+static PyObject *__pyx_n_s_Tc;
+static PyObject *__pyx_n_u_Tc;
+static PyObject *__pyx_n_s_Te;
+static PyObject *__pyx_n_u_Te;
+static PyObject *__pyx_n_s_Th;
+static PyObject *__pyx_n_u_Th;
+static PyObject *__pyx_n_s_Ti;
+static PyObject *__pyx_n_u_Ti;
+static PyObject *__pyx_n_s_Tl;
+static PyObject *__pyx_n_u_Tl;
+static PyObject *__pyx_n_s_Tm;
+static PyObject *__pyx_n_u_Tm;
+static PyObject *__pyx_n_s_U;
+static PyObject *__pyx_n_u_U;
+static PyObject *__pyx_n_s_V;
+static PyObject *__pyx_n_u_V;
+static PyObject *__pyx_n_s_W;
+static PyObject *__pyx_n_u_W;
+static PyObject *__pyx_n_s_X;
+static PyObject *__pyx_n_u_X;
+static PyObject *__pyx_n_s_Xe;
+static PyObject *__pyx_n_u_Xe;
+static PyObject *__pyx_n_s_Y;
+static PyObject *__pyx_n_u_Y;
+static PyObject *__pyx_n_s_Yb;
+static PyObject *__pyx_n_u_Yb;
+static PyObject *__pyx_n_s_Zn;
+static PyObject *__pyx_n_u_Zn;
+static PyObject *__pyx_n_s_Zr;
+static PyObject *__pyx_n_u_Zr;
+static PyObject *__pyx_kp_u__2;
+static PyObject *__pyx_kp_u__3;
+static PyObject *__pyx_kp_u__4;
+static PyObject *__pyx_kp_u__5;
+static PyObject *__pyx_n_u_actinum;
+static PyObject *__pyx_n_u_aluminium;
+static PyObject *__pyx_n_u_americium;
+static PyObject *__pyx_n_u_antimony;
+static PyObject *__pyx_n_u_argon;
+static PyObject *__pyx_n_u_arsenic;
+static PyObject *__pyx_n_u_astatine;
+static PyObject *__pyx_n_u_barium;
+static PyObject *__pyx_n_s_bde_dict;
+static PyObject *__pyx_n_s_bde_elements;
+static PyObject *__pyx_n_s_bdes;
+static PyObject *__pyx_n_u_berkelium;
+static PyObject *__pyx_n_u_beryllium;
+static PyObject *__pyx_n_u_bismuth;
+static PyObject *__pyx_n_u_bohrium;
+static PyObject *__pyx_n_u_boron;
+static PyObject *__pyx_n_u_bromine;
+static PyObject *__pyx_n_u_cadmium;
+static PyObject *__pyx_n_u_caesium;
+static PyObject *__pyx_n_u_calcium;
+static PyObject *__pyx_n_u_californium;
+static PyObject *__pyx_n_u_carbon;
+static PyObject *__pyx_kp_u_carbon_13;
+static PyObject *__pyx_n_u_cerium;
+static PyObject *__pyx_n_s_chemkin_name;
+static PyObject *__pyx_n_u_chlorine;
+static PyObject *__pyx_n_u_chromium;
+static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_u_cobalt;
+static PyObject *__pyx_n_u_copernicum;
+static PyObject *__pyx_n_u_copper;
+static PyObject *__pyx_n_u_curium;
+static PyObject *__pyx_n_u_darmstadtium;
+static PyObject *__pyx_n_u_deuterium;
+static PyObject *__pyx_n_s_doc;
+static PyObject *__pyx_n_u_dubnium;
+static PyObject *__pyx_n_u_dysprosium;
+static PyObject *__pyx_n_u_einsteinium;
+static PyObject *__pyx_n_s_electronegativity;
+static PyObject *__pyx_n_s_element_list;
+static PyObject *__pyx_n_u_erbium;
+static PyObject *__pyx_n_s_error;
+static PyObject *__pyx_n_u_europium;
+static PyObject *__pyx_n_u_fermium;
+static PyObject *__pyx_n_u_fluorine;
+static PyObject *__pyx_n_s_format;
+static PyObject *__pyx_n_u_francium;
+static PyObject *__pyx_n_u_gadolinium;
+static PyObject *__pyx_n_u_gallium;
+static PyObject *__pyx_n_u_germanium;
+static PyObject *__pyx_n_s_get_element;
+static PyObject *__pyx_n_u_gold;
+static PyObject *__pyx_n_u_hafnium;
+static PyObject *__pyx_n_u_hassium;
+static PyObject *__pyx_n_u_helium;
+static PyObject *__pyx_n_u_holmium;
+static PyObject *__pyx_n_u_hydrogen;
+static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_u_indium;
+static PyObject *__pyx_n_u_iodine;
+static PyObject *__pyx_n_u_iridium;
+static PyObject *__pyx_n_u_iron;
+static PyObject *__pyx_n_s_isotope;
+static PyObject *__pyx_n_s_items;
+static PyObject *__pyx_kp_u_kJ_mol;
+static PyObject *__pyx_n_s_key;
+static PyObject *__pyx_n_u_krypton;
+static PyObject *__pyx_n_u_lanthanum;
+static PyObject *__pyx_n_u_lawrencium;
+static PyObject *__pyx_n_u_lead;
+static PyObject *__pyx_n_u_lithium;
+static PyObject *__pyx_n_s_logging;
+static PyObject *__pyx_n_s_lone_pairs;
+static PyObject *__pyx_n_u_lutetium;
+static PyObject *__pyx_n_u_magnesium;
+static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_u_manganese;
+static PyObject *__pyx_n_s_mass;
+static PyObject *__pyx_n_u_meitnerium;
+static PyObject *__pyx_n_u_mendelevium;
+static PyObject *__pyx_n_u_mercury;
+static PyObject *__pyx_n_s_metaclass;
+static PyObject *__pyx_n_s_module;
+static PyObject *__pyx_n_u_molybdenum;
+static PyObject *__pyx_n_s_name;
+static PyObject *__pyx_n_s_name_2;
+static PyObject *__pyx_n_u_neodymium;
+static PyObject *__pyx_n_u_neon;
+static PyObject *__pyx_n_u_neptunium;
+static PyObject *__pyx_n_u_nickel;
+static PyObject *__pyx_n_u_niobium;
+static PyObject *__pyx_n_u_nitrogen;
+static PyObject *__pyx_n_u_nobelium;
+static PyObject *__pyx_n_s_number;
+static PyObject *__pyx_n_s_object;
+static PyObject *__pyx_n_u_osmium;
+static PyObject *__pyx_n_u_oxygen;
+static PyObject *__pyx_kp_u_oxygen_18;
+static PyObject *__pyx_n_u_palladium;
+static PyObject *__pyx_n_u_phosphorus;
+static PyObject *__pyx_n_u_platinum;
+static PyObject *__pyx_n_u_plutonium;
+static PyObject *__pyx_n_u_polonium;
+static PyObject *__pyx_n_u_potassium;
+static PyObject *__pyx_n_u_praesodymium;
+static PyObject *__pyx_n_s_prepare;
+static PyObject *__pyx_n_u_promethium;
+static PyObject *__pyx_n_u_protactinum;
+static PyObject *__pyx_n_s_q;
+static PyObject *__pyx_n_s_qualname;
+static PyObject *__pyx_n_u_radium;
+static PyObject *__pyx_n_u_radon;
+static PyObject *__pyx_n_s_rdkit_Chem;
+static PyObject *__pyx_n_s_rdkit_periodic_table;
+static PyObject *__pyx_n_s_reduce;
+static PyObject *__pyx_n_u_rhenium;
+static PyObject *__pyx_n_u_rhodium;
+static PyObject *__pyx_n_s_rmgpy_exceptions;
+static PyObject *__pyx_n_s_rmgpy_molecule_element;
+static PyObject *__pyx_kp_s_rmgpy_molecule_element_py;
+static PyObject *__pyx_n_s_rmgpy_quantity;
+static PyObject *__pyx_n_u_roentgenium;
+static PyObject *__pyx_n_u_rubidium;
+static PyObject *__pyx_n_u_ruthenium;
+static PyObject *__pyx_n_u_rutherfordium;
+static PyObject *__pyx_n_u_samarium;
+static PyObject *__pyx_n_u_scandium;
+static PyObject *__pyx_n_u_seaborgium;
+static PyObject *__pyx_n_u_selenium;
+static PyObject *__pyx_n_s_self;
+static PyObject *__pyx_n_u_silicon;
+static PyObject *__pyx_n_u_silver;
+static PyObject *__pyx_n_u_sodium;
+static PyObject *__pyx_n_u_strontium;
+static PyObject *__pyx_n_u_sulfur;
+static PyObject *__pyx_n_u_surface_site;
+static PyObject *__pyx_n_s_symbol;
+static PyObject *__pyx_n_u_tantalum;
+static PyObject *__pyx_n_u_technetium;
+static PyObject *__pyx_n_u_tellurium;
+static PyObject *__pyx_n_u_terbium;
+static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_n_u_thallium;
+static PyObject *__pyx_n_u_thorium;
+static PyObject *__pyx_n_u_thulium;
+static PyObject *__pyx_n_u_tin;
+static PyObject *__pyx_n_u_titanium;
+static PyObject *__pyx_n_u_tritium;
+static PyObject *__pyx_n_u_tungsten;
+static PyObject *__pyx_n_u_uranium;
+static PyObject *__pyx_n_s_valence_electrons;
+static PyObject *__pyx_n_s_valences;
+static PyObject *__pyx_n_s_value;
+static PyObject *__pyx_n_s_value_si;
+static PyObject *__pyx_n_u_vanadium;
+static PyObject *__pyx_n_u_xenon;
+static PyObject *__pyx_n_u_ytterbium;
+static PyObject *__pyx_n_u_yttrium;
+static PyObject *__pyx_n_u_zinc;
+static PyObject *__pyx_n_u_zirconium;
+static int __pyx_pf_5rmgpy_8molecule_7element_7Element___init__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self, PyObject *__pyx_v_number, PyObject *__pyx_v_symbol, PyObject *__pyx_v_name, PyObject *__pyx_v_mass, PyObject *__pyx_v_isotope, PyObject *__pyx_v_chemkin_name); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8molecule_7element_7Element_2__str__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8molecule_7element_7Element_4__repr__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8molecule_7element_7Element_6__reduce__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8molecule_7element_7Element_6number___get__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self); /* proto */
+static int __pyx_pf_5rmgpy_8molecule_7element_7Element_6number_2__set__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8molecule_7element_7Element_4name___get__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self); /* proto */
+static int __pyx_pf_5rmgpy_8molecule_7element_7Element_4name_2__set__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static int __pyx_pf_5rmgpy_8molecule_7element_7Element_4name_4__del__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8molecule_7element_7Element_6symbol___get__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self); /* proto */
+static int __pyx_pf_5rmgpy_8molecule_7element_7Element_6symbol_2__set__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static int __pyx_pf_5rmgpy_8molecule_7element_7Element_6symbol_4__del__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8molecule_7element_7Element_4mass___get__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self); /* proto */
+static int __pyx_pf_5rmgpy_8molecule_7element_7Element_4mass_2__set__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8molecule_7element_7Element_10cov_radius___get__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self); /* proto */
+static int __pyx_pf_5rmgpy_8molecule_7element_7Element_10cov_radius_2__set__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8molecule_7element_7Element_7isotope___get__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self); /* proto */
+static int __pyx_pf_5rmgpy_8molecule_7element_7Element_7isotope_2__set__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8molecule_7element_7Element_12chemkin_name___get__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self); /* proto */
+static int __pyx_pf_5rmgpy_8molecule_7element_7Element_12chemkin_name_2__set__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static int __pyx_pf_5rmgpy_8molecule_7element_7Element_12chemkin_name_4__del__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8molecule_7element_get_element(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_value, int __pyx_v_isotope); /* proto */
+static PyObject *__pyx_tp_new_5rmgpy_8molecule_7element_Element(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_float_0_0;
+static PyObject *__pyx_float_1_0;
+static PyObject *__pyx_float_1_5;
+static PyObject *__pyx_float_2_5;
+static PyObject *__pyx_float_1_90;
+static PyObject *__pyx_float_2_20;
+static PyObject *__pyx_float_2_55;
+static PyObject *__pyx_float_2_58;
+static PyObject *__pyx_float_2_66;
+static PyObject *__pyx_float_3_04;
+static PyObject *__pyx_float_3_16;
+static PyObject *__pyx_float_3_44;
+static PyObject *__pyx_float_3_98;
+static PyObject *__pyx_float_0_098;
+static PyObject *__pyx_float_0_145;
+static PyObject *__pyx_float_0_209;
+static PyObject *__pyx_float_0_210;
+static PyObject *__pyx_float_0_222;
+static PyObject *__pyx_float_0_223;
+static PyObject *__pyx_float_0_226;
+static PyObject *__pyx_float_0_227;
+static PyObject *__pyx_float_0_237;
+static PyObject *__pyx_float_0_243;
+static PyObject *__pyx_float_0_244;
+static PyObject *__pyx_float_0_247;
+static PyObject *__pyx_float_0_251;
+static PyObject *__pyx_float_0_252;
+static PyObject *__pyx_float_0_257;
+static PyObject *__pyx_float_0_258;
+static PyObject *__pyx_float_0_259;
+static PyObject *__pyx_float_0_261;
+static PyObject *__pyx_float_0_262;
+static PyObject *__pyx_float_0_264;
+static PyObject *__pyx_float_0_266;
+static PyObject *__pyx_float_0_268;
+static PyObject *__pyx_float_0_272;
+static PyObject *__pyx_float_0_277;
+static PyObject *__pyx_float_0_281;
+static PyObject *__pyx_float_0_285;
+static PyObject *__pyx_float_142_0;
+static PyObject *__pyx_float_167_0;
+static PyObject *__pyx_float_201_0;
+static PyObject *__pyx_float_222_0;
+static PyObject *__pyx_float_226_0;
+static PyObject *__pyx_float_240_0;
+static PyObject *__pyx_float_255_0;
+static PyObject *__pyx_float_265_0;
+static PyObject *__pyx_float_272_0;
+static PyObject *__pyx_float_293_0;
+static PyObject *__pyx_float_305_0;
+static PyObject *__pyx_float_313_0;
+static PyObject *__pyx_float_318_0;
+static PyObject *__pyx_float_327_0;
+static PyObject *__pyx_float_346_0;
+static PyObject *__pyx_float_355_0;
+static PyObject *__pyx_float_358_0;
+static PyObject *__pyx_float_363_0;
+static PyObject *__pyx_float_381_0;
+static PyObject *__pyx_float_386_0;
+static PyObject *__pyx_float_411_0;
+static PyObject *__pyx_float_418_0;
+static PyObject *__pyx_float_425_0;
+static PyObject *__pyx_float_428_0;
+static PyObject *__pyx_float_432_0;
+static PyObject *__pyx_float_452_0;
+static PyObject *__pyx_float_459_0;
+static PyObject *__pyx_float_494_0;
+static PyObject *__pyx_float_518_0;
+static PyObject *__pyx_float_522_0;
+static PyObject *__pyx_float_573_0;
+static PyObject *__pyx_float_602_0;
+static PyObject *__pyx_float_607_0;
+static PyObject *__pyx_float_615_0;
+static PyObject *__pyx_float_663_0;
+static PyObject *__pyx_float_799_0;
+static PyObject *__pyx_float_835_0;
+static PyObject *__pyx_float_887_0;
+static PyObject *__pyx_float_942_0;
+static PyObject *__pyx_float_0_2072;
+static PyObject *__pyx_float_1072_0;
+static PyObject *__pyx_float_0_07264;
+static PyObject *__pyx_float_0_07896;
+static PyObject *__pyx_float_0_08762;
+static PyObject *__pyx_float_0_09594;
+static PyObject *__pyx_float_0_10107;
+static PyObject *__pyx_float_0_10642;
+static PyObject *__pyx_float_0_12760;
+static PyObject *__pyx_float_0_14424;
+static PyObject *__pyx_float_0_15036;
+static PyObject *__pyx_float_0_15725;
+static PyObject *__pyx_float_0_17304;
+static PyObject *__pyx_float_0_17849;
+static PyObject *__pyx_float_0_18384;
+static PyObject *__pyx_float_0_19023;
+static PyObject *__pyx_float_0_20059;
+static PyObject *__pyx_float_0_006941;
+static PyObject *__pyx_float_0_010811;
+static PyObject *__pyx_float_0_032065;
+static PyObject *__pyx_float_0_035453;
+static PyObject *__pyx_float_0_039348;
+static PyObject *__pyx_float_0_040078;
+static PyObject *__pyx_float_0_047867;
+static PyObject *__pyx_float_0_055845;
+static PyObject *__pyx_float_0_063546;
+static PyObject *__pyx_float_0_065409;
+static PyObject *__pyx_float_0_069723;
+static PyObject *__pyx_float_0_079904;
+static PyObject *__pyx_float_0_083798;
+static PyObject *__pyx_float_0_091224;
+static PyObject *__pyx_float_0_112411;
+static PyObject *__pyx_float_0_114818;
+static PyObject *__pyx_float_0_118710;
+static PyObject *__pyx_float_0_121760;
+static PyObject *__pyx_float_0_131293;
+static PyObject *__pyx_float_0_137327;
+static PyObject *__pyx_float_0_140116;
+static PyObject *__pyx_float_0_151964;
+static PyObject *__pyx_float_0_162500;
+static PyObject *__pyx_float_0_167259;
+static PyObject *__pyx_float_0_174967;
+static PyObject *__pyx_float_0_186207;
+static PyObject *__pyx_float_0_192217;
+static PyObject *__pyx_float_0_195078;
+static PyObject *__pyx_float_0_0120107;
+static PyObject *__pyx_float_0_0130033;
+static PyObject *__pyx_float_0_0159994;
+static PyObject *__pyx_float_0_0179999;
+static PyObject *__pyx_float_0_0201797;
+static PyObject *__pyx_float_0_0243050;
+static PyObject *__pyx_float_0_0280855;
+static PyObject *__pyx_float_0_0390983;
+static PyObject *__pyx_float_0_0509415;
+static PyObject *__pyx_float_0_0519961;
+static PyObject *__pyx_float_0_0586934;
+static PyObject *__pyx_float_0_0854678;
+static PyObject *__pyx_float_0_1078682;
+static PyObject *__pyx_float_0_1389055;
+static PyObject *__pyx_float_0_1809479;
+static PyObject *__pyx_float_0_2043833;
+static PyObject *__pyx_float_0_2320381;
+static PyObject *__pyx_float_0_00100794;
+static PyObject *__pyx_float_0_01400674;
+static PyObject *__pyx_float_0_07492160;
+static PyObject *__pyx_float_0_08890585;
+static PyObject *__pyx_float_0_09290638;
+static PyObject *__pyx_float_0_10290550;
+static PyObject *__pyx_float_0_12690447;
+static PyObject *__pyx_float_0_13290545;
+static PyObject *__pyx_float_0_14090765;
+static PyObject *__pyx_float_0_15892534;
+static PyObject *__pyx_float_0_16493032;
+static PyObject *__pyx_float_0_16893421;
+static PyObject *__pyx_float_0_19696655;
+static PyObject *__pyx_float_0_20898038;
+static PyObject *__pyx_float_0_23103588;
+static PyObject *__pyx_float_0_23802891;
+static PyObject *__pyx_float_0_002014101;
+static PyObject *__pyx_float_0_003016049;
+static PyObject *__pyx_float_0_004002602;
+static PyObject *__pyx_float_0_009012182;
+static PyObject *__pyx_float_0_018998403;
+static PyObject *__pyx_float_0_022989770;
+static PyObject *__pyx_float_0_026981538;
+static PyObject *__pyx_float_0_030973761;
+static PyObject *__pyx_float_0_044955910;
+static PyObject *__pyx_float_0_054938049;
+static PyObject *__pyx_float_0_058933200;
+static PyObject *__pyx_int_0;
+static PyObject *__pyx_int_1;
+static PyObject *__pyx_int_2;
+static PyObject *__pyx_int_3;
+static PyObject *__pyx_int_4;
+static PyObject *__pyx_int_5;
+static PyObject *__pyx_int_6;
+static PyObject *__pyx_int_7;
+static PyObject *__pyx_int_8;
+static PyObject *__pyx_int_9;
+static PyObject *__pyx_int_10;
+static PyObject *__pyx_int_11;
+static PyObject *__pyx_int_12;
+static PyObject *__pyx_int_13;
+static PyObject *__pyx_int_14;
+static PyObject *__pyx_int_15;
+static PyObject *__pyx_int_16;
+static PyObject *__pyx_int_17;
+static PyObject *__pyx_int_18;
+static PyObject *__pyx_int_19;
+static PyObject *__pyx_int_20;
+static PyObject *__pyx_int_21;
+static PyObject *__pyx_int_22;
+static PyObject *__pyx_int_23;
+static PyObject *__pyx_int_24;
+static PyObject *__pyx_int_25;
+static PyObject *__pyx_int_26;
+static PyObject *__pyx_int_27;
+static PyObject *__pyx_int_28;
+static PyObject *__pyx_int_29;
+static PyObject *__pyx_int_30;
+static PyObject *__pyx_int_31;
+static PyObject *__pyx_int_32;
+static PyObject *__pyx_int_33;
+static PyObject *__pyx_int_34;
+static PyObject *__pyx_int_35;
+static PyObject *__pyx_int_36;
+static PyObject *__pyx_int_37;
+static PyObject *__pyx_int_38;
+static PyObject *__pyx_int_39;
+static PyObject *__pyx_int_40;
+static PyObject *__pyx_int_41;
+static PyObject *__pyx_int_42;
+static PyObject *__pyx_int_43;
+static PyObject *__pyx_int_44;
+static PyObject *__pyx_int_45;
+static PyObject *__pyx_int_46;
+static PyObject *__pyx_int_47;
+static PyObject *__pyx_int_48;
+static PyObject *__pyx_int_49;
+static PyObject *__pyx_int_50;
+static PyObject *__pyx_int_51;
+static PyObject *__pyx_int_52;
+static PyObject *__pyx_int_53;
+static PyObject *__pyx_int_54;
+static PyObject *__pyx_int_55;
+static PyObject *__pyx_int_56;
+static PyObject *__pyx_int_57;
+static PyObject *__pyx_int_58;
+static PyObject *__pyx_int_59;
+static PyObject *__pyx_int_60;
+static PyObject *__pyx_int_61;
+static PyObject *__pyx_int_62;
+static PyObject *__pyx_int_63;
+static PyObject *__pyx_int_64;
+static PyObject *__pyx_int_65;
+static PyObject *__pyx_int_66;
+static PyObject *__pyx_int_67;
+static PyObject *__pyx_int_68;
+static PyObject *__pyx_int_69;
+static PyObject *__pyx_int_70;
+static PyObject *__pyx_int_71;
+static PyObject *__pyx_int_72;
+static PyObject *__pyx_int_73;
+static PyObject *__pyx_int_74;
+static PyObject *__pyx_int_75;
+static PyObject *__pyx_int_76;
+static PyObject *__pyx_int_77;
+static PyObject *__pyx_int_78;
+static PyObject *__pyx_int_79;
+static PyObject *__pyx_int_80;
+static PyObject *__pyx_int_81;
+static PyObject *__pyx_int_82;
+static PyObject *__pyx_int_83;
+static PyObject *__pyx_int_84;
+static PyObject *__pyx_int_85;
+static PyObject *__pyx_int_86;
+static PyObject *__pyx_int_87;
+static PyObject *__pyx_int_88;
+static PyObject *__pyx_int_89;
+static PyObject *__pyx_int_90;
+static PyObject *__pyx_int_91;
+static PyObject *__pyx_int_92;
+static PyObject *__pyx_int_93;
+static PyObject *__pyx_int_94;
+static PyObject *__pyx_int_95;
+static PyObject *__pyx_int_96;
+static PyObject *__pyx_int_97;
+static PyObject *__pyx_int_98;
+static PyObject *__pyx_int_99;
+static PyObject *__pyx_int_100;
+static PyObject *__pyx_int_101;
+static PyObject *__pyx_int_102;
+static PyObject *__pyx_int_103;
+static PyObject *__pyx_int_104;
+static PyObject *__pyx_int_105;
+static PyObject *__pyx_int_106;
+static PyObject *__pyx_int_107;
+static PyObject *__pyx_int_108;
+static PyObject *__pyx_int_109;
+static PyObject *__pyx_int_110;
+static PyObject *__pyx_int_111;
+static PyObject *__pyx_int_112;
+static PyObject *__pyx_int_neg_1;
+static PyObject *__pyx_tuple__6;
+static PyObject *__pyx_tuple__8;
+static PyObject *__pyx_tuple__9;
+static PyObject *__pyx_tuple__11;
+static PyObject *__pyx_tuple__12;
+static PyObject *__pyx_tuple__13;
+static PyObject *__pyx_tuple__14;
+static PyObject *__pyx_tuple__15;
+static PyObject *__pyx_tuple__16;
+static PyObject *__pyx_tuple__17;
+static PyObject *__pyx_tuple__18;
+static PyObject *__pyx_tuple__19;
+static PyObject *__pyx_tuple__20;
+static PyObject *__pyx_tuple__21;
+static PyObject *__pyx_tuple__22;
+static PyObject *__pyx_tuple__23;
+static PyObject *__pyx_tuple__24;
+static PyObject *__pyx_tuple__25;
+static PyObject *__pyx_tuple__26;
+static PyObject *__pyx_tuple__27;
+static PyObject *__pyx_tuple__28;
+static PyObject *__pyx_tuple__29;
+static PyObject *__pyx_tuple__30;
+static PyObject *__pyx_tuple__31;
+static PyObject *__pyx_tuple__32;
+static PyObject *__pyx_tuple__33;
+static PyObject *__pyx_tuple__34;
+static PyObject *__pyx_tuple__35;
+static PyObject *__pyx_tuple__36;
+static PyObject *__pyx_tuple__37;
+static PyObject *__pyx_tuple__38;
+static PyObject *__pyx_tuple__39;
+static PyObject *__pyx_tuple__40;
+static PyObject *__pyx_tuple__41;
+static PyObject *__pyx_tuple__42;
+static PyObject *__pyx_tuple__43;
+static PyObject *__pyx_tuple__44;
+static PyObject *__pyx_tuple__45;
+static PyObject *__pyx_tuple__46;
+static PyObject *__pyx_tuple__47;
+static PyObject *__pyx_tuple__48;
+static PyObject *__pyx_tuple__49;
+static PyObject *__pyx_tuple__50;
+static PyObject *__pyx_tuple__51;
+static PyObject *__pyx_tuple__52;
+static PyObject *__pyx_tuple__53;
+static PyObject *__pyx_tuple__54;
+static PyObject *__pyx_tuple__55;
+static PyObject *__pyx_tuple__56;
+static PyObject *__pyx_tuple__57;
+static PyObject *__pyx_tuple__58;
+static PyObject *__pyx_tuple__59;
+static PyObject *__pyx_tuple__60;
+static PyObject *__pyx_tuple__61;
+static PyObject *__pyx_tuple__62;
+static PyObject *__pyx_tuple__63;
+static PyObject *__pyx_tuple__64;
+static PyObject *__pyx_tuple__65;
+static PyObject *__pyx_tuple__66;
+static PyObject *__pyx_tuple__67;
+static PyObject *__pyx_tuple__68;
+static PyObject *__pyx_tuple__69;
+static PyObject *__pyx_tuple__70;
+static PyObject *__pyx_tuple__71;
+static PyObject *__pyx_tuple__72;
+static PyObject *__pyx_tuple__73;
+static PyObject *__pyx_tuple__74;
+static PyObject *__pyx_tuple__75;
+static PyObject *__pyx_tuple__76;
+static PyObject *__pyx_tuple__77;
+static PyObject *__pyx_tuple__78;
+static PyObject *__pyx_tuple__79;
+static PyObject *__pyx_tuple__80;
+static PyObject *__pyx_tuple__81;
+static PyObject *__pyx_tuple__82;
+static PyObject *__pyx_tuple__83;
+static PyObject *__pyx_tuple__84;
+static PyObject *__pyx_tuple__85;
+static PyObject *__pyx_tuple__86;
+static PyObject *__pyx_tuple__87;
+static PyObject *__pyx_tuple__88;
+static PyObject *__pyx_tuple__89;
+static PyObject *__pyx_tuple__90;
+static PyObject *__pyx_tuple__91;
+static PyObject *__pyx_tuple__92;
+static PyObject *__pyx_tuple__93;
+static PyObject *__pyx_tuple__94;
+static PyObject *__pyx_tuple__95;
+static PyObject *__pyx_tuple__96;
+static PyObject *__pyx_tuple__97;
+static PyObject *__pyx_tuple__98;
+static PyObject *__pyx_tuple__99;
+static PyObject *__pyx_codeobj__7;
+static PyObject *__pyx_tuple__100;
+static PyObject *__pyx_tuple__101;
+static PyObject *__pyx_tuple__102;
+static PyObject *__pyx_tuple__103;
+static PyObject *__pyx_tuple__104;
+static PyObject *__pyx_tuple__105;
+static PyObject *__pyx_tuple__106;
+static PyObject *__pyx_tuple__107;
+static PyObject *__pyx_tuple__108;
+static PyObject *__pyx_tuple__109;
+static PyObject *__pyx_tuple__110;
+static PyObject *__pyx_tuple__111;
+static PyObject *__pyx_tuple__112;
+static PyObject *__pyx_tuple__113;
+static PyObject *__pyx_tuple__114;
+static PyObject *__pyx_tuple__115;
+static PyObject *__pyx_tuple__116;
+static PyObject *__pyx_tuple__117;
+static PyObject *__pyx_tuple__118;
+static PyObject *__pyx_tuple__119;
+static PyObject *__pyx_tuple__120;
+static PyObject *__pyx_tuple__121;
+static PyObject *__pyx_tuple__122;
+static PyObject *__pyx_tuple__123;
+static PyObject *__pyx_tuple__124;
+static PyObject *__pyx_tuple__125;
+static PyObject *__pyx_tuple__126;
+static PyObject *__pyx_tuple__127;
+static PyObject *__pyx_tuple__128;
+static PyObject *__pyx_tuple__129;
+static PyObject *__pyx_tuple__130;
+static PyObject *__pyx_tuple__131;
+static PyObject *__pyx_tuple__132;
+static PyObject *__pyx_tuple__133;
+static PyObject *__pyx_tuple__134;
+static PyObject *__pyx_tuple__135;
+static PyObject *__pyx_tuple__136;
+static PyObject *__pyx_tuple__137;
+static PyObject *__pyx_tuple__138;
+static PyObject *__pyx_tuple__139;
+static PyObject *__pyx_tuple__140;
+static PyObject *__pyx_tuple__141;
+static PyObject *__pyx_tuple__142;
+static PyObject *__pyx_tuple__143;
+static PyObject *__pyx_tuple__144;
+static PyObject *__pyx_tuple__145;
+static PyObject *__pyx_tuple__146;
+static PyObject *__pyx_tuple__147;
+static PyObject *__pyx_tuple__148;
+static PyObject *__pyx_tuple__149;
+static PyObject *__pyx_tuple__150;
+static PyObject *__pyx_tuple__151;
+static PyObject *__pyx_tuple__152;
+static PyObject *__pyx_tuple__153;
+static PyObject *__pyx_tuple__154;
+static PyObject *__pyx_tuple__155;
+static PyObject *__pyx_tuple__156;
+static PyObject *__pyx_tuple__157;
+static PyObject *__pyx_tuple__158;
+static PyObject *__pyx_tuple__159;
+static PyObject *__pyx_tuple__160;
+static PyObject *__pyx_tuple__161;
+static PyObject *__pyx_tuple__162;
+static PyObject *__pyx_tuple__163;
+static PyObject *__pyx_tuple__164;
+static PyObject *__pyx_tuple__165;
+static PyObject *__pyx_tuple__166;
+static PyObject *__pyx_tuple__167;
+static PyObject *__pyx_tuple__168;
+static PyObject *__pyx_tuple__169;
+static PyObject *__pyx_tuple__170;
+static PyObject *__pyx_tuple__171;
+static PyObject *__pyx_tuple__172;
+static PyObject *__pyx_tuple__173;
+static PyObject *__pyx_tuple__174;
+static PyObject *__pyx_tuple__175;
+static PyObject *__pyx_tuple__176;
+static PyObject *__pyx_tuple__177;
+static PyObject *__pyx_tuple__178;
+static PyObject *__pyx_tuple__179;
+static PyObject *__pyx_tuple__180;
+static PyObject *__pyx_tuple__181;
+static PyObject *__pyx_tuple__182;
+static PyObject *__pyx_tuple__183;
+static PyObject *__pyx_tuple__184;
+static PyObject *__pyx_tuple__185;
+static PyObject *__pyx_tuple__186;
+static PyObject *__pyx_tuple__187;
+static PyObject *__pyx_tuple__188;
+static PyObject *__pyx_tuple__189;
+static PyObject *__pyx_tuple__190;
+static PyObject *__pyx_tuple__191;
+static PyObject *__pyx_tuple__192;
+static PyObject *__pyx_tuple__193;
+static PyObject *__pyx_tuple__194;
+static PyObject *__pyx_tuple__195;
+static PyObject *__pyx_tuple__196;
+static PyObject *__pyx_tuple__197;
+static PyObject *__pyx_tuple__198;
+static PyObject *__pyx_tuple__199;
+static PyObject *__pyx_tuple__200;
+static PyObject *__pyx_tuple__201;
+static PyObject *__pyx_tuple__202;
+static PyObject *__pyx_tuple__203;
+static PyObject *__pyx_tuple__204;
+static PyObject *__pyx_tuple__205;
+static PyObject *__pyx_tuple__206;
+static PyObject *__pyx_tuple__207;
+static PyObject *__pyx_codeobj__10;
+/* Late includes */
+
+/* "rmgpy/molecule/element.py":75
+ *     """
+ * 
+ *     def __init__(self, number, symbol, name, mass, isotope=-1, chemkin_name=None):             # <<<<<<<<<<<<<<
+ *         self.number = number
+ *         self.symbol = symbol
+ */
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8molecule_7element_7Element_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_5rmgpy_8molecule_7element_7Element_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_number = 0;
+  PyObject *__pyx_v_symbol = 0;
+  PyObject *__pyx_v_name = 0;
+  PyObject *__pyx_v_mass = 0;
+  PyObject *__pyx_v_isotope = 0;
+  PyObject *__pyx_v_chemkin_name = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_number,&__pyx_n_s_symbol,&__pyx_n_s_name,&__pyx_n_s_mass,&__pyx_n_s_isotope,&__pyx_n_s_chemkin_name,0};
+    PyObject* values[6] = {0,0,0,0,0,0};
+    values[4] = ((PyObject *)__pyx_int_neg_1);
+    values[5] = ((PyObject *)Py_None);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_number)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_symbol)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__init__", 0, 4, 6, 1); __PYX_ERR(0, 75, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_name)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__init__", 0, 4, 6, 2); __PYX_ERR(0, 75, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_mass)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__init__", 0, 4, 6, 3); __PYX_ERR(0, 75, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_isotope);
+          if (value) { values[4] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_chemkin_name);
+          if (value) { values[5] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 75, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_number = values[0];
+    __pyx_v_symbol = values[1];
+    __pyx_v_name = values[2];
+    __pyx_v_mass = values[3];
+    __pyx_v_isotope = values[4];
+    __pyx_v_chemkin_name = values[5];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 4, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 75, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("rmgpy.molecule.element.Element.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_7element_7Element___init__(((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)__pyx_v_self), __pyx_v_number, __pyx_v_symbol, __pyx_v_name, __pyx_v_mass, __pyx_v_isotope, __pyx_v_chemkin_name);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8molecule_7element_7Element___init__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self, PyObject *__pyx_v_number, PyObject *__pyx_v_symbol, PyObject *__pyx_v_name, PyObject *__pyx_v_mass, PyObject *__pyx_v_isotope, PyObject *__pyx_v_chemkin_name) {
+  PyObject *__pyx_v_logging = NULL;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  float __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "rmgpy/molecule/element.py":76
+ * 
+ *     def __init__(self, number, symbol, name, mass, isotope=-1, chemkin_name=None):
+ *         self.number = number             # <<<<<<<<<<<<<<
+ *         self.symbol = symbol
+ *         self.name = name
+ */
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_number); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 76, __pyx_L1_error)
+  __pyx_v_self->number = __pyx_t_1;
+
+  /* "rmgpy/molecule/element.py":77
+ *     def __init__(self, number, symbol, name, mass, isotope=-1, chemkin_name=None):
+ *         self.number = number
+ *         self.symbol = symbol             # <<<<<<<<<<<<<<
+ *         self.name = name
+ *         self.mass = mass
+ */
+  if (!(likely(PyUnicode_CheckExact(__pyx_v_symbol))||((__pyx_v_symbol) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_v_symbol)->tp_name), 0))) __PYX_ERR(0, 77, __pyx_L1_error)
+  __pyx_t_2 = __pyx_v_symbol;
+  __Pyx_INCREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __Pyx_GOTREF(__pyx_v_self->symbol);
+  __Pyx_DECREF(__pyx_v_self->symbol);
+  __pyx_v_self->symbol = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "rmgpy/molecule/element.py":78
+ *         self.number = number
+ *         self.symbol = symbol
+ *         self.name = name             # <<<<<<<<<<<<<<
+ *         self.mass = mass
+ *         self.isotope = isotope
+ */
+  if (!(likely(PyUnicode_CheckExact(__pyx_v_name))||((__pyx_v_name) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_v_name)->tp_name), 0))) __PYX_ERR(0, 78, __pyx_L1_error)
+  __pyx_t_2 = __pyx_v_name;
+  __Pyx_INCREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __Pyx_GOTREF(__pyx_v_self->name);
+  __Pyx_DECREF(__pyx_v_self->name);
+  __pyx_v_self->name = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "rmgpy/molecule/element.py":79
+ *         self.symbol = symbol
+ *         self.name = name
+ *         self.mass = mass             # <<<<<<<<<<<<<<
+ *         self.isotope = isotope
+ *         self.chemkin_name = chemkin_name or self.name
+ */
+  __pyx_t_3 = __pyx_PyFloat_AsFloat(__pyx_v_mass); if (unlikely((__pyx_t_3 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 79, __pyx_L1_error)
+  __pyx_v_self->mass = __pyx_t_3;
+
+  /* "rmgpy/molecule/element.py":80
+ *         self.name = name
+ *         self.mass = mass
+ *         self.isotope = isotope             # <<<<<<<<<<<<<<
+ *         self.chemkin_name = chemkin_name or self.name
+ *         if symbol == 'X':
+ */
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_isotope); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 80, __pyx_L1_error)
+  __pyx_v_self->isotope = __pyx_t_1;
+
+  /* "rmgpy/molecule/element.py":81
+ *         self.mass = mass
+ *         self.isotope = isotope
+ *         self.chemkin_name = chemkin_name or self.name             # <<<<<<<<<<<<<<
+ *         if symbol == 'X':
+ *             self.cov_radius = 0
+ */
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_chemkin_name); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 81, __pyx_L1_error)
+  if (!__pyx_t_4) {
+  } else {
+    if (!(likely(PyUnicode_CheckExact(__pyx_v_chemkin_name))||((__pyx_v_chemkin_name) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_v_chemkin_name)->tp_name), 0))) __PYX_ERR(0, 81, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_chemkin_name);
+    __pyx_t_2 = __pyx_v_chemkin_name;
+    goto __pyx_L3_bool_binop_done;
+  }
+  __Pyx_INCREF(__pyx_v_self->name);
+  __pyx_t_2 = __pyx_v_self->name;
+  __pyx_L3_bool_binop_done:;
+  __Pyx_GIVEREF(__pyx_t_2);
+  __Pyx_GOTREF(__pyx_v_self->chemkin_name);
+  __Pyx_DECREF(__pyx_v_self->chemkin_name);
+  __pyx_v_self->chemkin_name = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "rmgpy/molecule/element.py":82
+ *         self.isotope = isotope
+ *         self.chemkin_name = chemkin_name or self.name
+ *         if symbol == 'X':             # <<<<<<<<<<<<<<
+ *             self.cov_radius = 0
+ *         else:
+ */
+  __pyx_t_4 = (__Pyx_PyUnicode_Equals(__pyx_v_symbol, __pyx_n_u_X, Py_EQ)); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 82, __pyx_L1_error)
+  if (__pyx_t_4) {
+
+    /* "rmgpy/molecule/element.py":83
+ *         self.chemkin_name = chemkin_name or self.name
+ *         if symbol == 'X':
+ *             self.cov_radius = 0             # <<<<<<<<<<<<<<
+ *         else:
+ *             try:
+ */
+    __pyx_v_self->cov_radius = 0.0;
+
+    /* "rmgpy/molecule/element.py":82
+ *         self.isotope = isotope
+ *         self.chemkin_name = chemkin_name or self.name
+ *         if symbol == 'X':             # <<<<<<<<<<<<<<
+ *             self.cov_radius = 0
+ *         else:
+ */
+    goto __pyx_L5;
+  }
+
+  /* "rmgpy/molecule/element.py":85
+ *             self.cov_radius = 0
+ *         else:
+ *             try:             # <<<<<<<<<<<<<<
+ *                 self.cov_radius = _rdkit_periodic_table.GetRcovalent(symbol)
+ *             except RuntimeError:
+ */
+  /*else*/ {
+    {
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __Pyx_ExceptionSave(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7);
+      __Pyx_XGOTREF(__pyx_t_5);
+      __Pyx_XGOTREF(__pyx_t_6);
+      __Pyx_XGOTREF(__pyx_t_7);
+      /*try:*/ {
+
+        /* "rmgpy/molecule/element.py":86
+ *         else:
+ *             try:
+ *                 self.cov_radius = _rdkit_periodic_table.GetRcovalent(symbol)             # <<<<<<<<<<<<<<
+ *             except RuntimeError:
+ *                 import logging
+ */
+        __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_n_s_rdkit_periodic_table); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 86, __pyx_L6_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_GetRcovalent); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 86, __pyx_L6_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __pyx_t_8 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_9))) {
+          __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_9);
+          if (likely(__pyx_t_8)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+            __Pyx_INCREF(__pyx_t_8);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_9, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_8, __pyx_v_symbol) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_v_symbol);
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 86, __pyx_L6_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_t_3 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_3 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 86, __pyx_L6_error)
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __pyx_v_self->cov_radius = __pyx_t_3;
+
+        /* "rmgpy/molecule/element.py":85
+ *             self.cov_radius = 0
+ *         else:
+ *             try:             # <<<<<<<<<<<<<<
+ *                 self.cov_radius = _rdkit_periodic_table.GetRcovalent(symbol)
+ *             except RuntimeError:
+ */
+      }
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      goto __pyx_L11_try_end;
+      __pyx_L6_error:;
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+      /* "rmgpy/molecule/element.py":87
+ *             try:
+ *                 self.cov_radius = _rdkit_periodic_table.GetRcovalent(symbol)
+ *             except RuntimeError:             # <<<<<<<<<<<<<<
+ *                 import logging
+ *                 logging.error("RDkit doesn't know element {0} so covalent radius unknown".format(symbol))
+ */
+      __pyx_t_1 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_RuntimeError);
+      if (__pyx_t_1) {
+        __Pyx_AddTraceback("rmgpy.molecule.element.Element.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+        if (__Pyx_GetException(&__pyx_t_2, &__pyx_t_9, &__pyx_t_8) < 0) __PYX_ERR(0, 87, __pyx_L8_except_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_GOTREF(__pyx_t_8);
+
+        /* "rmgpy/molecule/element.py":88
+ *                 self.cov_radius = _rdkit_periodic_table.GetRcovalent(symbol)
+ *             except RuntimeError:
+ *                 import logging             # <<<<<<<<<<<<<<
+ *                 logging.error("RDkit doesn't know element {0} so covalent radius unknown".format(symbol))
+ *                 self.cov_radius = 0
+ */
+        __pyx_t_10 = __Pyx_Import(__pyx_n_s_logging, 0, 0); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 88, __pyx_L8_except_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __pyx_v_logging = __pyx_t_10;
+        __pyx_t_10 = 0;
+
+        /* "rmgpy/molecule/element.py":89
+ *             except RuntimeError:
+ *                 import logging
+ *                 logging.error("RDkit doesn't know element {0} so covalent radius unknown".format(symbol))             # <<<<<<<<<<<<<<
+ *                 self.cov_radius = 0
+ * 
+ */
+        __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_v_logging, __pyx_n_s_error); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 89, __pyx_L8_except_error)
+        __Pyx_GOTREF(__pyx_t_11);
+        __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_RDkit_doesn_t_know_element_0_so, __pyx_n_s_format); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 89, __pyx_L8_except_error)
+        __Pyx_GOTREF(__pyx_t_13);
+        __pyx_t_14 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_13))) {
+          __pyx_t_14 = PyMethod_GET_SELF(__pyx_t_13);
+          if (likely(__pyx_t_14)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_13);
+            __Pyx_INCREF(__pyx_t_14);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_13, function);
+          }
+        }
+        __pyx_t_12 = (__pyx_t_14) ? __Pyx_PyObject_Call2Args(__pyx_t_13, __pyx_t_14, __pyx_v_symbol) : __Pyx_PyObject_CallOneArg(__pyx_t_13, __pyx_v_symbol);
+        __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
+        if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 89, __pyx_L8_except_error)
+        __Pyx_GOTREF(__pyx_t_12);
+        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+        __pyx_t_13 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_11))) {
+          __pyx_t_13 = PyMethod_GET_SELF(__pyx_t_11);
+          if (likely(__pyx_t_13)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_11);
+            __Pyx_INCREF(__pyx_t_13);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_11, function);
+          }
+        }
+        __pyx_t_10 = (__pyx_t_13) ? __Pyx_PyObject_Call2Args(__pyx_t_11, __pyx_t_13, __pyx_t_12) : __Pyx_PyObject_CallOneArg(__pyx_t_11, __pyx_t_12);
+        __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
+        __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+        if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 89, __pyx_L8_except_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+
+        /* "rmgpy/molecule/element.py":90
+ *                 import logging
+ *                 logging.error("RDkit doesn't know element {0} so covalent radius unknown".format(symbol))
+ *                 self.cov_radius = 0             # <<<<<<<<<<<<<<
+ * 
+ *     def __str__(self):
+ */
+        __pyx_v_self->cov_radius = 0.0;
+        __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        goto __pyx_L7_exception_handled;
+      }
+      goto __pyx_L8_except_error;
+      __pyx_L8_except_error:;
+
+      /* "rmgpy/molecule/element.py":85
+ *             self.cov_radius = 0
+ *         else:
+ *             try:             # <<<<<<<<<<<<<<
+ *                 self.cov_radius = _rdkit_periodic_table.GetRcovalent(symbol)
+ *             except RuntimeError:
+ */
+      __Pyx_XGIVEREF(__pyx_t_5);
+      __Pyx_XGIVEREF(__pyx_t_6);
+      __Pyx_XGIVEREF(__pyx_t_7);
+      __Pyx_ExceptionReset(__pyx_t_5, __pyx_t_6, __pyx_t_7);
+      goto __pyx_L1_error;
+      __pyx_L7_exception_handled:;
+      __Pyx_XGIVEREF(__pyx_t_5);
+      __Pyx_XGIVEREF(__pyx_t_6);
+      __Pyx_XGIVEREF(__pyx_t_7);
+      __Pyx_ExceptionReset(__pyx_t_5, __pyx_t_6, __pyx_t_7);
+      __pyx_L11_try_end:;
+    }
+  }
+  __pyx_L5:;
+
+  /* "rmgpy/molecule/element.py":75
+ *     """
+ * 
+ *     def __init__(self, number, symbol, name, mass, isotope=-1, chemkin_name=None):             # <<<<<<<<<<<<<<
+ *         self.number = number
+ *         self.symbol = symbol
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_14);
+  __Pyx_AddTraceback("rmgpy.molecule.element.Element.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_logging);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/molecule/element.py":92
+ *                 self.cov_radius = 0
+ * 
+ *     def __str__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Return a human-readable string representation of the object.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8molecule_7element_7Element_3__str__(PyObject *__pyx_v_self); /*proto*/
+static char __pyx_doc_5rmgpy_8molecule_7element_7Element_2__str__[] = "\n        Return a human-readable string representation of the object.\n        ";
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_5rmgpy_8molecule_7element_7Element_2__str__;
+#endif
+static PyObject *__pyx_pw_5rmgpy_8molecule_7element_7Element_3__str__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__str__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_7element_7Element_2__str__(((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8molecule_7element_7Element_2__str__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__str__", 0);
+
+  /* "rmgpy/molecule/element.py":96
+ *         Return a human-readable string representation of the object.
+ *         """
+ *         return self.symbol             # <<<<<<<<<<<<<<
+ * 
+ *     def __repr__(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->symbol);
+  __pyx_r = __pyx_v_self->symbol;
+  goto __pyx_L0;
+
+  /* "rmgpy/molecule/element.py":92
+ *                 self.cov_radius = 0
+ * 
+ *     def __str__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Return a human-readable string representation of the object.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/molecule/element.py":98
+ *         return self.symbol
+ * 
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Return a representation that can be used to reconstruct the object.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8molecule_7element_7Element_5__repr__(PyObject *__pyx_v_self); /*proto*/
+static char __pyx_doc_5rmgpy_8molecule_7element_7Element_4__repr__[] = "\n        Return a representation that can be used to reconstruct the object.\n        ";
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_5rmgpy_8molecule_7element_7Element_4__repr__;
+#endif
+static PyObject *__pyx_pw_5rmgpy_8molecule_7element_7Element_5__repr__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__repr__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_7element_7Element_4__repr__(((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8molecule_7element_7Element_4__repr__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  Py_UCS4 __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__repr__", 0);
+
+  /* "rmgpy/molecule/element.py":102
+ *         Return a representation that can be used to reconstruct the object.
+ *         """
+ *         return "Element(%s, '%s', '%s', %s, %s)" % (self.number, self.symbol, self.name, self.mass, self.isotope)             # <<<<<<<<<<<<<<
+ * 
+ *     def __reduce__(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyTuple_New(11); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = 0;
+  __pyx_t_3 = 127;
+  __Pyx_INCREF(__pyx_kp_u_Element);
+  __pyx_t_2 += 8;
+  __Pyx_GIVEREF(__pyx_kp_u_Element);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_kp_u_Element);
+  __pyx_t_4 = __Pyx_PyUnicode_From_int(__pyx_v_self->number, 0, ' ', 'd'); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __Pyx_INCREF(__pyx_kp_u_);
+  __pyx_t_2 += 3;
+  __Pyx_GIVEREF(__pyx_kp_u_);
+  PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_kp_u_);
+  __pyx_t_4 = __Pyx_PyUnicode_Unicode(__pyx_v_self->symbol); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_4) > __pyx_t_3) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_4) : __pyx_t_3;
+  __pyx_t_2 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_1, 3, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __Pyx_INCREF(__pyx_kp_u__2);
+  __pyx_t_2 += 4;
+  __Pyx_GIVEREF(__pyx_kp_u__2);
+  PyTuple_SET_ITEM(__pyx_t_1, 4, __pyx_kp_u__2);
+  __pyx_t_4 = __Pyx_PyUnicode_Unicode(__pyx_v_self->name); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_4) > __pyx_t_3) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_4) : __pyx_t_3;
+  __pyx_t_2 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_1, 5, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __Pyx_INCREF(__pyx_kp_u__3);
+  __pyx_t_2 += 3;
+  __Pyx_GIVEREF(__pyx_kp_u__3);
+  PyTuple_SET_ITEM(__pyx_t_1, 6, __pyx_kp_u__3);
+  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_self->mass); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_FormatSimpleAndDecref(PyObject_Unicode(__pyx_t_4), __pyx_empty_unicode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_3 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_5) > __pyx_t_3) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_5) : __pyx_t_3;
+  __pyx_t_2 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_1, 7, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __Pyx_INCREF(__pyx_kp_u__4);
+  __pyx_t_2 += 2;
+  __Pyx_GIVEREF(__pyx_kp_u__4);
+  PyTuple_SET_ITEM(__pyx_t_1, 8, __pyx_kp_u__4);
+  __pyx_t_5 = __Pyx_PyUnicode_From_int(__pyx_v_self->isotope, 0, ' ', 'd'); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_2 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_1, 9, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __Pyx_INCREF(__pyx_kp_u__5);
+  __pyx_t_2 += 1;
+  __Pyx_GIVEREF(__pyx_kp_u__5);
+  PyTuple_SET_ITEM(__pyx_t_1, 10, __pyx_kp_u__5);
+  __pyx_t_5 = __Pyx_PyUnicode_Join(__pyx_t_1, 11, __pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_5;
+  __pyx_t_5 = 0;
+  goto __pyx_L0;
+
+  /* "rmgpy/molecule/element.py":98
+ *         return self.symbol
+ * 
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Return a representation that can be used to reconstruct the object.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("rmgpy.molecule.element.Element.__repr__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/molecule/element.py":104
+ *         return "Element(%s, '%s', '%s', %s, %s)" % (self.number, self.symbol, self.name, self.mass, self.isotope)
+ * 
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         A helper function used when pickling an object.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8molecule_7element_7Element_7__reduce__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_5rmgpy_8molecule_7element_7Element_6__reduce__[] = "\n        A helper function used when pickling an object.\n        ";
+static PyMethodDef __pyx_mdef_5rmgpy_8molecule_7element_7Element_7__reduce__ = {"__reduce__", (PyCFunction)__pyx_pw_5rmgpy_8molecule_7element_7Element_7__reduce__, METH_NOARGS, __pyx_doc_5rmgpy_8molecule_7element_7Element_6__reduce__};
+static PyObject *__pyx_pw_5rmgpy_8molecule_7element_7Element_7__reduce__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_7element_7Element_6__reduce__(((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8molecule_7element_7Element_6__reduce__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce__", 0);
+
+  /* "rmgpy/molecule/element.py":108
+ *         A helper function used when pickling an object.
+ *         """
+ *         return (Element, (self.number, self.symbol, self.name, self.mass, self.isotope))             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->number); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 108, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->mass); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 108, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_self->isotope); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 108, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyTuple_New(5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 108, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_1);
+  __Pyx_INCREF(__pyx_v_self->symbol);
+  __Pyx_GIVEREF(__pyx_v_self->symbol);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_v_self->symbol);
+  __Pyx_INCREF(__pyx_v_self->name);
+  __Pyx_GIVEREF(__pyx_v_self->name);
+  PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_v_self->name);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_4, 3, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_4, 4, __pyx_t_3);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 108, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element));
+  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element));
+  PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element));
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "rmgpy/molecule/element.py":104
+ *         return "Element(%s, '%s', '%s', %s, %s)" % (self.number, self.symbol, self.name, self.mass, self.isotope)
+ * 
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         A helper function used when pickling an object.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("rmgpy.molecule.element.Element.__reduce__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/molecule/element.pxd":30
+ * cdef class Element:
+ * 
+ *     cdef public int number             # <<<<<<<<<<<<<<
+ *     cdef public str name
+ *     cdef public str symbol
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8molecule_7element_7Element_6number_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5rmgpy_8molecule_7element_7Element_6number_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_7element_7Element_6number___get__(((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8molecule_7element_7Element_6number___get__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->number); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 30, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("rmgpy.molecule.element.Element.number.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8molecule_7element_7Element_6number_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_5rmgpy_8molecule_7element_7Element_6number_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_7element_7Element_6number_2__set__(((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8molecule_7element_7Element_6number_2__set__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 30, __pyx_L1_error)
+  __pyx_v_self->number = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("rmgpy.molecule.element.Element.number.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/molecule/element.pxd":31
+ * 
+ *     cdef public int number
+ *     cdef public str name             # <<<<<<<<<<<<<<
+ *     cdef public str symbol
+ *     cdef public float mass
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8molecule_7element_7Element_4name_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5rmgpy_8molecule_7element_7Element_4name_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_7element_7Element_4name___get__(((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8molecule_7element_7Element_4name___get__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->name);
+  __pyx_r = __pyx_v_self->name;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8molecule_7element_7Element_4name_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_5rmgpy_8molecule_7element_7Element_4name_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_7element_7Element_4name_2__set__(((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8molecule_7element_7Element_4name_2__set__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  if (!(likely(PyUnicode_CheckExact(__pyx_v_value))||((__pyx_v_value) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_v_value)->tp_name), 0))) __PYX_ERR(1, 31, __pyx_L1_error)
+  __pyx_t_1 = __pyx_v_value;
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_self->name);
+  __Pyx_DECREF(__pyx_v_self->name);
+  __pyx_v_self->name = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("rmgpy.molecule.element.Element.name.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8molecule_7element_7Element_4name_5__del__(PyObject *__pyx_v_self); /*proto*/
+static int __pyx_pw_5rmgpy_8molecule_7element_7Element_4name_5__del__(PyObject *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_7element_7Element_4name_4__del__(((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8molecule_7element_7Element_4name_4__del__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__", 0);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->name);
+  __Pyx_DECREF(__pyx_v_self->name);
+  __pyx_v_self->name = ((PyObject*)Py_None);
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/molecule/element.pxd":32
+ *     cdef public int number
+ *     cdef public str name
+ *     cdef public str symbol             # <<<<<<<<<<<<<<
+ *     cdef public float mass
+ *     cdef public float cov_radius
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8molecule_7element_7Element_6symbol_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5rmgpy_8molecule_7element_7Element_6symbol_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_7element_7Element_6symbol___get__(((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8molecule_7element_7Element_6symbol___get__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->symbol);
+  __pyx_r = __pyx_v_self->symbol;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8molecule_7element_7Element_6symbol_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_5rmgpy_8molecule_7element_7Element_6symbol_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_7element_7Element_6symbol_2__set__(((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8molecule_7element_7Element_6symbol_2__set__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  if (!(likely(PyUnicode_CheckExact(__pyx_v_value))||((__pyx_v_value) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_v_value)->tp_name), 0))) __PYX_ERR(1, 32, __pyx_L1_error)
+  __pyx_t_1 = __pyx_v_value;
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_self->symbol);
+  __Pyx_DECREF(__pyx_v_self->symbol);
+  __pyx_v_self->symbol = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("rmgpy.molecule.element.Element.symbol.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8molecule_7element_7Element_6symbol_5__del__(PyObject *__pyx_v_self); /*proto*/
+static int __pyx_pw_5rmgpy_8molecule_7element_7Element_6symbol_5__del__(PyObject *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_7element_7Element_6symbol_4__del__(((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8molecule_7element_7Element_6symbol_4__del__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__", 0);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->symbol);
+  __Pyx_DECREF(__pyx_v_self->symbol);
+  __pyx_v_self->symbol = ((PyObject*)Py_None);
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/molecule/element.pxd":33
+ *     cdef public str name
+ *     cdef public str symbol
+ *     cdef public float mass             # <<<<<<<<<<<<<<
+ *     cdef public float cov_radius
+ *     cdef public int isotope
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8molecule_7element_7Element_4mass_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5rmgpy_8molecule_7element_7Element_4mass_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_7element_7Element_4mass___get__(((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8molecule_7element_7Element_4mass___get__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->mass); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 33, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("rmgpy.molecule.element.Element.mass.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8molecule_7element_7Element_4mass_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_5rmgpy_8molecule_7element_7Element_4mass_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_7element_7Element_4mass_2__set__(((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8molecule_7element_7Element_4mass_2__set__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  float __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_value); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) __PYX_ERR(1, 33, __pyx_L1_error)
+  __pyx_v_self->mass = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("rmgpy.molecule.element.Element.mass.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/molecule/element.pxd":34
+ *     cdef public str symbol
+ *     cdef public float mass
+ *     cdef public float cov_radius             # <<<<<<<<<<<<<<
+ *     cdef public int isotope
+ *     cdef public str chemkin_name
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8molecule_7element_7Element_10cov_radius_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5rmgpy_8molecule_7element_7Element_10cov_radius_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_7element_7Element_10cov_radius___get__(((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8molecule_7element_7Element_10cov_radius___get__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->cov_radius); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 34, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("rmgpy.molecule.element.Element.cov_radius.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8molecule_7element_7Element_10cov_radius_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_5rmgpy_8molecule_7element_7Element_10cov_radius_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_7element_7Element_10cov_radius_2__set__(((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8molecule_7element_7Element_10cov_radius_2__set__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  float __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_value); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) __PYX_ERR(1, 34, __pyx_L1_error)
+  __pyx_v_self->cov_radius = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("rmgpy.molecule.element.Element.cov_radius.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/molecule/element.pxd":35
+ *     cdef public float mass
+ *     cdef public float cov_radius
+ *     cdef public int isotope             # <<<<<<<<<<<<<<
+ *     cdef public str chemkin_name
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8molecule_7element_7Element_7isotope_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5rmgpy_8molecule_7element_7Element_7isotope_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_7element_7Element_7isotope___get__(((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8molecule_7element_7Element_7isotope___get__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->isotope); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 35, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("rmgpy.molecule.element.Element.isotope.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8molecule_7element_7Element_7isotope_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_5rmgpy_8molecule_7element_7Element_7isotope_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_7element_7Element_7isotope_2__set__(((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8molecule_7element_7Element_7isotope_2__set__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 35, __pyx_L1_error)
+  __pyx_v_self->isotope = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("rmgpy.molecule.element.Element.isotope.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/molecule/element.pxd":36
+ *     cdef public float cov_radius
+ *     cdef public int isotope
+ *     cdef public str chemkin_name             # <<<<<<<<<<<<<<
+ * 
+ * cpdef Element get_element(value, int isotope=?)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8molecule_7element_7Element_12chemkin_name_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5rmgpy_8molecule_7element_7Element_12chemkin_name_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_7element_7Element_12chemkin_name___get__(((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8molecule_7element_7Element_12chemkin_name___get__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->chemkin_name);
+  __pyx_r = __pyx_v_self->chemkin_name;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8molecule_7element_7Element_12chemkin_name_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_5rmgpy_8molecule_7element_7Element_12chemkin_name_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_7element_7Element_12chemkin_name_2__set__(((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8molecule_7element_7Element_12chemkin_name_2__set__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  if (!(likely(PyUnicode_CheckExact(__pyx_v_value))||((__pyx_v_value) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_v_value)->tp_name), 0))) __PYX_ERR(1, 36, __pyx_L1_error)
+  __pyx_t_1 = __pyx_v_value;
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_self->chemkin_name);
+  __Pyx_DECREF(__pyx_v_self->chemkin_name);
+  __pyx_v_self->chemkin_name = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("rmgpy.molecule.element.Element.chemkin_name.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_5rmgpy_8molecule_7element_7Element_12chemkin_name_5__del__(PyObject *__pyx_v_self); /*proto*/
+static int __pyx_pw_5rmgpy_8molecule_7element_7Element_12chemkin_name_5__del__(PyObject *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_7element_7Element_12chemkin_name_4__del__(((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5rmgpy_8molecule_7element_7Element_12chemkin_name_4__del__(struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__", 0);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->chemkin_name);
+  __Pyx_DECREF(__pyx_v_self->chemkin_name);
+  __pyx_v_self->chemkin_name = ((PyObject*)Py_None);
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/molecule/element.py":139
+ * 
+ * 
+ * def get_element(value, isotope=-1):             # <<<<<<<<<<<<<<
+ *     """
+ *     Return the :class:`Element` object corresponding to the given parameter
+ */
+
+static PyObject *__pyx_pw_5rmgpy_8molecule_7element_1get_element(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_f_5rmgpy_8molecule_7element_get_element(PyObject *__pyx_v_value, CYTHON_UNUSED int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_7element_get_element *__pyx_optional_args) {
+  int __pyx_v_isotope = ((int)-1);
+  struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_v_element = 0;
+  int __pyx_v_number;
+  PyObject *__pyx_v_symbol = 0;
+  struct __pyx_obj_5rmgpy_8molecule_7element_Element *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  Py_ssize_t __pyx_t_6;
+  PyObject *(*__pyx_t_7)(PyObject *);
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  int __pyx_t_11;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_element", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_isotope = __pyx_optional_args->isotope;
+    }
+  }
+
+  /* "rmgpy/molecule/element.py":147
+ *     """
+ *     cython.declare(element=Element, number=cython.int, symbol=str)
+ *     if isinstance(value, int):             # <<<<<<<<<<<<<<
+ *         # The parameter is an integer; assume this is the atomic number
+ *         number = value
+ */
+  __pyx_t_1 = PyInt_Check(__pyx_v_value); 
+  __pyx_t_2 = (__pyx_t_1 != 0);
+  if (__pyx_t_2) {
+
+    /* "rmgpy/molecule/element.py":149
+ *     if isinstance(value, int):
+ *         # The parameter is an integer; assume this is the atomic number
+ *         number = value             # <<<<<<<<<<<<<<
+ *         for element in element_list:
+ *             if element.number == number and element.isotope == isotope:
+ */
+    __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 149, __pyx_L1_error)
+    __pyx_v_number = __pyx_t_3;
+
+    /* "rmgpy/molecule/element.py":150
+ *         # The parameter is an integer; assume this is the atomic number
+ *         number = value
+ *         for element in element_list:             # <<<<<<<<<<<<<<
+ *             if element.number == number and element.isotope == isotope:
+ *                 return element
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_element_list); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 150, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    if (likely(PyList_CheckExact(__pyx_t_4)) || PyTuple_CheckExact(__pyx_t_4)) {
+      __pyx_t_5 = __pyx_t_4; __Pyx_INCREF(__pyx_t_5); __pyx_t_6 = 0;
+      __pyx_t_7 = NULL;
+    } else {
+      __pyx_t_6 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 150, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_7 = Py_TYPE(__pyx_t_5)->tp_iternext; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 150, __pyx_L1_error)
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    for (;;) {
+      if (likely(!__pyx_t_7)) {
+        if (likely(PyList_CheckExact(__pyx_t_5))) {
+          if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_5)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_4 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_6); __Pyx_INCREF(__pyx_t_4); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(0, 150, __pyx_L1_error)
+          #else
+          __pyx_t_4 = PySequence_ITEM(__pyx_t_5, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 150, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          #endif
+        } else {
+          if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_5)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_6); __Pyx_INCREF(__pyx_t_4); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(0, 150, __pyx_L1_error)
+          #else
+          __pyx_t_4 = PySequence_ITEM(__pyx_t_5, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 150, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          #endif
+        }
+      } else {
+        __pyx_t_4 = __pyx_t_7(__pyx_t_5);
+        if (unlikely(!__pyx_t_4)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 150, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_4);
+      }
+      if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5rmgpy_8molecule_7element_Element))))) __PYX_ERR(0, 150, __pyx_L1_error)
+      __Pyx_XDECREF_SET(__pyx_v_element, ((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)__pyx_t_4));
+      __pyx_t_4 = 0;
+
+      /* "rmgpy/molecule/element.py":151
+ *         number = value
+ *         for element in element_list:
+ *             if element.number == number and element.isotope == isotope:             # <<<<<<<<<<<<<<
+ *                 return element
+ *         # If we reach this point that means we did not find an appropriate element,
+ */
+      __pyx_t_1 = ((__pyx_v_element->number == __pyx_v_number) != 0);
+      if (__pyx_t_1) {
+      } else {
+        __pyx_t_2 = __pyx_t_1;
+        goto __pyx_L7_bool_binop_done;
+      }
+      __pyx_t_1 = ((__pyx_v_element->isotope == __pyx_v_isotope) != 0);
+      __pyx_t_2 = __pyx_t_1;
+      __pyx_L7_bool_binop_done:;
+      if (__pyx_t_2) {
+
+        /* "rmgpy/molecule/element.py":152
+ *         for element in element_list:
+ *             if element.number == number and element.isotope == isotope:
+ *                 return element             # <<<<<<<<<<<<<<
+ *         # If we reach this point that means we did not find an appropriate element,
+ *         # so we raise an exception
+ */
+        __Pyx_XDECREF(((PyObject *)__pyx_r));
+        __Pyx_INCREF(((PyObject *)__pyx_v_element));
+        __pyx_r = __pyx_v_element;
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        goto __pyx_L0;
+
+        /* "rmgpy/molecule/element.py":151
+ *         number = value
+ *         for element in element_list:
+ *             if element.number == number and element.isotope == isotope:             # <<<<<<<<<<<<<<
+ *                 return element
+ *         # If we reach this point that means we did not find an appropriate element,
+ */
+      }
+
+      /* "rmgpy/molecule/element.py":150
+ *         # The parameter is an integer; assume this is the atomic number
+ *         number = value
+ *         for element in element_list:             # <<<<<<<<<<<<<<
+ *             if element.number == number and element.isotope == isotope:
+ *                 return element
+ */
+    }
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "rmgpy/molecule/element.py":155
+ *         # If we reach this point that means we did not find an appropriate element,
+ *         # so we raise an exception
+ *         raise ElementError("No element found with atomic number %i, and isotope %i" % (number, isotope))             # <<<<<<<<<<<<<<
+ *     elif isinstance(value, str):
+ *         # The parameter is a string; assume this is the element symbol
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_ElementError); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 155, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_8 = __Pyx_PyInt_From_int(__pyx_v_number); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 155, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_isotope); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 155, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_10 = PyTuple_New(2); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 155, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_GIVEREF(__pyx_t_8);
+    PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_8);
+    __Pyx_GIVEREF(__pyx_t_9);
+    PyTuple_SET_ITEM(__pyx_t_10, 1, __pyx_t_9);
+    __pyx_t_8 = 0;
+    __pyx_t_9 = 0;
+    __pyx_t_9 = PyUnicode_Format(__pyx_kp_u_No_element_found_with_atomic_num, __pyx_t_10); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 155, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __pyx_t_10 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_10)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_10);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_10) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_10, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_9);
+    __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 155, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_Raise(__pyx_t_5, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __PYX_ERR(0, 155, __pyx_L1_error)
+
+    /* "rmgpy/molecule/element.py":147
+ *     """
+ *     cython.declare(element=Element, number=cython.int, symbol=str)
+ *     if isinstance(value, int):             # <<<<<<<<<<<<<<
+ *         # The parameter is an integer; assume this is the atomic number
+ *         number = value
+ */
+  }
+
+  /* "rmgpy/molecule/element.py":156
+ *         # so we raise an exception
+ *         raise ElementError("No element found with atomic number %i, and isotope %i" % (number, isotope))
+ *     elif isinstance(value, str):             # <<<<<<<<<<<<<<
+ *         # The parameter is a string; assume this is the element symbol
+ *         symbol = value
+ */
+  __pyx_t_2 = PyUnicode_Check(__pyx_v_value); 
+  __pyx_t_1 = (__pyx_t_2 != 0);
+  if (likely(__pyx_t_1)) {
+
+    /* "rmgpy/molecule/element.py":158
+ *     elif isinstance(value, str):
+ *         # The parameter is a string; assume this is the element symbol
+ *         symbol = value             # <<<<<<<<<<<<<<
+ *         for element in element_list:
+ *             if element.symbol == symbol and element.isotope == isotope:
+ */
+    if (!(likely(PyUnicode_CheckExact(__pyx_v_value))||((__pyx_v_value) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_v_value)->tp_name), 0))) __PYX_ERR(0, 158, __pyx_L1_error)
+    __pyx_t_5 = __pyx_v_value;
+    __Pyx_INCREF(__pyx_t_5);
+    __pyx_v_symbol = ((PyObject*)__pyx_t_5);
+    __pyx_t_5 = 0;
+
+    /* "rmgpy/molecule/element.py":159
+ *         # The parameter is a string; assume this is the element symbol
+ *         symbol = value
+ *         for element in element_list:             # <<<<<<<<<<<<<<
+ *             if element.symbol == symbol and element.isotope == isotope:
+ *                 return element
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_element_list); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 159, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (likely(PyList_CheckExact(__pyx_t_5)) || PyTuple_CheckExact(__pyx_t_5)) {
+      __pyx_t_4 = __pyx_t_5; __Pyx_INCREF(__pyx_t_4); __pyx_t_6 = 0;
+      __pyx_t_7 = NULL;
+    } else {
+      __pyx_t_6 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 159, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_7 = Py_TYPE(__pyx_t_4)->tp_iternext; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 159, __pyx_L1_error)
+    }
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    for (;;) {
+      if (likely(!__pyx_t_7)) {
+        if (likely(PyList_CheckExact(__pyx_t_4))) {
+          if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_4)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_5 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_6); __Pyx_INCREF(__pyx_t_5); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(0, 159, __pyx_L1_error)
+          #else
+          __pyx_t_5 = PySequence_ITEM(__pyx_t_4, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 159, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          #endif
+        } else {
+          if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_6); __Pyx_INCREF(__pyx_t_5); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(0, 159, __pyx_L1_error)
+          #else
+          __pyx_t_5 = PySequence_ITEM(__pyx_t_4, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 159, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          #endif
+        }
+      } else {
+        __pyx_t_5 = __pyx_t_7(__pyx_t_4);
+        if (unlikely(!__pyx_t_5)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 159, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_5);
+      }
+      if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5rmgpy_8molecule_7element_Element))))) __PYX_ERR(0, 159, __pyx_L1_error)
+      __Pyx_XDECREF_SET(__pyx_v_element, ((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)__pyx_t_5));
+      __pyx_t_5 = 0;
+
+      /* "rmgpy/molecule/element.py":160
+ *         symbol = value
+ *         for element in element_list:
+ *             if element.symbol == symbol and element.isotope == isotope:             # <<<<<<<<<<<<<<
+ *                 return element
+ *         # If we reach this point that means we did not find an appropriate element,
+ */
+      __pyx_t_2 = (__Pyx_PyUnicode_Equals(__pyx_v_element->symbol, __pyx_v_symbol, Py_EQ)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 160, __pyx_L1_error)
+      __pyx_t_11 = (__pyx_t_2 != 0);
+      if (__pyx_t_11) {
+      } else {
+        __pyx_t_1 = __pyx_t_11;
+        goto __pyx_L12_bool_binop_done;
+      }
+      __pyx_t_11 = ((__pyx_v_element->isotope == __pyx_v_isotope) != 0);
+      __pyx_t_1 = __pyx_t_11;
+      __pyx_L12_bool_binop_done:;
+      if (__pyx_t_1) {
+
+        /* "rmgpy/molecule/element.py":161
+ *         for element in element_list:
+ *             if element.symbol == symbol and element.isotope == isotope:
+ *                 return element             # <<<<<<<<<<<<<<
+ *         # If we reach this point that means we did not find an appropriate element,
+ *         # so we raise an exception
+ */
+        __Pyx_XDECREF(((PyObject *)__pyx_r));
+        __Pyx_INCREF(((PyObject *)__pyx_v_element));
+        __pyx_r = __pyx_v_element;
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        goto __pyx_L0;
+
+        /* "rmgpy/molecule/element.py":160
+ *         symbol = value
+ *         for element in element_list:
+ *             if element.symbol == symbol and element.isotope == isotope:             # <<<<<<<<<<<<<<
+ *                 return element
+ *         # If we reach this point that means we did not find an appropriate element,
+ */
+      }
+
+      /* "rmgpy/molecule/element.py":159
+ *         # The parameter is a string; assume this is the element symbol
+ *         symbol = value
+ *         for element in element_list:             # <<<<<<<<<<<<<<
+ *             if element.symbol == symbol and element.isotope == isotope:
+ *                 return element
+ */
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/element.py":164
+ *         # If we reach this point that means we did not find an appropriate element,
+ *         # so we raise an exception
+ *         raise ElementError("No element found with symbol %s, and isotope %i." % (symbol, isotope))             # <<<<<<<<<<<<<<
+ *     else:
+ *         raise ElementError('No element found based on parameter %s "%r", isotope: %i.' % (type(value), value, isotope))
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_ElementError); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 164, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_isotope); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 164, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_10 = PyTuple_New(2); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 164, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_INCREF(__pyx_v_symbol);
+    __Pyx_GIVEREF(__pyx_v_symbol);
+    PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_v_symbol);
+    __Pyx_GIVEREF(__pyx_t_9);
+    PyTuple_SET_ITEM(__pyx_t_10, 1, __pyx_t_9);
+    __pyx_t_9 = 0;
+    __pyx_t_9 = PyUnicode_Format(__pyx_kp_u_No_element_found_with_symbol_s_a, __pyx_t_10); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 164, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __pyx_t_10 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_10)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_10);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_10) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_10, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_9);
+    __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 164, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(0, 164, __pyx_L1_error)
+
+    /* "rmgpy/molecule/element.py":156
+ *         # so we raise an exception
+ *         raise ElementError("No element found with atomic number %i, and isotope %i" % (number, isotope))
+ *     elif isinstance(value, str):             # <<<<<<<<<<<<<<
+ *         # The parameter is a string; assume this is the element symbol
+ *         symbol = value
+ */
+  }
+
+  /* "rmgpy/molecule/element.py":166
+ *         raise ElementError("No element found with symbol %s, and isotope %i." % (symbol, isotope))
+ *     else:
+ *         raise ElementError('No element found based on parameter %s "%r", isotope: %i.' % (type(value), value, isotope))             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  /*else*/ {
+    __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_ElementError); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 166, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_isotope); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 166, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_10 = PyTuple_New(3); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 166, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(__pyx_v_value)));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(__pyx_v_value)));
+    PyTuple_SET_ITEM(__pyx_t_10, 0, ((PyObject *)Py_TYPE(__pyx_v_value)));
+    __Pyx_INCREF(__pyx_v_value);
+    __Pyx_GIVEREF(__pyx_v_value);
+    PyTuple_SET_ITEM(__pyx_t_10, 1, __pyx_v_value);
+    __Pyx_GIVEREF(__pyx_t_9);
+    PyTuple_SET_ITEM(__pyx_t_10, 2, __pyx_t_9);
+    __pyx_t_9 = 0;
+    __pyx_t_9 = PyUnicode_Format(__pyx_kp_u_No_element_found_based_on_parame, __pyx_t_10); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 166, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __pyx_t_10 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_10)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_10);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_10) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_10, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_9);
+    __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 166, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(0, 166, __pyx_L1_error)
+  }
+
+  /* "rmgpy/molecule/element.py":139
+ * 
+ * 
+ * def get_element(value, isotope=-1):             # <<<<<<<<<<<<<<
+ *     """
+ *     Return the :class:`Element` object corresponding to the given parameter
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("rmgpy.molecule.element.get_element", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_element);
+  __Pyx_XDECREF(__pyx_v_symbol);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8molecule_7element_1get_element(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5rmgpy_8molecule_7element_get_element[] = "\n    Return the :class:`Element` object corresponding to the given parameter\n    `value`. If an integer is provided, the value is treated as the atomic\n    number. If a string is provided, the value is treated as the symbol. An\n    :class:`ElementError` is raised if no matching element is found.\n    ";
+static PyMethodDef __pyx_mdef_5rmgpy_8molecule_7element_1get_element = {"get_element", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5rmgpy_8molecule_7element_1get_element, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5rmgpy_8molecule_7element_get_element};
+static PyObject *__pyx_pw_5rmgpy_8molecule_7element_1get_element(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_value = 0;
+  int __pyx_v_isotope;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("get_element (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_value,&__pyx_n_s_isotope,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_value)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_isotope);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "get_element") < 0)) __PYX_ERR(0, 139, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_value = values[0];
+    if (values[1]) {
+      __pyx_v_isotope = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_isotope == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 139, __pyx_L3_error)
+    } else {
+      __pyx_v_isotope = ((int)-1);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("get_element", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 139, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("rmgpy.molecule.element.get_element", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_7element_get_element(__pyx_self, __pyx_v_value, __pyx_v_isotope);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8molecule_7element_get_element(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_value, int __pyx_v_isotope) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  struct __pyx_opt_args_5rmgpy_8molecule_7element_get_element __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_element", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2.__pyx_n = 1;
+  __pyx_t_2.isotope = __pyx_v_isotope;
+  __pyx_t_1 = ((PyObject *)__pyx_f_5rmgpy_8molecule_7element_get_element(__pyx_v_value, 0, &__pyx_t_2)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 139, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("rmgpy.molecule.element.get_element", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_tp_new_5rmgpy_8molecule_7element_Element(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_5rmgpy_8molecule_7element_Element *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_5rmgpy_8molecule_7element_Element *)o);
+  p->name = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  p->symbol = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  p->chemkin_name = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_5rmgpy_8molecule_7element_Element(PyObject *o) {
+  struct __pyx_obj_5rmgpy_8molecule_7element_Element *p = (struct __pyx_obj_5rmgpy_8molecule_7element_Element *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !__Pyx_PyObject_GC_IsFinalized(o))) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  Py_CLEAR(p->name);
+  Py_CLEAR(p->symbol);
+  Py_CLEAR(p->chemkin_name);
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static PyObject *__pyx_getprop_5rmgpy_8molecule_7element_7Element_number(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5rmgpy_8molecule_7element_7Element_6number_1__get__(o);
+}
+
+static int __pyx_setprop_5rmgpy_8molecule_7element_7Element_number(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_5rmgpy_8molecule_7element_7Element_6number_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_5rmgpy_8molecule_7element_7Element_name(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5rmgpy_8molecule_7element_7Element_4name_1__get__(o);
+}
+
+static int __pyx_setprop_5rmgpy_8molecule_7element_7Element_name(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_5rmgpy_8molecule_7element_7Element_4name_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_5rmgpy_8molecule_7element_7Element_4name_5__del__(o);
+  }
+}
+
+static PyObject *__pyx_getprop_5rmgpy_8molecule_7element_7Element_symbol(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5rmgpy_8molecule_7element_7Element_6symbol_1__get__(o);
+}
+
+static int __pyx_setprop_5rmgpy_8molecule_7element_7Element_symbol(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_5rmgpy_8molecule_7element_7Element_6symbol_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_5rmgpy_8molecule_7element_7Element_6symbol_5__del__(o);
+  }
+}
+
+static PyObject *__pyx_getprop_5rmgpy_8molecule_7element_7Element_mass(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5rmgpy_8molecule_7element_7Element_4mass_1__get__(o);
+}
+
+static int __pyx_setprop_5rmgpy_8molecule_7element_7Element_mass(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_5rmgpy_8molecule_7element_7Element_4mass_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_5rmgpy_8molecule_7element_7Element_cov_radius(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5rmgpy_8molecule_7element_7Element_10cov_radius_1__get__(o);
+}
+
+static int __pyx_setprop_5rmgpy_8molecule_7element_7Element_cov_radius(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_5rmgpy_8molecule_7element_7Element_10cov_radius_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_5rmgpy_8molecule_7element_7Element_isotope(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5rmgpy_8molecule_7element_7Element_7isotope_1__get__(o);
+}
+
+static int __pyx_setprop_5rmgpy_8molecule_7element_7Element_isotope(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_5rmgpy_8molecule_7element_7Element_7isotope_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_5rmgpy_8molecule_7element_7Element_chemkin_name(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5rmgpy_8molecule_7element_7Element_12chemkin_name_1__get__(o);
+}
+
+static int __pyx_setprop_5rmgpy_8molecule_7element_7Element_chemkin_name(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_5rmgpy_8molecule_7element_7Element_12chemkin_name_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_5rmgpy_8molecule_7element_7Element_12chemkin_name_5__del__(o);
+  }
+}
+
+static PyMethodDef __pyx_methods_5rmgpy_8molecule_7element_Element[] = {
+  {"__reduce__", (PyCFunction)__pyx_pw_5rmgpy_8molecule_7element_7Element_7__reduce__, METH_NOARGS, __pyx_doc_5rmgpy_8molecule_7element_7Element_6__reduce__},
+  {0, 0, 0, 0}
+};
+
+static struct PyGetSetDef __pyx_getsets_5rmgpy_8molecule_7element_Element[] = {
+  {(char *)"number", __pyx_getprop_5rmgpy_8molecule_7element_7Element_number, __pyx_setprop_5rmgpy_8molecule_7element_7Element_number, (char *)0, 0},
+  {(char *)"name", __pyx_getprop_5rmgpy_8molecule_7element_7Element_name, __pyx_setprop_5rmgpy_8molecule_7element_7Element_name, (char *)0, 0},
+  {(char *)"symbol", __pyx_getprop_5rmgpy_8molecule_7element_7Element_symbol, __pyx_setprop_5rmgpy_8molecule_7element_7Element_symbol, (char *)0, 0},
+  {(char *)"mass", __pyx_getprop_5rmgpy_8molecule_7element_7Element_mass, __pyx_setprop_5rmgpy_8molecule_7element_7Element_mass, (char *)0, 0},
+  {(char *)"cov_radius", __pyx_getprop_5rmgpy_8molecule_7element_7Element_cov_radius, __pyx_setprop_5rmgpy_8molecule_7element_7Element_cov_radius, (char *)0, 0},
+  {(char *)"isotope", __pyx_getprop_5rmgpy_8molecule_7element_7Element_isotope, __pyx_setprop_5rmgpy_8molecule_7element_7Element_isotope, (char *)0, 0},
+  {(char *)"chemkin_name", __pyx_getprop_5rmgpy_8molecule_7element_7Element_chemkin_name, __pyx_setprop_5rmgpy_8molecule_7element_7Element_chemkin_name, (char *)0, 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_5rmgpy_8molecule_7element_Element = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "rmgpy.molecule.element.Element", /*tp_name*/
+  sizeof(struct __pyx_obj_5rmgpy_8molecule_7element_Element), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_5rmgpy_8molecule_7element_Element, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  __pyx_pw_5rmgpy_8molecule_7element_7Element_5__repr__, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  __pyx_pw_5rmgpy_8molecule_7element_7Element_3__str__, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  "\n    A chemical element. The attributes are:\n\n    ============= =============== ================================================\n    Attribute     Type            Description\n    ============= =============== ================================================\n    `number`      ``int``         The atomic number of the element\n    `symbol`      ``str``         The symbol used for the element\n    `name`        ``str``         The IUPAC name of the element\n    `mass`        ``float``       The mass of the element in kg/mol\n    `covRadius`   ``float``       Covalent bond radius in Angstrom\n    `isotope`     ``int``         The isotope integer of the element\n    `chemkin_name` ``str``         The chemkin compatible representation of the element\n    ============= =============== ================================================\n\n    This class is specifically for properties that all atoms of the same element\n    share. Ideally there is only one instance of this class for each element.\n    ", /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_5rmgpy_8molecule_7element_Element, /*tp_methods*/
+  0, /*tp_members*/
+  __pyx_getsets_5rmgpy_8molecule_7element_Element, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_5rmgpy_8molecule_7element_7Element_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_5rmgpy_8molecule_7element_Element, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec_element(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec_element},
+  {0, NULL}
+};
+#endif
+
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "element",
+    __pyx_k_This_module_defined_the_chemica, /* m_doc */
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    0, /* m_size */
+  #else
+    -1, /* m_size */
+  #endif
+    __pyx_methods /* m_methods */,
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    __pyx_moduledef_slots, /* m_slots */
+  #else
+    NULL, /* m_reload */
+  #endif
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_kp_u_, __pyx_k_, sizeof(__pyx_k_), 0, 1, 0, 0},
+  {&__pyx_n_s_Ac, __pyx_k_Ac, sizeof(__pyx_k_Ac), 0, 0, 1, 1},
+  {&__pyx_n_u_Ac, __pyx_k_Ac, sizeof(__pyx_k_Ac), 0, 1, 0, 1},
+  {&__pyx_n_s_Ag, __pyx_k_Ag, sizeof(__pyx_k_Ag), 0, 0, 1, 1},
+  {&__pyx_n_u_Ag, __pyx_k_Ag, sizeof(__pyx_k_Ag), 0, 1, 0, 1},
+  {&__pyx_n_s_Al, __pyx_k_Al, sizeof(__pyx_k_Al), 0, 0, 1, 1},
+  {&__pyx_n_u_Al, __pyx_k_Al, sizeof(__pyx_k_Al), 0, 1, 0, 1},
+  {&__pyx_n_s_Am, __pyx_k_Am, sizeof(__pyx_k_Am), 0, 0, 1, 1},
+  {&__pyx_n_u_Am, __pyx_k_Am, sizeof(__pyx_k_Am), 0, 1, 0, 1},
+  {&__pyx_n_s_Ar, __pyx_k_Ar, sizeof(__pyx_k_Ar), 0, 0, 1, 1},
+  {&__pyx_n_u_Ar, __pyx_k_Ar, sizeof(__pyx_k_Ar), 0, 1, 0, 1},
+  {&__pyx_n_s_As, __pyx_k_As, sizeof(__pyx_k_As), 0, 0, 1, 1},
+  {&__pyx_n_u_As, __pyx_k_As, sizeof(__pyx_k_As), 0, 1, 0, 1},
+  {&__pyx_n_s_At, __pyx_k_At, sizeof(__pyx_k_At), 0, 0, 1, 1},
+  {&__pyx_n_u_At, __pyx_k_At, sizeof(__pyx_k_At), 0, 1, 0, 1},
+  {&__pyx_n_s_Au, __pyx_k_Au, sizeof(__pyx_k_Au), 0, 0, 1, 1},
+  {&__pyx_n_u_Au, __pyx_k_Au, sizeof(__pyx_k_Au), 0, 1, 0, 1},
+  {&__pyx_n_s_B, __pyx_k_B, sizeof(__pyx_k_B), 0, 0, 1, 1},
+  {&__pyx_n_u_B, __pyx_k_B, sizeof(__pyx_k_B), 0, 1, 0, 1},
+  {&__pyx_n_s_Ba, __pyx_k_Ba, sizeof(__pyx_k_Ba), 0, 0, 1, 1},
+  {&__pyx_n_u_Ba, __pyx_k_Ba, sizeof(__pyx_k_Ba), 0, 1, 0, 1},
+  {&__pyx_n_s_Be, __pyx_k_Be, sizeof(__pyx_k_Be), 0, 0, 1, 1},
+  {&__pyx_n_u_Be, __pyx_k_Be, sizeof(__pyx_k_Be), 0, 1, 0, 1},
+  {&__pyx_n_s_Bh, __pyx_k_Bh, sizeof(__pyx_k_Bh), 0, 0, 1, 1},
+  {&__pyx_n_u_Bh, __pyx_k_Bh, sizeof(__pyx_k_Bh), 0, 1, 0, 1},
+  {&__pyx_n_s_Bi, __pyx_k_Bi, sizeof(__pyx_k_Bi), 0, 0, 1, 1},
+  {&__pyx_n_u_Bi, __pyx_k_Bi, sizeof(__pyx_k_Bi), 0, 1, 0, 1},
+  {&__pyx_n_s_Bk, __pyx_k_Bk, sizeof(__pyx_k_Bk), 0, 0, 1, 1},
+  {&__pyx_n_u_Bk, __pyx_k_Bk, sizeof(__pyx_k_Bk), 0, 1, 0, 1},
+  {&__pyx_n_s_Br, __pyx_k_Br, sizeof(__pyx_k_Br), 0, 0, 1, 1},
+  {&__pyx_n_u_Br, __pyx_k_Br, sizeof(__pyx_k_Br), 0, 1, 0, 1},
+  {&__pyx_n_s_C, __pyx_k_C, sizeof(__pyx_k_C), 0, 0, 1, 1},
+  {&__pyx_n_u_C, __pyx_k_C, sizeof(__pyx_k_C), 0, 1, 0, 1},
+  {&__pyx_n_s_C13, __pyx_k_C13, sizeof(__pyx_k_C13), 0, 0, 1, 1},
+  {&__pyx_n_u_C13, __pyx_k_C13, sizeof(__pyx_k_C13), 0, 1, 0, 1},
+  {&__pyx_n_u_CI, __pyx_k_CI, sizeof(__pyx_k_CI), 0, 1, 0, 1},
+  {&__pyx_n_s_Ca, __pyx_k_Ca, sizeof(__pyx_k_Ca), 0, 0, 1, 1},
+  {&__pyx_n_u_Ca, __pyx_k_Ca, sizeof(__pyx_k_Ca), 0, 1, 0, 1},
+  {&__pyx_n_s_Cd, __pyx_k_Cd, sizeof(__pyx_k_Cd), 0, 0, 1, 1},
+  {&__pyx_n_u_Cd, __pyx_k_Cd, sizeof(__pyx_k_Cd), 0, 1, 0, 1},
+  {&__pyx_n_s_Ce, __pyx_k_Ce, sizeof(__pyx_k_Ce), 0, 0, 1, 1},
+  {&__pyx_n_u_Ce, __pyx_k_Ce, sizeof(__pyx_k_Ce), 0, 1, 0, 1},
+  {&__pyx_n_s_Cf, __pyx_k_Cf, sizeof(__pyx_k_Cf), 0, 0, 1, 1},
+  {&__pyx_n_u_Cf, __pyx_k_Cf, sizeof(__pyx_k_Cf), 0, 1, 0, 1},
+  {&__pyx_n_s_Cl, __pyx_k_Cl, sizeof(__pyx_k_Cl), 0, 0, 1, 1},
+  {&__pyx_n_u_Cl, __pyx_k_Cl, sizeof(__pyx_k_Cl), 0, 1, 0, 1},
+  {&__pyx_n_s_Cm, __pyx_k_Cm, sizeof(__pyx_k_Cm), 0, 0, 1, 1},
+  {&__pyx_n_u_Cm, __pyx_k_Cm, sizeof(__pyx_k_Cm), 0, 1, 0, 1},
+  {&__pyx_n_s_Cn, __pyx_k_Cn, sizeof(__pyx_k_Cn), 0, 0, 1, 1},
+  {&__pyx_n_u_Cn, __pyx_k_Cn, sizeof(__pyx_k_Cn), 0, 1, 0, 1},
+  {&__pyx_n_s_Co, __pyx_k_Co, sizeof(__pyx_k_Co), 0, 0, 1, 1},
+  {&__pyx_n_u_Co, __pyx_k_Co, sizeof(__pyx_k_Co), 0, 1, 0, 1},
+  {&__pyx_kp_s_Collects_hard_coded_information, __pyx_k_Collects_hard_coded_information, sizeof(__pyx_k_Collects_hard_coded_information), 0, 0, 1, 0},
+  {&__pyx_n_s_Cr, __pyx_k_Cr, sizeof(__pyx_k_Cr), 0, 0, 1, 1},
+  {&__pyx_n_u_Cr, __pyx_k_Cr, sizeof(__pyx_k_Cr), 0, 1, 0, 1},
+  {&__pyx_n_s_Cs, __pyx_k_Cs, sizeof(__pyx_k_Cs), 0, 0, 1, 1},
+  {&__pyx_n_u_Cs, __pyx_k_Cs, sizeof(__pyx_k_Cs), 0, 1, 0, 1},
+  {&__pyx_n_s_Cu, __pyx_k_Cu, sizeof(__pyx_k_Cu), 0, 0, 1, 1},
+  {&__pyx_n_u_Cu, __pyx_k_Cu, sizeof(__pyx_k_Cu), 0, 1, 0, 1},
+  {&__pyx_n_s_D, __pyx_k_D, sizeof(__pyx_k_D), 0, 0, 1, 1},
+  {&__pyx_n_u_D, __pyx_k_D, sizeof(__pyx_k_D), 0, 1, 0, 1},
+  {&__pyx_n_s_Db, __pyx_k_Db, sizeof(__pyx_k_Db), 0, 0, 1, 1},
+  {&__pyx_n_u_Db, __pyx_k_Db, sizeof(__pyx_k_Db), 0, 1, 0, 1},
+  {&__pyx_n_s_Ds, __pyx_k_Ds, sizeof(__pyx_k_Ds), 0, 0, 1, 1},
+  {&__pyx_n_u_Ds, __pyx_k_Ds, sizeof(__pyx_k_Ds), 0, 1, 0, 1},
+  {&__pyx_n_s_Dy, __pyx_k_Dy, sizeof(__pyx_k_Dy), 0, 0, 1, 1},
+  {&__pyx_n_u_Dy, __pyx_k_Dy, sizeof(__pyx_k_Dy), 0, 1, 0, 1},
+  {&__pyx_kp_u_Element, __pyx_k_Element, sizeof(__pyx_k_Element), 0, 1, 0, 0},
+  {&__pyx_n_s_ElementError, __pyx_k_ElementError, sizeof(__pyx_k_ElementError), 0, 0, 1, 1},
+  {&__pyx_n_s_Element_2, __pyx_k_Element_2, sizeof(__pyx_k_Element_2), 0, 0, 1, 1},
+  {&__pyx_n_s_Element___reduce, __pyx_k_Element___reduce, sizeof(__pyx_k_Element___reduce), 0, 0, 1, 1},
+  {&__pyx_n_s_Er, __pyx_k_Er, sizeof(__pyx_k_Er), 0, 0, 1, 1},
+  {&__pyx_n_u_Er, __pyx_k_Er, sizeof(__pyx_k_Er), 0, 1, 0, 1},
+  {&__pyx_n_s_Es, __pyx_k_Es, sizeof(__pyx_k_Es), 0, 0, 1, 1},
+  {&__pyx_n_u_Es, __pyx_k_Es, sizeof(__pyx_k_Es), 0, 1, 0, 1},
+  {&__pyx_n_s_Eu, __pyx_k_Eu, sizeof(__pyx_k_Eu), 0, 0, 1, 1},
+  {&__pyx_n_u_Eu, __pyx_k_Eu, sizeof(__pyx_k_Eu), 0, 1, 0, 1},
+  {&__pyx_n_s_F, __pyx_k_F, sizeof(__pyx_k_F), 0, 0, 1, 1},
+  {&__pyx_n_u_F, __pyx_k_F, sizeof(__pyx_k_F), 0, 1, 0, 1},
+  {&__pyx_n_s_Fe, __pyx_k_Fe, sizeof(__pyx_k_Fe), 0, 0, 1, 1},
+  {&__pyx_n_u_Fe, __pyx_k_Fe, sizeof(__pyx_k_Fe), 0, 1, 0, 1},
+  {&__pyx_n_s_Fm, __pyx_k_Fm, sizeof(__pyx_k_Fm), 0, 0, 1, 1},
+  {&__pyx_n_u_Fm, __pyx_k_Fm, sizeof(__pyx_k_Fm), 0, 1, 0, 1},
+  {&__pyx_n_s_Fr, __pyx_k_Fr, sizeof(__pyx_k_Fr), 0, 0, 1, 1},
+  {&__pyx_n_u_Fr, __pyx_k_Fr, sizeof(__pyx_k_Fr), 0, 1, 0, 1},
+  {&__pyx_n_s_Ga, __pyx_k_Ga, sizeof(__pyx_k_Ga), 0, 0, 1, 1},
+  {&__pyx_n_u_Ga, __pyx_k_Ga, sizeof(__pyx_k_Ga), 0, 1, 0, 1},
+  {&__pyx_n_s_Gd, __pyx_k_Gd, sizeof(__pyx_k_Gd), 0, 0, 1, 1},
+  {&__pyx_n_u_Gd, __pyx_k_Gd, sizeof(__pyx_k_Gd), 0, 1, 0, 1},
+  {&__pyx_n_s_Ge, __pyx_k_Ge, sizeof(__pyx_k_Ge), 0, 0, 1, 1},
+  {&__pyx_n_u_Ge, __pyx_k_Ge, sizeof(__pyx_k_Ge), 0, 1, 0, 1},
+  {&__pyx_n_s_GetPeriodicTable, __pyx_k_GetPeriodicTable, sizeof(__pyx_k_GetPeriodicTable), 0, 0, 1, 1},
+  {&__pyx_n_s_GetRcovalent, __pyx_k_GetRcovalent, sizeof(__pyx_k_GetRcovalent), 0, 0, 1, 1},
+  {&__pyx_n_s_H, __pyx_k_H, sizeof(__pyx_k_H), 0, 0, 1, 1},
+  {&__pyx_n_u_H, __pyx_k_H, sizeof(__pyx_k_H), 0, 1, 0, 1},
+  {&__pyx_n_s_He, __pyx_k_He, sizeof(__pyx_k_He), 0, 0, 1, 1},
+  {&__pyx_n_u_He, __pyx_k_He, sizeof(__pyx_k_He), 0, 1, 0, 1},
+  {&__pyx_n_s_Hf, __pyx_k_Hf, sizeof(__pyx_k_Hf), 0, 0, 1, 1},
+  {&__pyx_n_u_Hf, __pyx_k_Hf, sizeof(__pyx_k_Hf), 0, 1, 0, 1},
+  {&__pyx_n_s_Hg, __pyx_k_Hg, sizeof(__pyx_k_Hg), 0, 0, 1, 1},
+  {&__pyx_n_u_Hg, __pyx_k_Hg, sizeof(__pyx_k_Hg), 0, 1, 0, 1},
+  {&__pyx_n_s_Ho, __pyx_k_Ho, sizeof(__pyx_k_Ho), 0, 0, 1, 1},
+  {&__pyx_n_u_Ho, __pyx_k_Ho, sizeof(__pyx_k_Ho), 0, 1, 0, 1},
+  {&__pyx_n_s_Hs, __pyx_k_Hs, sizeof(__pyx_k_Hs), 0, 0, 1, 1},
+  {&__pyx_n_u_Hs, __pyx_k_Hs, sizeof(__pyx_k_Hs), 0, 1, 0, 1},
+  {&__pyx_n_s_I, __pyx_k_I, sizeof(__pyx_k_I), 0, 0, 1, 1},
+  {&__pyx_n_u_I, __pyx_k_I, sizeof(__pyx_k_I), 0, 1, 0, 1},
+  {&__pyx_n_s_In, __pyx_k_In, sizeof(__pyx_k_In), 0, 0, 1, 1},
+  {&__pyx_n_u_In, __pyx_k_In, sizeof(__pyx_k_In), 0, 1, 0, 1},
+  {&__pyx_n_s_Ir, __pyx_k_Ir, sizeof(__pyx_k_Ir), 0, 0, 1, 1},
+  {&__pyx_n_u_Ir, __pyx_k_Ir, sizeof(__pyx_k_Ir), 0, 1, 0, 1},
+  {&__pyx_n_s_K, __pyx_k_K, sizeof(__pyx_k_K), 0, 0, 1, 1},
+  {&__pyx_n_u_K, __pyx_k_K, sizeof(__pyx_k_K), 0, 1, 0, 1},
+  {&__pyx_n_s_Kr, __pyx_k_Kr, sizeof(__pyx_k_Kr), 0, 0, 1, 1},
+  {&__pyx_n_u_Kr, __pyx_k_Kr, sizeof(__pyx_k_Kr), 0, 1, 0, 1},
+  {&__pyx_n_s_La, __pyx_k_La, sizeof(__pyx_k_La), 0, 0, 1, 1},
+  {&__pyx_n_u_La, __pyx_k_La, sizeof(__pyx_k_La), 0, 1, 0, 1},
+  {&__pyx_n_s_Li, __pyx_k_Li, sizeof(__pyx_k_Li), 0, 0, 1, 1},
+  {&__pyx_n_u_Li, __pyx_k_Li, sizeof(__pyx_k_Li), 0, 1, 0, 1},
+  {&__pyx_n_s_Lr, __pyx_k_Lr, sizeof(__pyx_k_Lr), 0, 0, 1, 1},
+  {&__pyx_n_u_Lr, __pyx_k_Lr, sizeof(__pyx_k_Lr), 0, 1, 0, 1},
+  {&__pyx_n_s_Lu, __pyx_k_Lu, sizeof(__pyx_k_Lu), 0, 0, 1, 1},
+  {&__pyx_n_u_Lu, __pyx_k_Lu, sizeof(__pyx_k_Lu), 0, 1, 0, 1},
+  {&__pyx_n_s_Md, __pyx_k_Md, sizeof(__pyx_k_Md), 0, 0, 1, 1},
+  {&__pyx_n_u_Md, __pyx_k_Md, sizeof(__pyx_k_Md), 0, 1, 0, 1},
+  {&__pyx_n_s_Mg, __pyx_k_Mg, sizeof(__pyx_k_Mg), 0, 0, 1, 1},
+  {&__pyx_n_u_Mg, __pyx_k_Mg, sizeof(__pyx_k_Mg), 0, 1, 0, 1},
+  {&__pyx_n_s_Mn, __pyx_k_Mn, sizeof(__pyx_k_Mn), 0, 0, 1, 1},
+  {&__pyx_n_u_Mn, __pyx_k_Mn, sizeof(__pyx_k_Mn), 0, 1, 0, 1},
+  {&__pyx_n_s_Mo, __pyx_k_Mo, sizeof(__pyx_k_Mo), 0, 0, 1, 1},
+  {&__pyx_n_u_Mo, __pyx_k_Mo, sizeof(__pyx_k_Mo), 0, 1, 0, 1},
+  {&__pyx_n_s_Mt, __pyx_k_Mt, sizeof(__pyx_k_Mt), 0, 0, 1, 1},
+  {&__pyx_n_u_Mt, __pyx_k_Mt, sizeof(__pyx_k_Mt), 0, 1, 0, 1},
+  {&__pyx_n_s_N, __pyx_k_N, sizeof(__pyx_k_N), 0, 0, 1, 1},
+  {&__pyx_n_u_N, __pyx_k_N, sizeof(__pyx_k_N), 0, 1, 0, 1},
+  {&__pyx_n_s_Na, __pyx_k_Na, sizeof(__pyx_k_Na), 0, 0, 1, 1},
+  {&__pyx_n_u_Na, __pyx_k_Na, sizeof(__pyx_k_Na), 0, 1, 0, 1},
+  {&__pyx_n_s_Nb, __pyx_k_Nb, sizeof(__pyx_k_Nb), 0, 0, 1, 1},
+  {&__pyx_n_u_Nb, __pyx_k_Nb, sizeof(__pyx_k_Nb), 0, 1, 0, 1},
+  {&__pyx_n_s_Nd, __pyx_k_Nd, sizeof(__pyx_k_Nd), 0, 0, 1, 1},
+  {&__pyx_n_u_Nd, __pyx_k_Nd, sizeof(__pyx_k_Nd), 0, 1, 0, 1},
+  {&__pyx_n_s_Ne, __pyx_k_Ne, sizeof(__pyx_k_Ne), 0, 0, 1, 1},
+  {&__pyx_n_u_Ne, __pyx_k_Ne, sizeof(__pyx_k_Ne), 0, 1, 0, 1},
+  {&__pyx_n_s_Ni, __pyx_k_Ni, sizeof(__pyx_k_Ni), 0, 0, 1, 1},
+  {&__pyx_n_u_Ni, __pyx_k_Ni, sizeof(__pyx_k_Ni), 0, 1, 0, 1},
+  {&__pyx_n_s_No, __pyx_k_No, sizeof(__pyx_k_No), 0, 0, 1, 1},
+  {&__pyx_n_u_No, __pyx_k_No, sizeof(__pyx_k_No), 0, 1, 0, 1},
+  {&__pyx_kp_u_No_element_found_based_on_parame, __pyx_k_No_element_found_based_on_parame, sizeof(__pyx_k_No_element_found_based_on_parame), 0, 1, 0, 0},
+  {&__pyx_kp_u_No_element_found_with_atomic_num, __pyx_k_No_element_found_with_atomic_num, sizeof(__pyx_k_No_element_found_with_atomic_num), 0, 1, 0, 0},
+  {&__pyx_kp_u_No_element_found_with_symbol_s_a, __pyx_k_No_element_found_with_symbol_s_a, sizeof(__pyx_k_No_element_found_with_symbol_s_a), 0, 1, 0, 0},
+  {&__pyx_kp_u_None, __pyx_k_None, sizeof(__pyx_k_None), 0, 1, 0, 0},
+  {&__pyx_n_s_Np, __pyx_k_Np, sizeof(__pyx_k_Np), 0, 0, 1, 1},
+  {&__pyx_n_u_Np, __pyx_k_Np, sizeof(__pyx_k_Np), 0, 1, 0, 1},
+  {&__pyx_n_s_O, __pyx_k_O, sizeof(__pyx_k_O), 0, 0, 1, 1},
+  {&__pyx_n_u_O, __pyx_k_O, sizeof(__pyx_k_O), 0, 1, 0, 1},
+  {&__pyx_n_s_O18, __pyx_k_O18, sizeof(__pyx_k_O18), 0, 0, 1, 1},
+  {&__pyx_n_u_O18, __pyx_k_O18, sizeof(__pyx_k_O18), 0, 1, 0, 1},
+  {&__pyx_n_u_OI, __pyx_k_OI, sizeof(__pyx_k_OI), 0, 1, 0, 1},
+  {&__pyx_n_s_Os, __pyx_k_Os, sizeof(__pyx_k_Os), 0, 0, 1, 1},
+  {&__pyx_n_u_Os, __pyx_k_Os, sizeof(__pyx_k_Os), 0, 1, 0, 1},
+  {&__pyx_n_s_P, __pyx_k_P, sizeof(__pyx_k_P), 0, 0, 1, 1},
+  {&__pyx_n_u_P, __pyx_k_P, sizeof(__pyx_k_P), 0, 1, 0, 1},
+  {&__pyx_n_s_Pa, __pyx_k_Pa, sizeof(__pyx_k_Pa), 0, 0, 1, 1},
+  {&__pyx_n_u_Pa, __pyx_k_Pa, sizeof(__pyx_k_Pa), 0, 1, 0, 1},
+  {&__pyx_n_s_Pb, __pyx_k_Pb, sizeof(__pyx_k_Pb), 0, 0, 1, 1},
+  {&__pyx_n_u_Pb, __pyx_k_Pb, sizeof(__pyx_k_Pb), 0, 1, 0, 1},
+  {&__pyx_n_s_Pd, __pyx_k_Pd, sizeof(__pyx_k_Pd), 0, 0, 1, 1},
+  {&__pyx_n_u_Pd, __pyx_k_Pd, sizeof(__pyx_k_Pd), 0, 1, 0, 1},
+  {&__pyx_n_s_PeriodicSystem, __pyx_k_PeriodicSystem, sizeof(__pyx_k_PeriodicSystem), 0, 0, 1, 1},
+  {&__pyx_n_s_Pm, __pyx_k_Pm, sizeof(__pyx_k_Pm), 0, 0, 1, 1},
+  {&__pyx_n_u_Pm, __pyx_k_Pm, sizeof(__pyx_k_Pm), 0, 1, 0, 1},
+  {&__pyx_n_s_Po, __pyx_k_Po, sizeof(__pyx_k_Po), 0, 0, 1, 1},
+  {&__pyx_n_u_Po, __pyx_k_Po, sizeof(__pyx_k_Po), 0, 1, 0, 1},
+  {&__pyx_n_s_Pr, __pyx_k_Pr, sizeof(__pyx_k_Pr), 0, 0, 1, 1},
+  {&__pyx_n_u_Pr, __pyx_k_Pr, sizeof(__pyx_k_Pr), 0, 1, 0, 1},
+  {&__pyx_n_s_Pt, __pyx_k_Pt, sizeof(__pyx_k_Pt), 0, 0, 1, 1},
+  {&__pyx_n_u_Pt, __pyx_k_Pt, sizeof(__pyx_k_Pt), 0, 1, 0, 1},
+  {&__pyx_n_s_Pu, __pyx_k_Pu, sizeof(__pyx_k_Pu), 0, 0, 1, 1},
+  {&__pyx_n_u_Pu, __pyx_k_Pu, sizeof(__pyx_k_Pu), 0, 1, 0, 1},
+  {&__pyx_n_s_Quantity, __pyx_k_Quantity, sizeof(__pyx_k_Quantity), 0, 0, 1, 1},
+  {&__pyx_kp_u_RDkit_doesn_t_know_element_0_so, __pyx_k_RDkit_doesn_t_know_element_0_so, sizeof(__pyx_k_RDkit_doesn_t_know_element_0_so), 0, 1, 0, 0},
+  {&__pyx_n_s_Ra, __pyx_k_Ra, sizeof(__pyx_k_Ra), 0, 0, 1, 1},
+  {&__pyx_n_u_Ra, __pyx_k_Ra, sizeof(__pyx_k_Ra), 0, 1, 0, 1},
+  {&__pyx_n_s_Rb, __pyx_k_Rb, sizeof(__pyx_k_Rb), 0, 0, 1, 1},
+  {&__pyx_n_u_Rb, __pyx_k_Rb, sizeof(__pyx_k_Rb), 0, 1, 0, 1},
+  {&__pyx_n_s_Re, __pyx_k_Re, sizeof(__pyx_k_Re), 0, 0, 1, 1},
+  {&__pyx_n_u_Re, __pyx_k_Re, sizeof(__pyx_k_Re), 0, 1, 0, 1},
+  {&__pyx_n_s_Rf, __pyx_k_Rf, sizeof(__pyx_k_Rf), 0, 0, 1, 1},
+  {&__pyx_n_u_Rf, __pyx_k_Rf, sizeof(__pyx_k_Rf), 0, 1, 0, 1},
+  {&__pyx_n_s_Rg, __pyx_k_Rg, sizeof(__pyx_k_Rg), 0, 0, 1, 1},
+  {&__pyx_n_u_Rg, __pyx_k_Rg, sizeof(__pyx_k_Rg), 0, 1, 0, 1},
+  {&__pyx_n_s_Rh, __pyx_k_Rh, sizeof(__pyx_k_Rh), 0, 0, 1, 1},
+  {&__pyx_n_u_Rh, __pyx_k_Rh, sizeof(__pyx_k_Rh), 0, 1, 0, 1},
+  {&__pyx_n_s_Rn, __pyx_k_Rn, sizeof(__pyx_k_Rn), 0, 0, 1, 1},
+  {&__pyx_n_u_Rn, __pyx_k_Rn, sizeof(__pyx_k_Rn), 0, 1, 0, 1},
+  {&__pyx_n_s_Ru, __pyx_k_Ru, sizeof(__pyx_k_Ru), 0, 0, 1, 1},
+  {&__pyx_n_u_Ru, __pyx_k_Ru, sizeof(__pyx_k_Ru), 0, 1, 0, 1},
+  {&__pyx_n_s_RuntimeError, __pyx_k_RuntimeError, sizeof(__pyx_k_RuntimeError), 0, 0, 1, 1},
+  {&__pyx_n_s_S, __pyx_k_S, sizeof(__pyx_k_S), 0, 0, 1, 1},
+  {&__pyx_n_u_S, __pyx_k_S, sizeof(__pyx_k_S), 0, 1, 0, 1},
+  {&__pyx_n_s_Sb, __pyx_k_Sb, sizeof(__pyx_k_Sb), 0, 0, 1, 1},
+  {&__pyx_n_u_Sb, __pyx_k_Sb, sizeof(__pyx_k_Sb), 0, 1, 0, 1},
+  {&__pyx_n_s_Sc, __pyx_k_Sc, sizeof(__pyx_k_Sc), 0, 0, 1, 1},
+  {&__pyx_n_u_Sc, __pyx_k_Sc, sizeof(__pyx_k_Sc), 0, 1, 0, 1},
+  {&__pyx_n_s_Se, __pyx_k_Se, sizeof(__pyx_k_Se), 0, 0, 1, 1},
+  {&__pyx_n_u_Se, __pyx_k_Se, sizeof(__pyx_k_Se), 0, 1, 0, 1},
+  {&__pyx_n_s_Sg, __pyx_k_Sg, sizeof(__pyx_k_Sg), 0, 0, 1, 1},
+  {&__pyx_n_u_Sg, __pyx_k_Sg, sizeof(__pyx_k_Sg), 0, 1, 0, 1},
+  {&__pyx_n_s_Si, __pyx_k_Si, sizeof(__pyx_k_Si), 0, 0, 1, 1},
+  {&__pyx_n_u_Si, __pyx_k_Si, sizeof(__pyx_k_Si), 0, 1, 0, 1},
+  {&__pyx_n_s_Sm, __pyx_k_Sm, sizeof(__pyx_k_Sm), 0, 0, 1, 1},
+  {&__pyx_n_u_Sm, __pyx_k_Sm, sizeof(__pyx_k_Sm), 0, 1, 0, 1},
+  {&__pyx_n_s_Sn, __pyx_k_Sn, sizeof(__pyx_k_Sn), 0, 0, 1, 1},
+  {&__pyx_n_u_Sn, __pyx_k_Sn, sizeof(__pyx_k_Sn), 0, 1, 0, 1},
+  {&__pyx_n_s_Sr, __pyx_k_Sr, sizeof(__pyx_k_Sr), 0, 0, 1, 1},
+  {&__pyx_n_u_Sr, __pyx_k_Sr, sizeof(__pyx_k_Sr), 0, 1, 0, 1},
+  {&__pyx_n_s_T, __pyx_k_T, sizeof(__pyx_k_T), 0, 0, 1, 1},
+  {&__pyx_n_u_T, __pyx_k_T, sizeof(__pyx_k_T), 0, 1, 0, 1},
+  {&__pyx_n_s_Ta, __pyx_k_Ta, sizeof(__pyx_k_Ta), 0, 0, 1, 1},
+  {&__pyx_n_u_Ta, __pyx_k_Ta, sizeof(__pyx_k_Ta), 0, 1, 0, 1},
+  {&__pyx_n_s_Tb, __pyx_k_Tb, sizeof(__pyx_k_Tb), 0, 0, 1, 1},
+  {&__pyx_n_u_Tb, __pyx_k_Tb, sizeof(__pyx_k_Tb), 0, 1, 0, 1},
+  {&__pyx_n_s_Tc, __pyx_k_Tc, sizeof(__pyx_k_Tc), 0, 0, 1, 1},
+  {&__pyx_n_u_Tc, __pyx_k_Tc, sizeof(__pyx_k_Tc), 0, 1, 0, 1},
+  {&__pyx_n_s_Te, __pyx_k_Te, sizeof(__pyx_k_Te), 0, 0, 1, 1},
+  {&__pyx_n_u_Te, __pyx_k_Te, sizeof(__pyx_k_Te), 0, 1, 0, 1},
+  {&__pyx_n_s_Th, __pyx_k_Th, sizeof(__pyx_k_Th), 0, 0, 1, 1},
+  {&__pyx_n_u_Th, __pyx_k_Th, sizeof(__pyx_k_Th), 0, 1, 0, 1},
+  {&__pyx_n_s_Ti, __pyx_k_Ti, sizeof(__pyx_k_Ti), 0, 0, 1, 1},
+  {&__pyx_n_u_Ti, __pyx_k_Ti, sizeof(__pyx_k_Ti), 0, 1, 0, 1},
+  {&__pyx_n_s_Tl, __pyx_k_Tl, sizeof(__pyx_k_Tl), 0, 0, 1, 1},
+  {&__pyx_n_u_Tl, __pyx_k_Tl, sizeof(__pyx_k_Tl), 0, 1, 0, 1},
+  {&__pyx_n_s_Tm, __pyx_k_Tm, sizeof(__pyx_k_Tm), 0, 0, 1, 1},
+  {&__pyx_n_u_Tm, __pyx_k_Tm, sizeof(__pyx_k_Tm), 0, 1, 0, 1},
+  {&__pyx_n_s_U, __pyx_k_U, sizeof(__pyx_k_U), 0, 0, 1, 1},
+  {&__pyx_n_u_U, __pyx_k_U, sizeof(__pyx_k_U), 0, 1, 0, 1},
+  {&__pyx_n_s_V, __pyx_k_V, sizeof(__pyx_k_V), 0, 0, 1, 1},
+  {&__pyx_n_u_V, __pyx_k_V, sizeof(__pyx_k_V), 0, 1, 0, 1},
+  {&__pyx_n_s_W, __pyx_k_W, sizeof(__pyx_k_W), 0, 0, 1, 1},
+  {&__pyx_n_u_W, __pyx_k_W, sizeof(__pyx_k_W), 0, 1, 0, 1},
+  {&__pyx_n_s_X, __pyx_k_X, sizeof(__pyx_k_X), 0, 0, 1, 1},
+  {&__pyx_n_u_X, __pyx_k_X, sizeof(__pyx_k_X), 0, 1, 0, 1},
+  {&__pyx_n_s_Xe, __pyx_k_Xe, sizeof(__pyx_k_Xe), 0, 0, 1, 1},
+  {&__pyx_n_u_Xe, __pyx_k_Xe, sizeof(__pyx_k_Xe), 0, 1, 0, 1},
+  {&__pyx_n_s_Y, __pyx_k_Y, sizeof(__pyx_k_Y), 0, 0, 1, 1},
+  {&__pyx_n_u_Y, __pyx_k_Y, sizeof(__pyx_k_Y), 0, 1, 0, 1},
+  {&__pyx_n_s_Yb, __pyx_k_Yb, sizeof(__pyx_k_Yb), 0, 0, 1, 1},
+  {&__pyx_n_u_Yb, __pyx_k_Yb, sizeof(__pyx_k_Yb), 0, 1, 0, 1},
+  {&__pyx_n_s_Zn, __pyx_k_Zn, sizeof(__pyx_k_Zn), 0, 0, 1, 1},
+  {&__pyx_n_u_Zn, __pyx_k_Zn, sizeof(__pyx_k_Zn), 0, 1, 0, 1},
+  {&__pyx_n_s_Zr, __pyx_k_Zr, sizeof(__pyx_k_Zr), 0, 0, 1, 1},
+  {&__pyx_n_u_Zr, __pyx_k_Zr, sizeof(__pyx_k_Zr), 0, 1, 0, 1},
+  {&__pyx_kp_u__2, __pyx_k__2, sizeof(__pyx_k__2), 0, 1, 0, 0},
+  {&__pyx_kp_u__3, __pyx_k__3, sizeof(__pyx_k__3), 0, 1, 0, 0},
+  {&__pyx_kp_u__4, __pyx_k__4, sizeof(__pyx_k__4), 0, 1, 0, 0},
+  {&__pyx_kp_u__5, __pyx_k__5, sizeof(__pyx_k__5), 0, 1, 0, 0},
+  {&__pyx_n_u_actinum, __pyx_k_actinum, sizeof(__pyx_k_actinum), 0, 1, 0, 1},
+  {&__pyx_n_u_aluminium, __pyx_k_aluminium, sizeof(__pyx_k_aluminium), 0, 1, 0, 1},
+  {&__pyx_n_u_americium, __pyx_k_americium, sizeof(__pyx_k_americium), 0, 1, 0, 1},
+  {&__pyx_n_u_antimony, __pyx_k_antimony, sizeof(__pyx_k_antimony), 0, 1, 0, 1},
+  {&__pyx_n_u_argon, __pyx_k_argon, sizeof(__pyx_k_argon), 0, 1, 0, 1},
+  {&__pyx_n_u_arsenic, __pyx_k_arsenic, sizeof(__pyx_k_arsenic), 0, 1, 0, 1},
+  {&__pyx_n_u_astatine, __pyx_k_astatine, sizeof(__pyx_k_astatine), 0, 1, 0, 1},
+  {&__pyx_n_u_barium, __pyx_k_barium, sizeof(__pyx_k_barium), 0, 1, 0, 1},
+  {&__pyx_n_s_bde_dict, __pyx_k_bde_dict, sizeof(__pyx_k_bde_dict), 0, 0, 1, 1},
+  {&__pyx_n_s_bde_elements, __pyx_k_bde_elements, sizeof(__pyx_k_bde_elements), 0, 0, 1, 1},
+  {&__pyx_n_s_bdes, __pyx_k_bdes, sizeof(__pyx_k_bdes), 0, 0, 1, 1},
+  {&__pyx_n_u_berkelium, __pyx_k_berkelium, sizeof(__pyx_k_berkelium), 0, 1, 0, 1},
+  {&__pyx_n_u_beryllium, __pyx_k_beryllium, sizeof(__pyx_k_beryllium), 0, 1, 0, 1},
+  {&__pyx_n_u_bismuth, __pyx_k_bismuth, sizeof(__pyx_k_bismuth), 0, 1, 0, 1},
+  {&__pyx_n_u_bohrium, __pyx_k_bohrium, sizeof(__pyx_k_bohrium), 0, 1, 0, 1},
+  {&__pyx_n_u_boron, __pyx_k_boron, sizeof(__pyx_k_boron), 0, 1, 0, 1},
+  {&__pyx_n_u_bromine, __pyx_k_bromine, sizeof(__pyx_k_bromine), 0, 1, 0, 1},
+  {&__pyx_n_u_cadmium, __pyx_k_cadmium, sizeof(__pyx_k_cadmium), 0, 1, 0, 1},
+  {&__pyx_n_u_caesium, __pyx_k_caesium, sizeof(__pyx_k_caesium), 0, 1, 0, 1},
+  {&__pyx_n_u_calcium, __pyx_k_calcium, sizeof(__pyx_k_calcium), 0, 1, 0, 1},
+  {&__pyx_n_u_californium, __pyx_k_californium, sizeof(__pyx_k_californium), 0, 1, 0, 1},
+  {&__pyx_n_u_carbon, __pyx_k_carbon, sizeof(__pyx_k_carbon), 0, 1, 0, 1},
+  {&__pyx_kp_u_carbon_13, __pyx_k_carbon_13, sizeof(__pyx_k_carbon_13), 0, 1, 0, 0},
+  {&__pyx_n_u_cerium, __pyx_k_cerium, sizeof(__pyx_k_cerium), 0, 1, 0, 1},
+  {&__pyx_n_s_chemkin_name, __pyx_k_chemkin_name, sizeof(__pyx_k_chemkin_name), 0, 0, 1, 1},
+  {&__pyx_n_u_chlorine, __pyx_k_chlorine, sizeof(__pyx_k_chlorine), 0, 1, 0, 1},
+  {&__pyx_n_u_chromium, __pyx_k_chromium, sizeof(__pyx_k_chromium), 0, 1, 0, 1},
+  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_u_cobalt, __pyx_k_cobalt, sizeof(__pyx_k_cobalt), 0, 1, 0, 1},
+  {&__pyx_n_u_copernicum, __pyx_k_copernicum, sizeof(__pyx_k_copernicum), 0, 1, 0, 1},
+  {&__pyx_n_u_copper, __pyx_k_copper, sizeof(__pyx_k_copper), 0, 1, 0, 1},
+  {&__pyx_n_u_curium, __pyx_k_curium, sizeof(__pyx_k_curium), 0, 1, 0, 1},
+  {&__pyx_n_u_darmstadtium, __pyx_k_darmstadtium, sizeof(__pyx_k_darmstadtium), 0, 1, 0, 1},
+  {&__pyx_n_u_deuterium, __pyx_k_deuterium, sizeof(__pyx_k_deuterium), 0, 1, 0, 1},
+  {&__pyx_n_s_doc, __pyx_k_doc, sizeof(__pyx_k_doc), 0, 0, 1, 1},
+  {&__pyx_n_u_dubnium, __pyx_k_dubnium, sizeof(__pyx_k_dubnium), 0, 1, 0, 1},
+  {&__pyx_n_u_dysprosium, __pyx_k_dysprosium, sizeof(__pyx_k_dysprosium), 0, 1, 0, 1},
+  {&__pyx_n_u_einsteinium, __pyx_k_einsteinium, sizeof(__pyx_k_einsteinium), 0, 1, 0, 1},
+  {&__pyx_n_s_electronegativity, __pyx_k_electronegativity, sizeof(__pyx_k_electronegativity), 0, 0, 1, 1},
+  {&__pyx_n_s_element_list, __pyx_k_element_list, sizeof(__pyx_k_element_list), 0, 0, 1, 1},
+  {&__pyx_n_u_erbium, __pyx_k_erbium, sizeof(__pyx_k_erbium), 0, 1, 0, 1},
+  {&__pyx_n_s_error, __pyx_k_error, sizeof(__pyx_k_error), 0, 0, 1, 1},
+  {&__pyx_n_u_europium, __pyx_k_europium, sizeof(__pyx_k_europium), 0, 1, 0, 1},
+  {&__pyx_n_u_fermium, __pyx_k_fermium, sizeof(__pyx_k_fermium), 0, 1, 0, 1},
+  {&__pyx_n_u_fluorine, __pyx_k_fluorine, sizeof(__pyx_k_fluorine), 0, 1, 0, 1},
+  {&__pyx_n_s_format, __pyx_k_format, sizeof(__pyx_k_format), 0, 0, 1, 1},
+  {&__pyx_n_u_francium, __pyx_k_francium, sizeof(__pyx_k_francium), 0, 1, 0, 1},
+  {&__pyx_n_u_gadolinium, __pyx_k_gadolinium, sizeof(__pyx_k_gadolinium), 0, 1, 0, 1},
+  {&__pyx_n_u_gallium, __pyx_k_gallium, sizeof(__pyx_k_gallium), 0, 1, 0, 1},
+  {&__pyx_n_u_germanium, __pyx_k_germanium, sizeof(__pyx_k_germanium), 0, 1, 0, 1},
+  {&__pyx_n_s_get_element, __pyx_k_get_element, sizeof(__pyx_k_get_element), 0, 0, 1, 1},
+  {&__pyx_n_u_gold, __pyx_k_gold, sizeof(__pyx_k_gold), 0, 1, 0, 1},
+  {&__pyx_n_u_hafnium, __pyx_k_hafnium, sizeof(__pyx_k_hafnium), 0, 1, 0, 1},
+  {&__pyx_n_u_hassium, __pyx_k_hassium, sizeof(__pyx_k_hassium), 0, 1, 0, 1},
+  {&__pyx_n_u_helium, __pyx_k_helium, sizeof(__pyx_k_helium), 0, 1, 0, 1},
+  {&__pyx_n_u_holmium, __pyx_k_holmium, sizeof(__pyx_k_holmium), 0, 1, 0, 1},
+  {&__pyx_n_u_hydrogen, __pyx_k_hydrogen, sizeof(__pyx_k_hydrogen), 0, 1, 0, 1},
+  {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_u_indium, __pyx_k_indium, sizeof(__pyx_k_indium), 0, 1, 0, 1},
+  {&__pyx_n_u_iodine, __pyx_k_iodine, sizeof(__pyx_k_iodine), 0, 1, 0, 1},
+  {&__pyx_n_u_iridium, __pyx_k_iridium, sizeof(__pyx_k_iridium), 0, 1, 0, 1},
+  {&__pyx_n_u_iron, __pyx_k_iron, sizeof(__pyx_k_iron), 0, 1, 0, 1},
+  {&__pyx_n_s_isotope, __pyx_k_isotope, sizeof(__pyx_k_isotope), 0, 0, 1, 1},
+  {&__pyx_n_s_items, __pyx_k_items, sizeof(__pyx_k_items), 0, 0, 1, 1},
+  {&__pyx_kp_u_kJ_mol, __pyx_k_kJ_mol, sizeof(__pyx_k_kJ_mol), 0, 1, 0, 0},
+  {&__pyx_n_s_key, __pyx_k_key, sizeof(__pyx_k_key), 0, 0, 1, 1},
+  {&__pyx_n_u_krypton, __pyx_k_krypton, sizeof(__pyx_k_krypton), 0, 1, 0, 1},
+  {&__pyx_n_u_lanthanum, __pyx_k_lanthanum, sizeof(__pyx_k_lanthanum), 0, 1, 0, 1},
+  {&__pyx_n_u_lawrencium, __pyx_k_lawrencium, sizeof(__pyx_k_lawrencium), 0, 1, 0, 1},
+  {&__pyx_n_u_lead, __pyx_k_lead, sizeof(__pyx_k_lead), 0, 1, 0, 1},
+  {&__pyx_n_u_lithium, __pyx_k_lithium, sizeof(__pyx_k_lithium), 0, 1, 0, 1},
+  {&__pyx_n_s_logging, __pyx_k_logging, sizeof(__pyx_k_logging), 0, 0, 1, 1},
+  {&__pyx_n_s_lone_pairs, __pyx_k_lone_pairs, sizeof(__pyx_k_lone_pairs), 0, 0, 1, 1},
+  {&__pyx_n_u_lutetium, __pyx_k_lutetium, sizeof(__pyx_k_lutetium), 0, 1, 0, 1},
+  {&__pyx_n_u_magnesium, __pyx_k_magnesium, sizeof(__pyx_k_magnesium), 0, 1, 0, 1},
+  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_u_manganese, __pyx_k_manganese, sizeof(__pyx_k_manganese), 0, 1, 0, 1},
+  {&__pyx_n_s_mass, __pyx_k_mass, sizeof(__pyx_k_mass), 0, 0, 1, 1},
+  {&__pyx_n_u_meitnerium, __pyx_k_meitnerium, sizeof(__pyx_k_meitnerium), 0, 1, 0, 1},
+  {&__pyx_n_u_mendelevium, __pyx_k_mendelevium, sizeof(__pyx_k_mendelevium), 0, 1, 0, 1},
+  {&__pyx_n_u_mercury, __pyx_k_mercury, sizeof(__pyx_k_mercury), 0, 1, 0, 1},
+  {&__pyx_n_s_metaclass, __pyx_k_metaclass, sizeof(__pyx_k_metaclass), 0, 0, 1, 1},
+  {&__pyx_n_s_module, __pyx_k_module, sizeof(__pyx_k_module), 0, 0, 1, 1},
+  {&__pyx_n_u_molybdenum, __pyx_k_molybdenum, sizeof(__pyx_k_molybdenum), 0, 1, 0, 1},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_n_s_name_2, __pyx_k_name_2, sizeof(__pyx_k_name_2), 0, 0, 1, 1},
+  {&__pyx_n_u_neodymium, __pyx_k_neodymium, sizeof(__pyx_k_neodymium), 0, 1, 0, 1},
+  {&__pyx_n_u_neon, __pyx_k_neon, sizeof(__pyx_k_neon), 0, 1, 0, 1},
+  {&__pyx_n_u_neptunium, __pyx_k_neptunium, sizeof(__pyx_k_neptunium), 0, 1, 0, 1},
+  {&__pyx_n_u_nickel, __pyx_k_nickel, sizeof(__pyx_k_nickel), 0, 1, 0, 1},
+  {&__pyx_n_u_niobium, __pyx_k_niobium, sizeof(__pyx_k_niobium), 0, 1, 0, 1},
+  {&__pyx_n_u_nitrogen, __pyx_k_nitrogen, sizeof(__pyx_k_nitrogen), 0, 1, 0, 1},
+  {&__pyx_n_u_nobelium, __pyx_k_nobelium, sizeof(__pyx_k_nobelium), 0, 1, 0, 1},
+  {&__pyx_n_s_number, __pyx_k_number, sizeof(__pyx_k_number), 0, 0, 1, 1},
+  {&__pyx_n_s_object, __pyx_k_object, sizeof(__pyx_k_object), 0, 0, 1, 1},
+  {&__pyx_n_u_osmium, __pyx_k_osmium, sizeof(__pyx_k_osmium), 0, 1, 0, 1},
+  {&__pyx_n_u_oxygen, __pyx_k_oxygen, sizeof(__pyx_k_oxygen), 0, 1, 0, 1},
+  {&__pyx_kp_u_oxygen_18, __pyx_k_oxygen_18, sizeof(__pyx_k_oxygen_18), 0, 1, 0, 0},
+  {&__pyx_n_u_palladium, __pyx_k_palladium, sizeof(__pyx_k_palladium), 0, 1, 0, 1},
+  {&__pyx_n_u_phosphorus, __pyx_k_phosphorus, sizeof(__pyx_k_phosphorus), 0, 1, 0, 1},
+  {&__pyx_n_u_platinum, __pyx_k_platinum, sizeof(__pyx_k_platinum), 0, 1, 0, 1},
+  {&__pyx_n_u_plutonium, __pyx_k_plutonium, sizeof(__pyx_k_plutonium), 0, 1, 0, 1},
+  {&__pyx_n_u_polonium, __pyx_k_polonium, sizeof(__pyx_k_polonium), 0, 1, 0, 1},
+  {&__pyx_n_u_potassium, __pyx_k_potassium, sizeof(__pyx_k_potassium), 0, 1, 0, 1},
+  {&__pyx_n_u_praesodymium, __pyx_k_praesodymium, sizeof(__pyx_k_praesodymium), 0, 1, 0, 1},
+  {&__pyx_n_s_prepare, __pyx_k_prepare, sizeof(__pyx_k_prepare), 0, 0, 1, 1},
+  {&__pyx_n_u_promethium, __pyx_k_promethium, sizeof(__pyx_k_promethium), 0, 1, 0, 1},
+  {&__pyx_n_u_protactinum, __pyx_k_protactinum, sizeof(__pyx_k_protactinum), 0, 1, 0, 1},
+  {&__pyx_n_s_q, __pyx_k_q, sizeof(__pyx_k_q), 0, 0, 1, 1},
+  {&__pyx_n_s_qualname, __pyx_k_qualname, sizeof(__pyx_k_qualname), 0, 0, 1, 1},
+  {&__pyx_n_u_radium, __pyx_k_radium, sizeof(__pyx_k_radium), 0, 1, 0, 1},
+  {&__pyx_n_u_radon, __pyx_k_radon, sizeof(__pyx_k_radon), 0, 1, 0, 1},
+  {&__pyx_n_s_rdkit_Chem, __pyx_k_rdkit_Chem, sizeof(__pyx_k_rdkit_Chem), 0, 0, 1, 1},
+  {&__pyx_n_s_rdkit_periodic_table, __pyx_k_rdkit_periodic_table, sizeof(__pyx_k_rdkit_periodic_table), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
+  {&__pyx_n_u_rhenium, __pyx_k_rhenium, sizeof(__pyx_k_rhenium), 0, 1, 0, 1},
+  {&__pyx_n_u_rhodium, __pyx_k_rhodium, sizeof(__pyx_k_rhodium), 0, 1, 0, 1},
+  {&__pyx_n_s_rmgpy_exceptions, __pyx_k_rmgpy_exceptions, sizeof(__pyx_k_rmgpy_exceptions), 0, 0, 1, 1},
+  {&__pyx_n_s_rmgpy_molecule_element, __pyx_k_rmgpy_molecule_element, sizeof(__pyx_k_rmgpy_molecule_element), 0, 0, 1, 1},
+  {&__pyx_kp_s_rmgpy_molecule_element_py, __pyx_k_rmgpy_molecule_element_py, sizeof(__pyx_k_rmgpy_molecule_element_py), 0, 0, 1, 0},
+  {&__pyx_n_s_rmgpy_quantity, __pyx_k_rmgpy_quantity, sizeof(__pyx_k_rmgpy_quantity), 0, 0, 1, 1},
+  {&__pyx_n_u_roentgenium, __pyx_k_roentgenium, sizeof(__pyx_k_roentgenium), 0, 1, 0, 1},
+  {&__pyx_n_u_rubidium, __pyx_k_rubidium, sizeof(__pyx_k_rubidium), 0, 1, 0, 1},
+  {&__pyx_n_u_ruthenium, __pyx_k_ruthenium, sizeof(__pyx_k_ruthenium), 0, 1, 0, 1},
+  {&__pyx_n_u_rutherfordium, __pyx_k_rutherfordium, sizeof(__pyx_k_rutherfordium), 0, 1, 0, 1},
+  {&__pyx_n_u_samarium, __pyx_k_samarium, sizeof(__pyx_k_samarium), 0, 1, 0, 1},
+  {&__pyx_n_u_scandium, __pyx_k_scandium, sizeof(__pyx_k_scandium), 0, 1, 0, 1},
+  {&__pyx_n_u_seaborgium, __pyx_k_seaborgium, sizeof(__pyx_k_seaborgium), 0, 1, 0, 1},
+  {&__pyx_n_u_selenium, __pyx_k_selenium, sizeof(__pyx_k_selenium), 0, 1, 0, 1},
+  {&__pyx_n_s_self, __pyx_k_self, sizeof(__pyx_k_self), 0, 0, 1, 1},
+  {&__pyx_n_u_silicon, __pyx_k_silicon, sizeof(__pyx_k_silicon), 0, 1, 0, 1},
+  {&__pyx_n_u_silver, __pyx_k_silver, sizeof(__pyx_k_silver), 0, 1, 0, 1},
+  {&__pyx_n_u_sodium, __pyx_k_sodium, sizeof(__pyx_k_sodium), 0, 1, 0, 1},
+  {&__pyx_n_u_strontium, __pyx_k_strontium, sizeof(__pyx_k_strontium), 0, 1, 0, 1},
+  {&__pyx_n_u_sulfur, __pyx_k_sulfur, sizeof(__pyx_k_sulfur), 0, 1, 0, 1},
+  {&__pyx_n_u_surface_site, __pyx_k_surface_site, sizeof(__pyx_k_surface_site), 0, 1, 0, 1},
+  {&__pyx_n_s_symbol, __pyx_k_symbol, sizeof(__pyx_k_symbol), 0, 0, 1, 1},
+  {&__pyx_n_u_tantalum, __pyx_k_tantalum, sizeof(__pyx_k_tantalum), 0, 1, 0, 1},
+  {&__pyx_n_u_technetium, __pyx_k_technetium, sizeof(__pyx_k_technetium), 0, 1, 0, 1},
+  {&__pyx_n_u_tellurium, __pyx_k_tellurium, sizeof(__pyx_k_tellurium), 0, 1, 0, 1},
+  {&__pyx_n_u_terbium, __pyx_k_terbium, sizeof(__pyx_k_terbium), 0, 1, 0, 1},
+  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_n_u_thallium, __pyx_k_thallium, sizeof(__pyx_k_thallium), 0, 1, 0, 1},
+  {&__pyx_n_u_thorium, __pyx_k_thorium, sizeof(__pyx_k_thorium), 0, 1, 0, 1},
+  {&__pyx_n_u_thulium, __pyx_k_thulium, sizeof(__pyx_k_thulium), 0, 1, 0, 1},
+  {&__pyx_n_u_tin, __pyx_k_tin, sizeof(__pyx_k_tin), 0, 1, 0, 1},
+  {&__pyx_n_u_titanium, __pyx_k_titanium, sizeof(__pyx_k_titanium), 0, 1, 0, 1},
+  {&__pyx_n_u_tritium, __pyx_k_tritium, sizeof(__pyx_k_tritium), 0, 1, 0, 1},
+  {&__pyx_n_u_tungsten, __pyx_k_tungsten, sizeof(__pyx_k_tungsten), 0, 1, 0, 1},
+  {&__pyx_n_u_uranium, __pyx_k_uranium, sizeof(__pyx_k_uranium), 0, 1, 0, 1},
+  {&__pyx_n_s_valence_electrons, __pyx_k_valence_electrons, sizeof(__pyx_k_valence_electrons), 0, 0, 1, 1},
+  {&__pyx_n_s_valences, __pyx_k_valences, sizeof(__pyx_k_valences), 0, 0, 1, 1},
+  {&__pyx_n_s_value, __pyx_k_value, sizeof(__pyx_k_value), 0, 0, 1, 1},
+  {&__pyx_n_s_value_si, __pyx_k_value_si, sizeof(__pyx_k_value_si), 0, 0, 1, 1},
+  {&__pyx_n_u_vanadium, __pyx_k_vanadium, sizeof(__pyx_k_vanadium), 0, 1, 0, 1},
+  {&__pyx_n_u_xenon, __pyx_k_xenon, sizeof(__pyx_k_xenon), 0, 1, 0, 1},
+  {&__pyx_n_u_ytterbium, __pyx_k_ytterbium, sizeof(__pyx_k_ytterbium), 0, 1, 0, 1},
+  {&__pyx_n_u_yttrium, __pyx_k_yttrium, sizeof(__pyx_k_yttrium), 0, 1, 0, 1},
+  {&__pyx_n_u_zinc, __pyx_k_zinc, sizeof(__pyx_k_zinc), 0, 1, 0, 1},
+  {&__pyx_n_u_zirconium, __pyx_k_zirconium, sizeof(__pyx_k_zirconium), 0, 1, 0, 1},
+  {0, 0, 0, 0, 0, 0, 0}
+};
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_object = __Pyx_GetBuiltinName(__pyx_n_s_object); if (!__pyx_builtin_object) __PYX_ERR(0, 111, __pyx_L1_error)
+  __pyx_builtin_RuntimeError = __Pyx_GetBuiltinName(__pyx_n_s_RuntimeError); if (!__pyx_builtin_RuntimeError) __PYX_ERR(0, 87, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "rmgpy/molecule/element.py":104
+ *         return "Element(%s, '%s', '%s', %s, %s)" % (self.number, self.symbol, self.name, self.mass, self.isotope)
+ * 
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         A helper function used when pickling an object.
+ */
+  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 104, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+  __pyx_codeobj__7 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__6, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rmgpy_molecule_element_py, __pyx_n_s_reduce, 104, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__7)) __PYX_ERR(0, 104, __pyx_L1_error)
+
+  /* "rmgpy/molecule/element.py":111
+ * 
+ * 
+ * class PeriodicSystem(object):             # <<<<<<<<<<<<<<
+ *     """
+ *     Collects hard-coded information of elements in periodic table.
+ */
+  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_builtin_object); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 111, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
+
+  /* "rmgpy/molecule/element.py":139
+ * 
+ * 
+ * def get_element(value, isotope=-1):             # <<<<<<<<<<<<<<
+ *     """
+ *     Return the :class:`Element` object corresponding to the given parameter
+ */
+  __pyx_tuple__9 = PyTuple_Pack(2, __pyx_n_s_value, __pyx_n_s_isotope); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(0, 139, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
+  __pyx_codeobj__10 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__9, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rmgpy_molecule_element_py, __pyx_n_s_get_element, 139, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__10)) __PYX_ERR(0, 139, __pyx_L1_error)
+
+  /* "rmgpy/molecule/element.py":179
+ * 
+ * # Surface site
+ * X = Element(0,    'X', 'surface_site'   , 0.0)             # <<<<<<<<<<<<<<
+ * 
+ * # Period 1
+ */
+  __pyx_tuple__11 = PyTuple_Pack(4, __pyx_int_0, __pyx_n_u_X, __pyx_n_u_surface_site, __pyx_float_0_0); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 179, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
+
+  /* "rmgpy/molecule/element.py":183
+ * # Period 1
+ * # Hydrogen
+ * H  = Element(1,   'H' , 'hydrogen'      , 0.00100794)             # <<<<<<<<<<<<<<
+ * D  = Element(1,   'H' , 'deuterium'     , 0.002014101, 2, 'D')
+ * T  = Element(1,   'H' , 'tritium'       , 0.003016049, 3, 'T')
+ */
+  __pyx_tuple__12 = PyTuple_Pack(4, __pyx_int_1, __pyx_n_u_H, __pyx_n_u_hydrogen, __pyx_float_0_00100794); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 183, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
+
+  /* "rmgpy/molecule/element.py":184
+ * # Hydrogen
+ * H  = Element(1,   'H' , 'hydrogen'      , 0.00100794)
+ * D  = Element(1,   'H' , 'deuterium'     , 0.002014101, 2, 'D')             # <<<<<<<<<<<<<<
+ * T  = Element(1,   'H' , 'tritium'       , 0.003016049, 3, 'T')
+ * He = Element(2,   'He', 'helium'        , 0.004002602)
+ */
+  __pyx_tuple__13 = PyTuple_Pack(6, __pyx_int_1, __pyx_n_u_H, __pyx_n_u_deuterium, __pyx_float_0_002014101, __pyx_int_2, __pyx_n_u_D); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 184, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
+
+  /* "rmgpy/molecule/element.py":185
+ * H  = Element(1,   'H' , 'hydrogen'      , 0.00100794)
+ * D  = Element(1,   'H' , 'deuterium'     , 0.002014101, 2, 'D')
+ * T  = Element(1,   'H' , 'tritium'       , 0.003016049, 3, 'T')             # <<<<<<<<<<<<<<
+ * He = Element(2,   'He', 'helium'        , 0.004002602)
+ * 
+ */
+  __pyx_tuple__14 = PyTuple_Pack(6, __pyx_int_1, __pyx_n_u_H, __pyx_n_u_tritium, __pyx_float_0_003016049, __pyx_int_3, __pyx_n_u_T); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(0, 185, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__14);
+  __Pyx_GIVEREF(__pyx_tuple__14);
+
+  /* "rmgpy/molecule/element.py":186
+ * D  = Element(1,   'H' , 'deuterium'     , 0.002014101, 2, 'D')
+ * T  = Element(1,   'H' , 'tritium'       , 0.003016049, 3, 'T')
+ * He = Element(2,   'He', 'helium'        , 0.004002602)             # <<<<<<<<<<<<<<
+ * 
+ * # Period 2
+ */
+  __pyx_tuple__15 = PyTuple_Pack(4, __pyx_int_2, __pyx_n_u_He, __pyx_n_u_helium, __pyx_float_0_004002602); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__15);
+  __Pyx_GIVEREF(__pyx_tuple__15);
+
+  /* "rmgpy/molecule/element.py":189
+ * 
+ * # Period 2
+ * Li = Element(3,   'Li', 'lithium'       , 0.006941)             # <<<<<<<<<<<<<<
+ * Be = Element(4,   'Be', 'beryllium'     , 0.009012182)
+ * B  = Element(5,   'B',  'boron'         , 0.010811)
+ */
+  __pyx_tuple__16 = PyTuple_Pack(4, __pyx_int_3, __pyx_n_u_Li, __pyx_n_u_lithium, __pyx_float_0_006941); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(0, 189, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__16);
+  __Pyx_GIVEREF(__pyx_tuple__16);
+
+  /* "rmgpy/molecule/element.py":190
+ * # Period 2
+ * Li = Element(3,   'Li', 'lithium'       , 0.006941)
+ * Be = Element(4,   'Be', 'beryllium'     , 0.009012182)             # <<<<<<<<<<<<<<
+ * B  = Element(5,   'B',  'boron'         , 0.010811)
+ * C  = Element(6,   'C' , 'carbon'        , 0.0120107)
+ */
+  __pyx_tuple__17 = PyTuple_Pack(4, __pyx_int_4, __pyx_n_u_Be, __pyx_n_u_beryllium, __pyx_float_0_009012182); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(0, 190, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__17);
+  __Pyx_GIVEREF(__pyx_tuple__17);
+
+  /* "rmgpy/molecule/element.py":191
+ * Li = Element(3,   'Li', 'lithium'       , 0.006941)
+ * Be = Element(4,   'Be', 'beryllium'     , 0.009012182)
+ * B  = Element(5,   'B',  'boron'         , 0.010811)             # <<<<<<<<<<<<<<
+ * C  = Element(6,   'C' , 'carbon'        , 0.0120107)
+ * C13= Element(6,   'C' , 'carbon-13'     , 0.0130033, 13, 'CI')
+ */
+  __pyx_tuple__18 = PyTuple_Pack(4, __pyx_int_5, __pyx_n_u_B, __pyx_n_u_boron, __pyx_float_0_010811); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(0, 191, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__18);
+  __Pyx_GIVEREF(__pyx_tuple__18);
+
+  /* "rmgpy/molecule/element.py":192
+ * Be = Element(4,   'Be', 'beryllium'     , 0.009012182)
+ * B  = Element(5,   'B',  'boron'         , 0.010811)
+ * C  = Element(6,   'C' , 'carbon'        , 0.0120107)             # <<<<<<<<<<<<<<
+ * C13= Element(6,   'C' , 'carbon-13'     , 0.0130033, 13, 'CI')
+ * N  = Element(7,   'N' , 'nitrogen'      , 0.01400674)
+ */
+  __pyx_tuple__19 = PyTuple_Pack(4, __pyx_int_6, __pyx_n_u_C, __pyx_n_u_carbon, __pyx_float_0_0120107); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(0, 192, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__19);
+  __Pyx_GIVEREF(__pyx_tuple__19);
+
+  /* "rmgpy/molecule/element.py":193
+ * B  = Element(5,   'B',  'boron'         , 0.010811)
+ * C  = Element(6,   'C' , 'carbon'        , 0.0120107)
+ * C13= Element(6,   'C' , 'carbon-13'     , 0.0130033, 13, 'CI')             # <<<<<<<<<<<<<<
+ * N  = Element(7,   'N' , 'nitrogen'      , 0.01400674)
+ * O  = Element(8,   'O' , 'oxygen'        , 0.0159994)
+ */
+  __pyx_tuple__20 = PyTuple_Pack(6, __pyx_int_6, __pyx_n_u_C, __pyx_kp_u_carbon_13, __pyx_float_0_0130033, __pyx_int_13, __pyx_n_u_CI); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(0, 193, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__20);
+  __Pyx_GIVEREF(__pyx_tuple__20);
+
+  /* "rmgpy/molecule/element.py":194
+ * C  = Element(6,   'C' , 'carbon'        , 0.0120107)
+ * C13= Element(6,   'C' , 'carbon-13'     , 0.0130033, 13, 'CI')
+ * N  = Element(7,   'N' , 'nitrogen'      , 0.01400674)             # <<<<<<<<<<<<<<
+ * O  = Element(8,   'O' , 'oxygen'        , 0.0159994)
+ * O18= Element(8,   'O' , 'oxygen-18'     , 0.0179999, 18, 'OI')
+ */
+  __pyx_tuple__21 = PyTuple_Pack(4, __pyx_int_7, __pyx_n_u_N, __pyx_n_u_nitrogen, __pyx_float_0_01400674); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(0, 194, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__21);
+  __Pyx_GIVEREF(__pyx_tuple__21);
+
+  /* "rmgpy/molecule/element.py":195
+ * C13= Element(6,   'C' , 'carbon-13'     , 0.0130033, 13, 'CI')
+ * N  = Element(7,   'N' , 'nitrogen'      , 0.01400674)
+ * O  = Element(8,   'O' , 'oxygen'        , 0.0159994)             # <<<<<<<<<<<<<<
+ * O18= Element(8,   'O' , 'oxygen-18'     , 0.0179999, 18, 'OI')
+ * F  = Element(9,   'F' , 'fluorine'      , 0.018998403)
+ */
+  __pyx_tuple__22 = PyTuple_Pack(4, __pyx_int_8, __pyx_n_u_O, __pyx_n_u_oxygen, __pyx_float_0_0159994); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(0, 195, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__22);
+  __Pyx_GIVEREF(__pyx_tuple__22);
+
+  /* "rmgpy/molecule/element.py":196
+ * N  = Element(7,   'N' , 'nitrogen'      , 0.01400674)
+ * O  = Element(8,   'O' , 'oxygen'        , 0.0159994)
+ * O18= Element(8,   'O' , 'oxygen-18'     , 0.0179999, 18, 'OI')             # <<<<<<<<<<<<<<
+ * F  = Element(9,   'F' , 'fluorine'      , 0.018998403)
+ * Ne = Element(10,  'Ne', 'neon'          , 0.0201797)
+ */
+  __pyx_tuple__23 = PyTuple_Pack(6, __pyx_int_8, __pyx_n_u_O, __pyx_kp_u_oxygen_18, __pyx_float_0_0179999, __pyx_int_18, __pyx_n_u_OI); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(0, 196, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__23);
+  __Pyx_GIVEREF(__pyx_tuple__23);
+
+  /* "rmgpy/molecule/element.py":197
+ * O  = Element(8,   'O' , 'oxygen'        , 0.0159994)
+ * O18= Element(8,   'O' , 'oxygen-18'     , 0.0179999, 18, 'OI')
+ * F  = Element(9,   'F' , 'fluorine'      , 0.018998403)             # <<<<<<<<<<<<<<
+ * Ne = Element(10,  'Ne', 'neon'          , 0.0201797)
+ * 
+ */
+  __pyx_tuple__24 = PyTuple_Pack(4, __pyx_int_9, __pyx_n_u_F, __pyx_n_u_fluorine, __pyx_float_0_018998403); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(0, 197, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__24);
+  __Pyx_GIVEREF(__pyx_tuple__24);
+
+  /* "rmgpy/molecule/element.py":198
+ * O18= Element(8,   'O' , 'oxygen-18'     , 0.0179999, 18, 'OI')
+ * F  = Element(9,   'F' , 'fluorine'      , 0.018998403)
+ * Ne = Element(10,  'Ne', 'neon'          , 0.0201797)             # <<<<<<<<<<<<<<
+ * 
+ * # Period 3
+ */
+  __pyx_tuple__25 = PyTuple_Pack(4, __pyx_int_10, __pyx_n_u_Ne, __pyx_n_u_neon, __pyx_float_0_0201797); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(0, 198, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__25);
+  __Pyx_GIVEREF(__pyx_tuple__25);
+
+  /* "rmgpy/molecule/element.py":201
+ * 
+ * # Period 3
+ * Na = Element(11,  'Na', 'sodium'        , 0.022989770)             # <<<<<<<<<<<<<<
+ * Mg = Element(12,  'Mg', 'magnesium'     , 0.0243050)
+ * Al = Element(13,  'Al', 'aluminium'     , 0.026981538)
+ */
+  __pyx_tuple__26 = PyTuple_Pack(4, __pyx_int_11, __pyx_n_u_Na, __pyx_n_u_sodium, __pyx_float_0_022989770); if (unlikely(!__pyx_tuple__26)) __PYX_ERR(0, 201, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__26);
+  __Pyx_GIVEREF(__pyx_tuple__26);
+
+  /* "rmgpy/molecule/element.py":202
+ * # Period 3
+ * Na = Element(11,  'Na', 'sodium'        , 0.022989770)
+ * Mg = Element(12,  'Mg', 'magnesium'     , 0.0243050)             # <<<<<<<<<<<<<<
+ * Al = Element(13,  'Al', 'aluminium'     , 0.026981538)
+ * Si = Element(14,  'Si', 'silicon'       , 0.0280855)
+ */
+  __pyx_tuple__27 = PyTuple_Pack(4, __pyx_int_12, __pyx_n_u_Mg, __pyx_n_u_magnesium, __pyx_float_0_0243050); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(0, 202, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__27);
+  __Pyx_GIVEREF(__pyx_tuple__27);
+
+  /* "rmgpy/molecule/element.py":203
+ * Na = Element(11,  'Na', 'sodium'        , 0.022989770)
+ * Mg = Element(12,  'Mg', 'magnesium'     , 0.0243050)
+ * Al = Element(13,  'Al', 'aluminium'     , 0.026981538)             # <<<<<<<<<<<<<<
+ * Si = Element(14,  'Si', 'silicon'       , 0.0280855)
+ * P  = Element(15,  'P' , 'phosphorus'    , 0.030973761)
+ */
+  __pyx_tuple__28 = PyTuple_Pack(4, __pyx_int_13, __pyx_n_u_Al, __pyx_n_u_aluminium, __pyx_float_0_026981538); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(0, 203, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__28);
+  __Pyx_GIVEREF(__pyx_tuple__28);
+
+  /* "rmgpy/molecule/element.py":204
+ * Mg = Element(12,  'Mg', 'magnesium'     , 0.0243050)
+ * Al = Element(13,  'Al', 'aluminium'     , 0.026981538)
+ * Si = Element(14,  'Si', 'silicon'       , 0.0280855)             # <<<<<<<<<<<<<<
+ * P  = Element(15,  'P' , 'phosphorus'    , 0.030973761)
+ * S  = Element(16,  'S' , 'sulfur'        , 0.032065)
+ */
+  __pyx_tuple__29 = PyTuple_Pack(4, __pyx_int_14, __pyx_n_u_Si, __pyx_n_u_silicon, __pyx_float_0_0280855); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(0, 204, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__29);
+  __Pyx_GIVEREF(__pyx_tuple__29);
+
+  /* "rmgpy/molecule/element.py":205
+ * Al = Element(13,  'Al', 'aluminium'     , 0.026981538)
+ * Si = Element(14,  'Si', 'silicon'       , 0.0280855)
+ * P  = Element(15,  'P' , 'phosphorus'    , 0.030973761)             # <<<<<<<<<<<<<<
+ * S  = Element(16,  'S' , 'sulfur'        , 0.032065)
+ * Cl = Element(17,  'Cl', 'chlorine'      , 0.035453)
+ */
+  __pyx_tuple__30 = PyTuple_Pack(4, __pyx_int_15, __pyx_n_u_P, __pyx_n_u_phosphorus, __pyx_float_0_030973761); if (unlikely(!__pyx_tuple__30)) __PYX_ERR(0, 205, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__30);
+  __Pyx_GIVEREF(__pyx_tuple__30);
+
+  /* "rmgpy/molecule/element.py":206
+ * Si = Element(14,  'Si', 'silicon'       , 0.0280855)
+ * P  = Element(15,  'P' , 'phosphorus'    , 0.030973761)
+ * S  = Element(16,  'S' , 'sulfur'        , 0.032065)             # <<<<<<<<<<<<<<
+ * Cl = Element(17,  'Cl', 'chlorine'      , 0.035453)
+ * Ar = Element(18,  'Ar', 'argon'         , 0.039348)
+ */
+  __pyx_tuple__31 = PyTuple_Pack(4, __pyx_int_16, __pyx_n_u_S, __pyx_n_u_sulfur, __pyx_float_0_032065); if (unlikely(!__pyx_tuple__31)) __PYX_ERR(0, 206, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__31);
+  __Pyx_GIVEREF(__pyx_tuple__31);
+
+  /* "rmgpy/molecule/element.py":207
+ * P  = Element(15,  'P' , 'phosphorus'    , 0.030973761)
+ * S  = Element(16,  'S' , 'sulfur'        , 0.032065)
+ * Cl = Element(17,  'Cl', 'chlorine'      , 0.035453)             # <<<<<<<<<<<<<<
+ * Ar = Element(18,  'Ar', 'argon'         , 0.039348)
+ * 
+ */
+  __pyx_tuple__32 = PyTuple_Pack(4, __pyx_int_17, __pyx_n_u_Cl, __pyx_n_u_chlorine, __pyx_float_0_035453); if (unlikely(!__pyx_tuple__32)) __PYX_ERR(0, 207, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__32);
+  __Pyx_GIVEREF(__pyx_tuple__32);
+
+  /* "rmgpy/molecule/element.py":208
+ * S  = Element(16,  'S' , 'sulfur'        , 0.032065)
+ * Cl = Element(17,  'Cl', 'chlorine'      , 0.035453)
+ * Ar = Element(18,  'Ar', 'argon'         , 0.039348)             # <<<<<<<<<<<<<<
+ * 
+ * # Period 4
+ */
+  __pyx_tuple__33 = PyTuple_Pack(4, __pyx_int_18, __pyx_n_u_Ar, __pyx_n_u_argon, __pyx_float_0_039348); if (unlikely(!__pyx_tuple__33)) __PYX_ERR(0, 208, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__33);
+  __Pyx_GIVEREF(__pyx_tuple__33);
+
+  /* "rmgpy/molecule/element.py":211
+ * 
+ * # Period 4
+ * K  = Element(19,  'K' , 'potassium'     , 0.0390983)             # <<<<<<<<<<<<<<
+ * Ca = Element(20,  'Ca', 'calcium'       , 0.040078)
+ * Sc = Element(21,  'Sc', 'scandium'      , 0.044955910)
+ */
+  __pyx_tuple__34 = PyTuple_Pack(4, __pyx_int_19, __pyx_n_u_K, __pyx_n_u_potassium, __pyx_float_0_0390983); if (unlikely(!__pyx_tuple__34)) __PYX_ERR(0, 211, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__34);
+  __Pyx_GIVEREF(__pyx_tuple__34);
+
+  /* "rmgpy/molecule/element.py":212
+ * # Period 4
+ * K  = Element(19,  'K' , 'potassium'     , 0.0390983)
+ * Ca = Element(20,  'Ca', 'calcium'       , 0.040078)             # <<<<<<<<<<<<<<
+ * Sc = Element(21,  'Sc', 'scandium'      , 0.044955910)
+ * Ti = Element(22,  'Ti', 'titanium'      , 0.047867)
+ */
+  __pyx_tuple__35 = PyTuple_Pack(4, __pyx_int_20, __pyx_n_u_Ca, __pyx_n_u_calcium, __pyx_float_0_040078); if (unlikely(!__pyx_tuple__35)) __PYX_ERR(0, 212, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__35);
+  __Pyx_GIVEREF(__pyx_tuple__35);
+
+  /* "rmgpy/molecule/element.py":213
+ * K  = Element(19,  'K' , 'potassium'     , 0.0390983)
+ * Ca = Element(20,  'Ca', 'calcium'       , 0.040078)
+ * Sc = Element(21,  'Sc', 'scandium'      , 0.044955910)             # <<<<<<<<<<<<<<
+ * Ti = Element(22,  'Ti', 'titanium'      , 0.047867)
+ * V  = Element(23,  'V' , 'vanadium'      , 0.0509415)
+ */
+  __pyx_tuple__36 = PyTuple_Pack(4, __pyx_int_21, __pyx_n_u_Sc, __pyx_n_u_scandium, __pyx_float_0_044955910); if (unlikely(!__pyx_tuple__36)) __PYX_ERR(0, 213, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__36);
+  __Pyx_GIVEREF(__pyx_tuple__36);
+
+  /* "rmgpy/molecule/element.py":214
+ * Ca = Element(20,  'Ca', 'calcium'       , 0.040078)
+ * Sc = Element(21,  'Sc', 'scandium'      , 0.044955910)
+ * Ti = Element(22,  'Ti', 'titanium'      , 0.047867)             # <<<<<<<<<<<<<<
+ * V  = Element(23,  'V' , 'vanadium'      , 0.0509415)
+ * Cr = Element(24,  'Cr', 'chromium'      , 0.0519961)
+ */
+  __pyx_tuple__37 = PyTuple_Pack(4, __pyx_int_22, __pyx_n_u_Ti, __pyx_n_u_titanium, __pyx_float_0_047867); if (unlikely(!__pyx_tuple__37)) __PYX_ERR(0, 214, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__37);
+  __Pyx_GIVEREF(__pyx_tuple__37);
+
+  /* "rmgpy/molecule/element.py":215
+ * Sc = Element(21,  'Sc', 'scandium'      , 0.044955910)
+ * Ti = Element(22,  'Ti', 'titanium'      , 0.047867)
+ * V  = Element(23,  'V' , 'vanadium'      , 0.0509415)             # <<<<<<<<<<<<<<
+ * Cr = Element(24,  'Cr', 'chromium'      , 0.0519961)
+ * Mn = Element(25,  'Mn', 'manganese'     , 0.054938049)
+ */
+  __pyx_tuple__38 = PyTuple_Pack(4, __pyx_int_23, __pyx_n_u_V, __pyx_n_u_vanadium, __pyx_float_0_0509415); if (unlikely(!__pyx_tuple__38)) __PYX_ERR(0, 215, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__38);
+  __Pyx_GIVEREF(__pyx_tuple__38);
+
+  /* "rmgpy/molecule/element.py":216
+ * Ti = Element(22,  'Ti', 'titanium'      , 0.047867)
+ * V  = Element(23,  'V' , 'vanadium'      , 0.0509415)
+ * Cr = Element(24,  'Cr', 'chromium'      , 0.0519961)             # <<<<<<<<<<<<<<
+ * Mn = Element(25,  'Mn', 'manganese'     , 0.054938049)
+ * Fe = Element(26,  'Fe', 'iron'          , 0.055845)
+ */
+  __pyx_tuple__39 = PyTuple_Pack(4, __pyx_int_24, __pyx_n_u_Cr, __pyx_n_u_chromium, __pyx_float_0_0519961); if (unlikely(!__pyx_tuple__39)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__39);
+  __Pyx_GIVEREF(__pyx_tuple__39);
+
+  /* "rmgpy/molecule/element.py":217
+ * V  = Element(23,  'V' , 'vanadium'      , 0.0509415)
+ * Cr = Element(24,  'Cr', 'chromium'      , 0.0519961)
+ * Mn = Element(25,  'Mn', 'manganese'     , 0.054938049)             # <<<<<<<<<<<<<<
+ * Fe = Element(26,  'Fe', 'iron'          , 0.055845)
+ * Co = Element(27,  'Co', 'cobalt'        , 0.058933200)
+ */
+  __pyx_tuple__40 = PyTuple_Pack(4, __pyx_int_25, __pyx_n_u_Mn, __pyx_n_u_manganese, __pyx_float_0_054938049); if (unlikely(!__pyx_tuple__40)) __PYX_ERR(0, 217, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__40);
+  __Pyx_GIVEREF(__pyx_tuple__40);
+
+  /* "rmgpy/molecule/element.py":218
+ * Cr = Element(24,  'Cr', 'chromium'      , 0.0519961)
+ * Mn = Element(25,  'Mn', 'manganese'     , 0.054938049)
+ * Fe = Element(26,  'Fe', 'iron'          , 0.055845)             # <<<<<<<<<<<<<<
+ * Co = Element(27,  'Co', 'cobalt'        , 0.058933200)
+ * Ni = Element(28,  'Ni', 'nickel'        , 0.0586934)
+ */
+  __pyx_tuple__41 = PyTuple_Pack(4, __pyx_int_26, __pyx_n_u_Fe, __pyx_n_u_iron, __pyx_float_0_055845); if (unlikely(!__pyx_tuple__41)) __PYX_ERR(0, 218, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__41);
+  __Pyx_GIVEREF(__pyx_tuple__41);
+
+  /* "rmgpy/molecule/element.py":219
+ * Mn = Element(25,  'Mn', 'manganese'     , 0.054938049)
+ * Fe = Element(26,  'Fe', 'iron'          , 0.055845)
+ * Co = Element(27,  'Co', 'cobalt'        , 0.058933200)             # <<<<<<<<<<<<<<
+ * Ni = Element(28,  'Ni', 'nickel'        , 0.0586934)
+ * Cu = Element(29,  'Cu', 'copper'        , 0.063546)
+ */
+  __pyx_tuple__42 = PyTuple_Pack(4, __pyx_int_27, __pyx_n_u_Co, __pyx_n_u_cobalt, __pyx_float_0_058933200); if (unlikely(!__pyx_tuple__42)) __PYX_ERR(0, 219, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__42);
+  __Pyx_GIVEREF(__pyx_tuple__42);
+
+  /* "rmgpy/molecule/element.py":220
+ * Fe = Element(26,  'Fe', 'iron'          , 0.055845)
+ * Co = Element(27,  'Co', 'cobalt'        , 0.058933200)
+ * Ni = Element(28,  'Ni', 'nickel'        , 0.0586934)             # <<<<<<<<<<<<<<
+ * Cu = Element(29,  'Cu', 'copper'        , 0.063546)
+ * Zn = Element(30,  'Zn', 'zinc'          , 0.065409)
+ */
+  __pyx_tuple__43 = PyTuple_Pack(4, __pyx_int_28, __pyx_n_u_Ni, __pyx_n_u_nickel, __pyx_float_0_0586934); if (unlikely(!__pyx_tuple__43)) __PYX_ERR(0, 220, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__43);
+  __Pyx_GIVEREF(__pyx_tuple__43);
+
+  /* "rmgpy/molecule/element.py":221
+ * Co = Element(27,  'Co', 'cobalt'        , 0.058933200)
+ * Ni = Element(28,  'Ni', 'nickel'        , 0.0586934)
+ * Cu = Element(29,  'Cu', 'copper'        , 0.063546)             # <<<<<<<<<<<<<<
+ * Zn = Element(30,  'Zn', 'zinc'          , 0.065409)
+ * Ga = Element(31,  'Ga', 'gallium'       , 0.069723)
+ */
+  __pyx_tuple__44 = PyTuple_Pack(4, __pyx_int_29, __pyx_n_u_Cu, __pyx_n_u_copper, __pyx_float_0_063546); if (unlikely(!__pyx_tuple__44)) __PYX_ERR(0, 221, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__44);
+  __Pyx_GIVEREF(__pyx_tuple__44);
+
+  /* "rmgpy/molecule/element.py":222
+ * Ni = Element(28,  'Ni', 'nickel'        , 0.0586934)
+ * Cu = Element(29,  'Cu', 'copper'        , 0.063546)
+ * Zn = Element(30,  'Zn', 'zinc'          , 0.065409)             # <<<<<<<<<<<<<<
+ * Ga = Element(31,  'Ga', 'gallium'       , 0.069723)
+ * Ge = Element(32,  'Ge', 'germanium'     , 0.07264)
+ */
+  __pyx_tuple__45 = PyTuple_Pack(4, __pyx_int_30, __pyx_n_u_Zn, __pyx_n_u_zinc, __pyx_float_0_065409); if (unlikely(!__pyx_tuple__45)) __PYX_ERR(0, 222, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__45);
+  __Pyx_GIVEREF(__pyx_tuple__45);
+
+  /* "rmgpy/molecule/element.py":223
+ * Cu = Element(29,  'Cu', 'copper'        , 0.063546)
+ * Zn = Element(30,  'Zn', 'zinc'          , 0.065409)
+ * Ga = Element(31,  'Ga', 'gallium'       , 0.069723)             # <<<<<<<<<<<<<<
+ * Ge = Element(32,  'Ge', 'germanium'     , 0.07264)
+ * As = Element(33,  'As', 'arsenic'       , 0.07492160)
+ */
+  __pyx_tuple__46 = PyTuple_Pack(4, __pyx_int_31, __pyx_n_u_Ga, __pyx_n_u_gallium, __pyx_float_0_069723); if (unlikely(!__pyx_tuple__46)) __PYX_ERR(0, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__46);
+  __Pyx_GIVEREF(__pyx_tuple__46);
+
+  /* "rmgpy/molecule/element.py":224
+ * Zn = Element(30,  'Zn', 'zinc'          , 0.065409)
+ * Ga = Element(31,  'Ga', 'gallium'       , 0.069723)
+ * Ge = Element(32,  'Ge', 'germanium'     , 0.07264)             # <<<<<<<<<<<<<<
+ * As = Element(33,  'As', 'arsenic'       , 0.07492160)
+ * Se = Element(34,  'Se', 'selenium'      , 0.07896)
+ */
+  __pyx_tuple__47 = PyTuple_Pack(4, __pyx_int_32, __pyx_n_u_Ge, __pyx_n_u_germanium, __pyx_float_0_07264); if (unlikely(!__pyx_tuple__47)) __PYX_ERR(0, 224, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__47);
+  __Pyx_GIVEREF(__pyx_tuple__47);
+
+  /* "rmgpy/molecule/element.py":225
+ * Ga = Element(31,  'Ga', 'gallium'       , 0.069723)
+ * Ge = Element(32,  'Ge', 'germanium'     , 0.07264)
+ * As = Element(33,  'As', 'arsenic'       , 0.07492160)             # <<<<<<<<<<<<<<
+ * Se = Element(34,  'Se', 'selenium'      , 0.07896)
+ * Br = Element(35,  'Br', 'bromine'       , 0.079904)
+ */
+  __pyx_tuple__48 = PyTuple_Pack(4, __pyx_int_33, __pyx_n_u_As, __pyx_n_u_arsenic, __pyx_float_0_07492160); if (unlikely(!__pyx_tuple__48)) __PYX_ERR(0, 225, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__48);
+  __Pyx_GIVEREF(__pyx_tuple__48);
+
+  /* "rmgpy/molecule/element.py":226
+ * Ge = Element(32,  'Ge', 'germanium'     , 0.07264)
+ * As = Element(33,  'As', 'arsenic'       , 0.07492160)
+ * Se = Element(34,  'Se', 'selenium'      , 0.07896)             # <<<<<<<<<<<<<<
+ * Br = Element(35,  'Br', 'bromine'       , 0.079904)
+ * Kr = Element(36,  'Kr', 'krypton'       , 0.083798)
+ */
+  __pyx_tuple__49 = PyTuple_Pack(4, __pyx_int_34, __pyx_n_u_Se, __pyx_n_u_selenium, __pyx_float_0_07896); if (unlikely(!__pyx_tuple__49)) __PYX_ERR(0, 226, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__49);
+  __Pyx_GIVEREF(__pyx_tuple__49);
+
+  /* "rmgpy/molecule/element.py":227
+ * As = Element(33,  'As', 'arsenic'       , 0.07492160)
+ * Se = Element(34,  'Se', 'selenium'      , 0.07896)
+ * Br = Element(35,  'Br', 'bromine'       , 0.079904)             # <<<<<<<<<<<<<<
+ * Kr = Element(36,  'Kr', 'krypton'       , 0.083798)
+ * 
+ */
+  __pyx_tuple__50 = PyTuple_Pack(4, __pyx_int_35, __pyx_n_u_Br, __pyx_n_u_bromine, __pyx_float_0_079904); if (unlikely(!__pyx_tuple__50)) __PYX_ERR(0, 227, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__50);
+  __Pyx_GIVEREF(__pyx_tuple__50);
+
+  /* "rmgpy/molecule/element.py":228
+ * Se = Element(34,  'Se', 'selenium'      , 0.07896)
+ * Br = Element(35,  'Br', 'bromine'       , 0.079904)
+ * Kr = Element(36,  'Kr', 'krypton'       , 0.083798)             # <<<<<<<<<<<<<<
+ * 
+ * # Period 5
+ */
+  __pyx_tuple__51 = PyTuple_Pack(4, __pyx_int_36, __pyx_n_u_Kr, __pyx_n_u_krypton, __pyx_float_0_083798); if (unlikely(!__pyx_tuple__51)) __PYX_ERR(0, 228, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__51);
+  __Pyx_GIVEREF(__pyx_tuple__51);
+
+  /* "rmgpy/molecule/element.py":231
+ * 
+ * # Period 5
+ * Rb = Element(37,  'Rb', 'rubidium'      , 0.0854678)             # <<<<<<<<<<<<<<
+ * Sr = Element(38,  'Sr', 'strontium'     , 0.08762)
+ * Y  = Element(39,  'Y' , 'yttrium'       , 0.08890585)
+ */
+  __pyx_tuple__52 = PyTuple_Pack(4, __pyx_int_37, __pyx_n_u_Rb, __pyx_n_u_rubidium, __pyx_float_0_0854678); if (unlikely(!__pyx_tuple__52)) __PYX_ERR(0, 231, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__52);
+  __Pyx_GIVEREF(__pyx_tuple__52);
+
+  /* "rmgpy/molecule/element.py":232
+ * # Period 5
+ * Rb = Element(37,  'Rb', 'rubidium'      , 0.0854678)
+ * Sr = Element(38,  'Sr', 'strontium'     , 0.08762)             # <<<<<<<<<<<<<<
+ * Y  = Element(39,  'Y' , 'yttrium'       , 0.08890585)
+ * Zr = Element(40,  'Zr', 'zirconium'     , 0.091224)
+ */
+  __pyx_tuple__53 = PyTuple_Pack(4, __pyx_int_38, __pyx_n_u_Sr, __pyx_n_u_strontium, __pyx_float_0_08762); if (unlikely(!__pyx_tuple__53)) __PYX_ERR(0, 232, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__53);
+  __Pyx_GIVEREF(__pyx_tuple__53);
+
+  /* "rmgpy/molecule/element.py":233
+ * Rb = Element(37,  'Rb', 'rubidium'      , 0.0854678)
+ * Sr = Element(38,  'Sr', 'strontium'     , 0.08762)
+ * Y  = Element(39,  'Y' , 'yttrium'       , 0.08890585)             # <<<<<<<<<<<<<<
+ * Zr = Element(40,  'Zr', 'zirconium'     , 0.091224)
+ * Nb = Element(41,  'Nb', 'niobium'       , 0.09290638)
+ */
+  __pyx_tuple__54 = PyTuple_Pack(4, __pyx_int_39, __pyx_n_u_Y, __pyx_n_u_yttrium, __pyx_float_0_08890585); if (unlikely(!__pyx_tuple__54)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__54);
+  __Pyx_GIVEREF(__pyx_tuple__54);
+
+  /* "rmgpy/molecule/element.py":234
+ * Sr = Element(38,  'Sr', 'strontium'     , 0.08762)
+ * Y  = Element(39,  'Y' , 'yttrium'       , 0.08890585)
+ * Zr = Element(40,  'Zr', 'zirconium'     , 0.091224)             # <<<<<<<<<<<<<<
+ * Nb = Element(41,  'Nb', 'niobium'       , 0.09290638)
+ * Mo = Element(42,  'Mo', 'molybdenum'    , 0.09594)
+ */
+  __pyx_tuple__55 = PyTuple_Pack(4, __pyx_int_40, __pyx_n_u_Zr, __pyx_n_u_zirconium, __pyx_float_0_091224); if (unlikely(!__pyx_tuple__55)) __PYX_ERR(0, 234, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__55);
+  __Pyx_GIVEREF(__pyx_tuple__55);
+
+  /* "rmgpy/molecule/element.py":235
+ * Y  = Element(39,  'Y' , 'yttrium'       , 0.08890585)
+ * Zr = Element(40,  'Zr', 'zirconium'     , 0.091224)
+ * Nb = Element(41,  'Nb', 'niobium'       , 0.09290638)             # <<<<<<<<<<<<<<
+ * Mo = Element(42,  'Mo', 'molybdenum'    , 0.09594)
+ * Tc = Element(43,  'Tc', 'technetium'    , 0.098)
+ */
+  __pyx_tuple__56 = PyTuple_Pack(4, __pyx_int_41, __pyx_n_u_Nb, __pyx_n_u_niobium, __pyx_float_0_09290638); if (unlikely(!__pyx_tuple__56)) __PYX_ERR(0, 235, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__56);
+  __Pyx_GIVEREF(__pyx_tuple__56);
+
+  /* "rmgpy/molecule/element.py":236
+ * Zr = Element(40,  'Zr', 'zirconium'     , 0.091224)
+ * Nb = Element(41,  'Nb', 'niobium'       , 0.09290638)
+ * Mo = Element(42,  'Mo', 'molybdenum'    , 0.09594)             # <<<<<<<<<<<<<<
+ * Tc = Element(43,  'Tc', 'technetium'    , 0.098)
+ * Ru = Element(44,  'Ru', 'ruthenium'     , 0.10107)
+ */
+  __pyx_tuple__57 = PyTuple_Pack(4, __pyx_int_42, __pyx_n_u_Mo, __pyx_n_u_molybdenum, __pyx_float_0_09594); if (unlikely(!__pyx_tuple__57)) __PYX_ERR(0, 236, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__57);
+  __Pyx_GIVEREF(__pyx_tuple__57);
+
+  /* "rmgpy/molecule/element.py":237
+ * Nb = Element(41,  'Nb', 'niobium'       , 0.09290638)
+ * Mo = Element(42,  'Mo', 'molybdenum'    , 0.09594)
+ * Tc = Element(43,  'Tc', 'technetium'    , 0.098)             # <<<<<<<<<<<<<<
+ * Ru = Element(44,  'Ru', 'ruthenium'     , 0.10107)
+ * Rh = Element(45,  'Rh', 'rhodium'       , 0.10290550)
+ */
+  __pyx_tuple__58 = PyTuple_Pack(4, __pyx_int_43, __pyx_n_u_Tc, __pyx_n_u_technetium, __pyx_float_0_098); if (unlikely(!__pyx_tuple__58)) __PYX_ERR(0, 237, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__58);
+  __Pyx_GIVEREF(__pyx_tuple__58);
+
+  /* "rmgpy/molecule/element.py":238
+ * Mo = Element(42,  'Mo', 'molybdenum'    , 0.09594)
+ * Tc = Element(43,  'Tc', 'technetium'    , 0.098)
+ * Ru = Element(44,  'Ru', 'ruthenium'     , 0.10107)             # <<<<<<<<<<<<<<
+ * Rh = Element(45,  'Rh', 'rhodium'       , 0.10290550)
+ * Pd = Element(46,  'Pd', 'palladium'     , 0.10642)
+ */
+  __pyx_tuple__59 = PyTuple_Pack(4, __pyx_int_44, __pyx_n_u_Ru, __pyx_n_u_ruthenium, __pyx_float_0_10107); if (unlikely(!__pyx_tuple__59)) __PYX_ERR(0, 238, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__59);
+  __Pyx_GIVEREF(__pyx_tuple__59);
+
+  /* "rmgpy/molecule/element.py":239
+ * Tc = Element(43,  'Tc', 'technetium'    , 0.098)
+ * Ru = Element(44,  'Ru', 'ruthenium'     , 0.10107)
+ * Rh = Element(45,  'Rh', 'rhodium'       , 0.10290550)             # <<<<<<<<<<<<<<
+ * Pd = Element(46,  'Pd', 'palladium'     , 0.10642)
+ * Ag = Element(47,  'Ag', 'silver'        , 0.1078682)
+ */
+  __pyx_tuple__60 = PyTuple_Pack(4, __pyx_int_45, __pyx_n_u_Rh, __pyx_n_u_rhodium, __pyx_float_0_10290550); if (unlikely(!__pyx_tuple__60)) __PYX_ERR(0, 239, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__60);
+  __Pyx_GIVEREF(__pyx_tuple__60);
+
+  /* "rmgpy/molecule/element.py":240
+ * Ru = Element(44,  'Ru', 'ruthenium'     , 0.10107)
+ * Rh = Element(45,  'Rh', 'rhodium'       , 0.10290550)
+ * Pd = Element(46,  'Pd', 'palladium'     , 0.10642)             # <<<<<<<<<<<<<<
+ * Ag = Element(47,  'Ag', 'silver'        , 0.1078682)
+ * Cd = Element(48,  'Cd', 'cadmium'       , 0.112411)
+ */
+  __pyx_tuple__61 = PyTuple_Pack(4, __pyx_int_46, __pyx_n_u_Pd, __pyx_n_u_palladium, __pyx_float_0_10642); if (unlikely(!__pyx_tuple__61)) __PYX_ERR(0, 240, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__61);
+  __Pyx_GIVEREF(__pyx_tuple__61);
+
+  /* "rmgpy/molecule/element.py":241
+ * Rh = Element(45,  'Rh', 'rhodium'       , 0.10290550)
+ * Pd = Element(46,  'Pd', 'palladium'     , 0.10642)
+ * Ag = Element(47,  'Ag', 'silver'        , 0.1078682)             # <<<<<<<<<<<<<<
+ * Cd = Element(48,  'Cd', 'cadmium'       , 0.112411)
+ * In = Element(49,  'In', 'indium'        , 0.114818)
+ */
+  __pyx_tuple__62 = PyTuple_Pack(4, __pyx_int_47, __pyx_n_u_Ag, __pyx_n_u_silver, __pyx_float_0_1078682); if (unlikely(!__pyx_tuple__62)) __PYX_ERR(0, 241, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__62);
+  __Pyx_GIVEREF(__pyx_tuple__62);
+
+  /* "rmgpy/molecule/element.py":242
+ * Pd = Element(46,  'Pd', 'palladium'     , 0.10642)
+ * Ag = Element(47,  'Ag', 'silver'        , 0.1078682)
+ * Cd = Element(48,  'Cd', 'cadmium'       , 0.112411)             # <<<<<<<<<<<<<<
+ * In = Element(49,  'In', 'indium'        , 0.114818)
+ * Sn = Element(50,  'Sn', 'tin'           , 0.118710)
+ */
+  __pyx_tuple__63 = PyTuple_Pack(4, __pyx_int_48, __pyx_n_u_Cd, __pyx_n_u_cadmium, __pyx_float_0_112411); if (unlikely(!__pyx_tuple__63)) __PYX_ERR(0, 242, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__63);
+  __Pyx_GIVEREF(__pyx_tuple__63);
+
+  /* "rmgpy/molecule/element.py":243
+ * Ag = Element(47,  'Ag', 'silver'        , 0.1078682)
+ * Cd = Element(48,  'Cd', 'cadmium'       , 0.112411)
+ * In = Element(49,  'In', 'indium'        , 0.114818)             # <<<<<<<<<<<<<<
+ * Sn = Element(50,  'Sn', 'tin'           , 0.118710)
+ * Sb = Element(51,  'Sb', 'antimony'      , 0.121760)
+ */
+  __pyx_tuple__64 = PyTuple_Pack(4, __pyx_int_49, __pyx_n_u_In, __pyx_n_u_indium, __pyx_float_0_114818); if (unlikely(!__pyx_tuple__64)) __PYX_ERR(0, 243, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__64);
+  __Pyx_GIVEREF(__pyx_tuple__64);
+
+  /* "rmgpy/molecule/element.py":244
+ * Cd = Element(48,  'Cd', 'cadmium'       , 0.112411)
+ * In = Element(49,  'In', 'indium'        , 0.114818)
+ * Sn = Element(50,  'Sn', 'tin'           , 0.118710)             # <<<<<<<<<<<<<<
+ * Sb = Element(51,  'Sb', 'antimony'      , 0.121760)
+ * Te = Element(52,  'Te', 'tellurium'     , 0.12760)
+ */
+  __pyx_tuple__65 = PyTuple_Pack(4, __pyx_int_50, __pyx_n_u_Sn, __pyx_n_u_tin, __pyx_float_0_118710); if (unlikely(!__pyx_tuple__65)) __PYX_ERR(0, 244, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__65);
+  __Pyx_GIVEREF(__pyx_tuple__65);
+
+  /* "rmgpy/molecule/element.py":245
+ * In = Element(49,  'In', 'indium'        , 0.114818)
+ * Sn = Element(50,  'Sn', 'tin'           , 0.118710)
+ * Sb = Element(51,  'Sb', 'antimony'      , 0.121760)             # <<<<<<<<<<<<<<
+ * Te = Element(52,  'Te', 'tellurium'     , 0.12760)
+ * I  = Element(53,  'I' , 'iodine'        , 0.12690447)
+ */
+  __pyx_tuple__66 = PyTuple_Pack(4, __pyx_int_51, __pyx_n_u_Sb, __pyx_n_u_antimony, __pyx_float_0_121760); if (unlikely(!__pyx_tuple__66)) __PYX_ERR(0, 245, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__66);
+  __Pyx_GIVEREF(__pyx_tuple__66);
+
+  /* "rmgpy/molecule/element.py":246
+ * Sn = Element(50,  'Sn', 'tin'           , 0.118710)
+ * Sb = Element(51,  'Sb', 'antimony'      , 0.121760)
+ * Te = Element(52,  'Te', 'tellurium'     , 0.12760)             # <<<<<<<<<<<<<<
+ * I  = Element(53,  'I' , 'iodine'        , 0.12690447)
+ * Xe = Element(54,  'Xe', 'xenon'         , 0.131293)
+ */
+  __pyx_tuple__67 = PyTuple_Pack(4, __pyx_int_52, __pyx_n_u_Te, __pyx_n_u_tellurium, __pyx_float_0_12760); if (unlikely(!__pyx_tuple__67)) __PYX_ERR(0, 246, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__67);
+  __Pyx_GIVEREF(__pyx_tuple__67);
+
+  /* "rmgpy/molecule/element.py":247
+ * Sb = Element(51,  'Sb', 'antimony'      , 0.121760)
+ * Te = Element(52,  'Te', 'tellurium'     , 0.12760)
+ * I  = Element(53,  'I' , 'iodine'        , 0.12690447)             # <<<<<<<<<<<<<<
+ * Xe = Element(54,  'Xe', 'xenon'         , 0.131293)
+ * 
+ */
+  __pyx_tuple__68 = PyTuple_Pack(4, __pyx_int_53, __pyx_n_u_I, __pyx_n_u_iodine, __pyx_float_0_12690447); if (unlikely(!__pyx_tuple__68)) __PYX_ERR(0, 247, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__68);
+  __Pyx_GIVEREF(__pyx_tuple__68);
+
+  /* "rmgpy/molecule/element.py":248
+ * Te = Element(52,  'Te', 'tellurium'     , 0.12760)
+ * I  = Element(53,  'I' , 'iodine'        , 0.12690447)
+ * Xe = Element(54,  'Xe', 'xenon'         , 0.131293)             # <<<<<<<<<<<<<<
+ * 
+ * # Period 6
+ */
+  __pyx_tuple__69 = PyTuple_Pack(4, __pyx_int_54, __pyx_n_u_Xe, __pyx_n_u_xenon, __pyx_float_0_131293); if (unlikely(!__pyx_tuple__69)) __PYX_ERR(0, 248, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__69);
+  __Pyx_GIVEREF(__pyx_tuple__69);
+
+  /* "rmgpy/molecule/element.py":251
+ * 
+ * # Period 6
+ * Cs = Element(55,  'Cs', 'caesium'       , 0.13290545)             # <<<<<<<<<<<<<<
+ * Ba = Element(56,  'Ba', 'barium'        , 0.137327)
+ * La = Element(57,  'La', 'lanthanum'     , 0.1389055)
+ */
+  __pyx_tuple__70 = PyTuple_Pack(4, __pyx_int_55, __pyx_n_u_Cs, __pyx_n_u_caesium, __pyx_float_0_13290545); if (unlikely(!__pyx_tuple__70)) __PYX_ERR(0, 251, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__70);
+  __Pyx_GIVEREF(__pyx_tuple__70);
+
+  /* "rmgpy/molecule/element.py":252
+ * # Period 6
+ * Cs = Element(55,  'Cs', 'caesium'       , 0.13290545)
+ * Ba = Element(56,  'Ba', 'barium'        , 0.137327)             # <<<<<<<<<<<<<<
+ * La = Element(57,  'La', 'lanthanum'     , 0.1389055)
+ * Ce = Element(58,  'Ce', 'cerium'        , 0.140116)
+ */
+  __pyx_tuple__71 = PyTuple_Pack(4, __pyx_int_56, __pyx_n_u_Ba, __pyx_n_u_barium, __pyx_float_0_137327); if (unlikely(!__pyx_tuple__71)) __PYX_ERR(0, 252, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__71);
+  __Pyx_GIVEREF(__pyx_tuple__71);
+
+  /* "rmgpy/molecule/element.py":253
+ * Cs = Element(55,  'Cs', 'caesium'       , 0.13290545)
+ * Ba = Element(56,  'Ba', 'barium'        , 0.137327)
+ * La = Element(57,  'La', 'lanthanum'     , 0.1389055)             # <<<<<<<<<<<<<<
+ * Ce = Element(58,  'Ce', 'cerium'        , 0.140116)
+ * Pr = Element(59,  'Pr', 'praesodymium'  , 0.14090765)
+ */
+  __pyx_tuple__72 = PyTuple_Pack(4, __pyx_int_57, __pyx_n_u_La, __pyx_n_u_lanthanum, __pyx_float_0_1389055); if (unlikely(!__pyx_tuple__72)) __PYX_ERR(0, 253, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__72);
+  __Pyx_GIVEREF(__pyx_tuple__72);
+
+  /* "rmgpy/molecule/element.py":254
+ * Ba = Element(56,  'Ba', 'barium'        , 0.137327)
+ * La = Element(57,  'La', 'lanthanum'     , 0.1389055)
+ * Ce = Element(58,  'Ce', 'cerium'        , 0.140116)             # <<<<<<<<<<<<<<
+ * Pr = Element(59,  'Pr', 'praesodymium'  , 0.14090765)
+ * Nd = Element(60,  'Nd', 'neodymium'     , 0.14424)
+ */
+  __pyx_tuple__73 = PyTuple_Pack(4, __pyx_int_58, __pyx_n_u_Ce, __pyx_n_u_cerium, __pyx_float_0_140116); if (unlikely(!__pyx_tuple__73)) __PYX_ERR(0, 254, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__73);
+  __Pyx_GIVEREF(__pyx_tuple__73);
+
+  /* "rmgpy/molecule/element.py":255
+ * La = Element(57,  'La', 'lanthanum'     , 0.1389055)
+ * Ce = Element(58,  'Ce', 'cerium'        , 0.140116)
+ * Pr = Element(59,  'Pr', 'praesodymium'  , 0.14090765)             # <<<<<<<<<<<<<<
+ * Nd = Element(60,  'Nd', 'neodymium'     , 0.14424)
+ * Pm = Element(61,  'Pm', 'promethium'    , 0.145)
+ */
+  __pyx_tuple__74 = PyTuple_Pack(4, __pyx_int_59, __pyx_n_u_Pr, __pyx_n_u_praesodymium, __pyx_float_0_14090765); if (unlikely(!__pyx_tuple__74)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__74);
+  __Pyx_GIVEREF(__pyx_tuple__74);
+
+  /* "rmgpy/molecule/element.py":256
+ * Ce = Element(58,  'Ce', 'cerium'        , 0.140116)
+ * Pr = Element(59,  'Pr', 'praesodymium'  , 0.14090765)
+ * Nd = Element(60,  'Nd', 'neodymium'     , 0.14424)             # <<<<<<<<<<<<<<
+ * Pm = Element(61,  'Pm', 'promethium'    , 0.145)
+ * Sm = Element(62,  'Sm', 'samarium'      , 0.15036)
+ */
+  __pyx_tuple__75 = PyTuple_Pack(4, __pyx_int_60, __pyx_n_u_Nd, __pyx_n_u_neodymium, __pyx_float_0_14424); if (unlikely(!__pyx_tuple__75)) __PYX_ERR(0, 256, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__75);
+  __Pyx_GIVEREF(__pyx_tuple__75);
+
+  /* "rmgpy/molecule/element.py":257
+ * Pr = Element(59,  'Pr', 'praesodymium'  , 0.14090765)
+ * Nd = Element(60,  'Nd', 'neodymium'     , 0.14424)
+ * Pm = Element(61,  'Pm', 'promethium'    , 0.145)             # <<<<<<<<<<<<<<
+ * Sm = Element(62,  'Sm', 'samarium'      , 0.15036)
+ * Eu = Element(63,  'Eu', 'europium'      , 0.151964)
+ */
+  __pyx_tuple__76 = PyTuple_Pack(4, __pyx_int_61, __pyx_n_u_Pm, __pyx_n_u_promethium, __pyx_float_0_145); if (unlikely(!__pyx_tuple__76)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__76);
+  __Pyx_GIVEREF(__pyx_tuple__76);
+
+  /* "rmgpy/molecule/element.py":258
+ * Nd = Element(60,  'Nd', 'neodymium'     , 0.14424)
+ * Pm = Element(61,  'Pm', 'promethium'    , 0.145)
+ * Sm = Element(62,  'Sm', 'samarium'      , 0.15036)             # <<<<<<<<<<<<<<
+ * Eu = Element(63,  'Eu', 'europium'      , 0.151964)
+ * Gd = Element(64,  'Gd', 'gadolinium'    , 0.15725)
+ */
+  __pyx_tuple__77 = PyTuple_Pack(4, __pyx_int_62, __pyx_n_u_Sm, __pyx_n_u_samarium, __pyx_float_0_15036); if (unlikely(!__pyx_tuple__77)) __PYX_ERR(0, 258, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__77);
+  __Pyx_GIVEREF(__pyx_tuple__77);
+
+  /* "rmgpy/molecule/element.py":259
+ * Pm = Element(61,  'Pm', 'promethium'    , 0.145)
+ * Sm = Element(62,  'Sm', 'samarium'      , 0.15036)
+ * Eu = Element(63,  'Eu', 'europium'      , 0.151964)             # <<<<<<<<<<<<<<
+ * Gd = Element(64,  'Gd', 'gadolinium'    , 0.15725)
+ * Tb = Element(65,  'Tb', 'terbium'       , 0.15892534)
+ */
+  __pyx_tuple__78 = PyTuple_Pack(4, __pyx_int_63, __pyx_n_u_Eu, __pyx_n_u_europium, __pyx_float_0_151964); if (unlikely(!__pyx_tuple__78)) __PYX_ERR(0, 259, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__78);
+  __Pyx_GIVEREF(__pyx_tuple__78);
+
+  /* "rmgpy/molecule/element.py":260
+ * Sm = Element(62,  'Sm', 'samarium'      , 0.15036)
+ * Eu = Element(63,  'Eu', 'europium'      , 0.151964)
+ * Gd = Element(64,  'Gd', 'gadolinium'    , 0.15725)             # <<<<<<<<<<<<<<
+ * Tb = Element(65,  'Tb', 'terbium'       , 0.15892534)
+ * Dy = Element(66,  'Dy', 'dysprosium'    , 0.162500)
+ */
+  __pyx_tuple__79 = PyTuple_Pack(4, __pyx_int_64, __pyx_n_u_Gd, __pyx_n_u_gadolinium, __pyx_float_0_15725); if (unlikely(!__pyx_tuple__79)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__79);
+  __Pyx_GIVEREF(__pyx_tuple__79);
+
+  /* "rmgpy/molecule/element.py":261
+ * Eu = Element(63,  'Eu', 'europium'      , 0.151964)
+ * Gd = Element(64,  'Gd', 'gadolinium'    , 0.15725)
+ * Tb = Element(65,  'Tb', 'terbium'       , 0.15892534)             # <<<<<<<<<<<<<<
+ * Dy = Element(66,  'Dy', 'dysprosium'    , 0.162500)
+ * Ho = Element(67,  'Ho', 'holmium'       , 0.16493032)
+ */
+  __pyx_tuple__80 = PyTuple_Pack(4, __pyx_int_65, __pyx_n_u_Tb, __pyx_n_u_terbium, __pyx_float_0_15892534); if (unlikely(!__pyx_tuple__80)) __PYX_ERR(0, 261, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__80);
+  __Pyx_GIVEREF(__pyx_tuple__80);
+
+  /* "rmgpy/molecule/element.py":262
+ * Gd = Element(64,  'Gd', 'gadolinium'    , 0.15725)
+ * Tb = Element(65,  'Tb', 'terbium'       , 0.15892534)
+ * Dy = Element(66,  'Dy', 'dysprosium'    , 0.162500)             # <<<<<<<<<<<<<<
+ * Ho = Element(67,  'Ho', 'holmium'       , 0.16493032)
+ * Er = Element(68,  'Er', 'erbium'        , 0.167259)
+ */
+  __pyx_tuple__81 = PyTuple_Pack(4, __pyx_int_66, __pyx_n_u_Dy, __pyx_n_u_dysprosium, __pyx_float_0_162500); if (unlikely(!__pyx_tuple__81)) __PYX_ERR(0, 262, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__81);
+  __Pyx_GIVEREF(__pyx_tuple__81);
+
+  /* "rmgpy/molecule/element.py":263
+ * Tb = Element(65,  'Tb', 'terbium'       , 0.15892534)
+ * Dy = Element(66,  'Dy', 'dysprosium'    , 0.162500)
+ * Ho = Element(67,  'Ho', 'holmium'       , 0.16493032)             # <<<<<<<<<<<<<<
+ * Er = Element(68,  'Er', 'erbium'        , 0.167259)
+ * Tm = Element(69,  'Tm', 'thulium'       , 0.16893421)
+ */
+  __pyx_tuple__82 = PyTuple_Pack(4, __pyx_int_67, __pyx_n_u_Ho, __pyx_n_u_holmium, __pyx_float_0_16493032); if (unlikely(!__pyx_tuple__82)) __PYX_ERR(0, 263, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__82);
+  __Pyx_GIVEREF(__pyx_tuple__82);
+
+  /* "rmgpy/molecule/element.py":264
+ * Dy = Element(66,  'Dy', 'dysprosium'    , 0.162500)
+ * Ho = Element(67,  'Ho', 'holmium'       , 0.16493032)
+ * Er = Element(68,  'Er', 'erbium'        , 0.167259)             # <<<<<<<<<<<<<<
+ * Tm = Element(69,  'Tm', 'thulium'       , 0.16893421)
+ * Yb = Element(70,  'Yb', 'ytterbium'     , 0.17304)
+ */
+  __pyx_tuple__83 = PyTuple_Pack(4, __pyx_int_68, __pyx_n_u_Er, __pyx_n_u_erbium, __pyx_float_0_167259); if (unlikely(!__pyx_tuple__83)) __PYX_ERR(0, 264, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__83);
+  __Pyx_GIVEREF(__pyx_tuple__83);
+
+  /* "rmgpy/molecule/element.py":265
+ * Ho = Element(67,  'Ho', 'holmium'       , 0.16493032)
+ * Er = Element(68,  'Er', 'erbium'        , 0.167259)
+ * Tm = Element(69,  'Tm', 'thulium'       , 0.16893421)             # <<<<<<<<<<<<<<
+ * Yb = Element(70,  'Yb', 'ytterbium'     , 0.17304)
+ * Lu = Element(71,  'Lu', 'lutetium'      , 0.174967)
+ */
+  __pyx_tuple__84 = PyTuple_Pack(4, __pyx_int_69, __pyx_n_u_Tm, __pyx_n_u_thulium, __pyx_float_0_16893421); if (unlikely(!__pyx_tuple__84)) __PYX_ERR(0, 265, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__84);
+  __Pyx_GIVEREF(__pyx_tuple__84);
+
+  /* "rmgpy/molecule/element.py":266
+ * Er = Element(68,  'Er', 'erbium'        , 0.167259)
+ * Tm = Element(69,  'Tm', 'thulium'       , 0.16893421)
+ * Yb = Element(70,  'Yb', 'ytterbium'     , 0.17304)             # <<<<<<<<<<<<<<
+ * Lu = Element(71,  'Lu', 'lutetium'      , 0.174967)
+ * Hf = Element(72,  'Hf', 'hafnium'       , 0.17849)
+ */
+  __pyx_tuple__85 = PyTuple_Pack(4, __pyx_int_70, __pyx_n_u_Yb, __pyx_n_u_ytterbium, __pyx_float_0_17304); if (unlikely(!__pyx_tuple__85)) __PYX_ERR(0, 266, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__85);
+  __Pyx_GIVEREF(__pyx_tuple__85);
+
+  /* "rmgpy/molecule/element.py":267
+ * Tm = Element(69,  'Tm', 'thulium'       , 0.16893421)
+ * Yb = Element(70,  'Yb', 'ytterbium'     , 0.17304)
+ * Lu = Element(71,  'Lu', 'lutetium'      , 0.174967)             # <<<<<<<<<<<<<<
+ * Hf = Element(72,  'Hf', 'hafnium'       , 0.17849)
+ * Ta = Element(73,  'Ta', 'tantalum'      , 0.1809479)
+ */
+  __pyx_tuple__86 = PyTuple_Pack(4, __pyx_int_71, __pyx_n_u_Lu, __pyx_n_u_lutetium, __pyx_float_0_174967); if (unlikely(!__pyx_tuple__86)) __PYX_ERR(0, 267, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__86);
+  __Pyx_GIVEREF(__pyx_tuple__86);
+
+  /* "rmgpy/molecule/element.py":268
+ * Yb = Element(70,  'Yb', 'ytterbium'     , 0.17304)
+ * Lu = Element(71,  'Lu', 'lutetium'      , 0.174967)
+ * Hf = Element(72,  'Hf', 'hafnium'       , 0.17849)             # <<<<<<<<<<<<<<
+ * Ta = Element(73,  'Ta', 'tantalum'      , 0.1809479)
+ * W  = Element(74,  'W' , 'tungsten'      , 0.18384)
+ */
+  __pyx_tuple__87 = PyTuple_Pack(4, __pyx_int_72, __pyx_n_u_Hf, __pyx_n_u_hafnium, __pyx_float_0_17849); if (unlikely(!__pyx_tuple__87)) __PYX_ERR(0, 268, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__87);
+  __Pyx_GIVEREF(__pyx_tuple__87);
+
+  /* "rmgpy/molecule/element.py":269
+ * Lu = Element(71,  'Lu', 'lutetium'      , 0.174967)
+ * Hf = Element(72,  'Hf', 'hafnium'       , 0.17849)
+ * Ta = Element(73,  'Ta', 'tantalum'      , 0.1809479)             # <<<<<<<<<<<<<<
+ * W  = Element(74,  'W' , 'tungsten'      , 0.18384)
+ * Re = Element(75,  'Re', 'rhenium'       , 0.186207)
+ */
+  __pyx_tuple__88 = PyTuple_Pack(4, __pyx_int_73, __pyx_n_u_Ta, __pyx_n_u_tantalum, __pyx_float_0_1809479); if (unlikely(!__pyx_tuple__88)) __PYX_ERR(0, 269, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__88);
+  __Pyx_GIVEREF(__pyx_tuple__88);
+
+  /* "rmgpy/molecule/element.py":270
+ * Hf = Element(72,  'Hf', 'hafnium'       , 0.17849)
+ * Ta = Element(73,  'Ta', 'tantalum'      , 0.1809479)
+ * W  = Element(74,  'W' , 'tungsten'      , 0.18384)             # <<<<<<<<<<<<<<
+ * Re = Element(75,  'Re', 'rhenium'       , 0.186207)
+ * Os = Element(76,  'Os', 'osmium'        , 0.19023)
+ */
+  __pyx_tuple__89 = PyTuple_Pack(4, __pyx_int_74, __pyx_n_u_W, __pyx_n_u_tungsten, __pyx_float_0_18384); if (unlikely(!__pyx_tuple__89)) __PYX_ERR(0, 270, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__89);
+  __Pyx_GIVEREF(__pyx_tuple__89);
+
+  /* "rmgpy/molecule/element.py":271
+ * Ta = Element(73,  'Ta', 'tantalum'      , 0.1809479)
+ * W  = Element(74,  'W' , 'tungsten'      , 0.18384)
+ * Re = Element(75,  'Re', 'rhenium'       , 0.186207)             # <<<<<<<<<<<<<<
+ * Os = Element(76,  'Os', 'osmium'        , 0.19023)
+ * Ir = Element(77,  'Ir', 'iridium'       , 0.192217)
+ */
+  __pyx_tuple__90 = PyTuple_Pack(4, __pyx_int_75, __pyx_n_u_Re, __pyx_n_u_rhenium, __pyx_float_0_186207); if (unlikely(!__pyx_tuple__90)) __PYX_ERR(0, 271, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__90);
+  __Pyx_GIVEREF(__pyx_tuple__90);
+
+  /* "rmgpy/molecule/element.py":272
+ * W  = Element(74,  'W' , 'tungsten'      , 0.18384)
+ * Re = Element(75,  'Re', 'rhenium'       , 0.186207)
+ * Os = Element(76,  'Os', 'osmium'        , 0.19023)             # <<<<<<<<<<<<<<
+ * Ir = Element(77,  'Ir', 'iridium'       , 0.192217)
+ * Pt = Element(78,  'Pt', 'platinum'      , 0.195078)
+ */
+  __pyx_tuple__91 = PyTuple_Pack(4, __pyx_int_76, __pyx_n_u_Os, __pyx_n_u_osmium, __pyx_float_0_19023); if (unlikely(!__pyx_tuple__91)) __PYX_ERR(0, 272, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__91);
+  __Pyx_GIVEREF(__pyx_tuple__91);
+
+  /* "rmgpy/molecule/element.py":273
+ * Re = Element(75,  'Re', 'rhenium'       , 0.186207)
+ * Os = Element(76,  'Os', 'osmium'        , 0.19023)
+ * Ir = Element(77,  'Ir', 'iridium'       , 0.192217)             # <<<<<<<<<<<<<<
+ * Pt = Element(78,  'Pt', 'platinum'      , 0.195078)
+ * Au = Element(79,  'Au', 'gold'          , 0.19696655)
+ */
+  __pyx_tuple__92 = PyTuple_Pack(4, __pyx_int_77, __pyx_n_u_Ir, __pyx_n_u_iridium, __pyx_float_0_192217); if (unlikely(!__pyx_tuple__92)) __PYX_ERR(0, 273, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__92);
+  __Pyx_GIVEREF(__pyx_tuple__92);
+
+  /* "rmgpy/molecule/element.py":274
+ * Os = Element(76,  'Os', 'osmium'        , 0.19023)
+ * Ir = Element(77,  'Ir', 'iridium'       , 0.192217)
+ * Pt = Element(78,  'Pt', 'platinum'      , 0.195078)             # <<<<<<<<<<<<<<
+ * Au = Element(79,  'Au', 'gold'          , 0.19696655)
+ * Hg = Element(80,  'Hg', 'mercury'       , 0.20059)
+ */
+  __pyx_tuple__93 = PyTuple_Pack(4, __pyx_int_78, __pyx_n_u_Pt, __pyx_n_u_platinum, __pyx_float_0_195078); if (unlikely(!__pyx_tuple__93)) __PYX_ERR(0, 274, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__93);
+  __Pyx_GIVEREF(__pyx_tuple__93);
+
+  /* "rmgpy/molecule/element.py":275
+ * Ir = Element(77,  'Ir', 'iridium'       , 0.192217)
+ * Pt = Element(78,  'Pt', 'platinum'      , 0.195078)
+ * Au = Element(79,  'Au', 'gold'          , 0.19696655)             # <<<<<<<<<<<<<<
+ * Hg = Element(80,  'Hg', 'mercury'       , 0.20059)
+ * Tl = Element(81,  'Tl', 'thallium'      , 0.2043833)
+ */
+  __pyx_tuple__94 = PyTuple_Pack(4, __pyx_int_79, __pyx_n_u_Au, __pyx_n_u_gold, __pyx_float_0_19696655); if (unlikely(!__pyx_tuple__94)) __PYX_ERR(0, 275, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__94);
+  __Pyx_GIVEREF(__pyx_tuple__94);
+
+  /* "rmgpy/molecule/element.py":276
+ * Pt = Element(78,  'Pt', 'platinum'      , 0.195078)
+ * Au = Element(79,  'Au', 'gold'          , 0.19696655)
+ * Hg = Element(80,  'Hg', 'mercury'       , 0.20059)             # <<<<<<<<<<<<<<
+ * Tl = Element(81,  'Tl', 'thallium'      , 0.2043833)
+ * Pb = Element(82,  'Pb', 'lead'          , 0.2072)
+ */
+  __pyx_tuple__95 = PyTuple_Pack(4, __pyx_int_80, __pyx_n_u_Hg, __pyx_n_u_mercury, __pyx_float_0_20059); if (unlikely(!__pyx_tuple__95)) __PYX_ERR(0, 276, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__95);
+  __Pyx_GIVEREF(__pyx_tuple__95);
+
+  /* "rmgpy/molecule/element.py":277
+ * Au = Element(79,  'Au', 'gold'          , 0.19696655)
+ * Hg = Element(80,  'Hg', 'mercury'       , 0.20059)
+ * Tl = Element(81,  'Tl', 'thallium'      , 0.2043833)             # <<<<<<<<<<<<<<
+ * Pb = Element(82,  'Pb', 'lead'          , 0.2072)
+ * Bi = Element(83,  'Bi', 'bismuth'       , 0.20898038)
+ */
+  __pyx_tuple__96 = PyTuple_Pack(4, __pyx_int_81, __pyx_n_u_Tl, __pyx_n_u_thallium, __pyx_float_0_2043833); if (unlikely(!__pyx_tuple__96)) __PYX_ERR(0, 277, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__96);
+  __Pyx_GIVEREF(__pyx_tuple__96);
+
+  /* "rmgpy/molecule/element.py":278
+ * Hg = Element(80,  'Hg', 'mercury'       , 0.20059)
+ * Tl = Element(81,  'Tl', 'thallium'      , 0.2043833)
+ * Pb = Element(82,  'Pb', 'lead'          , 0.2072)             # <<<<<<<<<<<<<<
+ * Bi = Element(83,  'Bi', 'bismuth'       , 0.20898038)
+ * Po = Element(84,  'Po', 'polonium'      , 0.209)
+ */
+  __pyx_tuple__97 = PyTuple_Pack(4, __pyx_int_82, __pyx_n_u_Pb, __pyx_n_u_lead, __pyx_float_0_2072); if (unlikely(!__pyx_tuple__97)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__97);
+  __Pyx_GIVEREF(__pyx_tuple__97);
+
+  /* "rmgpy/molecule/element.py":279
+ * Tl = Element(81,  'Tl', 'thallium'      , 0.2043833)
+ * Pb = Element(82,  'Pb', 'lead'          , 0.2072)
+ * Bi = Element(83,  'Bi', 'bismuth'       , 0.20898038)             # <<<<<<<<<<<<<<
+ * Po = Element(84,  'Po', 'polonium'      , 0.209)
+ * At = Element(85,  'At', 'astatine'      , 0.210)
+ */
+  __pyx_tuple__98 = PyTuple_Pack(4, __pyx_int_83, __pyx_n_u_Bi, __pyx_n_u_bismuth, __pyx_float_0_20898038); if (unlikely(!__pyx_tuple__98)) __PYX_ERR(0, 279, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__98);
+  __Pyx_GIVEREF(__pyx_tuple__98);
+
+  /* "rmgpy/molecule/element.py":280
+ * Pb = Element(82,  'Pb', 'lead'          , 0.2072)
+ * Bi = Element(83,  'Bi', 'bismuth'       , 0.20898038)
+ * Po = Element(84,  'Po', 'polonium'      , 0.209)             # <<<<<<<<<<<<<<
+ * At = Element(85,  'At', 'astatine'      , 0.210)
+ * Rn = Element(86,  'Rn', 'radon'         , 0.222)
+ */
+  __pyx_tuple__99 = PyTuple_Pack(4, __pyx_int_84, __pyx_n_u_Po, __pyx_n_u_polonium, __pyx_float_0_209); if (unlikely(!__pyx_tuple__99)) __PYX_ERR(0, 280, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__99);
+  __Pyx_GIVEREF(__pyx_tuple__99);
+
+  /* "rmgpy/molecule/element.py":281
+ * Bi = Element(83,  'Bi', 'bismuth'       , 0.20898038)
+ * Po = Element(84,  'Po', 'polonium'      , 0.209)
+ * At = Element(85,  'At', 'astatine'      , 0.210)             # <<<<<<<<<<<<<<
+ * Rn = Element(86,  'Rn', 'radon'         , 0.222)
+ * 
+ */
+  __pyx_tuple__100 = PyTuple_Pack(4, __pyx_int_85, __pyx_n_u_At, __pyx_n_u_astatine, __pyx_float_0_210); if (unlikely(!__pyx_tuple__100)) __PYX_ERR(0, 281, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__100);
+  __Pyx_GIVEREF(__pyx_tuple__100);
+
+  /* "rmgpy/molecule/element.py":282
+ * Po = Element(84,  'Po', 'polonium'      , 0.209)
+ * At = Element(85,  'At', 'astatine'      , 0.210)
+ * Rn = Element(86,  'Rn', 'radon'         , 0.222)             # <<<<<<<<<<<<<<
+ * 
+ * # Period 7
+ */
+  __pyx_tuple__101 = PyTuple_Pack(4, __pyx_int_86, __pyx_n_u_Rn, __pyx_n_u_radon, __pyx_float_0_222); if (unlikely(!__pyx_tuple__101)) __PYX_ERR(0, 282, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__101);
+  __Pyx_GIVEREF(__pyx_tuple__101);
+
+  /* "rmgpy/molecule/element.py":285
+ * 
+ * # Period 7
+ * Fr = Element(87,  'Fr', 'francium'      , 0.223)             # <<<<<<<<<<<<<<
+ * Ra = Element(88,  'Ra', 'radium'        , 0.226)
+ * Ac = Element(89,  'Ac', 'actinum'       , 0.227)
+ */
+  __pyx_tuple__102 = PyTuple_Pack(4, __pyx_int_87, __pyx_n_u_Fr, __pyx_n_u_francium, __pyx_float_0_223); if (unlikely(!__pyx_tuple__102)) __PYX_ERR(0, 285, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__102);
+  __Pyx_GIVEREF(__pyx_tuple__102);
+
+  /* "rmgpy/molecule/element.py":286
+ * # Period 7
+ * Fr = Element(87,  'Fr', 'francium'      , 0.223)
+ * Ra = Element(88,  'Ra', 'radium'        , 0.226)             # <<<<<<<<<<<<<<
+ * Ac = Element(89,  'Ac', 'actinum'       , 0.227)
+ * Th = Element(90,  'Th', 'thorium'       , 0.2320381)
+ */
+  __pyx_tuple__103 = PyTuple_Pack(4, __pyx_int_88, __pyx_n_u_Ra, __pyx_n_u_radium, __pyx_float_0_226); if (unlikely(!__pyx_tuple__103)) __PYX_ERR(0, 286, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__103);
+  __Pyx_GIVEREF(__pyx_tuple__103);
+
+  /* "rmgpy/molecule/element.py":287
+ * Fr = Element(87,  'Fr', 'francium'      , 0.223)
+ * Ra = Element(88,  'Ra', 'radium'        , 0.226)
+ * Ac = Element(89,  'Ac', 'actinum'       , 0.227)             # <<<<<<<<<<<<<<
+ * Th = Element(90,  'Th', 'thorium'       , 0.2320381)
+ * Pa = Element(91,  'Pa', 'protactinum'   , 0.23103588)
+ */
+  __pyx_tuple__104 = PyTuple_Pack(4, __pyx_int_89, __pyx_n_u_Ac, __pyx_n_u_actinum, __pyx_float_0_227); if (unlikely(!__pyx_tuple__104)) __PYX_ERR(0, 287, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__104);
+  __Pyx_GIVEREF(__pyx_tuple__104);
+
+  /* "rmgpy/molecule/element.py":288
+ * Ra = Element(88,  'Ra', 'radium'        , 0.226)
+ * Ac = Element(89,  'Ac', 'actinum'       , 0.227)
+ * Th = Element(90,  'Th', 'thorium'       , 0.2320381)             # <<<<<<<<<<<<<<
+ * Pa = Element(91,  'Pa', 'protactinum'   , 0.23103588)
+ * U  = Element(92,  'U' , 'uranium'       , 0.23802891)
+ */
+  __pyx_tuple__105 = PyTuple_Pack(4, __pyx_int_90, __pyx_n_u_Th, __pyx_n_u_thorium, __pyx_float_0_2320381); if (unlikely(!__pyx_tuple__105)) __PYX_ERR(0, 288, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__105);
+  __Pyx_GIVEREF(__pyx_tuple__105);
+
+  /* "rmgpy/molecule/element.py":289
+ * Ac = Element(89,  'Ac', 'actinum'       , 0.227)
+ * Th = Element(90,  'Th', 'thorium'       , 0.2320381)
+ * Pa = Element(91,  'Pa', 'protactinum'   , 0.23103588)             # <<<<<<<<<<<<<<
+ * U  = Element(92,  'U' , 'uranium'       , 0.23802891)
+ * Np = Element(93,  'Np', 'neptunium'     , 0.237)
+ */
+  __pyx_tuple__106 = PyTuple_Pack(4, __pyx_int_91, __pyx_n_u_Pa, __pyx_n_u_protactinum, __pyx_float_0_23103588); if (unlikely(!__pyx_tuple__106)) __PYX_ERR(0, 289, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__106);
+  __Pyx_GIVEREF(__pyx_tuple__106);
+
+  /* "rmgpy/molecule/element.py":290
+ * Th = Element(90,  'Th', 'thorium'       , 0.2320381)
+ * Pa = Element(91,  'Pa', 'protactinum'   , 0.23103588)
+ * U  = Element(92,  'U' , 'uranium'       , 0.23802891)             # <<<<<<<<<<<<<<
+ * Np = Element(93,  'Np', 'neptunium'     , 0.237)
+ * Pu = Element(94,  'Pu', 'plutonium'     , 0.244)
+ */
+  __pyx_tuple__107 = PyTuple_Pack(4, __pyx_int_92, __pyx_n_u_U, __pyx_n_u_uranium, __pyx_float_0_23802891); if (unlikely(!__pyx_tuple__107)) __PYX_ERR(0, 290, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__107);
+  __Pyx_GIVEREF(__pyx_tuple__107);
+
+  /* "rmgpy/molecule/element.py":291
+ * Pa = Element(91,  'Pa', 'protactinum'   , 0.23103588)
+ * U  = Element(92,  'U' , 'uranium'       , 0.23802891)
+ * Np = Element(93,  'Np', 'neptunium'     , 0.237)             # <<<<<<<<<<<<<<
+ * Pu = Element(94,  'Pu', 'plutonium'     , 0.244)
+ * Am = Element(95,  'Am', 'americium'     , 0.243)
+ */
+  __pyx_tuple__108 = PyTuple_Pack(4, __pyx_int_93, __pyx_n_u_Np, __pyx_n_u_neptunium, __pyx_float_0_237); if (unlikely(!__pyx_tuple__108)) __PYX_ERR(0, 291, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__108);
+  __Pyx_GIVEREF(__pyx_tuple__108);
+
+  /* "rmgpy/molecule/element.py":292
+ * U  = Element(92,  'U' , 'uranium'       , 0.23802891)
+ * Np = Element(93,  'Np', 'neptunium'     , 0.237)
+ * Pu = Element(94,  'Pu', 'plutonium'     , 0.244)             # <<<<<<<<<<<<<<
+ * Am = Element(95,  'Am', 'americium'     , 0.243)
+ * Cm = Element(96,  'Cm', 'curium'        , 0.247)
+ */
+  __pyx_tuple__109 = PyTuple_Pack(4, __pyx_int_94, __pyx_n_u_Pu, __pyx_n_u_plutonium, __pyx_float_0_244); if (unlikely(!__pyx_tuple__109)) __PYX_ERR(0, 292, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__109);
+  __Pyx_GIVEREF(__pyx_tuple__109);
+
+  /* "rmgpy/molecule/element.py":293
+ * Np = Element(93,  'Np', 'neptunium'     , 0.237)
+ * Pu = Element(94,  'Pu', 'plutonium'     , 0.244)
+ * Am = Element(95,  'Am', 'americium'     , 0.243)             # <<<<<<<<<<<<<<
+ * Cm = Element(96,  'Cm', 'curium'        , 0.247)
+ * Bk = Element(97,  'Bk', 'berkelium'     , 0.247)
+ */
+  __pyx_tuple__110 = PyTuple_Pack(4, __pyx_int_95, __pyx_n_u_Am, __pyx_n_u_americium, __pyx_float_0_243); if (unlikely(!__pyx_tuple__110)) __PYX_ERR(0, 293, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__110);
+  __Pyx_GIVEREF(__pyx_tuple__110);
+
+  /* "rmgpy/molecule/element.py":294
+ * Pu = Element(94,  'Pu', 'plutonium'     , 0.244)
+ * Am = Element(95,  'Am', 'americium'     , 0.243)
+ * Cm = Element(96,  'Cm', 'curium'        , 0.247)             # <<<<<<<<<<<<<<
+ * Bk = Element(97,  'Bk', 'berkelium'     , 0.247)
+ * Cf = Element(98,  'Cf', 'californium'   , 0.251)
+ */
+  __pyx_tuple__111 = PyTuple_Pack(4, __pyx_int_96, __pyx_n_u_Cm, __pyx_n_u_curium, __pyx_float_0_247); if (unlikely(!__pyx_tuple__111)) __PYX_ERR(0, 294, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__111);
+  __Pyx_GIVEREF(__pyx_tuple__111);
+
+  /* "rmgpy/molecule/element.py":295
+ * Am = Element(95,  'Am', 'americium'     , 0.243)
+ * Cm = Element(96,  'Cm', 'curium'        , 0.247)
+ * Bk = Element(97,  'Bk', 'berkelium'     , 0.247)             # <<<<<<<<<<<<<<
+ * Cf = Element(98,  'Cf', 'californium'   , 0.251)
+ * Es = Element(99,  'Es', 'einsteinium'   , 0.252)
+ */
+  __pyx_tuple__112 = PyTuple_Pack(4, __pyx_int_97, __pyx_n_u_Bk, __pyx_n_u_berkelium, __pyx_float_0_247); if (unlikely(!__pyx_tuple__112)) __PYX_ERR(0, 295, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__112);
+  __Pyx_GIVEREF(__pyx_tuple__112);
+
+  /* "rmgpy/molecule/element.py":296
+ * Cm = Element(96,  'Cm', 'curium'        , 0.247)
+ * Bk = Element(97,  'Bk', 'berkelium'     , 0.247)
+ * Cf = Element(98,  'Cf', 'californium'   , 0.251)             # <<<<<<<<<<<<<<
+ * Es = Element(99,  'Es', 'einsteinium'   , 0.252)
+ * Fm = Element(100, 'Fm', 'fermium'       , 0.257)
+ */
+  __pyx_tuple__113 = PyTuple_Pack(4, __pyx_int_98, __pyx_n_u_Cf, __pyx_n_u_californium, __pyx_float_0_251); if (unlikely(!__pyx_tuple__113)) __PYX_ERR(0, 296, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__113);
+  __Pyx_GIVEREF(__pyx_tuple__113);
+
+  /* "rmgpy/molecule/element.py":297
+ * Bk = Element(97,  'Bk', 'berkelium'     , 0.247)
+ * Cf = Element(98,  'Cf', 'californium'   , 0.251)
+ * Es = Element(99,  'Es', 'einsteinium'   , 0.252)             # <<<<<<<<<<<<<<
+ * Fm = Element(100, 'Fm', 'fermium'       , 0.257)
+ * Md = Element(101, 'Md', 'mendelevium'   , 0.258)
+ */
+  __pyx_tuple__114 = PyTuple_Pack(4, __pyx_int_99, __pyx_n_u_Es, __pyx_n_u_einsteinium, __pyx_float_0_252); if (unlikely(!__pyx_tuple__114)) __PYX_ERR(0, 297, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__114);
+  __Pyx_GIVEREF(__pyx_tuple__114);
+
+  /* "rmgpy/molecule/element.py":298
+ * Cf = Element(98,  'Cf', 'californium'   , 0.251)
+ * Es = Element(99,  'Es', 'einsteinium'   , 0.252)
+ * Fm = Element(100, 'Fm', 'fermium'       , 0.257)             # <<<<<<<<<<<<<<
+ * Md = Element(101, 'Md', 'mendelevium'   , 0.258)
+ * No = Element(102, 'No', 'nobelium'      , 0.259)
+ */
+  __pyx_tuple__115 = PyTuple_Pack(4, __pyx_int_100, __pyx_n_u_Fm, __pyx_n_u_fermium, __pyx_float_0_257); if (unlikely(!__pyx_tuple__115)) __PYX_ERR(0, 298, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__115);
+  __Pyx_GIVEREF(__pyx_tuple__115);
+
+  /* "rmgpy/molecule/element.py":299
+ * Es = Element(99,  'Es', 'einsteinium'   , 0.252)
+ * Fm = Element(100, 'Fm', 'fermium'       , 0.257)
+ * Md = Element(101, 'Md', 'mendelevium'   , 0.258)             # <<<<<<<<<<<<<<
+ * No = Element(102, 'No', 'nobelium'      , 0.259)
+ * Lr = Element(103, 'Lr', 'lawrencium'    , 0.262)
+ */
+  __pyx_tuple__116 = PyTuple_Pack(4, __pyx_int_101, __pyx_n_u_Md, __pyx_n_u_mendelevium, __pyx_float_0_258); if (unlikely(!__pyx_tuple__116)) __PYX_ERR(0, 299, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__116);
+  __Pyx_GIVEREF(__pyx_tuple__116);
+
+  /* "rmgpy/molecule/element.py":300
+ * Fm = Element(100, 'Fm', 'fermium'       , 0.257)
+ * Md = Element(101, 'Md', 'mendelevium'   , 0.258)
+ * No = Element(102, 'No', 'nobelium'      , 0.259)             # <<<<<<<<<<<<<<
+ * Lr = Element(103, 'Lr', 'lawrencium'    , 0.262)
+ * Rf = Element(104, 'Rf', 'rutherfordium' , 0.261)
+ */
+  __pyx_tuple__117 = PyTuple_Pack(4, __pyx_int_102, __pyx_n_u_No, __pyx_n_u_nobelium, __pyx_float_0_259); if (unlikely(!__pyx_tuple__117)) __PYX_ERR(0, 300, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__117);
+  __Pyx_GIVEREF(__pyx_tuple__117);
+
+  /* "rmgpy/molecule/element.py":301
+ * Md = Element(101, 'Md', 'mendelevium'   , 0.258)
+ * No = Element(102, 'No', 'nobelium'      , 0.259)
+ * Lr = Element(103, 'Lr', 'lawrencium'    , 0.262)             # <<<<<<<<<<<<<<
+ * Rf = Element(104, 'Rf', 'rutherfordium' , 0.261)
+ * Db = Element(105, 'Db', 'dubnium'       , 0.262)
+ */
+  __pyx_tuple__118 = PyTuple_Pack(4, __pyx_int_103, __pyx_n_u_Lr, __pyx_n_u_lawrencium, __pyx_float_0_262); if (unlikely(!__pyx_tuple__118)) __PYX_ERR(0, 301, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__118);
+  __Pyx_GIVEREF(__pyx_tuple__118);
+
+  /* "rmgpy/molecule/element.py":302
+ * No = Element(102, 'No', 'nobelium'      , 0.259)
+ * Lr = Element(103, 'Lr', 'lawrencium'    , 0.262)
+ * Rf = Element(104, 'Rf', 'rutherfordium' , 0.261)             # <<<<<<<<<<<<<<
+ * Db = Element(105, 'Db', 'dubnium'       , 0.262)
+ * Sg = Element(106, 'Sg', 'seaborgium'    , 0.266)
+ */
+  __pyx_tuple__119 = PyTuple_Pack(4, __pyx_int_104, __pyx_n_u_Rf, __pyx_n_u_rutherfordium, __pyx_float_0_261); if (unlikely(!__pyx_tuple__119)) __PYX_ERR(0, 302, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__119);
+  __Pyx_GIVEREF(__pyx_tuple__119);
+
+  /* "rmgpy/molecule/element.py":303
+ * Lr = Element(103, 'Lr', 'lawrencium'    , 0.262)
+ * Rf = Element(104, 'Rf', 'rutherfordium' , 0.261)
+ * Db = Element(105, 'Db', 'dubnium'       , 0.262)             # <<<<<<<<<<<<<<
+ * Sg = Element(106, 'Sg', 'seaborgium'    , 0.266)
+ * Bh = Element(107, 'Bh', 'bohrium'       , 0.264)
+ */
+  __pyx_tuple__120 = PyTuple_Pack(4, __pyx_int_105, __pyx_n_u_Db, __pyx_n_u_dubnium, __pyx_float_0_262); if (unlikely(!__pyx_tuple__120)) __PYX_ERR(0, 303, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__120);
+  __Pyx_GIVEREF(__pyx_tuple__120);
+
+  /* "rmgpy/molecule/element.py":304
+ * Rf = Element(104, 'Rf', 'rutherfordium' , 0.261)
+ * Db = Element(105, 'Db', 'dubnium'       , 0.262)
+ * Sg = Element(106, 'Sg', 'seaborgium'    , 0.266)             # <<<<<<<<<<<<<<
+ * Bh = Element(107, 'Bh', 'bohrium'       , 0.264)
+ * Hs = Element(108, 'Hs', 'hassium'       , 0.277)
+ */
+  __pyx_tuple__121 = PyTuple_Pack(4, __pyx_int_106, __pyx_n_u_Sg, __pyx_n_u_seaborgium, __pyx_float_0_266); if (unlikely(!__pyx_tuple__121)) __PYX_ERR(0, 304, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__121);
+  __Pyx_GIVEREF(__pyx_tuple__121);
+
+  /* "rmgpy/molecule/element.py":305
+ * Db = Element(105, 'Db', 'dubnium'       , 0.262)
+ * Sg = Element(106, 'Sg', 'seaborgium'    , 0.266)
+ * Bh = Element(107, 'Bh', 'bohrium'       , 0.264)             # <<<<<<<<<<<<<<
+ * Hs = Element(108, 'Hs', 'hassium'       , 0.277)
+ * Mt = Element(109, 'Mt', 'meitnerium'    , 0.268)
+ */
+  __pyx_tuple__122 = PyTuple_Pack(4, __pyx_int_107, __pyx_n_u_Bh, __pyx_n_u_bohrium, __pyx_float_0_264); if (unlikely(!__pyx_tuple__122)) __PYX_ERR(0, 305, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__122);
+  __Pyx_GIVEREF(__pyx_tuple__122);
+
+  /* "rmgpy/molecule/element.py":306
+ * Sg = Element(106, 'Sg', 'seaborgium'    , 0.266)
+ * Bh = Element(107, 'Bh', 'bohrium'       , 0.264)
+ * Hs = Element(108, 'Hs', 'hassium'       , 0.277)             # <<<<<<<<<<<<<<
+ * Mt = Element(109, 'Mt', 'meitnerium'    , 0.268)
+ * Ds = Element(110, 'Ds', 'darmstadtium'  , 0.281)
+ */
+  __pyx_tuple__123 = PyTuple_Pack(4, __pyx_int_108, __pyx_n_u_Hs, __pyx_n_u_hassium, __pyx_float_0_277); if (unlikely(!__pyx_tuple__123)) __PYX_ERR(0, 306, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__123);
+  __Pyx_GIVEREF(__pyx_tuple__123);
+
+  /* "rmgpy/molecule/element.py":307
+ * Bh = Element(107, 'Bh', 'bohrium'       , 0.264)
+ * Hs = Element(108, 'Hs', 'hassium'       , 0.277)
+ * Mt = Element(109, 'Mt', 'meitnerium'    , 0.268)             # <<<<<<<<<<<<<<
+ * Ds = Element(110, 'Ds', 'darmstadtium'  , 0.281)
+ * Rg = Element(111, 'Rg', 'roentgenium'   , 0.272)
+ */
+  __pyx_tuple__124 = PyTuple_Pack(4, __pyx_int_109, __pyx_n_u_Mt, __pyx_n_u_meitnerium, __pyx_float_0_268); if (unlikely(!__pyx_tuple__124)) __PYX_ERR(0, 307, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__124);
+  __Pyx_GIVEREF(__pyx_tuple__124);
+
+  /* "rmgpy/molecule/element.py":308
+ * Hs = Element(108, 'Hs', 'hassium'       , 0.277)
+ * Mt = Element(109, 'Mt', 'meitnerium'    , 0.268)
+ * Ds = Element(110, 'Ds', 'darmstadtium'  , 0.281)             # <<<<<<<<<<<<<<
+ * Rg = Element(111, 'Rg', 'roentgenium'   , 0.272)
+ * Cn = Element(112, 'Cn', 'copernicum'    , 0.285)
+ */
+  __pyx_tuple__125 = PyTuple_Pack(4, __pyx_int_110, __pyx_n_u_Ds, __pyx_n_u_darmstadtium, __pyx_float_0_281); if (unlikely(!__pyx_tuple__125)) __PYX_ERR(0, 308, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__125);
+  __Pyx_GIVEREF(__pyx_tuple__125);
+
+  /* "rmgpy/molecule/element.py":309
+ * Mt = Element(109, 'Mt', 'meitnerium'    , 0.268)
+ * Ds = Element(110, 'Ds', 'darmstadtium'  , 0.281)
+ * Rg = Element(111, 'Rg', 'roentgenium'   , 0.272)             # <<<<<<<<<<<<<<
+ * Cn = Element(112, 'Cn', 'copernicum'    , 0.285)
+ * 
+ */
+  __pyx_tuple__126 = PyTuple_Pack(4, __pyx_int_111, __pyx_n_u_Rg, __pyx_n_u_roentgenium, __pyx_float_0_272); if (unlikely(!__pyx_tuple__126)) __PYX_ERR(0, 309, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__126);
+  __Pyx_GIVEREF(__pyx_tuple__126);
+
+  /* "rmgpy/molecule/element.py":310
+ * Ds = Element(110, 'Ds', 'darmstadtium'  , 0.281)
+ * Rg = Element(111, 'Rg', 'roentgenium'   , 0.272)
+ * Cn = Element(112, 'Cn', 'copernicum'    , 0.285)             # <<<<<<<<<<<<<<
+ * 
+ * # A list of the elements, sorted by increasing atomic number
+ */
+  __pyx_tuple__127 = PyTuple_Pack(4, __pyx_int_112, __pyx_n_u_Cn, __pyx_n_u_copernicum, __pyx_float_0_285); if (unlikely(!__pyx_tuple__127)) __PYX_ERR(0, 310, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__127);
+  __Pyx_GIVEREF(__pyx_tuple__127);
+
+  /* "rmgpy/molecule/element.py":334
+ * # (C,C,2.5) is C#C - (CbenzeneC - C-C)
+ * bde_elements = ['C', 'N', 'H', 'O', 'S', 'Cl', 'Si']  # elements supported by BDE
+ * bde_dict = {('H', 'H', 1.0): (432.0, 'kJ/mol'), ('H', 'C', 1): (411.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('H', 'N', 1): (386.0, 'kJ/mol'), ('H', 'O', 1.0): (459.0, 'kJ/mol'),
+ *             ('H', 'S', 1): (363.0, 'kJ/mol'), ('H', 'Cl', 1): (428.0, 'kJ/mol'),
+ */
+  __pyx_tuple__128 = PyTuple_Pack(3, __pyx_n_u_H, __pyx_n_u_H, __pyx_float_1_0); if (unlikely(!__pyx_tuple__128)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__128);
+  __Pyx_GIVEREF(__pyx_tuple__128);
+  __pyx_tuple__129 = PyTuple_Pack(2, __pyx_float_432_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__129)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__129);
+  __Pyx_GIVEREF(__pyx_tuple__129);
+  __pyx_tuple__130 = PyTuple_Pack(3, __pyx_n_u_H, __pyx_n_u_C, __pyx_int_1); if (unlikely(!__pyx_tuple__130)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__130);
+  __Pyx_GIVEREF(__pyx_tuple__130);
+  __pyx_tuple__131 = PyTuple_Pack(2, __pyx_float_411_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__131)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__131);
+  __Pyx_GIVEREF(__pyx_tuple__131);
+
+  /* "rmgpy/molecule/element.py":335
+ * bde_elements = ['C', 'N', 'H', 'O', 'S', 'Cl', 'Si']  # elements supported by BDE
+ * bde_dict = {('H', 'H', 1.0): (432.0, 'kJ/mol'), ('H', 'C', 1): (411.0, 'kJ/mol'),
+ *             ('H', 'N', 1): (386.0, 'kJ/mol'), ('H', 'O', 1.0): (459.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('H', 'S', 1): (363.0, 'kJ/mol'), ('H', 'Cl', 1): (428.0, 'kJ/mol'),
+ *             ('C', 'C', 1): (346.0, 'kJ/mol'), ('C', 'C', 2): (602.0, 'kJ/mol'),
+ */
+  __pyx_tuple__132 = PyTuple_Pack(3, __pyx_n_u_H, __pyx_n_u_N, __pyx_int_1); if (unlikely(!__pyx_tuple__132)) __PYX_ERR(0, 335, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__132);
+  __Pyx_GIVEREF(__pyx_tuple__132);
+  __pyx_tuple__133 = PyTuple_Pack(2, __pyx_float_386_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__133)) __PYX_ERR(0, 335, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__133);
+  __Pyx_GIVEREF(__pyx_tuple__133);
+  __pyx_tuple__134 = PyTuple_Pack(3, __pyx_n_u_H, __pyx_n_u_O, __pyx_float_1_0); if (unlikely(!__pyx_tuple__134)) __PYX_ERR(0, 335, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__134);
+  __Pyx_GIVEREF(__pyx_tuple__134);
+  __pyx_tuple__135 = PyTuple_Pack(2, __pyx_float_459_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__135)) __PYX_ERR(0, 335, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__135);
+  __Pyx_GIVEREF(__pyx_tuple__135);
+
+  /* "rmgpy/molecule/element.py":336
+ * bde_dict = {('H', 'H', 1.0): (432.0, 'kJ/mol'), ('H', 'C', 1): (411.0, 'kJ/mol'),
+ *             ('H', 'N', 1): (386.0, 'kJ/mol'), ('H', 'O', 1.0): (459.0, 'kJ/mol'),
+ *             ('H', 'S', 1): (363.0, 'kJ/mol'), ('H', 'Cl', 1): (428.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('C', 'C', 1): (346.0, 'kJ/mol'), ('C', 'C', 2): (602.0, 'kJ/mol'),
+ *             ('C', 'C', 3): (835.0, 'kJ/mol'), ('C', 'Si', 1): (318.0, 'kJ/mol'),
+ */
+  __pyx_tuple__136 = PyTuple_Pack(3, __pyx_n_u_H, __pyx_n_u_S, __pyx_int_1); if (unlikely(!__pyx_tuple__136)) __PYX_ERR(0, 336, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__136);
+  __Pyx_GIVEREF(__pyx_tuple__136);
+  __pyx_tuple__137 = PyTuple_Pack(2, __pyx_float_363_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__137)) __PYX_ERR(0, 336, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__137);
+  __Pyx_GIVEREF(__pyx_tuple__137);
+  __pyx_tuple__138 = PyTuple_Pack(3, __pyx_n_u_H, __pyx_n_u_Cl, __pyx_int_1); if (unlikely(!__pyx_tuple__138)) __PYX_ERR(0, 336, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__138);
+  __Pyx_GIVEREF(__pyx_tuple__138);
+  __pyx_tuple__139 = PyTuple_Pack(2, __pyx_float_428_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__139)) __PYX_ERR(0, 336, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__139);
+  __Pyx_GIVEREF(__pyx_tuple__139);
+
+  /* "rmgpy/molecule/element.py":337
+ *             ('H', 'N', 1): (386.0, 'kJ/mol'), ('H', 'O', 1.0): (459.0, 'kJ/mol'),
+ *             ('H', 'S', 1): (363.0, 'kJ/mol'), ('H', 'Cl', 1): (428.0, 'kJ/mol'),
+ *             ('C', 'C', 1): (346.0, 'kJ/mol'), ('C', 'C', 2): (602.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('C', 'C', 3): (835.0, 'kJ/mol'), ('C', 'Si', 1): (318.0, 'kJ/mol'),
+ *             ('C', 'N', 1): (305.0, 'kJ/mol'), ('C', 'N', 2): (615.0, 'kJ/mol'),
+ */
+  __pyx_tuple__140 = PyTuple_Pack(3, __pyx_n_u_C, __pyx_n_u_C, __pyx_int_1); if (unlikely(!__pyx_tuple__140)) __PYX_ERR(0, 337, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__140);
+  __Pyx_GIVEREF(__pyx_tuple__140);
+  __pyx_tuple__141 = PyTuple_Pack(2, __pyx_float_346_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__141)) __PYX_ERR(0, 337, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__141);
+  __Pyx_GIVEREF(__pyx_tuple__141);
+  __pyx_tuple__142 = PyTuple_Pack(3, __pyx_n_u_C, __pyx_n_u_C, __pyx_int_2); if (unlikely(!__pyx_tuple__142)) __PYX_ERR(0, 337, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__142);
+  __Pyx_GIVEREF(__pyx_tuple__142);
+  __pyx_tuple__143 = PyTuple_Pack(2, __pyx_float_602_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__143)) __PYX_ERR(0, 337, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__143);
+  __Pyx_GIVEREF(__pyx_tuple__143);
+
+  /* "rmgpy/molecule/element.py":338
+ *             ('H', 'S', 1): (363.0, 'kJ/mol'), ('H', 'Cl', 1): (428.0, 'kJ/mol'),
+ *             ('C', 'C', 1): (346.0, 'kJ/mol'), ('C', 'C', 2): (602.0, 'kJ/mol'),
+ *             ('C', 'C', 3): (835.0, 'kJ/mol'), ('C', 'Si', 1): (318.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('C', 'N', 1): (305.0, 'kJ/mol'), ('C', 'N', 2): (615.0, 'kJ/mol'),
+ *             ('C', 'N', 3): (887.0, 'kJ/mol'), ('C', 'O', 1): (358.0, 'kJ/mol'),
+ */
+  __pyx_tuple__144 = PyTuple_Pack(3, __pyx_n_u_C, __pyx_n_u_C, __pyx_int_3); if (unlikely(!__pyx_tuple__144)) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__144);
+  __Pyx_GIVEREF(__pyx_tuple__144);
+  __pyx_tuple__145 = PyTuple_Pack(2, __pyx_float_835_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__145)) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__145);
+  __Pyx_GIVEREF(__pyx_tuple__145);
+  __pyx_tuple__146 = PyTuple_Pack(3, __pyx_n_u_C, __pyx_n_u_Si, __pyx_int_1); if (unlikely(!__pyx_tuple__146)) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__146);
+  __Pyx_GIVEREF(__pyx_tuple__146);
+  __pyx_tuple__147 = PyTuple_Pack(2, __pyx_float_318_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__147)) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__147);
+  __Pyx_GIVEREF(__pyx_tuple__147);
+
+  /* "rmgpy/molecule/element.py":339
+ *             ('C', 'C', 1): (346.0, 'kJ/mol'), ('C', 'C', 2): (602.0, 'kJ/mol'),
+ *             ('C', 'C', 3): (835.0, 'kJ/mol'), ('C', 'Si', 1): (318.0, 'kJ/mol'),
+ *             ('C', 'N', 1): (305.0, 'kJ/mol'), ('C', 'N', 2): (615.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('C', 'N', 3): (887.0, 'kJ/mol'), ('C', 'O', 1): (358.0, 'kJ/mol'),
+ *             ('C', 'O', 2): (799.0, 'kJ/mol'), ('C', 'O', 3): (1072.0, 'kJ/mol'),
+ */
+  __pyx_tuple__148 = PyTuple_Pack(3, __pyx_n_u_C, __pyx_n_u_N, __pyx_int_1); if (unlikely(!__pyx_tuple__148)) __PYX_ERR(0, 339, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__148);
+  __Pyx_GIVEREF(__pyx_tuple__148);
+  __pyx_tuple__149 = PyTuple_Pack(2, __pyx_float_305_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__149)) __PYX_ERR(0, 339, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__149);
+  __Pyx_GIVEREF(__pyx_tuple__149);
+  __pyx_tuple__150 = PyTuple_Pack(3, __pyx_n_u_C, __pyx_n_u_N, __pyx_int_2); if (unlikely(!__pyx_tuple__150)) __PYX_ERR(0, 339, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__150);
+  __Pyx_GIVEREF(__pyx_tuple__150);
+  __pyx_tuple__151 = PyTuple_Pack(2, __pyx_float_615_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__151)) __PYX_ERR(0, 339, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__151);
+  __Pyx_GIVEREF(__pyx_tuple__151);
+
+  /* "rmgpy/molecule/element.py":340
+ *             ('C', 'C', 3): (835.0, 'kJ/mol'), ('C', 'Si', 1): (318.0, 'kJ/mol'),
+ *             ('C', 'N', 1): (305.0, 'kJ/mol'), ('C', 'N', 2): (615.0, 'kJ/mol'),
+ *             ('C', 'N', 3): (887.0, 'kJ/mol'), ('C', 'O', 1): (358.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('C', 'O', 2): (799.0, 'kJ/mol'), ('C', 'O', 3): (1072.0, 'kJ/mol'),
+ *             ('C', 'S', 1): (272.0, 'kJ/mol'), ('C', 'S', 2): (573.0, 'kJ/mol'),
+ */
+  __pyx_tuple__152 = PyTuple_Pack(3, __pyx_n_u_C, __pyx_n_u_N, __pyx_int_3); if (unlikely(!__pyx_tuple__152)) __PYX_ERR(0, 340, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__152);
+  __Pyx_GIVEREF(__pyx_tuple__152);
+  __pyx_tuple__153 = PyTuple_Pack(2, __pyx_float_887_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__153)) __PYX_ERR(0, 340, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__153);
+  __Pyx_GIVEREF(__pyx_tuple__153);
+  __pyx_tuple__154 = PyTuple_Pack(3, __pyx_n_u_C, __pyx_n_u_O, __pyx_int_1); if (unlikely(!__pyx_tuple__154)) __PYX_ERR(0, 340, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__154);
+  __Pyx_GIVEREF(__pyx_tuple__154);
+  __pyx_tuple__155 = PyTuple_Pack(2, __pyx_float_358_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__155)) __PYX_ERR(0, 340, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__155);
+  __Pyx_GIVEREF(__pyx_tuple__155);
+
+  /* "rmgpy/molecule/element.py":341
+ *             ('C', 'N', 1): (305.0, 'kJ/mol'), ('C', 'N', 2): (615.0, 'kJ/mol'),
+ *             ('C', 'N', 3): (887.0, 'kJ/mol'), ('C', 'O', 1): (358.0, 'kJ/mol'),
+ *             ('C', 'O', 2): (799.0, 'kJ/mol'), ('C', 'O', 3): (1072.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('C', 'S', 1): (272.0, 'kJ/mol'), ('C', 'S', 2): (573.0, 'kJ/mol'),
+ *             ('C', 'Cl', 1): (327.0, 'kJ/mol'), ('Si', 'Si', 1): (222.0, 'kJ/mol'),
+ */
+  __pyx_tuple__156 = PyTuple_Pack(3, __pyx_n_u_C, __pyx_n_u_O, __pyx_int_2); if (unlikely(!__pyx_tuple__156)) __PYX_ERR(0, 341, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__156);
+  __Pyx_GIVEREF(__pyx_tuple__156);
+  __pyx_tuple__157 = PyTuple_Pack(2, __pyx_float_799_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__157)) __PYX_ERR(0, 341, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__157);
+  __Pyx_GIVEREF(__pyx_tuple__157);
+  __pyx_tuple__158 = PyTuple_Pack(3, __pyx_n_u_C, __pyx_n_u_O, __pyx_int_3); if (unlikely(!__pyx_tuple__158)) __PYX_ERR(0, 341, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__158);
+  __Pyx_GIVEREF(__pyx_tuple__158);
+  __pyx_tuple__159 = PyTuple_Pack(2, __pyx_float_1072_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__159)) __PYX_ERR(0, 341, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__159);
+  __Pyx_GIVEREF(__pyx_tuple__159);
+
+  /* "rmgpy/molecule/element.py":342
+ *             ('C', 'N', 3): (887.0, 'kJ/mol'), ('C', 'O', 1): (358.0, 'kJ/mol'),
+ *             ('C', 'O', 2): (799.0, 'kJ/mol'), ('C', 'O', 3): (1072.0, 'kJ/mol'),
+ *             ('C', 'S', 1): (272.0, 'kJ/mol'), ('C', 'S', 2): (573.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('C', 'Cl', 1): (327.0, 'kJ/mol'), ('Si', 'Si', 1): (222.0, 'kJ/mol'),
+ *             ('Si', 'N', 1): (355.0, 'kJ/mol'), ('Si', 'O', 1): (452.0, 'kJ/mol'),
+ */
+  __pyx_tuple__160 = PyTuple_Pack(3, __pyx_n_u_C, __pyx_n_u_S, __pyx_int_1); if (unlikely(!__pyx_tuple__160)) __PYX_ERR(0, 342, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__160);
+  __Pyx_GIVEREF(__pyx_tuple__160);
+  __pyx_tuple__161 = PyTuple_Pack(2, __pyx_float_272_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__161)) __PYX_ERR(0, 342, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__161);
+  __Pyx_GIVEREF(__pyx_tuple__161);
+  __pyx_tuple__162 = PyTuple_Pack(3, __pyx_n_u_C, __pyx_n_u_S, __pyx_int_2); if (unlikely(!__pyx_tuple__162)) __PYX_ERR(0, 342, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__162);
+  __Pyx_GIVEREF(__pyx_tuple__162);
+  __pyx_tuple__163 = PyTuple_Pack(2, __pyx_float_573_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__163)) __PYX_ERR(0, 342, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__163);
+  __Pyx_GIVEREF(__pyx_tuple__163);
+
+  /* "rmgpy/molecule/element.py":343
+ *             ('C', 'O', 2): (799.0, 'kJ/mol'), ('C', 'O', 3): (1072.0, 'kJ/mol'),
+ *             ('C', 'S', 1): (272.0, 'kJ/mol'), ('C', 'S', 2): (573.0, 'kJ/mol'),
+ *             ('C', 'Cl', 1): (327.0, 'kJ/mol'), ('Si', 'Si', 1): (222.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('Si', 'N', 1): (355.0, 'kJ/mol'), ('Si', 'O', 1): (452.0, 'kJ/mol'),
+ *             ('Si', 'S', 1): (293.0, 'kJ/mol'), ('Si', 'Cl', 1): (381.0, 'kJ/mol'),
+ */
+  __pyx_tuple__164 = PyTuple_Pack(3, __pyx_n_u_C, __pyx_n_u_Cl, __pyx_int_1); if (unlikely(!__pyx_tuple__164)) __PYX_ERR(0, 343, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__164);
+  __Pyx_GIVEREF(__pyx_tuple__164);
+  __pyx_tuple__165 = PyTuple_Pack(2, __pyx_float_327_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__165)) __PYX_ERR(0, 343, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__165);
+  __Pyx_GIVEREF(__pyx_tuple__165);
+  __pyx_tuple__166 = PyTuple_Pack(3, __pyx_n_u_Si, __pyx_n_u_Si, __pyx_int_1); if (unlikely(!__pyx_tuple__166)) __PYX_ERR(0, 343, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__166);
+  __Pyx_GIVEREF(__pyx_tuple__166);
+  __pyx_tuple__167 = PyTuple_Pack(2, __pyx_float_222_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__167)) __PYX_ERR(0, 343, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__167);
+  __Pyx_GIVEREF(__pyx_tuple__167);
+
+  /* "rmgpy/molecule/element.py":344
+ *             ('C', 'S', 1): (272.0, 'kJ/mol'), ('C', 'S', 2): (573.0, 'kJ/mol'),
+ *             ('C', 'Cl', 1): (327.0, 'kJ/mol'), ('Si', 'Si', 1): (222.0, 'kJ/mol'),
+ *             ('Si', 'N', 1): (355.0, 'kJ/mol'), ('Si', 'O', 1): (452.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('Si', 'S', 1): (293.0, 'kJ/mol'), ('Si', 'Cl', 1): (381.0, 'kJ/mol'),
+ *             ('N', 'N', 1): (167.0, 'kJ/mol'), ('N', 'N', 2): (418.0, 'kJ/mol'),
+ */
+  __pyx_tuple__168 = PyTuple_Pack(3, __pyx_n_u_Si, __pyx_n_u_N, __pyx_int_1); if (unlikely(!__pyx_tuple__168)) __PYX_ERR(0, 344, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__168);
+  __Pyx_GIVEREF(__pyx_tuple__168);
+  __pyx_tuple__169 = PyTuple_Pack(2, __pyx_float_355_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__169)) __PYX_ERR(0, 344, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__169);
+  __Pyx_GIVEREF(__pyx_tuple__169);
+  __pyx_tuple__170 = PyTuple_Pack(3, __pyx_n_u_Si, __pyx_n_u_O, __pyx_int_1); if (unlikely(!__pyx_tuple__170)) __PYX_ERR(0, 344, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__170);
+  __Pyx_GIVEREF(__pyx_tuple__170);
+  __pyx_tuple__171 = PyTuple_Pack(2, __pyx_float_452_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__171)) __PYX_ERR(0, 344, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__171);
+  __Pyx_GIVEREF(__pyx_tuple__171);
+
+  /* "rmgpy/molecule/element.py":345
+ *             ('C', 'Cl', 1): (327.0, 'kJ/mol'), ('Si', 'Si', 1): (222.0, 'kJ/mol'),
+ *             ('Si', 'N', 1): (355.0, 'kJ/mol'), ('Si', 'O', 1): (452.0, 'kJ/mol'),
+ *             ('Si', 'S', 1): (293.0, 'kJ/mol'), ('Si', 'Cl', 1): (381.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('N', 'N', 1): (167.0, 'kJ/mol'), ('N', 'N', 2): (418.0, 'kJ/mol'),
+ *             ('N', 'N', 3): (942.0, 'kJ/mol'), ('N', 'O', 1): (201.0, 'kJ/mol'),
+ */
+  __pyx_tuple__172 = PyTuple_Pack(3, __pyx_n_u_Si, __pyx_n_u_S, __pyx_int_1); if (unlikely(!__pyx_tuple__172)) __PYX_ERR(0, 345, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__172);
+  __Pyx_GIVEREF(__pyx_tuple__172);
+  __pyx_tuple__173 = PyTuple_Pack(2, __pyx_float_293_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__173)) __PYX_ERR(0, 345, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__173);
+  __Pyx_GIVEREF(__pyx_tuple__173);
+  __pyx_tuple__174 = PyTuple_Pack(3, __pyx_n_u_Si, __pyx_n_u_Cl, __pyx_int_1); if (unlikely(!__pyx_tuple__174)) __PYX_ERR(0, 345, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__174);
+  __Pyx_GIVEREF(__pyx_tuple__174);
+  __pyx_tuple__175 = PyTuple_Pack(2, __pyx_float_381_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__175)) __PYX_ERR(0, 345, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__175);
+  __Pyx_GIVEREF(__pyx_tuple__175);
+
+  /* "rmgpy/molecule/element.py":346
+ *             ('Si', 'N', 1): (355.0, 'kJ/mol'), ('Si', 'O', 1): (452.0, 'kJ/mol'),
+ *             ('Si', 'S', 1): (293.0, 'kJ/mol'), ('Si', 'Cl', 1): (381.0, 'kJ/mol'),
+ *             ('N', 'N', 1): (167.0, 'kJ/mol'), ('N', 'N', 2): (418.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('N', 'N', 3): (942.0, 'kJ/mol'), ('N', 'O', 1): (201.0, 'kJ/mol'),
+ *             ('N', 'O', 2): (607.0, 'kJ/mol'), ('N', 'Cl', 1): (313.0, 'kJ/mol'),
+ */
+  __pyx_tuple__176 = PyTuple_Pack(3, __pyx_n_u_N, __pyx_n_u_N, __pyx_int_1); if (unlikely(!__pyx_tuple__176)) __PYX_ERR(0, 346, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__176);
+  __Pyx_GIVEREF(__pyx_tuple__176);
+  __pyx_tuple__177 = PyTuple_Pack(2, __pyx_float_167_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__177)) __PYX_ERR(0, 346, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__177);
+  __Pyx_GIVEREF(__pyx_tuple__177);
+  __pyx_tuple__178 = PyTuple_Pack(3, __pyx_n_u_N, __pyx_n_u_N, __pyx_int_2); if (unlikely(!__pyx_tuple__178)) __PYX_ERR(0, 346, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__178);
+  __Pyx_GIVEREF(__pyx_tuple__178);
+  __pyx_tuple__179 = PyTuple_Pack(2, __pyx_float_418_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__179)) __PYX_ERR(0, 346, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__179);
+  __Pyx_GIVEREF(__pyx_tuple__179);
+
+  /* "rmgpy/molecule/element.py":347
+ *             ('Si', 'S', 1): (293.0, 'kJ/mol'), ('Si', 'Cl', 1): (381.0, 'kJ/mol'),
+ *             ('N', 'N', 1): (167.0, 'kJ/mol'), ('N', 'N', 2): (418.0, 'kJ/mol'),
+ *             ('N', 'N', 3): (942.0, 'kJ/mol'), ('N', 'O', 1): (201.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('N', 'O', 2): (607.0, 'kJ/mol'), ('N', 'Cl', 1): (313.0, 'kJ/mol'),
+ *             ('O', 'O', 1): (142.0, 'kJ/mol'), ('O', 'O', 2): (494.0, 'kJ/mol'),
+ */
+  __pyx_tuple__180 = PyTuple_Pack(3, __pyx_n_u_N, __pyx_n_u_N, __pyx_int_3); if (unlikely(!__pyx_tuple__180)) __PYX_ERR(0, 347, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__180);
+  __Pyx_GIVEREF(__pyx_tuple__180);
+  __pyx_tuple__181 = PyTuple_Pack(2, __pyx_float_942_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__181)) __PYX_ERR(0, 347, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__181);
+  __Pyx_GIVEREF(__pyx_tuple__181);
+  __pyx_tuple__182 = PyTuple_Pack(3, __pyx_n_u_N, __pyx_n_u_O, __pyx_int_1); if (unlikely(!__pyx_tuple__182)) __PYX_ERR(0, 347, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__182);
+  __Pyx_GIVEREF(__pyx_tuple__182);
+  __pyx_tuple__183 = PyTuple_Pack(2, __pyx_float_201_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__183)) __PYX_ERR(0, 347, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__183);
+  __Pyx_GIVEREF(__pyx_tuple__183);
+
+  /* "rmgpy/molecule/element.py":348
+ *             ('N', 'N', 1): (167.0, 'kJ/mol'), ('N', 'N', 2): (418.0, 'kJ/mol'),
+ *             ('N', 'N', 3): (942.0, 'kJ/mol'), ('N', 'O', 1): (201.0, 'kJ/mol'),
+ *             ('N', 'O', 2): (607.0, 'kJ/mol'), ('N', 'Cl', 1): (313.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('O', 'O', 1): (142.0, 'kJ/mol'), ('O', 'O', 2): (494.0, 'kJ/mol'),
+ *             ('S', 'O', 2): (522.0, 'kJ/mol'), ('S', 'S', 1): (226.0, 'kJ/mol'),
+ */
+  __pyx_tuple__184 = PyTuple_Pack(3, __pyx_n_u_N, __pyx_n_u_O, __pyx_int_2); if (unlikely(!__pyx_tuple__184)) __PYX_ERR(0, 348, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__184);
+  __Pyx_GIVEREF(__pyx_tuple__184);
+  __pyx_tuple__185 = PyTuple_Pack(2, __pyx_float_607_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__185)) __PYX_ERR(0, 348, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__185);
+  __Pyx_GIVEREF(__pyx_tuple__185);
+  __pyx_tuple__186 = PyTuple_Pack(3, __pyx_n_u_N, __pyx_n_u_Cl, __pyx_int_1); if (unlikely(!__pyx_tuple__186)) __PYX_ERR(0, 348, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__186);
+  __Pyx_GIVEREF(__pyx_tuple__186);
+  __pyx_tuple__187 = PyTuple_Pack(2, __pyx_float_313_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__187)) __PYX_ERR(0, 348, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__187);
+  __Pyx_GIVEREF(__pyx_tuple__187);
+
+  /* "rmgpy/molecule/element.py":349
+ *             ('N', 'N', 3): (942.0, 'kJ/mol'), ('N', 'O', 1): (201.0, 'kJ/mol'),
+ *             ('N', 'O', 2): (607.0, 'kJ/mol'), ('N', 'Cl', 1): (313.0, 'kJ/mol'),
+ *             ('O', 'O', 1): (142.0, 'kJ/mol'), ('O', 'O', 2): (494.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('S', 'O', 2): (522.0, 'kJ/mol'), ('S', 'S', 1): (226.0, 'kJ/mol'),
+ *             ('S', 'S', 2): (425.0, 'kJ/mol'), ('S', 'Cl', 1): (255.0, 'kJ/mol'),
+ */
+  __pyx_tuple__188 = PyTuple_Pack(3, __pyx_n_u_O, __pyx_n_u_O, __pyx_int_1); if (unlikely(!__pyx_tuple__188)) __PYX_ERR(0, 349, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__188);
+  __Pyx_GIVEREF(__pyx_tuple__188);
+  __pyx_tuple__189 = PyTuple_Pack(2, __pyx_float_142_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__189)) __PYX_ERR(0, 349, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__189);
+  __Pyx_GIVEREF(__pyx_tuple__189);
+  __pyx_tuple__190 = PyTuple_Pack(3, __pyx_n_u_O, __pyx_n_u_O, __pyx_int_2); if (unlikely(!__pyx_tuple__190)) __PYX_ERR(0, 349, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__190);
+  __Pyx_GIVEREF(__pyx_tuple__190);
+  __pyx_tuple__191 = PyTuple_Pack(2, __pyx_float_494_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__191)) __PYX_ERR(0, 349, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__191);
+  __Pyx_GIVEREF(__pyx_tuple__191);
+
+  /* "rmgpy/molecule/element.py":350
+ *             ('N', 'O', 2): (607.0, 'kJ/mol'), ('N', 'Cl', 1): (313.0, 'kJ/mol'),
+ *             ('O', 'O', 1): (142.0, 'kJ/mol'), ('O', 'O', 2): (494.0, 'kJ/mol'),
+ *             ('S', 'O', 2): (522.0, 'kJ/mol'), ('S', 'S', 1): (226.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('S', 'S', 2): (425.0, 'kJ/mol'), ('S', 'Cl', 1): (255.0, 'kJ/mol'),
+ *             ('Cl', 'Cl', 1): (240.0, 'kJ/mol'), ('C', 'C', 1.5): (518.0, 'kJ/mol'),
+ */
+  __pyx_tuple__192 = PyTuple_Pack(3, __pyx_n_u_S, __pyx_n_u_O, __pyx_int_2); if (unlikely(!__pyx_tuple__192)) __PYX_ERR(0, 350, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__192);
+  __Pyx_GIVEREF(__pyx_tuple__192);
+  __pyx_tuple__193 = PyTuple_Pack(2, __pyx_float_522_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__193)) __PYX_ERR(0, 350, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__193);
+  __Pyx_GIVEREF(__pyx_tuple__193);
+  __pyx_tuple__194 = PyTuple_Pack(3, __pyx_n_u_S, __pyx_n_u_S, __pyx_int_1); if (unlikely(!__pyx_tuple__194)) __PYX_ERR(0, 350, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__194);
+  __Pyx_GIVEREF(__pyx_tuple__194);
+  __pyx_tuple__195 = PyTuple_Pack(2, __pyx_float_226_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__195)) __PYX_ERR(0, 350, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__195);
+  __Pyx_GIVEREF(__pyx_tuple__195);
+
+  /* "rmgpy/molecule/element.py":351
+ *             ('O', 'O', 1): (142.0, 'kJ/mol'), ('O', 'O', 2): (494.0, 'kJ/mol'),
+ *             ('S', 'O', 2): (522.0, 'kJ/mol'), ('S', 'S', 1): (226.0, 'kJ/mol'),
+ *             ('S', 'S', 2): (425.0, 'kJ/mol'), ('S', 'Cl', 1): (255.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('Cl', 'Cl', 1): (240.0, 'kJ/mol'), ('C', 'C', 1.5): (518.0, 'kJ/mol'),
+ *             ('O', 'S', 1): (265.0, 'kJ/mol'), ('C', 'C', 2.5): (663.0, 'kJ/mol')}
+ */
+  __pyx_tuple__196 = PyTuple_Pack(3, __pyx_n_u_S, __pyx_n_u_S, __pyx_int_2); if (unlikely(!__pyx_tuple__196)) __PYX_ERR(0, 351, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__196);
+  __Pyx_GIVEREF(__pyx_tuple__196);
+  __pyx_tuple__197 = PyTuple_Pack(2, __pyx_float_425_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__197)) __PYX_ERR(0, 351, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__197);
+  __Pyx_GIVEREF(__pyx_tuple__197);
+  __pyx_tuple__198 = PyTuple_Pack(3, __pyx_n_u_S, __pyx_n_u_Cl, __pyx_int_1); if (unlikely(!__pyx_tuple__198)) __PYX_ERR(0, 351, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__198);
+  __Pyx_GIVEREF(__pyx_tuple__198);
+  __pyx_tuple__199 = PyTuple_Pack(2, __pyx_float_255_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__199)) __PYX_ERR(0, 351, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__199);
+  __Pyx_GIVEREF(__pyx_tuple__199);
+
+  /* "rmgpy/molecule/element.py":352
+ *             ('S', 'O', 2): (522.0, 'kJ/mol'), ('S', 'S', 1): (226.0, 'kJ/mol'),
+ *             ('S', 'S', 2): (425.0, 'kJ/mol'), ('S', 'Cl', 1): (255.0, 'kJ/mol'),
+ *             ('Cl', 'Cl', 1): (240.0, 'kJ/mol'), ('C', 'C', 1.5): (518.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('O', 'S', 1): (265.0, 'kJ/mol'), ('C', 'C', 2.5): (663.0, 'kJ/mol')}
+ * 
+ */
+  __pyx_tuple__200 = PyTuple_Pack(3, __pyx_n_u_Cl, __pyx_n_u_Cl, __pyx_int_1); if (unlikely(!__pyx_tuple__200)) __PYX_ERR(0, 352, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__200);
+  __Pyx_GIVEREF(__pyx_tuple__200);
+  __pyx_tuple__201 = PyTuple_Pack(2, __pyx_float_240_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__201)) __PYX_ERR(0, 352, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__201);
+  __Pyx_GIVEREF(__pyx_tuple__201);
+  __pyx_tuple__202 = PyTuple_Pack(3, __pyx_n_u_C, __pyx_n_u_C, __pyx_float_1_5); if (unlikely(!__pyx_tuple__202)) __PYX_ERR(0, 352, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__202);
+  __Pyx_GIVEREF(__pyx_tuple__202);
+  __pyx_tuple__203 = PyTuple_Pack(2, __pyx_float_518_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__203)) __PYX_ERR(0, 352, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__203);
+  __Pyx_GIVEREF(__pyx_tuple__203);
+
+  /* "rmgpy/molecule/element.py":353
+ *             ('S', 'S', 2): (425.0, 'kJ/mol'), ('S', 'Cl', 1): (255.0, 'kJ/mol'),
+ *             ('Cl', 'Cl', 1): (240.0, 'kJ/mol'), ('C', 'C', 1.5): (518.0, 'kJ/mol'),
+ *             ('O', 'S', 1): (265.0, 'kJ/mol'), ('C', 'C', 2.5): (663.0, 'kJ/mol')}             # <<<<<<<<<<<<<<
+ * 
+ * bdes = {}
+ */
+  __pyx_tuple__204 = PyTuple_Pack(3, __pyx_n_u_O, __pyx_n_u_S, __pyx_int_1); if (unlikely(!__pyx_tuple__204)) __PYX_ERR(0, 353, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__204);
+  __Pyx_GIVEREF(__pyx_tuple__204);
+  __pyx_tuple__205 = PyTuple_Pack(2, __pyx_float_265_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__205)) __PYX_ERR(0, 353, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__205);
+  __Pyx_GIVEREF(__pyx_tuple__205);
+  __pyx_tuple__206 = PyTuple_Pack(3, __pyx_n_u_C, __pyx_n_u_C, __pyx_float_2_5); if (unlikely(!__pyx_tuple__206)) __PYX_ERR(0, 353, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__206);
+  __Pyx_GIVEREF(__pyx_tuple__206);
+  __pyx_tuple__207 = PyTuple_Pack(2, __pyx_float_663_0, __pyx_kp_u_kJ_mol); if (unlikely(!__pyx_tuple__207)) __PYX_ERR(0, 353, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__207);
+  __Pyx_GIVEREF(__pyx_tuple__207);
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_0 = PyFloat_FromDouble(0.0); if (unlikely(!__pyx_float_0_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_1_0 = PyFloat_FromDouble(1.0); if (unlikely(!__pyx_float_1_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_1_5 = PyFloat_FromDouble(1.5); if (unlikely(!__pyx_float_1_5)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_2_5 = PyFloat_FromDouble(2.5); if (unlikely(!__pyx_float_2_5)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_1_90 = PyFloat_FromDouble(1.90); if (unlikely(!__pyx_float_1_90)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_2_20 = PyFloat_FromDouble(2.20); if (unlikely(!__pyx_float_2_20)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_2_55 = PyFloat_FromDouble(2.55); if (unlikely(!__pyx_float_2_55)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_2_58 = PyFloat_FromDouble(2.58); if (unlikely(!__pyx_float_2_58)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_2_66 = PyFloat_FromDouble(2.66); if (unlikely(!__pyx_float_2_66)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_3_04 = PyFloat_FromDouble(3.04); if (unlikely(!__pyx_float_3_04)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_3_16 = PyFloat_FromDouble(3.16); if (unlikely(!__pyx_float_3_16)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_3_44 = PyFloat_FromDouble(3.44); if (unlikely(!__pyx_float_3_44)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_3_98 = PyFloat_FromDouble(3.98); if (unlikely(!__pyx_float_3_98)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_098 = PyFloat_FromDouble(0.098); if (unlikely(!__pyx_float_0_098)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_145 = PyFloat_FromDouble(0.145); if (unlikely(!__pyx_float_0_145)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_209 = PyFloat_FromDouble(0.209); if (unlikely(!__pyx_float_0_209)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_210 = PyFloat_FromDouble(0.210); if (unlikely(!__pyx_float_0_210)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_222 = PyFloat_FromDouble(0.222); if (unlikely(!__pyx_float_0_222)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_223 = PyFloat_FromDouble(0.223); if (unlikely(!__pyx_float_0_223)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_226 = PyFloat_FromDouble(0.226); if (unlikely(!__pyx_float_0_226)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_227 = PyFloat_FromDouble(0.227); if (unlikely(!__pyx_float_0_227)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_237 = PyFloat_FromDouble(0.237); if (unlikely(!__pyx_float_0_237)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_243 = PyFloat_FromDouble(0.243); if (unlikely(!__pyx_float_0_243)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_244 = PyFloat_FromDouble(0.244); if (unlikely(!__pyx_float_0_244)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_247 = PyFloat_FromDouble(0.247); if (unlikely(!__pyx_float_0_247)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_251 = PyFloat_FromDouble(0.251); if (unlikely(!__pyx_float_0_251)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_252 = PyFloat_FromDouble(0.252); if (unlikely(!__pyx_float_0_252)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_257 = PyFloat_FromDouble(0.257); if (unlikely(!__pyx_float_0_257)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_258 = PyFloat_FromDouble(0.258); if (unlikely(!__pyx_float_0_258)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_259 = PyFloat_FromDouble(0.259); if (unlikely(!__pyx_float_0_259)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_261 = PyFloat_FromDouble(0.261); if (unlikely(!__pyx_float_0_261)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_262 = PyFloat_FromDouble(0.262); if (unlikely(!__pyx_float_0_262)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_264 = PyFloat_FromDouble(0.264); if (unlikely(!__pyx_float_0_264)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_266 = PyFloat_FromDouble(0.266); if (unlikely(!__pyx_float_0_266)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_268 = PyFloat_FromDouble(0.268); if (unlikely(!__pyx_float_0_268)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_272 = PyFloat_FromDouble(0.272); if (unlikely(!__pyx_float_0_272)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_277 = PyFloat_FromDouble(0.277); if (unlikely(!__pyx_float_0_277)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_281 = PyFloat_FromDouble(0.281); if (unlikely(!__pyx_float_0_281)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_285 = PyFloat_FromDouble(0.285); if (unlikely(!__pyx_float_0_285)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_142_0 = PyFloat_FromDouble(142.0); if (unlikely(!__pyx_float_142_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_167_0 = PyFloat_FromDouble(167.0); if (unlikely(!__pyx_float_167_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_201_0 = PyFloat_FromDouble(201.0); if (unlikely(!__pyx_float_201_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_222_0 = PyFloat_FromDouble(222.0); if (unlikely(!__pyx_float_222_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_226_0 = PyFloat_FromDouble(226.0); if (unlikely(!__pyx_float_226_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_240_0 = PyFloat_FromDouble(240.0); if (unlikely(!__pyx_float_240_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_255_0 = PyFloat_FromDouble(255.0); if (unlikely(!__pyx_float_255_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_265_0 = PyFloat_FromDouble(265.0); if (unlikely(!__pyx_float_265_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_272_0 = PyFloat_FromDouble(272.0); if (unlikely(!__pyx_float_272_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_293_0 = PyFloat_FromDouble(293.0); if (unlikely(!__pyx_float_293_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_305_0 = PyFloat_FromDouble(305.0); if (unlikely(!__pyx_float_305_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_313_0 = PyFloat_FromDouble(313.0); if (unlikely(!__pyx_float_313_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_318_0 = PyFloat_FromDouble(318.0); if (unlikely(!__pyx_float_318_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_327_0 = PyFloat_FromDouble(327.0); if (unlikely(!__pyx_float_327_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_346_0 = PyFloat_FromDouble(346.0); if (unlikely(!__pyx_float_346_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_355_0 = PyFloat_FromDouble(355.0); if (unlikely(!__pyx_float_355_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_358_0 = PyFloat_FromDouble(358.0); if (unlikely(!__pyx_float_358_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_363_0 = PyFloat_FromDouble(363.0); if (unlikely(!__pyx_float_363_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_381_0 = PyFloat_FromDouble(381.0); if (unlikely(!__pyx_float_381_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_386_0 = PyFloat_FromDouble(386.0); if (unlikely(!__pyx_float_386_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_411_0 = PyFloat_FromDouble(411.0); if (unlikely(!__pyx_float_411_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_418_0 = PyFloat_FromDouble(418.0); if (unlikely(!__pyx_float_418_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_425_0 = PyFloat_FromDouble(425.0); if (unlikely(!__pyx_float_425_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_428_0 = PyFloat_FromDouble(428.0); if (unlikely(!__pyx_float_428_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_432_0 = PyFloat_FromDouble(432.0); if (unlikely(!__pyx_float_432_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_452_0 = PyFloat_FromDouble(452.0); if (unlikely(!__pyx_float_452_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_459_0 = PyFloat_FromDouble(459.0); if (unlikely(!__pyx_float_459_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_494_0 = PyFloat_FromDouble(494.0); if (unlikely(!__pyx_float_494_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_518_0 = PyFloat_FromDouble(518.0); if (unlikely(!__pyx_float_518_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_522_0 = PyFloat_FromDouble(522.0); if (unlikely(!__pyx_float_522_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_573_0 = PyFloat_FromDouble(573.0); if (unlikely(!__pyx_float_573_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_602_0 = PyFloat_FromDouble(602.0); if (unlikely(!__pyx_float_602_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_607_0 = PyFloat_FromDouble(607.0); if (unlikely(!__pyx_float_607_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_615_0 = PyFloat_FromDouble(615.0); if (unlikely(!__pyx_float_615_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_663_0 = PyFloat_FromDouble(663.0); if (unlikely(!__pyx_float_663_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_799_0 = PyFloat_FromDouble(799.0); if (unlikely(!__pyx_float_799_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_835_0 = PyFloat_FromDouble(835.0); if (unlikely(!__pyx_float_835_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_887_0 = PyFloat_FromDouble(887.0); if (unlikely(!__pyx_float_887_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_942_0 = PyFloat_FromDouble(942.0); if (unlikely(!__pyx_float_942_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_2072 = PyFloat_FromDouble(0.2072); if (unlikely(!__pyx_float_0_2072)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_1072_0 = PyFloat_FromDouble(1072.0); if (unlikely(!__pyx_float_1072_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_07264 = PyFloat_FromDouble(0.07264); if (unlikely(!__pyx_float_0_07264)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_07896 = PyFloat_FromDouble(0.07896); if (unlikely(!__pyx_float_0_07896)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_08762 = PyFloat_FromDouble(0.08762); if (unlikely(!__pyx_float_0_08762)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_09594 = PyFloat_FromDouble(0.09594); if (unlikely(!__pyx_float_0_09594)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_10107 = PyFloat_FromDouble(0.10107); if (unlikely(!__pyx_float_0_10107)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_10642 = PyFloat_FromDouble(0.10642); if (unlikely(!__pyx_float_0_10642)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_12760 = PyFloat_FromDouble(0.12760); if (unlikely(!__pyx_float_0_12760)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_14424 = PyFloat_FromDouble(0.14424); if (unlikely(!__pyx_float_0_14424)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_15036 = PyFloat_FromDouble(0.15036); if (unlikely(!__pyx_float_0_15036)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_15725 = PyFloat_FromDouble(0.15725); if (unlikely(!__pyx_float_0_15725)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_17304 = PyFloat_FromDouble(0.17304); if (unlikely(!__pyx_float_0_17304)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_17849 = PyFloat_FromDouble(0.17849); if (unlikely(!__pyx_float_0_17849)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_18384 = PyFloat_FromDouble(0.18384); if (unlikely(!__pyx_float_0_18384)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_19023 = PyFloat_FromDouble(0.19023); if (unlikely(!__pyx_float_0_19023)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_20059 = PyFloat_FromDouble(0.20059); if (unlikely(!__pyx_float_0_20059)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_006941 = PyFloat_FromDouble(0.006941); if (unlikely(!__pyx_float_0_006941)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_010811 = PyFloat_FromDouble(0.010811); if (unlikely(!__pyx_float_0_010811)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_032065 = PyFloat_FromDouble(0.032065); if (unlikely(!__pyx_float_0_032065)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_035453 = PyFloat_FromDouble(0.035453); if (unlikely(!__pyx_float_0_035453)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_039348 = PyFloat_FromDouble(0.039348); if (unlikely(!__pyx_float_0_039348)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_040078 = PyFloat_FromDouble(0.040078); if (unlikely(!__pyx_float_0_040078)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_047867 = PyFloat_FromDouble(0.047867); if (unlikely(!__pyx_float_0_047867)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_055845 = PyFloat_FromDouble(0.055845); if (unlikely(!__pyx_float_0_055845)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_063546 = PyFloat_FromDouble(0.063546); if (unlikely(!__pyx_float_0_063546)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_065409 = PyFloat_FromDouble(0.065409); if (unlikely(!__pyx_float_0_065409)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_069723 = PyFloat_FromDouble(0.069723); if (unlikely(!__pyx_float_0_069723)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_079904 = PyFloat_FromDouble(0.079904); if (unlikely(!__pyx_float_0_079904)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_083798 = PyFloat_FromDouble(0.083798); if (unlikely(!__pyx_float_0_083798)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_091224 = PyFloat_FromDouble(0.091224); if (unlikely(!__pyx_float_0_091224)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_112411 = PyFloat_FromDouble(0.112411); if (unlikely(!__pyx_float_0_112411)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_114818 = PyFloat_FromDouble(0.114818); if (unlikely(!__pyx_float_0_114818)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_118710 = PyFloat_FromDouble(0.118710); if (unlikely(!__pyx_float_0_118710)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_121760 = PyFloat_FromDouble(0.121760); if (unlikely(!__pyx_float_0_121760)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_131293 = PyFloat_FromDouble(0.131293); if (unlikely(!__pyx_float_0_131293)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_137327 = PyFloat_FromDouble(0.137327); if (unlikely(!__pyx_float_0_137327)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_140116 = PyFloat_FromDouble(0.140116); if (unlikely(!__pyx_float_0_140116)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_151964 = PyFloat_FromDouble(0.151964); if (unlikely(!__pyx_float_0_151964)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_162500 = PyFloat_FromDouble(0.162500); if (unlikely(!__pyx_float_0_162500)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_167259 = PyFloat_FromDouble(0.167259); if (unlikely(!__pyx_float_0_167259)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_174967 = PyFloat_FromDouble(0.174967); if (unlikely(!__pyx_float_0_174967)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_186207 = PyFloat_FromDouble(0.186207); if (unlikely(!__pyx_float_0_186207)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_192217 = PyFloat_FromDouble(0.192217); if (unlikely(!__pyx_float_0_192217)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_195078 = PyFloat_FromDouble(0.195078); if (unlikely(!__pyx_float_0_195078)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_0120107 = PyFloat_FromDouble(0.0120107); if (unlikely(!__pyx_float_0_0120107)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_0130033 = PyFloat_FromDouble(0.0130033); if (unlikely(!__pyx_float_0_0130033)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_0159994 = PyFloat_FromDouble(0.0159994); if (unlikely(!__pyx_float_0_0159994)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_0179999 = PyFloat_FromDouble(0.0179999); if (unlikely(!__pyx_float_0_0179999)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_0201797 = PyFloat_FromDouble(0.0201797); if (unlikely(!__pyx_float_0_0201797)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_0243050 = PyFloat_FromDouble(0.0243050); if (unlikely(!__pyx_float_0_0243050)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_0280855 = PyFloat_FromDouble(0.0280855); if (unlikely(!__pyx_float_0_0280855)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_0390983 = PyFloat_FromDouble(0.0390983); if (unlikely(!__pyx_float_0_0390983)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_0509415 = PyFloat_FromDouble(0.0509415); if (unlikely(!__pyx_float_0_0509415)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_0519961 = PyFloat_FromDouble(0.0519961); if (unlikely(!__pyx_float_0_0519961)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_0586934 = PyFloat_FromDouble(0.0586934); if (unlikely(!__pyx_float_0_0586934)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_0854678 = PyFloat_FromDouble(0.0854678); if (unlikely(!__pyx_float_0_0854678)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_1078682 = PyFloat_FromDouble(0.1078682); if (unlikely(!__pyx_float_0_1078682)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_1389055 = PyFloat_FromDouble(0.1389055); if (unlikely(!__pyx_float_0_1389055)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_1809479 = PyFloat_FromDouble(0.1809479); if (unlikely(!__pyx_float_0_1809479)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_2043833 = PyFloat_FromDouble(0.2043833); if (unlikely(!__pyx_float_0_2043833)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_2320381 = PyFloat_FromDouble(0.2320381); if (unlikely(!__pyx_float_0_2320381)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_00100794 = PyFloat_FromDouble(0.00100794); if (unlikely(!__pyx_float_0_00100794)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_01400674 = PyFloat_FromDouble(0.01400674); if (unlikely(!__pyx_float_0_01400674)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_07492160 = PyFloat_FromDouble(0.07492160); if (unlikely(!__pyx_float_0_07492160)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_08890585 = PyFloat_FromDouble(0.08890585); if (unlikely(!__pyx_float_0_08890585)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_09290638 = PyFloat_FromDouble(0.09290638); if (unlikely(!__pyx_float_0_09290638)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_10290550 = PyFloat_FromDouble(0.10290550); if (unlikely(!__pyx_float_0_10290550)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_12690447 = PyFloat_FromDouble(0.12690447); if (unlikely(!__pyx_float_0_12690447)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_13290545 = PyFloat_FromDouble(0.13290545); if (unlikely(!__pyx_float_0_13290545)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_14090765 = PyFloat_FromDouble(0.14090765); if (unlikely(!__pyx_float_0_14090765)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_15892534 = PyFloat_FromDouble(0.15892534); if (unlikely(!__pyx_float_0_15892534)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_16493032 = PyFloat_FromDouble(0.16493032); if (unlikely(!__pyx_float_0_16493032)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_16893421 = PyFloat_FromDouble(0.16893421); if (unlikely(!__pyx_float_0_16893421)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_19696655 = PyFloat_FromDouble(0.19696655); if (unlikely(!__pyx_float_0_19696655)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_20898038 = PyFloat_FromDouble(0.20898038); if (unlikely(!__pyx_float_0_20898038)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_23103588 = PyFloat_FromDouble(0.23103588); if (unlikely(!__pyx_float_0_23103588)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_23802891 = PyFloat_FromDouble(0.23802891); if (unlikely(!__pyx_float_0_23802891)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_002014101 = PyFloat_FromDouble(0.002014101); if (unlikely(!__pyx_float_0_002014101)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_003016049 = PyFloat_FromDouble(0.003016049); if (unlikely(!__pyx_float_0_003016049)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_004002602 = PyFloat_FromDouble(0.004002602); if (unlikely(!__pyx_float_0_004002602)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_009012182 = PyFloat_FromDouble(0.009012182); if (unlikely(!__pyx_float_0_009012182)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_018998403 = PyFloat_FromDouble(0.018998403); if (unlikely(!__pyx_float_0_018998403)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_022989770 = PyFloat_FromDouble(0.022989770); if (unlikely(!__pyx_float_0_022989770)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_026981538 = PyFloat_FromDouble(0.026981538); if (unlikely(!__pyx_float_0_026981538)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_030973761 = PyFloat_FromDouble(0.030973761); if (unlikely(!__pyx_float_0_030973761)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_044955910 = PyFloat_FromDouble(0.044955910); if (unlikely(!__pyx_float_0_044955910)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_054938049 = PyFloat_FromDouble(0.054938049); if (unlikely(!__pyx_float_0_054938049)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_058933200 = PyFloat_FromDouble(0.058933200); if (unlikely(!__pyx_float_0_058933200)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_3 = PyInt_FromLong(3); if (unlikely(!__pyx_int_3)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_4 = PyInt_FromLong(4); if (unlikely(!__pyx_int_4)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_5 = PyInt_FromLong(5); if (unlikely(!__pyx_int_5)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_6 = PyInt_FromLong(6); if (unlikely(!__pyx_int_6)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_7 = PyInt_FromLong(7); if (unlikely(!__pyx_int_7)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_8 = PyInt_FromLong(8); if (unlikely(!__pyx_int_8)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_9 = PyInt_FromLong(9); if (unlikely(!__pyx_int_9)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_10 = PyInt_FromLong(10); if (unlikely(!__pyx_int_10)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_11 = PyInt_FromLong(11); if (unlikely(!__pyx_int_11)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_12 = PyInt_FromLong(12); if (unlikely(!__pyx_int_12)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_13 = PyInt_FromLong(13); if (unlikely(!__pyx_int_13)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_14 = PyInt_FromLong(14); if (unlikely(!__pyx_int_14)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_15 = PyInt_FromLong(15); if (unlikely(!__pyx_int_15)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_16 = PyInt_FromLong(16); if (unlikely(!__pyx_int_16)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_17 = PyInt_FromLong(17); if (unlikely(!__pyx_int_17)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_18 = PyInt_FromLong(18); if (unlikely(!__pyx_int_18)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_19 = PyInt_FromLong(19); if (unlikely(!__pyx_int_19)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_20 = PyInt_FromLong(20); if (unlikely(!__pyx_int_20)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_21 = PyInt_FromLong(21); if (unlikely(!__pyx_int_21)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_22 = PyInt_FromLong(22); if (unlikely(!__pyx_int_22)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_23 = PyInt_FromLong(23); if (unlikely(!__pyx_int_23)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_24 = PyInt_FromLong(24); if (unlikely(!__pyx_int_24)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_25 = PyInt_FromLong(25); if (unlikely(!__pyx_int_25)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_26 = PyInt_FromLong(26); if (unlikely(!__pyx_int_26)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_27 = PyInt_FromLong(27); if (unlikely(!__pyx_int_27)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_28 = PyInt_FromLong(28); if (unlikely(!__pyx_int_28)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_29 = PyInt_FromLong(29); if (unlikely(!__pyx_int_29)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_30 = PyInt_FromLong(30); if (unlikely(!__pyx_int_30)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_31 = PyInt_FromLong(31); if (unlikely(!__pyx_int_31)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_32 = PyInt_FromLong(32); if (unlikely(!__pyx_int_32)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_33 = PyInt_FromLong(33); if (unlikely(!__pyx_int_33)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_34 = PyInt_FromLong(34); if (unlikely(!__pyx_int_34)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_35 = PyInt_FromLong(35); if (unlikely(!__pyx_int_35)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_36 = PyInt_FromLong(36); if (unlikely(!__pyx_int_36)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_37 = PyInt_FromLong(37); if (unlikely(!__pyx_int_37)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_38 = PyInt_FromLong(38); if (unlikely(!__pyx_int_38)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_39 = PyInt_FromLong(39); if (unlikely(!__pyx_int_39)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_40 = PyInt_FromLong(40); if (unlikely(!__pyx_int_40)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_41 = PyInt_FromLong(41); if (unlikely(!__pyx_int_41)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_42 = PyInt_FromLong(42); if (unlikely(!__pyx_int_42)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_43 = PyInt_FromLong(43); if (unlikely(!__pyx_int_43)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_44 = PyInt_FromLong(44); if (unlikely(!__pyx_int_44)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_45 = PyInt_FromLong(45); if (unlikely(!__pyx_int_45)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_46 = PyInt_FromLong(46); if (unlikely(!__pyx_int_46)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_47 = PyInt_FromLong(47); if (unlikely(!__pyx_int_47)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_48 = PyInt_FromLong(48); if (unlikely(!__pyx_int_48)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_49 = PyInt_FromLong(49); if (unlikely(!__pyx_int_49)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_50 = PyInt_FromLong(50); if (unlikely(!__pyx_int_50)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_51 = PyInt_FromLong(51); if (unlikely(!__pyx_int_51)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_52 = PyInt_FromLong(52); if (unlikely(!__pyx_int_52)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_53 = PyInt_FromLong(53); if (unlikely(!__pyx_int_53)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_54 = PyInt_FromLong(54); if (unlikely(!__pyx_int_54)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_55 = PyInt_FromLong(55); if (unlikely(!__pyx_int_55)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_56 = PyInt_FromLong(56); if (unlikely(!__pyx_int_56)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_57 = PyInt_FromLong(57); if (unlikely(!__pyx_int_57)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_58 = PyInt_FromLong(58); if (unlikely(!__pyx_int_58)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_59 = PyInt_FromLong(59); if (unlikely(!__pyx_int_59)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_60 = PyInt_FromLong(60); if (unlikely(!__pyx_int_60)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_61 = PyInt_FromLong(61); if (unlikely(!__pyx_int_61)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_62 = PyInt_FromLong(62); if (unlikely(!__pyx_int_62)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_63 = PyInt_FromLong(63); if (unlikely(!__pyx_int_63)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_64 = PyInt_FromLong(64); if (unlikely(!__pyx_int_64)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_65 = PyInt_FromLong(65); if (unlikely(!__pyx_int_65)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_66 = PyInt_FromLong(66); if (unlikely(!__pyx_int_66)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_67 = PyInt_FromLong(67); if (unlikely(!__pyx_int_67)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_68 = PyInt_FromLong(68); if (unlikely(!__pyx_int_68)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_69 = PyInt_FromLong(69); if (unlikely(!__pyx_int_69)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_70 = PyInt_FromLong(70); if (unlikely(!__pyx_int_70)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_71 = PyInt_FromLong(71); if (unlikely(!__pyx_int_71)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_72 = PyInt_FromLong(72); if (unlikely(!__pyx_int_72)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_73 = PyInt_FromLong(73); if (unlikely(!__pyx_int_73)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_74 = PyInt_FromLong(74); if (unlikely(!__pyx_int_74)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_75 = PyInt_FromLong(75); if (unlikely(!__pyx_int_75)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_76 = PyInt_FromLong(76); if (unlikely(!__pyx_int_76)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_77 = PyInt_FromLong(77); if (unlikely(!__pyx_int_77)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_78 = PyInt_FromLong(78); if (unlikely(!__pyx_int_78)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_79 = PyInt_FromLong(79); if (unlikely(!__pyx_int_79)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_80 = PyInt_FromLong(80); if (unlikely(!__pyx_int_80)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_81 = PyInt_FromLong(81); if (unlikely(!__pyx_int_81)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_82 = PyInt_FromLong(82); if (unlikely(!__pyx_int_82)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_83 = PyInt_FromLong(83); if (unlikely(!__pyx_int_83)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_84 = PyInt_FromLong(84); if (unlikely(!__pyx_int_84)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_85 = PyInt_FromLong(85); if (unlikely(!__pyx_int_85)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_86 = PyInt_FromLong(86); if (unlikely(!__pyx_int_86)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_87 = PyInt_FromLong(87); if (unlikely(!__pyx_int_87)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_88 = PyInt_FromLong(88); if (unlikely(!__pyx_int_88)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_89 = PyInt_FromLong(89); if (unlikely(!__pyx_int_89)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_90 = PyInt_FromLong(90); if (unlikely(!__pyx_int_90)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_91 = PyInt_FromLong(91); if (unlikely(!__pyx_int_91)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_92 = PyInt_FromLong(92); if (unlikely(!__pyx_int_92)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_93 = PyInt_FromLong(93); if (unlikely(!__pyx_int_93)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_94 = PyInt_FromLong(94); if (unlikely(!__pyx_int_94)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_95 = PyInt_FromLong(95); if (unlikely(!__pyx_int_95)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_96 = PyInt_FromLong(96); if (unlikely(!__pyx_int_96)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_97 = PyInt_FromLong(97); if (unlikely(!__pyx_int_97)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_98 = PyInt_FromLong(98); if (unlikely(!__pyx_int_98)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_99 = PyInt_FromLong(99); if (unlikely(!__pyx_int_99)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_100 = PyInt_FromLong(100); if (unlikely(!__pyx_int_100)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_101 = PyInt_FromLong(101); if (unlikely(!__pyx_int_101)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_102 = PyInt_FromLong(102); if (unlikely(!__pyx_int_102)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_103 = PyInt_FromLong(103); if (unlikely(!__pyx_int_103)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_104 = PyInt_FromLong(104); if (unlikely(!__pyx_int_104)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_105 = PyInt_FromLong(105); if (unlikely(!__pyx_int_105)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_106 = PyInt_FromLong(106); if (unlikely(!__pyx_int_106)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_107 = PyInt_FromLong(107); if (unlikely(!__pyx_int_107)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_108 = PyInt_FromLong(108); if (unlikely(!__pyx_int_108)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_109 = PyInt_FromLong(109); if (unlikely(!__pyx_int_109)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_110 = PyInt_FromLong(110); if (unlikely(!__pyx_int_110)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_111 = PyInt_FromLong(111); if (unlikely(!__pyx_int_111)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_112 = PyInt_FromLong(112); if (unlikely(!__pyx_int_112)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_neg_1 = PyInt_FromLong(-1); if (unlikely(!__pyx_int_neg_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  if (__Pyx_ExportFunction("get_element", (void (*)(void))__pyx_f_5rmgpy_8molecule_7element_get_element, "struct __pyx_obj_5rmgpy_8molecule_7element_Element *(PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_7element_get_element *__pyx_optional_args)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  if (PyType_Ready(&__pyx_type_5rmgpy_8molecule_7element_Element) < 0) __PYX_ERR(0, 55, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_5rmgpy_8molecule_7element_Element.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_5rmgpy_8molecule_7element_Element.tp_dictoffset && __pyx_type_5rmgpy_8molecule_7element_Element.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_5rmgpy_8molecule_7element_Element.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_5rmgpy_8molecule_7element_Element, "__str__"); if (unlikely(!wrapper)) __PYX_ERR(0, 55, __pyx_L1_error)
+    if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
+      __pyx_wrapperbase_5rmgpy_8molecule_7element_7Element_2__str__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_5rmgpy_8molecule_7element_7Element_2__str__.doc = __pyx_doc_5rmgpy_8molecule_7element_7Element_2__str__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_5rmgpy_8molecule_7element_7Element_2__str__;
+    }
+  }
+  #endif
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_5rmgpy_8molecule_7element_Element, "__repr__"); if (unlikely(!wrapper)) __PYX_ERR(0, 55, __pyx_L1_error)
+    if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
+      __pyx_wrapperbase_5rmgpy_8molecule_7element_7Element_4__repr__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_5rmgpy_8molecule_7element_7Element_4__repr__.doc = __pyx_doc_5rmgpy_8molecule_7element_7Element_4__repr__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_5rmgpy_8molecule_7element_7Element_4__repr__;
+    }
+  }
+  #endif
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Element_2, (PyObject *)&__pyx_type_5rmgpy_8molecule_7element_Element) < 0) __PYX_ERR(0, 55, __pyx_L1_error)
+  __pyx_ptype_5rmgpy_8molecule_7element_Element = &__pyx_type_5rmgpy_8molecule_7element_Element;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC initelement(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC initelement(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit_element(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit_element(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec_element(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  PyObject *__pyx_t_15 = NULL;
+  PyObject *__pyx_t_16 = NULL;
+  PyObject *__pyx_t_17 = NULL;
+  PyObject *__pyx_t_18 = NULL;
+  PyObject *__pyx_t_19 = NULL;
+  PyObject *__pyx_t_20 = NULL;
+  PyObject *__pyx_t_21 = NULL;
+  PyObject *__pyx_t_22 = NULL;
+  PyObject *__pyx_t_23 = NULL;
+  PyObject *__pyx_t_24 = NULL;
+  PyObject *__pyx_t_25 = NULL;
+  PyObject *__pyx_t_26 = NULL;
+  PyObject *__pyx_t_27 = NULL;
+  PyObject *__pyx_t_28 = NULL;
+  PyObject *__pyx_t_29 = NULL;
+  PyObject *__pyx_t_30 = NULL;
+  PyObject *__pyx_t_31 = NULL;
+  PyObject *__pyx_t_32 = NULL;
+  PyObject *__pyx_t_33 = NULL;
+  PyObject *__pyx_t_34 = NULL;
+  PyObject *__pyx_t_35 = NULL;
+  PyObject *__pyx_t_36 = NULL;
+  PyObject *__pyx_t_37 = NULL;
+  PyObject *__pyx_t_38 = NULL;
+  PyObject *__pyx_t_39 = NULL;
+  PyObject *__pyx_t_40 = NULL;
+  PyObject *__pyx_t_41 = NULL;
+  PyObject *__pyx_t_42 = NULL;
+  PyObject *__pyx_t_43 = NULL;
+  PyObject *__pyx_t_44 = NULL;
+  PyObject *__pyx_t_45 = NULL;
+  PyObject *__pyx_t_46 = NULL;
+  PyObject *__pyx_t_47 = NULL;
+  PyObject *__pyx_t_48 = NULL;
+  PyObject *__pyx_t_49 = NULL;
+  PyObject *__pyx_t_50 = NULL;
+  PyObject *__pyx_t_51 = NULL;
+  PyObject *__pyx_t_52 = NULL;
+  PyObject *__pyx_t_53 = NULL;
+  PyObject *__pyx_t_54 = NULL;
+  PyObject *__pyx_t_55 = NULL;
+  PyObject *__pyx_t_56 = NULL;
+  PyObject *__pyx_t_57 = NULL;
+  PyObject *__pyx_t_58 = NULL;
+  PyObject *__pyx_t_59 = NULL;
+  PyObject *__pyx_t_60 = NULL;
+  PyObject *__pyx_t_61 = NULL;
+  PyObject *__pyx_t_62 = NULL;
+  PyObject *__pyx_t_63 = NULL;
+  PyObject *__pyx_t_64 = NULL;
+  PyObject *__pyx_t_65 = NULL;
+  PyObject *__pyx_t_66 = NULL;
+  PyObject *__pyx_t_67 = NULL;
+  PyObject *__pyx_t_68 = NULL;
+  PyObject *__pyx_t_69 = NULL;
+  PyObject *__pyx_t_70 = NULL;
+  PyObject *__pyx_t_71 = NULL;
+  PyObject *__pyx_t_72 = NULL;
+  PyObject *__pyx_t_73 = NULL;
+  PyObject *__pyx_t_74 = NULL;
+  PyObject *__pyx_t_75 = NULL;
+  PyObject *__pyx_t_76 = NULL;
+  PyObject *__pyx_t_77 = NULL;
+  PyObject *__pyx_t_78 = NULL;
+  PyObject *__pyx_t_79 = NULL;
+  PyObject *__pyx_t_80 = NULL;
+  PyObject *__pyx_t_81 = NULL;
+  PyObject *__pyx_t_82 = NULL;
+  PyObject *__pyx_t_83 = NULL;
+  PyObject *__pyx_t_84 = NULL;
+  PyObject *__pyx_t_85 = NULL;
+  PyObject *__pyx_t_86 = NULL;
+  PyObject *__pyx_t_87 = NULL;
+  PyObject *__pyx_t_88 = NULL;
+  PyObject *__pyx_t_89 = NULL;
+  PyObject *__pyx_t_90 = NULL;
+  PyObject *__pyx_t_91 = NULL;
+  PyObject *__pyx_t_92 = NULL;
+  PyObject *__pyx_t_93 = NULL;
+  PyObject *__pyx_t_94 = NULL;
+  PyObject *__pyx_t_95 = NULL;
+  PyObject *__pyx_t_96 = NULL;
+  PyObject *__pyx_t_97 = NULL;
+  PyObject *__pyx_t_98 = NULL;
+  PyObject *__pyx_t_99 = NULL;
+  PyObject *__pyx_t_100 = NULL;
+  PyObject *__pyx_t_101 = NULL;
+  PyObject *__pyx_t_102 = NULL;
+  PyObject *__pyx_t_103 = NULL;
+  PyObject *__pyx_t_104 = NULL;
+  PyObject *__pyx_t_105 = NULL;
+  PyObject *__pyx_t_106 = NULL;
+  PyObject *__pyx_t_107 = NULL;
+  PyObject *__pyx_t_108 = NULL;
+  PyObject *__pyx_t_109 = NULL;
+  PyObject *__pyx_t_110 = NULL;
+  PyObject *__pyx_t_111 = NULL;
+  PyObject *__pyx_t_112 = NULL;
+  PyObject *__pyx_t_113 = NULL;
+  PyObject *__pyx_t_114 = NULL;
+  PyObject *__pyx_t_115 = NULL;
+  PyObject *__pyx_t_116 = NULL;
+  PyObject *__pyx_t_117 = NULL;
+  PyObject *__pyx_t_118 = NULL;
+  Py_ssize_t __pyx_t_119;
+  Py_ssize_t __pyx_t_120;
+  int __pyx_t_121;
+  int __pyx_t_122;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module 'element' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit_element(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("element", __pyx_methods, __pyx_k_This_module_defined_the_chemica, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_b);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_rmgpy__molecule__element) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name_2, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "rmgpy.molecule.element")) {
+      if (unlikely(PyDict_SetItemString(modules, "rmgpy.molecule.element", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  if (unlikely(__Pyx_modinit_function_export_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_type_import_code();
+  (void)__Pyx_modinit_variable_import_code();
+  (void)__Pyx_modinit_function_import_code();
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+
+  /* "rmgpy/molecule/element.py":45
+ * 
+ * import cython
+ * from rdkit.Chem import GetPeriodicTable             # <<<<<<<<<<<<<<
+ * 
+ * from rmgpy.exceptions import ElementError
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 45, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_GetPeriodicTable);
+  __Pyx_GIVEREF(__pyx_n_s_GetPeriodicTable);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_GetPeriodicTable);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_rdkit_Chem, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 45, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_GetPeriodicTable); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 45, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_GetPeriodicTable, __pyx_t_1) < 0) __PYX_ERR(0, 45, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "rmgpy/molecule/element.py":47
+ * from rdkit.Chem import GetPeriodicTable
+ * 
+ * from rmgpy.exceptions import ElementError             # <<<<<<<<<<<<<<
+ * from rmgpy.quantity import Quantity
+ * 
+ */
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 47, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_n_s_ElementError);
+  __Pyx_GIVEREF(__pyx_n_s_ElementError);
+  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_ElementError);
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_rmgpy_exceptions, __pyx_t_2, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 47, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_ElementError); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 47, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ElementError, __pyx_t_2) < 0) __PYX_ERR(0, 47, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":48
+ * 
+ * from rmgpy.exceptions import ElementError
+ * from rmgpy.quantity import Quantity             # <<<<<<<<<<<<<<
+ * 
+ * ################################################################################
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 48, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_Quantity);
+  __Pyx_GIVEREF(__pyx_n_s_Quantity);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_Quantity);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_rmgpy_quantity, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 48, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_Quantity); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 48, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Quantity, __pyx_t_1) < 0) __PYX_ERR(0, 48, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "rmgpy/molecule/element.py":52
+ * ################################################################################
+ * 
+ * _rdkit_periodic_table = GetPeriodicTable()             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_GetPeriodicTable); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 52, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 52, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_rdkit_periodic_table, __pyx_t_1) < 0) __PYX_ERR(0, 52, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":104
+ *         return "Element(%s, '%s', '%s', %s, %s)" % (self.number, self.symbol, self.name, self.mass, self.isotope)
+ * 
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         A helper function used when pickling an object.
+ */
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_5rmgpy_8molecule_7element_7Element_7__reduce__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Element___reduce, NULL, __pyx_n_s_rmgpy_molecule_element, __pyx_d, ((PyObject *)__pyx_codeobj__7)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 104, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element->tp_dict, __pyx_n_s_reduce, __pyx_t_1) < 0) __PYX_ERR(0, 104, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  PyType_Modified(__pyx_ptype_5rmgpy_8molecule_7element_Element);
+
+  /* "rmgpy/molecule/element.py":111
+ * 
+ * 
+ * class PeriodicSystem(object):             # <<<<<<<<<<<<<<
+ *     """
+ *     Collects hard-coded information of elements in periodic table.
+ */
+  __pyx_t_1 = __Pyx_CalculateMetaclass(NULL, __pyx_tuple__8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 111, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_Py3MetaclassPrepare(__pyx_t_1, __pyx_tuple__8, __pyx_n_s_PeriodicSystem, __pyx_n_s_PeriodicSystem, (PyObject *) NULL, __pyx_n_s_rmgpy_molecule_element, __pyx_kp_s_Collects_hard_coded_information); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 111, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+
+  /* "rmgpy/molecule/element.py":126
+ *     isotops of the same element may have slight different electronegativities, which is not reflected below
+ *     """
+ *     valences = {'H': 1, 'He': 0, 'C': 4, 'N': 3, 'O': 2, 'F': 1, 'Ne': 0,             # <<<<<<<<<<<<<<
+ *                 'Si': 4, 'S': 2, 'Cl': 1, 'Ar': 0, 'I': 1, 'X': 4}
+ *     valence_electrons = {'H': 1, 'He': 2, 'C': 4, 'N': 5, 'O': 6, 'F': 7, 'Ne': 8,
+ */
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(13); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 126, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_H, __pyx_int_1) < 0) __PYX_ERR(0, 126, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_He, __pyx_int_0) < 0) __PYX_ERR(0, 126, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_C, __pyx_int_4) < 0) __PYX_ERR(0, 126, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_N, __pyx_int_3) < 0) __PYX_ERR(0, 126, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_O, __pyx_int_2) < 0) __PYX_ERR(0, 126, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_F, __pyx_int_1) < 0) __PYX_ERR(0, 126, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_Ne, __pyx_int_0) < 0) __PYX_ERR(0, 126, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_Si, __pyx_int_4) < 0) __PYX_ERR(0, 126, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_S, __pyx_int_2) < 0) __PYX_ERR(0, 126, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_Cl, __pyx_int_1) < 0) __PYX_ERR(0, 126, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_Ar, __pyx_int_0) < 0) __PYX_ERR(0, 126, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_I, __pyx_int_1) < 0) __PYX_ERR(0, 126, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_X, __pyx_int_4) < 0) __PYX_ERR(0, 126, __pyx_L1_error)
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_valences, __pyx_t_3) < 0) __PYX_ERR(0, 126, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "rmgpy/molecule/element.py":128
+ *     valences = {'H': 1, 'He': 0, 'C': 4, 'N': 3, 'O': 2, 'F': 1, 'Ne': 0,
+ *                 'Si': 4, 'S': 2, 'Cl': 1, 'Ar': 0, 'I': 1, 'X': 4}
+ *     valence_electrons = {'H': 1, 'He': 2, 'C': 4, 'N': 5, 'O': 6, 'F': 7, 'Ne': 8,             # <<<<<<<<<<<<<<
+ *                          'Si': 4, 'S': 6, 'Cl': 7, 'Ar': 8, 'I': 7, 'X': 4}
+ *     lone_pairs = {'H': 0, 'He': 1, 'C': 0, 'N': 1, 'O': 2, 'F': 3, 'Ne': 4,
+ */
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(13); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 128, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_H, __pyx_int_1) < 0) __PYX_ERR(0, 128, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_He, __pyx_int_2) < 0) __PYX_ERR(0, 128, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_C, __pyx_int_4) < 0) __PYX_ERR(0, 128, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_N, __pyx_int_5) < 0) __PYX_ERR(0, 128, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_O, __pyx_int_6) < 0) __PYX_ERR(0, 128, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_F, __pyx_int_7) < 0) __PYX_ERR(0, 128, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_Ne, __pyx_int_8) < 0) __PYX_ERR(0, 128, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_Si, __pyx_int_4) < 0) __PYX_ERR(0, 128, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_S, __pyx_int_6) < 0) __PYX_ERR(0, 128, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_Cl, __pyx_int_7) < 0) __PYX_ERR(0, 128, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_Ar, __pyx_int_8) < 0) __PYX_ERR(0, 128, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_I, __pyx_int_7) < 0) __PYX_ERR(0, 128, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_X, __pyx_int_4) < 0) __PYX_ERR(0, 128, __pyx_L1_error)
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_valence_electrons, __pyx_t_3) < 0) __PYX_ERR(0, 128, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "rmgpy/molecule/element.py":130
+ *     valence_electrons = {'H': 1, 'He': 2, 'C': 4, 'N': 5, 'O': 6, 'F': 7, 'Ne': 8,
+ *                          'Si': 4, 'S': 6, 'Cl': 7, 'Ar': 8, 'I': 7, 'X': 4}
+ *     lone_pairs = {'H': 0, 'He': 1, 'C': 0, 'N': 1, 'O': 2, 'F': 3, 'Ne': 4,             # <<<<<<<<<<<<<<
+ *                   'Si': 0, 'S': 2, 'Cl': 3, 'Ar': 4, 'I': 3, 'X': 0}
+ *     electronegativity = {'H': 2.20, 'D': 2.20, 'T': 2.20, 'C': 2.55, 'C13': 2.55, 'N': 3.04, 'O': 3.44, 'O18': 3.44,
+ */
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(13); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 130, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_H, __pyx_int_0) < 0) __PYX_ERR(0, 130, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_He, __pyx_int_1) < 0) __PYX_ERR(0, 130, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_C, __pyx_int_0) < 0) __PYX_ERR(0, 130, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_N, __pyx_int_1) < 0) __PYX_ERR(0, 130, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_O, __pyx_int_2) < 0) __PYX_ERR(0, 130, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_F, __pyx_int_3) < 0) __PYX_ERR(0, 130, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_Ne, __pyx_int_4) < 0) __PYX_ERR(0, 130, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_Si, __pyx_int_0) < 0) __PYX_ERR(0, 130, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_S, __pyx_int_2) < 0) __PYX_ERR(0, 130, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_Cl, __pyx_int_3) < 0) __PYX_ERR(0, 130, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_Ar, __pyx_int_4) < 0) __PYX_ERR(0, 130, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_I, __pyx_int_3) < 0) __PYX_ERR(0, 130, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_X, __pyx_int_0) < 0) __PYX_ERR(0, 130, __pyx_L1_error)
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_lone_pairs, __pyx_t_3) < 0) __PYX_ERR(0, 130, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "rmgpy/molecule/element.py":132
+ *     lone_pairs = {'H': 0, 'He': 1, 'C': 0, 'N': 1, 'O': 2, 'F': 3, 'Ne': 4,
+ *                   'Si': 0, 'S': 2, 'Cl': 3, 'Ar': 4, 'I': 3, 'X': 0}
+ *     electronegativity = {'H': 2.20, 'D': 2.20, 'T': 2.20, 'C': 2.55, 'C13': 2.55, 'N': 3.04, 'O': 3.44, 'O18': 3.44,             # <<<<<<<<<<<<<<
+ *                          'F': 3.98, 'Si': 1.90, 'S': 2.58, 'Cl': 3.16, 'I': 2.66, 'X': 0.0}
+ * 
+ */
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(14); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 132, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_H, __pyx_float_2_20) < 0) __PYX_ERR(0, 132, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_D, __pyx_float_2_20) < 0) __PYX_ERR(0, 132, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_T, __pyx_float_2_20) < 0) __PYX_ERR(0, 132, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_C, __pyx_float_2_55) < 0) __PYX_ERR(0, 132, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_C13, __pyx_float_2_55) < 0) __PYX_ERR(0, 132, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_N, __pyx_float_3_04) < 0) __PYX_ERR(0, 132, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_O, __pyx_float_3_44) < 0) __PYX_ERR(0, 132, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_O18, __pyx_float_3_44) < 0) __PYX_ERR(0, 132, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_F, __pyx_float_3_98) < 0) __PYX_ERR(0, 132, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_Si, __pyx_float_1_90) < 0) __PYX_ERR(0, 132, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_S, __pyx_float_2_58) < 0) __PYX_ERR(0, 132, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_Cl, __pyx_float_3_16) < 0) __PYX_ERR(0, 132, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_I, __pyx_float_2_66) < 0) __PYX_ERR(0, 132, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_X, __pyx_float_0_0) < 0) __PYX_ERR(0, 132, __pyx_L1_error)
+  if (__Pyx_SetNameInClass(__pyx_t_2, __pyx_n_s_electronegativity, __pyx_t_3) < 0) __PYX_ERR(0, 132, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "rmgpy/molecule/element.py":111
+ * 
+ * 
+ * class PeriodicSystem(object):             # <<<<<<<<<<<<<<
+ *     """
+ *     Collects hard-coded information of elements in periodic table.
+ */
+  __pyx_t_3 = __Pyx_Py3ClassCreate(__pyx_t_1, __pyx_n_s_PeriodicSystem, __pyx_tuple__8, __pyx_t_2, NULL, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 111, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PeriodicSystem, __pyx_t_3) < 0) __PYX_ERR(0, 111, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":139
+ * 
+ * 
+ * def get_element(value, isotope=-1):             # <<<<<<<<<<<<<<
+ *     """
+ *     Return the :class:`Element` object corresponding to the given parameter
+ */
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_5rmgpy_8molecule_7element_1get_element, 0, __pyx_n_s_get_element, NULL, __pyx_n_s_rmgpy_molecule_element, __pyx_d, ((PyObject *)__pyx_codeobj__10)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 139, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_get_element, __pyx_t_1) < 0) __PYX_ERR(0, 139, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":179
+ * 
+ * # Surface site
+ * X = Element(0,    'X', 'surface_site'   , 0.0)             # <<<<<<<<<<<<<<
+ * 
+ * # Period 1
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 179, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_X, __pyx_t_1) < 0) __PYX_ERR(0, 179, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":183
+ * # Period 1
+ * # Hydrogen
+ * H  = Element(1,   'H' , 'hydrogen'      , 0.00100794)             # <<<<<<<<<<<<<<
+ * D  = Element(1,   'H' , 'deuterium'     , 0.002014101, 2, 'D')
+ * T  = Element(1,   'H' , 'tritium'       , 0.003016049, 3, 'T')
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 183, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_H, __pyx_t_1) < 0) __PYX_ERR(0, 183, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":184
+ * # Hydrogen
+ * H  = Element(1,   'H' , 'hydrogen'      , 0.00100794)
+ * D  = Element(1,   'H' , 'deuterium'     , 0.002014101, 2, 'D')             # <<<<<<<<<<<<<<
+ * T  = Element(1,   'H' , 'tritium'       , 0.003016049, 3, 'T')
+ * He = Element(2,   'He', 'helium'        , 0.004002602)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 184, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_D, __pyx_t_1) < 0) __PYX_ERR(0, 184, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":185
+ * H  = Element(1,   'H' , 'hydrogen'      , 0.00100794)
+ * D  = Element(1,   'H' , 'deuterium'     , 0.002014101, 2, 'D')
+ * T  = Element(1,   'H' , 'tritium'       , 0.003016049, 3, 'T')             # <<<<<<<<<<<<<<
+ * He = Element(2,   'He', 'helium'        , 0.004002602)
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 185, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_T, __pyx_t_1) < 0) __PYX_ERR(0, 185, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":186
+ * D  = Element(1,   'H' , 'deuterium'     , 0.002014101, 2, 'D')
+ * T  = Element(1,   'H' , 'tritium'       , 0.003016049, 3, 'T')
+ * He = Element(2,   'He', 'helium'        , 0.004002602)             # <<<<<<<<<<<<<<
+ * 
+ * # Period 2
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_He, __pyx_t_1) < 0) __PYX_ERR(0, 186, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":189
+ * 
+ * # Period 2
+ * Li = Element(3,   'Li', 'lithium'       , 0.006941)             # <<<<<<<<<<<<<<
+ * Be = Element(4,   'Be', 'beryllium'     , 0.009012182)
+ * B  = Element(5,   'B',  'boron'         , 0.010811)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__16, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 189, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Li, __pyx_t_1) < 0) __PYX_ERR(0, 189, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":190
+ * # Period 2
+ * Li = Element(3,   'Li', 'lithium'       , 0.006941)
+ * Be = Element(4,   'Be', 'beryllium'     , 0.009012182)             # <<<<<<<<<<<<<<
+ * B  = Element(5,   'B',  'boron'         , 0.010811)
+ * C  = Element(6,   'C' , 'carbon'        , 0.0120107)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__17, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 190, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Be, __pyx_t_1) < 0) __PYX_ERR(0, 190, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":191
+ * Li = Element(3,   'Li', 'lithium'       , 0.006941)
+ * Be = Element(4,   'Be', 'beryllium'     , 0.009012182)
+ * B  = Element(5,   'B',  'boron'         , 0.010811)             # <<<<<<<<<<<<<<
+ * C  = Element(6,   'C' , 'carbon'        , 0.0120107)
+ * C13= Element(6,   'C' , 'carbon-13'     , 0.0130033, 13, 'CI')
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__18, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 191, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_B, __pyx_t_1) < 0) __PYX_ERR(0, 191, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":192
+ * Be = Element(4,   'Be', 'beryllium'     , 0.009012182)
+ * B  = Element(5,   'B',  'boron'         , 0.010811)
+ * C  = Element(6,   'C' , 'carbon'        , 0.0120107)             # <<<<<<<<<<<<<<
+ * C13= Element(6,   'C' , 'carbon-13'     , 0.0130033, 13, 'CI')
+ * N  = Element(7,   'N' , 'nitrogen'      , 0.01400674)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__19, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 192, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_C, __pyx_t_1) < 0) __PYX_ERR(0, 192, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":193
+ * B  = Element(5,   'B',  'boron'         , 0.010811)
+ * C  = Element(6,   'C' , 'carbon'        , 0.0120107)
+ * C13= Element(6,   'C' , 'carbon-13'     , 0.0130033, 13, 'CI')             # <<<<<<<<<<<<<<
+ * N  = Element(7,   'N' , 'nitrogen'      , 0.01400674)
+ * O  = Element(8,   'O' , 'oxygen'        , 0.0159994)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__20, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 193, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_C13, __pyx_t_1) < 0) __PYX_ERR(0, 193, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":194
+ * C  = Element(6,   'C' , 'carbon'        , 0.0120107)
+ * C13= Element(6,   'C' , 'carbon-13'     , 0.0130033, 13, 'CI')
+ * N  = Element(7,   'N' , 'nitrogen'      , 0.01400674)             # <<<<<<<<<<<<<<
+ * O  = Element(8,   'O' , 'oxygen'        , 0.0159994)
+ * O18= Element(8,   'O' , 'oxygen-18'     , 0.0179999, 18, 'OI')
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__21, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 194, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_N, __pyx_t_1) < 0) __PYX_ERR(0, 194, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":195
+ * C13= Element(6,   'C' , 'carbon-13'     , 0.0130033, 13, 'CI')
+ * N  = Element(7,   'N' , 'nitrogen'      , 0.01400674)
+ * O  = Element(8,   'O' , 'oxygen'        , 0.0159994)             # <<<<<<<<<<<<<<
+ * O18= Element(8,   'O' , 'oxygen-18'     , 0.0179999, 18, 'OI')
+ * F  = Element(9,   'F' , 'fluorine'      , 0.018998403)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__22, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 195, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_O, __pyx_t_1) < 0) __PYX_ERR(0, 195, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":196
+ * N  = Element(7,   'N' , 'nitrogen'      , 0.01400674)
+ * O  = Element(8,   'O' , 'oxygen'        , 0.0159994)
+ * O18= Element(8,   'O' , 'oxygen-18'     , 0.0179999, 18, 'OI')             # <<<<<<<<<<<<<<
+ * F  = Element(9,   'F' , 'fluorine'      , 0.018998403)
+ * Ne = Element(10,  'Ne', 'neon'          , 0.0201797)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__23, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 196, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_O18, __pyx_t_1) < 0) __PYX_ERR(0, 196, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":197
+ * O  = Element(8,   'O' , 'oxygen'        , 0.0159994)
+ * O18= Element(8,   'O' , 'oxygen-18'     , 0.0179999, 18, 'OI')
+ * F  = Element(9,   'F' , 'fluorine'      , 0.018998403)             # <<<<<<<<<<<<<<
+ * Ne = Element(10,  'Ne', 'neon'          , 0.0201797)
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__24, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 197, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_F, __pyx_t_1) < 0) __PYX_ERR(0, 197, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":198
+ * O18= Element(8,   'O' , 'oxygen-18'     , 0.0179999, 18, 'OI')
+ * F  = Element(9,   'F' , 'fluorine'      , 0.018998403)
+ * Ne = Element(10,  'Ne', 'neon'          , 0.0201797)             # <<<<<<<<<<<<<<
+ * 
+ * # Period 3
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__25, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 198, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Ne, __pyx_t_1) < 0) __PYX_ERR(0, 198, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":201
+ * 
+ * # Period 3
+ * Na = Element(11,  'Na', 'sodium'        , 0.022989770)             # <<<<<<<<<<<<<<
+ * Mg = Element(12,  'Mg', 'magnesium'     , 0.0243050)
+ * Al = Element(13,  'Al', 'aluminium'     , 0.026981538)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__26, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 201, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Na, __pyx_t_1) < 0) __PYX_ERR(0, 201, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":202
+ * # Period 3
+ * Na = Element(11,  'Na', 'sodium'        , 0.022989770)
+ * Mg = Element(12,  'Mg', 'magnesium'     , 0.0243050)             # <<<<<<<<<<<<<<
+ * Al = Element(13,  'Al', 'aluminium'     , 0.026981538)
+ * Si = Element(14,  'Si', 'silicon'       , 0.0280855)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__27, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 202, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Mg, __pyx_t_1) < 0) __PYX_ERR(0, 202, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":203
+ * Na = Element(11,  'Na', 'sodium'        , 0.022989770)
+ * Mg = Element(12,  'Mg', 'magnesium'     , 0.0243050)
+ * Al = Element(13,  'Al', 'aluminium'     , 0.026981538)             # <<<<<<<<<<<<<<
+ * Si = Element(14,  'Si', 'silicon'       , 0.0280855)
+ * P  = Element(15,  'P' , 'phosphorus'    , 0.030973761)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__28, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 203, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Al, __pyx_t_1) < 0) __PYX_ERR(0, 203, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":204
+ * Mg = Element(12,  'Mg', 'magnesium'     , 0.0243050)
+ * Al = Element(13,  'Al', 'aluminium'     , 0.026981538)
+ * Si = Element(14,  'Si', 'silicon'       , 0.0280855)             # <<<<<<<<<<<<<<
+ * P  = Element(15,  'P' , 'phosphorus'    , 0.030973761)
+ * S  = Element(16,  'S' , 'sulfur'        , 0.032065)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__29, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 204, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Si, __pyx_t_1) < 0) __PYX_ERR(0, 204, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":205
+ * Al = Element(13,  'Al', 'aluminium'     , 0.026981538)
+ * Si = Element(14,  'Si', 'silicon'       , 0.0280855)
+ * P  = Element(15,  'P' , 'phosphorus'    , 0.030973761)             # <<<<<<<<<<<<<<
+ * S  = Element(16,  'S' , 'sulfur'        , 0.032065)
+ * Cl = Element(17,  'Cl', 'chlorine'      , 0.035453)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__30, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 205, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_P, __pyx_t_1) < 0) __PYX_ERR(0, 205, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":206
+ * Si = Element(14,  'Si', 'silicon'       , 0.0280855)
+ * P  = Element(15,  'P' , 'phosphorus'    , 0.030973761)
+ * S  = Element(16,  'S' , 'sulfur'        , 0.032065)             # <<<<<<<<<<<<<<
+ * Cl = Element(17,  'Cl', 'chlorine'      , 0.035453)
+ * Ar = Element(18,  'Ar', 'argon'         , 0.039348)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__31, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 206, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_S, __pyx_t_1) < 0) __PYX_ERR(0, 206, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":207
+ * P  = Element(15,  'P' , 'phosphorus'    , 0.030973761)
+ * S  = Element(16,  'S' , 'sulfur'        , 0.032065)
+ * Cl = Element(17,  'Cl', 'chlorine'      , 0.035453)             # <<<<<<<<<<<<<<
+ * Ar = Element(18,  'Ar', 'argon'         , 0.039348)
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__32, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 207, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Cl, __pyx_t_1) < 0) __PYX_ERR(0, 207, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":208
+ * S  = Element(16,  'S' , 'sulfur'        , 0.032065)
+ * Cl = Element(17,  'Cl', 'chlorine'      , 0.035453)
+ * Ar = Element(18,  'Ar', 'argon'         , 0.039348)             # <<<<<<<<<<<<<<
+ * 
+ * # Period 4
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__33, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 208, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Ar, __pyx_t_1) < 0) __PYX_ERR(0, 208, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":211
+ * 
+ * # Period 4
+ * K  = Element(19,  'K' , 'potassium'     , 0.0390983)             # <<<<<<<<<<<<<<
+ * Ca = Element(20,  'Ca', 'calcium'       , 0.040078)
+ * Sc = Element(21,  'Sc', 'scandium'      , 0.044955910)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__34, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 211, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_K, __pyx_t_1) < 0) __PYX_ERR(0, 211, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":212
+ * # Period 4
+ * K  = Element(19,  'K' , 'potassium'     , 0.0390983)
+ * Ca = Element(20,  'Ca', 'calcium'       , 0.040078)             # <<<<<<<<<<<<<<
+ * Sc = Element(21,  'Sc', 'scandium'      , 0.044955910)
+ * Ti = Element(22,  'Ti', 'titanium'      , 0.047867)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__35, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 212, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Ca, __pyx_t_1) < 0) __PYX_ERR(0, 212, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":213
+ * K  = Element(19,  'K' , 'potassium'     , 0.0390983)
+ * Ca = Element(20,  'Ca', 'calcium'       , 0.040078)
+ * Sc = Element(21,  'Sc', 'scandium'      , 0.044955910)             # <<<<<<<<<<<<<<
+ * Ti = Element(22,  'Ti', 'titanium'      , 0.047867)
+ * V  = Element(23,  'V' , 'vanadium'      , 0.0509415)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__36, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 213, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Sc, __pyx_t_1) < 0) __PYX_ERR(0, 213, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":214
+ * Ca = Element(20,  'Ca', 'calcium'       , 0.040078)
+ * Sc = Element(21,  'Sc', 'scandium'      , 0.044955910)
+ * Ti = Element(22,  'Ti', 'titanium'      , 0.047867)             # <<<<<<<<<<<<<<
+ * V  = Element(23,  'V' , 'vanadium'      , 0.0509415)
+ * Cr = Element(24,  'Cr', 'chromium'      , 0.0519961)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__37, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 214, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Ti, __pyx_t_1) < 0) __PYX_ERR(0, 214, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":215
+ * Sc = Element(21,  'Sc', 'scandium'      , 0.044955910)
+ * Ti = Element(22,  'Ti', 'titanium'      , 0.047867)
+ * V  = Element(23,  'V' , 'vanadium'      , 0.0509415)             # <<<<<<<<<<<<<<
+ * Cr = Element(24,  'Cr', 'chromium'      , 0.0519961)
+ * Mn = Element(25,  'Mn', 'manganese'     , 0.054938049)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__38, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 215, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_V, __pyx_t_1) < 0) __PYX_ERR(0, 215, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":216
+ * Ti = Element(22,  'Ti', 'titanium'      , 0.047867)
+ * V  = Element(23,  'V' , 'vanadium'      , 0.0509415)
+ * Cr = Element(24,  'Cr', 'chromium'      , 0.0519961)             # <<<<<<<<<<<<<<
+ * Mn = Element(25,  'Mn', 'manganese'     , 0.054938049)
+ * Fe = Element(26,  'Fe', 'iron'          , 0.055845)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__39, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 216, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Cr, __pyx_t_1) < 0) __PYX_ERR(0, 216, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":217
+ * V  = Element(23,  'V' , 'vanadium'      , 0.0509415)
+ * Cr = Element(24,  'Cr', 'chromium'      , 0.0519961)
+ * Mn = Element(25,  'Mn', 'manganese'     , 0.054938049)             # <<<<<<<<<<<<<<
+ * Fe = Element(26,  'Fe', 'iron'          , 0.055845)
+ * Co = Element(27,  'Co', 'cobalt'        , 0.058933200)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__40, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 217, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Mn, __pyx_t_1) < 0) __PYX_ERR(0, 217, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":218
+ * Cr = Element(24,  'Cr', 'chromium'      , 0.0519961)
+ * Mn = Element(25,  'Mn', 'manganese'     , 0.054938049)
+ * Fe = Element(26,  'Fe', 'iron'          , 0.055845)             # <<<<<<<<<<<<<<
+ * Co = Element(27,  'Co', 'cobalt'        , 0.058933200)
+ * Ni = Element(28,  'Ni', 'nickel'        , 0.0586934)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__41, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 218, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Fe, __pyx_t_1) < 0) __PYX_ERR(0, 218, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":219
+ * Mn = Element(25,  'Mn', 'manganese'     , 0.054938049)
+ * Fe = Element(26,  'Fe', 'iron'          , 0.055845)
+ * Co = Element(27,  'Co', 'cobalt'        , 0.058933200)             # <<<<<<<<<<<<<<
+ * Ni = Element(28,  'Ni', 'nickel'        , 0.0586934)
+ * Cu = Element(29,  'Cu', 'copper'        , 0.063546)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__42, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 219, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Co, __pyx_t_1) < 0) __PYX_ERR(0, 219, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":220
+ * Fe = Element(26,  'Fe', 'iron'          , 0.055845)
+ * Co = Element(27,  'Co', 'cobalt'        , 0.058933200)
+ * Ni = Element(28,  'Ni', 'nickel'        , 0.0586934)             # <<<<<<<<<<<<<<
+ * Cu = Element(29,  'Cu', 'copper'        , 0.063546)
+ * Zn = Element(30,  'Zn', 'zinc'          , 0.065409)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__43, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 220, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Ni, __pyx_t_1) < 0) __PYX_ERR(0, 220, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":221
+ * Co = Element(27,  'Co', 'cobalt'        , 0.058933200)
+ * Ni = Element(28,  'Ni', 'nickel'        , 0.0586934)
+ * Cu = Element(29,  'Cu', 'copper'        , 0.063546)             # <<<<<<<<<<<<<<
+ * Zn = Element(30,  'Zn', 'zinc'          , 0.065409)
+ * Ga = Element(31,  'Ga', 'gallium'       , 0.069723)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__44, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 221, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Cu, __pyx_t_1) < 0) __PYX_ERR(0, 221, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":222
+ * Ni = Element(28,  'Ni', 'nickel'        , 0.0586934)
+ * Cu = Element(29,  'Cu', 'copper'        , 0.063546)
+ * Zn = Element(30,  'Zn', 'zinc'          , 0.065409)             # <<<<<<<<<<<<<<
+ * Ga = Element(31,  'Ga', 'gallium'       , 0.069723)
+ * Ge = Element(32,  'Ge', 'germanium'     , 0.07264)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__45, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 222, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Zn, __pyx_t_1) < 0) __PYX_ERR(0, 222, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":223
+ * Cu = Element(29,  'Cu', 'copper'        , 0.063546)
+ * Zn = Element(30,  'Zn', 'zinc'          , 0.065409)
+ * Ga = Element(31,  'Ga', 'gallium'       , 0.069723)             # <<<<<<<<<<<<<<
+ * Ge = Element(32,  'Ge', 'germanium'     , 0.07264)
+ * As = Element(33,  'As', 'arsenic'       , 0.07492160)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__46, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Ga, __pyx_t_1) < 0) __PYX_ERR(0, 223, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":224
+ * Zn = Element(30,  'Zn', 'zinc'          , 0.065409)
+ * Ga = Element(31,  'Ga', 'gallium'       , 0.069723)
+ * Ge = Element(32,  'Ge', 'germanium'     , 0.07264)             # <<<<<<<<<<<<<<
+ * As = Element(33,  'As', 'arsenic'       , 0.07492160)
+ * Se = Element(34,  'Se', 'selenium'      , 0.07896)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__47, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 224, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Ge, __pyx_t_1) < 0) __PYX_ERR(0, 224, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":225
+ * Ga = Element(31,  'Ga', 'gallium'       , 0.069723)
+ * Ge = Element(32,  'Ge', 'germanium'     , 0.07264)
+ * As = Element(33,  'As', 'arsenic'       , 0.07492160)             # <<<<<<<<<<<<<<
+ * Se = Element(34,  'Se', 'selenium'      , 0.07896)
+ * Br = Element(35,  'Br', 'bromine'       , 0.079904)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__48, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 225, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_As, __pyx_t_1) < 0) __PYX_ERR(0, 225, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":226
+ * Ge = Element(32,  'Ge', 'germanium'     , 0.07264)
+ * As = Element(33,  'As', 'arsenic'       , 0.07492160)
+ * Se = Element(34,  'Se', 'selenium'      , 0.07896)             # <<<<<<<<<<<<<<
+ * Br = Element(35,  'Br', 'bromine'       , 0.079904)
+ * Kr = Element(36,  'Kr', 'krypton'       , 0.083798)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__49, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 226, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Se, __pyx_t_1) < 0) __PYX_ERR(0, 226, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":227
+ * As = Element(33,  'As', 'arsenic'       , 0.07492160)
+ * Se = Element(34,  'Se', 'selenium'      , 0.07896)
+ * Br = Element(35,  'Br', 'bromine'       , 0.079904)             # <<<<<<<<<<<<<<
+ * Kr = Element(36,  'Kr', 'krypton'       , 0.083798)
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__50, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 227, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Br, __pyx_t_1) < 0) __PYX_ERR(0, 227, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":228
+ * Se = Element(34,  'Se', 'selenium'      , 0.07896)
+ * Br = Element(35,  'Br', 'bromine'       , 0.079904)
+ * Kr = Element(36,  'Kr', 'krypton'       , 0.083798)             # <<<<<<<<<<<<<<
+ * 
+ * # Period 5
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__51, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 228, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Kr, __pyx_t_1) < 0) __PYX_ERR(0, 228, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":231
+ * 
+ * # Period 5
+ * Rb = Element(37,  'Rb', 'rubidium'      , 0.0854678)             # <<<<<<<<<<<<<<
+ * Sr = Element(38,  'Sr', 'strontium'     , 0.08762)
+ * Y  = Element(39,  'Y' , 'yttrium'       , 0.08890585)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__52, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 231, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Rb, __pyx_t_1) < 0) __PYX_ERR(0, 231, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":232
+ * # Period 5
+ * Rb = Element(37,  'Rb', 'rubidium'      , 0.0854678)
+ * Sr = Element(38,  'Sr', 'strontium'     , 0.08762)             # <<<<<<<<<<<<<<
+ * Y  = Element(39,  'Y' , 'yttrium'       , 0.08890585)
+ * Zr = Element(40,  'Zr', 'zirconium'     , 0.091224)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__53, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 232, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Sr, __pyx_t_1) < 0) __PYX_ERR(0, 232, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":233
+ * Rb = Element(37,  'Rb', 'rubidium'      , 0.0854678)
+ * Sr = Element(38,  'Sr', 'strontium'     , 0.08762)
+ * Y  = Element(39,  'Y' , 'yttrium'       , 0.08890585)             # <<<<<<<<<<<<<<
+ * Zr = Element(40,  'Zr', 'zirconium'     , 0.091224)
+ * Nb = Element(41,  'Nb', 'niobium'       , 0.09290638)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__54, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Y, __pyx_t_1) < 0) __PYX_ERR(0, 233, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":234
+ * Sr = Element(38,  'Sr', 'strontium'     , 0.08762)
+ * Y  = Element(39,  'Y' , 'yttrium'       , 0.08890585)
+ * Zr = Element(40,  'Zr', 'zirconium'     , 0.091224)             # <<<<<<<<<<<<<<
+ * Nb = Element(41,  'Nb', 'niobium'       , 0.09290638)
+ * Mo = Element(42,  'Mo', 'molybdenum'    , 0.09594)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__55, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 234, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Zr, __pyx_t_1) < 0) __PYX_ERR(0, 234, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":235
+ * Y  = Element(39,  'Y' , 'yttrium'       , 0.08890585)
+ * Zr = Element(40,  'Zr', 'zirconium'     , 0.091224)
+ * Nb = Element(41,  'Nb', 'niobium'       , 0.09290638)             # <<<<<<<<<<<<<<
+ * Mo = Element(42,  'Mo', 'molybdenum'    , 0.09594)
+ * Tc = Element(43,  'Tc', 'technetium'    , 0.098)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__56, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 235, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Nb, __pyx_t_1) < 0) __PYX_ERR(0, 235, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":236
+ * Zr = Element(40,  'Zr', 'zirconium'     , 0.091224)
+ * Nb = Element(41,  'Nb', 'niobium'       , 0.09290638)
+ * Mo = Element(42,  'Mo', 'molybdenum'    , 0.09594)             # <<<<<<<<<<<<<<
+ * Tc = Element(43,  'Tc', 'technetium'    , 0.098)
+ * Ru = Element(44,  'Ru', 'ruthenium'     , 0.10107)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__57, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 236, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Mo, __pyx_t_1) < 0) __PYX_ERR(0, 236, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":237
+ * Nb = Element(41,  'Nb', 'niobium'       , 0.09290638)
+ * Mo = Element(42,  'Mo', 'molybdenum'    , 0.09594)
+ * Tc = Element(43,  'Tc', 'technetium'    , 0.098)             # <<<<<<<<<<<<<<
+ * Ru = Element(44,  'Ru', 'ruthenium'     , 0.10107)
+ * Rh = Element(45,  'Rh', 'rhodium'       , 0.10290550)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__58, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 237, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Tc, __pyx_t_1) < 0) __PYX_ERR(0, 237, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":238
+ * Mo = Element(42,  'Mo', 'molybdenum'    , 0.09594)
+ * Tc = Element(43,  'Tc', 'technetium'    , 0.098)
+ * Ru = Element(44,  'Ru', 'ruthenium'     , 0.10107)             # <<<<<<<<<<<<<<
+ * Rh = Element(45,  'Rh', 'rhodium'       , 0.10290550)
+ * Pd = Element(46,  'Pd', 'palladium'     , 0.10642)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__59, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 238, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Ru, __pyx_t_1) < 0) __PYX_ERR(0, 238, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":239
+ * Tc = Element(43,  'Tc', 'technetium'    , 0.098)
+ * Ru = Element(44,  'Ru', 'ruthenium'     , 0.10107)
+ * Rh = Element(45,  'Rh', 'rhodium'       , 0.10290550)             # <<<<<<<<<<<<<<
+ * Pd = Element(46,  'Pd', 'palladium'     , 0.10642)
+ * Ag = Element(47,  'Ag', 'silver'        , 0.1078682)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__60, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 239, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Rh, __pyx_t_1) < 0) __PYX_ERR(0, 239, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":240
+ * Ru = Element(44,  'Ru', 'ruthenium'     , 0.10107)
+ * Rh = Element(45,  'Rh', 'rhodium'       , 0.10290550)
+ * Pd = Element(46,  'Pd', 'palladium'     , 0.10642)             # <<<<<<<<<<<<<<
+ * Ag = Element(47,  'Ag', 'silver'        , 0.1078682)
+ * Cd = Element(48,  'Cd', 'cadmium'       , 0.112411)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__61, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 240, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Pd, __pyx_t_1) < 0) __PYX_ERR(0, 240, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":241
+ * Rh = Element(45,  'Rh', 'rhodium'       , 0.10290550)
+ * Pd = Element(46,  'Pd', 'palladium'     , 0.10642)
+ * Ag = Element(47,  'Ag', 'silver'        , 0.1078682)             # <<<<<<<<<<<<<<
+ * Cd = Element(48,  'Cd', 'cadmium'       , 0.112411)
+ * In = Element(49,  'In', 'indium'        , 0.114818)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__62, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 241, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Ag, __pyx_t_1) < 0) __PYX_ERR(0, 241, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":242
+ * Pd = Element(46,  'Pd', 'palladium'     , 0.10642)
+ * Ag = Element(47,  'Ag', 'silver'        , 0.1078682)
+ * Cd = Element(48,  'Cd', 'cadmium'       , 0.112411)             # <<<<<<<<<<<<<<
+ * In = Element(49,  'In', 'indium'        , 0.114818)
+ * Sn = Element(50,  'Sn', 'tin'           , 0.118710)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__63, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 242, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Cd, __pyx_t_1) < 0) __PYX_ERR(0, 242, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":243
+ * Ag = Element(47,  'Ag', 'silver'        , 0.1078682)
+ * Cd = Element(48,  'Cd', 'cadmium'       , 0.112411)
+ * In = Element(49,  'In', 'indium'        , 0.114818)             # <<<<<<<<<<<<<<
+ * Sn = Element(50,  'Sn', 'tin'           , 0.118710)
+ * Sb = Element(51,  'Sb', 'antimony'      , 0.121760)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__64, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 243, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_In, __pyx_t_1) < 0) __PYX_ERR(0, 243, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":244
+ * Cd = Element(48,  'Cd', 'cadmium'       , 0.112411)
+ * In = Element(49,  'In', 'indium'        , 0.114818)
+ * Sn = Element(50,  'Sn', 'tin'           , 0.118710)             # <<<<<<<<<<<<<<
+ * Sb = Element(51,  'Sb', 'antimony'      , 0.121760)
+ * Te = Element(52,  'Te', 'tellurium'     , 0.12760)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__65, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 244, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Sn, __pyx_t_1) < 0) __PYX_ERR(0, 244, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":245
+ * In = Element(49,  'In', 'indium'        , 0.114818)
+ * Sn = Element(50,  'Sn', 'tin'           , 0.118710)
+ * Sb = Element(51,  'Sb', 'antimony'      , 0.121760)             # <<<<<<<<<<<<<<
+ * Te = Element(52,  'Te', 'tellurium'     , 0.12760)
+ * I  = Element(53,  'I' , 'iodine'        , 0.12690447)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__66, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 245, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Sb, __pyx_t_1) < 0) __PYX_ERR(0, 245, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":246
+ * Sn = Element(50,  'Sn', 'tin'           , 0.118710)
+ * Sb = Element(51,  'Sb', 'antimony'      , 0.121760)
+ * Te = Element(52,  'Te', 'tellurium'     , 0.12760)             # <<<<<<<<<<<<<<
+ * I  = Element(53,  'I' , 'iodine'        , 0.12690447)
+ * Xe = Element(54,  'Xe', 'xenon'         , 0.131293)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__67, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 246, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Te, __pyx_t_1) < 0) __PYX_ERR(0, 246, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":247
+ * Sb = Element(51,  'Sb', 'antimony'      , 0.121760)
+ * Te = Element(52,  'Te', 'tellurium'     , 0.12760)
+ * I  = Element(53,  'I' , 'iodine'        , 0.12690447)             # <<<<<<<<<<<<<<
+ * Xe = Element(54,  'Xe', 'xenon'         , 0.131293)
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__68, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 247, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_I, __pyx_t_1) < 0) __PYX_ERR(0, 247, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":248
+ * Te = Element(52,  'Te', 'tellurium'     , 0.12760)
+ * I  = Element(53,  'I' , 'iodine'        , 0.12690447)
+ * Xe = Element(54,  'Xe', 'xenon'         , 0.131293)             # <<<<<<<<<<<<<<
+ * 
+ * # Period 6
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__69, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 248, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Xe, __pyx_t_1) < 0) __PYX_ERR(0, 248, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":251
+ * 
+ * # Period 6
+ * Cs = Element(55,  'Cs', 'caesium'       , 0.13290545)             # <<<<<<<<<<<<<<
+ * Ba = Element(56,  'Ba', 'barium'        , 0.137327)
+ * La = Element(57,  'La', 'lanthanum'     , 0.1389055)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__70, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 251, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Cs, __pyx_t_1) < 0) __PYX_ERR(0, 251, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":252
+ * # Period 6
+ * Cs = Element(55,  'Cs', 'caesium'       , 0.13290545)
+ * Ba = Element(56,  'Ba', 'barium'        , 0.137327)             # <<<<<<<<<<<<<<
+ * La = Element(57,  'La', 'lanthanum'     , 0.1389055)
+ * Ce = Element(58,  'Ce', 'cerium'        , 0.140116)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__71, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 252, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Ba, __pyx_t_1) < 0) __PYX_ERR(0, 252, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":253
+ * Cs = Element(55,  'Cs', 'caesium'       , 0.13290545)
+ * Ba = Element(56,  'Ba', 'barium'        , 0.137327)
+ * La = Element(57,  'La', 'lanthanum'     , 0.1389055)             # <<<<<<<<<<<<<<
+ * Ce = Element(58,  'Ce', 'cerium'        , 0.140116)
+ * Pr = Element(59,  'Pr', 'praesodymium'  , 0.14090765)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__72, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 253, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_La, __pyx_t_1) < 0) __PYX_ERR(0, 253, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":254
+ * Ba = Element(56,  'Ba', 'barium'        , 0.137327)
+ * La = Element(57,  'La', 'lanthanum'     , 0.1389055)
+ * Ce = Element(58,  'Ce', 'cerium'        , 0.140116)             # <<<<<<<<<<<<<<
+ * Pr = Element(59,  'Pr', 'praesodymium'  , 0.14090765)
+ * Nd = Element(60,  'Nd', 'neodymium'     , 0.14424)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__73, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 254, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Ce, __pyx_t_1) < 0) __PYX_ERR(0, 254, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":255
+ * La = Element(57,  'La', 'lanthanum'     , 0.1389055)
+ * Ce = Element(58,  'Ce', 'cerium'        , 0.140116)
+ * Pr = Element(59,  'Pr', 'praesodymium'  , 0.14090765)             # <<<<<<<<<<<<<<
+ * Nd = Element(60,  'Nd', 'neodymium'     , 0.14424)
+ * Pm = Element(61,  'Pm', 'promethium'    , 0.145)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__74, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Pr, __pyx_t_1) < 0) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":256
+ * Ce = Element(58,  'Ce', 'cerium'        , 0.140116)
+ * Pr = Element(59,  'Pr', 'praesodymium'  , 0.14090765)
+ * Nd = Element(60,  'Nd', 'neodymium'     , 0.14424)             # <<<<<<<<<<<<<<
+ * Pm = Element(61,  'Pm', 'promethium'    , 0.145)
+ * Sm = Element(62,  'Sm', 'samarium'      , 0.15036)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__75, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 256, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Nd, __pyx_t_1) < 0) __PYX_ERR(0, 256, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":257
+ * Pr = Element(59,  'Pr', 'praesodymium'  , 0.14090765)
+ * Nd = Element(60,  'Nd', 'neodymium'     , 0.14424)
+ * Pm = Element(61,  'Pm', 'promethium'    , 0.145)             # <<<<<<<<<<<<<<
+ * Sm = Element(62,  'Sm', 'samarium'      , 0.15036)
+ * Eu = Element(63,  'Eu', 'europium'      , 0.151964)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__76, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Pm, __pyx_t_1) < 0) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":258
+ * Nd = Element(60,  'Nd', 'neodymium'     , 0.14424)
+ * Pm = Element(61,  'Pm', 'promethium'    , 0.145)
+ * Sm = Element(62,  'Sm', 'samarium'      , 0.15036)             # <<<<<<<<<<<<<<
+ * Eu = Element(63,  'Eu', 'europium'      , 0.151964)
+ * Gd = Element(64,  'Gd', 'gadolinium'    , 0.15725)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__77, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 258, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Sm, __pyx_t_1) < 0) __PYX_ERR(0, 258, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":259
+ * Pm = Element(61,  'Pm', 'promethium'    , 0.145)
+ * Sm = Element(62,  'Sm', 'samarium'      , 0.15036)
+ * Eu = Element(63,  'Eu', 'europium'      , 0.151964)             # <<<<<<<<<<<<<<
+ * Gd = Element(64,  'Gd', 'gadolinium'    , 0.15725)
+ * Tb = Element(65,  'Tb', 'terbium'       , 0.15892534)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__78, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 259, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Eu, __pyx_t_1) < 0) __PYX_ERR(0, 259, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":260
+ * Sm = Element(62,  'Sm', 'samarium'      , 0.15036)
+ * Eu = Element(63,  'Eu', 'europium'      , 0.151964)
+ * Gd = Element(64,  'Gd', 'gadolinium'    , 0.15725)             # <<<<<<<<<<<<<<
+ * Tb = Element(65,  'Tb', 'terbium'       , 0.15892534)
+ * Dy = Element(66,  'Dy', 'dysprosium'    , 0.162500)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__79, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Gd, __pyx_t_1) < 0) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":261
+ * Eu = Element(63,  'Eu', 'europium'      , 0.151964)
+ * Gd = Element(64,  'Gd', 'gadolinium'    , 0.15725)
+ * Tb = Element(65,  'Tb', 'terbium'       , 0.15892534)             # <<<<<<<<<<<<<<
+ * Dy = Element(66,  'Dy', 'dysprosium'    , 0.162500)
+ * Ho = Element(67,  'Ho', 'holmium'       , 0.16493032)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__80, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 261, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Tb, __pyx_t_1) < 0) __PYX_ERR(0, 261, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":262
+ * Gd = Element(64,  'Gd', 'gadolinium'    , 0.15725)
+ * Tb = Element(65,  'Tb', 'terbium'       , 0.15892534)
+ * Dy = Element(66,  'Dy', 'dysprosium'    , 0.162500)             # <<<<<<<<<<<<<<
+ * Ho = Element(67,  'Ho', 'holmium'       , 0.16493032)
+ * Er = Element(68,  'Er', 'erbium'        , 0.167259)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__81, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 262, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Dy, __pyx_t_1) < 0) __PYX_ERR(0, 262, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":263
+ * Tb = Element(65,  'Tb', 'terbium'       , 0.15892534)
+ * Dy = Element(66,  'Dy', 'dysprosium'    , 0.162500)
+ * Ho = Element(67,  'Ho', 'holmium'       , 0.16493032)             # <<<<<<<<<<<<<<
+ * Er = Element(68,  'Er', 'erbium'        , 0.167259)
+ * Tm = Element(69,  'Tm', 'thulium'       , 0.16893421)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__82, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 263, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Ho, __pyx_t_1) < 0) __PYX_ERR(0, 263, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":264
+ * Dy = Element(66,  'Dy', 'dysprosium'    , 0.162500)
+ * Ho = Element(67,  'Ho', 'holmium'       , 0.16493032)
+ * Er = Element(68,  'Er', 'erbium'        , 0.167259)             # <<<<<<<<<<<<<<
+ * Tm = Element(69,  'Tm', 'thulium'       , 0.16893421)
+ * Yb = Element(70,  'Yb', 'ytterbium'     , 0.17304)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__83, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 264, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Er, __pyx_t_1) < 0) __PYX_ERR(0, 264, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":265
+ * Ho = Element(67,  'Ho', 'holmium'       , 0.16493032)
+ * Er = Element(68,  'Er', 'erbium'        , 0.167259)
+ * Tm = Element(69,  'Tm', 'thulium'       , 0.16893421)             # <<<<<<<<<<<<<<
+ * Yb = Element(70,  'Yb', 'ytterbium'     , 0.17304)
+ * Lu = Element(71,  'Lu', 'lutetium'      , 0.174967)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__84, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 265, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Tm, __pyx_t_1) < 0) __PYX_ERR(0, 265, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":266
+ * Er = Element(68,  'Er', 'erbium'        , 0.167259)
+ * Tm = Element(69,  'Tm', 'thulium'       , 0.16893421)
+ * Yb = Element(70,  'Yb', 'ytterbium'     , 0.17304)             # <<<<<<<<<<<<<<
+ * Lu = Element(71,  'Lu', 'lutetium'      , 0.174967)
+ * Hf = Element(72,  'Hf', 'hafnium'       , 0.17849)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__85, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 266, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Yb, __pyx_t_1) < 0) __PYX_ERR(0, 266, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":267
+ * Tm = Element(69,  'Tm', 'thulium'       , 0.16893421)
+ * Yb = Element(70,  'Yb', 'ytterbium'     , 0.17304)
+ * Lu = Element(71,  'Lu', 'lutetium'      , 0.174967)             # <<<<<<<<<<<<<<
+ * Hf = Element(72,  'Hf', 'hafnium'       , 0.17849)
+ * Ta = Element(73,  'Ta', 'tantalum'      , 0.1809479)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__86, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 267, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Lu, __pyx_t_1) < 0) __PYX_ERR(0, 267, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":268
+ * Yb = Element(70,  'Yb', 'ytterbium'     , 0.17304)
+ * Lu = Element(71,  'Lu', 'lutetium'      , 0.174967)
+ * Hf = Element(72,  'Hf', 'hafnium'       , 0.17849)             # <<<<<<<<<<<<<<
+ * Ta = Element(73,  'Ta', 'tantalum'      , 0.1809479)
+ * W  = Element(74,  'W' , 'tungsten'      , 0.18384)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__87, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 268, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Hf, __pyx_t_1) < 0) __PYX_ERR(0, 268, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":269
+ * Lu = Element(71,  'Lu', 'lutetium'      , 0.174967)
+ * Hf = Element(72,  'Hf', 'hafnium'       , 0.17849)
+ * Ta = Element(73,  'Ta', 'tantalum'      , 0.1809479)             # <<<<<<<<<<<<<<
+ * W  = Element(74,  'W' , 'tungsten'      , 0.18384)
+ * Re = Element(75,  'Re', 'rhenium'       , 0.186207)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__88, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 269, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Ta, __pyx_t_1) < 0) __PYX_ERR(0, 269, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":270
+ * Hf = Element(72,  'Hf', 'hafnium'       , 0.17849)
+ * Ta = Element(73,  'Ta', 'tantalum'      , 0.1809479)
+ * W  = Element(74,  'W' , 'tungsten'      , 0.18384)             # <<<<<<<<<<<<<<
+ * Re = Element(75,  'Re', 'rhenium'       , 0.186207)
+ * Os = Element(76,  'Os', 'osmium'        , 0.19023)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__89, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 270, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_W, __pyx_t_1) < 0) __PYX_ERR(0, 270, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":271
+ * Ta = Element(73,  'Ta', 'tantalum'      , 0.1809479)
+ * W  = Element(74,  'W' , 'tungsten'      , 0.18384)
+ * Re = Element(75,  'Re', 'rhenium'       , 0.186207)             # <<<<<<<<<<<<<<
+ * Os = Element(76,  'Os', 'osmium'        , 0.19023)
+ * Ir = Element(77,  'Ir', 'iridium'       , 0.192217)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__90, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 271, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Re, __pyx_t_1) < 0) __PYX_ERR(0, 271, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":272
+ * W  = Element(74,  'W' , 'tungsten'      , 0.18384)
+ * Re = Element(75,  'Re', 'rhenium'       , 0.186207)
+ * Os = Element(76,  'Os', 'osmium'        , 0.19023)             # <<<<<<<<<<<<<<
+ * Ir = Element(77,  'Ir', 'iridium'       , 0.192217)
+ * Pt = Element(78,  'Pt', 'platinum'      , 0.195078)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__91, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 272, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Os, __pyx_t_1) < 0) __PYX_ERR(0, 272, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":273
+ * Re = Element(75,  'Re', 'rhenium'       , 0.186207)
+ * Os = Element(76,  'Os', 'osmium'        , 0.19023)
+ * Ir = Element(77,  'Ir', 'iridium'       , 0.192217)             # <<<<<<<<<<<<<<
+ * Pt = Element(78,  'Pt', 'platinum'      , 0.195078)
+ * Au = Element(79,  'Au', 'gold'          , 0.19696655)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__92, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 273, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Ir, __pyx_t_1) < 0) __PYX_ERR(0, 273, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":274
+ * Os = Element(76,  'Os', 'osmium'        , 0.19023)
+ * Ir = Element(77,  'Ir', 'iridium'       , 0.192217)
+ * Pt = Element(78,  'Pt', 'platinum'      , 0.195078)             # <<<<<<<<<<<<<<
+ * Au = Element(79,  'Au', 'gold'          , 0.19696655)
+ * Hg = Element(80,  'Hg', 'mercury'       , 0.20059)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__93, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 274, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Pt, __pyx_t_1) < 0) __PYX_ERR(0, 274, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":275
+ * Ir = Element(77,  'Ir', 'iridium'       , 0.192217)
+ * Pt = Element(78,  'Pt', 'platinum'      , 0.195078)
+ * Au = Element(79,  'Au', 'gold'          , 0.19696655)             # <<<<<<<<<<<<<<
+ * Hg = Element(80,  'Hg', 'mercury'       , 0.20059)
+ * Tl = Element(81,  'Tl', 'thallium'      , 0.2043833)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__94, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 275, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Au, __pyx_t_1) < 0) __PYX_ERR(0, 275, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":276
+ * Pt = Element(78,  'Pt', 'platinum'      , 0.195078)
+ * Au = Element(79,  'Au', 'gold'          , 0.19696655)
+ * Hg = Element(80,  'Hg', 'mercury'       , 0.20059)             # <<<<<<<<<<<<<<
+ * Tl = Element(81,  'Tl', 'thallium'      , 0.2043833)
+ * Pb = Element(82,  'Pb', 'lead'          , 0.2072)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__95, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 276, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Hg, __pyx_t_1) < 0) __PYX_ERR(0, 276, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":277
+ * Au = Element(79,  'Au', 'gold'          , 0.19696655)
+ * Hg = Element(80,  'Hg', 'mercury'       , 0.20059)
+ * Tl = Element(81,  'Tl', 'thallium'      , 0.2043833)             # <<<<<<<<<<<<<<
+ * Pb = Element(82,  'Pb', 'lead'          , 0.2072)
+ * Bi = Element(83,  'Bi', 'bismuth'       , 0.20898038)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__96, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 277, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Tl, __pyx_t_1) < 0) __PYX_ERR(0, 277, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":278
+ * Hg = Element(80,  'Hg', 'mercury'       , 0.20059)
+ * Tl = Element(81,  'Tl', 'thallium'      , 0.2043833)
+ * Pb = Element(82,  'Pb', 'lead'          , 0.2072)             # <<<<<<<<<<<<<<
+ * Bi = Element(83,  'Bi', 'bismuth'       , 0.20898038)
+ * Po = Element(84,  'Po', 'polonium'      , 0.209)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__97, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Pb, __pyx_t_1) < 0) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":279
+ * Tl = Element(81,  'Tl', 'thallium'      , 0.2043833)
+ * Pb = Element(82,  'Pb', 'lead'          , 0.2072)
+ * Bi = Element(83,  'Bi', 'bismuth'       , 0.20898038)             # <<<<<<<<<<<<<<
+ * Po = Element(84,  'Po', 'polonium'      , 0.209)
+ * At = Element(85,  'At', 'astatine'      , 0.210)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__98, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 279, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Bi, __pyx_t_1) < 0) __PYX_ERR(0, 279, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":280
+ * Pb = Element(82,  'Pb', 'lead'          , 0.2072)
+ * Bi = Element(83,  'Bi', 'bismuth'       , 0.20898038)
+ * Po = Element(84,  'Po', 'polonium'      , 0.209)             # <<<<<<<<<<<<<<
+ * At = Element(85,  'At', 'astatine'      , 0.210)
+ * Rn = Element(86,  'Rn', 'radon'         , 0.222)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__99, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 280, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Po, __pyx_t_1) < 0) __PYX_ERR(0, 280, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":281
+ * Bi = Element(83,  'Bi', 'bismuth'       , 0.20898038)
+ * Po = Element(84,  'Po', 'polonium'      , 0.209)
+ * At = Element(85,  'At', 'astatine'      , 0.210)             # <<<<<<<<<<<<<<
+ * Rn = Element(86,  'Rn', 'radon'         , 0.222)
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__100, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 281, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_At, __pyx_t_1) < 0) __PYX_ERR(0, 281, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":282
+ * Po = Element(84,  'Po', 'polonium'      , 0.209)
+ * At = Element(85,  'At', 'astatine'      , 0.210)
+ * Rn = Element(86,  'Rn', 'radon'         , 0.222)             # <<<<<<<<<<<<<<
+ * 
+ * # Period 7
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__101, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 282, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Rn, __pyx_t_1) < 0) __PYX_ERR(0, 282, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":285
+ * 
+ * # Period 7
+ * Fr = Element(87,  'Fr', 'francium'      , 0.223)             # <<<<<<<<<<<<<<
+ * Ra = Element(88,  'Ra', 'radium'        , 0.226)
+ * Ac = Element(89,  'Ac', 'actinum'       , 0.227)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__102, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 285, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Fr, __pyx_t_1) < 0) __PYX_ERR(0, 285, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":286
+ * # Period 7
+ * Fr = Element(87,  'Fr', 'francium'      , 0.223)
+ * Ra = Element(88,  'Ra', 'radium'        , 0.226)             # <<<<<<<<<<<<<<
+ * Ac = Element(89,  'Ac', 'actinum'       , 0.227)
+ * Th = Element(90,  'Th', 'thorium'       , 0.2320381)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__103, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 286, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Ra, __pyx_t_1) < 0) __PYX_ERR(0, 286, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":287
+ * Fr = Element(87,  'Fr', 'francium'      , 0.223)
+ * Ra = Element(88,  'Ra', 'radium'        , 0.226)
+ * Ac = Element(89,  'Ac', 'actinum'       , 0.227)             # <<<<<<<<<<<<<<
+ * Th = Element(90,  'Th', 'thorium'       , 0.2320381)
+ * Pa = Element(91,  'Pa', 'protactinum'   , 0.23103588)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__104, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 287, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Ac, __pyx_t_1) < 0) __PYX_ERR(0, 287, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":288
+ * Ra = Element(88,  'Ra', 'radium'        , 0.226)
+ * Ac = Element(89,  'Ac', 'actinum'       , 0.227)
+ * Th = Element(90,  'Th', 'thorium'       , 0.2320381)             # <<<<<<<<<<<<<<
+ * Pa = Element(91,  'Pa', 'protactinum'   , 0.23103588)
+ * U  = Element(92,  'U' , 'uranium'       , 0.23802891)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__105, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 288, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Th, __pyx_t_1) < 0) __PYX_ERR(0, 288, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":289
+ * Ac = Element(89,  'Ac', 'actinum'       , 0.227)
+ * Th = Element(90,  'Th', 'thorium'       , 0.2320381)
+ * Pa = Element(91,  'Pa', 'protactinum'   , 0.23103588)             # <<<<<<<<<<<<<<
+ * U  = Element(92,  'U' , 'uranium'       , 0.23802891)
+ * Np = Element(93,  'Np', 'neptunium'     , 0.237)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__106, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 289, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Pa, __pyx_t_1) < 0) __PYX_ERR(0, 289, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":290
+ * Th = Element(90,  'Th', 'thorium'       , 0.2320381)
+ * Pa = Element(91,  'Pa', 'protactinum'   , 0.23103588)
+ * U  = Element(92,  'U' , 'uranium'       , 0.23802891)             # <<<<<<<<<<<<<<
+ * Np = Element(93,  'Np', 'neptunium'     , 0.237)
+ * Pu = Element(94,  'Pu', 'plutonium'     , 0.244)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__107, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 290, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_U, __pyx_t_1) < 0) __PYX_ERR(0, 290, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":291
+ * Pa = Element(91,  'Pa', 'protactinum'   , 0.23103588)
+ * U  = Element(92,  'U' , 'uranium'       , 0.23802891)
+ * Np = Element(93,  'Np', 'neptunium'     , 0.237)             # <<<<<<<<<<<<<<
+ * Pu = Element(94,  'Pu', 'plutonium'     , 0.244)
+ * Am = Element(95,  'Am', 'americium'     , 0.243)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__108, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 291, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Np, __pyx_t_1) < 0) __PYX_ERR(0, 291, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":292
+ * U  = Element(92,  'U' , 'uranium'       , 0.23802891)
+ * Np = Element(93,  'Np', 'neptunium'     , 0.237)
+ * Pu = Element(94,  'Pu', 'plutonium'     , 0.244)             # <<<<<<<<<<<<<<
+ * Am = Element(95,  'Am', 'americium'     , 0.243)
+ * Cm = Element(96,  'Cm', 'curium'        , 0.247)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__109, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 292, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Pu, __pyx_t_1) < 0) __PYX_ERR(0, 292, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":293
+ * Np = Element(93,  'Np', 'neptunium'     , 0.237)
+ * Pu = Element(94,  'Pu', 'plutonium'     , 0.244)
+ * Am = Element(95,  'Am', 'americium'     , 0.243)             # <<<<<<<<<<<<<<
+ * Cm = Element(96,  'Cm', 'curium'        , 0.247)
+ * Bk = Element(97,  'Bk', 'berkelium'     , 0.247)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__110, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 293, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Am, __pyx_t_1) < 0) __PYX_ERR(0, 293, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":294
+ * Pu = Element(94,  'Pu', 'plutonium'     , 0.244)
+ * Am = Element(95,  'Am', 'americium'     , 0.243)
+ * Cm = Element(96,  'Cm', 'curium'        , 0.247)             # <<<<<<<<<<<<<<
+ * Bk = Element(97,  'Bk', 'berkelium'     , 0.247)
+ * Cf = Element(98,  'Cf', 'californium'   , 0.251)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__111, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 294, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Cm, __pyx_t_1) < 0) __PYX_ERR(0, 294, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":295
+ * Am = Element(95,  'Am', 'americium'     , 0.243)
+ * Cm = Element(96,  'Cm', 'curium'        , 0.247)
+ * Bk = Element(97,  'Bk', 'berkelium'     , 0.247)             # <<<<<<<<<<<<<<
+ * Cf = Element(98,  'Cf', 'californium'   , 0.251)
+ * Es = Element(99,  'Es', 'einsteinium'   , 0.252)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__112, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 295, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Bk, __pyx_t_1) < 0) __PYX_ERR(0, 295, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":296
+ * Cm = Element(96,  'Cm', 'curium'        , 0.247)
+ * Bk = Element(97,  'Bk', 'berkelium'     , 0.247)
+ * Cf = Element(98,  'Cf', 'californium'   , 0.251)             # <<<<<<<<<<<<<<
+ * Es = Element(99,  'Es', 'einsteinium'   , 0.252)
+ * Fm = Element(100, 'Fm', 'fermium'       , 0.257)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__113, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 296, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Cf, __pyx_t_1) < 0) __PYX_ERR(0, 296, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":297
+ * Bk = Element(97,  'Bk', 'berkelium'     , 0.247)
+ * Cf = Element(98,  'Cf', 'californium'   , 0.251)
+ * Es = Element(99,  'Es', 'einsteinium'   , 0.252)             # <<<<<<<<<<<<<<
+ * Fm = Element(100, 'Fm', 'fermium'       , 0.257)
+ * Md = Element(101, 'Md', 'mendelevium'   , 0.258)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__114, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 297, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Es, __pyx_t_1) < 0) __PYX_ERR(0, 297, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":298
+ * Cf = Element(98,  'Cf', 'californium'   , 0.251)
+ * Es = Element(99,  'Es', 'einsteinium'   , 0.252)
+ * Fm = Element(100, 'Fm', 'fermium'       , 0.257)             # <<<<<<<<<<<<<<
+ * Md = Element(101, 'Md', 'mendelevium'   , 0.258)
+ * No = Element(102, 'No', 'nobelium'      , 0.259)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__115, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 298, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Fm, __pyx_t_1) < 0) __PYX_ERR(0, 298, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":299
+ * Es = Element(99,  'Es', 'einsteinium'   , 0.252)
+ * Fm = Element(100, 'Fm', 'fermium'       , 0.257)
+ * Md = Element(101, 'Md', 'mendelevium'   , 0.258)             # <<<<<<<<<<<<<<
+ * No = Element(102, 'No', 'nobelium'      , 0.259)
+ * Lr = Element(103, 'Lr', 'lawrencium'    , 0.262)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__116, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 299, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Md, __pyx_t_1) < 0) __PYX_ERR(0, 299, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":300
+ * Fm = Element(100, 'Fm', 'fermium'       , 0.257)
+ * Md = Element(101, 'Md', 'mendelevium'   , 0.258)
+ * No = Element(102, 'No', 'nobelium'      , 0.259)             # <<<<<<<<<<<<<<
+ * Lr = Element(103, 'Lr', 'lawrencium'    , 0.262)
+ * Rf = Element(104, 'Rf', 'rutherfordium' , 0.261)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__117, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 300, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_No, __pyx_t_1) < 0) __PYX_ERR(0, 300, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":301
+ * Md = Element(101, 'Md', 'mendelevium'   , 0.258)
+ * No = Element(102, 'No', 'nobelium'      , 0.259)
+ * Lr = Element(103, 'Lr', 'lawrencium'    , 0.262)             # <<<<<<<<<<<<<<
+ * Rf = Element(104, 'Rf', 'rutherfordium' , 0.261)
+ * Db = Element(105, 'Db', 'dubnium'       , 0.262)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__118, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 301, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Lr, __pyx_t_1) < 0) __PYX_ERR(0, 301, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":302
+ * No = Element(102, 'No', 'nobelium'      , 0.259)
+ * Lr = Element(103, 'Lr', 'lawrencium'    , 0.262)
+ * Rf = Element(104, 'Rf', 'rutherfordium' , 0.261)             # <<<<<<<<<<<<<<
+ * Db = Element(105, 'Db', 'dubnium'       , 0.262)
+ * Sg = Element(106, 'Sg', 'seaborgium'    , 0.266)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__119, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 302, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Rf, __pyx_t_1) < 0) __PYX_ERR(0, 302, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":303
+ * Lr = Element(103, 'Lr', 'lawrencium'    , 0.262)
+ * Rf = Element(104, 'Rf', 'rutherfordium' , 0.261)
+ * Db = Element(105, 'Db', 'dubnium'       , 0.262)             # <<<<<<<<<<<<<<
+ * Sg = Element(106, 'Sg', 'seaborgium'    , 0.266)
+ * Bh = Element(107, 'Bh', 'bohrium'       , 0.264)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__120, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 303, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Db, __pyx_t_1) < 0) __PYX_ERR(0, 303, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":304
+ * Rf = Element(104, 'Rf', 'rutherfordium' , 0.261)
+ * Db = Element(105, 'Db', 'dubnium'       , 0.262)
+ * Sg = Element(106, 'Sg', 'seaborgium'    , 0.266)             # <<<<<<<<<<<<<<
+ * Bh = Element(107, 'Bh', 'bohrium'       , 0.264)
+ * Hs = Element(108, 'Hs', 'hassium'       , 0.277)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__121, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 304, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Sg, __pyx_t_1) < 0) __PYX_ERR(0, 304, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":305
+ * Db = Element(105, 'Db', 'dubnium'       , 0.262)
+ * Sg = Element(106, 'Sg', 'seaborgium'    , 0.266)
+ * Bh = Element(107, 'Bh', 'bohrium'       , 0.264)             # <<<<<<<<<<<<<<
+ * Hs = Element(108, 'Hs', 'hassium'       , 0.277)
+ * Mt = Element(109, 'Mt', 'meitnerium'    , 0.268)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__122, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 305, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Bh, __pyx_t_1) < 0) __PYX_ERR(0, 305, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":306
+ * Sg = Element(106, 'Sg', 'seaborgium'    , 0.266)
+ * Bh = Element(107, 'Bh', 'bohrium'       , 0.264)
+ * Hs = Element(108, 'Hs', 'hassium'       , 0.277)             # <<<<<<<<<<<<<<
+ * Mt = Element(109, 'Mt', 'meitnerium'    , 0.268)
+ * Ds = Element(110, 'Ds', 'darmstadtium'  , 0.281)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__123, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 306, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Hs, __pyx_t_1) < 0) __PYX_ERR(0, 306, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":307
+ * Bh = Element(107, 'Bh', 'bohrium'       , 0.264)
+ * Hs = Element(108, 'Hs', 'hassium'       , 0.277)
+ * Mt = Element(109, 'Mt', 'meitnerium'    , 0.268)             # <<<<<<<<<<<<<<
+ * Ds = Element(110, 'Ds', 'darmstadtium'  , 0.281)
+ * Rg = Element(111, 'Rg', 'roentgenium'   , 0.272)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__124, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 307, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Mt, __pyx_t_1) < 0) __PYX_ERR(0, 307, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":308
+ * Hs = Element(108, 'Hs', 'hassium'       , 0.277)
+ * Mt = Element(109, 'Mt', 'meitnerium'    , 0.268)
+ * Ds = Element(110, 'Ds', 'darmstadtium'  , 0.281)             # <<<<<<<<<<<<<<
+ * Rg = Element(111, 'Rg', 'roentgenium'   , 0.272)
+ * Cn = Element(112, 'Cn', 'copernicum'    , 0.285)
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__125, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 308, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Ds, __pyx_t_1) < 0) __PYX_ERR(0, 308, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":309
+ * Mt = Element(109, 'Mt', 'meitnerium'    , 0.268)
+ * Ds = Element(110, 'Ds', 'darmstadtium'  , 0.281)
+ * Rg = Element(111, 'Rg', 'roentgenium'   , 0.272)             # <<<<<<<<<<<<<<
+ * Cn = Element(112, 'Cn', 'copernicum'    , 0.285)
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__126, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 309, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Rg, __pyx_t_1) < 0) __PYX_ERR(0, 309, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":310
+ * Ds = Element(110, 'Ds', 'darmstadtium'  , 0.281)
+ * Rg = Element(111, 'Rg', 'roentgenium'   , 0.272)
+ * Cn = Element(112, 'Cn', 'copernicum'    , 0.285)             # <<<<<<<<<<<<<<
+ * 
+ * # A list of the elements, sorted by increasing atomic number
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_5rmgpy_8molecule_7element_Element), __pyx_tuple__127, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 310, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Cn, __pyx_t_1) < 0) __PYX_ERR(0, 310, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/element.py":314
+ * # A list of the elements, sorted by increasing atomic number
+ * element_list = [
+ *     X,             # <<<<<<<<<<<<<<
+ *     H, D, T, He,
+ *     Li, Be, B, C, C13, N, O, O18, F, Ne,
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_X); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 314, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+
+  /* "rmgpy/molecule/element.py":315
+ * element_list = [
+ *     X,
+ *     H, D, T, He,             # <<<<<<<<<<<<<<
+ *     Li, Be, B, C, C13, N, O, O18, F, Ne,
+ *     Na, Mg, Al, Si, P, S, Cl, Ar,
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_H); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 315, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_D); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 315, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_T); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 315, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_He); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 315, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+
+  /* "rmgpy/molecule/element.py":316
+ *     X,
+ *     H, D, T, He,
+ *     Li, Be, B, C, C13, N, O, O18, F, Ne,             # <<<<<<<<<<<<<<
+ *     Na, Mg, Al, Si, P, S, Cl, Ar,
+ *     K, Ca, Sc, Ti, V, Cr, Mn, Fe, Co, Ni, Cu, Zn, Ga, Ge, As, Se, Br, Kr,
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_Li); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_n_s_Be); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_n_s_B); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_GetModuleGlobalName(__pyx_t_9, __pyx_n_s_C); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_GetModuleGlobalName(__pyx_t_10, __pyx_n_s_C13); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __Pyx_GetModuleGlobalName(__pyx_t_11, __pyx_n_s_N); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __Pyx_GetModuleGlobalName(__pyx_t_12, __pyx_n_s_O); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __Pyx_GetModuleGlobalName(__pyx_t_13, __pyx_n_s_O18); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __Pyx_GetModuleGlobalName(__pyx_t_14, __pyx_n_s_F); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __Pyx_GetModuleGlobalName(__pyx_t_15, __pyx_n_s_Ne); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_15);
+
+  /* "rmgpy/molecule/element.py":317
+ *     H, D, T, He,
+ *     Li, Be, B, C, C13, N, O, O18, F, Ne,
+ *     Na, Mg, Al, Si, P, S, Cl, Ar,             # <<<<<<<<<<<<<<
+ *     K, Ca, Sc, Ti, V, Cr, Mn, Fe, Co, Ni, Cu, Zn, Ga, Ge, As, Se, Br, Kr,
+ *     Rb, Sr, Y, Zr, Nb, Mo, Tc, Ru, Rh, Pd, Ag, Cd, In, Sn, Sb, Te, I, Xe,
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_16, __pyx_n_s_Na); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_16);
+  __Pyx_GetModuleGlobalName(__pyx_t_17, __pyx_n_s_Mg); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_17);
+  __Pyx_GetModuleGlobalName(__pyx_t_18, __pyx_n_s_Al); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_18);
+  __Pyx_GetModuleGlobalName(__pyx_t_19, __pyx_n_s_Si); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_19);
+  __Pyx_GetModuleGlobalName(__pyx_t_20, __pyx_n_s_P); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_20);
+  __Pyx_GetModuleGlobalName(__pyx_t_21, __pyx_n_s_S); if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_21);
+  __Pyx_GetModuleGlobalName(__pyx_t_22, __pyx_n_s_Cl); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_22);
+  __Pyx_GetModuleGlobalName(__pyx_t_23, __pyx_n_s_Ar); if (unlikely(!__pyx_t_23)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_23);
+
+  /* "rmgpy/molecule/element.py":318
+ *     Li, Be, B, C, C13, N, O, O18, F, Ne,
+ *     Na, Mg, Al, Si, P, S, Cl, Ar,
+ *     K, Ca, Sc, Ti, V, Cr, Mn, Fe, Co, Ni, Cu, Zn, Ga, Ge, As, Se, Br, Kr,             # <<<<<<<<<<<<<<
+ *     Rb, Sr, Y, Zr, Nb, Mo, Tc, Ru, Rh, Pd, Ag, Cd, In, Sn, Sb, Te, I, Xe,
+ *     Cs, Ba, La, Ce, Pr, Nd, Pm, Sm, Eu, Gd, Tb, Dy, Ho, Er, Tm, Yb, Lu, Hf, Ta, W, Re, Os, Ir, Pt, Au, Hg, Tl, Pb, Bi,
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_24, __pyx_n_s_K); if (unlikely(!__pyx_t_24)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_24);
+  __Pyx_GetModuleGlobalName(__pyx_t_25, __pyx_n_s_Ca); if (unlikely(!__pyx_t_25)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_25);
+  __Pyx_GetModuleGlobalName(__pyx_t_26, __pyx_n_s_Sc); if (unlikely(!__pyx_t_26)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_26);
+  __Pyx_GetModuleGlobalName(__pyx_t_27, __pyx_n_s_Ti); if (unlikely(!__pyx_t_27)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_27);
+  __Pyx_GetModuleGlobalName(__pyx_t_28, __pyx_n_s_V); if (unlikely(!__pyx_t_28)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_28);
+  __Pyx_GetModuleGlobalName(__pyx_t_29, __pyx_n_s_Cr); if (unlikely(!__pyx_t_29)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_29);
+  __Pyx_GetModuleGlobalName(__pyx_t_30, __pyx_n_s_Mn); if (unlikely(!__pyx_t_30)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_30);
+  __Pyx_GetModuleGlobalName(__pyx_t_31, __pyx_n_s_Fe); if (unlikely(!__pyx_t_31)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_31);
+  __Pyx_GetModuleGlobalName(__pyx_t_32, __pyx_n_s_Co); if (unlikely(!__pyx_t_32)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_32);
+  __Pyx_GetModuleGlobalName(__pyx_t_33, __pyx_n_s_Ni); if (unlikely(!__pyx_t_33)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_33);
+  __Pyx_GetModuleGlobalName(__pyx_t_34, __pyx_n_s_Cu); if (unlikely(!__pyx_t_34)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_34);
+  __Pyx_GetModuleGlobalName(__pyx_t_35, __pyx_n_s_Zn); if (unlikely(!__pyx_t_35)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_35);
+  __Pyx_GetModuleGlobalName(__pyx_t_36, __pyx_n_s_Ga); if (unlikely(!__pyx_t_36)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_36);
+  __Pyx_GetModuleGlobalName(__pyx_t_37, __pyx_n_s_Ge); if (unlikely(!__pyx_t_37)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_37);
+  __Pyx_GetModuleGlobalName(__pyx_t_38, __pyx_n_s_As); if (unlikely(!__pyx_t_38)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_38);
+  __Pyx_GetModuleGlobalName(__pyx_t_39, __pyx_n_s_Se); if (unlikely(!__pyx_t_39)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_39);
+  __Pyx_GetModuleGlobalName(__pyx_t_40, __pyx_n_s_Br); if (unlikely(!__pyx_t_40)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_40);
+  __Pyx_GetModuleGlobalName(__pyx_t_41, __pyx_n_s_Kr); if (unlikely(!__pyx_t_41)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_41);
+
+  /* "rmgpy/molecule/element.py":319
+ *     Na, Mg, Al, Si, P, S, Cl, Ar,
+ *     K, Ca, Sc, Ti, V, Cr, Mn, Fe, Co, Ni, Cu, Zn, Ga, Ge, As, Se, Br, Kr,
+ *     Rb, Sr, Y, Zr, Nb, Mo, Tc, Ru, Rh, Pd, Ag, Cd, In, Sn, Sb, Te, I, Xe,             # <<<<<<<<<<<<<<
+ *     Cs, Ba, La, Ce, Pr, Nd, Pm, Sm, Eu, Gd, Tb, Dy, Ho, Er, Tm, Yb, Lu, Hf, Ta, W, Re, Os, Ir, Pt, Au, Hg, Tl, Pb, Bi,
+ *     Po, At, Rn,
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_42, __pyx_n_s_Rb); if (unlikely(!__pyx_t_42)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_42);
+  __Pyx_GetModuleGlobalName(__pyx_t_43, __pyx_n_s_Sr); if (unlikely(!__pyx_t_43)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_43);
+  __Pyx_GetModuleGlobalName(__pyx_t_44, __pyx_n_s_Y); if (unlikely(!__pyx_t_44)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_44);
+  __Pyx_GetModuleGlobalName(__pyx_t_45, __pyx_n_s_Zr); if (unlikely(!__pyx_t_45)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_45);
+  __Pyx_GetModuleGlobalName(__pyx_t_46, __pyx_n_s_Nb); if (unlikely(!__pyx_t_46)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_46);
+  __Pyx_GetModuleGlobalName(__pyx_t_47, __pyx_n_s_Mo); if (unlikely(!__pyx_t_47)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_47);
+  __Pyx_GetModuleGlobalName(__pyx_t_48, __pyx_n_s_Tc); if (unlikely(!__pyx_t_48)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_48);
+  __Pyx_GetModuleGlobalName(__pyx_t_49, __pyx_n_s_Ru); if (unlikely(!__pyx_t_49)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_49);
+  __Pyx_GetModuleGlobalName(__pyx_t_50, __pyx_n_s_Rh); if (unlikely(!__pyx_t_50)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_50);
+  __Pyx_GetModuleGlobalName(__pyx_t_51, __pyx_n_s_Pd); if (unlikely(!__pyx_t_51)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_51);
+  __Pyx_GetModuleGlobalName(__pyx_t_52, __pyx_n_s_Ag); if (unlikely(!__pyx_t_52)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_52);
+  __Pyx_GetModuleGlobalName(__pyx_t_53, __pyx_n_s_Cd); if (unlikely(!__pyx_t_53)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_53);
+  __Pyx_GetModuleGlobalName(__pyx_t_54, __pyx_n_s_In); if (unlikely(!__pyx_t_54)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_54);
+  __Pyx_GetModuleGlobalName(__pyx_t_55, __pyx_n_s_Sn); if (unlikely(!__pyx_t_55)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_55);
+  __Pyx_GetModuleGlobalName(__pyx_t_56, __pyx_n_s_Sb); if (unlikely(!__pyx_t_56)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_56);
+  __Pyx_GetModuleGlobalName(__pyx_t_57, __pyx_n_s_Te); if (unlikely(!__pyx_t_57)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_57);
+  __Pyx_GetModuleGlobalName(__pyx_t_58, __pyx_n_s_I); if (unlikely(!__pyx_t_58)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_58);
+  __Pyx_GetModuleGlobalName(__pyx_t_59, __pyx_n_s_Xe); if (unlikely(!__pyx_t_59)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_59);
+
+  /* "rmgpy/molecule/element.py":320
+ *     K, Ca, Sc, Ti, V, Cr, Mn, Fe, Co, Ni, Cu, Zn, Ga, Ge, As, Se, Br, Kr,
+ *     Rb, Sr, Y, Zr, Nb, Mo, Tc, Ru, Rh, Pd, Ag, Cd, In, Sn, Sb, Te, I, Xe,
+ *     Cs, Ba, La, Ce, Pr, Nd, Pm, Sm, Eu, Gd, Tb, Dy, Ho, Er, Tm, Yb, Lu, Hf, Ta, W, Re, Os, Ir, Pt, Au, Hg, Tl, Pb, Bi,             # <<<<<<<<<<<<<<
+ *     Po, At, Rn,
+ *     Fr, Ra, Ac, Th, Pa, U, Np, Pu, Am, Cm, Bk, Cf, Es, Fm, Md, No, Lr, Rf, Db, Sg, Bh, Hs, Mt, Ds, Rg, Cn
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_60, __pyx_n_s_Cs); if (unlikely(!__pyx_t_60)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_60);
+  __Pyx_GetModuleGlobalName(__pyx_t_61, __pyx_n_s_Ba); if (unlikely(!__pyx_t_61)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_61);
+  __Pyx_GetModuleGlobalName(__pyx_t_62, __pyx_n_s_La); if (unlikely(!__pyx_t_62)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_62);
+  __Pyx_GetModuleGlobalName(__pyx_t_63, __pyx_n_s_Ce); if (unlikely(!__pyx_t_63)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_63);
+  __Pyx_GetModuleGlobalName(__pyx_t_64, __pyx_n_s_Pr); if (unlikely(!__pyx_t_64)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_64);
+  __Pyx_GetModuleGlobalName(__pyx_t_65, __pyx_n_s_Nd); if (unlikely(!__pyx_t_65)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_65);
+  __Pyx_GetModuleGlobalName(__pyx_t_66, __pyx_n_s_Pm); if (unlikely(!__pyx_t_66)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_66);
+  __Pyx_GetModuleGlobalName(__pyx_t_67, __pyx_n_s_Sm); if (unlikely(!__pyx_t_67)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_67);
+  __Pyx_GetModuleGlobalName(__pyx_t_68, __pyx_n_s_Eu); if (unlikely(!__pyx_t_68)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_68);
+  __Pyx_GetModuleGlobalName(__pyx_t_69, __pyx_n_s_Gd); if (unlikely(!__pyx_t_69)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_69);
+  __Pyx_GetModuleGlobalName(__pyx_t_70, __pyx_n_s_Tb); if (unlikely(!__pyx_t_70)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_70);
+  __Pyx_GetModuleGlobalName(__pyx_t_71, __pyx_n_s_Dy); if (unlikely(!__pyx_t_71)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_71);
+  __Pyx_GetModuleGlobalName(__pyx_t_72, __pyx_n_s_Ho); if (unlikely(!__pyx_t_72)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_72);
+  __Pyx_GetModuleGlobalName(__pyx_t_73, __pyx_n_s_Er); if (unlikely(!__pyx_t_73)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_73);
+  __Pyx_GetModuleGlobalName(__pyx_t_74, __pyx_n_s_Tm); if (unlikely(!__pyx_t_74)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_74);
+  __Pyx_GetModuleGlobalName(__pyx_t_75, __pyx_n_s_Yb); if (unlikely(!__pyx_t_75)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_75);
+  __Pyx_GetModuleGlobalName(__pyx_t_76, __pyx_n_s_Lu); if (unlikely(!__pyx_t_76)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_76);
+  __Pyx_GetModuleGlobalName(__pyx_t_77, __pyx_n_s_Hf); if (unlikely(!__pyx_t_77)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_77);
+  __Pyx_GetModuleGlobalName(__pyx_t_78, __pyx_n_s_Ta); if (unlikely(!__pyx_t_78)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_78);
+  __Pyx_GetModuleGlobalName(__pyx_t_79, __pyx_n_s_W); if (unlikely(!__pyx_t_79)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_79);
+  __Pyx_GetModuleGlobalName(__pyx_t_80, __pyx_n_s_Re); if (unlikely(!__pyx_t_80)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_80);
+  __Pyx_GetModuleGlobalName(__pyx_t_81, __pyx_n_s_Os); if (unlikely(!__pyx_t_81)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_81);
+  __Pyx_GetModuleGlobalName(__pyx_t_82, __pyx_n_s_Ir); if (unlikely(!__pyx_t_82)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_82);
+  __Pyx_GetModuleGlobalName(__pyx_t_83, __pyx_n_s_Pt); if (unlikely(!__pyx_t_83)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_83);
+  __Pyx_GetModuleGlobalName(__pyx_t_84, __pyx_n_s_Au); if (unlikely(!__pyx_t_84)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_84);
+  __Pyx_GetModuleGlobalName(__pyx_t_85, __pyx_n_s_Hg); if (unlikely(!__pyx_t_85)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_85);
+  __Pyx_GetModuleGlobalName(__pyx_t_86, __pyx_n_s_Tl); if (unlikely(!__pyx_t_86)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_86);
+  __Pyx_GetModuleGlobalName(__pyx_t_87, __pyx_n_s_Pb); if (unlikely(!__pyx_t_87)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_87);
+  __Pyx_GetModuleGlobalName(__pyx_t_88, __pyx_n_s_Bi); if (unlikely(!__pyx_t_88)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_88);
+
+  /* "rmgpy/molecule/element.py":321
+ *     Rb, Sr, Y, Zr, Nb, Mo, Tc, Ru, Rh, Pd, Ag, Cd, In, Sn, Sb, Te, I, Xe,
+ *     Cs, Ba, La, Ce, Pr, Nd, Pm, Sm, Eu, Gd, Tb, Dy, Ho, Er, Tm, Yb, Lu, Hf, Ta, W, Re, Os, Ir, Pt, Au, Hg, Tl, Pb, Bi,
+ *     Po, At, Rn,             # <<<<<<<<<<<<<<
+ *     Fr, Ra, Ac, Th, Pa, U, Np, Pu, Am, Cm, Bk, Cf, Es, Fm, Md, No, Lr, Rf, Db, Sg, Bh, Hs, Mt, Ds, Rg, Cn
+ * ]
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_89, __pyx_n_s_Po); if (unlikely(!__pyx_t_89)) __PYX_ERR(0, 321, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_89);
+  __Pyx_GetModuleGlobalName(__pyx_t_90, __pyx_n_s_At); if (unlikely(!__pyx_t_90)) __PYX_ERR(0, 321, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_90);
+  __Pyx_GetModuleGlobalName(__pyx_t_91, __pyx_n_s_Rn); if (unlikely(!__pyx_t_91)) __PYX_ERR(0, 321, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_91);
+
+  /* "rmgpy/molecule/element.py":322
+ *     Cs, Ba, La, Ce, Pr, Nd, Pm, Sm, Eu, Gd, Tb, Dy, Ho, Er, Tm, Yb, Lu, Hf, Ta, W, Re, Os, Ir, Pt, Au, Hg, Tl, Pb, Bi,
+ *     Po, At, Rn,
+ *     Fr, Ra, Ac, Th, Pa, U, Np, Pu, Am, Cm, Bk, Cf, Es, Fm, Md, No, Lr, Rf, Db, Sg, Bh, Hs, Mt, Ds, Rg, Cn             # <<<<<<<<<<<<<<
+ * ]
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_92, __pyx_n_s_Fr); if (unlikely(!__pyx_t_92)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_92);
+  __Pyx_GetModuleGlobalName(__pyx_t_93, __pyx_n_s_Ra); if (unlikely(!__pyx_t_93)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_93);
+  __Pyx_GetModuleGlobalName(__pyx_t_94, __pyx_n_s_Ac); if (unlikely(!__pyx_t_94)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_94);
+  __Pyx_GetModuleGlobalName(__pyx_t_95, __pyx_n_s_Th); if (unlikely(!__pyx_t_95)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_95);
+  __Pyx_GetModuleGlobalName(__pyx_t_96, __pyx_n_s_Pa); if (unlikely(!__pyx_t_96)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_96);
+  __Pyx_GetModuleGlobalName(__pyx_t_97, __pyx_n_s_U); if (unlikely(!__pyx_t_97)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_97);
+  __Pyx_GetModuleGlobalName(__pyx_t_98, __pyx_n_s_Np); if (unlikely(!__pyx_t_98)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_98);
+  __Pyx_GetModuleGlobalName(__pyx_t_99, __pyx_n_s_Pu); if (unlikely(!__pyx_t_99)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_99);
+  __Pyx_GetModuleGlobalName(__pyx_t_100, __pyx_n_s_Am); if (unlikely(!__pyx_t_100)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_100);
+  __Pyx_GetModuleGlobalName(__pyx_t_101, __pyx_n_s_Cm); if (unlikely(!__pyx_t_101)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_101);
+  __Pyx_GetModuleGlobalName(__pyx_t_102, __pyx_n_s_Bk); if (unlikely(!__pyx_t_102)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_102);
+  __Pyx_GetModuleGlobalName(__pyx_t_103, __pyx_n_s_Cf); if (unlikely(!__pyx_t_103)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_103);
+  __Pyx_GetModuleGlobalName(__pyx_t_104, __pyx_n_s_Es); if (unlikely(!__pyx_t_104)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_104);
+  __Pyx_GetModuleGlobalName(__pyx_t_105, __pyx_n_s_Fm); if (unlikely(!__pyx_t_105)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_105);
+  __Pyx_GetModuleGlobalName(__pyx_t_106, __pyx_n_s_Md); if (unlikely(!__pyx_t_106)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_106);
+  __Pyx_GetModuleGlobalName(__pyx_t_107, __pyx_n_s_No); if (unlikely(!__pyx_t_107)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_107);
+  __Pyx_GetModuleGlobalName(__pyx_t_108, __pyx_n_s_Lr); if (unlikely(!__pyx_t_108)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_108);
+  __Pyx_GetModuleGlobalName(__pyx_t_109, __pyx_n_s_Rf); if (unlikely(!__pyx_t_109)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_109);
+  __Pyx_GetModuleGlobalName(__pyx_t_110, __pyx_n_s_Db); if (unlikely(!__pyx_t_110)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_110);
+  __Pyx_GetModuleGlobalName(__pyx_t_111, __pyx_n_s_Sg); if (unlikely(!__pyx_t_111)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_111);
+  __Pyx_GetModuleGlobalName(__pyx_t_112, __pyx_n_s_Bh); if (unlikely(!__pyx_t_112)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_112);
+  __Pyx_GetModuleGlobalName(__pyx_t_113, __pyx_n_s_Hs); if (unlikely(!__pyx_t_113)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_113);
+  __Pyx_GetModuleGlobalName(__pyx_t_114, __pyx_n_s_Mt); if (unlikely(!__pyx_t_114)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_114);
+  __Pyx_GetModuleGlobalName(__pyx_t_115, __pyx_n_s_Ds); if (unlikely(!__pyx_t_115)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_115);
+  __Pyx_GetModuleGlobalName(__pyx_t_116, __pyx_n_s_Rg); if (unlikely(!__pyx_t_116)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_116);
+  __Pyx_GetModuleGlobalName(__pyx_t_117, __pyx_n_s_Cn); if (unlikely(!__pyx_t_117)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_117);
+
+  /* "rmgpy/molecule/element.py":313
+ * 
+ * # A list of the elements, sorted by increasing atomic number
+ * element_list = [             # <<<<<<<<<<<<<<
+ *     X,
+ *     H, D, T, He,
+ */
+  __pyx_t_118 = PyList_New(117); if (unlikely(!__pyx_t_118)) __PYX_ERR(0, 313, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_118);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyList_SET_ITEM(__pyx_t_118, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyList_SET_ITEM(__pyx_t_118, 1, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyList_SET_ITEM(__pyx_t_118, 2, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyList_SET_ITEM(__pyx_t_118, 3, __pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyList_SET_ITEM(__pyx_t_118, 4, __pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyList_SET_ITEM(__pyx_t_118, 5, __pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyList_SET_ITEM(__pyx_t_118, 6, __pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_8);
+  PyList_SET_ITEM(__pyx_t_118, 7, __pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_9);
+  PyList_SET_ITEM(__pyx_t_118, 8, __pyx_t_9);
+  __Pyx_GIVEREF(__pyx_t_10);
+  PyList_SET_ITEM(__pyx_t_118, 9, __pyx_t_10);
+  __Pyx_GIVEREF(__pyx_t_11);
+  PyList_SET_ITEM(__pyx_t_118, 10, __pyx_t_11);
+  __Pyx_GIVEREF(__pyx_t_12);
+  PyList_SET_ITEM(__pyx_t_118, 11, __pyx_t_12);
+  __Pyx_GIVEREF(__pyx_t_13);
+  PyList_SET_ITEM(__pyx_t_118, 12, __pyx_t_13);
+  __Pyx_GIVEREF(__pyx_t_14);
+  PyList_SET_ITEM(__pyx_t_118, 13, __pyx_t_14);
+  __Pyx_GIVEREF(__pyx_t_15);
+  PyList_SET_ITEM(__pyx_t_118, 14, __pyx_t_15);
+  __Pyx_GIVEREF(__pyx_t_16);
+  PyList_SET_ITEM(__pyx_t_118, 15, __pyx_t_16);
+  __Pyx_GIVEREF(__pyx_t_17);
+  PyList_SET_ITEM(__pyx_t_118, 16, __pyx_t_17);
+  __Pyx_GIVEREF(__pyx_t_18);
+  PyList_SET_ITEM(__pyx_t_118, 17, __pyx_t_18);
+  __Pyx_GIVEREF(__pyx_t_19);
+  PyList_SET_ITEM(__pyx_t_118, 18, __pyx_t_19);
+  __Pyx_GIVEREF(__pyx_t_20);
+  PyList_SET_ITEM(__pyx_t_118, 19, __pyx_t_20);
+  __Pyx_GIVEREF(__pyx_t_21);
+  PyList_SET_ITEM(__pyx_t_118, 20, __pyx_t_21);
+  __Pyx_GIVEREF(__pyx_t_22);
+  PyList_SET_ITEM(__pyx_t_118, 21, __pyx_t_22);
+  __Pyx_GIVEREF(__pyx_t_23);
+  PyList_SET_ITEM(__pyx_t_118, 22, __pyx_t_23);
+  __Pyx_GIVEREF(__pyx_t_24);
+  PyList_SET_ITEM(__pyx_t_118, 23, __pyx_t_24);
+  __Pyx_GIVEREF(__pyx_t_25);
+  PyList_SET_ITEM(__pyx_t_118, 24, __pyx_t_25);
+  __Pyx_GIVEREF(__pyx_t_26);
+  PyList_SET_ITEM(__pyx_t_118, 25, __pyx_t_26);
+  __Pyx_GIVEREF(__pyx_t_27);
+  PyList_SET_ITEM(__pyx_t_118, 26, __pyx_t_27);
+  __Pyx_GIVEREF(__pyx_t_28);
+  PyList_SET_ITEM(__pyx_t_118, 27, __pyx_t_28);
+  __Pyx_GIVEREF(__pyx_t_29);
+  PyList_SET_ITEM(__pyx_t_118, 28, __pyx_t_29);
+  __Pyx_GIVEREF(__pyx_t_30);
+  PyList_SET_ITEM(__pyx_t_118, 29, __pyx_t_30);
+  __Pyx_GIVEREF(__pyx_t_31);
+  PyList_SET_ITEM(__pyx_t_118, 30, __pyx_t_31);
+  __Pyx_GIVEREF(__pyx_t_32);
+  PyList_SET_ITEM(__pyx_t_118, 31, __pyx_t_32);
+  __Pyx_GIVEREF(__pyx_t_33);
+  PyList_SET_ITEM(__pyx_t_118, 32, __pyx_t_33);
+  __Pyx_GIVEREF(__pyx_t_34);
+  PyList_SET_ITEM(__pyx_t_118, 33, __pyx_t_34);
+  __Pyx_GIVEREF(__pyx_t_35);
+  PyList_SET_ITEM(__pyx_t_118, 34, __pyx_t_35);
+  __Pyx_GIVEREF(__pyx_t_36);
+  PyList_SET_ITEM(__pyx_t_118, 35, __pyx_t_36);
+  __Pyx_GIVEREF(__pyx_t_37);
+  PyList_SET_ITEM(__pyx_t_118, 36, __pyx_t_37);
+  __Pyx_GIVEREF(__pyx_t_38);
+  PyList_SET_ITEM(__pyx_t_118, 37, __pyx_t_38);
+  __Pyx_GIVEREF(__pyx_t_39);
+  PyList_SET_ITEM(__pyx_t_118, 38, __pyx_t_39);
+  __Pyx_GIVEREF(__pyx_t_40);
+  PyList_SET_ITEM(__pyx_t_118, 39, __pyx_t_40);
+  __Pyx_GIVEREF(__pyx_t_41);
+  PyList_SET_ITEM(__pyx_t_118, 40, __pyx_t_41);
+  __Pyx_GIVEREF(__pyx_t_42);
+  PyList_SET_ITEM(__pyx_t_118, 41, __pyx_t_42);
+  __Pyx_GIVEREF(__pyx_t_43);
+  PyList_SET_ITEM(__pyx_t_118, 42, __pyx_t_43);
+  __Pyx_GIVEREF(__pyx_t_44);
+  PyList_SET_ITEM(__pyx_t_118, 43, __pyx_t_44);
+  __Pyx_GIVEREF(__pyx_t_45);
+  PyList_SET_ITEM(__pyx_t_118, 44, __pyx_t_45);
+  __Pyx_GIVEREF(__pyx_t_46);
+  PyList_SET_ITEM(__pyx_t_118, 45, __pyx_t_46);
+  __Pyx_GIVEREF(__pyx_t_47);
+  PyList_SET_ITEM(__pyx_t_118, 46, __pyx_t_47);
+  __Pyx_GIVEREF(__pyx_t_48);
+  PyList_SET_ITEM(__pyx_t_118, 47, __pyx_t_48);
+  __Pyx_GIVEREF(__pyx_t_49);
+  PyList_SET_ITEM(__pyx_t_118, 48, __pyx_t_49);
+  __Pyx_GIVEREF(__pyx_t_50);
+  PyList_SET_ITEM(__pyx_t_118, 49, __pyx_t_50);
+  __Pyx_GIVEREF(__pyx_t_51);
+  PyList_SET_ITEM(__pyx_t_118, 50, __pyx_t_51);
+  __Pyx_GIVEREF(__pyx_t_52);
+  PyList_SET_ITEM(__pyx_t_118, 51, __pyx_t_52);
+  __Pyx_GIVEREF(__pyx_t_53);
+  PyList_SET_ITEM(__pyx_t_118, 52, __pyx_t_53);
+  __Pyx_GIVEREF(__pyx_t_54);
+  PyList_SET_ITEM(__pyx_t_118, 53, __pyx_t_54);
+  __Pyx_GIVEREF(__pyx_t_55);
+  PyList_SET_ITEM(__pyx_t_118, 54, __pyx_t_55);
+  __Pyx_GIVEREF(__pyx_t_56);
+  PyList_SET_ITEM(__pyx_t_118, 55, __pyx_t_56);
+  __Pyx_GIVEREF(__pyx_t_57);
+  PyList_SET_ITEM(__pyx_t_118, 56, __pyx_t_57);
+  __Pyx_GIVEREF(__pyx_t_58);
+  PyList_SET_ITEM(__pyx_t_118, 57, __pyx_t_58);
+  __Pyx_GIVEREF(__pyx_t_59);
+  PyList_SET_ITEM(__pyx_t_118, 58, __pyx_t_59);
+  __Pyx_GIVEREF(__pyx_t_60);
+  PyList_SET_ITEM(__pyx_t_118, 59, __pyx_t_60);
+  __Pyx_GIVEREF(__pyx_t_61);
+  PyList_SET_ITEM(__pyx_t_118, 60, __pyx_t_61);
+  __Pyx_GIVEREF(__pyx_t_62);
+  PyList_SET_ITEM(__pyx_t_118, 61, __pyx_t_62);
+  __Pyx_GIVEREF(__pyx_t_63);
+  PyList_SET_ITEM(__pyx_t_118, 62, __pyx_t_63);
+  __Pyx_GIVEREF(__pyx_t_64);
+  PyList_SET_ITEM(__pyx_t_118, 63, __pyx_t_64);
+  __Pyx_GIVEREF(__pyx_t_65);
+  PyList_SET_ITEM(__pyx_t_118, 64, __pyx_t_65);
+  __Pyx_GIVEREF(__pyx_t_66);
+  PyList_SET_ITEM(__pyx_t_118, 65, __pyx_t_66);
+  __Pyx_GIVEREF(__pyx_t_67);
+  PyList_SET_ITEM(__pyx_t_118, 66, __pyx_t_67);
+  __Pyx_GIVEREF(__pyx_t_68);
+  PyList_SET_ITEM(__pyx_t_118, 67, __pyx_t_68);
+  __Pyx_GIVEREF(__pyx_t_69);
+  PyList_SET_ITEM(__pyx_t_118, 68, __pyx_t_69);
+  __Pyx_GIVEREF(__pyx_t_70);
+  PyList_SET_ITEM(__pyx_t_118, 69, __pyx_t_70);
+  __Pyx_GIVEREF(__pyx_t_71);
+  PyList_SET_ITEM(__pyx_t_118, 70, __pyx_t_71);
+  __Pyx_GIVEREF(__pyx_t_72);
+  PyList_SET_ITEM(__pyx_t_118, 71, __pyx_t_72);
+  __Pyx_GIVEREF(__pyx_t_73);
+  PyList_SET_ITEM(__pyx_t_118, 72, __pyx_t_73);
+  __Pyx_GIVEREF(__pyx_t_74);
+  PyList_SET_ITEM(__pyx_t_118, 73, __pyx_t_74);
+  __Pyx_GIVEREF(__pyx_t_75);
+  PyList_SET_ITEM(__pyx_t_118, 74, __pyx_t_75);
+  __Pyx_GIVEREF(__pyx_t_76);
+  PyList_SET_ITEM(__pyx_t_118, 75, __pyx_t_76);
+  __Pyx_GIVEREF(__pyx_t_77);
+  PyList_SET_ITEM(__pyx_t_118, 76, __pyx_t_77);
+  __Pyx_GIVEREF(__pyx_t_78);
+  PyList_SET_ITEM(__pyx_t_118, 77, __pyx_t_78);
+  __Pyx_GIVEREF(__pyx_t_79);
+  PyList_SET_ITEM(__pyx_t_118, 78, __pyx_t_79);
+  __Pyx_GIVEREF(__pyx_t_80);
+  PyList_SET_ITEM(__pyx_t_118, 79, __pyx_t_80);
+  __Pyx_GIVEREF(__pyx_t_81);
+  PyList_SET_ITEM(__pyx_t_118, 80, __pyx_t_81);
+  __Pyx_GIVEREF(__pyx_t_82);
+  PyList_SET_ITEM(__pyx_t_118, 81, __pyx_t_82);
+  __Pyx_GIVEREF(__pyx_t_83);
+  PyList_SET_ITEM(__pyx_t_118, 82, __pyx_t_83);
+  __Pyx_GIVEREF(__pyx_t_84);
+  PyList_SET_ITEM(__pyx_t_118, 83, __pyx_t_84);
+  __Pyx_GIVEREF(__pyx_t_85);
+  PyList_SET_ITEM(__pyx_t_118, 84, __pyx_t_85);
+  __Pyx_GIVEREF(__pyx_t_86);
+  PyList_SET_ITEM(__pyx_t_118, 85, __pyx_t_86);
+  __Pyx_GIVEREF(__pyx_t_87);
+  PyList_SET_ITEM(__pyx_t_118, 86, __pyx_t_87);
+  __Pyx_GIVEREF(__pyx_t_88);
+  PyList_SET_ITEM(__pyx_t_118, 87, __pyx_t_88);
+  __Pyx_GIVEREF(__pyx_t_89);
+  PyList_SET_ITEM(__pyx_t_118, 88, __pyx_t_89);
+  __Pyx_GIVEREF(__pyx_t_90);
+  PyList_SET_ITEM(__pyx_t_118, 89, __pyx_t_90);
+  __Pyx_GIVEREF(__pyx_t_91);
+  PyList_SET_ITEM(__pyx_t_118, 90, __pyx_t_91);
+  __Pyx_GIVEREF(__pyx_t_92);
+  PyList_SET_ITEM(__pyx_t_118, 91, __pyx_t_92);
+  __Pyx_GIVEREF(__pyx_t_93);
+  PyList_SET_ITEM(__pyx_t_118, 92, __pyx_t_93);
+  __Pyx_GIVEREF(__pyx_t_94);
+  PyList_SET_ITEM(__pyx_t_118, 93, __pyx_t_94);
+  __Pyx_GIVEREF(__pyx_t_95);
+  PyList_SET_ITEM(__pyx_t_118, 94, __pyx_t_95);
+  __Pyx_GIVEREF(__pyx_t_96);
+  PyList_SET_ITEM(__pyx_t_118, 95, __pyx_t_96);
+  __Pyx_GIVEREF(__pyx_t_97);
+  PyList_SET_ITEM(__pyx_t_118, 96, __pyx_t_97);
+  __Pyx_GIVEREF(__pyx_t_98);
+  PyList_SET_ITEM(__pyx_t_118, 97, __pyx_t_98);
+  __Pyx_GIVEREF(__pyx_t_99);
+  PyList_SET_ITEM(__pyx_t_118, 98, __pyx_t_99);
+  __Pyx_GIVEREF(__pyx_t_100);
+  PyList_SET_ITEM(__pyx_t_118, 99, __pyx_t_100);
+  __Pyx_GIVEREF(__pyx_t_101);
+  PyList_SET_ITEM(__pyx_t_118, 100, __pyx_t_101);
+  __Pyx_GIVEREF(__pyx_t_102);
+  PyList_SET_ITEM(__pyx_t_118, 101, __pyx_t_102);
+  __Pyx_GIVEREF(__pyx_t_103);
+  PyList_SET_ITEM(__pyx_t_118, 102, __pyx_t_103);
+  __Pyx_GIVEREF(__pyx_t_104);
+  PyList_SET_ITEM(__pyx_t_118, 103, __pyx_t_104);
+  __Pyx_GIVEREF(__pyx_t_105);
+  PyList_SET_ITEM(__pyx_t_118, 104, __pyx_t_105);
+  __Pyx_GIVEREF(__pyx_t_106);
+  PyList_SET_ITEM(__pyx_t_118, 105, __pyx_t_106);
+  __Pyx_GIVEREF(__pyx_t_107);
+  PyList_SET_ITEM(__pyx_t_118, 106, __pyx_t_107);
+  __Pyx_GIVEREF(__pyx_t_108);
+  PyList_SET_ITEM(__pyx_t_118, 107, __pyx_t_108);
+  __Pyx_GIVEREF(__pyx_t_109);
+  PyList_SET_ITEM(__pyx_t_118, 108, __pyx_t_109);
+  __Pyx_GIVEREF(__pyx_t_110);
+  PyList_SET_ITEM(__pyx_t_118, 109, __pyx_t_110);
+  __Pyx_GIVEREF(__pyx_t_111);
+  PyList_SET_ITEM(__pyx_t_118, 110, __pyx_t_111);
+  __Pyx_GIVEREF(__pyx_t_112);
+  PyList_SET_ITEM(__pyx_t_118, 111, __pyx_t_112);
+  __Pyx_GIVEREF(__pyx_t_113);
+  PyList_SET_ITEM(__pyx_t_118, 112, __pyx_t_113);
+  __Pyx_GIVEREF(__pyx_t_114);
+  PyList_SET_ITEM(__pyx_t_118, 113, __pyx_t_114);
+  __Pyx_GIVEREF(__pyx_t_115);
+  PyList_SET_ITEM(__pyx_t_118, 114, __pyx_t_115);
+  __Pyx_GIVEREF(__pyx_t_116);
+  PyList_SET_ITEM(__pyx_t_118, 115, __pyx_t_116);
+  __Pyx_GIVEREF(__pyx_t_117);
+  PyList_SET_ITEM(__pyx_t_118, 116, __pyx_t_117);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_4 = 0;
+  __pyx_t_5 = 0;
+  __pyx_t_6 = 0;
+  __pyx_t_7 = 0;
+  __pyx_t_8 = 0;
+  __pyx_t_9 = 0;
+  __pyx_t_10 = 0;
+  __pyx_t_11 = 0;
+  __pyx_t_12 = 0;
+  __pyx_t_13 = 0;
+  __pyx_t_14 = 0;
+  __pyx_t_15 = 0;
+  __pyx_t_16 = 0;
+  __pyx_t_17 = 0;
+  __pyx_t_18 = 0;
+  __pyx_t_19 = 0;
+  __pyx_t_20 = 0;
+  __pyx_t_21 = 0;
+  __pyx_t_22 = 0;
+  __pyx_t_23 = 0;
+  __pyx_t_24 = 0;
+  __pyx_t_25 = 0;
+  __pyx_t_26 = 0;
+  __pyx_t_27 = 0;
+  __pyx_t_28 = 0;
+  __pyx_t_29 = 0;
+  __pyx_t_30 = 0;
+  __pyx_t_31 = 0;
+  __pyx_t_32 = 0;
+  __pyx_t_33 = 0;
+  __pyx_t_34 = 0;
+  __pyx_t_35 = 0;
+  __pyx_t_36 = 0;
+  __pyx_t_37 = 0;
+  __pyx_t_38 = 0;
+  __pyx_t_39 = 0;
+  __pyx_t_40 = 0;
+  __pyx_t_41 = 0;
+  __pyx_t_42 = 0;
+  __pyx_t_43 = 0;
+  __pyx_t_44 = 0;
+  __pyx_t_45 = 0;
+  __pyx_t_46 = 0;
+  __pyx_t_47 = 0;
+  __pyx_t_48 = 0;
+  __pyx_t_49 = 0;
+  __pyx_t_50 = 0;
+  __pyx_t_51 = 0;
+  __pyx_t_52 = 0;
+  __pyx_t_53 = 0;
+  __pyx_t_54 = 0;
+  __pyx_t_55 = 0;
+  __pyx_t_56 = 0;
+  __pyx_t_57 = 0;
+  __pyx_t_58 = 0;
+  __pyx_t_59 = 0;
+  __pyx_t_60 = 0;
+  __pyx_t_61 = 0;
+  __pyx_t_62 = 0;
+  __pyx_t_63 = 0;
+  __pyx_t_64 = 0;
+  __pyx_t_65 = 0;
+  __pyx_t_66 = 0;
+  __pyx_t_67 = 0;
+  __pyx_t_68 = 0;
+  __pyx_t_69 = 0;
+  __pyx_t_70 = 0;
+  __pyx_t_71 = 0;
+  __pyx_t_72 = 0;
+  __pyx_t_73 = 0;
+  __pyx_t_74 = 0;
+  __pyx_t_75 = 0;
+  __pyx_t_76 = 0;
+  __pyx_t_77 = 0;
+  __pyx_t_78 = 0;
+  __pyx_t_79 = 0;
+  __pyx_t_80 = 0;
+  __pyx_t_81 = 0;
+  __pyx_t_82 = 0;
+  __pyx_t_83 = 0;
+  __pyx_t_84 = 0;
+  __pyx_t_85 = 0;
+  __pyx_t_86 = 0;
+  __pyx_t_87 = 0;
+  __pyx_t_88 = 0;
+  __pyx_t_89 = 0;
+  __pyx_t_90 = 0;
+  __pyx_t_91 = 0;
+  __pyx_t_92 = 0;
+  __pyx_t_93 = 0;
+  __pyx_t_94 = 0;
+  __pyx_t_95 = 0;
+  __pyx_t_96 = 0;
+  __pyx_t_97 = 0;
+  __pyx_t_98 = 0;
+  __pyx_t_99 = 0;
+  __pyx_t_100 = 0;
+  __pyx_t_101 = 0;
+  __pyx_t_102 = 0;
+  __pyx_t_103 = 0;
+  __pyx_t_104 = 0;
+  __pyx_t_105 = 0;
+  __pyx_t_106 = 0;
+  __pyx_t_107 = 0;
+  __pyx_t_108 = 0;
+  __pyx_t_109 = 0;
+  __pyx_t_110 = 0;
+  __pyx_t_111 = 0;
+  __pyx_t_112 = 0;
+  __pyx_t_113 = 0;
+  __pyx_t_114 = 0;
+  __pyx_t_115 = 0;
+  __pyx_t_116 = 0;
+  __pyx_t_117 = 0;
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_element_list, __pyx_t_118) < 0) __PYX_ERR(0, 313, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_118); __pyx_t_118 = 0;
+
+  /* "rmgpy/molecule/element.py":333
+ * # if a sourced value becomes available
+ * # (C,C,2.5) is C#C - (CbenzeneC - C-C)
+ * bde_elements = ['C', 'N', 'H', 'O', 'S', 'Cl', 'Si']  # elements supported by BDE             # <<<<<<<<<<<<<<
+ * bde_dict = {('H', 'H', 1.0): (432.0, 'kJ/mol'), ('H', 'C', 1): (411.0, 'kJ/mol'),
+ *             ('H', 'N', 1): (386.0, 'kJ/mol'), ('H', 'O', 1.0): (459.0, 'kJ/mol'),
+ */
+  __pyx_t_118 = PyList_New(7); if (unlikely(!__pyx_t_118)) __PYX_ERR(0, 333, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_118);
+  __Pyx_INCREF(__pyx_n_u_C);
+  __Pyx_GIVEREF(__pyx_n_u_C);
+  PyList_SET_ITEM(__pyx_t_118, 0, __pyx_n_u_C);
+  __Pyx_INCREF(__pyx_n_u_N);
+  __Pyx_GIVEREF(__pyx_n_u_N);
+  PyList_SET_ITEM(__pyx_t_118, 1, __pyx_n_u_N);
+  __Pyx_INCREF(__pyx_n_u_H);
+  __Pyx_GIVEREF(__pyx_n_u_H);
+  PyList_SET_ITEM(__pyx_t_118, 2, __pyx_n_u_H);
+  __Pyx_INCREF(__pyx_n_u_O);
+  __Pyx_GIVEREF(__pyx_n_u_O);
+  PyList_SET_ITEM(__pyx_t_118, 3, __pyx_n_u_O);
+  __Pyx_INCREF(__pyx_n_u_S);
+  __Pyx_GIVEREF(__pyx_n_u_S);
+  PyList_SET_ITEM(__pyx_t_118, 4, __pyx_n_u_S);
+  __Pyx_INCREF(__pyx_n_u_Cl);
+  __Pyx_GIVEREF(__pyx_n_u_Cl);
+  PyList_SET_ITEM(__pyx_t_118, 5, __pyx_n_u_Cl);
+  __Pyx_INCREF(__pyx_n_u_Si);
+  __Pyx_GIVEREF(__pyx_n_u_Si);
+  PyList_SET_ITEM(__pyx_t_118, 6, __pyx_n_u_Si);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_bde_elements, __pyx_t_118) < 0) __PYX_ERR(0, 333, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_118); __pyx_t_118 = 0;
+
+  /* "rmgpy/molecule/element.py":334
+ * # (C,C,2.5) is C#C - (CbenzeneC - C-C)
+ * bde_elements = ['C', 'N', 'H', 'O', 'S', 'Cl', 'Si']  # elements supported by BDE
+ * bde_dict = {('H', 'H', 1.0): (432.0, 'kJ/mol'), ('H', 'C', 1): (411.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('H', 'N', 1): (386.0, 'kJ/mol'), ('H', 'O', 1.0): (459.0, 'kJ/mol'),
+ *             ('H', 'S', 1): (363.0, 'kJ/mol'), ('H', 'Cl', 1): (428.0, 'kJ/mol'),
+ */
+  __pyx_t_118 = __Pyx_PyDict_NewPresized(40); if (unlikely(!__pyx_t_118)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_118);
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__128, __pyx_tuple__129) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__130, __pyx_tuple__131) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+
+  /* "rmgpy/molecule/element.py":335
+ * bde_elements = ['C', 'N', 'H', 'O', 'S', 'Cl', 'Si']  # elements supported by BDE
+ * bde_dict = {('H', 'H', 1.0): (432.0, 'kJ/mol'), ('H', 'C', 1): (411.0, 'kJ/mol'),
+ *             ('H', 'N', 1): (386.0, 'kJ/mol'), ('H', 'O', 1.0): (459.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('H', 'S', 1): (363.0, 'kJ/mol'), ('H', 'Cl', 1): (428.0, 'kJ/mol'),
+ *             ('C', 'C', 1): (346.0, 'kJ/mol'), ('C', 'C', 2): (602.0, 'kJ/mol'),
+ */
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__132, __pyx_tuple__133) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__134, __pyx_tuple__135) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+
+  /* "rmgpy/molecule/element.py":336
+ * bde_dict = {('H', 'H', 1.0): (432.0, 'kJ/mol'), ('H', 'C', 1): (411.0, 'kJ/mol'),
+ *             ('H', 'N', 1): (386.0, 'kJ/mol'), ('H', 'O', 1.0): (459.0, 'kJ/mol'),
+ *             ('H', 'S', 1): (363.0, 'kJ/mol'), ('H', 'Cl', 1): (428.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('C', 'C', 1): (346.0, 'kJ/mol'), ('C', 'C', 2): (602.0, 'kJ/mol'),
+ *             ('C', 'C', 3): (835.0, 'kJ/mol'), ('C', 'Si', 1): (318.0, 'kJ/mol'),
+ */
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__136, __pyx_tuple__137) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__138, __pyx_tuple__139) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+
+  /* "rmgpy/molecule/element.py":337
+ *             ('H', 'N', 1): (386.0, 'kJ/mol'), ('H', 'O', 1.0): (459.0, 'kJ/mol'),
+ *             ('H', 'S', 1): (363.0, 'kJ/mol'), ('H', 'Cl', 1): (428.0, 'kJ/mol'),
+ *             ('C', 'C', 1): (346.0, 'kJ/mol'), ('C', 'C', 2): (602.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('C', 'C', 3): (835.0, 'kJ/mol'), ('C', 'Si', 1): (318.0, 'kJ/mol'),
+ *             ('C', 'N', 1): (305.0, 'kJ/mol'), ('C', 'N', 2): (615.0, 'kJ/mol'),
+ */
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__140, __pyx_tuple__141) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__142, __pyx_tuple__143) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+
+  /* "rmgpy/molecule/element.py":338
+ *             ('H', 'S', 1): (363.0, 'kJ/mol'), ('H', 'Cl', 1): (428.0, 'kJ/mol'),
+ *             ('C', 'C', 1): (346.0, 'kJ/mol'), ('C', 'C', 2): (602.0, 'kJ/mol'),
+ *             ('C', 'C', 3): (835.0, 'kJ/mol'), ('C', 'Si', 1): (318.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('C', 'N', 1): (305.0, 'kJ/mol'), ('C', 'N', 2): (615.0, 'kJ/mol'),
+ *             ('C', 'N', 3): (887.0, 'kJ/mol'), ('C', 'O', 1): (358.0, 'kJ/mol'),
+ */
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__144, __pyx_tuple__145) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__146, __pyx_tuple__147) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+
+  /* "rmgpy/molecule/element.py":339
+ *             ('C', 'C', 1): (346.0, 'kJ/mol'), ('C', 'C', 2): (602.0, 'kJ/mol'),
+ *             ('C', 'C', 3): (835.0, 'kJ/mol'), ('C', 'Si', 1): (318.0, 'kJ/mol'),
+ *             ('C', 'N', 1): (305.0, 'kJ/mol'), ('C', 'N', 2): (615.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('C', 'N', 3): (887.0, 'kJ/mol'), ('C', 'O', 1): (358.0, 'kJ/mol'),
+ *             ('C', 'O', 2): (799.0, 'kJ/mol'), ('C', 'O', 3): (1072.0, 'kJ/mol'),
+ */
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__148, __pyx_tuple__149) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__150, __pyx_tuple__151) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+
+  /* "rmgpy/molecule/element.py":340
+ *             ('C', 'C', 3): (835.0, 'kJ/mol'), ('C', 'Si', 1): (318.0, 'kJ/mol'),
+ *             ('C', 'N', 1): (305.0, 'kJ/mol'), ('C', 'N', 2): (615.0, 'kJ/mol'),
+ *             ('C', 'N', 3): (887.0, 'kJ/mol'), ('C', 'O', 1): (358.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('C', 'O', 2): (799.0, 'kJ/mol'), ('C', 'O', 3): (1072.0, 'kJ/mol'),
+ *             ('C', 'S', 1): (272.0, 'kJ/mol'), ('C', 'S', 2): (573.0, 'kJ/mol'),
+ */
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__152, __pyx_tuple__153) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__154, __pyx_tuple__155) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+
+  /* "rmgpy/molecule/element.py":341
+ *             ('C', 'N', 1): (305.0, 'kJ/mol'), ('C', 'N', 2): (615.0, 'kJ/mol'),
+ *             ('C', 'N', 3): (887.0, 'kJ/mol'), ('C', 'O', 1): (358.0, 'kJ/mol'),
+ *             ('C', 'O', 2): (799.0, 'kJ/mol'), ('C', 'O', 3): (1072.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('C', 'S', 1): (272.0, 'kJ/mol'), ('C', 'S', 2): (573.0, 'kJ/mol'),
+ *             ('C', 'Cl', 1): (327.0, 'kJ/mol'), ('Si', 'Si', 1): (222.0, 'kJ/mol'),
+ */
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__156, __pyx_tuple__157) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__158, __pyx_tuple__159) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+
+  /* "rmgpy/molecule/element.py":342
+ *             ('C', 'N', 3): (887.0, 'kJ/mol'), ('C', 'O', 1): (358.0, 'kJ/mol'),
+ *             ('C', 'O', 2): (799.0, 'kJ/mol'), ('C', 'O', 3): (1072.0, 'kJ/mol'),
+ *             ('C', 'S', 1): (272.0, 'kJ/mol'), ('C', 'S', 2): (573.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('C', 'Cl', 1): (327.0, 'kJ/mol'), ('Si', 'Si', 1): (222.0, 'kJ/mol'),
+ *             ('Si', 'N', 1): (355.0, 'kJ/mol'), ('Si', 'O', 1): (452.0, 'kJ/mol'),
+ */
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__160, __pyx_tuple__161) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__162, __pyx_tuple__163) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+
+  /* "rmgpy/molecule/element.py":343
+ *             ('C', 'O', 2): (799.0, 'kJ/mol'), ('C', 'O', 3): (1072.0, 'kJ/mol'),
+ *             ('C', 'S', 1): (272.0, 'kJ/mol'), ('C', 'S', 2): (573.0, 'kJ/mol'),
+ *             ('C', 'Cl', 1): (327.0, 'kJ/mol'), ('Si', 'Si', 1): (222.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('Si', 'N', 1): (355.0, 'kJ/mol'), ('Si', 'O', 1): (452.0, 'kJ/mol'),
+ *             ('Si', 'S', 1): (293.0, 'kJ/mol'), ('Si', 'Cl', 1): (381.0, 'kJ/mol'),
+ */
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__164, __pyx_tuple__165) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__166, __pyx_tuple__167) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+
+  /* "rmgpy/molecule/element.py":344
+ *             ('C', 'S', 1): (272.0, 'kJ/mol'), ('C', 'S', 2): (573.0, 'kJ/mol'),
+ *             ('C', 'Cl', 1): (327.0, 'kJ/mol'), ('Si', 'Si', 1): (222.0, 'kJ/mol'),
+ *             ('Si', 'N', 1): (355.0, 'kJ/mol'), ('Si', 'O', 1): (452.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('Si', 'S', 1): (293.0, 'kJ/mol'), ('Si', 'Cl', 1): (381.0, 'kJ/mol'),
+ *             ('N', 'N', 1): (167.0, 'kJ/mol'), ('N', 'N', 2): (418.0, 'kJ/mol'),
+ */
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__168, __pyx_tuple__169) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__170, __pyx_tuple__171) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+
+  /* "rmgpy/molecule/element.py":345
+ *             ('C', 'Cl', 1): (327.0, 'kJ/mol'), ('Si', 'Si', 1): (222.0, 'kJ/mol'),
+ *             ('Si', 'N', 1): (355.0, 'kJ/mol'), ('Si', 'O', 1): (452.0, 'kJ/mol'),
+ *             ('Si', 'S', 1): (293.0, 'kJ/mol'), ('Si', 'Cl', 1): (381.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('N', 'N', 1): (167.0, 'kJ/mol'), ('N', 'N', 2): (418.0, 'kJ/mol'),
+ *             ('N', 'N', 3): (942.0, 'kJ/mol'), ('N', 'O', 1): (201.0, 'kJ/mol'),
+ */
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__172, __pyx_tuple__173) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__174, __pyx_tuple__175) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+
+  /* "rmgpy/molecule/element.py":346
+ *             ('Si', 'N', 1): (355.0, 'kJ/mol'), ('Si', 'O', 1): (452.0, 'kJ/mol'),
+ *             ('Si', 'S', 1): (293.0, 'kJ/mol'), ('Si', 'Cl', 1): (381.0, 'kJ/mol'),
+ *             ('N', 'N', 1): (167.0, 'kJ/mol'), ('N', 'N', 2): (418.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('N', 'N', 3): (942.0, 'kJ/mol'), ('N', 'O', 1): (201.0, 'kJ/mol'),
+ *             ('N', 'O', 2): (607.0, 'kJ/mol'), ('N', 'Cl', 1): (313.0, 'kJ/mol'),
+ */
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__176, __pyx_tuple__177) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__178, __pyx_tuple__179) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+
+  /* "rmgpy/molecule/element.py":347
+ *             ('Si', 'S', 1): (293.0, 'kJ/mol'), ('Si', 'Cl', 1): (381.0, 'kJ/mol'),
+ *             ('N', 'N', 1): (167.0, 'kJ/mol'), ('N', 'N', 2): (418.0, 'kJ/mol'),
+ *             ('N', 'N', 3): (942.0, 'kJ/mol'), ('N', 'O', 1): (201.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('N', 'O', 2): (607.0, 'kJ/mol'), ('N', 'Cl', 1): (313.0, 'kJ/mol'),
+ *             ('O', 'O', 1): (142.0, 'kJ/mol'), ('O', 'O', 2): (494.0, 'kJ/mol'),
+ */
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__180, __pyx_tuple__181) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__182, __pyx_tuple__183) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+
+  /* "rmgpy/molecule/element.py":348
+ *             ('N', 'N', 1): (167.0, 'kJ/mol'), ('N', 'N', 2): (418.0, 'kJ/mol'),
+ *             ('N', 'N', 3): (942.0, 'kJ/mol'), ('N', 'O', 1): (201.0, 'kJ/mol'),
+ *             ('N', 'O', 2): (607.0, 'kJ/mol'), ('N', 'Cl', 1): (313.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('O', 'O', 1): (142.0, 'kJ/mol'), ('O', 'O', 2): (494.0, 'kJ/mol'),
+ *             ('S', 'O', 2): (522.0, 'kJ/mol'), ('S', 'S', 1): (226.0, 'kJ/mol'),
+ */
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__184, __pyx_tuple__185) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__186, __pyx_tuple__187) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+
+  /* "rmgpy/molecule/element.py":349
+ *             ('N', 'N', 3): (942.0, 'kJ/mol'), ('N', 'O', 1): (201.0, 'kJ/mol'),
+ *             ('N', 'O', 2): (607.0, 'kJ/mol'), ('N', 'Cl', 1): (313.0, 'kJ/mol'),
+ *             ('O', 'O', 1): (142.0, 'kJ/mol'), ('O', 'O', 2): (494.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('S', 'O', 2): (522.0, 'kJ/mol'), ('S', 'S', 1): (226.0, 'kJ/mol'),
+ *             ('S', 'S', 2): (425.0, 'kJ/mol'), ('S', 'Cl', 1): (255.0, 'kJ/mol'),
+ */
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__188, __pyx_tuple__189) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__190, __pyx_tuple__191) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+
+  /* "rmgpy/molecule/element.py":350
+ *             ('N', 'O', 2): (607.0, 'kJ/mol'), ('N', 'Cl', 1): (313.0, 'kJ/mol'),
+ *             ('O', 'O', 1): (142.0, 'kJ/mol'), ('O', 'O', 2): (494.0, 'kJ/mol'),
+ *             ('S', 'O', 2): (522.0, 'kJ/mol'), ('S', 'S', 1): (226.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('S', 'S', 2): (425.0, 'kJ/mol'), ('S', 'Cl', 1): (255.0, 'kJ/mol'),
+ *             ('Cl', 'Cl', 1): (240.0, 'kJ/mol'), ('C', 'C', 1.5): (518.0, 'kJ/mol'),
+ */
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__192, __pyx_tuple__193) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__194, __pyx_tuple__195) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+
+  /* "rmgpy/molecule/element.py":351
+ *             ('O', 'O', 1): (142.0, 'kJ/mol'), ('O', 'O', 2): (494.0, 'kJ/mol'),
+ *             ('S', 'O', 2): (522.0, 'kJ/mol'), ('S', 'S', 1): (226.0, 'kJ/mol'),
+ *             ('S', 'S', 2): (425.0, 'kJ/mol'), ('S', 'Cl', 1): (255.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('Cl', 'Cl', 1): (240.0, 'kJ/mol'), ('C', 'C', 1.5): (518.0, 'kJ/mol'),
+ *             ('O', 'S', 1): (265.0, 'kJ/mol'), ('C', 'C', 2.5): (663.0, 'kJ/mol')}
+ */
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__196, __pyx_tuple__197) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__198, __pyx_tuple__199) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+
+  /* "rmgpy/molecule/element.py":352
+ *             ('S', 'O', 2): (522.0, 'kJ/mol'), ('S', 'S', 1): (226.0, 'kJ/mol'),
+ *             ('S', 'S', 2): (425.0, 'kJ/mol'), ('S', 'Cl', 1): (255.0, 'kJ/mol'),
+ *             ('Cl', 'Cl', 1): (240.0, 'kJ/mol'), ('C', 'C', 1.5): (518.0, 'kJ/mol'),             # <<<<<<<<<<<<<<
+ *             ('O', 'S', 1): (265.0, 'kJ/mol'), ('C', 'C', 2.5): (663.0, 'kJ/mol')}
+ * 
+ */
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__200, __pyx_tuple__201) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__202, __pyx_tuple__203) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+
+  /* "rmgpy/molecule/element.py":353
+ *             ('S', 'S', 2): (425.0, 'kJ/mol'), ('S', 'Cl', 1): (255.0, 'kJ/mol'),
+ *             ('Cl', 'Cl', 1): (240.0, 'kJ/mol'), ('C', 'C', 1.5): (518.0, 'kJ/mol'),
+ *             ('O', 'S', 1): (265.0, 'kJ/mol'), ('C', 'C', 2.5): (663.0, 'kJ/mol')}             # <<<<<<<<<<<<<<
+ * 
+ * bdes = {}
+ */
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__204, __pyx_tuple__205) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_118, __pyx_tuple__206, __pyx_tuple__207) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_bde_dict, __pyx_t_118) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_118); __pyx_t_118 = 0;
+
+  /* "rmgpy/molecule/element.py":355
+ *             ('O', 'S', 1): (265.0, 'kJ/mol'), ('C', 'C', 2.5): (663.0, 'kJ/mol')}
+ * 
+ * bdes = {}             # <<<<<<<<<<<<<<
+ * for key, value in bde_dict.items():
+ *     q = Quantity(value).value_si
+ */
+  __pyx_t_118 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_118)) __PYX_ERR(0, 355, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_118);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_bdes, __pyx_t_118) < 0) __PYX_ERR(0, 355, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_118); __pyx_t_118 = 0;
+
+  /* "rmgpy/molecule/element.py":356
+ * 
+ * bdes = {}
+ * for key, value in bde_dict.items():             # <<<<<<<<<<<<<<
+ *     q = Quantity(value).value_si
+ *     bdes[(key[0], key[1], key[2])] = q
+ */
+  __pyx_t_119 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_117, __pyx_n_s_bde_dict); if (unlikely(!__pyx_t_117)) __PYX_ERR(0, 356, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_117);
+  if (unlikely(__pyx_t_117 == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "items");
+    __PYX_ERR(0, 356, __pyx_L1_error)
+  }
+  __pyx_t_116 = __Pyx_dict_iterator(__pyx_t_117, 0, __pyx_n_s_items, (&__pyx_t_120), (&__pyx_t_121)); if (unlikely(!__pyx_t_116)) __PYX_ERR(0, 356, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_116);
+  __Pyx_DECREF(__pyx_t_117); __pyx_t_117 = 0;
+  __Pyx_XDECREF(__pyx_t_118);
+  __pyx_t_118 = __pyx_t_116;
+  __pyx_t_116 = 0;
+  while (1) {
+    __pyx_t_122 = __Pyx_dict_iter_next(__pyx_t_118, __pyx_t_120, &__pyx_t_119, &__pyx_t_116, &__pyx_t_117, NULL, __pyx_t_121);
+    if (unlikely(__pyx_t_122 == 0)) break;
+    if (unlikely(__pyx_t_122 == -1)) __PYX_ERR(0, 356, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_116);
+    __Pyx_GOTREF(__pyx_t_117);
+    if (PyDict_SetItem(__pyx_d, __pyx_n_s_key, __pyx_t_116) < 0) __PYX_ERR(0, 356, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_116); __pyx_t_116 = 0;
+    if (PyDict_SetItem(__pyx_d, __pyx_n_s_value, __pyx_t_117) < 0) __PYX_ERR(0, 356, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_117); __pyx_t_117 = 0;
+
+    /* "rmgpy/molecule/element.py":357
+ * bdes = {}
+ * for key, value in bde_dict.items():
+ *     q = Quantity(value).value_si             # <<<<<<<<<<<<<<
+ *     bdes[(key[0], key[1], key[2])] = q
+ *     bdes[(key[1], key[0], key[2])] = q
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_116, __pyx_n_s_Quantity); if (unlikely(!__pyx_t_116)) __PYX_ERR(0, 357, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_116);
+    __Pyx_GetModuleGlobalName(__pyx_t_115, __pyx_n_s_value); if (unlikely(!__pyx_t_115)) __PYX_ERR(0, 357, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_115);
+    __pyx_t_114 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_116))) {
+      __pyx_t_114 = PyMethod_GET_SELF(__pyx_t_116);
+      if (likely(__pyx_t_114)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_116);
+        __Pyx_INCREF(__pyx_t_114);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_116, function);
+      }
+    }
+    __pyx_t_117 = (__pyx_t_114) ? __Pyx_PyObject_Call2Args(__pyx_t_116, __pyx_t_114, __pyx_t_115) : __Pyx_PyObject_CallOneArg(__pyx_t_116, __pyx_t_115);
+    __Pyx_XDECREF(__pyx_t_114); __pyx_t_114 = 0;
+    __Pyx_DECREF(__pyx_t_115); __pyx_t_115 = 0;
+    if (unlikely(!__pyx_t_117)) __PYX_ERR(0, 357, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_117);
+    __Pyx_DECREF(__pyx_t_116); __pyx_t_116 = 0;
+    __pyx_t_116 = __Pyx_PyObject_GetAttrStr(__pyx_t_117, __pyx_n_s_value_si); if (unlikely(!__pyx_t_116)) __PYX_ERR(0, 357, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_116);
+    __Pyx_DECREF(__pyx_t_117); __pyx_t_117 = 0;
+    if (PyDict_SetItem(__pyx_d, __pyx_n_s_q, __pyx_t_116) < 0) __PYX_ERR(0, 357, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_116); __pyx_t_116 = 0;
+
+    /* "rmgpy/molecule/element.py":358
+ * for key, value in bde_dict.items():
+ *     q = Quantity(value).value_si
+ *     bdes[(key[0], key[1], key[2])] = q             # <<<<<<<<<<<<<<
+ *     bdes[(key[1], key[0], key[2])] = q
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_116, __pyx_n_s_q); if (unlikely(!__pyx_t_116)) __PYX_ERR(0, 358, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_116);
+    __Pyx_GetModuleGlobalName(__pyx_t_117, __pyx_n_s_bdes); if (unlikely(!__pyx_t_117)) __PYX_ERR(0, 358, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_117);
+    __Pyx_GetModuleGlobalName(__pyx_t_115, __pyx_n_s_key); if (unlikely(!__pyx_t_115)) __PYX_ERR(0, 358, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_115);
+    __pyx_t_114 = __Pyx_GetItemInt(__pyx_t_115, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_114)) __PYX_ERR(0, 358, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_114);
+    __Pyx_DECREF(__pyx_t_115); __pyx_t_115 = 0;
+    __Pyx_GetModuleGlobalName(__pyx_t_115, __pyx_n_s_key); if (unlikely(!__pyx_t_115)) __PYX_ERR(0, 358, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_115);
+    __pyx_t_113 = __Pyx_GetItemInt(__pyx_t_115, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_113)) __PYX_ERR(0, 358, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_113);
+    __Pyx_DECREF(__pyx_t_115); __pyx_t_115 = 0;
+    __Pyx_GetModuleGlobalName(__pyx_t_115, __pyx_n_s_key); if (unlikely(!__pyx_t_115)) __PYX_ERR(0, 358, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_115);
+    __pyx_t_112 = __Pyx_GetItemInt(__pyx_t_115, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_112)) __PYX_ERR(0, 358, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_112);
+    __Pyx_DECREF(__pyx_t_115); __pyx_t_115 = 0;
+    __pyx_t_115 = PyTuple_New(3); if (unlikely(!__pyx_t_115)) __PYX_ERR(0, 358, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_115);
+    __Pyx_GIVEREF(__pyx_t_114);
+    PyTuple_SET_ITEM(__pyx_t_115, 0, __pyx_t_114);
+    __Pyx_GIVEREF(__pyx_t_113);
+    PyTuple_SET_ITEM(__pyx_t_115, 1, __pyx_t_113);
+    __Pyx_GIVEREF(__pyx_t_112);
+    PyTuple_SET_ITEM(__pyx_t_115, 2, __pyx_t_112);
+    __pyx_t_114 = 0;
+    __pyx_t_113 = 0;
+    __pyx_t_112 = 0;
+    if (unlikely(PyObject_SetItem(__pyx_t_117, __pyx_t_115, __pyx_t_116) < 0)) __PYX_ERR(0, 358, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_117); __pyx_t_117 = 0;
+    __Pyx_DECREF(__pyx_t_115); __pyx_t_115 = 0;
+    __Pyx_DECREF(__pyx_t_116); __pyx_t_116 = 0;
+
+    /* "rmgpy/molecule/element.py":359
+ *     q = Quantity(value).value_si
+ *     bdes[(key[0], key[1], key[2])] = q
+ *     bdes[(key[1], key[0], key[2])] = q             # <<<<<<<<<<<<<<
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_116, __pyx_n_s_q); if (unlikely(!__pyx_t_116)) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_116);
+    __Pyx_GetModuleGlobalName(__pyx_t_115, __pyx_n_s_bdes); if (unlikely(!__pyx_t_115)) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_115);
+    __Pyx_GetModuleGlobalName(__pyx_t_117, __pyx_n_s_key); if (unlikely(!__pyx_t_117)) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_117);
+    __pyx_t_112 = __Pyx_GetItemInt(__pyx_t_117, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_112)) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_112);
+    __Pyx_DECREF(__pyx_t_117); __pyx_t_117 = 0;
+    __Pyx_GetModuleGlobalName(__pyx_t_117, __pyx_n_s_key); if (unlikely(!__pyx_t_117)) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_117);
+    __pyx_t_113 = __Pyx_GetItemInt(__pyx_t_117, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_113)) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_113);
+    __Pyx_DECREF(__pyx_t_117); __pyx_t_117 = 0;
+    __Pyx_GetModuleGlobalName(__pyx_t_117, __pyx_n_s_key); if (unlikely(!__pyx_t_117)) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_117);
+    __pyx_t_114 = __Pyx_GetItemInt(__pyx_t_117, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_114)) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_114);
+    __Pyx_DECREF(__pyx_t_117); __pyx_t_117 = 0;
+    __pyx_t_117 = PyTuple_New(3); if (unlikely(!__pyx_t_117)) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_117);
+    __Pyx_GIVEREF(__pyx_t_112);
+    PyTuple_SET_ITEM(__pyx_t_117, 0, __pyx_t_112);
+    __Pyx_GIVEREF(__pyx_t_113);
+    PyTuple_SET_ITEM(__pyx_t_117, 1, __pyx_t_113);
+    __Pyx_GIVEREF(__pyx_t_114);
+    PyTuple_SET_ITEM(__pyx_t_117, 2, __pyx_t_114);
+    __pyx_t_112 = 0;
+    __pyx_t_113 = 0;
+    __pyx_t_114 = 0;
+    if (unlikely(PyObject_SetItem(__pyx_t_115, __pyx_t_117, __pyx_t_116) < 0)) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_115); __pyx_t_115 = 0;
+    __Pyx_DECREF(__pyx_t_117); __pyx_t_117 = 0;
+    __Pyx_DECREF(__pyx_t_116); __pyx_t_116 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_118); __pyx_t_118 = 0;
+
+  /* "rmgpy/molecule/element.py":1
+ * #!/usr/bin/env python             # <<<<<<<<<<<<<<
+ * # -*- coding: utf-8 -*-
+ * 
+ */
+  __pyx_t_118 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_118)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_118);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_118) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_118); __pyx_t_118 = 0;
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_14);
+  __Pyx_XDECREF(__pyx_t_15);
+  __Pyx_XDECREF(__pyx_t_16);
+  __Pyx_XDECREF(__pyx_t_17);
+  __Pyx_XDECREF(__pyx_t_18);
+  __Pyx_XDECREF(__pyx_t_19);
+  __Pyx_XDECREF(__pyx_t_20);
+  __Pyx_XDECREF(__pyx_t_21);
+  __Pyx_XDECREF(__pyx_t_22);
+  __Pyx_XDECREF(__pyx_t_23);
+  __Pyx_XDECREF(__pyx_t_24);
+  __Pyx_XDECREF(__pyx_t_25);
+  __Pyx_XDECREF(__pyx_t_26);
+  __Pyx_XDECREF(__pyx_t_27);
+  __Pyx_XDECREF(__pyx_t_28);
+  __Pyx_XDECREF(__pyx_t_29);
+  __Pyx_XDECREF(__pyx_t_30);
+  __Pyx_XDECREF(__pyx_t_31);
+  __Pyx_XDECREF(__pyx_t_32);
+  __Pyx_XDECREF(__pyx_t_33);
+  __Pyx_XDECREF(__pyx_t_34);
+  __Pyx_XDECREF(__pyx_t_35);
+  __Pyx_XDECREF(__pyx_t_36);
+  __Pyx_XDECREF(__pyx_t_37);
+  __Pyx_XDECREF(__pyx_t_38);
+  __Pyx_XDECREF(__pyx_t_39);
+  __Pyx_XDECREF(__pyx_t_40);
+  __Pyx_XDECREF(__pyx_t_41);
+  __Pyx_XDECREF(__pyx_t_42);
+  __Pyx_XDECREF(__pyx_t_43);
+  __Pyx_XDECREF(__pyx_t_44);
+  __Pyx_XDECREF(__pyx_t_45);
+  __Pyx_XDECREF(__pyx_t_46);
+  __Pyx_XDECREF(__pyx_t_47);
+  __Pyx_XDECREF(__pyx_t_48);
+  __Pyx_XDECREF(__pyx_t_49);
+  __Pyx_XDECREF(__pyx_t_50);
+  __Pyx_XDECREF(__pyx_t_51);
+  __Pyx_XDECREF(__pyx_t_52);
+  __Pyx_XDECREF(__pyx_t_53);
+  __Pyx_XDECREF(__pyx_t_54);
+  __Pyx_XDECREF(__pyx_t_55);
+  __Pyx_XDECREF(__pyx_t_56);
+  __Pyx_XDECREF(__pyx_t_57);
+  __Pyx_XDECREF(__pyx_t_58);
+  __Pyx_XDECREF(__pyx_t_59);
+  __Pyx_XDECREF(__pyx_t_60);
+  __Pyx_XDECREF(__pyx_t_61);
+  __Pyx_XDECREF(__pyx_t_62);
+  __Pyx_XDECREF(__pyx_t_63);
+  __Pyx_XDECREF(__pyx_t_64);
+  __Pyx_XDECREF(__pyx_t_65);
+  __Pyx_XDECREF(__pyx_t_66);
+  __Pyx_XDECREF(__pyx_t_67);
+  __Pyx_XDECREF(__pyx_t_68);
+  __Pyx_XDECREF(__pyx_t_69);
+  __Pyx_XDECREF(__pyx_t_70);
+  __Pyx_XDECREF(__pyx_t_71);
+  __Pyx_XDECREF(__pyx_t_72);
+  __Pyx_XDECREF(__pyx_t_73);
+  __Pyx_XDECREF(__pyx_t_74);
+  __Pyx_XDECREF(__pyx_t_75);
+  __Pyx_XDECREF(__pyx_t_76);
+  __Pyx_XDECREF(__pyx_t_77);
+  __Pyx_XDECREF(__pyx_t_78);
+  __Pyx_XDECREF(__pyx_t_79);
+  __Pyx_XDECREF(__pyx_t_80);
+  __Pyx_XDECREF(__pyx_t_81);
+  __Pyx_XDECREF(__pyx_t_82);
+  __Pyx_XDECREF(__pyx_t_83);
+  __Pyx_XDECREF(__pyx_t_84);
+  __Pyx_XDECREF(__pyx_t_85);
+  __Pyx_XDECREF(__pyx_t_86);
+  __Pyx_XDECREF(__pyx_t_87);
+  __Pyx_XDECREF(__pyx_t_88);
+  __Pyx_XDECREF(__pyx_t_89);
+  __Pyx_XDECREF(__pyx_t_90);
+  __Pyx_XDECREF(__pyx_t_91);
+  __Pyx_XDECREF(__pyx_t_92);
+  __Pyx_XDECREF(__pyx_t_93);
+  __Pyx_XDECREF(__pyx_t_94);
+  __Pyx_XDECREF(__pyx_t_95);
+  __Pyx_XDECREF(__pyx_t_96);
+  __Pyx_XDECREF(__pyx_t_97);
+  __Pyx_XDECREF(__pyx_t_98);
+  __Pyx_XDECREF(__pyx_t_99);
+  __Pyx_XDECREF(__pyx_t_100);
+  __Pyx_XDECREF(__pyx_t_101);
+  __Pyx_XDECREF(__pyx_t_102);
+  __Pyx_XDECREF(__pyx_t_103);
+  __Pyx_XDECREF(__pyx_t_104);
+  __Pyx_XDECREF(__pyx_t_105);
+  __Pyx_XDECREF(__pyx_t_106);
+  __Pyx_XDECREF(__pyx_t_107);
+  __Pyx_XDECREF(__pyx_t_108);
+  __Pyx_XDECREF(__pyx_t_109);
+  __Pyx_XDECREF(__pyx_t_110);
+  __Pyx_XDECREF(__pyx_t_111);
+  __Pyx_XDECREF(__pyx_t_112);
+  __Pyx_XDECREF(__pyx_t_113);
+  __Pyx_XDECREF(__pyx_t_114);
+  __Pyx_XDECREF(__pyx_t_115);
+  __Pyx_XDECREF(__pyx_t_116);
+  __Pyx_XDECREF(__pyx_t_117);
+  __Pyx_XDECREF(__pyx_t_118);
+  if (__pyx_m) {
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init rmgpy.molecule.element", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    Py_CLEAR(__pyx_m);
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init rmgpy.molecule.element");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+            continue;
+        }
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (**name == key) ? 0 :
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key);
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* BytesEquals */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+    if (s1 == s2) {
+        return (equals == Py_EQ);
+    } else if (PyBytes_CheckExact(s1) & PyBytes_CheckExact(s2)) {
+        const char *ps1, *ps2;
+        Py_ssize_t length = PyBytes_GET_SIZE(s1);
+        if (length != PyBytes_GET_SIZE(s2))
+            return (equals == Py_NE);
+        ps1 = PyBytes_AS_STRING(s1);
+        ps2 = PyBytes_AS_STRING(s2);
+        if (ps1[0] != ps2[0]) {
+            return (equals == Py_NE);
+        } else if (length == 1) {
+            return (equals == Py_EQ);
+        } else {
+            int result;
+#if CYTHON_USE_UNICODE_INTERNALS && (PY_VERSION_HEX < 0x030B0000)
+            Py_hash_t hash1, hash2;
+            hash1 = ((PyBytesObject*)s1)->ob_shash;
+            hash2 = ((PyBytesObject*)s2)->ob_shash;
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                return (equals == Py_NE);
+            }
+#endif
+            result = memcmp(ps1, ps2, (size_t)length);
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & PyBytes_CheckExact(s2)) {
+        return (equals == Py_NE);
+    } else if ((s2 == Py_None) & PyBytes_CheckExact(s1)) {
+        return (equals == Py_NE);
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+#endif
+}
+
+/* UnicodeEquals */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+#if PY_MAJOR_VERSION < 3
+    PyObject* owned_ref = NULL;
+#endif
+    int s1_is_unicode, s2_is_unicode;
+    if (s1 == s2) {
+        goto return_eq;
+    }
+    s1_is_unicode = PyUnicode_CheckExact(s1);
+    s2_is_unicode = PyUnicode_CheckExact(s2);
+#if PY_MAJOR_VERSION < 3
+    if ((s1_is_unicode & (!s2_is_unicode)) && PyString_CheckExact(s2)) {
+        owned_ref = PyUnicode_FromObject(s2);
+        if (unlikely(!owned_ref))
+            return -1;
+        s2 = owned_ref;
+        s2_is_unicode = 1;
+    } else if ((s2_is_unicode & (!s1_is_unicode)) && PyString_CheckExact(s1)) {
+        owned_ref = PyUnicode_FromObject(s1);
+        if (unlikely(!owned_ref))
+            return -1;
+        s1 = owned_ref;
+        s1_is_unicode = 1;
+    } else if (((!s2_is_unicode) & (!s1_is_unicode))) {
+        return __Pyx_PyBytes_Equals(s1, s2, equals);
+    }
+#endif
+    if (s1_is_unicode & s2_is_unicode) {
+        Py_ssize_t length;
+        int kind;
+        void *data1, *data2;
+        if (unlikely(__Pyx_PyUnicode_READY(s1) < 0) || unlikely(__Pyx_PyUnicode_READY(s2) < 0))
+            return -1;
+        length = __Pyx_PyUnicode_GET_LENGTH(s1);
+        if (length != __Pyx_PyUnicode_GET_LENGTH(s2)) {
+            goto return_ne;
+        }
+#if CYTHON_USE_UNICODE_INTERNALS
+        {
+            Py_hash_t hash1, hash2;
+        #if CYTHON_PEP393_ENABLED
+            hash1 = ((PyASCIIObject*)s1)->hash;
+            hash2 = ((PyASCIIObject*)s2)->hash;
+        #else
+            hash1 = ((PyUnicodeObject*)s1)->hash;
+            hash2 = ((PyUnicodeObject*)s2)->hash;
+        #endif
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                goto return_ne;
+            }
+        }
+#endif
+        kind = __Pyx_PyUnicode_KIND(s1);
+        if (kind != __Pyx_PyUnicode_KIND(s2)) {
+            goto return_ne;
+        }
+        data1 = __Pyx_PyUnicode_DATA(s1);
+        data2 = __Pyx_PyUnicode_DATA(s2);
+        if (__Pyx_PyUnicode_READ(kind, data1, 0) != __Pyx_PyUnicode_READ(kind, data2, 0)) {
+            goto return_ne;
+        } else if (length == 1) {
+            goto return_eq;
+        } else {
+            int result = memcmp(data1, data2, (size_t)(length * kind));
+            #if PY_MAJOR_VERSION < 3
+            Py_XDECREF(owned_ref);
+            #endif
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & s2_is_unicode) {
+        goto return_ne;
+    } else if ((s2 == Py_None) & s1_is_unicode) {
+        goto return_ne;
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        #if PY_MAJOR_VERSION < 3
+        Py_XDECREF(owned_ref);
+        #endif
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+return_eq:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_EQ);
+return_ne:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_NE);
+#endif
+}
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* GetTopmostException */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem *
+__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
+{
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    while ((exc_info->exc_type == NULL || exc_info->exc_type == Py_None) &&
+           exc_info->previous_item != NULL)
+    {
+        exc_info = exc_info->previous_item;
+    }
+    return exc_info;
+}
+#endif
+
+/* SaveResetException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    *type = exc_info->exc_type;
+    *value = exc_info->exc_value;
+    *tb = exc_info->exc_traceback;
+    #else
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    #endif
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+}
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = type;
+    exc_info->exc_value = value;
+    exc_info->exc_traceback = tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+#endif
+
+/* PyErrExceptionMatches */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    PyObject *exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+    if (unlikely(PyTuple_Check(err)))
+        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+}
+#endif
+
+/* GetException */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
+#endif
+{
+    PyObject *local_type, *local_value, *local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    local_type = tstate->curexc_type;
+    local_value = tstate->curexc_value;
+    local_tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#else
+    PyErr_Fetch(&local_type, &local_value, &local_tb);
+#endif
+    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+#if CYTHON_FAST_THREAD_STATE
+    if (unlikely(tstate->curexc_type))
+#else
+    if (unlikely(PyErr_Occurred()))
+#endif
+        goto bad;
+    #if PY_MAJOR_VERSION >= 3
+    if (local_tb) {
+        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+            goto bad;
+    }
+    #endif
+    Py_XINCREF(local_tb);
+    Py_XINCREF(local_type);
+    Py_XINCREF(local_value);
+    *type = local_type;
+    *value = local_value;
+    *tb = local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_USE_EXC_INFO_STACK
+    {
+        _PyErr_StackItem *exc_info = tstate->exc_info;
+        tmp_type = exc_info->exc_type;
+        tmp_value = exc_info->exc_value;
+        tmp_tb = exc_info->exc_traceback;
+        exc_info->exc_type = local_type;
+        exc_info->exc_value = local_value;
+        exc_info->exc_traceback = local_tb;
+    }
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = local_type;
+    tstate->exc_value = local_value;
+    tstate->exc_traceback = local_tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#else
+    PyErr_SetExcInfo(local_type, local_value, local_tb);
+#endif
+    return 0;
+bad:
+    *type = 0;
+    *value = 0;
+    *tb = 0;
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_tb);
+    return -1;
+}
+
+/* Import */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+    PyObject *empty_list = 0;
+    PyObject *module = 0;
+    PyObject *global_dict = 0;
+    PyObject *empty_dict = 0;
+    PyObject *list;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_import;
+    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
+    if (!py_import)
+        goto bad;
+    #endif
+    if (from_list)
+        list = from_list;
+    else {
+        empty_list = PyList_New(0);
+        if (!empty_list)
+            goto bad;
+        list = empty_list;
+    }
+    global_dict = PyModule_GetDict(__pyx_m);
+    if (!global_dict)
+        goto bad;
+    empty_dict = PyDict_New();
+    if (!empty_dict)
+        goto bad;
+    {
+        #if PY_MAJOR_VERSION >= 3
+        if (level == -1) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
+                module = PyImport_ImportModuleLevelObject(
+                    name, global_dict, empty_dict, list, 1);
+                if (!module) {
+                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
+                        goto bad;
+                    PyErr_Clear();
+                }
+            }
+            level = 0;
+        }
+        #endif
+        if (!module) {
+            #if PY_MAJOR_VERSION < 3
+            PyObject *py_level = PyInt_FromLong(level);
+            if (!py_level)
+                goto bad;
+            module = PyObject_CallFunctionObjArgs(py_import,
+                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
+            Py_DECREF(py_level);
+            #else
+            module = PyImport_ImportModuleLevelObject(
+                name, global_dict, empty_dict, list, level);
+            #endif
+        }
+    }
+bad:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_import);
+    #endif
+    Py_XDECREF(empty_list);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+/* CIntToDigits */
+static const char DIGIT_PAIRS_10[2*10*10+1] = {
+    "00010203040506070809"
+    "10111213141516171819"
+    "20212223242526272829"
+    "30313233343536373839"
+    "40414243444546474849"
+    "50515253545556575859"
+    "60616263646566676869"
+    "70717273747576777879"
+    "80818283848586878889"
+    "90919293949596979899"
+};
+static const char DIGIT_PAIRS_8[2*8*8+1] = {
+    "0001020304050607"
+    "1011121314151617"
+    "2021222324252627"
+    "3031323334353637"
+    "4041424344454647"
+    "5051525354555657"
+    "6061626364656667"
+    "7071727374757677"
+};
+static const char DIGITS_HEX[2*16+1] = {
+    "0123456789abcdef"
+    "0123456789ABCDEF"
+};
+
+/* BuildPyUnicode */
+static PyObject* __Pyx_PyUnicode_BuildFromAscii(Py_ssize_t ulength, char* chars, int clength,
+                                                int prepend_sign, char padding_char) {
+    PyObject *uval;
+    Py_ssize_t uoffset = ulength - clength;
+#if CYTHON_USE_UNICODE_INTERNALS
+    Py_ssize_t i;
+#if CYTHON_PEP393_ENABLED
+    void *udata;
+    uval = PyUnicode_New(ulength, 127);
+    if (unlikely(!uval)) return NULL;
+    udata = PyUnicode_DATA(uval);
+#else
+    Py_UNICODE *udata;
+    uval = PyUnicode_FromUnicode(NULL, ulength);
+    if (unlikely(!uval)) return NULL;
+    udata = PyUnicode_AS_UNICODE(uval);
+#endif
+    if (uoffset > 0) {
+        i = 0;
+        if (prepend_sign) {
+            __Pyx_PyUnicode_WRITE(PyUnicode_1BYTE_KIND, udata, 0, '-');
+            i++;
+        }
+        for (; i < uoffset; i++) {
+            __Pyx_PyUnicode_WRITE(PyUnicode_1BYTE_KIND, udata, i, padding_char);
+        }
+    }
+    for (i=0; i < clength; i++) {
+        __Pyx_PyUnicode_WRITE(PyUnicode_1BYTE_KIND, udata, uoffset+i, chars[i]);
+    }
+#else
+    {
+        PyObject *sign = NULL, *padding = NULL;
+        uval = NULL;
+        if (uoffset > 0) {
+            prepend_sign = !!prepend_sign;
+            if (uoffset > prepend_sign) {
+                padding = PyUnicode_FromOrdinal(padding_char);
+                if (likely(padding) && uoffset > prepend_sign + 1) {
+                    PyObject *tmp;
+                    PyObject *repeat = PyInt_FromSsize_t(uoffset - prepend_sign);
+                    if (unlikely(!repeat)) goto done_or_error;
+                    tmp = PyNumber_Multiply(padding, repeat);
+                    Py_DECREF(repeat);
+                    Py_DECREF(padding);
+                    padding = tmp;
+                }
+                if (unlikely(!padding)) goto done_or_error;
+            }
+            if (prepend_sign) {
+                sign = PyUnicode_FromOrdinal('-');
+                if (unlikely(!sign)) goto done_or_error;
+            }
+        }
+        uval = PyUnicode_DecodeASCII(chars, clength, NULL);
+        if (likely(uval) && padding) {
+            PyObject *tmp = PyNumber_Add(padding, uval);
+            Py_DECREF(uval);
+            uval = tmp;
+        }
+        if (likely(uval) && sign) {
+            PyObject *tmp = PyNumber_Add(sign, uval);
+            Py_DECREF(uval);
+            uval = tmp;
+        }
+done_or_error:
+        Py_XDECREF(padding);
+        Py_XDECREF(sign);
+    }
+#endif
+    return uval;
+}
+
+/* CIntToPyUnicode */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_From_int(int value, Py_ssize_t width, char padding_char, char format_char) {
+    char digits[sizeof(int)*3+2];
+    char *dpos, *end = digits + sizeof(int)*3+2;
+    const char *hex_digits = DIGITS_HEX;
+    Py_ssize_t length, ulength;
+    int prepend_sign, last_one_off;
+    int remaining;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (format_char == 'X') {
+        hex_digits += 16;
+        format_char = 'x';
+    }
+    remaining = value;
+    last_one_off = 0;
+    dpos = end;
+    do {
+        int digit_pos;
+        switch (format_char) {
+        case 'o':
+            digit_pos = abs((int)(remaining % (8*8)));
+            remaining = (int) (remaining / (8*8));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_8 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 8);
+            break;
+        case 'd':
+            digit_pos = abs((int)(remaining % (10*10)));
+            remaining = (int) (remaining / (10*10));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_10 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 10);
+            break;
+        case 'x':
+            *(--dpos) = hex_digits[abs((int)(remaining % 16))];
+            remaining = (int) (remaining / 16);
+            break;
+        default:
+            assert(0);
+            break;
+        }
+    } while (unlikely(remaining != 0));
+    if (last_one_off) {
+        assert(*dpos == '0');
+        dpos++;
+    }
+    length = end - dpos;
+    ulength = length;
+    prepend_sign = 0;
+    if (!is_unsigned && value <= neg_one) {
+        if (padding_char == ' ' || width <= length + 1) {
+            *(--dpos) = '-';
+            ++length;
+        } else {
+            prepend_sign = 1;
+        }
+        ++ulength;
+    }
+    if (width > ulength) {
+        ulength = width;
+    }
+    if (ulength == 1) {
+        return PyUnicode_FromOrdinal(*dpos);
+    }
+    return __Pyx_PyUnicode_BuildFromAscii(ulength, dpos, (int) length, prepend_sign, padding_char);
+}
+
+/* PyUnicode_Unicode */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_Unicode(PyObject *obj) {
+    if (unlikely(obj == Py_None))
+        obj = __pyx_kp_u_None;
+    return __Pyx_NewRef(obj);
+}
+
+/* PyObjectFormatAndDecref */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FormatSimpleAndDecref(PyObject* s, PyObject* f) {
+    if (unlikely(!s)) return NULL;
+    if (likely(PyUnicode_CheckExact(s))) return s;
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyString_CheckExact(s))) {
+        PyObject *result = PyUnicode_FromEncodedObject(s, NULL, "strict");
+        Py_DECREF(s);
+        return result;
+    }
+    #endif
+    return __Pyx_PyObject_FormatAndDecref(s, f);
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FormatAndDecref(PyObject* s, PyObject* f) {
+    PyObject *result = PyObject_Format(s, f);
+    Py_DECREF(s);
+    return result;
+}
+
+/* JoinPyUnicode */
+static PyObject* __Pyx_PyUnicode_Join(PyObject* value_tuple, Py_ssize_t value_count, Py_ssize_t result_ulength,
+                                      CYTHON_UNUSED Py_UCS4 max_char) {
+#if CYTHON_USE_UNICODE_INTERNALS && CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    PyObject *result_uval;
+    int result_ukind;
+    Py_ssize_t i, char_pos;
+    void *result_udata;
+#if CYTHON_PEP393_ENABLED
+    result_uval = PyUnicode_New(result_ulength, max_char);
+    if (unlikely(!result_uval)) return NULL;
+    result_ukind = (max_char <= 255) ? PyUnicode_1BYTE_KIND : (max_char <= 65535) ? PyUnicode_2BYTE_KIND : PyUnicode_4BYTE_KIND;
+    result_udata = PyUnicode_DATA(result_uval);
+#else
+    result_uval = PyUnicode_FromUnicode(NULL, result_ulength);
+    if (unlikely(!result_uval)) return NULL;
+    result_ukind = sizeof(Py_UNICODE);
+    result_udata = PyUnicode_AS_UNICODE(result_uval);
+#endif
+    char_pos = 0;
+    for (i=0; i < value_count; i++) {
+        int ukind;
+        Py_ssize_t ulength;
+        void *udata;
+        PyObject *uval = PyTuple_GET_ITEM(value_tuple, i);
+        if (unlikely(__Pyx_PyUnicode_READY(uval)))
+            goto bad;
+        ulength = __Pyx_PyUnicode_GET_LENGTH(uval);
+        if (unlikely(!ulength))
+            continue;
+        if (unlikely(char_pos + ulength < 0))
+            goto overflow;
+        ukind = __Pyx_PyUnicode_KIND(uval);
+        udata = __Pyx_PyUnicode_DATA(uval);
+        if (!CYTHON_PEP393_ENABLED || ukind == result_ukind) {
+            memcpy((char *)result_udata + char_pos * result_ukind, udata, (size_t) (ulength * result_ukind));
+        } else {
+            #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030300F0 || defined(_PyUnicode_FastCopyCharacters)
+            _PyUnicode_FastCopyCharacters(result_uval, char_pos, uval, 0, ulength);
+            #else
+            Py_ssize_t j;
+            for (j=0; j < ulength; j++) {
+                Py_UCS4 uchar = __Pyx_PyUnicode_READ(ukind, udata, j);
+                __Pyx_PyUnicode_WRITE(result_ukind, result_udata, char_pos+j, uchar);
+            }
+            #endif
+        }
+        char_pos += ulength;
+    }
+    return result_uval;
+overflow:
+    PyErr_SetString(PyExc_OverflowError, "join() result is too long for a Python string");
+bad:
+    Py_DECREF(result_uval);
+    return NULL;
+#else
+    result_ulength++;
+    value_count++;
+    return PyUnicode_Join(__pyx_empty_unicode, value_tuple);
+#endif
+}
+
+/* ExtTypeTest */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    if (likely(__Pyx_TypeCheck(obj, type)))
+        return 1;
+    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
+                 Py_TYPE(obj)->tp_name, type->tp_name);
+    return 0;
+}
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
+                        CYTHON_UNUSED PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+#endif
+
+/* PyObject_GenericGetAttrNoDict */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, attr_name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(attr_name));
+#endif
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name) {
+    PyObject *descr;
+    PyTypeObject *tp = Py_TYPE(obj);
+    if (unlikely(!PyString_Check(attr_name))) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    assert(!tp->tp_dictoffset);
+    descr = _PyType_Lookup(tp, attr_name);
+    if (unlikely(!descr)) {
+        return __Pyx_RaiseGenericGetAttributeError(tp, attr_name);
+    }
+    Py_INCREF(descr);
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_HAVE_CLASS)))
+    #endif
+    {
+        descrgetfunc f = Py_TYPE(descr)->tp_descr_get;
+        if (unlikely(f)) {
+            PyObject *res = f(descr, obj, (PyObject *)tp);
+            Py_DECREF(descr);
+            return res;
+        }
+    }
+    return descr;
+}
+#endif
+
+/* PyObject_GenericGetAttr */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
+    if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    return __Pyx_PyObject_GenericGetAttrNoDict(obj, attr_name);
+}
+#endif
+
+/* ImportFrom */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Format(PyExc_ImportError,
+        #if PY_MAJOR_VERSION < 3
+            "cannot import name %.230s", PyString_AS_STRING(name));
+        #else
+            "cannot import name %S", name);
+        #endif
+    }
+    return value;
+}
+
+/* PyObjectCallNoArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
+/* FetchCommonType */
+static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type) {
+    PyObject* fake_module;
+    PyTypeObject* cached_type = NULL;
+    fake_module = PyImport_AddModule((char*) "_cython_" CYTHON_ABI);
+    if (!fake_module) return NULL;
+    Py_INCREF(fake_module);
+    cached_type = (PyTypeObject*) PyObject_GetAttrString(fake_module, type->tp_name);
+    if (cached_type) {
+        if (!PyType_Check((PyObject*)cached_type)) {
+            PyErr_Format(PyExc_TypeError,
+                "Shared Cython type %.200s is not a type object",
+                type->tp_name);
+            goto bad;
+        }
+        if (cached_type->tp_basicsize != type->tp_basicsize) {
+            PyErr_Format(PyExc_TypeError,
+                "Shared Cython type %.200s has the wrong size, try recompiling",
+                type->tp_name);
+            goto bad;
+        }
+    } else {
+        if (!PyErr_ExceptionMatches(PyExc_AttributeError)) goto bad;
+        PyErr_Clear();
+        if (PyType_Ready(type) < 0) goto bad;
+        if (PyObject_SetAttrString(fake_module, type->tp_name, (PyObject*) type) < 0)
+            goto bad;
+        Py_INCREF(type);
+        cached_type = type;
+    }
+done:
+    Py_DECREF(fake_module);
+    return cached_type;
+bad:
+    Py_XDECREF(cached_type);
+    cached_type = NULL;
+    goto done;
+}
+
+/* CythonFunctionShared */
+#include <structmember.h>
+static PyObject *
+__Pyx_CyFunction_get_doc(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *closure)
+{
+    if (unlikely(op->func_doc == NULL)) {
+        if (op->func.m_ml->ml_doc) {
+#if PY_MAJOR_VERSION >= 3
+            op->func_doc = PyUnicode_FromString(op->func.m_ml->ml_doc);
+#else
+            op->func_doc = PyString_FromString(op->func.m_ml->ml_doc);
+#endif
+            if (unlikely(op->func_doc == NULL))
+                return NULL;
+        } else {
+            Py_INCREF(Py_None);
+            return Py_None;
+        }
+    }
+    Py_INCREF(op->func_doc);
+    return op->func_doc;
+}
+static int
+__Pyx_CyFunction_set_doc(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp = op->func_doc;
+    if (value == NULL) {
+        value = Py_None;
+    }
+    Py_INCREF(value);
+    op->func_doc = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_name(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    if (unlikely(op->func_name == NULL)) {
+#if PY_MAJOR_VERSION >= 3
+        op->func_name = PyUnicode_InternFromString(op->func.m_ml->ml_name);
+#else
+        op->func_name = PyString_InternFromString(op->func.m_ml->ml_name);
+#endif
+        if (unlikely(op->func_name == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_name);
+    return op->func_name;
+}
+static int
+__Pyx_CyFunction_set_name(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp;
+#if PY_MAJOR_VERSION >= 3
+    if (unlikely(value == NULL || !PyUnicode_Check(value)))
+#else
+    if (unlikely(value == NULL || !PyString_Check(value)))
+#endif
+    {
+        PyErr_SetString(PyExc_TypeError,
+                        "__name__ must be set to a string object");
+        return -1;
+    }
+    tmp = op->func_name;
+    Py_INCREF(value);
+    op->func_name = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_qualname(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    Py_INCREF(op->func_qualname);
+    return op->func_qualname;
+}
+static int
+__Pyx_CyFunction_set_qualname(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp;
+#if PY_MAJOR_VERSION >= 3
+    if (unlikely(value == NULL || !PyUnicode_Check(value)))
+#else
+    if (unlikely(value == NULL || !PyString_Check(value)))
+#endif
+    {
+        PyErr_SetString(PyExc_TypeError,
+                        "__qualname__ must be set to a string object");
+        return -1;
+    }
+    tmp = op->func_qualname;
+    Py_INCREF(value);
+    op->func_qualname = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_self(__pyx_CyFunctionObject *m, CYTHON_UNUSED void *closure)
+{
+    PyObject *self;
+    self = m->func_closure;
+    if (self == NULL)
+        self = Py_None;
+    Py_INCREF(self);
+    return self;
+}
+static PyObject *
+__Pyx_CyFunction_get_dict(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    if (unlikely(op->func_dict == NULL)) {
+        op->func_dict = PyDict_New();
+        if (unlikely(op->func_dict == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_dict);
+    return op->func_dict;
+}
+static int
+__Pyx_CyFunction_set_dict(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp;
+    if (unlikely(value == NULL)) {
+        PyErr_SetString(PyExc_TypeError,
+               "function's dictionary may not be deleted");
+        return -1;
+    }
+    if (unlikely(!PyDict_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+               "setting function's dictionary to a non-dict");
+        return -1;
+    }
+    tmp = op->func_dict;
+    Py_INCREF(value);
+    op->func_dict = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_globals(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    Py_INCREF(op->func_globals);
+    return op->func_globals;
+}
+static PyObject *
+__Pyx_CyFunction_get_closure(CYTHON_UNUSED __pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+static PyObject *
+__Pyx_CyFunction_get_code(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    PyObject* result = (op->func_code) ? op->func_code : Py_None;
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_init_defaults(__pyx_CyFunctionObject *op) {
+    int result = 0;
+    PyObject *res = op->defaults_getter((PyObject *) op);
+    if (unlikely(!res))
+        return -1;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    op->defaults_tuple = PyTuple_GET_ITEM(res, 0);
+    Py_INCREF(op->defaults_tuple);
+    op->defaults_kwdict = PyTuple_GET_ITEM(res, 1);
+    Py_INCREF(op->defaults_kwdict);
+    #else
+    op->defaults_tuple = PySequence_ITEM(res, 0);
+    if (unlikely(!op->defaults_tuple)) result = -1;
+    else {
+        op->defaults_kwdict = PySequence_ITEM(res, 1);
+        if (unlikely(!op->defaults_kwdict)) result = -1;
+    }
+    #endif
+    Py_DECREF(res);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_defaults(__pyx_CyFunctionObject *op, PyObject* value, CYTHON_UNUSED void *context) {
+    PyObject* tmp;
+    if (!value) {
+        value = Py_None;
+    } else if (value != Py_None && !PyTuple_Check(value)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__defaults__ must be set to a tuple object");
+        return -1;
+    }
+    Py_INCREF(value);
+    tmp = op->defaults_tuple;
+    op->defaults_tuple = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_defaults(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context) {
+    PyObject* result = op->defaults_tuple;
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (__Pyx_CyFunction_init_defaults(op) < 0) return NULL;
+            result = op->defaults_tuple;
+        } else {
+            result = Py_None;
+        }
+    }
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_kwdefaults(__pyx_CyFunctionObject *op, PyObject* value, CYTHON_UNUSED void *context) {
+    PyObject* tmp;
+    if (!value) {
+        value = Py_None;
+    } else if (value != Py_None && !PyDict_Check(value)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__kwdefaults__ must be set to a dict object");
+        return -1;
+    }
+    Py_INCREF(value);
+    tmp = op->defaults_kwdict;
+    op->defaults_kwdict = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_kwdefaults(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context) {
+    PyObject* result = op->defaults_kwdict;
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (__Pyx_CyFunction_init_defaults(op) < 0) return NULL;
+            result = op->defaults_kwdict;
+        } else {
+            result = Py_None;
+        }
+    }
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_annotations(__pyx_CyFunctionObject *op, PyObject* value, CYTHON_UNUSED void *context) {
+    PyObject* tmp;
+    if (!value || value == Py_None) {
+        value = NULL;
+    } else if (!PyDict_Check(value)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__annotations__ must be set to a dict object");
+        return -1;
+    }
+    Py_XINCREF(value);
+    tmp = op->func_annotations;
+    op->func_annotations = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_annotations(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context) {
+    PyObject* result = op->func_annotations;
+    if (unlikely(!result)) {
+        result = PyDict_New();
+        if (unlikely(!result)) return NULL;
+        op->func_annotations = result;
+    }
+    Py_INCREF(result);
+    return result;
+}
+static PyGetSetDef __pyx_CyFunction_getsets[] = {
+    {(char *) "func_doc", (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {(char *) "__doc__",  (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {(char *) "func_name", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {(char *) "__name__", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {(char *) "__qualname__", (getter)__Pyx_CyFunction_get_qualname, (setter)__Pyx_CyFunction_set_qualname, 0, 0},
+    {(char *) "__self__", (getter)__Pyx_CyFunction_get_self, 0, 0, 0},
+    {(char *) "func_dict", (getter)__Pyx_CyFunction_get_dict, (setter)__Pyx_CyFunction_set_dict, 0, 0},
+    {(char *) "__dict__", (getter)__Pyx_CyFunction_get_dict, (setter)__Pyx_CyFunction_set_dict, 0, 0},
+    {(char *) "func_globals", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {(char *) "__globals__", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {(char *) "func_closure", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {(char *) "__closure__", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {(char *) "func_code", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {(char *) "__code__", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {(char *) "func_defaults", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {(char *) "__defaults__", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {(char *) "__kwdefaults__", (getter)__Pyx_CyFunction_get_kwdefaults, (setter)__Pyx_CyFunction_set_kwdefaults, 0, 0},
+    {(char *) "__annotations__", (getter)__Pyx_CyFunction_get_annotations, (setter)__Pyx_CyFunction_set_annotations, 0, 0},
+    {0, 0, 0, 0, 0}
+};
+static PyMemberDef __pyx_CyFunction_members[] = {
+    {(char *) "__module__", T_OBJECT, offsetof(PyCFunctionObject, m_module), PY_WRITE_RESTRICTED, 0},
+    {0, 0, 0,  0, 0}
+};
+static PyObject *
+__Pyx_CyFunction_reduce(__pyx_CyFunctionObject *m, CYTHON_UNUSED PyObject *args)
+{
+#if PY_MAJOR_VERSION >= 3
+    Py_INCREF(m->func_qualname);
+    return m->func_qualname;
+#else
+    return PyString_FromString(m->func.m_ml->ml_name);
+#endif
+}
+static PyMethodDef __pyx_CyFunction_methods[] = {
+    {"__reduce__", (PyCFunction)__Pyx_CyFunction_reduce, METH_VARARGS, 0},
+    {0, 0, 0, 0}
+};
+#if PY_VERSION_HEX < 0x030500A0
+#define __Pyx_CyFunction_weakreflist(cyfunc) ((cyfunc)->func_weakreflist)
+#else
+#define __Pyx_CyFunction_weakreflist(cyfunc) ((cyfunc)->func.m_weakreflist)
+#endif
+static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject *op, PyMethodDef *ml, int flags, PyObject* qualname,
+                                       PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    if (unlikely(op == NULL))
+        return NULL;
+    op->flags = flags;
+    __Pyx_CyFunction_weakreflist(op) = NULL;
+    op->func.m_ml = ml;
+    op->func.m_self = (PyObject *) op;
+    Py_XINCREF(closure);
+    op->func_closure = closure;
+    Py_XINCREF(module);
+    op->func.m_module = module;
+    op->func_dict = NULL;
+    op->func_name = NULL;
+    Py_INCREF(qualname);
+    op->func_qualname = qualname;
+    op->func_doc = NULL;
+    op->func_classobj = NULL;
+    op->func_globals = globals;
+    Py_INCREF(op->func_globals);
+    Py_XINCREF(code);
+    op->func_code = code;
+    op->defaults_pyobjects = 0;
+    op->defaults_size = 0;
+    op->defaults = NULL;
+    op->defaults_tuple = NULL;
+    op->defaults_kwdict = NULL;
+    op->defaults_getter = NULL;
+    op->func_annotations = NULL;
+    return (PyObject *) op;
+}
+static int
+__Pyx_CyFunction_clear(__pyx_CyFunctionObject *m)
+{
+    Py_CLEAR(m->func_closure);
+    Py_CLEAR(m->func.m_module);
+    Py_CLEAR(m->func_dict);
+    Py_CLEAR(m->func_name);
+    Py_CLEAR(m->func_qualname);
+    Py_CLEAR(m->func_doc);
+    Py_CLEAR(m->func_globals);
+    Py_CLEAR(m->func_code);
+    Py_CLEAR(m->func_classobj);
+    Py_CLEAR(m->defaults_tuple);
+    Py_CLEAR(m->defaults_kwdict);
+    Py_CLEAR(m->func_annotations);
+    if (m->defaults) {
+        PyObject **pydefaults = __Pyx_CyFunction_Defaults(PyObject *, m);
+        int i;
+        for (i = 0; i < m->defaults_pyobjects; i++)
+            Py_XDECREF(pydefaults[i]);
+        PyObject_Free(m->defaults);
+        m->defaults = NULL;
+    }
+    return 0;
+}
+static void __Pyx__CyFunction_dealloc(__pyx_CyFunctionObject *m)
+{
+    if (__Pyx_CyFunction_weakreflist(m) != NULL)
+        PyObject_ClearWeakRefs((PyObject *) m);
+    __Pyx_CyFunction_clear(m);
+    PyObject_GC_Del(m);
+}
+static void __Pyx_CyFunction_dealloc(__pyx_CyFunctionObject *m)
+{
+    PyObject_GC_UnTrack(m);
+    __Pyx__CyFunction_dealloc(m);
+}
+static int __Pyx_CyFunction_traverse(__pyx_CyFunctionObject *m, visitproc visit, void *arg)
+{
+    Py_VISIT(m->func_closure);
+    Py_VISIT(m->func.m_module);
+    Py_VISIT(m->func_dict);
+    Py_VISIT(m->func_name);
+    Py_VISIT(m->func_qualname);
+    Py_VISIT(m->func_doc);
+    Py_VISIT(m->func_globals);
+    Py_VISIT(m->func_code);
+    Py_VISIT(m->func_classobj);
+    Py_VISIT(m->defaults_tuple);
+    Py_VISIT(m->defaults_kwdict);
+    if (m->defaults) {
+        PyObject **pydefaults = __Pyx_CyFunction_Defaults(PyObject *, m);
+        int i;
+        for (i = 0; i < m->defaults_pyobjects; i++)
+            Py_VISIT(pydefaults[i]);
+    }
+    return 0;
+}
+static PyObject *__Pyx_CyFunction_descr_get(PyObject *func, PyObject *obj, PyObject *type)
+{
+#if PY_MAJOR_VERSION < 3
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    if (m->flags & __Pyx_CYFUNCTION_STATICMETHOD) {
+        Py_INCREF(func);
+        return func;
+    }
+    if (m->flags & __Pyx_CYFUNCTION_CLASSMETHOD) {
+        if (type == NULL)
+            type = (PyObject *)(Py_TYPE(obj));
+        return __Pyx_PyMethod_New(func, type, (PyObject *)(Py_TYPE(type)));
+    }
+    if (obj == Py_None)
+        obj = NULL;
+#endif
+    return __Pyx_PyMethod_New(func, obj, type);
+}
+static PyObject*
+__Pyx_CyFunction_repr(__pyx_CyFunctionObject *op)
+{
+#if PY_MAJOR_VERSION >= 3
+    return PyUnicode_FromFormat("<cyfunction %U at %p>",
+                                op->func_qualname, (void *)op);
+#else
+    return PyString_FromFormat("<cyfunction %s at %p>",
+                               PyString_AsString(op->func_qualname), (void *)op);
+#endif
+}
+static PyObject * __Pyx_CyFunction_CallMethod(PyObject *func, PyObject *self, PyObject *arg, PyObject *kw) {
+    PyCFunctionObject* f = (PyCFunctionObject*)func;
+    PyCFunction meth = f->m_ml->ml_meth;
+    Py_ssize_t size;
+    switch (f->m_ml->ml_flags & (METH_VARARGS | METH_KEYWORDS | METH_NOARGS | METH_O)) {
+    case METH_VARARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0))
+            return (*meth)(self, arg);
+        break;
+    case METH_VARARGS | METH_KEYWORDS:
+        return (*(PyCFunctionWithKeywords)(void*)meth)(self, arg, kw);
+    case METH_NOARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+            size = PyTuple_GET_SIZE(arg);
+            if (likely(size == 0))
+                return (*meth)(self, NULL);
+            PyErr_Format(PyExc_TypeError,
+                "%.200s() takes no arguments (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                f->m_ml->ml_name, size);
+            return NULL;
+        }
+        break;
+    case METH_O:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+            size = PyTuple_GET_SIZE(arg);
+            if (likely(size == 1)) {
+                PyObject *result, *arg0;
+                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                arg0 = PyTuple_GET_ITEM(arg, 0);
+                #else
+                arg0 = PySequence_ITEM(arg, 0); if (unlikely(!arg0)) return NULL;
+                #endif
+                result = (*meth)(self, arg0);
+                #if !(CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS)
+                Py_DECREF(arg0);
+                #endif
+                return result;
+            }
+            PyErr_Format(PyExc_TypeError,
+                "%.200s() takes exactly one argument (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                f->m_ml->ml_name, size);
+            return NULL;
+        }
+        break;
+    default:
+        PyErr_SetString(PyExc_SystemError, "Bad call flags in "
+                        "__Pyx_CyFunction_Call. METH_OLDARGS is no "
+                        "longer supported!");
+        return NULL;
+    }
+    PyErr_Format(PyExc_TypeError, "%.200s() takes no keyword arguments",
+                 f->m_ml->ml_name);
+    return NULL;
+}
+static CYTHON_INLINE PyObject *__Pyx_CyFunction_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    return __Pyx_CyFunction_CallMethod(func, ((PyCFunctionObject*)func)->m_self, arg, kw);
+}
+static PyObject *__Pyx_CyFunction_CallAsMethod(PyObject *func, PyObject *args, PyObject *kw) {
+    PyObject *result;
+    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *) func;
+    if ((cyfunc->flags & __Pyx_CYFUNCTION_CCLASS) && !(cyfunc->flags & __Pyx_CYFUNCTION_STATICMETHOD)) {
+        Py_ssize_t argc;
+        PyObject *new_args;
+        PyObject *self;
+        argc = PyTuple_GET_SIZE(args);
+        new_args = PyTuple_GetSlice(args, 1, argc);
+        if (unlikely(!new_args))
+            return NULL;
+        self = PyTuple_GetItem(args, 0);
+        if (unlikely(!self)) {
+            Py_DECREF(new_args);
+#if PY_MAJOR_VERSION > 2
+            PyErr_Format(PyExc_TypeError,
+                         "unbound method %.200S() needs an argument",
+                         cyfunc->func_qualname);
+#else
+            PyErr_SetString(PyExc_TypeError,
+                            "unbound method needs an argument");
+#endif
+            return NULL;
+        }
+        result = __Pyx_CyFunction_CallMethod(func, self, new_args, kw);
+        Py_DECREF(new_args);
+    } else {
+        result = __Pyx_CyFunction_Call(func, args, kw);
+    }
+    return result;
+}
+static PyTypeObject __pyx_CyFunctionType_type = {
+    PyVarObject_HEAD_INIT(0, 0)
+    "cython_function_or_method",
+    sizeof(__pyx_CyFunctionObject),
+    0,
+    (destructor) __Pyx_CyFunction_dealloc,
+    0,
+    0,
+    0,
+#if PY_MAJOR_VERSION < 3
+    0,
+#else
+    0,
+#endif
+    (reprfunc) __Pyx_CyFunction_repr,
+    0,
+    0,
+    0,
+    0,
+    __Pyx_CyFunction_CallAsMethod,
+    0,
+    0,
+    0,
+    0,
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,
+    0,
+    (traverseproc) __Pyx_CyFunction_traverse,
+    (inquiry) __Pyx_CyFunction_clear,
+    0,
+#if PY_VERSION_HEX < 0x030500A0
+    offsetof(__pyx_CyFunctionObject, func_weakreflist),
+#else
+    offsetof(PyCFunctionObject, m_weakreflist),
+#endif
+    0,
+    0,
+    __pyx_CyFunction_methods,
+    __pyx_CyFunction_members,
+    __pyx_CyFunction_getsets,
+    0,
+    0,
+    __Pyx_CyFunction_descr_get,
+    0,
+    offsetof(__pyx_CyFunctionObject, func_dict),
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+#if PY_VERSION_HEX >= 0x030400a1
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030C0000
+    0,
+#endif
+#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+    0,
+#endif
+};
+static int __pyx_CyFunction_init(void) {
+    __pyx_CyFunctionType = __Pyx_FetchCommonType(&__pyx_CyFunctionType_type);
+    if (unlikely(__pyx_CyFunctionType == NULL)) {
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_INLINE void *__Pyx_CyFunction_InitDefaults(PyObject *func, size_t size, int pyobjects) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults = PyObject_Malloc(size);
+    if (unlikely(!m->defaults))
+        return PyErr_NoMemory();
+    memset(m->defaults, 0, size);
+    m->defaults_pyobjects = pyobjects;
+    m->defaults_size = size;
+    return m->defaults;
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *func, PyObject *tuple) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults_tuple = tuple;
+    Py_INCREF(tuple);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults_kwdict = dict;
+    Py_INCREF(dict);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->func_annotations = dict;
+    Py_INCREF(dict);
+}
+
+/* CythonFunction */
+static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml, int flags, PyObject* qualname,
+                                      PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    PyObject *op = __Pyx_CyFunction_Init(
+        PyObject_GC_New(__pyx_CyFunctionObject, __pyx_CyFunctionType),
+        ml, flags, qualname, closure, module, globals, code
+    );
+    if (likely(op)) {
+        PyObject_GC_Track(op);
+    }
+    return op;
+}
+
+/* CalculateMetaclass */
+static PyObject *__Pyx_CalculateMetaclass(PyTypeObject *metaclass, PyObject *bases) {
+    Py_ssize_t i, nbases = PyTuple_GET_SIZE(bases);
+    for (i=0; i < nbases; i++) {
+        PyTypeObject *tmptype;
+        PyObject *tmp = PyTuple_GET_ITEM(bases, i);
+        tmptype = Py_TYPE(tmp);
+#if PY_MAJOR_VERSION < 3
+        if (tmptype == &PyClass_Type)
+            continue;
+#endif
+        if (!metaclass) {
+            metaclass = tmptype;
+            continue;
+        }
+        if (PyType_IsSubtype(metaclass, tmptype))
+            continue;
+        if (PyType_IsSubtype(tmptype, metaclass)) {
+            metaclass = tmptype;
+            continue;
+        }
+        PyErr_SetString(PyExc_TypeError,
+                        "metaclass conflict: "
+                        "the metaclass of a derived class "
+                        "must be a (non-strict) subclass "
+                        "of the metaclasses of all its bases");
+        return NULL;
+    }
+    if (!metaclass) {
+#if PY_MAJOR_VERSION < 3
+        metaclass = &PyClass_Type;
+#else
+        metaclass = &PyType_Type;
+#endif
+    }
+    Py_INCREF((PyObject*) metaclass);
+    return (PyObject*) metaclass;
+}
+
+/* Py3ClassCreate */
+static PyObject *__Pyx_Py3MetaclassPrepare(PyObject *metaclass, PyObject *bases, PyObject *name,
+                                           PyObject *qualname, PyObject *mkw, PyObject *modname, PyObject *doc) {
+    PyObject *ns;
+    if (metaclass) {
+        PyObject *prep = __Pyx_PyObject_GetAttrStr(metaclass, __pyx_n_s_prepare);
+        if (prep) {
+            PyObject *pargs = PyTuple_Pack(2, name, bases);
+            if (unlikely(!pargs)) {
+                Py_DECREF(prep);
+                return NULL;
+            }
+            ns = PyObject_Call(prep, pargs, mkw);
+            Py_DECREF(prep);
+            Py_DECREF(pargs);
+        } else {
+            if (unlikely(!PyErr_ExceptionMatches(PyExc_AttributeError)))
+                return NULL;
+            PyErr_Clear();
+            ns = PyDict_New();
+        }
+    } else {
+        ns = PyDict_New();
+    }
+    if (unlikely(!ns))
+        return NULL;
+    if (unlikely(PyObject_SetItem(ns, __pyx_n_s_module, modname) < 0)) goto bad;
+    if (unlikely(PyObject_SetItem(ns, __pyx_n_s_qualname, qualname) < 0)) goto bad;
+    if (unlikely(doc && PyObject_SetItem(ns, __pyx_n_s_doc, doc) < 0)) goto bad;
+    return ns;
+bad:
+    Py_DECREF(ns);
+    return NULL;
+}
+static PyObject *__Pyx_Py3ClassCreate(PyObject *metaclass, PyObject *name, PyObject *bases,
+                                      PyObject *dict, PyObject *mkw,
+                                      int calculate_metaclass, int allow_py2_metaclass) {
+    PyObject *result, *margs;
+    PyObject *owned_metaclass = NULL;
+    if (allow_py2_metaclass) {
+        owned_metaclass = PyObject_GetItem(dict, __pyx_n_s_metaclass);
+        if (owned_metaclass) {
+            metaclass = owned_metaclass;
+        } else if (likely(PyErr_ExceptionMatches(PyExc_KeyError))) {
+            PyErr_Clear();
+        } else {
+            return NULL;
+        }
+    }
+    if (calculate_metaclass && (!metaclass || PyType_Check(metaclass))) {
+        metaclass = __Pyx_CalculateMetaclass((PyTypeObject*) metaclass, bases);
+        Py_XDECREF(owned_metaclass);
+        if (unlikely(!metaclass))
+            return NULL;
+        owned_metaclass = metaclass;
+    }
+    margs = PyTuple_Pack(3, name, bases, dict);
+    if (unlikely(!margs)) {
+        result = NULL;
+    } else {
+        result = PyObject_Call(metaclass, margs, mkw);
+        Py_DECREF(margs);
+    }
+    Py_XDECREF(owned_metaclass);
+    return result;
+}
+
+/* IterFinish */
+static CYTHON_INLINE int __Pyx_IterFinish(void) {
+#if CYTHON_FAST_THREAD_STATE
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject* exc_type = tstate->curexc_type;
+    if (unlikely(exc_type)) {
+        if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) {
+            PyObject *exc_value, *exc_tb;
+            exc_value = tstate->curexc_value;
+            exc_tb = tstate->curexc_traceback;
+            tstate->curexc_type = 0;
+            tstate->curexc_value = 0;
+            tstate->curexc_traceback = 0;
+            Py_DECREF(exc_type);
+            Py_XDECREF(exc_value);
+            Py_XDECREF(exc_tb);
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#else
+    if (unlikely(PyErr_Occurred())) {
+        if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) {
+            PyErr_Clear();
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#endif
+}
+
+/* PyObjectGetMethod */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method) {
+    PyObject *attr;
+#if CYTHON_UNPACK_METHODS && CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_PYTYPE_LOOKUP
+    PyTypeObject *tp = Py_TYPE(obj);
+    PyObject *descr;
+    descrgetfunc f = NULL;
+    PyObject **dictptr, *dict;
+    int meth_found = 0;
+    assert (*method == NULL);
+    if (unlikely(tp->tp_getattro != PyObject_GenericGetAttr)) {
+        attr = __Pyx_PyObject_GetAttrStr(obj, name);
+        goto try_unpack;
+    }
+    if (unlikely(tp->tp_dict == NULL) && unlikely(PyType_Ready(tp) < 0)) {
+        return 0;
+    }
+    descr = _PyType_Lookup(tp, name);
+    if (likely(descr != NULL)) {
+        Py_INCREF(descr);
+#if PY_MAJOR_VERSION >= 3
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type)))
+        #endif
+#else
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr)))
+        #endif
+#endif
+        {
+            meth_found = 1;
+        } else {
+            f = Py_TYPE(descr)->tp_descr_get;
+            if (f != NULL && PyDescr_IsData(descr)) {
+                attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+                Py_DECREF(descr);
+                goto try_unpack;
+            }
+        }
+    }
+    dictptr = _PyObject_GetDictPtr(obj);
+    if (dictptr != NULL && (dict = *dictptr) != NULL) {
+        Py_INCREF(dict);
+        attr = __Pyx_PyDict_GetItemStr(dict, name);
+        if (attr != NULL) {
+            Py_INCREF(attr);
+            Py_DECREF(dict);
+            Py_XDECREF(descr);
+            goto try_unpack;
+        }
+        Py_DECREF(dict);
+    }
+    if (meth_found) {
+        *method = descr;
+        return 1;
+    }
+    if (f != NULL) {
+        attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+        Py_DECREF(descr);
+        goto try_unpack;
+    }
+    if (descr != NULL) {
+        *method = descr;
+        return 0;
+    }
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(name));
+#endif
+    return 0;
+#else
+    attr = __Pyx_PyObject_GetAttrStr(obj, name);
+    goto try_unpack;
+#endif
+try_unpack:
+#if CYTHON_UNPACK_METHODS
+    if (likely(attr) && PyMethod_Check(attr) && likely(PyMethod_GET_SELF(attr) == obj)) {
+        PyObject *function = PyMethod_GET_FUNCTION(attr);
+        Py_INCREF(function);
+        Py_DECREF(attr);
+        *method = function;
+        return 1;
+    }
+#endif
+    *method = attr;
+    return 0;
+}
+
+/* PyObjectCallMethod0 */
+static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name) {
+    PyObject *method = NULL, *result = NULL;
+    int is_method = __Pyx_PyObject_GetMethod(obj, method_name, &method);
+    if (likely(is_method)) {
+        result = __Pyx_PyObject_CallOneArg(method, obj);
+        Py_DECREF(method);
+        return result;
+    }
+    if (unlikely(!method)) goto bad;
+    result = __Pyx_PyObject_CallNoArg(method);
+    Py_DECREF(method);
+bad:
+    return result;
+}
+
+/* RaiseNeedMoreValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+    PyErr_Format(PyExc_ValueError,
+                 "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
+                 index, (index == 1) ? "" : "s");
+}
+
+/* RaiseTooManyValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
+    PyErr_Format(PyExc_ValueError,
+                 "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
+}
+
+/* UnpackItemEndCheck */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
+    if (unlikely(retval)) {
+        Py_DECREF(retval);
+        __Pyx_RaiseTooManyValuesError(expected);
+        return -1;
+    }
+    return __Pyx_IterFinish();
+}
+
+/* RaiseNoneIterError */
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+}
+
+/* UnpackTupleError */
+static void __Pyx_UnpackTupleError(PyObject *t, Py_ssize_t index) {
+    if (t == Py_None) {
+      __Pyx_RaiseNoneNotIterableError();
+    } else if (PyTuple_GET_SIZE(t) < index) {
+      __Pyx_RaiseNeedMoreValuesError(PyTuple_GET_SIZE(t));
+    } else {
+      __Pyx_RaiseTooManyValuesError(index);
+    }
+}
+
+/* UnpackTuple2 */
+static CYTHON_INLINE int __Pyx_unpack_tuple2_exact(
+        PyObject* tuple, PyObject** pvalue1, PyObject** pvalue2, int decref_tuple) {
+    PyObject *value1 = NULL, *value2 = NULL;
+#if CYTHON_COMPILING_IN_PYPY
+    value1 = PySequence_ITEM(tuple, 0);  if (unlikely(!value1)) goto bad;
+    value2 = PySequence_ITEM(tuple, 1);  if (unlikely(!value2)) goto bad;
+#else
+    value1 = PyTuple_GET_ITEM(tuple, 0);  Py_INCREF(value1);
+    value2 = PyTuple_GET_ITEM(tuple, 1);  Py_INCREF(value2);
+#endif
+    if (decref_tuple) {
+        Py_DECREF(tuple);
+    }
+    *pvalue1 = value1;
+    *pvalue2 = value2;
+    return 0;
+#if CYTHON_COMPILING_IN_PYPY
+bad:
+    Py_XDECREF(value1);
+    Py_XDECREF(value2);
+    if (decref_tuple) { Py_XDECREF(tuple); }
+    return -1;
+#endif
+}
+static int __Pyx_unpack_tuple2_generic(PyObject* tuple, PyObject** pvalue1, PyObject** pvalue2,
+                                       int has_known_size, int decref_tuple) {
+    Py_ssize_t index;
+    PyObject *value1 = NULL, *value2 = NULL, *iter = NULL;
+    iternextfunc iternext;
+    iter = PyObject_GetIter(tuple);
+    if (unlikely(!iter)) goto bad;
+    if (decref_tuple) { Py_DECREF(tuple); tuple = NULL; }
+    iternext = Py_TYPE(iter)->tp_iternext;
+    value1 = iternext(iter); if (unlikely(!value1)) { index = 0; goto unpacking_failed; }
+    value2 = iternext(iter); if (unlikely(!value2)) { index = 1; goto unpacking_failed; }
+    if (!has_known_size && unlikely(__Pyx_IternextUnpackEndCheck(iternext(iter), 2))) goto bad;
+    Py_DECREF(iter);
+    *pvalue1 = value1;
+    *pvalue2 = value2;
+    return 0;
+unpacking_failed:
+    if (!has_known_size && __Pyx_IterFinish() == 0)
+        __Pyx_RaiseNeedMoreValuesError(index);
+bad:
+    Py_XDECREF(iter);
+    Py_XDECREF(value1);
+    Py_XDECREF(value2);
+    if (decref_tuple) { Py_XDECREF(tuple); }
+    return -1;
+}
+
+/* dict_iter */
+static CYTHON_INLINE PyObject* __Pyx_dict_iterator(PyObject* iterable, int is_dict, PyObject* method_name,
+                                                   Py_ssize_t* p_orig_length, int* p_source_is_dict) {
+    is_dict = is_dict || likely(PyDict_CheckExact(iterable));
+    *p_source_is_dict = is_dict;
+    if (is_dict) {
+#if !CYTHON_COMPILING_IN_PYPY
+        *p_orig_length = PyDict_Size(iterable);
+        Py_INCREF(iterable);
+        return iterable;
+#elif PY_MAJOR_VERSION >= 3
+        static PyObject *py_items = NULL, *py_keys = NULL, *py_values = NULL;
+        PyObject **pp = NULL;
+        if (method_name) {
+            const char *name = PyUnicode_AsUTF8(method_name);
+            if (strcmp(name, "iteritems") == 0) pp = &py_items;
+            else if (strcmp(name, "iterkeys") == 0) pp = &py_keys;
+            else if (strcmp(name, "itervalues") == 0) pp = &py_values;
+            if (pp) {
+                if (!*pp) {
+                    *pp = PyUnicode_FromString(name + 4);
+                    if (!*pp)
+                        return NULL;
+                }
+                method_name = *pp;
+            }
+        }
+#endif
+    }
+    *p_orig_length = 0;
+    if (method_name) {
+        PyObject* iter;
+        iterable = __Pyx_PyObject_CallMethod0(iterable, method_name);
+        if (!iterable)
+            return NULL;
+#if !CYTHON_COMPILING_IN_PYPY
+        if (PyTuple_CheckExact(iterable) || PyList_CheckExact(iterable))
+            return iterable;
+#endif
+        iter = PyObject_GetIter(iterable);
+        Py_DECREF(iterable);
+        return iter;
+    }
+    return PyObject_GetIter(iterable);
+}
+static CYTHON_INLINE int __Pyx_dict_iter_next(
+        PyObject* iter_obj, CYTHON_NCP_UNUSED Py_ssize_t orig_length, CYTHON_NCP_UNUSED Py_ssize_t* ppos,
+        PyObject** pkey, PyObject** pvalue, PyObject** pitem, int source_is_dict) {
+    PyObject* next_item;
+#if !CYTHON_COMPILING_IN_PYPY
+    if (source_is_dict) {
+        PyObject *key, *value;
+        if (unlikely(orig_length != PyDict_Size(iter_obj))) {
+            PyErr_SetString(PyExc_RuntimeError, "dictionary changed size during iteration");
+            return -1;
+        }
+        if (unlikely(!PyDict_Next(iter_obj, ppos, &key, &value))) {
+            return 0;
+        }
+        if (pitem) {
+            PyObject* tuple = PyTuple_New(2);
+            if (unlikely(!tuple)) {
+                return -1;
+            }
+            Py_INCREF(key);
+            Py_INCREF(value);
+            PyTuple_SET_ITEM(tuple, 0, key);
+            PyTuple_SET_ITEM(tuple, 1, value);
+            *pitem = tuple;
+        } else {
+            if (pkey) {
+                Py_INCREF(key);
+                *pkey = key;
+            }
+            if (pvalue) {
+                Py_INCREF(value);
+                *pvalue = value;
+            }
+        }
+        return 1;
+    } else if (PyTuple_CheckExact(iter_obj)) {
+        Py_ssize_t pos = *ppos;
+        if (unlikely(pos >= PyTuple_GET_SIZE(iter_obj))) return 0;
+        *ppos = pos + 1;
+        next_item = PyTuple_GET_ITEM(iter_obj, pos);
+        Py_INCREF(next_item);
+    } else if (PyList_CheckExact(iter_obj)) {
+        Py_ssize_t pos = *ppos;
+        if (unlikely(pos >= PyList_GET_SIZE(iter_obj))) return 0;
+        *ppos = pos + 1;
+        next_item = PyList_GET_ITEM(iter_obj, pos);
+        Py_INCREF(next_item);
+    } else
+#endif
+    {
+        next_item = PyIter_Next(iter_obj);
+        if (unlikely(!next_item)) {
+            return __Pyx_IterFinish();
+        }
+    }
+    if (pitem) {
+        *pitem = next_item;
+    } else if (pkey && pvalue) {
+        if (__Pyx_unpack_tuple2(next_item, pkey, pvalue, source_is_dict, source_is_dict, 1))
+            return -1;
+    } else if (pkey) {
+        *pkey = next_item;
+    } else {
+        *pvalue = next_item;
+    }
+    return 1;
+}
+
+/* GetItemInt */
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return m->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+}
+
+/* CLineInTraceback */
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
+    }
+    if (!use_cline) {
+        c_line = 0;
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+    }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
+    }
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
+    }
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
+}
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
+    py_srcfile = PyString_FromString(filename);
+    if (!py_srcfile) goto bad;
+    #endif
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        if (!py_funcname) goto bad;
+        #endif
+    }
+    #if PY_MAJOR_VERSION < 3
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            long val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (long) -1;
+        }
+    } else {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = a->tp_base;
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
+        }
+    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
+}
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    int res = exc_type1 ? __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type1) : 0;
+    if (!res) {
+        res = __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+    return res;
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
+        char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
+        PyOS_snprintf(message, sizeof(message),
+                      "compiletime version %s of module '%.100s' "
+                      "does not match runtime version %s",
+                      ctversion, __Pyx_MODULE_NAME, rtversion);
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+    return 0;
+}
+
+/* FunctionExport */
+static int __Pyx_ExportFunction(const char *name, void (*f)(void), const char *sig) {
+    PyObject *d = 0;
+    PyObject *cobj = 0;
+    union {
+        void (*fp)(void);
+        void *p;
+    } tmp;
+    d = PyObject_GetAttrString(__pyx_m, (char *)"__pyx_capi__");
+    if (!d) {
+        PyErr_Clear();
+        d = PyDict_New();
+        if (!d)
+            goto bad;
+        Py_INCREF(d);
+        if (PyModule_AddObject(__pyx_m, (char *)"__pyx_capi__", d) < 0)
+            goto bad;
+    }
+    tmp.fp = f;
+#if PY_VERSION_HEX >= 0x02070000
+    cobj = PyCapsule_New(tmp.p, sig, 0);
+#else
+    cobj = PyCObject_FromVoidPtrAndDesc(tmp.p, (void *)sig, 0);
+#endif
+    if (!cobj)
+        goto bad;
+    if (PyDict_SetItemString(d, name, cobj) < 0)
+        goto bad;
+    Py_DECREF(cobj);
+    Py_DECREF(d);
+    return 0;
+bad:
+    Py_XDECREF(cobj);
+    Py_XDECREF(d);
+    return -1;
+}
+
+/* InitStrings */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+    while (t->p) {
+        #if PY_MAJOR_VERSION < 3
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        #else
+        if (t->is_unicode | t->is_str) {
+            if (t->intern) {
+                *t->p = PyUnicode_InternFromString(t->s);
+            } else if (t->encoding) {
+                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
+            } else {
+                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
+            }
+        } else {
+            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
+        }
+        #endif
+        if (!*t->p)
+            return -1;
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
+        ++t;
+    }
+    return 0;
+}
+
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
+            }
+        }
+    }
+#endif
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
+#else
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
+#endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    if (PyByteArray_Check(o)) {
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+    } else
+#endif
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type %.200s).  "
+                "The ability to return an instance of a strict subclass of int "
+                "is deprecated, and may be removed in a future version of Python.",
+                Py_TYPE(result)->tp_name)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type %.200s)",
+                 type_name, type_name, Py_TYPE(result)->tp_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
+#else
+  if (likely(PyLong_Check(x)))
+#endif
+    return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  #if PY_MAJOR_VERSION < 3
+  if (m && m->nb_int) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = m->nb_long(x);
+  }
+  #else
+  if (likely(m && m->nb_int)) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
+  }
+#endif
+  if (likely(res)) {
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
+#else
+    if (unlikely(!PyLong_CheckExact(res))) {
+#endif
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(b);
+  }
+#endif
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    const digit* digits = ((PyLongObject*)b)->ob_digit;
+    const Py_ssize_t size = Py_SIZE(b);
+    if (likely(__Pyx_sst_abs(size) <= 1)) {
+        ival = likely(size) ? digits[0] : 0;
+        if (size == -1) ival = -ival;
+        return ival;
+    } else {
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+    return PyInt_FromSize_t(ival);
+}
+
+
+#endif /* Py_PYTHON_H */
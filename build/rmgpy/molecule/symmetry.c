@@ -0,0 +1,19480 @@
+/* Generated by Cython 0.29.37 */
+
+/* BEGIN: Cython Metadata
+{
+    "distutils": {
+        "include_dirs": [
+            "."
+        ],
+        "name": "rmgpy.molecule.symmetry",
+        "sources": [
+            "rmgpy/molecule/symmetry.py"
+        ]
+    },
+    "module_name": "rmgpy.molecule.symmetry"
+}
+END: Cython Metadata */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.6+ or Python 3.3+.
+#else
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
+#define CYTHON_FUTURE_DIVISION 1
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #if PY_VERSION_HEX >= 0x02070000
+    #define HAVE_LONG_LONG
+  #endif
+#endif
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#ifdef PYPY_VERSION
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PYSTON_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #elif !defined(CYTHON_USE_PYTYPE_LOOKUP)
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
+  #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+#endif
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_MAYBE_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_MAYBE_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+           typedef unsigned char     uint8_t;
+           typedef unsigned int      uint32_t;
+        #else
+           typedef unsigned __int8   uint8_t;
+           typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
+#else
+   #include <stdint.h>
+#endif
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus) && __cplusplus >= 201103L
+    #if __has_cpp_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH [[fallthrough]]
+    #elif __has_cpp_attribute(clang::fallthrough)
+      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+    #elif __has_cpp_attribute(gnu::fallthrough)
+      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__ ) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyClass_Type
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+  #define __Pyx_DefaultClassType PyType_Type
+#endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+#endif
+#if CYTHON_FAST_PYCCALL
+#define __Pyx_PyFastCFunction_Check(func)\
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
+#else
+#define __Pyx_PyFastCFunction_Check(func) 0
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
+#if CYTHON_COMPILING_IN_PYSTON
+  #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if !CYTHON_FAST_THREAD_STATE || PY_VERSION_HEX < 0x02070000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0;
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStr(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+#else
+#define __Pyx_PyDict_GetItemStr(dict, name)  PyDict_GetItem(dict, name)
+#endif
+#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
+  #define CYTHON_PEP393_ENABLED 1
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+#else
+  #define CYTHON_PEP393_ENABLED 0
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
+  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
+  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyByteArray_Check)
+  #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
+  #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
+#else
+  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
+#endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyStringObject               PyUnicodeObject
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_Check               PyUnicode_Check
+  #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
+  #define PyObject_Unicode             PyObject_Str
+#endif
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
+  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
+#else
+  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
+  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
+#endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+#else
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyIntObject                  PyLongObject
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define PyNumber_Int                 PyNumber_Long
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBoolObject                 PyLongObject
+#endif
+#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
+  #ifndef PyUnicode_InternFromString
+    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+  #endif
+#endif
+#if PY_VERSION_HEX < 0x030200A4
+  typedef long Py_hash_t;
+  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
+#else
+  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
+#else
+  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
+#endif
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #else
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #endif
+#else
+  #define __Pyx_PyType_AsAsync(obj) NULL
+#endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
+#endif
+
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#ifdef NAN
+#define __PYX_NAN() ((float) NAN)
+#else
+static CYTHON_INLINE float __PYX_NAN() {
+  float value;
+  memset(&value, 0xFF, sizeof(value));
+  return value;
+}
+#endif
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifndef __PYX_EXTERN_C
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#define __PYX_HAVE__rmgpy__molecule__symmetry
+#define __PYX_HAVE_API__rmgpy__molecule__symmetry
+/* Early includes */
+#include <string.h>
+#include <stdio.h>
+#include "numpy/arrayobject.h"
+#include "numpy/ndarrayobject.h"
+#include "numpy/ndarraytypes.h"
+#include "numpy/arrayscalars.h"
+#include "numpy/ufuncobject.h"
+
+    /* NumPy API declarations from "numpy/__init__.pxd" */
+    
+#include "pythread.h"
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
+                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
+
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#else
+    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
+#endif
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
+    const Py_UNICODE *u_end = u;
+    while (*u_end++) ;
+    return (size_t)(u_end - u - 1);
+}
+#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
+#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#else
+#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#endif
+#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#define __Pyx_PyNumber_Float(x) (PyFloat_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Float(x))
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+static int __Pyx_sys_getdefaultencoding_not_ascii;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    PyObject* ascii_chars_u = NULL;
+    PyObject* ascii_chars_b = NULL;
+    const char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    if (strcmp(default_encoding_c, "ascii") == 0) {
+        __Pyx_sys_getdefaultencoding_not_ascii = 0;
+    } else {
+        char ascii_chars[128];
+        int c;
+        for (c = 0; c < 128; c++) {
+            ascii_chars[c] = c;
+        }
+        __Pyx_sys_getdefaultencoding_not_ascii = 1;
+        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
+        if (!ascii_chars_u) goto bad;
+        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
+        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
+                default_encoding_c);
+            goto bad;
+        }
+        Py_DECREF(ascii_chars_u);
+        Py_DECREF(ascii_chars_b);
+    }
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    Py_XDECREF(ascii_chars_u);
+    Py_XDECREF(ascii_chars_b);
+    return -1;
+}
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#else
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+static char* __PYX_DEFAULT_STRING_ENCODING;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
+    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
+    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    return -1;
+}
+#endif
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+
+static PyObject *__pyx_m = NULL;
+static PyObject *__pyx_d;
+static PyObject *__pyx_b;
+static PyObject *__pyx_cython_runtime = NULL;
+static PyObject *__pyx_empty_tuple;
+static PyObject *__pyx_empty_bytes;
+static PyObject *__pyx_empty_unicode;
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm= __FILE__;
+static const char *__pyx_filename;
+
+/* Header.proto */
+#if !defined(CYTHON_CCOMPLEX)
+  #if defined(__cplusplus)
+    #define CYTHON_CCOMPLEX 1
+  #elif (defined(_Complex_I) && !defined(_MSC_VER))
+    #define CYTHON_CCOMPLEX 1
+  #else
+    #define CYTHON_CCOMPLEX 0
+  #endif
+#endif
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    #include <complex>
+  #else
+    #include <complex.h>
+  #endif
+#endif
+#if CYTHON_CCOMPLEX && !defined(__cplusplus) && defined(__sun__) && defined(__GNUC__)
+  #undef _Complex_I
+  #define _Complex_I 1.0fj
+#endif
+
+
+static const char *__pyx_f[] = {
+  "rmgpy/molecule/symmetry.py",
+  "__init__.pxd",
+  "type.pxd",
+  "bool.pxd",
+  "complex.pxd",
+  "rmgpy/molecule/graph.pxd",
+  "rmgpy/molecule/atomtype.pxd",
+  "rmgpy/molecule/group.pxd",
+  "rmgpy/molecule/element.pxd",
+  "rmgpy/molecule/molecule.pxd",
+};
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":688
+ * # in Cython to enable them only on the right systems.
+ * 
+ * ctypedef npy_int8       int8_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_int16      int16_t
+ * ctypedef npy_int32      int32_t
+ */
+typedef npy_int8 __pyx_t_5numpy_int8_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":689
+ * 
+ * ctypedef npy_int8       int8_t
+ * ctypedef npy_int16      int16_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_int32      int32_t
+ * ctypedef npy_int64      int64_t
+ */
+typedef npy_int16 __pyx_t_5numpy_int16_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":690
+ * ctypedef npy_int8       int8_t
+ * ctypedef npy_int16      int16_t
+ * ctypedef npy_int32      int32_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_int64      int64_t
+ * #ctypedef npy_int96      int96_t
+ */
+typedef npy_int32 __pyx_t_5numpy_int32_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":691
+ * ctypedef npy_int16      int16_t
+ * ctypedef npy_int32      int32_t
+ * ctypedef npy_int64      int64_t             # <<<<<<<<<<<<<<
+ * #ctypedef npy_int96      int96_t
+ * #ctypedef npy_int128     int128_t
+ */
+typedef npy_int64 __pyx_t_5numpy_int64_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":695
+ * #ctypedef npy_int128     int128_t
+ * 
+ * ctypedef npy_uint8      uint8_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uint16     uint16_t
+ * ctypedef npy_uint32     uint32_t
+ */
+typedef npy_uint8 __pyx_t_5numpy_uint8_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":696
+ * 
+ * ctypedef npy_uint8      uint8_t
+ * ctypedef npy_uint16     uint16_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uint32     uint32_t
+ * ctypedef npy_uint64     uint64_t
+ */
+typedef npy_uint16 __pyx_t_5numpy_uint16_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":697
+ * ctypedef npy_uint8      uint8_t
+ * ctypedef npy_uint16     uint16_t
+ * ctypedef npy_uint32     uint32_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uint64     uint64_t
+ * #ctypedef npy_uint96     uint96_t
+ */
+typedef npy_uint32 __pyx_t_5numpy_uint32_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":698
+ * ctypedef npy_uint16     uint16_t
+ * ctypedef npy_uint32     uint32_t
+ * ctypedef npy_uint64     uint64_t             # <<<<<<<<<<<<<<
+ * #ctypedef npy_uint96     uint96_t
+ * #ctypedef npy_uint128    uint128_t
+ */
+typedef npy_uint64 __pyx_t_5numpy_uint64_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":702
+ * #ctypedef npy_uint128    uint128_t
+ * 
+ * ctypedef npy_float32    float32_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_float64    float64_t
+ * #ctypedef npy_float80    float80_t
+ */
+typedef npy_float32 __pyx_t_5numpy_float32_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":703
+ * 
+ * ctypedef npy_float32    float32_t
+ * ctypedef npy_float64    float64_t             # <<<<<<<<<<<<<<
+ * #ctypedef npy_float80    float80_t
+ * #ctypedef npy_float128   float128_t
+ */
+typedef npy_float64 __pyx_t_5numpy_float64_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":712
+ * # The int types are mapped a bit surprising --
+ * # numpy.int corresponds to 'l' and numpy.long to 'q'
+ * ctypedef npy_long       int_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_longlong   longlong_t
+ * 
+ */
+typedef npy_long __pyx_t_5numpy_int_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":713
+ * # numpy.int corresponds to 'l' and numpy.long to 'q'
+ * ctypedef npy_long       int_t
+ * ctypedef npy_longlong   longlong_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_ulong      uint_t
+ */
+typedef npy_longlong __pyx_t_5numpy_longlong_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":715
+ * ctypedef npy_longlong   longlong_t
+ * 
+ * ctypedef npy_ulong      uint_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_ulonglong  ulonglong_t
+ * 
+ */
+typedef npy_ulong __pyx_t_5numpy_uint_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":716
+ * 
+ * ctypedef npy_ulong      uint_t
+ * ctypedef npy_ulonglong  ulonglong_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_intp       intp_t
+ */
+typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":718
+ * ctypedef npy_ulonglong  ulonglong_t
+ * 
+ * ctypedef npy_intp       intp_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uintp      uintp_t
+ * 
+ */
+typedef npy_intp __pyx_t_5numpy_intp_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":719
+ * 
+ * ctypedef npy_intp       intp_t
+ * ctypedef npy_uintp      uintp_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_double     float_t
+ */
+typedef npy_uintp __pyx_t_5numpy_uintp_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":721
+ * ctypedef npy_uintp      uintp_t
+ * 
+ * ctypedef npy_double     float_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_double     double_t
+ * ctypedef npy_longdouble longdouble_t
+ */
+typedef npy_double __pyx_t_5numpy_float_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":722
+ * 
+ * ctypedef npy_double     float_t
+ * ctypedef npy_double     double_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_longdouble longdouble_t
+ * 
+ */
+typedef npy_double __pyx_t_5numpy_double_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":723
+ * ctypedef npy_double     float_t
+ * ctypedef npy_double     double_t
+ * ctypedef npy_longdouble longdouble_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_cfloat      cfloat_t
+ */
+typedef npy_longdouble __pyx_t_5numpy_longdouble_t;
+/* Declarations.proto */
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    typedef ::std::complex< float > __pyx_t_float_complex;
+  #else
+    typedef float _Complex __pyx_t_float_complex;
+  #endif
+#else
+    typedef struct { float real, imag; } __pyx_t_float_complex;
+#endif
+static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float, float);
+
+/* Declarations.proto */
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    typedef ::std::complex< double > __pyx_t_double_complex;
+  #else
+    typedef double _Complex __pyx_t_double_complex;
+  #endif
+#else
+    typedef struct { double real, imag; } __pyx_t_double_complex;
+#endif
+static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double, double);
+
+
+/*--- Type declarations ---*/
+struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex;
+struct __pyx_obj_5rmgpy_8molecule_5graph_Edge;
+struct __pyx_obj_5rmgpy_8molecule_5graph_Graph;
+struct __pyx_obj_5rmgpy_8molecule_8atomtype_AtomType;
+struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom;
+struct __pyx_obj_5rmgpy_8molecule_5group_GroupBond;
+struct __pyx_obj_5rmgpy_8molecule_5group_Group;
+struct __pyx_obj_5rmgpy_8molecule_7element_Element;
+struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom;
+struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond;
+struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":725
+ * ctypedef npy_longdouble longdouble_t
+ * 
+ * ctypedef npy_cfloat      cfloat_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_cdouble     cdouble_t
+ * ctypedef npy_clongdouble clongdouble_t
+ */
+typedef npy_cfloat __pyx_t_5numpy_cfloat_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":726
+ * 
+ * ctypedef npy_cfloat      cfloat_t
+ * ctypedef npy_cdouble     cdouble_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_clongdouble clongdouble_t
+ * 
+ */
+typedef npy_cdouble __pyx_t_5numpy_cdouble_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":727
+ * ctypedef npy_cfloat      cfloat_t
+ * ctypedef npy_cdouble     cdouble_t
+ * ctypedef npy_clongdouble clongdouble_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_cdouble     complex_t
+ */
+typedef npy_clongdouble __pyx_t_5numpy_clongdouble_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":729
+ * ctypedef npy_clongdouble clongdouble_t
+ * 
+ * ctypedef npy_cdouble     complex_t             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):
+ */
+typedef npy_cdouble __pyx_t_5numpy_complex_t;
+struct __pyx_opt_args_5rmgpy_8molecule_5graph_6Vertex_equivalent;
+struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_copy;
+struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_sort_vertices;
+struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_is_isomorphic;
+struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_find_isomorphism;
+struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_is_subgraph_isomorphic;
+struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_find_subgraph_isomorphisms;
+struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_is_mapping_valid;
+struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_get_edges_in_cycle;
+
+/* "graph.pxd":43
+ *     cpdef Vertex copy(self)
+ * 
+ *     cpdef bint equivalent(self, Vertex other, bint strict=?) except -2             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_specific_case_of(self, Vertex other) except -2
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5graph_6Vertex_equivalent {
+  int __pyx_n;
+  int strict;
+};
+
+/* "graph.pxd":99
+ *     cpdef update_connectivity_values(self)
+ * 
+ *     cpdef Graph copy(self, bint deep=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef dict copy_and_map(self)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_copy {
+  int __pyx_n;
+  int deep;
+};
+
+/* "graph.pxd":109
+ *     cpdef reset_connectivity_values(self)
+ * 
+ *     cpdef sort_vertices(self, bint save_order=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef restore_vertex_order(self)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_sort_vertices {
+  int __pyx_n;
+  int save_order;
+};
+
+/* "graph.pxd":113
+ *     cpdef restore_vertex_order(self)
+ * 
+ *     cpdef bint is_isomorphic(self, Graph other, dict initial_map=?, bint save_order=?, bint strict=?) except -2             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef list find_isomorphism(self, Graph other, dict initial_map=?, bint save_order=?, bint strict=?)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_is_isomorphic {
+  int __pyx_n;
+  PyObject *initial_map;
+  int save_order;
+  int strict;
+};
+
+/* "graph.pxd":115
+ *     cpdef bint is_isomorphic(self, Graph other, dict initial_map=?, bint save_order=?, bint strict=?) except -2
+ * 
+ *     cpdef list find_isomorphism(self, Graph other, dict initial_map=?, bint save_order=?, bint strict=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_subgraph_isomorphic(self, Graph other, dict initial_map=?, bint save_order=?) except -2
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_find_isomorphism {
+  int __pyx_n;
+  PyObject *initial_map;
+  int save_order;
+  int strict;
+};
+
+/* "graph.pxd":117
+ *     cpdef list find_isomorphism(self, Graph other, dict initial_map=?, bint save_order=?, bint strict=?)
+ * 
+ *     cpdef bint is_subgraph_isomorphic(self, Graph other, dict initial_map=?, bint save_order=?) except -2             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef list find_subgraph_isomorphisms(self, Graph other, dict initial_map=?, bint save_order=?)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_is_subgraph_isomorphic {
+  int __pyx_n;
+  PyObject *initial_map;
+  int save_order;
+};
+
+/* "graph.pxd":119
+ *     cpdef bint is_subgraph_isomorphic(self, Graph other, dict initial_map=?, bint save_order=?) except -2
+ * 
+ *     cpdef list find_subgraph_isomorphisms(self, Graph other, dict initial_map=?, bint save_order=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_cyclic(self) except -2
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_find_subgraph_isomorphisms {
+  int __pyx_n;
+  PyObject *initial_map;
+  int save_order;
+};
+
+/* "graph.pxd":159
+ *     cpdef list get_largest_ring(self, Vertex vertex)
+ * 
+ *     cpdef bint is_mapping_valid(self, Graph other, dict mapping, bint equivalent=?, bint strict=?) except -2             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef list get_edges_in_cycle(self, list vertices, bint sort=?)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_is_mapping_valid {
+  int __pyx_n;
+  int equivalent;
+  int strict;
+};
+
+/* "graph.pxd":161
+ *     cpdef bint is_mapping_valid(self, Graph other, dict mapping, bint equivalent=?, bint strict=?) except -2
+ * 
+ *     cpdef list get_edges_in_cycle(self, list vertices, bint sort=?)             # <<<<<<<<<<<<<<
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_get_edges_in_cycle {
+  int __pyx_n;
+  int sort;
+};
+struct __pyx_opt_args_5rmgpy_8molecule_5group_9GroupAtom_equivalent;
+struct __pyx_opt_args_5rmgpy_8molecule_5group_9GroupAtom_count_bonds;
+struct __pyx_opt_args_5rmgpy_8molecule_5group_9GroupBond_is_single;
+struct __pyx_opt_args_5rmgpy_8molecule_5group_9GroupBond_is_double;
+struct __pyx_opt_args_5rmgpy_8molecule_5group_9GroupBond_is_triple;
+struct __pyx_opt_args_5rmgpy_8molecule_5group_9GroupBond_is_benzene;
+struct __pyx_opt_args_5rmgpy_8molecule_5group_5Group_copy;
+struct __pyx_opt_args_5rmgpy_8molecule_5group_5Group_to_adjacency_list;
+struct __pyx_opt_args_5rmgpy_8molecule_5group_5Group_is_isomorphic;
+struct __pyx_opt_args_5rmgpy_8molecule_5group_5Group_find_isomorphism;
+struct __pyx_opt_args_5rmgpy_8molecule_5group_5Group_is_subgraph_isomorphic;
+struct __pyx_opt_args_5rmgpy_8molecule_5group_5Group_find_subgraph_isomorphisms;
+struct __pyx_opt_args_5rmgpy_8molecule_5group_5Group_is_identical;
+struct __pyx_opt_args_5rmgpy_8molecule_5group_5Group_classify_benzene_carbons;
+struct __pyx_opt_args_5rmgpy_8molecule_5group_5Group_merge_groups;
+
+/* "rmgpy/molecule/group.pxd":66
+ *     cpdef apply_action(self, list action)
+ * 
+ *     cpdef bint equivalent(self, Vertex other, bint strict=?) except -2             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_specific_case_of(self, Vertex other) except -2
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5group_9GroupAtom_equivalent {
+  int __pyx_n;
+  int strict;
+};
+
+/* "rmgpy/molecule/group.pxd":80
+ *     cpdef bint is_carbon(self)
+ * 
+ *     cpdef list count_bonds(self, wildcards = ?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint has_wildcards(self)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5group_9GroupAtom_count_bonds {
+  int __pyx_n;
+  PyObject *wildcards;
+};
+
+/* "rmgpy/molecule/group.pxd":105
+ *     cpdef _change_bond(self, short order)
+ * 
+ *     cpdef bint is_single(self, bint wildcards = ?) except -2             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_double(self, bint wildcards = ?) except -2
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5group_9GroupBond_is_single {
+  int __pyx_n;
+  int wildcards;
+};
+
+/* "rmgpy/molecule/group.pxd":107
+ *     cpdef bint is_single(self, bint wildcards = ?) except -2
+ * 
+ *     cpdef bint is_double(self, bint wildcards = ?) except -2             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_triple(self, bint wildcards = ?) except -2
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5group_9GroupBond_is_double {
+  int __pyx_n;
+  int wildcards;
+};
+
+/* "rmgpy/molecule/group.pxd":109
+ *     cpdef bint is_double(self, bint wildcards = ?) except -2
+ * 
+ *     cpdef bint is_triple(self, bint wildcards = ?) except -2             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_benzene(self, bint wildcards = ?) except -2
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5group_9GroupBond_is_triple {
+  int __pyx_n;
+  int wildcards;
+};
+
+/* "rmgpy/molecule/group.pxd":111
+ *     cpdef bint is_triple(self, bint wildcards = ?) except -2
+ * 
+ *     cpdef bint is_benzene(self, bint wildcards = ?) except -2             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef apply_action(self, list action)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5group_9GroupBond_is_benzene {
+  int __pyx_n;
+  int wildcards;
+};
+
+/* "rmgpy/molecule/group.pxd":155
+ *     cpdef list sort_by_connectivity(self, list atom_list)
+ * 
+ *     cpdef Graph copy(self, bint deep=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef clear_labeled_atoms(self)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5group_5Group_copy {
+  int __pyx_n;
+  int deep;
+};
+
+/* "rmgpy/molecule/group.pxd":169
+ *     cpdef from_adjacency_list(self, str adjlist)
+ * 
+ *     cpdef to_adjacency_list(self, str label=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef update_fingerprint(self)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5group_5Group_to_adjacency_list {
+  int __pyx_n;
+  PyObject *label;
+};
+
+/* "rmgpy/molecule/group.pxd":175
+ *     cpdef update_charge(self)
+ * 
+ *     cpdef bint is_isomorphic(self, Graph other, dict initial_map=?, bint save_order=?, bint strict=?) except -2             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef list find_isomorphism(self, Graph other, dict initial_map=?, bint save_order=?, bint strict=?)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5group_5Group_is_isomorphic {
+  int __pyx_n;
+  PyObject *initial_map;
+  int save_order;
+  int strict;
+};
+
+/* "rmgpy/molecule/group.pxd":177
+ *     cpdef bint is_isomorphic(self, Graph other, dict initial_map=?, bint save_order=?, bint strict=?) except -2
+ * 
+ *     cpdef list find_isomorphism(self, Graph other, dict initial_map=?, bint save_order=?, bint strict=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_subgraph_isomorphic(self, Graph other, dict initial_map=?, bint generate_initial_map=?, bint save_order=?) except -2
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5group_5Group_find_isomorphism {
+  int __pyx_n;
+  PyObject *initial_map;
+  int save_order;
+  int strict;
+};
+
+/* "rmgpy/molecule/group.pxd":179
+ *     cpdef list find_isomorphism(self, Graph other, dict initial_map=?, bint save_order=?, bint strict=?)
+ * 
+ *     cpdef bint is_subgraph_isomorphic(self, Graph other, dict initial_map=?, bint generate_initial_map=?, bint save_order=?) except -2             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef list find_subgraph_isomorphisms(self, Graph other, dict initial_map=?, bint save_order=?)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5group_5Group_is_subgraph_isomorphic {
+  int __pyx_n;
+  PyObject *initial_map;
+  int generate_initial_map;
+  int save_order;
+};
+
+/* "rmgpy/molecule/group.pxd":181
+ *     cpdef bint is_subgraph_isomorphic(self, Graph other, dict initial_map=?, bint generate_initial_map=?, bint save_order=?) except -2
+ * 
+ *     cpdef list find_subgraph_isomorphisms(self, Graph other, dict initial_map=?, bint save_order=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_identical(self, Graph other, bint save_order=?)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5group_5Group_find_subgraph_isomorphisms {
+  int __pyx_n;
+  PyObject *initial_map;
+  int save_order;
+};
+
+/* "rmgpy/molecule/group.pxd":183
+ *     cpdef list find_subgraph_isomorphisms(self, Graph other, dict initial_map=?, bint save_order=?)
+ * 
+ *     cpdef bint is_identical(self, Graph other, bint save_order=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_surface_site(self) except -2
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5group_5Group_is_identical {
+  int __pyx_n;
+  int save_order;
+};
+
+/* "rmgpy/molecule/group.pxd":205
+ *     cpdef mol.Molecule make_sample_molecule(self)
+ * 
+ *     cpdef tuple classify_benzene_carbons(self, dict partners=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef Group add_implicit_benzene(self)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5group_5Group_classify_benzene_carbons {
+  int __pyx_n;
+  PyObject *partners;
+};
+
+/* "rmgpy/molecule/group.pxd":211
+ *     cpdef bint is_benzene_explicit(self)
+ * 
+ *     cpdef Group merge_groups(self, Group other, bint keep_identical_labels=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef reset_ring_membership(self)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_5group_5Group_merge_groups {
+  int __pyx_n;
+  int keep_identical_labels;
+};
+struct __pyx_opt_args_5rmgpy_8molecule_7element_get_element;
+
+/* "rmgpy/molecule/element.pxd":38
+ *     cdef public str chemkin_name
+ * 
+ * cpdef Element get_element(value, int isotope=?)             # <<<<<<<<<<<<<<
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_7element_get_element {
+  int __pyx_n;
+  int isotope;
+};
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_4Atom_equivalent;
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_get_num_atoms;
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_copy;
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_is_isomorphic;
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_find_isomorphism;
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_is_subgraph_isomorphic;
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_find_subgraph_isomorphisms;
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_from_inchi;
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_from_smiles;
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_from_adjacency_list;
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_to_adjacency_list;
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_update_atomtypes;
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_is_aryl_radical;
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_generate_resonance_structures;
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_get_aromatic_rings;
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_is_identical;
+
+/* "rmgpy/molecule/molecule.pxd":51
+ *     cdef public dict props
+ * 
+ *     cpdef bint equivalent(self, Vertex other, bint strict=?) except -2             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_specific_case_of(self, Vertex other) except -2
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_4Atom_equivalent {
+  int __pyx_n;
+  int strict;
+};
+
+/* "rmgpy/molecule/molecule.pxd":177
+ *     cpdef double get_molecular_weight(self)
+ * 
+ *     cpdef int get_num_atoms(self, str element=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef Graph copy(self, bint deep=?)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_get_num_atoms {
+  int __pyx_n;
+  PyObject *element;
+};
+
+/* "rmgpy/molecule/molecule.pxd":179
+ *     cpdef int get_num_atoms(self, str element=?)
+ * 
+ *     cpdef Graph copy(self, bint deep=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef delete_hydrogens(self)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_copy {
+  int __pyx_n;
+  int deep;
+};
+
+/* "rmgpy/molecule/molecule.pxd":193
+ *     cpdef dict get_element_count(self)
+ * 
+ *     cpdef bint is_isomorphic(self, Graph other, dict initial_map=?, bint generate_initial_map=?, bint save_order=?, bint strict=?) except -2             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef list find_isomorphism(self, Graph other, dict initial_map=?, bint save_order=?, bint strict=?)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_is_isomorphic {
+  int __pyx_n;
+  PyObject *initial_map;
+  int generate_initial_map;
+  int save_order;
+  int strict;
+};
+
+/* "rmgpy/molecule/molecule.pxd":195
+ *     cpdef bint is_isomorphic(self, Graph other, dict initial_map=?, bint generate_initial_map=?, bint save_order=?, bint strict=?) except -2
+ * 
+ *     cpdef list find_isomorphism(self, Graph other, dict initial_map=?, bint save_order=?, bint strict=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_subgraph_isomorphic(self, Graph other, dict initial_map=?, bint generate_initial_map=?, bint save_order=?) except -2
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_find_isomorphism {
+  int __pyx_n;
+  PyObject *initial_map;
+  int save_order;
+  int strict;
+};
+
+/* "rmgpy/molecule/molecule.pxd":197
+ *     cpdef list find_isomorphism(self, Graph other, dict initial_map=?, bint save_order=?, bint strict=?)
+ * 
+ *     cpdef bint is_subgraph_isomorphic(self, Graph other, dict initial_map=?, bint generate_initial_map=?, bint save_order=?) except -2             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef list find_subgraph_isomorphisms(self, Graph other, dict initial_map=?, bint save_order=?)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_is_subgraph_isomorphic {
+  int __pyx_n;
+  PyObject *initial_map;
+  int generate_initial_map;
+  int save_order;
+};
+
+/* "rmgpy/molecule/molecule.pxd":199
+ *     cpdef bint is_subgraph_isomorphic(self, Graph other, dict initial_map=?, bint generate_initial_map=?, bint save_order=?) except -2
+ * 
+ *     cpdef list find_subgraph_isomorphisms(self, Graph other, dict initial_map=?, bint save_order=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_atom_in_cycle(self, Atom atom) except -2
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_find_subgraph_isomorphisms {
+  int __pyx_n;
+  PyObject *initial_map;
+  int save_order;
+};
+
+/* "rmgpy/molecule/molecule.pxd":207
+ *     cpdef draw(self, str path)
+ * 
+ *     cpdef from_inchi(self, str inchistr, backend=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef from_smiles(self, str smilesstr, backend=?)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_from_inchi {
+  int __pyx_n;
+  PyObject *backend;
+};
+
+/* "rmgpy/molecule/molecule.pxd":209
+ *     cpdef from_inchi(self, str inchistr, backend=?)
+ * 
+ *     cpdef from_smiles(self, str smilesstr, backend=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef from_adjacency_list(self, str adjlist, bint saturate_h=?)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_from_smiles {
+  int __pyx_n;
+  PyObject *backend;
+};
+
+/* "rmgpy/molecule/molecule.pxd":211
+ *     cpdef from_smiles(self, str smilesstr, backend=?)
+ * 
+ *     cpdef from_adjacency_list(self, str adjlist, bint saturate_h=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef from_xyz(self, np.ndarray atomic_nums, np.ndarray coordinates)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_from_adjacency_list {
+  int __pyx_n;
+  int saturate_h;
+};
+
+/* "rmgpy/molecule/molecule.pxd":225
+ *     cpdef str to_smiles(self)
+ * 
+ *     cpdef to_adjacency_list(self, str label=?, bint remove_h=?, bint remove_lone_pairs=?, bint old_style=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_linear(self) except -2
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_to_adjacency_list {
+  int __pyx_n;
+  PyObject *label;
+  int remove_h;
+  int remove_lone_pairs;
+  int old_style;
+};
+
+/* "rmgpy/molecule/molecule.pxd":237
+ *     cpdef double calculate_cpinf(self) except -1
+ * 
+ *     cpdef update_atomtypes(self, bint log_species=?, bint raise_exception=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef bint is_radical(self) except -2
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_update_atomtypes {
+  int __pyx_n;
+  int log_species;
+  int raise_exception;
+};
+
+/* "rmgpy/molecule/molecule.pxd":243
+ *     cpdef bint has_lone_pairs(self) except -2
+ * 
+ *     cpdef bint is_aryl_radical(self, list aromatic_rings=?) except -2             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef float calculate_symmetry_number(self) except -1
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_is_aryl_radical {
+  int __pyx_n;
+  PyObject *aromatic_rings;
+};
+
+/* "rmgpy/molecule/molecule.pxd":247
+ *     cpdef float calculate_symmetry_number(self) except -1
+ * 
+ *     cpdef list generate_resonance_structures(self, bint keep_isomorphic=?, bint filter_structures=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef identify_ring_membership(self)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_generate_resonance_structures {
+  int __pyx_n;
+  int keep_isomorphic;
+  int filter_structures;
+};
+
+/* "rmgpy/molecule/molecule.pxd":253
+ *     cpdef int count_aromatic_rings(self)
+ * 
+ *     cpdef tuple get_aromatic_rings(self, list rings=?)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef list get_deterministic_sssr(self)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_get_aromatic_rings {
+  int __pyx_n;
+  PyObject *rings;
+};
+
+/* "rmgpy/molecule/molecule.pxd":263
+ *     cpdef bint atom_ids_valid(self)
+ * 
+ *     cpdef bint is_identical(self, Molecule other, bint strict=?) except -2             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef dict enumerate_bonds(self)
+ */
+struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_is_identical {
+  int __pyx_n;
+  int strict;
+};
+
+/* "graph.pxd":28
+ * ###############################################################################
+ * 
+ * cdef class Vertex(object):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public dict edges
+ */
+struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_5rmgpy_8molecule_5graph_Vertex *__pyx_vtab;
+  PyObject *edges;
+  short connectivity1;
+  short connectivity2;
+  short connectivity3;
+  short sorting_label;
+  int terminal;
+  struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *mapping;
+  int ignore;
+};
+
+
+/* "graph.pxd":55
+ * ################################################################################
+ * 
+ * cdef class Edge(object):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public Vertex vertex1, vertex2
+ */
+struct __pyx_obj_5rmgpy_8molecule_5graph_Edge {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_5rmgpy_8molecule_5graph_Edge *__pyx_vtab;
+  struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *vertex1;
+  struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *vertex2;
+};
+
+
+/* "graph.pxd":73
+ * cdef Vertex _get_edge_vertex2(Edge edge)
+ * 
+ * cdef class Graph(object):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public list vertices
+ */
+struct __pyx_obj_5rmgpy_8molecule_5graph_Graph {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_5rmgpy_8molecule_5graph_Graph *__pyx_vtab;
+  PyObject *vertices;
+  PyObject *ordered_vertices;
+};
+
+
+/* "atomtype.pxd":28
+ * ###############################################################################
+ * 
+ * cdef class AtomType:             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public str label
+ */
+struct __pyx_obj_5rmgpy_8molecule_8atomtype_AtomType {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_5rmgpy_8molecule_8atomtype_AtomType *__pyx_vtab;
+  PyObject *label;
+  PyObject *generic;
+  PyObject *specific;
+  PyObject *increment_bond;
+  PyObject *decrement_bond;
+  PyObject *form_bond;
+  PyObject *break_bond;
+  PyObject *increment_radical;
+  PyObject *decrement_radical;
+  PyObject *increment_lone_pair;
+  PyObject *decrement_lone_pair;
+  PyObject *single;
+  PyObject *all_double;
+  PyObject *r_double;
+  PyObject *o_double;
+  PyObject *s_double;
+  PyObject *triple;
+  PyObject *quadruple;
+  PyObject *benzene;
+  PyObject *lone_pairs;
+  PyObject *charge;
+};
+
+
+/* "rmgpy/molecule/group.pxd":34
+ * ################################################################################
+ * 
+ * cdef class GroupAtom(Vertex):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public list atomtype
+ */
+struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom {
+  struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex __pyx_base;
+  PyObject *atomtype;
+  PyObject *radical_electrons;
+  PyObject *charge;
+  PyObject *label;
+  PyObject *lone_pairs;
+  PyObject *props;
+  PyObject *reg_dim_atm;
+  PyObject *reg_dim_u;
+  PyObject *reg_dim_r;
+};
+
+
+/* "rmgpy/molecule/group.pxd":88
+ * ################################################################################
+ * 
+ * cdef class GroupBond(Edge):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public list order
+ */
+struct __pyx_obj_5rmgpy_8molecule_5group_GroupBond {
+  struct __pyx_obj_5rmgpy_8molecule_5graph_Edge __pyx_base;
+  PyObject *order;
+  PyObject *reg_dim;
+};
+
+
+/* "rmgpy/molecule/group.pxd":123
+ * ################################################################################
+ * 
+ * cdef class Group(Graph):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public dict props
+ */
+struct __pyx_obj_5rmgpy_8molecule_5group_Group {
+  struct __pyx_obj_5rmgpy_8molecule_5graph_Graph __pyx_base;
+  PyObject *props;
+  PyObject *multiplicity;
+  PyObject *elementCount;
+  short radicalCount;
+};
+
+
+/* "rmgpy/molecule/element.pxd":28
+ * ###############################################################################
+ * 
+ * cdef class Element:             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public int number
+ */
+struct __pyx_obj_5rmgpy_8molecule_7element_Element {
+  PyObject_HEAD
+  int number;
+  PyObject *name;
+  PyObject *symbol;
+  float mass;
+  float cov_radius;
+  int isotope;
+  PyObject *chemkin_name;
+};
+
+
+/* "rmgpy/molecule/molecule.pxd":39
+ * cdef dict bond_orders
+ * 
+ * cdef class Atom(Vertex):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public Element element
+ */
+struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom {
+  struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex __pyx_base;
+  struct __pyx_obj_5rmgpy_8molecule_7element_Element *element;
+  short radical_electrons;
+  short charge;
+  PyObject *label;
+  struct __pyx_obj_5rmgpy_8molecule_8atomtype_AtomType *atomtype;
+  PyArrayObject *coords;
+  short lone_pairs;
+  int id;
+  PyObject *props;
+};
+
+
+/* "rmgpy/molecule/molecule.pxd":95
+ * ################################################################################
+ * 
+ * cdef class Bond(Edge):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public float order
+ */
+struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond {
+  struct __pyx_obj_5rmgpy_8molecule_5graph_Edge __pyx_base;
+  float order;
+};
+
+
+/* "rmgpy/molecule/molecule.pxd":135
+ * ################################################################################
+ * 
+ * cdef class Molecule(Graph):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public float symmetry_number
+ */
+struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule {
+  struct __pyx_obj_5rmgpy_8molecule_5graph_Graph __pyx_base;
+  float symmetry_number;
+  int multiplicity;
+  int reactive;
+  PyObject *props;
+  PyObject *_fingerprint;
+  PyObject *_inchi;
+  PyObject *_smiles;
+};
+
+
+
+/* "graph.pxd":28
+ * ###############################################################################
+ * 
+ * cdef class Vertex(object):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public dict edges
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8molecule_5graph_Vertex {
+  struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *(*copy)(struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *, int __pyx_skip_dispatch);
+  int (*equivalent)(struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *, struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_5graph_6Vertex_equivalent *__pyx_optional_args);
+  int (*is_specific_case_of)(struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *, struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *, int __pyx_skip_dispatch);
+  PyObject *(*reset_connectivity_values)(struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8molecule_5graph_Vertex *__pyx_vtabptr_5rmgpy_8molecule_5graph_Vertex;
+
+
+/* "graph.pxd":55
+ * ################################################################################
+ * 
+ * cdef class Edge(object):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public Vertex vertex1, vertex2
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8molecule_5graph_Edge {
+  struct __pyx_obj_5rmgpy_8molecule_5graph_Edge *(*copy)(struct __pyx_obj_5rmgpy_8molecule_5graph_Edge *, int __pyx_skip_dispatch);
+  int (*equivalent)(struct __pyx_obj_5rmgpy_8molecule_5graph_Edge *, struct __pyx_obj_5rmgpy_8molecule_5graph_Edge *, int __pyx_skip_dispatch);
+  int (*is_specific_case_of)(struct __pyx_obj_5rmgpy_8molecule_5graph_Edge *, struct __pyx_obj_5rmgpy_8molecule_5graph_Edge *, int __pyx_skip_dispatch);
+  struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *(*get_other_vertex)(struct __pyx_obj_5rmgpy_8molecule_5graph_Edge *, struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8molecule_5graph_Edge *__pyx_vtabptr_5rmgpy_8molecule_5graph_Edge;
+
+
+/* "graph.pxd":73
+ * cdef Vertex _get_edge_vertex2(Edge edge)
+ * 
+ * cdef class Graph(object):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public list vertices
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8molecule_5graph_Graph {
+  struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *(*add_vertex)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *, int __pyx_skip_dispatch);
+  struct __pyx_obj_5rmgpy_8molecule_5graph_Edge *(*add_edge)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, struct __pyx_obj_5rmgpy_8molecule_5graph_Edge *, int __pyx_skip_dispatch);
+  PyObject *(*get_all_edges)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch);
+  PyObject *(*get_edges)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *, int __pyx_skip_dispatch);
+  struct __pyx_obj_5rmgpy_8molecule_5graph_Edge *(*get_edge)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *, struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *, int __pyx_skip_dispatch);
+  int (*has_vertex)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *, int __pyx_skip_dispatch);
+  int (*has_edge)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *, struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *, int __pyx_skip_dispatch);
+  PyObject *(*remove_vertex)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *, int __pyx_skip_dispatch);
+  PyObject *(*remove_edge)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, struct __pyx_obj_5rmgpy_8molecule_5graph_Edge *, int __pyx_skip_dispatch);
+  PyObject *(*update_connectivity_values)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch);
+  struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *(*copy)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_copy *__pyx_optional_args);
+  PyObject *(*copy_and_map)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch);
+  struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *(*merge)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch);
+  PyObject *(*split)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch);
+  PyObject *(*reset_connectivity_values)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch);
+  PyObject *(*sort_vertices)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_sort_vertices *__pyx_optional_args);
+  PyObject *(*restore_vertex_order)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch);
+  int (*is_isomorphic)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_is_isomorphic *__pyx_optional_args);
+  PyObject *(*find_isomorphism)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_find_isomorphism *__pyx_optional_args);
+  int (*is_subgraph_isomorphic)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_is_subgraph_isomorphic *__pyx_optional_args);
+  PyObject *(*find_subgraph_isomorphisms)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_find_subgraph_isomorphisms *__pyx_optional_args);
+  int (*is_cyclic)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch);
+  int (*is_vertex_in_cycle)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *, int __pyx_skip_dispatch);
+  int (*is_edge_in_cycle)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, struct __pyx_obj_5rmgpy_8molecule_5graph_Edge *, int __pyx_skip_dispatch);
+  int (*_is_chain_in_cycle)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*get_all_cyclic_vertices)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch);
+  PyObject *(*get_all_polycyclic_vertices)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch);
+  PyObject *(*get_polycycles)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch);
+  PyObject *(*get_monocycles)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch);
+  PyObject *(*get_disparate_cycles)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch);
+  PyObject *(*_merge_cycles)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*get_all_cycles)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *, int __pyx_skip_dispatch);
+  PyObject *(*get_all_cycles_of_size)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int, int __pyx_skip_dispatch);
+  PyObject *(*get_all_simple_cycles_of_size)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int, int __pyx_skip_dispatch);
+  PyObject *(*_explore_cycles_recursively)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, PyObject *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*get_smallest_set_of_smallest_rings)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch);
+  PyObject *(*get_relevant_cycles)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch);
+  PyObject *(*sort_cyclic_vertices)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, PyObject *, int __pyx_skip_dispatch);
+  int (*get_max_cycle_overlap)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch);
+  PyObject *(*get_largest_ring)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *, int __pyx_skip_dispatch);
+  int (*is_mapping_valid)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_is_mapping_valid *__pyx_optional_args);
+  PyObject *(*get_edges_in_cycle)(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_get_edges_in_cycle *__pyx_optional_args);
+};
+static struct __pyx_vtabstruct_5rmgpy_8molecule_5graph_Graph *__pyx_vtabptr_5rmgpy_8molecule_5graph_Graph;
+
+
+/* "atomtype.pxd":28
+ * ###############################################################################
+ * 
+ * cdef class AtomType:             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public str label
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8molecule_8atomtype_AtomType {
+  int (*is_specific_case_of)(struct __pyx_obj_5rmgpy_8molecule_8atomtype_AtomType *, struct __pyx_obj_5rmgpy_8molecule_8atomtype_AtomType *, int __pyx_skip_dispatch);
+  int (*equivalent)(struct __pyx_obj_5rmgpy_8molecule_8atomtype_AtomType *, struct __pyx_obj_5rmgpy_8molecule_8atomtype_AtomType *, int __pyx_skip_dispatch);
+  PyObject *(*get_features)(struct __pyx_obj_5rmgpy_8molecule_8atomtype_AtomType *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8molecule_8atomtype_AtomType *__pyx_vtabptr_5rmgpy_8molecule_8atomtype_AtomType;
+
+
+/* "rmgpy/molecule/group.pxd":34
+ * ################################################################################
+ * 
+ * cdef class GroupAtom(Vertex):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public list atomtype
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8molecule_5group_GroupAtom {
+  struct __pyx_vtabstruct_5rmgpy_8molecule_5graph_Vertex __pyx_base;
+  PyObject *(*_change_bond)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, short, int __pyx_skip_dispatch);
+  PyObject *(*_form_bond)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, float, int __pyx_skip_dispatch);
+  PyObject *(*_break_bond)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, float, int __pyx_skip_dispatch);
+  PyObject *(*_gain_radical)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, short, int __pyx_skip_dispatch);
+  PyObject *(*_lose_radical)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, short, int __pyx_skip_dispatch);
+  PyObject *(*_gain_pair)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, short, int __pyx_skip_dispatch);
+  PyObject *(*_lose_pair)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, short, int __pyx_skip_dispatch);
+  PyObject *(*apply_action)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, PyObject *, int __pyx_skip_dispatch);
+  int (*is_surface_site)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, int __pyx_skip_dispatch);
+  int (*is_oxygen)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, int __pyx_skip_dispatch);
+  int (*is_sulfur)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, int __pyx_skip_dispatch);
+  int (*is_nitrogen)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, int __pyx_skip_dispatch);
+  int (*is_carbon)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, int __pyx_skip_dispatch);
+  PyObject *(*count_bonds)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_5group_9GroupAtom_count_bonds *__pyx_optional_args);
+  int (*has_wildcards)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, int __pyx_skip_dispatch);
+  struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *(*make_sample_atom)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8molecule_5group_GroupAtom *__pyx_vtabptr_5rmgpy_8molecule_5group_GroupAtom;
+
+
+/* "rmgpy/molecule/group.pxd":88
+ * ################################################################################
+ * 
+ * cdef class GroupBond(Edge):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public list order
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8molecule_5group_GroupBond {
+  struct __pyx_vtabstruct_5rmgpy_8molecule_5graph_Edge __pyx_base;
+  PyObject *(*get_order_str)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupBond *, int __pyx_skip_dispatch);
+  PyObject *(*set_order_str)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupBond *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*get_order_num)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupBond *, int __pyx_skip_dispatch);
+  PyObject *(*set_order_num)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupBond *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*_change_bond)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupBond *, short, int __pyx_skip_dispatch);
+  int (*is_single)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupBond *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_5group_9GroupBond_is_single *__pyx_optional_args);
+  int (*is_double)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupBond *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_5group_9GroupBond_is_double *__pyx_optional_args);
+  int (*is_triple)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupBond *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_5group_9GroupBond_is_triple *__pyx_optional_args);
+  int (*is_benzene)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupBond *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_5group_9GroupBond_is_benzene *__pyx_optional_args);
+  PyObject *(*apply_action)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupBond *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*make_bond)(struct __pyx_obj_5rmgpy_8molecule_5group_GroupBond *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8molecule_5group_GroupBond *__pyx_vtabptr_5rmgpy_8molecule_5group_GroupBond;
+
+
+/* "rmgpy/molecule/group.pxd":123
+ * ################################################################################
+ * 
+ * cdef class Group(Graph):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public dict props
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8molecule_5group_Group {
+  struct __pyx_vtabstruct_5rmgpy_8molecule_5graph_Graph __pyx_base;
+  PyObject *(*add_atom)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, int __pyx_skip_dispatch);
+  PyObject *(*add_bond)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, struct __pyx_obj_5rmgpy_8molecule_5group_GroupBond *, int __pyx_skip_dispatch);
+  PyObject *(*get_bonds)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, int __pyx_skip_dispatch);
+  struct __pyx_obj_5rmgpy_8molecule_5group_GroupBond *(*get_bond)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, int __pyx_skip_dispatch);
+  int (*has_atom)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, int __pyx_skip_dispatch);
+  int (*has_bond)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, int __pyx_skip_dispatch);
+  PyObject *(*remove_atom)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, int __pyx_skip_dispatch);
+  PyObject *(*remove_bond)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, struct __pyx_obj_5rmgpy_8molecule_5group_GroupBond *, int __pyx_skip_dispatch);
+  PyObject *(*remove_van_der_waals_bonds)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, int __pyx_skip_dispatch);
+  PyObject *(*sort_atoms)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, int __pyx_skip_dispatch);
+  PyObject *(*sort_by_connectivity)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*clear_labeled_atoms)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, int __pyx_skip_dispatch);
+  int (*contains_labeled_atom)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*get_labeled_atoms)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*get_all_labeled_atoms)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, int __pyx_skip_dispatch);
+  PyObject *(*get_element_count)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, int __pyx_skip_dispatch);
+  PyObject *(*from_adjacency_list)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*to_adjacency_list)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_5group_5Group_to_adjacency_list *__pyx_optional_args);
+  PyObject *(*update_fingerprint)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, int __pyx_skip_dispatch);
+  PyObject *(*update_charge)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, int __pyx_skip_dispatch);
+  int (*is_subgraph_isomorphic)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_5group_5Group_is_subgraph_isomorphic *__pyx_optional_args);
+  int (*is_identical)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_5group_5Group_is_identical *__pyx_optional_args);
+  int (*is_surface_site)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, int __pyx_skip_dispatch);
+  int (*contains_surface_site)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, int __pyx_skip_dispatch);
+  int (*is_aromatic_ring)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, int __pyx_skip_dispatch);
+  int (*standardize_atomtype)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, int __pyx_skip_dispatch);
+  int (*add_explicit_ligands)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, int __pyx_skip_dispatch);
+  struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *(*create_and_connect_atom)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, PyObject *, struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom *, PyObject *, int __pyx_skip_dispatch);
+  int (*standardize_group)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, int __pyx_skip_dispatch);
+  struct __pyx_obj_5rmgpy_8molecule_5group_Group *(*add_implicit_atoms_from_atomtype)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, int __pyx_skip_dispatch);
+  PyObject *(*pick_wildcards)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, int __pyx_skip_dispatch);
+  struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *(*make_sample_molecule)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, int __pyx_skip_dispatch);
+  PyObject *(*classify_benzene_carbons)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_5group_5Group_classify_benzene_carbons *__pyx_optional_args);
+  struct __pyx_obj_5rmgpy_8molecule_5group_Group *(*add_implicit_benzene)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, int __pyx_skip_dispatch);
+  int (*is_benzene_explicit)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, int __pyx_skip_dispatch);
+  struct __pyx_obj_5rmgpy_8molecule_5group_Group *(*merge_groups)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, struct __pyx_obj_5rmgpy_8molecule_5group_Group *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_5group_5Group_merge_groups *__pyx_optional_args);
+  PyObject *(*reset_ring_membership)(struct __pyx_obj_5rmgpy_8molecule_5group_Group *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8molecule_5group_Group *__pyx_vtabptr_5rmgpy_8molecule_5group_Group;
+
+
+/* "rmgpy/molecule/molecule.pxd":39
+ * cdef dict bond_orders
+ * 
+ * cdef class Atom(Vertex):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public Element element
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Atom {
+  struct __pyx_vtabstruct_5rmgpy_8molecule_5graph_Vertex __pyx_base;
+  int (*is_hydrogen)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+  int (*is_non_hydrogen)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+  int (*is_carbon)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+  int (*is_oxygen)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+  int (*is_fluorine)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+  int (*is_silicon)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+  int (*is_sulfur)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+  int (*is_chlorine)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+  int (*is_iodine)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+  int (*is_nos)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+  int (*is_surface_site)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+  PyObject *(*increment_radical)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+  PyObject *(*decrement_radical)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+  PyObject *(*set_lone_pairs)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int, int __pyx_skip_dispatch);
+  PyObject *(*increment_lone_pairs)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+  PyObject *(*decrement_lone_pairs)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+  PyObject *(*update_charge)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+  PyObject *(*get_total_bond_order)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Atom *__pyx_vtabptr_5rmgpy_8molecule_8molecule_Atom;
+
+
+/* "rmgpy/molecule/molecule.pxd":95
+ * ################################################################################
+ * 
+ * cdef class Bond(Edge):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public float order
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Bond {
+  struct __pyx_vtabstruct_5rmgpy_8molecule_5graph_Edge __pyx_base;
+  PyObject *(*get_order_str)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *, int __pyx_skip_dispatch);
+  PyObject *(*set_order_str)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *, PyObject *, int __pyx_skip_dispatch);
+  float (*get_order_num)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *, int __pyx_skip_dispatch);
+  PyObject *(*set_order_num)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *, float, int __pyx_skip_dispatch);
+  int (*is_order)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *, float, int __pyx_skip_dispatch);
+  int (*is_van_der_waals)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *, int __pyx_skip_dispatch);
+  int (*is_single)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *, int __pyx_skip_dispatch);
+  int (*is_double)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *, int __pyx_skip_dispatch);
+  int (*is_triple)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *, int __pyx_skip_dispatch);
+  int (*is_quadruple)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *, int __pyx_skip_dispatch);
+  int (*is_benzene)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *, int __pyx_skip_dispatch);
+  PyObject *(*increment_order)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *, int __pyx_skip_dispatch);
+  PyObject *(*decrement_order)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *, int __pyx_skip_dispatch);
+  PyObject *(*get_bond_string)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Bond *__pyx_vtabptr_5rmgpy_8molecule_8molecule_Bond;
+
+
+/* "rmgpy/molecule/molecule.pxd":135
+ * ################################################################################
+ * 
+ * cdef class Molecule(Graph):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public float symmetry_number
+ */
+
+struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Molecule {
+  struct __pyx_vtabstruct_5rmgpy_8molecule_5graph_Graph __pyx_base;
+  PyObject *(*add_atom)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+  PyObject *(*add_bond)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *, int __pyx_skip_dispatch);
+  PyObject *(*get_bonds)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+  struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *(*get_bond)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+  int (*has_atom)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+  int (*has_bond)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+  int (*contains_surface_site)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  int (*is_surface_site)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  PyObject *(*remove_atom)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+  PyObject *(*remove_bond)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *, int __pyx_skip_dispatch);
+  PyObject *(*remove_van_der_waals_bonds)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  PyObject *(*sort_atoms)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  PyObject *(*get_formula)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  short (*get_radical_count)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  short (*get_singlet_carbene_count)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  double (*get_molecular_weight)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  int (*get_num_atoms)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_get_num_atoms *__pyx_optional_args);
+  PyObject *(*delete_hydrogens)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  PyObject *(*clear_labeled_atoms)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  int (*contains_labeled_atom)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*get_labeled_atoms)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*get_all_labeled_atoms)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  PyObject *(*get_element_count)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  int (*is_isomorphic)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_is_isomorphic *__pyx_optional_args);
+  int (*is_subgraph_isomorphic)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_is_subgraph_isomorphic *__pyx_optional_args);
+  int (*is_atom_in_cycle)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch);
+  int (*is_bond_in_cycle)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *, int __pyx_skip_dispatch);
+  PyObject *(*draw)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*from_inchi)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_from_inchi *__pyx_optional_args);
+  PyObject *(*from_smiles)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_from_smiles *__pyx_optional_args);
+  PyObject *(*from_adjacency_list)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_from_adjacency_list *__pyx_optional_args);
+  PyObject *(*from_xyz)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, PyArrayObject *, PyArrayObject *, int __pyx_skip_dispatch);
+  PyObject *(*to_inchi)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  PyObject *(*to_augmented_inchi)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  PyObject *(*to_inchi_key)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  PyObject *(*to_augmented_inchi_key)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  PyObject *(*to_smiles)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  PyObject *(*to_adjacency_list)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_to_adjacency_list *__pyx_optional_args);
+  int (*is_linear)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  int (*is_heterocyclic)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  int (*count_internal_rotors)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  double (*calculate_cp0)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  double (*calculate_cpinf)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  PyObject *(*update_atomtypes)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_update_atomtypes *__pyx_optional_args);
+  int (*is_radical)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  int (*has_lone_pairs)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  int (*is_aryl_radical)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_is_aryl_radical *__pyx_optional_args);
+  float (*calculate_symmetry_number)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  PyObject *(*generate_resonance_structures)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_generate_resonance_structures *__pyx_optional_args);
+  PyObject *(*identify_ring_membership)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  int (*count_aromatic_rings)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  PyObject *(*get_aromatic_rings)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_get_aromatic_rings *__pyx_optional_args);
+  PyObject *(*get_deterministic_sssr)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  PyObject *(*kekulize)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  PyObject *(*assign_atom_ids)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  int (*atom_ids_valid)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+  int (*is_identical)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch, struct __pyx_opt_args_5rmgpy_8molecule_8molecule_8Molecule_is_identical *__pyx_optional_args);
+  PyObject *(*enumerate_bonds)(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Molecule *__pyx_vtabptr_5rmgpy_8molecule_8molecule_Molecule;
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, int);
+    void (*DECREF)(void*, PyObject*, int);
+    void (*GOTREF)(void*, PyObject*, int);
+    void (*GIVEREF)(void*, PyObject*, int);
+    void* (*SetupContext)(const char*, int, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+#ifdef WITH_THREAD
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+          }
+#else
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
+#endif
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* IterFinish.proto */
+static CYTHON_INLINE int __Pyx_IterFinish(void);
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
+#endif
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectCallNoArg.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+#else
+#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
+#endif
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* PyObjectGetMethod.proto */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method);
+
+/* PyObjectCallMethod0.proto */
+static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name);
+
+/* RaiseNeedMoreValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
+
+/* RaiseTooManyValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
+
+/* UnpackItemEndCheck.proto */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected);
+
+/* RaiseNoneIterError.proto */
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void);
+
+/* UnpackTupleError.proto */
+static void __Pyx_UnpackTupleError(PyObject *, Py_ssize_t index);
+
+/* UnpackTuple2.proto */
+#define __Pyx_unpack_tuple2(tuple, value1, value2, is_tuple, has_known_size, decref_tuple)\
+    (likely(is_tuple || PyTuple_Check(tuple)) ?\
+        (likely(has_known_size || PyTuple_GET_SIZE(tuple) == 2) ?\
+            __Pyx_unpack_tuple2_exact(tuple, value1, value2, decref_tuple) :\
+            (__Pyx_UnpackTupleError(tuple, 2), -1)) :\
+        __Pyx_unpack_tuple2_generic(tuple, value1, value2, has_known_size, decref_tuple))
+static CYTHON_INLINE int __Pyx_unpack_tuple2_exact(
+    PyObject* tuple, PyObject** value1, PyObject** value2, int decref_tuple);
+static int __Pyx_unpack_tuple2_generic(
+    PyObject* tuple, PyObject** value1, PyObject** value2, int has_known_size, int decref_tuple);
+
+/* dict_iter.proto */
+static CYTHON_INLINE PyObject* __Pyx_dict_iterator(PyObject* dict, int is_dict, PyObject* method_name,
+                                                   Py_ssize_t* p_orig_length, int* p_is_dict);
+static CYTHON_INLINE int __Pyx_dict_iter_next(PyObject* dict_or_iter, Py_ssize_t orig_length, Py_ssize_t* ppos,
+                                              PyObject** pkey, PyObject** pvalue, PyObject** pitem, int is_dict);
+
+/* PyIntBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
+#else
+#define __Pyx_PyInt_AddObjC(op1, op2, intval, inplace, zerodivision_check)\
+    (inplace ? PyNumber_InPlaceAdd(op1, op2) : PyNumber_Add(op1, op2))
+#endif
+
+/* ExtTypeTest.proto */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
+
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
+
+/* ObjectGetItem.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject* key);
+#else
+#define __Pyx_PyObject_GetItem(obj, key)  PyObject_GetItem(obj, key)
+#endif
+
+/* ListCompAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len)) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* DictGetItem.proto */
+#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
+static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key);
+#define __Pyx_PyObject_Dict_GetItem(obj, name)\
+    (likely(PyDict_CheckExact(obj)) ?\
+     __Pyx_PyDict_GetItem(obj, name) : PyObject_GetItem(obj, name))
+#else
+#define __Pyx_PyDict_GetItem(d, key) PyObject_GetItem(d, key)
+#define __Pyx_PyObject_Dict_GetItem(obj, name)  PyObject_GetItem(obj, name)
+#endif
+
+/* PySequenceContains.proto */
+static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
+    int result = PySequence_Contains(seq, item);
+    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
+}
+
+/* PyIntBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_FloorDivideObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
+#else
+#define __Pyx_PyInt_FloorDivideObjC(op1, op2, intval, inplace, zerodivision_check)\
+    (inplace ? PyNumber_InPlaceFloorDivide(op1, op2) : PyNumber_FloorDivide(op1, op2))
+#endif
+
+/* UnpackUnboundCMethod.proto */
+typedef struct {
+    PyObject *type;
+    PyObject **method_name;
+    PyCFunction func;
+    PyObject *method;
+    int flag;
+} __Pyx_CachedCFunction;
+
+/* CallUnboundCMethod1.proto */
+static PyObject* __Pyx__CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg);
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg);
+#else
+#define __Pyx_CallUnboundCMethod1(cfunc, self, arg)  __Pyx__CallUnboundCMethod1(cfunc, self, arg)
+#endif
+
+/* PyIntCompare.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_EqObjC(PyObject *op1, PyObject *op2, long intval, long inplace);
+
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* RaiseDoubleKeywords.proto */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
+
+/* ParseKeywords.proto */
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
+    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
+    const char* function_name);
+
+/* ArgTypeTest.proto */
+#define __Pyx_ArgTypeTest(obj, type, none_allowed, name, exact)\
+    ((likely((Py_TYPE(obj) == type) | (none_allowed && (obj == Py_None)))) ? 1 :\
+        __Pyx__ArgTypeTest(obj, type, name, exact))
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact);
+
+/* IncludeStringH.proto */
+#include <string.h>
+
+/* BytesEquals.proto */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals);
+
+/* UnicodeEquals.proto */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals);
+
+/* ListAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* SliceTupleAndList.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyList_GetSlice(PyObject* src, Py_ssize_t start, Py_ssize_t stop);
+static CYTHON_INLINE PyObject* __Pyx_PyTuple_GetSlice(PyObject* src, Py_ssize_t start, Py_ssize_t stop);
+#else
+#define __Pyx_PyList_GetSlice(seq, start, stop)   PySequence_GetSlice(seq, start, stop)
+#define __Pyx_PyTuple_GetSlice(seq, start, stop)  PySequence_GetSlice(seq, start, stop)
+#endif
+
+/* PyObjectCallMethod1.proto */
+static PyObject* __Pyx_PyObject_CallMethod1(PyObject* obj, PyObject* method_name, PyObject* arg);
+
+/* append.proto */
+static CYTHON_INLINE int __Pyx_PyObject_Append(PyObject* L, PyObject* x);
+
+/* ListExtend.proto */
+static CYTHON_INLINE int __Pyx_PyList_Extend(PyObject* L, PyObject* v) {
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject* none = _PyList_Extend((PyListObject*)L, v);
+    if (unlikely(!none))
+        return -1;
+    Py_DECREF(none);
+    return 0;
+#else
+    return PyList_SetSlice(L, PY_SSIZE_T_MAX, PY_SSIZE_T_MAX, v);
+#endif
+}
+
+/* PyIntCompare.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_NeObjC(PyObject *op1, PyObject *op2, long intval, long inplace);
+
+/* PyIntBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_RemainderObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
+#else
+#define __Pyx_PyInt_RemainderObjC(op1, op2, intval, inplace, zerodivision_check)\
+    (inplace ? PyNumber_InPlaceRemainder(op1, op2) : PyNumber_Remainder(op1, op2))
+#endif
+
+/* PyIntBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_SubtractObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
+#else
+#define __Pyx_PyInt_SubtractObjC(op1, op2, intval, inplace, zerodivision_check)\
+    (inplace ? PyNumber_InPlaceSubtract(op1, op2) : PyNumber_Subtract(op1, op2))
+#endif
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* WriteUnraisableException.proto */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil);
+
+/* GetTopmostException.proto */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
+#endif
+
+/* SaveResetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+#else
+#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
+#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
+#endif
+
+/* PyErrExceptionMatches.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* GetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* TypeImport.proto */
+#ifndef __PYX_HAVE_RT_ImportType_proto_0_29_37
+#define __PYX_HAVE_RT_ImportType_proto_0_29_37
+#if __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if __STDC_VERSION__ >= 201112L || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize_0_29_37 {
+   __Pyx_ImportType_CheckSize_Error_0_29_37 = 0,
+   __Pyx_ImportType_CheckSize_Warn_0_29_37 = 1,
+   __Pyx_ImportType_CheckSize_Ignore_0_29_37 = 2
+};
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size);
+#endif
+
+/* GetVTable.proto */
+static void* __Pyx_GetVtable(PyObject *dict);
+
+/* Import.proto */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
+
+/* FetchCommonType.proto */
+static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type);
+
+/* CythonFunctionShared.proto */
+#define __Pyx_CyFunction_USED 1
+#define __Pyx_CYFUNCTION_STATICMETHOD  0x01
+#define __Pyx_CYFUNCTION_CLASSMETHOD   0x02
+#define __Pyx_CYFUNCTION_CCLASS        0x04
+#define __Pyx_CyFunction_GetClosure(f)\
+    (((__pyx_CyFunctionObject *) (f))->func_closure)
+#define __Pyx_CyFunction_GetClassObj(f)\
+    (((__pyx_CyFunctionObject *) (f))->func_classobj)
+#define __Pyx_CyFunction_Defaults(type, f)\
+    ((type *)(((__pyx_CyFunctionObject *) (f))->defaults))
+#define __Pyx_CyFunction_SetDefaultsGetter(f, g)\
+    ((__pyx_CyFunctionObject *) (f))->defaults_getter = (g)
+typedef struct {
+    PyCFunctionObject func;
+#if PY_VERSION_HEX < 0x030500A0
+    PyObject *func_weakreflist;
+#endif
+    PyObject *func_dict;
+    PyObject *func_name;
+    PyObject *func_qualname;
+    PyObject *func_doc;
+    PyObject *func_globals;
+    PyObject *func_code;
+    PyObject *func_closure;
+    PyObject *func_classobj;
+    void *defaults;
+    int defaults_pyobjects;
+    size_t defaults_size;  // used by FusedFunction for copying defaults
+    int flags;
+    PyObject *defaults_tuple;
+    PyObject *defaults_kwdict;
+    PyObject *(*defaults_getter)(PyObject *);
+    PyObject *func_annotations;
+} __pyx_CyFunctionObject;
+static PyTypeObject *__pyx_CyFunctionType = 0;
+#define __Pyx_CyFunction_Check(obj)  (__Pyx_TypeCheck(obj, __pyx_CyFunctionType))
+static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject* op, PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *self,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
+static CYTHON_INLINE void *__Pyx_CyFunction_InitDefaults(PyObject *m,
+                                                         size_t size,
+                                                         int pyobjects);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *m,
+                                                            PyObject *tuple);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *m,
+                                                             PyObject *dict);
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *m,
+                                                              PyObject *dict);
+static int __pyx_CyFunction_init(void);
+
+/* CythonFunction.proto */
+static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *closure,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
+
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
+
+/* CodeObjectCache.proto */
+typedef struct {
+    PyCodeObject* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+};
+static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static PyCodeObject *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* RealImag.proto */
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    #define __Pyx_CREAL(z) ((z).real())
+    #define __Pyx_CIMAG(z) ((z).imag())
+  #else
+    #define __Pyx_CREAL(z) (__real__(z))
+    #define __Pyx_CIMAG(z) (__imag__(z))
+  #endif
+#else
+    #define __Pyx_CREAL(z) ((z).real)
+    #define __Pyx_CIMAG(z) ((z).imag)
+#endif
+#if defined(__cplusplus) && CYTHON_CCOMPLEX\
+        && (defined(_WIN32) || defined(__clang__) || (defined(__GNUC__) && (__GNUC__ >= 5 || __GNUC__ == 4 && __GNUC_MINOR__ >= 4 )) || __cplusplus >= 201103)
+    #define __Pyx_SET_CREAL(z,x) ((z).real(x))
+    #define __Pyx_SET_CIMAG(z,y) ((z).imag(y))
+#else
+    #define __Pyx_SET_CREAL(z,x) __Pyx_CREAL(z) = (x)
+    #define __Pyx_SET_CIMAG(z,y) __Pyx_CIMAG(z) = (y)
+#endif
+
+/* Arithmetic.proto */
+#if CYTHON_CCOMPLEX
+    #define __Pyx_c_eq_float(a, b)   ((a)==(b))
+    #define __Pyx_c_sum_float(a, b)  ((a)+(b))
+    #define __Pyx_c_diff_float(a, b) ((a)-(b))
+    #define __Pyx_c_prod_float(a, b) ((a)*(b))
+    #define __Pyx_c_quot_float(a, b) ((a)/(b))
+    #define __Pyx_c_neg_float(a)     (-(a))
+  #ifdef __cplusplus
+    #define __Pyx_c_is_zero_float(z) ((z)==(float)0)
+    #define __Pyx_c_conj_float(z)    (::std::conj(z))
+    #if 1
+        #define __Pyx_c_abs_float(z)     (::std::abs(z))
+        #define __Pyx_c_pow_float(a, b)  (::std::pow(a, b))
+    #endif
+  #else
+    #define __Pyx_c_is_zero_float(z) ((z)==0)
+    #define __Pyx_c_conj_float(z)    (conjf(z))
+    #if 1
+        #define __Pyx_c_abs_float(z)     (cabsf(z))
+        #define __Pyx_c_pow_float(a, b)  (cpowf(a, b))
+    #endif
+ #endif
+#else
+    static CYTHON_INLINE int __Pyx_c_eq_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_sum_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_diff_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_prod_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_quot_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_neg_float(__pyx_t_float_complex);
+    static CYTHON_INLINE int __Pyx_c_is_zero_float(__pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_conj_float(__pyx_t_float_complex);
+    #if 1
+        static CYTHON_INLINE float __Pyx_c_abs_float(__pyx_t_float_complex);
+        static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_pow_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    #endif
+#endif
+
+/* Arithmetic.proto */
+#if CYTHON_CCOMPLEX
+    #define __Pyx_c_eq_double(a, b)   ((a)==(b))
+    #define __Pyx_c_sum_double(a, b)  ((a)+(b))
+    #define __Pyx_c_diff_double(a, b) ((a)-(b))
+    #define __Pyx_c_prod_double(a, b) ((a)*(b))
+    #define __Pyx_c_quot_double(a, b) ((a)/(b))
+    #define __Pyx_c_neg_double(a)     (-(a))
+  #ifdef __cplusplus
+    #define __Pyx_c_is_zero_double(z) ((z)==(double)0)
+    #define __Pyx_c_conj_double(z)    (::std::conj(z))
+    #if 1
+        #define __Pyx_c_abs_double(z)     (::std::abs(z))
+        #define __Pyx_c_pow_double(a, b)  (::std::pow(a, b))
+    #endif
+  #else
+    #define __Pyx_c_is_zero_double(z) ((z)==0)
+    #define __Pyx_c_conj_double(z)    (conj(z))
+    #if 1
+        #define __Pyx_c_abs_double(z)     (cabs(z))
+        #define __Pyx_c_pow_double(a, b)  (cpow(a, b))
+    #endif
+ #endif
+#else
+    static CYTHON_INLINE int __Pyx_c_eq_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_sum_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_diff_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_prod_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_quot_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_neg_double(__pyx_t_double_complex);
+    static CYTHON_INLINE int __Pyx_c_is_zero_double(__pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_conj_double(__pyx_t_double_complex);
+    #if 1
+        static CYTHON_INLINE double __Pyx_c_abs_double(__pyx_t_double_complex);
+        static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_pow_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    #endif
+#endif
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(void);
+
+/* FunctionExport.proto */
+static int __Pyx_ExportFunction(const char *name, void (*f)(void), const char *sig);
+
+/* VoidPtrImport.proto */
+static int __Pyx_ImportVoidPtr_0_29_37(PyObject *module, const char *name, void **p, const char *sig);
+
+/* InitStrings.proto */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+
+
+/* Module declarations from 'cpython.buffer' */
+
+/* Module declarations from 'libc.string' */
+
+/* Module declarations from 'libc.stdio' */
+
+/* Module declarations from '__builtin__' */
+
+/* Module declarations from 'cpython.type' */
+static PyTypeObject *__pyx_ptype_7cpython_4type_type = 0;
+
+/* Module declarations from 'cpython.version' */
+
+/* Module declarations from 'cpython.exc' */
+
+/* Module declarations from 'cpython.module' */
+
+/* Module declarations from 'cpython.mem' */
+
+/* Module declarations from 'cpython.tuple' */
+
+/* Module declarations from 'cpython.list' */
+
+/* Module declarations from 'cpython.sequence' */
+
+/* Module declarations from 'cpython.mapping' */
+
+/* Module declarations from 'cpython.iterator' */
+
+/* Module declarations from 'cpython.number' */
+
+/* Module declarations from 'cpython.int' */
+
+/* Module declarations from '__builtin__' */
+
+/* Module declarations from 'cpython.bool' */
+static PyTypeObject *__pyx_ptype_7cpython_4bool_bool = 0;
+
+/* Module declarations from 'cpython.long' */
+
+/* Module declarations from 'cpython.float' */
+
+/* Module declarations from '__builtin__' */
+
+/* Module declarations from 'cpython.complex' */
+static PyTypeObject *__pyx_ptype_7cpython_7complex_complex = 0;
+
+/* Module declarations from 'cpython.string' */
+
+/* Module declarations from 'cpython.unicode' */
+
+/* Module declarations from 'cpython.dict' */
+
+/* Module declarations from 'cpython.instance' */
+
+/* Module declarations from 'cpython.function' */
+
+/* Module declarations from 'cpython.method' */
+
+/* Module declarations from 'cpython.weakref' */
+
+/* Module declarations from 'cpython.getargs' */
+
+/* Module declarations from 'cpython.pythread' */
+
+/* Module declarations from 'cpython.pystate' */
+
+/* Module declarations from 'cpython.cobject' */
+
+/* Module declarations from 'cpython.oldbuffer' */
+
+/* Module declarations from 'cpython.set' */
+
+/* Module declarations from 'cpython.bytes' */
+
+/* Module declarations from 'cpython.pycapsule' */
+
+/* Module declarations from 'cpython' */
+
+/* Module declarations from 'cpython.object' */
+
+/* Module declarations from 'cpython.ref' */
+
+/* Module declarations from 'numpy' */
+
+/* Module declarations from 'numpy' */
+static PyTypeObject *__pyx_ptype_5numpy_dtype = 0;
+static PyTypeObject *__pyx_ptype_5numpy_flatiter = 0;
+static PyTypeObject *__pyx_ptype_5numpy_broadcast = 0;
+static PyTypeObject *__pyx_ptype_5numpy_ndarray = 0;
+static PyTypeObject *__pyx_ptype_5numpy_generic = 0;
+static PyTypeObject *__pyx_ptype_5numpy_number = 0;
+static PyTypeObject *__pyx_ptype_5numpy_integer = 0;
+static PyTypeObject *__pyx_ptype_5numpy_signedinteger = 0;
+static PyTypeObject *__pyx_ptype_5numpy_unsignedinteger = 0;
+static PyTypeObject *__pyx_ptype_5numpy_inexact = 0;
+static PyTypeObject *__pyx_ptype_5numpy_floating = 0;
+static PyTypeObject *__pyx_ptype_5numpy_complexfloating = 0;
+static PyTypeObject *__pyx_ptype_5numpy_flexible = 0;
+static PyTypeObject *__pyx_ptype_5numpy_character = 0;
+static PyTypeObject *__pyx_ptype_5numpy_ufunc = 0;
+
+/* Module declarations from 'rmgpy.constants' */
+static double *__pyx_vp_5rmgpy_9constants_pi = 0;
+#define __pyx_v_5rmgpy_9constants_pi (*__pyx_vp_5rmgpy_9constants_pi)
+static double *__pyx_vp_5rmgpy_9constants_Na = 0;
+#define __pyx_v_5rmgpy_9constants_Na (*__pyx_vp_5rmgpy_9constants_Na)
+static double *__pyx_vp_5rmgpy_9constants_kB = 0;
+#define __pyx_v_5rmgpy_9constants_kB (*__pyx_vp_5rmgpy_9constants_kB)
+static double *__pyx_vp_5rmgpy_9constants_R = 0;
+#define __pyx_v_5rmgpy_9constants_R (*__pyx_vp_5rmgpy_9constants_R)
+static double *__pyx_vp_5rmgpy_9constants_h = 0;
+#define __pyx_v_5rmgpy_9constants_h (*__pyx_vp_5rmgpy_9constants_h)
+static double *__pyx_vp_5rmgpy_9constants_hbar = 0;
+#define __pyx_v_5rmgpy_9constants_hbar (*__pyx_vp_5rmgpy_9constants_hbar)
+static double *__pyx_vp_5rmgpy_9constants_c = 0;
+#define __pyx_v_5rmgpy_9constants_c (*__pyx_vp_5rmgpy_9constants_c)
+static double *__pyx_vp_5rmgpy_9constants_e = 0;
+#define __pyx_v_5rmgpy_9constants_e (*__pyx_vp_5rmgpy_9constants_e)
+static double *__pyx_vp_5rmgpy_9constants_m_e = 0;
+#define __pyx_v_5rmgpy_9constants_m_e (*__pyx_vp_5rmgpy_9constants_m_e)
+static double *__pyx_vp_5rmgpy_9constants_m_p = 0;
+#define __pyx_v_5rmgpy_9constants_m_p (*__pyx_vp_5rmgpy_9constants_m_p)
+static double *__pyx_vp_5rmgpy_9constants_m_n = 0;
+#define __pyx_v_5rmgpy_9constants_m_n (*__pyx_vp_5rmgpy_9constants_m_n)
+static double *__pyx_vp_5rmgpy_9constants_amu = 0;
+#define __pyx_v_5rmgpy_9constants_amu (*__pyx_vp_5rmgpy_9constants_amu)
+static double *__pyx_vp_5rmgpy_9constants_a0 = 0;
+#define __pyx_v_5rmgpy_9constants_a0 (*__pyx_vp_5rmgpy_9constants_a0)
+static double *__pyx_vp_5rmgpy_9constants_E_h = 0;
+#define __pyx_v_5rmgpy_9constants_E_h (*__pyx_vp_5rmgpy_9constants_E_h)
+
+/* Module declarations from 'rmgpy.molecule.graph' */
+static PyTypeObject *__pyx_ptype_5rmgpy_8molecule_5graph_Vertex = 0;
+static PyTypeObject *__pyx_ptype_5rmgpy_8molecule_5graph_Edge = 0;
+static PyTypeObject *__pyx_ptype_5rmgpy_8molecule_5graph_Graph = 0;
+
+/* Module declarations from 'rmgpy.molecule.atomtype' */
+static PyTypeObject *__pyx_ptype_5rmgpy_8molecule_8atomtype_AtomType = 0;
+
+/* Module declarations from 'rmgpy.molecule.group' */
+static PyTypeObject *__pyx_ptype_5rmgpy_8molecule_5group_GroupAtom = 0;
+static PyTypeObject *__pyx_ptype_5rmgpy_8molecule_5group_GroupBond = 0;
+static PyTypeObject *__pyx_ptype_5rmgpy_8molecule_5group_Group = 0;
+
+/* Module declarations from 'rmgpy.molecule.element' */
+static PyTypeObject *__pyx_ptype_5rmgpy_8molecule_7element_Element = 0;
+
+/* Module declarations from 'rmgpy.molecule.molecule' */
+static PyTypeObject *__pyx_ptype_5rmgpy_8molecule_8molecule_Atom = 0;
+static PyTypeObject *__pyx_ptype_5rmgpy_8molecule_8molecule_Bond = 0;
+static PyTypeObject *__pyx_ptype_5rmgpy_8molecule_8molecule_Molecule = 0;
+static PyObject **__pyx_vp_5rmgpy_8molecule_8molecule_bond_orders = 0;
+#define __pyx_v_5rmgpy_8molecule_8molecule_bond_orders (*__pyx_vp_5rmgpy_8molecule_8molecule_bond_orders)
+static PyObject **__pyx_vp_5rmgpy_8molecule_8molecule_atom_id_counter = 0;
+#define __pyx_v_5rmgpy_8molecule_8molecule_atom_id_counter (*__pyx_vp_5rmgpy_8molecule_8molecule_atom_id_counter)
+
+/* Module declarations from 'rmgpy.molecule.symmetry' */
+static float __pyx_f_5rmgpy_8molecule_8symmetry_calculate_atom_symmetry_number(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch); /*proto*/
+static float __pyx_f_5rmgpy_8molecule_8symmetry_calculate_bond_symmetry_number(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch); /*proto*/
+static float __pyx_f_5rmgpy_8molecule_8symmetry_calculate_axis_symmetry_number(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch); /*proto*/
+static float __pyx_f_5rmgpy_8molecule_8symmetry_calculate_cyclic_symmetry_number(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch); /*proto*/
+static int __pyx_f_5rmgpy_8molecule_8symmetry__indistinguishable(struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch); /*proto*/
+static float __pyx_f_5rmgpy_8molecule_8symmetry_calculate_symmetry_number(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch); /*proto*/
+#define __Pyx_MODULE_NAME "rmgpy.molecule.symmetry"
+extern int __pyx_module_is_main_rmgpy__molecule__symmetry;
+int __pyx_module_is_main_rmgpy__molecule__symmetry = 0;
+
+/* Implementation of 'rmgpy.molecule.symmetry' */
+static PyObject *__pyx_builtin_range;
+static PyObject *__pyx_builtin_sum;
+static PyObject *__pyx_builtin_enumerate;
+static PyObject *__pyx_builtin_id;
+static PyObject *__pyx_builtin_ImportError;
+static const char __pyx_k_id[] = "id";
+static const char __pyx_k_N3d[] = "N3d";
+static const char __pyx_k_O2s[] = "O2s";
+static const char __pyx_k_sum[] = "sum";
+static const char __pyx_k_atom[] = "atom";
+static const char __pyx_k_keys[] = "keys";
+static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_name[] = "__name__";
+static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_atom1[] = "atom1";
+static const char __pyx_k_atom2[] = "atom2";
+static const char __pyx_k_atoms[] = "atoms";
+static const char __pyx_k_bonds[] = "bonds";
+static const char __pyx_k_chain[] = "chain";
+static const char __pyx_k_count[] = "count";
+static const char __pyx_k_edges[] = "edges";
+static const char __pyx_k_index[] = "index";
+static const char __pyx_k_items[] = "items";
+static const char __pyx_k_label[] = "label";
+static const char __pyx_k_order[] = "order";
+static const char __pyx_k_range[] = "range";
+static const char __pyx_k_split[] = "split";
+static const char __pyx_k_append[] = "append";
+static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_remove[] = "remove";
+static const char __pyx_k_values[] = "values";
+static const char __pyx_k_atomtype[] = "atomtype";
+static const char __pyx_k_molecule[] = "molecule";
+static const char __pyx_k_enumerate[] = "enumerate";
+static const char __pyx_k_is_double[] = "is_double";
+static const char __pyx_k_is_single[] = "is_single";
+static const char __pyx_k_is_triple[] = "is_triple";
+static const char __pyx_k_itertools[] = "itertools";
+static const char __pyx_k_equivalent[] = "equivalent";
+static const char __pyx_k_is_benzene[] = "is_benzene";
+static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_ImportError[] = "ImportError";
+static const char __pyx_k_remove_atom[] = "remove_atom";
+static const char __pyx_k_is_isomorphic[] = "is_isomorphic";
+static const char __pyx_k_indistinguishable[] = "_indistinguishable";
+static const char __pyx_k_radical_electrons[] = "radical_electrons";
+static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_rmgpy_molecule_symmetry[] = "rmgpy.molecule.symmetry";
+static const char __pyx_k_calculate_symmetry_number[] = "calculate_symmetry_number";
+static const char __pyx_k_rmgpy_molecule_symmetry_py[] = "rmgpy/molecule/symmetry.py";
+static const char __pyx_k_calculate_atom_symmetry_number[] = "calculate_atom_symmetry_number";
+static const char __pyx_k_calculate_axis_symmetry_number[] = "calculate_axis_symmetry_number";
+static const char __pyx_k_calculate_bond_symmetry_number[] = "calculate_bond_symmetry_number";
+static const char __pyx_k_This_module_provides_functional[] = "\nThis module provides functionality for estimating the symmetry number of a\nmolecule from its chemical graph representation.\n";
+static const char __pyx_k_numpy_core_multiarray_failed_to[] = "numpy.core.multiarray failed to import";
+static const char __pyx_k_calculate_cyclic_symmetry_number[] = "calculate_cyclic_symmetry_number";
+static const char __pyx_k_numpy_core_umath_failed_to_impor[] = "numpy.core.umath failed to import";
+static PyObject *__pyx_n_s_ImportError;
+static PyObject *__pyx_n_u_N3d;
+static PyObject *__pyx_n_u_O2s;
+static PyObject *__pyx_n_s_append;
+static PyObject *__pyx_n_s_atom;
+static PyObject *__pyx_n_s_atom1;
+static PyObject *__pyx_n_s_atom2;
+static PyObject *__pyx_n_s_atoms;
+static PyObject *__pyx_n_s_atomtype;
+static PyObject *__pyx_n_s_bonds;
+static PyObject *__pyx_n_s_calculate_atom_symmetry_number;
+static PyObject *__pyx_n_s_calculate_axis_symmetry_number;
+static PyObject *__pyx_n_s_calculate_bond_symmetry_number;
+static PyObject *__pyx_n_s_calculate_cyclic_symmetry_number;
+static PyObject *__pyx_n_s_calculate_symmetry_number;
+static PyObject *__pyx_n_s_chain;
+static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_count;
+static PyObject *__pyx_n_s_edges;
+static PyObject *__pyx_n_s_enumerate;
+static PyObject *__pyx_n_s_equivalent;
+static PyObject *__pyx_n_s_id;
+static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_index;
+static PyObject *__pyx_n_s_indistinguishable;
+static PyObject *__pyx_n_s_is_benzene;
+static PyObject *__pyx_n_s_is_double;
+static PyObject *__pyx_n_s_is_isomorphic;
+static PyObject *__pyx_n_s_is_single;
+static PyObject *__pyx_n_s_is_triple;
+static PyObject *__pyx_n_s_items;
+static PyObject *__pyx_n_s_itertools;
+static PyObject *__pyx_n_s_keys;
+static PyObject *__pyx_n_s_label;
+static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_molecule;
+static PyObject *__pyx_n_s_name;
+static PyObject *__pyx_kp_u_numpy_core_multiarray_failed_to;
+static PyObject *__pyx_kp_u_numpy_core_umath_failed_to_impor;
+static PyObject *__pyx_n_s_order;
+static PyObject *__pyx_n_s_pyx_vtable;
+static PyObject *__pyx_n_s_radical_electrons;
+static PyObject *__pyx_n_s_range;
+static PyObject *__pyx_n_s_remove;
+static PyObject *__pyx_n_s_remove_atom;
+static PyObject *__pyx_n_s_rmgpy_molecule_symmetry;
+static PyObject *__pyx_kp_s_rmgpy_molecule_symmetry_py;
+static PyObject *__pyx_n_s_split;
+static PyObject *__pyx_n_s_sum;
+static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_n_s_values;
+static PyObject *__pyx_pf_5rmgpy_8molecule_8symmetry_calculate_atom_symmetry_number(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *__pyx_v_molecule, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *__pyx_v_atom); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8molecule_8symmetry_2calculate_bond_symmetry_number(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *__pyx_v_molecule, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *__pyx_v_atom1, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *__pyx_v_atom2); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8molecule_8symmetry_4calculate_axis_symmetry_number(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *__pyx_v_molecule); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8molecule_8symmetry_6calculate_cyclic_symmetry_number(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *__pyx_v_molecule); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8molecule_8symmetry_8_indistinguishable(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *__pyx_v_atom1, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *__pyx_v_atom2); /* proto */
+static PyObject *__pyx_pf_5rmgpy_8molecule_8symmetry_10calculate_symmetry_number(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *__pyx_v_molecule); /* proto */
+static __Pyx_CachedCFunction __pyx_umethod_PyList_Type_count = {0, &__pyx_n_s_count, 0, 0, 0};
+static __Pyx_CachedCFunction __pyx_umethod_PyList_Type_remove = {0, &__pyx_n_s_remove, 0, 0, 0};
+static PyObject *__pyx_float_0_5;
+static PyObject *__pyx_int_0;
+static PyObject *__pyx_int_1;
+static PyObject *__pyx_int_2;
+static PyObject *__pyx_int_3;
+static PyObject *__pyx_int_4;
+static PyObject *__pyx_int_6;
+static PyObject *__pyx_int_12;
+static PyObject *__pyx_int_neg_1;
+static PyObject *__pyx_tuple_;
+static PyObject *__pyx_tuple__2;
+static PyObject *__pyx_tuple__3;
+static PyObject *__pyx_tuple__5;
+static PyObject *__pyx_tuple__7;
+static PyObject *__pyx_tuple__9;
+static PyObject *__pyx_tuple__11;
+static PyObject *__pyx_tuple__13;
+static PyObject *__pyx_codeobj__4;
+static PyObject *__pyx_codeobj__6;
+static PyObject *__pyx_codeobj__8;
+static PyObject *__pyx_codeobj__10;
+static PyObject *__pyx_codeobj__12;
+static PyObject *__pyx_codeobj__14;
+/* Late includes */
+
+/* "rmgpy/molecule/symmetry.py":38
+ * 
+ * 
+ * def calculate_atom_symmetry_number(molecule, atom):             # <<<<<<<<<<<<<<
+ *     """
+ *     Return the symmetry number centered at `atom` in the structure. The
+ */
+
+static PyObject *__pyx_pw_5rmgpy_8molecule_8symmetry_1calculate_atom_symmetry_number(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static float __pyx_f_5rmgpy_8molecule_8symmetry_calculate_atom_symmetry_number(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *__pyx_v_molecule, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *__pyx_v_atom, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  PyObject *__pyx_v_symmetry_number = NULL;
+  PyObject *__pyx_v_single = NULL;
+  PyObject *__pyx_v_double = NULL;
+  PyObject *__pyx_v_triple = NULL;
+  PyObject *__pyx_v_benzene = NULL;
+  PyObject *__pyx_v_num_neighbors = NULL;
+  PyObject *__pyx_v_bond = NULL;
+  struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *__pyx_v_molecule0 = NULL;
+  PyObject *__pyx_v_groups = NULL;
+  PyObject *__pyx_v_group_isomorphism = NULL;
+  PyObject *__pyx_v_group1 = NULL;
+  PyObject *__pyx_v_group2 = NULL;
+  PyObject *__pyx_v_count = NULL;
+  CYTHON_UNUSED PyObject *__pyx_v_i = NULL;
+  PyObject *__pyx_7genexpr__pyx_v_group = NULL;
+  PyObject *__pyx_8genexpr1__pyx_v_group1 = NULL;
+  PyObject *__pyx_8genexpr2__pyx_v_group2 = NULL;
+  float __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  float __pyx_t_10;
+  struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_copy __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_t_13;
+  PyObject *__pyx_t_14 = NULL;
+  PyObject *__pyx_t_15 = NULL;
+  PyObject *(*__pyx_t_16)(PyObject *);
+  int __pyx_t_17;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("calculate_atom_symmetry_number", 0);
+  __Pyx_INCREF((PyObject *)__pyx_v_molecule);
+  __Pyx_INCREF((PyObject *)__pyx_v_atom);
+
+  /* "rmgpy/molecule/symmetry.py":43
+ *     `atom` of interest must not be in a cycle.
+ *     """
+ *     symmetry_number = 1             # <<<<<<<<<<<<<<
+ * 
+ *     single = double = triple = benzene = num_neighbors = 0  # note that 0 is immutable
+ */
+  __Pyx_INCREF(__pyx_int_1);
+  __pyx_v_symmetry_number = __pyx_int_1;
+
+  /* "rmgpy/molecule/symmetry.py":45
+ *     symmetry_number = 1
+ * 
+ *     single = double = triple = benzene = num_neighbors = 0  # note that 0 is immutable             # <<<<<<<<<<<<<<
+ *     for bond in atom.edges.values():
+ *         if bond.is_single():
+ */
+  __Pyx_INCREF(__pyx_int_0);
+  __pyx_v_single = __pyx_int_0;
+  __Pyx_INCREF(__pyx_int_0);
+  __pyx_v_double = __pyx_int_0;
+  __Pyx_INCREF(__pyx_int_0);
+  __pyx_v_triple = __pyx_int_0;
+  __Pyx_INCREF(__pyx_int_0);
+  __pyx_v_benzene = __pyx_int_0;
+  __Pyx_INCREF(__pyx_int_0);
+  __pyx_v_num_neighbors = __pyx_int_0;
+
+  /* "rmgpy/molecule/symmetry.py":46
+ * 
+ *     single = double = triple = benzene = num_neighbors = 0  # note that 0 is immutable
+ *     for bond in atom.edges.values():             # <<<<<<<<<<<<<<
+ *         if bond.is_single():
+ *             single += 1
+ */
+  __pyx_t_2 = 0;
+  if (unlikely(__pyx_v_atom->__pyx_base.edges == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "values");
+    __PYX_ERR(0, 46, __pyx_L1_error)
+  }
+  __pyx_t_5 = __Pyx_dict_iterator(__pyx_v_atom->__pyx_base.edges, 1, __pyx_n_s_values, (&__pyx_t_3), (&__pyx_t_4)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 46, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_1);
+  __pyx_t_1 = __pyx_t_5;
+  __pyx_t_5 = 0;
+  while (1) {
+    __pyx_t_6 = __Pyx_dict_iter_next(__pyx_t_1, __pyx_t_3, &__pyx_t_2, NULL, &__pyx_t_5, NULL, __pyx_t_4);
+    if (unlikely(__pyx_t_6 == 0)) break;
+    if (unlikely(__pyx_t_6 == -1)) __PYX_ERR(0, 46, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_XDECREF_SET(__pyx_v_bond, __pyx_t_5);
+    __pyx_t_5 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":47
+ *     single = double = triple = benzene = num_neighbors = 0  # note that 0 is immutable
+ *     for bond in atom.edges.values():
+ *         if bond.is_single():             # <<<<<<<<<<<<<<
+ *             single += 1
+ *         elif bond.is_double():
+ */
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_bond, __pyx_n_s_is_single); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 47, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_8 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_7))) {
+      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_7);
+      if (likely(__pyx_t_8)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+        __Pyx_INCREF(__pyx_t_8);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_7, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_8) ? __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_8) : __Pyx_PyObject_CallNoArg(__pyx_t_7);
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 47, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_9 < 0)) __PYX_ERR(0, 47, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (__pyx_t_9) {
+
+      /* "rmgpy/molecule/symmetry.py":48
+ *     for bond in atom.edges.values():
+ *         if bond.is_single():
+ *             single += 1             # <<<<<<<<<<<<<<
+ *         elif bond.is_double():
+ *             double += 1
+ */
+      __pyx_t_5 = __Pyx_PyInt_AddObjC(__pyx_v_single, __pyx_int_1, 1, 1, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 48, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF_SET(__pyx_v_single, __pyx_t_5);
+      __pyx_t_5 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":47
+ *     single = double = triple = benzene = num_neighbors = 0  # note that 0 is immutable
+ *     for bond in atom.edges.values():
+ *         if bond.is_single():             # <<<<<<<<<<<<<<
+ *             single += 1
+ *         elif bond.is_double():
+ */
+      goto __pyx_L5;
+    }
+
+    /* "rmgpy/molecule/symmetry.py":49
+ *         if bond.is_single():
+ *             single += 1
+ *         elif bond.is_double():             # <<<<<<<<<<<<<<
+ *             double += 1
+ *         elif bond.is_triple():
+ */
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_bond, __pyx_n_s_is_double); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 49, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_8 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_7))) {
+      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_7);
+      if (likely(__pyx_t_8)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+        __Pyx_INCREF(__pyx_t_8);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_7, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_8) ? __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_8) : __Pyx_PyObject_CallNoArg(__pyx_t_7);
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 49, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_9 < 0)) __PYX_ERR(0, 49, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (__pyx_t_9) {
+
+      /* "rmgpy/molecule/symmetry.py":50
+ *             single += 1
+ *         elif bond.is_double():
+ *             double += 1             # <<<<<<<<<<<<<<
+ *         elif bond.is_triple():
+ *             triple += 1
+ */
+      __pyx_t_5 = __Pyx_PyInt_AddObjC(__pyx_v_double, __pyx_int_1, 1, 1, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 50, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF_SET(__pyx_v_double, __pyx_t_5);
+      __pyx_t_5 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":49
+ *         if bond.is_single():
+ *             single += 1
+ *         elif bond.is_double():             # <<<<<<<<<<<<<<
+ *             double += 1
+ *         elif bond.is_triple():
+ */
+      goto __pyx_L5;
+    }
+
+    /* "rmgpy/molecule/symmetry.py":51
+ *         elif bond.is_double():
+ *             double += 1
+ *         elif bond.is_triple():             # <<<<<<<<<<<<<<
+ *             triple += 1
+ *         elif bond.is_benzene():
+ */
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_bond, __pyx_n_s_is_triple); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 51, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_8 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_7))) {
+      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_7);
+      if (likely(__pyx_t_8)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+        __Pyx_INCREF(__pyx_t_8);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_7, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_8) ? __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_8) : __Pyx_PyObject_CallNoArg(__pyx_t_7);
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 51, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_9 < 0)) __PYX_ERR(0, 51, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (__pyx_t_9) {
+
+      /* "rmgpy/molecule/symmetry.py":52
+ *             double += 1
+ *         elif bond.is_triple():
+ *             triple += 1             # <<<<<<<<<<<<<<
+ *         elif bond.is_benzene():
+ *             benzene += 1
+ */
+      __pyx_t_5 = __Pyx_PyInt_AddObjC(__pyx_v_triple, __pyx_int_1, 1, 1, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 52, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF_SET(__pyx_v_triple, __pyx_t_5);
+      __pyx_t_5 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":51
+ *         elif bond.is_double():
+ *             double += 1
+ *         elif bond.is_triple():             # <<<<<<<<<<<<<<
+ *             triple += 1
+ *         elif bond.is_benzene():
+ */
+      goto __pyx_L5;
+    }
+
+    /* "rmgpy/molecule/symmetry.py":53
+ *         elif bond.is_triple():
+ *             triple += 1
+ *         elif bond.is_benzene():             # <<<<<<<<<<<<<<
+ *             benzene += 1
+ *         num_neighbors += 1
+ */
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_bond, __pyx_n_s_is_benzene); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 53, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_8 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_7))) {
+      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_7);
+      if (likely(__pyx_t_8)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+        __Pyx_INCREF(__pyx_t_8);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_7, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_8) ? __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_8) : __Pyx_PyObject_CallNoArg(__pyx_t_7);
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 53, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_9 < 0)) __PYX_ERR(0, 53, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (__pyx_t_9) {
+
+      /* "rmgpy/molecule/symmetry.py":54
+ *             triple += 1
+ *         elif bond.is_benzene():
+ *             benzene += 1             # <<<<<<<<<<<<<<
+ *         num_neighbors += 1
+ * 
+ */
+      __pyx_t_5 = __Pyx_PyInt_AddObjC(__pyx_v_benzene, __pyx_int_1, 1, 1, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 54, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF_SET(__pyx_v_benzene, __pyx_t_5);
+      __pyx_t_5 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":53
+ *         elif bond.is_triple():
+ *             triple += 1
+ *         elif bond.is_benzene():             # <<<<<<<<<<<<<<
+ *             benzene += 1
+ *         num_neighbors += 1
+ */
+    }
+    __pyx_L5:;
+
+    /* "rmgpy/molecule/symmetry.py":55
+ *         elif bond.is_benzene():
+ *             benzene += 1
+ *         num_neighbors += 1             # <<<<<<<<<<<<<<
+ * 
+ *     # If atom has zero or one neighbors, the symmetry number is 1
+ */
+    __pyx_t_5 = __Pyx_PyInt_AddObjC(__pyx_v_num_neighbors, __pyx_int_1, 1, 1, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 55, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF_SET(__pyx_v_num_neighbors, __pyx_t_5);
+    __pyx_t_5 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":58
+ * 
+ *     # If atom has zero or one neighbors, the symmetry number is 1
+ *     if num_neighbors < 2:             # <<<<<<<<<<<<<<
+ *         return symmetry_number
+ * 
+ */
+  __pyx_t_1 = PyObject_RichCompare(__pyx_v_num_neighbors, __pyx_int_2, Py_LT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 58, __pyx_L1_error)
+  __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_9 < 0)) __PYX_ERR(0, 58, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_9) {
+
+    /* "rmgpy/molecule/symmetry.py":59
+ *     # If atom has zero or one neighbors, the symmetry number is 1
+ *     if num_neighbors < 2:
+ *         return symmetry_number             # <<<<<<<<<<<<<<
+ * 
+ *     # Create temporary structures for each functional group attached to atom
+ */
+    __pyx_t_10 = __pyx_PyFloat_AsFloat(__pyx_v_symmetry_number); if (unlikely((__pyx_t_10 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 59, __pyx_L1_error)
+    __pyx_r = __pyx_t_10;
+    goto __pyx_L0;
+
+    /* "rmgpy/molecule/symmetry.py":58
+ * 
+ *     # If atom has zero or one neighbors, the symmetry number is 1
+ *     if num_neighbors < 2:             # <<<<<<<<<<<<<<
+ *         return symmetry_number
+ * 
+ */
+  }
+
+  /* "rmgpy/molecule/symmetry.py":62
+ * 
+ *     # Create temporary structures for each functional group attached to atom
+ *     molecule0 = molecule             # <<<<<<<<<<<<<<
+ *     molecule = molecule0.copy(True)
+ *     atom = molecule.vertices[molecule0.vertices.index(atom)]
+ */
+  __Pyx_INCREF(((PyObject *)__pyx_v_molecule));
+  __pyx_v_molecule0 = __pyx_v_molecule;
+
+  /* "rmgpy/molecule/symmetry.py":63
+ *     # Create temporary structures for each functional group attached to atom
+ *     molecule0 = molecule
+ *     molecule = molecule0.copy(True)             # <<<<<<<<<<<<<<
+ *     atom = molecule.vertices[molecule0.vertices.index(atom)]
+ *     molecule.remove_atom(atom)
+ */
+  __pyx_t_11.__pyx_n = 1;
+  __pyx_t_11.deep = 1;
+  __pyx_t_1 = ((PyObject *)((struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Molecule *)__pyx_v_molecule0->__pyx_base.__pyx_vtab)->__pyx_base.copy(((struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *)__pyx_v_molecule0), 0, &__pyx_t_11)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5rmgpy_8molecule_8molecule_Molecule))))) __PYX_ERR(0, 63, __pyx_L1_error)
+  __Pyx_DECREF_SET(__pyx_v_molecule, ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *)__pyx_t_1));
+  __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":64
+ *     molecule0 = molecule
+ *     molecule = molecule0.copy(True)
+ *     atom = molecule.vertices[molecule0.vertices.index(atom)]             # <<<<<<<<<<<<<<
+ *     molecule.remove_atom(atom)
+ *     groups = molecule.split()
+ */
+  if (unlikely(__pyx_v_molecule->__pyx_base.vertices == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 64, __pyx_L1_error)
+  }
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_molecule0->__pyx_base.vertices, __pyx_n_s_index); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 64, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_7 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_7)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_7);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_7, ((PyObject *)__pyx_v_atom)) : __Pyx_PyObject_CallOneArg(__pyx_t_5, ((PyObject *)__pyx_v_atom));
+  __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 64, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_GetItem(__pyx_v_molecule->__pyx_base.vertices, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 64, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 64, __pyx_L1_error)
+  __Pyx_DECREF_SET(__pyx_v_atom, ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_5));
+  __pyx_t_5 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":65
+ *     molecule = molecule0.copy(True)
+ *     atom = molecule.vertices[molecule0.vertices.index(atom)]
+ *     molecule.remove_atom(atom)             # <<<<<<<<<<<<<<
+ *     groups = molecule.split()
+ * 
+ */
+  __pyx_t_5 = ((struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Molecule *)__pyx_v_molecule->__pyx_base.__pyx_vtab)->remove_atom(__pyx_v_molecule, __pyx_v_atom, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 65, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":66
+ *     atom = molecule.vertices[molecule0.vertices.index(atom)]
+ *     molecule.remove_atom(atom)
+ *     groups = molecule.split()             # <<<<<<<<<<<<<<
+ * 
+ *     # Determine equivalence of functional groups around atom
+ */
+  __pyx_t_5 = ((struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Molecule *)__pyx_v_molecule->__pyx_base.__pyx_vtab)->__pyx_base.split(((struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *)__pyx_v_molecule), 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 66, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_v_groups = ((PyObject*)__pyx_t_5);
+  __pyx_t_5 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":69
+ * 
+ *     # Determine equivalence of functional groups around atom
+ *     group_isomorphism = dict([(group, dict()) for group in groups])             # <<<<<<<<<<<<<<
+ *     for group1 in groups:
+ *         for group2 in groups:
+ */
+  { /* enter inner scope */
+    __pyx_t_5 = PyList_New(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 69, __pyx_L9_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (unlikely(__pyx_v_groups == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+      __PYX_ERR(0, 69, __pyx_L9_error)
+    }
+    __pyx_t_1 = __pyx_v_groups; __Pyx_INCREF(__pyx_t_1); __pyx_t_3 = 0;
+    for (;;) {
+      if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_1)) break;
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      __pyx_t_7 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_7); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 69, __pyx_L9_error)
+      #else
+      __pyx_t_7 = PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 69, __pyx_L9_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      #endif
+      __Pyx_XDECREF_SET(__pyx_7genexpr__pyx_v_group, __pyx_t_7);
+      __pyx_t_7 = 0;
+      __pyx_t_7 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 69, __pyx_L9_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 69, __pyx_L9_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_INCREF(__pyx_7genexpr__pyx_v_group);
+      __Pyx_GIVEREF(__pyx_7genexpr__pyx_v_group);
+      PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_7genexpr__pyx_v_group);
+      __Pyx_GIVEREF(__pyx_t_7);
+      PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_7);
+      __pyx_t_7 = 0;
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_5, (PyObject*)__pyx_t_8))) __PYX_ERR(0, 69, __pyx_L9_error)
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_7genexpr__pyx_v_group); __pyx_7genexpr__pyx_v_group = 0;
+    goto __pyx_L12_exit_scope;
+    __pyx_L9_error:;
+    __Pyx_XDECREF(__pyx_7genexpr__pyx_v_group); __pyx_7genexpr__pyx_v_group = 0;
+    goto __pyx_L1_error;
+    __pyx_L12_exit_scope:;
+  } /* exit inner scope */
+  __pyx_t_1 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyDict_Type)), __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 69, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_v_group_isomorphism = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":70
+ *     # Determine equivalence of functional groups around atom
+ *     group_isomorphism = dict([(group, dict()) for group in groups])
+ *     for group1 in groups:             # <<<<<<<<<<<<<<
+ *         for group2 in groups:
+ *             if group1 is not group2 and group2 not in group_isomorphism[group1]:
+ */
+  if (unlikely(__pyx_v_groups == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+    __PYX_ERR(0, 70, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_v_groups; __Pyx_INCREF(__pyx_t_1); __pyx_t_3 = 0;
+  for (;;) {
+    if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_1)) break;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    __pyx_t_5 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_5); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 70, __pyx_L1_error)
+    #else
+    __pyx_t_5 = PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 70, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    #endif
+    __Pyx_XDECREF_SET(__pyx_v_group1, __pyx_t_5);
+    __pyx_t_5 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":71
+ *     group_isomorphism = dict([(group, dict()) for group in groups])
+ *     for group1 in groups:
+ *         for group2 in groups:             # <<<<<<<<<<<<<<
+ *             if group1 is not group2 and group2 not in group_isomorphism[group1]:
+ *                 group_isomorphism[group1][group2] = group1.is_isomorphic(group2)
+ */
+    if (unlikely(__pyx_v_groups == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+      __PYX_ERR(0, 71, __pyx_L1_error)
+    }
+    __pyx_t_5 = __pyx_v_groups; __Pyx_INCREF(__pyx_t_5); __pyx_t_2 = 0;
+    for (;;) {
+      if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_5)) break;
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      __pyx_t_8 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_2); __Pyx_INCREF(__pyx_t_8); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 71, __pyx_L1_error)
+      #else
+      __pyx_t_8 = PySequence_ITEM(__pyx_t_5, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 71, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      #endif
+      __Pyx_XDECREF_SET(__pyx_v_group2, __pyx_t_8);
+      __pyx_t_8 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":72
+ *     for group1 in groups:
+ *         for group2 in groups:
+ *             if group1 is not group2 and group2 not in group_isomorphism[group1]:             # <<<<<<<<<<<<<<
+ *                 group_isomorphism[group1][group2] = group1.is_isomorphic(group2)
+ *                 group_isomorphism[group2][group1] = group_isomorphism[group1][group2]
+ */
+      __pyx_t_12 = (__pyx_v_group1 != __pyx_v_group2);
+      __pyx_t_13 = (__pyx_t_12 != 0);
+      if (__pyx_t_13) {
+      } else {
+        __pyx_t_9 = __pyx_t_13;
+        goto __pyx_L18_bool_binop_done;
+      }
+      __pyx_t_8 = __Pyx_PyDict_GetItem(__pyx_v_group_isomorphism, __pyx_v_group1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 72, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_13 = (__Pyx_PySequence_ContainsTF(__pyx_v_group2, __pyx_t_8, Py_NE)); if (unlikely(__pyx_t_13 < 0)) __PYX_ERR(0, 72, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_12 = (__pyx_t_13 != 0);
+      __pyx_t_9 = __pyx_t_12;
+      __pyx_L18_bool_binop_done:;
+      if (__pyx_t_9) {
+
+        /* "rmgpy/molecule/symmetry.py":73
+ *         for group2 in groups:
+ *             if group1 is not group2 and group2 not in group_isomorphism[group1]:
+ *                 group_isomorphism[group1][group2] = group1.is_isomorphic(group2)             # <<<<<<<<<<<<<<
+ *                 group_isomorphism[group2][group1] = group_isomorphism[group1][group2]
+ *             elif group1 is group2:
+ */
+        __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_group1, __pyx_n_s_is_isomorphic); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 73, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        __pyx_t_14 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_7))) {
+          __pyx_t_14 = PyMethod_GET_SELF(__pyx_t_7);
+          if (likely(__pyx_t_14)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+            __Pyx_INCREF(__pyx_t_14);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_7, function);
+          }
+        }
+        __pyx_t_8 = (__pyx_t_14) ? __Pyx_PyObject_Call2Args(__pyx_t_7, __pyx_t_14, __pyx_v_group2) : __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_v_group2);
+        __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
+        if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 73, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __pyx_t_7 = __Pyx_PyDict_GetItem(__pyx_v_group_isomorphism, __pyx_v_group1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 73, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        if (unlikely(PyObject_SetItem(__pyx_t_7, __pyx_v_group2, __pyx_t_8) < 0)) __PYX_ERR(0, 73, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":74
+ *             if group1 is not group2 and group2 not in group_isomorphism[group1]:
+ *                 group_isomorphism[group1][group2] = group1.is_isomorphic(group2)
+ *                 group_isomorphism[group2][group1] = group_isomorphism[group1][group2]             # <<<<<<<<<<<<<<
+ *             elif group1 is group2:
+ *                 group_isomorphism[group1][group1] = True
+ */
+        __pyx_t_8 = __Pyx_PyDict_GetItem(__pyx_v_group_isomorphism, __pyx_v_group1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 74, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __pyx_t_7 = __Pyx_PyObject_GetItem(__pyx_t_8, __pyx_v_group2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 74, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __pyx_t_8 = __Pyx_PyDict_GetItem(__pyx_v_group_isomorphism, __pyx_v_group2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 74, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        if (unlikely(PyObject_SetItem(__pyx_t_8, __pyx_v_group1, __pyx_t_7) < 0)) __PYX_ERR(0, 74, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":72
+ *     for group1 in groups:
+ *         for group2 in groups:
+ *             if group1 is not group2 and group2 not in group_isomorphism[group1]:             # <<<<<<<<<<<<<<
+ *                 group_isomorphism[group1][group2] = group1.is_isomorphic(group2)
+ *                 group_isomorphism[group2][group1] = group_isomorphism[group1][group2]
+ */
+        goto __pyx_L17;
+      }
+
+      /* "rmgpy/molecule/symmetry.py":75
+ *                 group_isomorphism[group1][group2] = group1.is_isomorphic(group2)
+ *                 group_isomorphism[group2][group1] = group_isomorphism[group1][group2]
+ *             elif group1 is group2:             # <<<<<<<<<<<<<<
+ *                 group_isomorphism[group1][group1] = True
+ *     count = [sum([int(group_isomorphism[group1][group2]) for group2 in groups]) for group1 in groups]
+ */
+      __pyx_t_9 = (__pyx_v_group1 == __pyx_v_group2);
+      __pyx_t_12 = (__pyx_t_9 != 0);
+      if (__pyx_t_12) {
+
+        /* "rmgpy/molecule/symmetry.py":76
+ *                 group_isomorphism[group2][group1] = group_isomorphism[group1][group2]
+ *             elif group1 is group2:
+ *                 group_isomorphism[group1][group1] = True             # <<<<<<<<<<<<<<
+ *     count = [sum([int(group_isomorphism[group1][group2]) for group2 in groups]) for group1 in groups]
+ *     for i in range(count.count(2) // 2):
+ */
+        __pyx_t_7 = __Pyx_PyDict_GetItem(__pyx_v_group_isomorphism, __pyx_v_group1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 76, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        if (unlikely(PyObject_SetItem(__pyx_t_7, __pyx_v_group1, Py_True) < 0)) __PYX_ERR(0, 76, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":75
+ *                 group_isomorphism[group1][group2] = group1.is_isomorphic(group2)
+ *                 group_isomorphism[group2][group1] = group_isomorphism[group1][group2]
+ *             elif group1 is group2:             # <<<<<<<<<<<<<<
+ *                 group_isomorphism[group1][group1] = True
+ *     count = [sum([int(group_isomorphism[group1][group2]) for group2 in groups]) for group1 in groups]
+ */
+      }
+      __pyx_L17:;
+
+      /* "rmgpy/molecule/symmetry.py":71
+ *     group_isomorphism = dict([(group, dict()) for group in groups])
+ *     for group1 in groups:
+ *         for group2 in groups:             # <<<<<<<<<<<<<<
+ *             if group1 is not group2 and group2 not in group_isomorphism[group1]:
+ *                 group_isomorphism[group1][group2] = group1.is_isomorphic(group2)
+ */
+    }
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":70
+ *     # Determine equivalence of functional groups around atom
+ *     group_isomorphism = dict([(group, dict()) for group in groups])
+ *     for group1 in groups:             # <<<<<<<<<<<<<<
+ *         for group2 in groups:
+ *             if group1 is not group2 and group2 not in group_isomorphism[group1]:
+ */
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":77
+ *             elif group1 is group2:
+ *                 group_isomorphism[group1][group1] = True
+ *     count = [sum([int(group_isomorphism[group1][group2]) for group2 in groups]) for group1 in groups]             # <<<<<<<<<<<<<<
+ *     for i in range(count.count(2) // 2):
+ *         count.remove(2)
+ */
+  { /* enter inner scope */
+    __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 77, __pyx_L22_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    if (unlikely(__pyx_v_groups == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+      __PYX_ERR(0, 77, __pyx_L22_error)
+    }
+    __pyx_t_5 = __pyx_v_groups; __Pyx_INCREF(__pyx_t_5); __pyx_t_3 = 0;
+    for (;;) {
+      if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_5)) break;
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      __pyx_t_7 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_3); __Pyx_INCREF(__pyx_t_7); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 77, __pyx_L22_error)
+      #else
+      __pyx_t_7 = PySequence_ITEM(__pyx_t_5, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 77, __pyx_L22_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      #endif
+      __Pyx_XDECREF_SET(__pyx_8genexpr1__pyx_v_group1, __pyx_t_7);
+      __pyx_t_7 = 0;
+      { /* enter inner scope */
+        __pyx_t_7 = PyList_New(0); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 77, __pyx_L27_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        if (unlikely(__pyx_v_groups == Py_None)) {
+          PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+          __PYX_ERR(0, 77, __pyx_L27_error)
+        }
+        __pyx_t_8 = __pyx_v_groups; __Pyx_INCREF(__pyx_t_8); __pyx_t_2 = 0;
+        for (;;) {
+          if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_8)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_14 = PyList_GET_ITEM(__pyx_t_8, __pyx_t_2); __Pyx_INCREF(__pyx_t_14); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 77, __pyx_L27_error)
+          #else
+          __pyx_t_14 = PySequence_ITEM(__pyx_t_8, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 77, __pyx_L27_error)
+          __Pyx_GOTREF(__pyx_t_14);
+          #endif
+          __Pyx_XDECREF_SET(__pyx_8genexpr2__pyx_v_group2, __pyx_t_14);
+          __pyx_t_14 = 0;
+          __pyx_t_14 = __Pyx_PyDict_GetItem(__pyx_v_group_isomorphism, __pyx_8genexpr1__pyx_v_group1); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 77, __pyx_L27_error)
+          __Pyx_GOTREF(__pyx_t_14);
+          __pyx_t_15 = __Pyx_PyObject_GetItem(__pyx_t_14, __pyx_8genexpr2__pyx_v_group2); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 77, __pyx_L27_error)
+          __Pyx_GOTREF(__pyx_t_15);
+          __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+          __pyx_t_14 = __Pyx_PyNumber_Int(__pyx_t_15); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 77, __pyx_L27_error)
+          __Pyx_GOTREF(__pyx_t_14);
+          __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+          if (unlikely(__Pyx_ListComp_Append(__pyx_t_7, (PyObject*)__pyx_t_14))) __PYX_ERR(0, 77, __pyx_L27_error)
+          __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+        }
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_group2); __pyx_8genexpr2__pyx_v_group2 = 0;
+        goto __pyx_L30_exit_scope;
+        __pyx_L27_error:;
+        __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_group2); __pyx_8genexpr2__pyx_v_group2 = 0;
+        goto __pyx_L22_error;
+        __pyx_L30_exit_scope:;
+      } /* exit inner scope */
+      __pyx_t_8 = __Pyx_PyObject_CallOneArg(__pyx_builtin_sum, __pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 77, __pyx_L22_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_8))) __PYX_ERR(0, 77, __pyx_L22_error)
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_group1); __pyx_8genexpr1__pyx_v_group1 = 0;
+    goto __pyx_L31_exit_scope;
+    __pyx_L22_error:;
+    __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_group1); __pyx_8genexpr1__pyx_v_group1 = 0;
+    goto __pyx_L1_error;
+    __pyx_L31_exit_scope:;
+  } /* exit inner scope */
+  __pyx_v_count = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":78
+ *                 group_isomorphism[group1][group1] = True
+ *     count = [sum([int(group_isomorphism[group1][group2]) for group2 in groups]) for group1 in groups]
+ *     for i in range(count.count(2) // 2):             # <<<<<<<<<<<<<<
+ *         count.remove(2)
+ *     for i in range(count.count(3) // 3):
+ */
+  __pyx_t_1 = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyList_Type_count, __pyx_v_count, __pyx_int_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 78, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = __Pyx_PyInt_FloorDivideObjC(__pyx_t_1, __pyx_int_2, 2, 0, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 78, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 78, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (likely(PyList_CheckExact(__pyx_t_1)) || PyTuple_CheckExact(__pyx_t_1)) {
+    __pyx_t_5 = __pyx_t_1; __Pyx_INCREF(__pyx_t_5); __pyx_t_3 = 0;
+    __pyx_t_16 = NULL;
+  } else {
+    __pyx_t_3 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 78, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_16 = Py_TYPE(__pyx_t_5)->tp_iternext; if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 78, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_16)) {
+      if (likely(PyList_CheckExact(__pyx_t_5))) {
+        if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_5)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_3); __Pyx_INCREF(__pyx_t_1); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 78, __pyx_L1_error)
+        #else
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_5, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 78, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        #endif
+      } else {
+        if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_5)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_3); __Pyx_INCREF(__pyx_t_1); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 78, __pyx_L1_error)
+        #else
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_5, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 78, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        #endif
+      }
+    } else {
+      __pyx_t_1 = __pyx_t_16(__pyx_t_5);
+      if (unlikely(!__pyx_t_1)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 78, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":79
+ *     count = [sum([int(group_isomorphism[group1][group2]) for group2 in groups]) for group1 in groups]
+ *     for i in range(count.count(2) // 2):
+ *         count.remove(2)             # <<<<<<<<<<<<<<
+ *     for i in range(count.count(3) // 3):
+ *         count.remove(3)
+ */
+    __pyx_t_1 = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyList_Type_remove, __pyx_v_count, __pyx_int_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 79, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":78
+ *                 group_isomorphism[group1][group1] = True
+ *     count = [sum([int(group_isomorphism[group1][group2]) for group2 in groups]) for group1 in groups]
+ *     for i in range(count.count(2) // 2):             # <<<<<<<<<<<<<<
+ *         count.remove(2)
+ *     for i in range(count.count(3) // 3):
+ */
+  }
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":80
+ *     for i in range(count.count(2) // 2):
+ *         count.remove(2)
+ *     for i in range(count.count(3) // 3):             # <<<<<<<<<<<<<<
+ *         count.remove(3)
+ *         count.remove(3)
+ */
+  __pyx_t_5 = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyList_Type_count, __pyx_v_count, __pyx_int_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 80, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_1 = __Pyx_PyInt_FloorDivideObjC(__pyx_t_5, __pyx_int_3, 3, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 80, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 80, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (likely(PyList_CheckExact(__pyx_t_5)) || PyTuple_CheckExact(__pyx_t_5)) {
+    __pyx_t_1 = __pyx_t_5; __Pyx_INCREF(__pyx_t_1); __pyx_t_3 = 0;
+    __pyx_t_16 = NULL;
+  } else {
+    __pyx_t_3 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 80, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_16 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 80, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_16)) {
+      if (likely(PyList_CheckExact(__pyx_t_1))) {
+        if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_5 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_5); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 80, __pyx_L1_error)
+        #else
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 80, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        #endif
+      } else {
+        if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_5); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 80, __pyx_L1_error)
+        #else
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 80, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        #endif
+      }
+    } else {
+      __pyx_t_5 = __pyx_t_16(__pyx_t_1);
+      if (unlikely(!__pyx_t_5)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 80, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_5);
+    }
+    __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_5);
+    __pyx_t_5 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":81
+ *         count.remove(2)
+ *     for i in range(count.count(3) // 3):
+ *         count.remove(3)             # <<<<<<<<<<<<<<
+ *         count.remove(3)
+ *     for i in range(count.count(4) // 4):
+ */
+    __pyx_t_5 = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyList_Type_remove, __pyx_v_count, __pyx_int_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 81, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":82
+ *     for i in range(count.count(3) // 3):
+ *         count.remove(3)
+ *         count.remove(3)             # <<<<<<<<<<<<<<
+ *     for i in range(count.count(4) // 4):
+ *         count.remove(4)
+ */
+    __pyx_t_5 = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyList_Type_remove, __pyx_v_count, __pyx_int_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 82, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":80
+ *     for i in range(count.count(2) // 2):
+ *         count.remove(2)
+ *     for i in range(count.count(3) // 3):             # <<<<<<<<<<<<<<
+ *         count.remove(3)
+ *         count.remove(3)
+ */
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":83
+ *         count.remove(3)
+ *         count.remove(3)
+ *     for i in range(count.count(4) // 4):             # <<<<<<<<<<<<<<
+ *         count.remove(4)
+ *         count.remove(4)
+ */
+  __pyx_t_1 = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyList_Type_count, __pyx_v_count, __pyx_int_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 83, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = __Pyx_PyInt_FloorDivideObjC(__pyx_t_1, __pyx_int_4, 4, 0, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 83, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 83, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (likely(PyList_CheckExact(__pyx_t_1)) || PyTuple_CheckExact(__pyx_t_1)) {
+    __pyx_t_5 = __pyx_t_1; __Pyx_INCREF(__pyx_t_5); __pyx_t_3 = 0;
+    __pyx_t_16 = NULL;
+  } else {
+    __pyx_t_3 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 83, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_16 = Py_TYPE(__pyx_t_5)->tp_iternext; if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 83, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_16)) {
+      if (likely(PyList_CheckExact(__pyx_t_5))) {
+        if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_5)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_3); __Pyx_INCREF(__pyx_t_1); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 83, __pyx_L1_error)
+        #else
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_5, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 83, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        #endif
+      } else {
+        if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_5)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_3); __Pyx_INCREF(__pyx_t_1); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 83, __pyx_L1_error)
+        #else
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_5, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 83, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        #endif
+      }
+    } else {
+      __pyx_t_1 = __pyx_t_16(__pyx_t_5);
+      if (unlikely(!__pyx_t_1)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 83, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":84
+ *         count.remove(3)
+ *     for i in range(count.count(4) // 4):
+ *         count.remove(4)             # <<<<<<<<<<<<<<
+ *         count.remove(4)
+ *         count.remove(4)
+ */
+    __pyx_t_1 = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyList_Type_remove, __pyx_v_count, __pyx_int_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 84, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":85
+ *     for i in range(count.count(4) // 4):
+ *         count.remove(4)
+ *         count.remove(4)             # <<<<<<<<<<<<<<
+ *         count.remove(4)
+ *     count.sort()
+ */
+    __pyx_t_1 = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyList_Type_remove, __pyx_v_count, __pyx_int_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 85, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":86
+ *         count.remove(4)
+ *         count.remove(4)
+ *         count.remove(4)             # <<<<<<<<<<<<<<
+ *     count.sort()
+ *     count.reverse()
+ */
+    __pyx_t_1 = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyList_Type_remove, __pyx_v_count, __pyx_int_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":83
+ *         count.remove(3)
+ *         count.remove(3)
+ *     for i in range(count.count(4) // 4):             # <<<<<<<<<<<<<<
+ *         count.remove(4)
+ *         count.remove(4)
+ */
+  }
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":87
+ *         count.remove(4)
+ *         count.remove(4)
+ *     count.sort()             # <<<<<<<<<<<<<<
+ *     count.reverse()
+ * 
+ */
+  __pyx_t_17 = PyList_Sort(__pyx_v_count); if (unlikely(__pyx_t_17 == ((int)-1))) __PYX_ERR(0, 87, __pyx_L1_error)
+
+  /* "rmgpy/molecule/symmetry.py":88
+ *         count.remove(4)
+ *     count.sort()
+ *     count.reverse()             # <<<<<<<<<<<<<<
+ * 
+ *     if atom.radical_electrons == 0:
+ */
+  __pyx_t_17 = PyList_Reverse(__pyx_v_count); if (unlikely(__pyx_t_17 == ((int)-1))) __PYX_ERR(0, 88, __pyx_L1_error)
+
+  /* "rmgpy/molecule/symmetry.py":90
+ *     count.reverse()
+ * 
+ *     if atom.radical_electrons == 0:             # <<<<<<<<<<<<<<
+ *         if single == 4:
+ *             # Four single bonds
+ */
+  switch (__pyx_v_atom->radical_electrons) {
+    case 0:
+
+    /* "rmgpy/molecule/symmetry.py":91
+ * 
+ *     if atom.radical_electrons == 0:
+ *         if single == 4:             # <<<<<<<<<<<<<<
+ *             # Four single bonds
+ *             if count == [4]:
+ */
+    __pyx_t_5 = __Pyx_PyInt_EqObjC(__pyx_v_single, __pyx_int_4, 4, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 91, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 91, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (__pyx_t_12) {
+
+      /* "rmgpy/molecule/symmetry.py":93
+ *         if single == 4:
+ *             # Four single bonds
+ *             if count == [4]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 12
+ *             elif count == [3, 1]:
+ */
+      __pyx_t_5 = PyList_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 93, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_INCREF(__pyx_int_4);
+      __Pyx_GIVEREF(__pyx_int_4);
+      PyList_SET_ITEM(__pyx_t_5, 0, __pyx_int_4);
+      __pyx_t_1 = PyObject_RichCompare(__pyx_v_count, __pyx_t_5, Py_EQ); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 93, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 93, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      if (__pyx_t_12) {
+
+        /* "rmgpy/molecule/symmetry.py":94
+ *             # Four single bonds
+ *             if count == [4]:
+ *                 symmetry_number *= 12             # <<<<<<<<<<<<<<
+ *             elif count == [3, 1]:
+ *                 symmetry_number *= 3
+ */
+        __pyx_t_1 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_12); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 94, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_1);
+        __pyx_t_1 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":93
+ *         if single == 4:
+ *             # Four single bonds
+ *             if count == [4]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 12
+ *             elif count == [3, 1]:
+ */
+        goto __pyx_L39;
+      }
+
+      /* "rmgpy/molecule/symmetry.py":95
+ *             if count == [4]:
+ *                 symmetry_number *= 12
+ *             elif count == [3, 1]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 3
+ *             elif count == [2, 2]:
+ */
+      __pyx_t_1 = PyList_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 95, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_INCREF(__pyx_int_3);
+      __Pyx_GIVEREF(__pyx_int_3);
+      PyList_SET_ITEM(__pyx_t_1, 0, __pyx_int_3);
+      __Pyx_INCREF(__pyx_int_1);
+      __Pyx_GIVEREF(__pyx_int_1);
+      PyList_SET_ITEM(__pyx_t_1, 1, __pyx_int_1);
+      __pyx_t_5 = PyObject_RichCompare(__pyx_v_count, __pyx_t_1, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 95, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 95, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (__pyx_t_12) {
+
+        /* "rmgpy/molecule/symmetry.py":96
+ *                 symmetry_number *= 12
+ *             elif count == [3, 1]:
+ *                 symmetry_number *= 3             # <<<<<<<<<<<<<<
+ *             elif count == [2, 2]:
+ *                 symmetry_number *= 2
+ */
+        __pyx_t_5 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 96, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_5);
+        __pyx_t_5 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":95
+ *             if count == [4]:
+ *                 symmetry_number *= 12
+ *             elif count == [3, 1]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 3
+ *             elif count == [2, 2]:
+ */
+        goto __pyx_L39;
+      }
+
+      /* "rmgpy/molecule/symmetry.py":97
+ *             elif count == [3, 1]:
+ *                 symmetry_number *= 3
+ *             elif count == [2, 2]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 2
+ *             elif count == [2, 1, 1]:
+ */
+      __pyx_t_5 = PyList_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 97, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_INCREF(__pyx_int_2);
+      __Pyx_GIVEREF(__pyx_int_2);
+      PyList_SET_ITEM(__pyx_t_5, 0, __pyx_int_2);
+      __Pyx_INCREF(__pyx_int_2);
+      __Pyx_GIVEREF(__pyx_int_2);
+      PyList_SET_ITEM(__pyx_t_5, 1, __pyx_int_2);
+      __pyx_t_1 = PyObject_RichCompare(__pyx_v_count, __pyx_t_5, Py_EQ); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 97, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 97, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      if (__pyx_t_12) {
+
+        /* "rmgpy/molecule/symmetry.py":98
+ *                 symmetry_number *= 3
+ *             elif count == [2, 2]:
+ *                 symmetry_number *= 2             # <<<<<<<<<<<<<<
+ *             elif count == [2, 1, 1]:
+ *                 symmetry_number *= 1
+ */
+        __pyx_t_1 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 98, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_1);
+        __pyx_t_1 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":97
+ *             elif count == [3, 1]:
+ *                 symmetry_number *= 3
+ *             elif count == [2, 2]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 2
+ *             elif count == [2, 1, 1]:
+ */
+        goto __pyx_L39;
+      }
+
+      /* "rmgpy/molecule/symmetry.py":99
+ *             elif count == [2, 2]:
+ *                 symmetry_number *= 2
+ *             elif count == [2, 1, 1]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 1
+ *             elif count == [1, 1, 1, 1]:
+ */
+      __pyx_t_1 = PyList_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 99, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_INCREF(__pyx_int_2);
+      __Pyx_GIVEREF(__pyx_int_2);
+      PyList_SET_ITEM(__pyx_t_1, 0, __pyx_int_2);
+      __Pyx_INCREF(__pyx_int_1);
+      __Pyx_GIVEREF(__pyx_int_1);
+      PyList_SET_ITEM(__pyx_t_1, 1, __pyx_int_1);
+      __Pyx_INCREF(__pyx_int_1);
+      __Pyx_GIVEREF(__pyx_int_1);
+      PyList_SET_ITEM(__pyx_t_1, 2, __pyx_int_1);
+      __pyx_t_5 = PyObject_RichCompare(__pyx_v_count, __pyx_t_1, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 99, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 99, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (__pyx_t_12) {
+
+        /* "rmgpy/molecule/symmetry.py":100
+ *                 symmetry_number *= 2
+ *             elif count == [2, 1, 1]:
+ *                 symmetry_number *= 1             # <<<<<<<<<<<<<<
+ *             elif count == [1, 1, 1, 1]:
+ *                 symmetry_number *= 0.5  # found chirality
+ */
+        __pyx_t_5 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 100, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_5);
+        __pyx_t_5 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":99
+ *             elif count == [2, 2]:
+ *                 symmetry_number *= 2
+ *             elif count == [2, 1, 1]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 1
+ *             elif count == [1, 1, 1, 1]:
+ */
+        goto __pyx_L39;
+      }
+
+      /* "rmgpy/molecule/symmetry.py":101
+ *             elif count == [2, 1, 1]:
+ *                 symmetry_number *= 1
+ *             elif count == [1, 1, 1, 1]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 0.5  # found chirality
+ *         elif single == 3:
+ */
+      __pyx_t_5 = PyList_New(4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 101, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_INCREF(__pyx_int_1);
+      __Pyx_GIVEREF(__pyx_int_1);
+      PyList_SET_ITEM(__pyx_t_5, 0, __pyx_int_1);
+      __Pyx_INCREF(__pyx_int_1);
+      __Pyx_GIVEREF(__pyx_int_1);
+      PyList_SET_ITEM(__pyx_t_5, 1, __pyx_int_1);
+      __Pyx_INCREF(__pyx_int_1);
+      __Pyx_GIVEREF(__pyx_int_1);
+      PyList_SET_ITEM(__pyx_t_5, 2, __pyx_int_1);
+      __Pyx_INCREF(__pyx_int_1);
+      __Pyx_GIVEREF(__pyx_int_1);
+      PyList_SET_ITEM(__pyx_t_5, 3, __pyx_int_1);
+      __pyx_t_1 = PyObject_RichCompare(__pyx_v_count, __pyx_t_5, Py_EQ); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 101, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 101, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      if (__pyx_t_12) {
+
+        /* "rmgpy/molecule/symmetry.py":102
+ *                 symmetry_number *= 1
+ *             elif count == [1, 1, 1, 1]:
+ *                 symmetry_number *= 0.5  # found chirality             # <<<<<<<<<<<<<<
+ *         elif single == 3:
+ *             # Three single bonds
+ */
+        __pyx_t_1 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_float_0_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 102, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_1);
+        __pyx_t_1 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":101
+ *             elif count == [2, 1, 1]:
+ *                 symmetry_number *= 1
+ *             elif count == [1, 1, 1, 1]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 0.5  # found chirality
+ *         elif single == 3:
+ */
+      }
+      __pyx_L39:;
+
+      /* "rmgpy/molecule/symmetry.py":91
+ * 
+ *     if atom.radical_electrons == 0:
+ *         if single == 4:             # <<<<<<<<<<<<<<
+ *             # Four single bonds
+ *             if count == [4]:
+ */
+      goto __pyx_L38;
+    }
+
+    /* "rmgpy/molecule/symmetry.py":103
+ *             elif count == [1, 1, 1, 1]:
+ *                 symmetry_number *= 0.5  # found chirality
+ *         elif single == 3:             # <<<<<<<<<<<<<<
+ *             # Three single bonds
+ *             if count == [3]:
+ */
+    __pyx_t_1 = __Pyx_PyInt_EqObjC(__pyx_v_single, __pyx_int_3, 3, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 103, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 103, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (__pyx_t_12) {
+
+      /* "rmgpy/molecule/symmetry.py":105
+ *         elif single == 3:
+ *             # Three single bonds
+ *             if count == [3]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 3
+ *             elif count == [2, 1]:
+ */
+      __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 105, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_INCREF(__pyx_int_3);
+      __Pyx_GIVEREF(__pyx_int_3);
+      PyList_SET_ITEM(__pyx_t_1, 0, __pyx_int_3);
+      __pyx_t_5 = PyObject_RichCompare(__pyx_v_count, __pyx_t_1, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 105, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 105, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (__pyx_t_12) {
+
+        /* "rmgpy/molecule/symmetry.py":106
+ *             # Three single bonds
+ *             if count == [3]:
+ *                 symmetry_number *= 3             # <<<<<<<<<<<<<<
+ *             elif count == [2, 1]:
+ *                 symmetry_number *= 1
+ */
+        __pyx_t_5 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 106, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_5);
+        __pyx_t_5 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":105
+ *         elif single == 3:
+ *             # Three single bonds
+ *             if count == [3]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 3
+ *             elif count == [2, 1]:
+ */
+        goto __pyx_L40;
+      }
+
+      /* "rmgpy/molecule/symmetry.py":107
+ *             if count == [3]:
+ *                 symmetry_number *= 3
+ *             elif count == [2, 1]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 1
+ *             elif count == [1, 1, 1]:
+ */
+      __pyx_t_5 = PyList_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 107, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_INCREF(__pyx_int_2);
+      __Pyx_GIVEREF(__pyx_int_2);
+      PyList_SET_ITEM(__pyx_t_5, 0, __pyx_int_2);
+      __Pyx_INCREF(__pyx_int_1);
+      __Pyx_GIVEREF(__pyx_int_1);
+      PyList_SET_ITEM(__pyx_t_5, 1, __pyx_int_1);
+      __pyx_t_1 = PyObject_RichCompare(__pyx_v_count, __pyx_t_5, Py_EQ); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 107, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 107, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      if (__pyx_t_12) {
+
+        /* "rmgpy/molecule/symmetry.py":108
+ *                 symmetry_number *= 3
+ *             elif count == [2, 1]:
+ *                 symmetry_number *= 1             # <<<<<<<<<<<<<<
+ *             elif count == [1, 1, 1]:
+ *                 symmetry_number *= 1
+ */
+        __pyx_t_1 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 108, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_1);
+        __pyx_t_1 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":107
+ *             if count == [3]:
+ *                 symmetry_number *= 3
+ *             elif count == [2, 1]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 1
+ *             elif count == [1, 1, 1]:
+ */
+        goto __pyx_L40;
+      }
+
+      /* "rmgpy/molecule/symmetry.py":109
+ *             elif count == [2, 1]:
+ *                 symmetry_number *= 1
+ *             elif count == [1, 1, 1]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 1
+ *         elif single == 2:
+ */
+      __pyx_t_1 = PyList_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 109, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_INCREF(__pyx_int_1);
+      __Pyx_GIVEREF(__pyx_int_1);
+      PyList_SET_ITEM(__pyx_t_1, 0, __pyx_int_1);
+      __Pyx_INCREF(__pyx_int_1);
+      __Pyx_GIVEREF(__pyx_int_1);
+      PyList_SET_ITEM(__pyx_t_1, 1, __pyx_int_1);
+      __Pyx_INCREF(__pyx_int_1);
+      __Pyx_GIVEREF(__pyx_int_1);
+      PyList_SET_ITEM(__pyx_t_1, 2, __pyx_int_1);
+      __pyx_t_5 = PyObject_RichCompare(__pyx_v_count, __pyx_t_1, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 109, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 109, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (__pyx_t_12) {
+
+        /* "rmgpy/molecule/symmetry.py":110
+ *                 symmetry_number *= 1
+ *             elif count == [1, 1, 1]:
+ *                 symmetry_number *= 1             # <<<<<<<<<<<<<<
+ *         elif single == 2:
+ *             # Two single bonds
+ */
+        __pyx_t_5 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 110, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_5);
+        __pyx_t_5 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":109
+ *             elif count == [2, 1]:
+ *                 symmetry_number *= 1
+ *             elif count == [1, 1, 1]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 1
+ *         elif single == 2:
+ */
+      }
+      __pyx_L40:;
+
+      /* "rmgpy/molecule/symmetry.py":103
+ *             elif count == [1, 1, 1, 1]:
+ *                 symmetry_number *= 0.5  # found chirality
+ *         elif single == 3:             # <<<<<<<<<<<<<<
+ *             # Three single bonds
+ *             if count == [3]:
+ */
+      goto __pyx_L38;
+    }
+
+    /* "rmgpy/molecule/symmetry.py":111
+ *             elif count == [1, 1, 1]:
+ *                 symmetry_number *= 1
+ *         elif single == 2:             # <<<<<<<<<<<<<<
+ *             # Two single bonds
+ *             if count == [2]:
+ */
+    __pyx_t_5 = __Pyx_PyInt_EqObjC(__pyx_v_single, __pyx_int_2, 2, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 111, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 111, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (__pyx_t_12) {
+
+      /* "rmgpy/molecule/symmetry.py":113
+ *         elif single == 2:
+ *             # Two single bonds
+ *             if count == [2]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 2
+ *         # for resonance hybrids
+ */
+      __pyx_t_5 = PyList_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 113, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_INCREF(__pyx_int_2);
+      __Pyx_GIVEREF(__pyx_int_2);
+      PyList_SET_ITEM(__pyx_t_5, 0, __pyx_int_2);
+      __pyx_t_1 = PyObject_RichCompare(__pyx_v_count, __pyx_t_5, Py_EQ); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 113, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 113, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      if (__pyx_t_12) {
+
+        /* "rmgpy/molecule/symmetry.py":114
+ *             # Two single bonds
+ *             if count == [2]:
+ *                 symmetry_number *= 2             # <<<<<<<<<<<<<<
+ *         # for resonance hybrids
+ *         elif single == 1:
+ */
+        __pyx_t_1 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 114, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_1);
+        __pyx_t_1 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":113
+ *         elif single == 2:
+ *             # Two single bonds
+ *             if count == [2]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 2
+ *         # for resonance hybrids
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":111
+ *             elif count == [1, 1, 1]:
+ *                 symmetry_number *= 1
+ *         elif single == 2:             # <<<<<<<<<<<<<<
+ *             # Two single bonds
+ *             if count == [2]:
+ */
+      goto __pyx_L38;
+    }
+
+    /* "rmgpy/molecule/symmetry.py":116
+ *                 symmetry_number *= 2
+ *         # for resonance hybrids
+ *         elif single == 1:             # <<<<<<<<<<<<<<
+ *             if count == [2, 1]:
+ *                 symmetry_number *= 2
+ */
+    __pyx_t_1 = __Pyx_PyInt_EqObjC(__pyx_v_single, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 116, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 116, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (__pyx_t_12) {
+
+      /* "rmgpy/molecule/symmetry.py":117
+ *         # for resonance hybrids
+ *         elif single == 1:
+ *             if count == [2, 1]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 2
+ *         elif double == 2:
+ */
+      __pyx_t_1 = PyList_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 117, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_INCREF(__pyx_int_2);
+      __Pyx_GIVEREF(__pyx_int_2);
+      PyList_SET_ITEM(__pyx_t_1, 0, __pyx_int_2);
+      __Pyx_INCREF(__pyx_int_1);
+      __Pyx_GIVEREF(__pyx_int_1);
+      PyList_SET_ITEM(__pyx_t_1, 1, __pyx_int_1);
+      __pyx_t_5 = PyObject_RichCompare(__pyx_v_count, __pyx_t_1, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 117, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 117, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (__pyx_t_12) {
+
+        /* "rmgpy/molecule/symmetry.py":118
+ *         elif single == 1:
+ *             if count == [2, 1]:
+ *                 symmetry_number *= 2             # <<<<<<<<<<<<<<
+ *         elif double == 2:
+ *             # Two double bonds
+ */
+        __pyx_t_5 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 118, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_5);
+        __pyx_t_5 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":117
+ *         # for resonance hybrids
+ *         elif single == 1:
+ *             if count == [2, 1]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 2
+ *         elif double == 2:
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":116
+ *                 symmetry_number *= 2
+ *         # for resonance hybrids
+ *         elif single == 1:             # <<<<<<<<<<<<<<
+ *             if count == [2, 1]:
+ *                 symmetry_number *= 2
+ */
+      goto __pyx_L38;
+    }
+
+    /* "rmgpy/molecule/symmetry.py":119
+ *             if count == [2, 1]:
+ *                 symmetry_number *= 2
+ *         elif double == 2:             # <<<<<<<<<<<<<<
+ *             # Two double bonds
+ *             if count == [2]:
+ */
+    __pyx_t_5 = __Pyx_PyInt_EqObjC(__pyx_v_double, __pyx_int_2, 2, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 119, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 119, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (__pyx_t_12) {
+
+      /* "rmgpy/molecule/symmetry.py":121
+ *         elif double == 2:
+ *             # Two double bonds
+ *             if count == [2]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 2
+ *         # for nitrogen resonance hybrids
+ */
+      __pyx_t_5 = PyList_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 121, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_INCREF(__pyx_int_2);
+      __Pyx_GIVEREF(__pyx_int_2);
+      PyList_SET_ITEM(__pyx_t_5, 0, __pyx_int_2);
+      __pyx_t_1 = PyObject_RichCompare(__pyx_v_count, __pyx_t_5, Py_EQ); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 121, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 121, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      if (__pyx_t_12) {
+
+        /* "rmgpy/molecule/symmetry.py":122
+ *             # Two double bonds
+ *             if count == [2]:
+ *                 symmetry_number *= 2             # <<<<<<<<<<<<<<
+ *         # for nitrogen resonance hybrids
+ *         elif single == 0:
+ */
+        __pyx_t_1 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 122, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_1);
+        __pyx_t_1 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":121
+ *         elif double == 2:
+ *             # Two double bonds
+ *             if count == [2]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 2
+ *         # for nitrogen resonance hybrids
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":119
+ *             if count == [2, 1]:
+ *                 symmetry_number *= 2
+ *         elif double == 2:             # <<<<<<<<<<<<<<
+ *             # Two double bonds
+ *             if count == [2]:
+ */
+      goto __pyx_L38;
+    }
+
+    /* "rmgpy/molecule/symmetry.py":124
+ *                 symmetry_number *= 2
+ *         # for nitrogen resonance hybrids
+ *         elif single == 0:             # <<<<<<<<<<<<<<
+ *             if count == [2]:
+ *                 symmetry_number *= 2
+ */
+    __pyx_t_1 = __Pyx_PyInt_EqObjC(__pyx_v_single, __pyx_int_0, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 124, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 124, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (__pyx_t_12) {
+
+      /* "rmgpy/molecule/symmetry.py":125
+ *         # for nitrogen resonance hybrids
+ *         elif single == 0:
+ *             if count == [2]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 2
+ *     elif atom.radical_electrons == 1:
+ */
+      __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 125, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_INCREF(__pyx_int_2);
+      __Pyx_GIVEREF(__pyx_int_2);
+      PyList_SET_ITEM(__pyx_t_1, 0, __pyx_int_2);
+      __pyx_t_5 = PyObject_RichCompare(__pyx_v_count, __pyx_t_1, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 125, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 125, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (__pyx_t_12) {
+
+        /* "rmgpy/molecule/symmetry.py":126
+ *         elif single == 0:
+ *             if count == [2]:
+ *                 symmetry_number *= 2             # <<<<<<<<<<<<<<
+ *     elif atom.radical_electrons == 1:
+ *         if single == 3:
+ */
+        __pyx_t_5 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 126, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_5);
+        __pyx_t_5 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":125
+ *         # for nitrogen resonance hybrids
+ *         elif single == 0:
+ *             if count == [2]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 2
+ *     elif atom.radical_electrons == 1:
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":124
+ *                 symmetry_number *= 2
+ *         # for nitrogen resonance hybrids
+ *         elif single == 0:             # <<<<<<<<<<<<<<
+ *             if count == [2]:
+ *                 symmetry_number *= 2
+ */
+    }
+    __pyx_L38:;
+
+    /* "rmgpy/molecule/symmetry.py":90
+ *     count.reverse()
+ * 
+ *     if atom.radical_electrons == 0:             # <<<<<<<<<<<<<<
+ *         if single == 4:
+ *             # Four single bonds
+ */
+    break;
+    case 1:
+
+    /* "rmgpy/molecule/symmetry.py":128
+ *                 symmetry_number *= 2
+ *     elif atom.radical_electrons == 1:
+ *         if single == 3:             # <<<<<<<<<<<<<<
+ *             # Three single bonds
+ *             if count == [3]:
+ */
+    __pyx_t_5 = __Pyx_PyInt_EqObjC(__pyx_v_single, __pyx_int_3, 3, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 128, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 128, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (__pyx_t_12) {
+
+      /* "rmgpy/molecule/symmetry.py":130
+ *         if single == 3:
+ *             # Three single bonds
+ *             if count == [3]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 6
+ *             elif count == [2, 1]:
+ */
+      __pyx_t_5 = PyList_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 130, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_INCREF(__pyx_int_3);
+      __Pyx_GIVEREF(__pyx_int_3);
+      PyList_SET_ITEM(__pyx_t_5, 0, __pyx_int_3);
+      __pyx_t_1 = PyObject_RichCompare(__pyx_v_count, __pyx_t_5, Py_EQ); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 130, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 130, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      if (__pyx_t_12) {
+
+        /* "rmgpy/molecule/symmetry.py":131
+ *             # Three single bonds
+ *             if count == [3]:
+ *                 symmetry_number *= 6             # <<<<<<<<<<<<<<
+ *             elif count == [2, 1]:
+ *                 symmetry_number *= 2
+ */
+        __pyx_t_1 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 131, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_1);
+        __pyx_t_1 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":130
+ *         if single == 3:
+ *             # Three single bonds
+ *             if count == [3]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 6
+ *             elif count == [2, 1]:
+ */
+        goto __pyx_L46;
+      }
+
+      /* "rmgpy/molecule/symmetry.py":132
+ *             if count == [3]:
+ *                 symmetry_number *= 6
+ *             elif count == [2, 1]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 2
+ *             elif count == [1, 1, 1]:
+ */
+      __pyx_t_1 = PyList_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 132, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_INCREF(__pyx_int_2);
+      __Pyx_GIVEREF(__pyx_int_2);
+      PyList_SET_ITEM(__pyx_t_1, 0, __pyx_int_2);
+      __Pyx_INCREF(__pyx_int_1);
+      __Pyx_GIVEREF(__pyx_int_1);
+      PyList_SET_ITEM(__pyx_t_1, 1, __pyx_int_1);
+      __pyx_t_5 = PyObject_RichCompare(__pyx_v_count, __pyx_t_1, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 132, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 132, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (__pyx_t_12) {
+
+        /* "rmgpy/molecule/symmetry.py":133
+ *                 symmetry_number *= 6
+ *             elif count == [2, 1]:
+ *                 symmetry_number *= 2             # <<<<<<<<<<<<<<
+ *             elif count == [1, 1, 1]:
+ *                 symmetry_number *= 1
+ */
+        __pyx_t_5 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 133, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_5);
+        __pyx_t_5 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":132
+ *             if count == [3]:
+ *                 symmetry_number *= 6
+ *             elif count == [2, 1]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 2
+ *             elif count == [1, 1, 1]:
+ */
+        goto __pyx_L46;
+      }
+
+      /* "rmgpy/molecule/symmetry.py":134
+ *             elif count == [2, 1]:
+ *                 symmetry_number *= 2
+ *             elif count == [1, 1, 1]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 1
+ *         elif single == 1:
+ */
+      __pyx_t_5 = PyList_New(3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 134, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_INCREF(__pyx_int_1);
+      __Pyx_GIVEREF(__pyx_int_1);
+      PyList_SET_ITEM(__pyx_t_5, 0, __pyx_int_1);
+      __Pyx_INCREF(__pyx_int_1);
+      __Pyx_GIVEREF(__pyx_int_1);
+      PyList_SET_ITEM(__pyx_t_5, 1, __pyx_int_1);
+      __Pyx_INCREF(__pyx_int_1);
+      __Pyx_GIVEREF(__pyx_int_1);
+      PyList_SET_ITEM(__pyx_t_5, 2, __pyx_int_1);
+      __pyx_t_1 = PyObject_RichCompare(__pyx_v_count, __pyx_t_5, Py_EQ); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 134, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 134, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      if (__pyx_t_12) {
+
+        /* "rmgpy/molecule/symmetry.py":135
+ *                 symmetry_number *= 2
+ *             elif count == [1, 1, 1]:
+ *                 symmetry_number *= 1             # <<<<<<<<<<<<<<
+ *         elif single == 1:
+ *             if count == [2, 1]:
+ */
+        __pyx_t_1 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 135, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_1);
+        __pyx_t_1 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":134
+ *             elif count == [2, 1]:
+ *                 symmetry_number *= 2
+ *             elif count == [1, 1, 1]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 1
+ *         elif single == 1:
+ */
+      }
+      __pyx_L46:;
+
+      /* "rmgpy/molecule/symmetry.py":128
+ *                 symmetry_number *= 2
+ *     elif atom.radical_electrons == 1:
+ *         if single == 3:             # <<<<<<<<<<<<<<
+ *             # Three single bonds
+ *             if count == [3]:
+ */
+      goto __pyx_L45;
+    }
+
+    /* "rmgpy/molecule/symmetry.py":136
+ *             elif count == [1, 1, 1]:
+ *                 symmetry_number *= 1
+ *         elif single == 1:             # <<<<<<<<<<<<<<
+ *             if count == [2, 1]:
+ *                 symmetry_number *= 2
+ */
+    __pyx_t_1 = __Pyx_PyInt_EqObjC(__pyx_v_single, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 136, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 136, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (__pyx_t_12) {
+
+      /* "rmgpy/molecule/symmetry.py":137
+ *                 symmetry_number *= 1
+ *         elif single == 1:
+ *             if count == [2, 1]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 2
+ *             elif count == [1, 1, 1]:
+ */
+      __pyx_t_1 = PyList_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 137, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_INCREF(__pyx_int_2);
+      __Pyx_GIVEREF(__pyx_int_2);
+      PyList_SET_ITEM(__pyx_t_1, 0, __pyx_int_2);
+      __Pyx_INCREF(__pyx_int_1);
+      __Pyx_GIVEREF(__pyx_int_1);
+      PyList_SET_ITEM(__pyx_t_1, 1, __pyx_int_1);
+      __pyx_t_5 = PyObject_RichCompare(__pyx_v_count, __pyx_t_1, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 137, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 137, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (__pyx_t_12) {
+
+        /* "rmgpy/molecule/symmetry.py":138
+ *         elif single == 1:
+ *             if count == [2, 1]:
+ *                 symmetry_number *= 2             # <<<<<<<<<<<<<<
+ *             elif count == [1, 1, 1]:
+ *                 symmetry_number *= 1
+ */
+        __pyx_t_5 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 138, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_5);
+        __pyx_t_5 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":137
+ *                 symmetry_number *= 1
+ *         elif single == 1:
+ *             if count == [2, 1]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 2
+ *             elif count == [1, 1, 1]:
+ */
+        goto __pyx_L47;
+      }
+
+      /* "rmgpy/molecule/symmetry.py":139
+ *             if count == [2, 1]:
+ *                 symmetry_number *= 2
+ *             elif count == [1, 1, 1]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 1
+ *     elif atom.radical_electrons == 2:
+ */
+      __pyx_t_5 = PyList_New(3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 139, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_INCREF(__pyx_int_1);
+      __Pyx_GIVEREF(__pyx_int_1);
+      PyList_SET_ITEM(__pyx_t_5, 0, __pyx_int_1);
+      __Pyx_INCREF(__pyx_int_1);
+      __Pyx_GIVEREF(__pyx_int_1);
+      PyList_SET_ITEM(__pyx_t_5, 1, __pyx_int_1);
+      __Pyx_INCREF(__pyx_int_1);
+      __Pyx_GIVEREF(__pyx_int_1);
+      PyList_SET_ITEM(__pyx_t_5, 2, __pyx_int_1);
+      __pyx_t_1 = PyObject_RichCompare(__pyx_v_count, __pyx_t_5, Py_EQ); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 139, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 139, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      if (__pyx_t_12) {
+
+        /* "rmgpy/molecule/symmetry.py":140
+ *                 symmetry_number *= 2
+ *             elif count == [1, 1, 1]:
+ *                 symmetry_number *= 1             # <<<<<<<<<<<<<<
+ *     elif atom.radical_electrons == 2:
+ *         if single == 2:
+ */
+        __pyx_t_1 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 140, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_1);
+        __pyx_t_1 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":139
+ *             if count == [2, 1]:
+ *                 symmetry_number *= 2
+ *             elif count == [1, 1, 1]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 1
+ *     elif atom.radical_electrons == 2:
+ */
+      }
+      __pyx_L47:;
+
+      /* "rmgpy/molecule/symmetry.py":136
+ *             elif count == [1, 1, 1]:
+ *                 symmetry_number *= 1
+ *         elif single == 1:             # <<<<<<<<<<<<<<
+ *             if count == [2, 1]:
+ *                 symmetry_number *= 2
+ */
+    }
+    __pyx_L45:;
+
+    /* "rmgpy/molecule/symmetry.py":127
+ *             if count == [2]:
+ *                 symmetry_number *= 2
+ *     elif atom.radical_electrons == 1:             # <<<<<<<<<<<<<<
+ *         if single == 3:
+ *             # Three single bonds
+ */
+    break;
+    case 2:
+
+    /* "rmgpy/molecule/symmetry.py":142
+ *                 symmetry_number *= 1
+ *     elif atom.radical_electrons == 2:
+ *         if single == 2:             # <<<<<<<<<<<<<<
+ *             # Two single bonds
+ *             if count == [2]:
+ */
+    __pyx_t_1 = __Pyx_PyInt_EqObjC(__pyx_v_single, __pyx_int_2, 2, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 142, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 142, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (__pyx_t_12) {
+
+      /* "rmgpy/molecule/symmetry.py":144
+ *         if single == 2:
+ *             # Two single bonds
+ *             if count == [2]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 2
+ * 
+ */
+      __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 144, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_INCREF(__pyx_int_2);
+      __Pyx_GIVEREF(__pyx_int_2);
+      PyList_SET_ITEM(__pyx_t_1, 0, __pyx_int_2);
+      __pyx_t_5 = PyObject_RichCompare(__pyx_v_count, __pyx_t_1, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 144, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 144, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (__pyx_t_12) {
+
+        /* "rmgpy/molecule/symmetry.py":145
+ *             # Two single bonds
+ *             if count == [2]:
+ *                 symmetry_number *= 2             # <<<<<<<<<<<<<<
+ * 
+ *     return symmetry_number
+ */
+        __pyx_t_5 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 145, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_5);
+        __pyx_t_5 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":144
+ *         if single == 2:
+ *             # Two single bonds
+ *             if count == [2]:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 2
+ * 
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":142
+ *                 symmetry_number *= 1
+ *     elif atom.radical_electrons == 2:
+ *         if single == 2:             # <<<<<<<<<<<<<<
+ *             # Two single bonds
+ *             if count == [2]:
+ */
+    }
+
+    /* "rmgpy/molecule/symmetry.py":141
+ *             elif count == [1, 1, 1]:
+ *                 symmetry_number *= 1
+ *     elif atom.radical_electrons == 2:             # <<<<<<<<<<<<<<
+ *         if single == 2:
+ *             # Two single bonds
+ */
+    break;
+    default: break;
+  }
+
+  /* "rmgpy/molecule/symmetry.py":147
+ *                 symmetry_number *= 2
+ * 
+ *     return symmetry_number             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_10 = __pyx_PyFloat_AsFloat(__pyx_v_symmetry_number); if (unlikely((__pyx_t_10 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 147, __pyx_L1_error)
+  __pyx_r = __pyx_t_10;
+  goto __pyx_L0;
+
+  /* "rmgpy/molecule/symmetry.py":38
+ * 
+ * 
+ * def calculate_atom_symmetry_number(molecule, atom):             # <<<<<<<<<<<<<<
+ *     """
+ *     Return the symmetry number centered at `atom` in the structure. The
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_14);
+  __Pyx_XDECREF(__pyx_t_15);
+  __Pyx_AddTraceback("rmgpy.molecule.symmetry.calculate_atom_symmetry_number", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1.0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_symmetry_number);
+  __Pyx_XDECREF(__pyx_v_single);
+  __Pyx_XDECREF(__pyx_v_double);
+  __Pyx_XDECREF(__pyx_v_triple);
+  __Pyx_XDECREF(__pyx_v_benzene);
+  __Pyx_XDECREF(__pyx_v_num_neighbors);
+  __Pyx_XDECREF(__pyx_v_bond);
+  __Pyx_XDECREF((PyObject *)__pyx_v_molecule0);
+  __Pyx_XDECREF(__pyx_v_groups);
+  __Pyx_XDECREF(__pyx_v_group_isomorphism);
+  __Pyx_XDECREF(__pyx_v_group1);
+  __Pyx_XDECREF(__pyx_v_group2);
+  __Pyx_XDECREF(__pyx_v_count);
+  __Pyx_XDECREF(__pyx_v_i);
+  __Pyx_XDECREF(__pyx_7genexpr__pyx_v_group);
+  __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_group1);
+  __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_group2);
+  __Pyx_XDECREF((PyObject *)__pyx_v_molecule);
+  __Pyx_XDECREF((PyObject *)__pyx_v_atom);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8molecule_8symmetry_1calculate_atom_symmetry_number(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5rmgpy_8molecule_8symmetry_calculate_atom_symmetry_number[] = "\n    Return the symmetry number centered at `atom` in the structure. The\n    `atom` of interest must not be in a cycle.\n    ";
+static PyMethodDef __pyx_mdef_5rmgpy_8molecule_8symmetry_1calculate_atom_symmetry_number = {"calculate_atom_symmetry_number", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5rmgpy_8molecule_8symmetry_1calculate_atom_symmetry_number, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5rmgpy_8molecule_8symmetry_calculate_atom_symmetry_number};
+static PyObject *__pyx_pw_5rmgpy_8molecule_8symmetry_1calculate_atom_symmetry_number(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *__pyx_v_molecule = 0;
+  struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *__pyx_v_atom = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("calculate_atom_symmetry_number (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_molecule,&__pyx_n_s_atom,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_molecule)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_atom)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("calculate_atom_symmetry_number", 1, 2, 2, 1); __PYX_ERR(0, 38, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "calculate_atom_symmetry_number") < 0)) __PYX_ERR(0, 38, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_molecule = ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *)values[0]);
+    __pyx_v_atom = ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)values[1]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("calculate_atom_symmetry_number", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 38, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("rmgpy.molecule.symmetry.calculate_atom_symmetry_number", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_molecule), __pyx_ptype_5rmgpy_8molecule_8molecule_Molecule, 1, "molecule", 0))) __PYX_ERR(0, 38, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_atom), __pyx_ptype_5rmgpy_8molecule_8molecule_Atom, 1, "atom", 0))) __PYX_ERR(0, 38, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_8symmetry_calculate_atom_symmetry_number(__pyx_self, __pyx_v_molecule, __pyx_v_atom);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8molecule_8symmetry_calculate_atom_symmetry_number(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *__pyx_v_molecule, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *__pyx_v_atom) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  float __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("calculate_atom_symmetry_number", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_5rmgpy_8molecule_8symmetry_calculate_atom_symmetry_number(__pyx_v_molecule, __pyx_v_atom, 0); if (unlikely(__pyx_t_1 == ((float)-1.0))) __PYX_ERR(0, 38, __pyx_L1_error)
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("rmgpy.molecule.symmetry.calculate_atom_symmetry_number", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/molecule/symmetry.py":152
+ * ################################################################################
+ * 
+ * def calculate_bond_symmetry_number(molecule, atom1, atom2):             # <<<<<<<<<<<<<<
+ *     """
+ *     Return the symmetry number centered at `bond` in the structure.
+ */
+
+static PyObject *__pyx_pw_5rmgpy_8molecule_8symmetry_3calculate_bond_symmetry_number(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static float __pyx_f_5rmgpy_8molecule_8symmetry_calculate_bond_symmetry_number(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *__pyx_v_molecule, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *__pyx_v_atom1, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *__pyx_v_atom2, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  PyObject *__pyx_v_bond = NULL;
+  PyObject *__pyx_v_symmetry_number = NULL;
+  struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *__pyx_v_structure = NULL;
+  PyObject *__pyx_v_fragments = NULL;
+  PyObject *__pyx_v_fragment1 = NULL;
+  PyObject *__pyx_v_fragment2 = NULL;
+  PyObject *__pyx_v_groups1 = NULL;
+  PyObject *__pyx_v_groups2 = NULL;
+  float __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  float __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_copy __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  Py_ssize_t __pyx_t_11;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("calculate_bond_symmetry_number", 0);
+  __Pyx_INCREF((PyObject *)__pyx_v_atom1);
+  __Pyx_INCREF((PyObject *)__pyx_v_atom2);
+
+  /* "rmgpy/molecule/symmetry.py":156
+ *     Return the symmetry number centered at `bond` in the structure.
+ *     """
+ *     bond = atom1.edges[atom2]             # <<<<<<<<<<<<<<
+ *     symmetry_number = 1
+ *     if atom1.equivalent(atom2):
+ */
+  if (unlikely(__pyx_v_atom1->__pyx_base.edges == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 156, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyDict_GetItem(__pyx_v_atom1->__pyx_base.edges, ((PyObject *)__pyx_v_atom2)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_bond = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":157
+ *     """
+ *     bond = atom1.edges[atom2]
+ *     symmetry_number = 1             # <<<<<<<<<<<<<<
+ *     if atom1.equivalent(atom2):
+ *         # An O-O bond is considered to be an "optical isomer" and so no
+ */
+  __Pyx_INCREF(__pyx_int_1);
+  __pyx_v_symmetry_number = __pyx_int_1;
+
+  /* "rmgpy/molecule/symmetry.py":158
+ *     bond = atom1.edges[atom2]
+ *     symmetry_number = 1
+ *     if atom1.equivalent(atom2):             # <<<<<<<<<<<<<<
+ *         # An O-O bond is considered to be an "optical isomer" and so no
+ *         # symmetry correction will be applied
+ */
+  __pyx_t_2 = ((struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Atom *)__pyx_v_atom1->__pyx_base.__pyx_vtab)->__pyx_base.equivalent(((struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *)__pyx_v_atom1), ((struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *)__pyx_v_atom2), 0, NULL); if (unlikely(__pyx_t_2 == ((int)-2))) __PYX_ERR(0, 158, __pyx_L1_error)
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "rmgpy/molecule/symmetry.py":161
+ *         # An O-O bond is considered to be an "optical isomer" and so no
+ *         # symmetry correction will be applied
+ *         if (atom1.atomtype.label == 'O2s' and atom2.atomtype.label == 'O2s' and             # <<<<<<<<<<<<<<
+ *                 atom1.radical_electrons == atom2.radical_electrons == 0):
+ *             return symmetry_number
+ */
+    __pyx_t_2 = (__Pyx_PyUnicode_Equals(__pyx_v_atom1->atomtype->label, __pyx_n_u_O2s, Py_EQ)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 161, __pyx_L1_error)
+    __pyx_t_4 = (__pyx_t_2 != 0);
+    if (__pyx_t_4) {
+    } else {
+      __pyx_t_3 = __pyx_t_4;
+      goto __pyx_L5_bool_binop_done;
+    }
+    __pyx_t_4 = (__Pyx_PyUnicode_Equals(__pyx_v_atom2->atomtype->label, __pyx_n_u_O2s, Py_EQ)); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 161, __pyx_L1_error)
+    __pyx_t_2 = (__pyx_t_4 != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_3 = __pyx_t_2;
+      goto __pyx_L5_bool_binop_done;
+    }
+
+    /* "rmgpy/molecule/symmetry.py":162
+ *         # symmetry correction will be applied
+ *         if (atom1.atomtype.label == 'O2s' and atom2.atomtype.label == 'O2s' and
+ *                 atom1.radical_electrons == atom2.radical_electrons == 0):             # <<<<<<<<<<<<<<
+ *             return symmetry_number
+ *         # If the molecule is diatomic, then we don't have to check the
+ */
+    __pyx_t_2 = (__pyx_v_atom1->radical_electrons == __pyx_v_atom2->radical_electrons);
+    if (__pyx_t_2) {
+      __pyx_t_2 = (__pyx_v_atom2->radical_electrons == 0);
+    }
+    __pyx_t_4 = (__pyx_t_2 != 0);
+    __pyx_t_3 = __pyx_t_4;
+    __pyx_L5_bool_binop_done:;
+
+    /* "rmgpy/molecule/symmetry.py":161
+ *         # An O-O bond is considered to be an "optical isomer" and so no
+ *         # symmetry correction will be applied
+ *         if (atom1.atomtype.label == 'O2s' and atom2.atomtype.label == 'O2s' and             # <<<<<<<<<<<<<<
+ *                 atom1.radical_electrons == atom2.radical_electrons == 0):
+ *             return symmetry_number
+ */
+    if (__pyx_t_3) {
+
+      /* "rmgpy/molecule/symmetry.py":163
+ *         if (atom1.atomtype.label == 'O2s' and atom2.atomtype.label == 'O2s' and
+ *                 atom1.radical_electrons == atom2.radical_electrons == 0):
+ *             return symmetry_number             # <<<<<<<<<<<<<<
+ *         # If the molecule is diatomic, then we don't have to check the
+ *         # ligands on the two atoms in this bond (since we know there
+ */
+      __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_v_symmetry_number); if (unlikely((__pyx_t_5 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 163, __pyx_L1_error)
+      __pyx_r = __pyx_t_5;
+      goto __pyx_L0;
+
+      /* "rmgpy/molecule/symmetry.py":161
+ *         # An O-O bond is considered to be an "optical isomer" and so no
+ *         # symmetry correction will be applied
+ *         if (atom1.atomtype.label == 'O2s' and atom2.atomtype.label == 'O2s' and             # <<<<<<<<<<<<<<
+ *                 atom1.radical_electrons == atom2.radical_electrons == 0):
+ *             return symmetry_number
+ */
+    }
+
+    /* "rmgpy/molecule/symmetry.py":167
+ *         # ligands on the two atoms in this bond (since we know there
+ *         # aren't any)
+ *         elif len(molecule.vertices) == 2:             # <<<<<<<<<<<<<<
+ *             symmetry_number = 2
+ *         else:
+ */
+    __pyx_t_1 = __pyx_v_molecule->__pyx_base.vertices;
+    __Pyx_INCREF(__pyx_t_1);
+    if (unlikely(__pyx_t_1 == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+      __PYX_ERR(0, 167, __pyx_L1_error)
+    }
+    __pyx_t_6 = PyList_GET_SIZE(__pyx_t_1); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-1))) __PYX_ERR(0, 167, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_3 = ((__pyx_t_6 == 2) != 0);
+    if (__pyx_t_3) {
+
+      /* "rmgpy/molecule/symmetry.py":168
+ *         # aren't any)
+ *         elif len(molecule.vertices) == 2:
+ *             symmetry_number = 2             # <<<<<<<<<<<<<<
+ *         else:
+ *             molecule.remove_bond(bond)
+ */
+      __Pyx_INCREF(__pyx_int_2);
+      __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_int_2);
+
+      /* "rmgpy/molecule/symmetry.py":167
+ *         # ligands on the two atoms in this bond (since we know there
+ *         # aren't any)
+ *         elif len(molecule.vertices) == 2:             # <<<<<<<<<<<<<<
+ *             symmetry_number = 2
+ *         else:
+ */
+      goto __pyx_L4;
+    }
+
+    /* "rmgpy/molecule/symmetry.py":170
+ *             symmetry_number = 2
+ *         else:
+ *             molecule.remove_bond(bond)             # <<<<<<<<<<<<<<
+ *             structure = molecule.copy(True)
+ *             molecule.add_bond(bond)
+ */
+    /*else*/ {
+      if (!(likely(((__pyx_v_bond) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_bond, __pyx_ptype_5rmgpy_8molecule_8molecule_Bond))))) __PYX_ERR(0, 170, __pyx_L1_error)
+      __pyx_t_1 = ((struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Molecule *)__pyx_v_molecule->__pyx_base.__pyx_vtab)->remove_bond(__pyx_v_molecule, ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *)__pyx_v_bond), 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 170, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":171
+ *         else:
+ *             molecule.remove_bond(bond)
+ *             structure = molecule.copy(True)             # <<<<<<<<<<<<<<
+ *             molecule.add_bond(bond)
+ * 
+ */
+      __pyx_t_7.__pyx_n = 1;
+      __pyx_t_7.deep = 1;
+      __pyx_t_1 = ((PyObject *)((struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Molecule *)__pyx_v_molecule->__pyx_base.__pyx_vtab)->__pyx_base.copy(((struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *)__pyx_v_molecule), 0, &__pyx_t_7)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 171, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_v_structure = ((struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *)__pyx_t_1);
+      __pyx_t_1 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":172
+ *             molecule.remove_bond(bond)
+ *             structure = molecule.copy(True)
+ *             molecule.add_bond(bond)             # <<<<<<<<<<<<<<
+ * 
+ *             atom1 = structure.atoms[molecule.atoms.index(atom1)]
+ */
+      if (!(likely(((__pyx_v_bond) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_bond, __pyx_ptype_5rmgpy_8molecule_8molecule_Bond))))) __PYX_ERR(0, 172, __pyx_L1_error)
+      __pyx_t_1 = ((struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Molecule *)__pyx_v_molecule->__pyx_base.__pyx_vtab)->add_bond(__pyx_v_molecule, ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *)__pyx_v_bond), 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 172, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":174
+ *             molecule.add_bond(bond)
+ * 
+ *             atom1 = structure.atoms[molecule.atoms.index(atom1)]             # <<<<<<<<<<<<<<
+ *             atom2 = structure.atoms[molecule.atoms.index(atom2)]
+ *             fragments = structure.split()
+ */
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_structure), __pyx_n_s_atoms); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 174, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_9 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_molecule), __pyx_n_s_atoms); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 174, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_n_s_index); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 174, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_9 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_10))) {
+        __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_10);
+        if (likely(__pyx_t_9)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_10);
+          __Pyx_INCREF(__pyx_t_9);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_10, function);
+        }
+      }
+      __pyx_t_8 = (__pyx_t_9) ? __Pyx_PyObject_Call2Args(__pyx_t_10, __pyx_t_9, ((PyObject *)__pyx_v_atom1)) : __Pyx_PyObject_CallOneArg(__pyx_t_10, ((PyObject *)__pyx_v_atom1));
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 174, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      __pyx_t_10 = __Pyx_PyObject_GetItem(__pyx_t_1, __pyx_t_8); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 174, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      if (!(likely(((__pyx_t_10) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_10, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 174, __pyx_L1_error)
+      __Pyx_DECREF_SET(__pyx_v_atom1, ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_10));
+      __pyx_t_10 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":175
+ * 
+ *             atom1 = structure.atoms[molecule.atoms.index(atom1)]
+ *             atom2 = structure.atoms[molecule.atoms.index(atom2)]             # <<<<<<<<<<<<<<
+ *             fragments = structure.split()
+ * 
+ */
+      __pyx_t_10 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_structure), __pyx_n_s_atoms); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 175, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_molecule), __pyx_n_s_atoms); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 175, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_index); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 175, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_1 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+        __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_9);
+        if (likely(__pyx_t_1)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+          __Pyx_INCREF(__pyx_t_1);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_9, function);
+        }
+      }
+      __pyx_t_8 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_1, ((PyObject *)__pyx_v_atom2)) : __Pyx_PyObject_CallOneArg(__pyx_t_9, ((PyObject *)__pyx_v_atom2));
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 175, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_9 = __Pyx_PyObject_GetItem(__pyx_t_10, __pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 175, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      if (!(likely(((__pyx_t_9) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_9, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 175, __pyx_L1_error)
+      __Pyx_DECREF_SET(__pyx_v_atom2, ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_9));
+      __pyx_t_9 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":176
+ *             atom1 = structure.atoms[molecule.atoms.index(atom1)]
+ *             atom2 = structure.atoms[molecule.atoms.index(atom2)]
+ *             fragments = structure.split()             # <<<<<<<<<<<<<<
+ * 
+ *             if len(fragments) != 2:
+ */
+      __pyx_t_9 = ((struct __pyx_vtabstruct_5rmgpy_8molecule_5graph_Graph *)__pyx_v_structure->__pyx_vtab)->split(__pyx_v_structure, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 176, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_v_fragments = ((PyObject*)__pyx_t_9);
+      __pyx_t_9 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":178
+ *             fragments = structure.split()
+ * 
+ *             if len(fragments) != 2:             # <<<<<<<<<<<<<<
+ *                 return symmetry_number
+ * 
+ */
+      if (unlikely(__pyx_v_fragments == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+        __PYX_ERR(0, 178, __pyx_L1_error)
+      }
+      __pyx_t_6 = PyList_GET_SIZE(__pyx_v_fragments); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-1))) __PYX_ERR(0, 178, __pyx_L1_error)
+      __pyx_t_3 = ((__pyx_t_6 != 2) != 0);
+      if (__pyx_t_3) {
+
+        /* "rmgpy/molecule/symmetry.py":179
+ * 
+ *             if len(fragments) != 2:
+ *                 return symmetry_number             # <<<<<<<<<<<<<<
+ * 
+ *             fragment1, fragment2 = fragments
+ */
+        __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_v_symmetry_number); if (unlikely((__pyx_t_5 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 179, __pyx_L1_error)
+        __pyx_r = __pyx_t_5;
+        goto __pyx_L0;
+
+        /* "rmgpy/molecule/symmetry.py":178
+ *             fragments = structure.split()
+ * 
+ *             if len(fragments) != 2:             # <<<<<<<<<<<<<<
+ *                 return symmetry_number
+ * 
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":181
+ *                 return symmetry_number
+ * 
+ *             fragment1, fragment2 = fragments             # <<<<<<<<<<<<<<
+ *             if atom1 in fragment1.atoms:
+ *                 fragment1.remove_atom(atom1)
+ */
+      if (likely(__pyx_v_fragments != Py_None)) {
+        PyObject* sequence = __pyx_v_fragments;
+        Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+        if (unlikely(size != 2)) {
+          if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+          else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+          __PYX_ERR(0, 181, __pyx_L1_error)
+        }
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_9 = PyList_GET_ITEM(sequence, 0); 
+        __pyx_t_8 = PyList_GET_ITEM(sequence, 1); 
+        __Pyx_INCREF(__pyx_t_9);
+        __Pyx_INCREF(__pyx_t_8);
+        #else
+        __pyx_t_9 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 181, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_8 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 181, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        #endif
+      } else {
+        __Pyx_RaiseNoneNotIterableError(); __PYX_ERR(0, 181, __pyx_L1_error)
+      }
+      __pyx_v_fragment1 = __pyx_t_9;
+      __pyx_t_9 = 0;
+      __pyx_v_fragment2 = __pyx_t_8;
+      __pyx_t_8 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":182
+ * 
+ *             fragment1, fragment2 = fragments
+ *             if atom1 in fragment1.atoms:             # <<<<<<<<<<<<<<
+ *                 fragment1.remove_atom(atom1)
+ *             if atom2 in fragment1.atoms:
+ */
+      __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_fragment1, __pyx_n_s_atoms); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 182, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_3 = (__Pyx_PySequence_ContainsTF(((PyObject *)__pyx_v_atom1), __pyx_t_8, Py_EQ)); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 182, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_4 = (__pyx_t_3 != 0);
+      if (__pyx_t_4) {
+
+        /* "rmgpy/molecule/symmetry.py":183
+ *             fragment1, fragment2 = fragments
+ *             if atom1 in fragment1.atoms:
+ *                 fragment1.remove_atom(atom1)             # <<<<<<<<<<<<<<
+ *             if atom2 in fragment1.atoms:
+ *                 fragment1.remove_atom(atom2)
+ */
+        __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_fragment1, __pyx_n_s_remove_atom); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 183, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_10 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+          __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_9);
+          if (likely(__pyx_t_10)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+            __Pyx_INCREF(__pyx_t_10);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_9, function);
+          }
+        }
+        __pyx_t_8 = (__pyx_t_10) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_10, ((PyObject *)__pyx_v_atom1)) : __Pyx_PyObject_CallOneArg(__pyx_t_9, ((PyObject *)__pyx_v_atom1));
+        __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+        if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 183, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":182
+ * 
+ *             fragment1, fragment2 = fragments
+ *             if atom1 in fragment1.atoms:             # <<<<<<<<<<<<<<
+ *                 fragment1.remove_atom(atom1)
+ *             if atom2 in fragment1.atoms:
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":184
+ *             if atom1 in fragment1.atoms:
+ *                 fragment1.remove_atom(atom1)
+ *             if atom2 in fragment1.atoms:             # <<<<<<<<<<<<<<
+ *                 fragment1.remove_atom(atom2)
+ *             if atom1 in fragment2.atoms:
+ */
+      __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_fragment1, __pyx_n_s_atoms); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 184, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_4 = (__Pyx_PySequence_ContainsTF(((PyObject *)__pyx_v_atom2), __pyx_t_8, Py_EQ)); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 184, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_3 = (__pyx_t_4 != 0);
+      if (__pyx_t_3) {
+
+        /* "rmgpy/molecule/symmetry.py":185
+ *                 fragment1.remove_atom(atom1)
+ *             if atom2 in fragment1.atoms:
+ *                 fragment1.remove_atom(atom2)             # <<<<<<<<<<<<<<
+ *             if atom1 in fragment2.atoms:
+ *                 fragment2.remove_atom(atom1)
+ */
+        __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_fragment1, __pyx_n_s_remove_atom); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 185, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_10 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+          __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_9);
+          if (likely(__pyx_t_10)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+            __Pyx_INCREF(__pyx_t_10);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_9, function);
+          }
+        }
+        __pyx_t_8 = (__pyx_t_10) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_10, ((PyObject *)__pyx_v_atom2)) : __Pyx_PyObject_CallOneArg(__pyx_t_9, ((PyObject *)__pyx_v_atom2));
+        __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+        if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 185, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":184
+ *             if atom1 in fragment1.atoms:
+ *                 fragment1.remove_atom(atom1)
+ *             if atom2 in fragment1.atoms:             # <<<<<<<<<<<<<<
+ *                 fragment1.remove_atom(atom2)
+ *             if atom1 in fragment2.atoms:
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":186
+ *             if atom2 in fragment1.atoms:
+ *                 fragment1.remove_atom(atom2)
+ *             if atom1 in fragment2.atoms:             # <<<<<<<<<<<<<<
+ *                 fragment2.remove_atom(atom1)
+ *             if atom2 in fragment2.atoms:
+ */
+      __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_fragment2, __pyx_n_s_atoms); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 186, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_3 = (__Pyx_PySequence_ContainsTF(((PyObject *)__pyx_v_atom1), __pyx_t_8, Py_EQ)); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 186, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_4 = (__pyx_t_3 != 0);
+      if (__pyx_t_4) {
+
+        /* "rmgpy/molecule/symmetry.py":187
+ *                 fragment1.remove_atom(atom2)
+ *             if atom1 in fragment2.atoms:
+ *                 fragment2.remove_atom(atom1)             # <<<<<<<<<<<<<<
+ *             if atom2 in fragment2.atoms:
+ *                 fragment2.remove_atom(atom2)
+ */
+        __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_fragment2, __pyx_n_s_remove_atom); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 187, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_10 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+          __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_9);
+          if (likely(__pyx_t_10)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+            __Pyx_INCREF(__pyx_t_10);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_9, function);
+          }
+        }
+        __pyx_t_8 = (__pyx_t_10) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_10, ((PyObject *)__pyx_v_atom1)) : __Pyx_PyObject_CallOneArg(__pyx_t_9, ((PyObject *)__pyx_v_atom1));
+        __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+        if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 187, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":186
+ *             if atom2 in fragment1.atoms:
+ *                 fragment1.remove_atom(atom2)
+ *             if atom1 in fragment2.atoms:             # <<<<<<<<<<<<<<
+ *                 fragment2.remove_atom(atom1)
+ *             if atom2 in fragment2.atoms:
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":188
+ *             if atom1 in fragment2.atoms:
+ *                 fragment2.remove_atom(atom1)
+ *             if atom2 in fragment2.atoms:             # <<<<<<<<<<<<<<
+ *                 fragment2.remove_atom(atom2)
+ *             groups1 = fragment1.split()
+ */
+      __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_fragment2, __pyx_n_s_atoms); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 188, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_4 = (__Pyx_PySequence_ContainsTF(((PyObject *)__pyx_v_atom2), __pyx_t_8, Py_EQ)); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 188, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_3 = (__pyx_t_4 != 0);
+      if (__pyx_t_3) {
+
+        /* "rmgpy/molecule/symmetry.py":189
+ *                 fragment2.remove_atom(atom1)
+ *             if atom2 in fragment2.atoms:
+ *                 fragment2.remove_atom(atom2)             # <<<<<<<<<<<<<<
+ *             groups1 = fragment1.split()
+ *             groups2 = fragment2.split()
+ */
+        __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_fragment2, __pyx_n_s_remove_atom); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 189, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_10 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+          __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_9);
+          if (likely(__pyx_t_10)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+            __Pyx_INCREF(__pyx_t_10);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_9, function);
+          }
+        }
+        __pyx_t_8 = (__pyx_t_10) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_10, ((PyObject *)__pyx_v_atom2)) : __Pyx_PyObject_CallOneArg(__pyx_t_9, ((PyObject *)__pyx_v_atom2));
+        __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+        if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 189, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":188
+ *             if atom1 in fragment2.atoms:
+ *                 fragment2.remove_atom(atom1)
+ *             if atom2 in fragment2.atoms:             # <<<<<<<<<<<<<<
+ *                 fragment2.remove_atom(atom2)
+ *             groups1 = fragment1.split()
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":190
+ *             if atom2 in fragment2.atoms:
+ *                 fragment2.remove_atom(atom2)
+ *             groups1 = fragment1.split()             # <<<<<<<<<<<<<<
+ *             groups2 = fragment2.split()
+ * 
+ */
+      __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_fragment1, __pyx_n_s_split); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 190, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_10 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+        __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_9);
+        if (likely(__pyx_t_10)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+          __Pyx_INCREF(__pyx_t_10);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_9, function);
+        }
+      }
+      __pyx_t_8 = (__pyx_t_10) ? __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_10) : __Pyx_PyObject_CallNoArg(__pyx_t_9);
+      __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+      if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 190, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_v_groups1 = __pyx_t_8;
+      __pyx_t_8 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":191
+ *                 fragment2.remove_atom(atom2)
+ *             groups1 = fragment1.split()
+ *             groups2 = fragment2.split()             # <<<<<<<<<<<<<<
+ * 
+ *             # Test functional groups for symmetry
+ */
+      __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_fragment2, __pyx_n_s_split); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 191, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_10 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+        __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_9);
+        if (likely(__pyx_t_10)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+          __Pyx_INCREF(__pyx_t_10);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_9, function);
+        }
+      }
+      __pyx_t_8 = (__pyx_t_10) ? __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_10) : __Pyx_PyObject_CallNoArg(__pyx_t_9);
+      __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+      if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 191, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_v_groups2 = __pyx_t_8;
+      __pyx_t_8 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":194
+ * 
+ *             # Test functional groups for symmetry
+ *             if len(groups1) == len(groups2) == 1:             # <<<<<<<<<<<<<<
+ *                 if groups1[0].is_isomorphic(groups2[0]):
+ *                     symmetry_number *= 2
+ */
+      __pyx_t_6 = PyObject_Length(__pyx_v_groups1); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-1))) __PYX_ERR(0, 194, __pyx_L1_error)
+      __pyx_t_11 = PyObject_Length(__pyx_v_groups2); if (unlikely(__pyx_t_11 == ((Py_ssize_t)-1))) __PYX_ERR(0, 194, __pyx_L1_error)
+      __pyx_t_3 = (__pyx_t_6 == __pyx_t_11);
+      if (__pyx_t_3) {
+        __pyx_t_3 = (__pyx_t_11 == 1);
+      }
+      __pyx_t_4 = (__pyx_t_3 != 0);
+      if (__pyx_t_4) {
+
+        /* "rmgpy/molecule/symmetry.py":195
+ *             # Test functional groups for symmetry
+ *             if len(groups1) == len(groups2) == 1:
+ *                 if groups1[0].is_isomorphic(groups2[0]):             # <<<<<<<<<<<<<<
+ *                     symmetry_number *= 2
+ *             elif len(groups1) == len(groups2) == 2:
+ */
+        __pyx_t_9 = __Pyx_GetItemInt(__pyx_v_groups1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 195, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_n_s_is_isomorphic); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 195, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_t_9 = __Pyx_GetItemInt(__pyx_v_groups2, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 195, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_1 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_10))) {
+          __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_10);
+          if (likely(__pyx_t_1)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_10);
+            __Pyx_INCREF(__pyx_t_1);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_10, function);
+          }
+        }
+        __pyx_t_8 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_10, __pyx_t_1, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_10, __pyx_t_9);
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 195, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 195, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        if (__pyx_t_4) {
+
+          /* "rmgpy/molecule/symmetry.py":196
+ *             if len(groups1) == len(groups2) == 1:
+ *                 if groups1[0].is_isomorphic(groups2[0]):
+ *                     symmetry_number *= 2             # <<<<<<<<<<<<<<
+ *             elif len(groups1) == len(groups2) == 2:
+ *                 if groups1[0].is_isomorphic(groups2[0]) and groups1[1].is_isomorphic(groups2[1]):
+ */
+          __pyx_t_8 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 196, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_8);
+          __pyx_t_8 = 0;
+
+          /* "rmgpy/molecule/symmetry.py":195
+ *             # Test functional groups for symmetry
+ *             if len(groups1) == len(groups2) == 1:
+ *                 if groups1[0].is_isomorphic(groups2[0]):             # <<<<<<<<<<<<<<
+ *                     symmetry_number *= 2
+ *             elif len(groups1) == len(groups2) == 2:
+ */
+        }
+
+        /* "rmgpy/molecule/symmetry.py":194
+ * 
+ *             # Test functional groups for symmetry
+ *             if len(groups1) == len(groups2) == 1:             # <<<<<<<<<<<<<<
+ *                 if groups1[0].is_isomorphic(groups2[0]):
+ *                     symmetry_number *= 2
+ */
+        goto __pyx_L13;
+      }
+
+      /* "rmgpy/molecule/symmetry.py":197
+ *                 if groups1[0].is_isomorphic(groups2[0]):
+ *                     symmetry_number *= 2
+ *             elif len(groups1) == len(groups2) == 2:             # <<<<<<<<<<<<<<
+ *                 if groups1[0].is_isomorphic(groups2[0]) and groups1[1].is_isomorphic(groups2[1]):
+ *                     symmetry_number *= 2
+ */
+      __pyx_t_11 = PyObject_Length(__pyx_v_groups1); if (unlikely(__pyx_t_11 == ((Py_ssize_t)-1))) __PYX_ERR(0, 197, __pyx_L1_error)
+      __pyx_t_6 = PyObject_Length(__pyx_v_groups2); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-1))) __PYX_ERR(0, 197, __pyx_L1_error)
+      __pyx_t_4 = (__pyx_t_11 == __pyx_t_6);
+      if (__pyx_t_4) {
+        __pyx_t_4 = (__pyx_t_6 == 2);
+      }
+      __pyx_t_3 = (__pyx_t_4 != 0);
+      if (__pyx_t_3) {
+
+        /* "rmgpy/molecule/symmetry.py":198
+ *                     symmetry_number *= 2
+ *             elif len(groups1) == len(groups2) == 2:
+ *                 if groups1[0].is_isomorphic(groups2[0]) and groups1[1].is_isomorphic(groups2[1]):             # <<<<<<<<<<<<<<
+ *                     symmetry_number *= 2
+ *                 elif groups1[1].is_isomorphic(groups2[0]) and groups1[0].is_isomorphic(groups2[1]):
+ */
+        __pyx_t_10 = __Pyx_GetItemInt(__pyx_v_groups1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 198, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_n_s_is_isomorphic); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 198, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __pyx_t_10 = __Pyx_GetItemInt(__pyx_v_groups2, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 198, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __pyx_t_1 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+          __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_9);
+          if (likely(__pyx_t_1)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+            __Pyx_INCREF(__pyx_t_1);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_9, function);
+          }
+        }
+        __pyx_t_8 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_1, __pyx_t_10) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_10);
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 198, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 198, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        if (__pyx_t_4) {
+        } else {
+          __pyx_t_3 = __pyx_t_4;
+          goto __pyx_L16_bool_binop_done;
+        }
+        __pyx_t_9 = __Pyx_GetItemInt(__pyx_v_groups1, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 198, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_n_s_is_isomorphic); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 198, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_t_9 = __Pyx_GetItemInt(__pyx_v_groups2, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 198, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_1 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_10))) {
+          __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_10);
+          if (likely(__pyx_t_1)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_10);
+            __Pyx_INCREF(__pyx_t_1);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_10, function);
+          }
+        }
+        __pyx_t_8 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_10, __pyx_t_1, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_10, __pyx_t_9);
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 198, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 198, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __pyx_t_3 = __pyx_t_4;
+        __pyx_L16_bool_binop_done:;
+        if (__pyx_t_3) {
+
+          /* "rmgpy/molecule/symmetry.py":199
+ *             elif len(groups1) == len(groups2) == 2:
+ *                 if groups1[0].is_isomorphic(groups2[0]) and groups1[1].is_isomorphic(groups2[1]):
+ *                     symmetry_number *= 2             # <<<<<<<<<<<<<<
+ *                 elif groups1[1].is_isomorphic(groups2[0]) and groups1[0].is_isomorphic(groups2[1]):
+ *                     symmetry_number *= 2
+ */
+          __pyx_t_8 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 199, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_8);
+          __pyx_t_8 = 0;
+
+          /* "rmgpy/molecule/symmetry.py":198
+ *                     symmetry_number *= 2
+ *             elif len(groups1) == len(groups2) == 2:
+ *                 if groups1[0].is_isomorphic(groups2[0]) and groups1[1].is_isomorphic(groups2[1]):             # <<<<<<<<<<<<<<
+ *                     symmetry_number *= 2
+ *                 elif groups1[1].is_isomorphic(groups2[0]) and groups1[0].is_isomorphic(groups2[1]):
+ */
+          goto __pyx_L15;
+        }
+
+        /* "rmgpy/molecule/symmetry.py":200
+ *                 if groups1[0].is_isomorphic(groups2[0]) and groups1[1].is_isomorphic(groups2[1]):
+ *                     symmetry_number *= 2
+ *                 elif groups1[1].is_isomorphic(groups2[0]) and groups1[0].is_isomorphic(groups2[1]):             # <<<<<<<<<<<<<<
+ *                     symmetry_number *= 2
+ *             elif len(groups1) == len(groups2) == 3:
+ */
+        __pyx_t_10 = __Pyx_GetItemInt(__pyx_v_groups1, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 200, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_n_s_is_isomorphic); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 200, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __pyx_t_10 = __Pyx_GetItemInt(__pyx_v_groups2, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 200, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __pyx_t_1 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+          __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_9);
+          if (likely(__pyx_t_1)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+            __Pyx_INCREF(__pyx_t_1);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_9, function);
+          }
+        }
+        __pyx_t_8 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_1, __pyx_t_10) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_10);
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 200, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 200, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        if (__pyx_t_4) {
+        } else {
+          __pyx_t_3 = __pyx_t_4;
+          goto __pyx_L18_bool_binop_done;
+        }
+        __pyx_t_9 = __Pyx_GetItemInt(__pyx_v_groups1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 200, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_n_s_is_isomorphic); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 200, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_t_9 = __Pyx_GetItemInt(__pyx_v_groups2, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 200, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_1 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_10))) {
+          __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_10);
+          if (likely(__pyx_t_1)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_10);
+            __Pyx_INCREF(__pyx_t_1);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_10, function);
+          }
+        }
+        __pyx_t_8 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_10, __pyx_t_1, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_10, __pyx_t_9);
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 200, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 200, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __pyx_t_3 = __pyx_t_4;
+        __pyx_L18_bool_binop_done:;
+        if (__pyx_t_3) {
+
+          /* "rmgpy/molecule/symmetry.py":201
+ *                     symmetry_number *= 2
+ *                 elif groups1[1].is_isomorphic(groups2[0]) and groups1[0].is_isomorphic(groups2[1]):
+ *                     symmetry_number *= 2             # <<<<<<<<<<<<<<
+ *             elif len(groups1) == len(groups2) == 3:
+ *                 if groups1[0].is_isomorphic(groups2[0]):
+ */
+          __pyx_t_8 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 201, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_8);
+          __pyx_t_8 = 0;
+
+          /* "rmgpy/molecule/symmetry.py":200
+ *                 if groups1[0].is_isomorphic(groups2[0]) and groups1[1].is_isomorphic(groups2[1]):
+ *                     symmetry_number *= 2
+ *                 elif groups1[1].is_isomorphic(groups2[0]) and groups1[0].is_isomorphic(groups2[1]):             # <<<<<<<<<<<<<<
+ *                     symmetry_number *= 2
+ *             elif len(groups1) == len(groups2) == 3:
+ */
+        }
+        __pyx_L15:;
+
+        /* "rmgpy/molecule/symmetry.py":197
+ *                 if groups1[0].is_isomorphic(groups2[0]):
+ *                     symmetry_number *= 2
+ *             elif len(groups1) == len(groups2) == 2:             # <<<<<<<<<<<<<<
+ *                 if groups1[0].is_isomorphic(groups2[0]) and groups1[1].is_isomorphic(groups2[1]):
+ *                     symmetry_number *= 2
+ */
+        goto __pyx_L13;
+      }
+
+      /* "rmgpy/molecule/symmetry.py":202
+ *                 elif groups1[1].is_isomorphic(groups2[0]) and groups1[0].is_isomorphic(groups2[1]):
+ *                     symmetry_number *= 2
+ *             elif len(groups1) == len(groups2) == 3:             # <<<<<<<<<<<<<<
+ *                 if groups1[0].is_isomorphic(groups2[0]):
+ *                     if groups1[1].is_isomorphic(groups2[1]) and groups1[2].is_isomorphic(groups2[2]):
+ */
+      __pyx_t_6 = PyObject_Length(__pyx_v_groups1); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-1))) __PYX_ERR(0, 202, __pyx_L1_error)
+      __pyx_t_11 = PyObject_Length(__pyx_v_groups2); if (unlikely(__pyx_t_11 == ((Py_ssize_t)-1))) __PYX_ERR(0, 202, __pyx_L1_error)
+      __pyx_t_3 = (__pyx_t_6 == __pyx_t_11);
+      if (__pyx_t_3) {
+        __pyx_t_3 = (__pyx_t_11 == 3);
+      }
+      __pyx_t_4 = (__pyx_t_3 != 0);
+      if (__pyx_t_4) {
+
+        /* "rmgpy/molecule/symmetry.py":203
+ *                     symmetry_number *= 2
+ *             elif len(groups1) == len(groups2) == 3:
+ *                 if groups1[0].is_isomorphic(groups2[0]):             # <<<<<<<<<<<<<<
+ *                     if groups1[1].is_isomorphic(groups2[1]) and groups1[2].is_isomorphic(groups2[2]):
+ *                         symmetry_number *= 2
+ */
+        __pyx_t_10 = __Pyx_GetItemInt(__pyx_v_groups1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 203, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_n_s_is_isomorphic); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 203, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __pyx_t_10 = __Pyx_GetItemInt(__pyx_v_groups2, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 203, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __pyx_t_1 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+          __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_9);
+          if (likely(__pyx_t_1)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+            __Pyx_INCREF(__pyx_t_1);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_9, function);
+          }
+        }
+        __pyx_t_8 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_1, __pyx_t_10) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_10);
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 203, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 203, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        if (__pyx_t_4) {
+
+          /* "rmgpy/molecule/symmetry.py":204
+ *             elif len(groups1) == len(groups2) == 3:
+ *                 if groups1[0].is_isomorphic(groups2[0]):
+ *                     if groups1[1].is_isomorphic(groups2[1]) and groups1[2].is_isomorphic(groups2[2]):             # <<<<<<<<<<<<<<
+ *                         symmetry_number *= 2
+ *                     elif groups1[1].is_isomorphic(groups2[2]) and groups1[2].is_isomorphic(groups2[1]):
+ */
+          __pyx_t_9 = __Pyx_GetItemInt(__pyx_v_groups1, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 204, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_n_s_is_isomorphic); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 204, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __pyx_t_9 = __Pyx_GetItemInt(__pyx_v_groups2, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 204, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_1 = NULL;
+          if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_10))) {
+            __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_10);
+            if (likely(__pyx_t_1)) {
+              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_10);
+              __Pyx_INCREF(__pyx_t_1);
+              __Pyx_INCREF(function);
+              __Pyx_DECREF_SET(__pyx_t_10, function);
+            }
+          }
+          __pyx_t_8 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_10, __pyx_t_1, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_10, __pyx_t_9);
+          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 204, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 204, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+          if (__pyx_t_3) {
+          } else {
+            __pyx_t_4 = __pyx_t_3;
+            goto __pyx_L22_bool_binop_done;
+          }
+          __pyx_t_10 = __Pyx_GetItemInt(__pyx_v_groups1, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 204, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_n_s_is_isomorphic); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 204, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          __pyx_t_10 = __Pyx_GetItemInt(__pyx_v_groups2, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 204, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __pyx_t_1 = NULL;
+          if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+            __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_9);
+            if (likely(__pyx_t_1)) {
+              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+              __Pyx_INCREF(__pyx_t_1);
+              __Pyx_INCREF(function);
+              __Pyx_DECREF_SET(__pyx_t_9, function);
+            }
+          }
+          __pyx_t_8 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_1, __pyx_t_10) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_10);
+          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 204, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 204, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+          __pyx_t_4 = __pyx_t_3;
+          __pyx_L22_bool_binop_done:;
+          if (__pyx_t_4) {
+
+            /* "rmgpy/molecule/symmetry.py":205
+ *                 if groups1[0].is_isomorphic(groups2[0]):
+ *                     if groups1[1].is_isomorphic(groups2[1]) and groups1[2].is_isomorphic(groups2[2]):
+ *                         symmetry_number *= 2             # <<<<<<<<<<<<<<
+ *                     elif groups1[1].is_isomorphic(groups2[2]) and groups1[2].is_isomorphic(groups2[1]):
+ *                         symmetry_number *= 2
+ */
+            __pyx_t_8 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 205, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_8);
+            __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_8);
+            __pyx_t_8 = 0;
+
+            /* "rmgpy/molecule/symmetry.py":204
+ *             elif len(groups1) == len(groups2) == 3:
+ *                 if groups1[0].is_isomorphic(groups2[0]):
+ *                     if groups1[1].is_isomorphic(groups2[1]) and groups1[2].is_isomorphic(groups2[2]):             # <<<<<<<<<<<<<<
+ *                         symmetry_number *= 2
+ *                     elif groups1[1].is_isomorphic(groups2[2]) and groups1[2].is_isomorphic(groups2[1]):
+ */
+            goto __pyx_L21;
+          }
+
+          /* "rmgpy/molecule/symmetry.py":206
+ *                     if groups1[1].is_isomorphic(groups2[1]) and groups1[2].is_isomorphic(groups2[2]):
+ *                         symmetry_number *= 2
+ *                     elif groups1[1].is_isomorphic(groups2[2]) and groups1[2].is_isomorphic(groups2[1]):             # <<<<<<<<<<<<<<
+ *                         symmetry_number *= 2
+ *                 elif groups1[0].is_isomorphic(groups2[1]):
+ */
+          __pyx_t_9 = __Pyx_GetItemInt(__pyx_v_groups1, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 206, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_n_s_is_isomorphic); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 206, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __pyx_t_9 = __Pyx_GetItemInt(__pyx_v_groups2, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 206, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_1 = NULL;
+          if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_10))) {
+            __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_10);
+            if (likely(__pyx_t_1)) {
+              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_10);
+              __Pyx_INCREF(__pyx_t_1);
+              __Pyx_INCREF(function);
+              __Pyx_DECREF_SET(__pyx_t_10, function);
+            }
+          }
+          __pyx_t_8 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_10, __pyx_t_1, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_10, __pyx_t_9);
+          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 206, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 206, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+          if (__pyx_t_3) {
+          } else {
+            __pyx_t_4 = __pyx_t_3;
+            goto __pyx_L24_bool_binop_done;
+          }
+          __pyx_t_10 = __Pyx_GetItemInt(__pyx_v_groups1, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 206, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_n_s_is_isomorphic); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 206, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          __pyx_t_10 = __Pyx_GetItemInt(__pyx_v_groups2, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 206, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __pyx_t_1 = NULL;
+          if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+            __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_9);
+            if (likely(__pyx_t_1)) {
+              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+              __Pyx_INCREF(__pyx_t_1);
+              __Pyx_INCREF(function);
+              __Pyx_DECREF_SET(__pyx_t_9, function);
+            }
+          }
+          __pyx_t_8 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_1, __pyx_t_10) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_10);
+          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 206, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 206, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+          __pyx_t_4 = __pyx_t_3;
+          __pyx_L24_bool_binop_done:;
+          if (__pyx_t_4) {
+
+            /* "rmgpy/molecule/symmetry.py":207
+ *                         symmetry_number *= 2
+ *                     elif groups1[1].is_isomorphic(groups2[2]) and groups1[2].is_isomorphic(groups2[1]):
+ *                         symmetry_number *= 2             # <<<<<<<<<<<<<<
+ *                 elif groups1[0].is_isomorphic(groups2[1]):
+ *                     if groups1[1].is_isomorphic(groups2[2]) and groups1[2].is_isomorphic(groups2[0]):
+ */
+            __pyx_t_8 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 207, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_8);
+            __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_8);
+            __pyx_t_8 = 0;
+
+            /* "rmgpy/molecule/symmetry.py":206
+ *                     if groups1[1].is_isomorphic(groups2[1]) and groups1[2].is_isomorphic(groups2[2]):
+ *                         symmetry_number *= 2
+ *                     elif groups1[1].is_isomorphic(groups2[2]) and groups1[2].is_isomorphic(groups2[1]):             # <<<<<<<<<<<<<<
+ *                         symmetry_number *= 2
+ *                 elif groups1[0].is_isomorphic(groups2[1]):
+ */
+          }
+          __pyx_L21:;
+
+          /* "rmgpy/molecule/symmetry.py":203
+ *                     symmetry_number *= 2
+ *             elif len(groups1) == len(groups2) == 3:
+ *                 if groups1[0].is_isomorphic(groups2[0]):             # <<<<<<<<<<<<<<
+ *                     if groups1[1].is_isomorphic(groups2[1]) and groups1[2].is_isomorphic(groups2[2]):
+ *                         symmetry_number *= 2
+ */
+          goto __pyx_L20;
+        }
+
+        /* "rmgpy/molecule/symmetry.py":208
+ *                     elif groups1[1].is_isomorphic(groups2[2]) and groups1[2].is_isomorphic(groups2[1]):
+ *                         symmetry_number *= 2
+ *                 elif groups1[0].is_isomorphic(groups2[1]):             # <<<<<<<<<<<<<<
+ *                     if groups1[1].is_isomorphic(groups2[2]) and groups1[2].is_isomorphic(groups2[0]):
+ *                         symmetry_number *= 2
+ */
+        __pyx_t_9 = __Pyx_GetItemInt(__pyx_v_groups1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 208, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_n_s_is_isomorphic); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 208, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_t_9 = __Pyx_GetItemInt(__pyx_v_groups2, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 208, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_1 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_10))) {
+          __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_10);
+          if (likely(__pyx_t_1)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_10);
+            __Pyx_INCREF(__pyx_t_1);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_10, function);
+          }
+        }
+        __pyx_t_8 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_10, __pyx_t_1, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_10, __pyx_t_9);
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 208, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 208, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        if (__pyx_t_4) {
+
+          /* "rmgpy/molecule/symmetry.py":209
+ *                         symmetry_number *= 2
+ *                 elif groups1[0].is_isomorphic(groups2[1]):
+ *                     if groups1[1].is_isomorphic(groups2[2]) and groups1[2].is_isomorphic(groups2[0]):             # <<<<<<<<<<<<<<
+ *                         symmetry_number *= 2
+ *                     elif groups1[1].is_isomorphic(groups2[0]) and groups1[2].is_isomorphic(groups2[2]):
+ */
+          __pyx_t_10 = __Pyx_GetItemInt(__pyx_v_groups1, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 209, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_n_s_is_isomorphic); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 209, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          __pyx_t_10 = __Pyx_GetItemInt(__pyx_v_groups2, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 209, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __pyx_t_1 = NULL;
+          if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+            __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_9);
+            if (likely(__pyx_t_1)) {
+              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+              __Pyx_INCREF(__pyx_t_1);
+              __Pyx_INCREF(function);
+              __Pyx_DECREF_SET(__pyx_t_9, function);
+            }
+          }
+          __pyx_t_8 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_1, __pyx_t_10) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_10);
+          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 209, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 209, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+          if (__pyx_t_3) {
+          } else {
+            __pyx_t_4 = __pyx_t_3;
+            goto __pyx_L27_bool_binop_done;
+          }
+          __pyx_t_9 = __Pyx_GetItemInt(__pyx_v_groups1, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 209, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_n_s_is_isomorphic); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 209, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __pyx_t_9 = __Pyx_GetItemInt(__pyx_v_groups2, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 209, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_1 = NULL;
+          if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_10))) {
+            __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_10);
+            if (likely(__pyx_t_1)) {
+              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_10);
+              __Pyx_INCREF(__pyx_t_1);
+              __Pyx_INCREF(function);
+              __Pyx_DECREF_SET(__pyx_t_10, function);
+            }
+          }
+          __pyx_t_8 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_10, __pyx_t_1, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_10, __pyx_t_9);
+          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 209, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 209, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+          __pyx_t_4 = __pyx_t_3;
+          __pyx_L27_bool_binop_done:;
+          if (__pyx_t_4) {
+
+            /* "rmgpy/molecule/symmetry.py":210
+ *                 elif groups1[0].is_isomorphic(groups2[1]):
+ *                     if groups1[1].is_isomorphic(groups2[2]) and groups1[2].is_isomorphic(groups2[0]):
+ *                         symmetry_number *= 2             # <<<<<<<<<<<<<<
+ *                     elif groups1[1].is_isomorphic(groups2[0]) and groups1[2].is_isomorphic(groups2[2]):
+ *                         symmetry_number *= 2
+ */
+            __pyx_t_8 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 210, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_8);
+            __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_8);
+            __pyx_t_8 = 0;
+
+            /* "rmgpy/molecule/symmetry.py":209
+ *                         symmetry_number *= 2
+ *                 elif groups1[0].is_isomorphic(groups2[1]):
+ *                     if groups1[1].is_isomorphic(groups2[2]) and groups1[2].is_isomorphic(groups2[0]):             # <<<<<<<<<<<<<<
+ *                         symmetry_number *= 2
+ *                     elif groups1[1].is_isomorphic(groups2[0]) and groups1[2].is_isomorphic(groups2[2]):
+ */
+            goto __pyx_L26;
+          }
+
+          /* "rmgpy/molecule/symmetry.py":211
+ *                     if groups1[1].is_isomorphic(groups2[2]) and groups1[2].is_isomorphic(groups2[0]):
+ *                         symmetry_number *= 2
+ *                     elif groups1[1].is_isomorphic(groups2[0]) and groups1[2].is_isomorphic(groups2[2]):             # <<<<<<<<<<<<<<
+ *                         symmetry_number *= 2
+ *                 elif groups1[0].is_isomorphic(groups2[2]):
+ */
+          __pyx_t_10 = __Pyx_GetItemInt(__pyx_v_groups1, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 211, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_n_s_is_isomorphic); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 211, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          __pyx_t_10 = __Pyx_GetItemInt(__pyx_v_groups2, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 211, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __pyx_t_1 = NULL;
+          if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+            __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_9);
+            if (likely(__pyx_t_1)) {
+              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+              __Pyx_INCREF(__pyx_t_1);
+              __Pyx_INCREF(function);
+              __Pyx_DECREF_SET(__pyx_t_9, function);
+            }
+          }
+          __pyx_t_8 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_1, __pyx_t_10) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_10);
+          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 211, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 211, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+          if (__pyx_t_3) {
+          } else {
+            __pyx_t_4 = __pyx_t_3;
+            goto __pyx_L29_bool_binop_done;
+          }
+          __pyx_t_9 = __Pyx_GetItemInt(__pyx_v_groups1, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 211, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_n_s_is_isomorphic); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 211, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __pyx_t_9 = __Pyx_GetItemInt(__pyx_v_groups2, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 211, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_1 = NULL;
+          if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_10))) {
+            __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_10);
+            if (likely(__pyx_t_1)) {
+              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_10);
+              __Pyx_INCREF(__pyx_t_1);
+              __Pyx_INCREF(function);
+              __Pyx_DECREF_SET(__pyx_t_10, function);
+            }
+          }
+          __pyx_t_8 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_10, __pyx_t_1, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_10, __pyx_t_9);
+          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 211, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 211, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+          __pyx_t_4 = __pyx_t_3;
+          __pyx_L29_bool_binop_done:;
+          if (__pyx_t_4) {
+
+            /* "rmgpy/molecule/symmetry.py":212
+ *                         symmetry_number *= 2
+ *                     elif groups1[1].is_isomorphic(groups2[0]) and groups1[2].is_isomorphic(groups2[2]):
+ *                         symmetry_number *= 2             # <<<<<<<<<<<<<<
+ *                 elif groups1[0].is_isomorphic(groups2[2]):
+ *                     if groups1[1].is_isomorphic(groups2[0]) and groups1[2].is_isomorphic(groups2[1]):
+ */
+            __pyx_t_8 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 212, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_8);
+            __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_8);
+            __pyx_t_8 = 0;
+
+            /* "rmgpy/molecule/symmetry.py":211
+ *                     if groups1[1].is_isomorphic(groups2[2]) and groups1[2].is_isomorphic(groups2[0]):
+ *                         symmetry_number *= 2
+ *                     elif groups1[1].is_isomorphic(groups2[0]) and groups1[2].is_isomorphic(groups2[2]):             # <<<<<<<<<<<<<<
+ *                         symmetry_number *= 2
+ *                 elif groups1[0].is_isomorphic(groups2[2]):
+ */
+          }
+          __pyx_L26:;
+
+          /* "rmgpy/molecule/symmetry.py":208
+ *                     elif groups1[1].is_isomorphic(groups2[2]) and groups1[2].is_isomorphic(groups2[1]):
+ *                         symmetry_number *= 2
+ *                 elif groups1[0].is_isomorphic(groups2[1]):             # <<<<<<<<<<<<<<
+ *                     if groups1[1].is_isomorphic(groups2[2]) and groups1[2].is_isomorphic(groups2[0]):
+ *                         symmetry_number *= 2
+ */
+          goto __pyx_L20;
+        }
+
+        /* "rmgpy/molecule/symmetry.py":213
+ *                     elif groups1[1].is_isomorphic(groups2[0]) and groups1[2].is_isomorphic(groups2[2]):
+ *                         symmetry_number *= 2
+ *                 elif groups1[0].is_isomorphic(groups2[2]):             # <<<<<<<<<<<<<<
+ *                     if groups1[1].is_isomorphic(groups2[0]) and groups1[2].is_isomorphic(groups2[1]):
+ *                         symmetry_number *= 2
+ */
+        __pyx_t_10 = __Pyx_GetItemInt(__pyx_v_groups1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 213, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_n_s_is_isomorphic); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 213, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __pyx_t_10 = __Pyx_GetItemInt(__pyx_v_groups2, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 213, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __pyx_t_1 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+          __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_9);
+          if (likely(__pyx_t_1)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+            __Pyx_INCREF(__pyx_t_1);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_9, function);
+          }
+        }
+        __pyx_t_8 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_1, __pyx_t_10) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_10);
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 213, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 213, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        if (__pyx_t_4) {
+
+          /* "rmgpy/molecule/symmetry.py":214
+ *                         symmetry_number *= 2
+ *                 elif groups1[0].is_isomorphic(groups2[2]):
+ *                     if groups1[1].is_isomorphic(groups2[0]) and groups1[2].is_isomorphic(groups2[1]):             # <<<<<<<<<<<<<<
+ *                         symmetry_number *= 2
+ *                     elif groups1[1].is_isomorphic(groups2[1]) and groups1[2].is_isomorphic(groups2[0]):
+ */
+          __pyx_t_9 = __Pyx_GetItemInt(__pyx_v_groups1, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 214, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_n_s_is_isomorphic); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 214, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __pyx_t_9 = __Pyx_GetItemInt(__pyx_v_groups2, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 214, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_1 = NULL;
+          if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_10))) {
+            __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_10);
+            if (likely(__pyx_t_1)) {
+              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_10);
+              __Pyx_INCREF(__pyx_t_1);
+              __Pyx_INCREF(function);
+              __Pyx_DECREF_SET(__pyx_t_10, function);
+            }
+          }
+          __pyx_t_8 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_10, __pyx_t_1, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_10, __pyx_t_9);
+          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 214, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 214, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+          if (__pyx_t_3) {
+          } else {
+            __pyx_t_4 = __pyx_t_3;
+            goto __pyx_L32_bool_binop_done;
+          }
+          __pyx_t_10 = __Pyx_GetItemInt(__pyx_v_groups1, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 214, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_n_s_is_isomorphic); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 214, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          __pyx_t_10 = __Pyx_GetItemInt(__pyx_v_groups2, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 214, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __pyx_t_1 = NULL;
+          if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+            __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_9);
+            if (likely(__pyx_t_1)) {
+              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+              __Pyx_INCREF(__pyx_t_1);
+              __Pyx_INCREF(function);
+              __Pyx_DECREF_SET(__pyx_t_9, function);
+            }
+          }
+          __pyx_t_8 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_1, __pyx_t_10) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_10);
+          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 214, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 214, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+          __pyx_t_4 = __pyx_t_3;
+          __pyx_L32_bool_binop_done:;
+          if (__pyx_t_4) {
+
+            /* "rmgpy/molecule/symmetry.py":215
+ *                 elif groups1[0].is_isomorphic(groups2[2]):
+ *                     if groups1[1].is_isomorphic(groups2[0]) and groups1[2].is_isomorphic(groups2[1]):
+ *                         symmetry_number *= 2             # <<<<<<<<<<<<<<
+ *                     elif groups1[1].is_isomorphic(groups2[1]) and groups1[2].is_isomorphic(groups2[0]):
+ *                         symmetry_number *= 2
+ */
+            __pyx_t_8 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 215, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_8);
+            __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_8);
+            __pyx_t_8 = 0;
+
+            /* "rmgpy/molecule/symmetry.py":214
+ *                         symmetry_number *= 2
+ *                 elif groups1[0].is_isomorphic(groups2[2]):
+ *                     if groups1[1].is_isomorphic(groups2[0]) and groups1[2].is_isomorphic(groups2[1]):             # <<<<<<<<<<<<<<
+ *                         symmetry_number *= 2
+ *                     elif groups1[1].is_isomorphic(groups2[1]) and groups1[2].is_isomorphic(groups2[0]):
+ */
+            goto __pyx_L31;
+          }
+
+          /* "rmgpy/molecule/symmetry.py":216
+ *                     if groups1[1].is_isomorphic(groups2[0]) and groups1[2].is_isomorphic(groups2[1]):
+ *                         symmetry_number *= 2
+ *                     elif groups1[1].is_isomorphic(groups2[1]) and groups1[2].is_isomorphic(groups2[0]):             # <<<<<<<<<<<<<<
+ *                         symmetry_number *= 2
+ * 
+ */
+          __pyx_t_9 = __Pyx_GetItemInt(__pyx_v_groups1, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 216, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_n_s_is_isomorphic); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 216, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __pyx_t_9 = __Pyx_GetItemInt(__pyx_v_groups2, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 216, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_1 = NULL;
+          if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_10))) {
+            __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_10);
+            if (likely(__pyx_t_1)) {
+              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_10);
+              __Pyx_INCREF(__pyx_t_1);
+              __Pyx_INCREF(function);
+              __Pyx_DECREF_SET(__pyx_t_10, function);
+            }
+          }
+          __pyx_t_8 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_10, __pyx_t_1, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_10, __pyx_t_9);
+          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 216, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 216, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+          if (__pyx_t_3) {
+          } else {
+            __pyx_t_4 = __pyx_t_3;
+            goto __pyx_L34_bool_binop_done;
+          }
+          __pyx_t_10 = __Pyx_GetItemInt(__pyx_v_groups1, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 216, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_n_s_is_isomorphic); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 216, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          __pyx_t_10 = __Pyx_GetItemInt(__pyx_v_groups2, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 216, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __pyx_t_1 = NULL;
+          if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+            __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_9);
+            if (likely(__pyx_t_1)) {
+              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+              __Pyx_INCREF(__pyx_t_1);
+              __Pyx_INCREF(function);
+              __Pyx_DECREF_SET(__pyx_t_9, function);
+            }
+          }
+          __pyx_t_8 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_1, __pyx_t_10) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_10);
+          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 216, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 216, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+          __pyx_t_4 = __pyx_t_3;
+          __pyx_L34_bool_binop_done:;
+          if (__pyx_t_4) {
+
+            /* "rmgpy/molecule/symmetry.py":217
+ *                         symmetry_number *= 2
+ *                     elif groups1[1].is_isomorphic(groups2[1]) and groups1[2].is_isomorphic(groups2[0]):
+ *                         symmetry_number *= 2             # <<<<<<<<<<<<<<
+ * 
+ *     return symmetry_number
+ */
+            __pyx_t_8 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 217, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_8);
+            __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_8);
+            __pyx_t_8 = 0;
+
+            /* "rmgpy/molecule/symmetry.py":216
+ *                     if groups1[1].is_isomorphic(groups2[0]) and groups1[2].is_isomorphic(groups2[1]):
+ *                         symmetry_number *= 2
+ *                     elif groups1[1].is_isomorphic(groups2[1]) and groups1[2].is_isomorphic(groups2[0]):             # <<<<<<<<<<<<<<
+ *                         symmetry_number *= 2
+ * 
+ */
+          }
+          __pyx_L31:;
+
+          /* "rmgpy/molecule/symmetry.py":213
+ *                     elif groups1[1].is_isomorphic(groups2[0]) and groups1[2].is_isomorphic(groups2[2]):
+ *                         symmetry_number *= 2
+ *                 elif groups1[0].is_isomorphic(groups2[2]):             # <<<<<<<<<<<<<<
+ *                     if groups1[1].is_isomorphic(groups2[0]) and groups1[2].is_isomorphic(groups2[1]):
+ *                         symmetry_number *= 2
+ */
+        }
+        __pyx_L20:;
+
+        /* "rmgpy/molecule/symmetry.py":202
+ *                 elif groups1[1].is_isomorphic(groups2[0]) and groups1[0].is_isomorphic(groups2[1]):
+ *                     symmetry_number *= 2
+ *             elif len(groups1) == len(groups2) == 3:             # <<<<<<<<<<<<<<
+ *                 if groups1[0].is_isomorphic(groups2[0]):
+ *                     if groups1[1].is_isomorphic(groups2[1]) and groups1[2].is_isomorphic(groups2[2]):
+ */
+      }
+      __pyx_L13:;
+    }
+    __pyx_L4:;
+
+    /* "rmgpy/molecule/symmetry.py":158
+ *     bond = atom1.edges[atom2]
+ *     symmetry_number = 1
+ *     if atom1.equivalent(atom2):             # <<<<<<<<<<<<<<
+ *         # An O-O bond is considered to be an "optical isomer" and so no
+ *         # symmetry correction will be applied
+ */
+  }
+
+  /* "rmgpy/molecule/symmetry.py":219
+ *                         symmetry_number *= 2
+ * 
+ *     return symmetry_number             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_v_symmetry_number); if (unlikely((__pyx_t_5 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 219, __pyx_L1_error)
+  __pyx_r = __pyx_t_5;
+  goto __pyx_L0;
+
+  /* "rmgpy/molecule/symmetry.py":152
+ * ################################################################################
+ * 
+ * def calculate_bond_symmetry_number(molecule, atom1, atom2):             # <<<<<<<<<<<<<<
+ *     """
+ *     Return the symmetry number centered at `bond` in the structure.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("rmgpy.molecule.symmetry.calculate_bond_symmetry_number", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1.0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_bond);
+  __Pyx_XDECREF(__pyx_v_symmetry_number);
+  __Pyx_XDECREF((PyObject *)__pyx_v_structure);
+  __Pyx_XDECREF(__pyx_v_fragments);
+  __Pyx_XDECREF(__pyx_v_fragment1);
+  __Pyx_XDECREF(__pyx_v_fragment2);
+  __Pyx_XDECREF(__pyx_v_groups1);
+  __Pyx_XDECREF(__pyx_v_groups2);
+  __Pyx_XDECREF((PyObject *)__pyx_v_atom1);
+  __Pyx_XDECREF((PyObject *)__pyx_v_atom2);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8molecule_8symmetry_3calculate_bond_symmetry_number(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5rmgpy_8molecule_8symmetry_2calculate_bond_symmetry_number[] = "\n    Return the symmetry number centered at `bond` in the structure.\n    ";
+static PyMethodDef __pyx_mdef_5rmgpy_8molecule_8symmetry_3calculate_bond_symmetry_number = {"calculate_bond_symmetry_number", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5rmgpy_8molecule_8symmetry_3calculate_bond_symmetry_number, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5rmgpy_8molecule_8symmetry_2calculate_bond_symmetry_number};
+static PyObject *__pyx_pw_5rmgpy_8molecule_8symmetry_3calculate_bond_symmetry_number(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *__pyx_v_molecule = 0;
+  struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *__pyx_v_atom1 = 0;
+  struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *__pyx_v_atom2 = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("calculate_bond_symmetry_number (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_molecule,&__pyx_n_s_atom1,&__pyx_n_s_atom2,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_molecule)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_atom1)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("calculate_bond_symmetry_number", 1, 3, 3, 1); __PYX_ERR(0, 152, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_atom2)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("calculate_bond_symmetry_number", 1, 3, 3, 2); __PYX_ERR(0, 152, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "calculate_bond_symmetry_number") < 0)) __PYX_ERR(0, 152, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v_molecule = ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *)values[0]);
+    __pyx_v_atom1 = ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)values[1]);
+    __pyx_v_atom2 = ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)values[2]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("calculate_bond_symmetry_number", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 152, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("rmgpy.molecule.symmetry.calculate_bond_symmetry_number", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_molecule), __pyx_ptype_5rmgpy_8molecule_8molecule_Molecule, 1, "molecule", 0))) __PYX_ERR(0, 152, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_atom1), __pyx_ptype_5rmgpy_8molecule_8molecule_Atom, 1, "atom1", 0))) __PYX_ERR(0, 152, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_atom2), __pyx_ptype_5rmgpy_8molecule_8molecule_Atom, 1, "atom2", 0))) __PYX_ERR(0, 152, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_8symmetry_2calculate_bond_symmetry_number(__pyx_self, __pyx_v_molecule, __pyx_v_atom1, __pyx_v_atom2);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8molecule_8symmetry_2calculate_bond_symmetry_number(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *__pyx_v_molecule, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *__pyx_v_atom1, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *__pyx_v_atom2) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  float __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("calculate_bond_symmetry_number", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_5rmgpy_8molecule_8symmetry_calculate_bond_symmetry_number(__pyx_v_molecule, __pyx_v_atom1, __pyx_v_atom2, 0); if (unlikely(__pyx_t_1 == ((float)-1.0))) __PYX_ERR(0, 152, __pyx_L1_error)
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 152, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("rmgpy.molecule.symmetry.calculate_bond_symmetry_number", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/molecule/symmetry.py":224
+ * ################################################################################
+ * 
+ * def calculate_axis_symmetry_number(molecule):             # <<<<<<<<<<<<<<
+ *     r"""
+ *     Get the axis symmetry number correction. The "axis" refers to a series
+ */
+
+static PyObject *__pyx_pw_5rmgpy_8molecule_8symmetry_5calculate_axis_symmetry_number(PyObject *__pyx_self, PyObject *__pyx_v_molecule); /*proto*/
+static float __pyx_f_5rmgpy_8molecule_8symmetry_calculate_axis_symmetry_number(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *__pyx_v_molecule, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  PyObject *__pyx_v_symmetry_number = NULL;
+  PyObject *__pyx_v_double_bonds = NULL;
+  PyObject *__pyx_v_atom1 = NULL;
+  PyObject *__pyx_v_atom2 = NULL;
+  PyObject *__pyx_v_cumulated_bonds = NULL;
+  PyObject *__pyx_v_i = NULL;
+  PyObject *__pyx_v_bond1 = NULL;
+  PyObject *__pyx_v_atom11 = NULL;
+  PyObject *__pyx_v_atom12 = NULL;
+  PyObject *__pyx_v_bond2 = NULL;
+  PyObject *__pyx_v_atom21 = NULL;
+  PyObject *__pyx_v_atom22 = NULL;
+  PyObject *__pyx_v_list_to_add_to = NULL;
+  PyObject *__pyx_v_cumBonds = NULL;
+  PyObject *__pyx_v_bonds = NULL;
+  int __pyx_v_found;
+  PyObject *__pyx_v_axis = NULL;
+  PyObject *__pyx_v_bond = NULL;
+  PyObject *__pyx_v_terminal_atoms = NULL;
+  PyObject *__pyx_v_atom = NULL;
+  PyObject *__pyx_v_bond_list = NULL;
+  struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *__pyx_v_structure = NULL;
+  PyObject *__pyx_v_atoms_to_remove = NULL;
+  PyObject *__pyx_v_end_fragments = NULL;
+  int __pyx_v_symmetry_broken;
+  PyObject *__pyx_v_end_fragments_to_remove = NULL;
+  PyObject *__pyx_v_fragment = NULL;
+  PyObject *__pyx_v_terminal_atom = NULL;
+  PyObject *__pyx_v_groups = NULL;
+  PyObject *__pyx_8genexpr3__pyx_v_atom = NULL;
+  float __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  Py_ssize_t __pyx_t_5;
+  PyObject *(*__pyx_t_6)(PyObject *);
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_t_10;
+  PyObject *__pyx_t_11 = NULL;
+  int __pyx_t_12;
+  PyObject *(*__pyx_t_13)(PyObject *);
+  Py_ssize_t __pyx_t_14;
+  int __pyx_t_15;
+  struct __pyx_opt_args_5rmgpy_8molecule_5graph_5Graph_copy __pyx_t_16;
+  float __pyx_t_17;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("calculate_axis_symmetry_number", 0);
+
+  /* "rmgpy/molecule/symmetry.py":255
+ *     """
+ * 
+ *     symmetry_number = 1             # <<<<<<<<<<<<<<
+ * 
+ *     # List all double bonds in the structure
+ */
+  __Pyx_INCREF(__pyx_int_1);
+  __pyx_v_symmetry_number = __pyx_int_1;
+
+  /* "rmgpy/molecule/symmetry.py":258
+ * 
+ *     # List all double bonds in the structure
+ *     double_bonds = []             # <<<<<<<<<<<<<<
+ *     for atom1 in molecule.vertices:
+ *         for atom2 in atom1.edges:
+ */
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 258, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_double_bonds = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":259
+ *     # List all double bonds in the structure
+ *     double_bonds = []
+ *     for atom1 in molecule.vertices:             # <<<<<<<<<<<<<<
+ *         for atom2 in atom1.edges:
+ *             if (atom1.edges[atom2].is_double() or atom1.edges[atom2].order > 2) \
+ */
+  if (unlikely(__pyx_v_molecule->__pyx_base.vertices == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+    __PYX_ERR(0, 259, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_v_molecule->__pyx_base.vertices; __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
+  for (;;) {
+    if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_1)) break;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    __pyx_t_3 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 259, __pyx_L1_error)
+    #else
+    __pyx_t_3 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 259, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    #endif
+    __Pyx_XDECREF_SET(__pyx_v_atom1, __pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":260
+ *     double_bonds = []
+ *     for atom1 in molecule.vertices:
+ *         for atom2 in atom1.edges:             # <<<<<<<<<<<<<<
+ *             if (atom1.edges[atom2].is_double() or atom1.edges[atom2].order > 2) \
+ *                     and molecule.vertices.index(atom1) < molecule.vertices.index(atom2):
+ */
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_atom1, __pyx_n_s_edges); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 260, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    if (likely(PyList_CheckExact(__pyx_t_3)) || PyTuple_CheckExact(__pyx_t_3)) {
+      __pyx_t_4 = __pyx_t_3; __Pyx_INCREF(__pyx_t_4); __pyx_t_5 = 0;
+      __pyx_t_6 = NULL;
+    } else {
+      __pyx_t_5 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 260, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_6 = Py_TYPE(__pyx_t_4)->tp_iternext; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 260, __pyx_L1_error)
+    }
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    for (;;) {
+      if (likely(!__pyx_t_6)) {
+        if (likely(PyList_CheckExact(__pyx_t_4))) {
+          if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_4)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_3 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_3); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 260, __pyx_L1_error)
+          #else
+          __pyx_t_3 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 260, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          #endif
+        } else {
+          if (__pyx_t_5 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_3); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 260, __pyx_L1_error)
+          #else
+          __pyx_t_3 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 260, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          #endif
+        }
+      } else {
+        __pyx_t_3 = __pyx_t_6(__pyx_t_4);
+        if (unlikely(!__pyx_t_3)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 260, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_3);
+      }
+      __Pyx_XDECREF_SET(__pyx_v_atom2, __pyx_t_3);
+      __pyx_t_3 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":261
+ *     for atom1 in molecule.vertices:
+ *         for atom2 in atom1.edges:
+ *             if (atom1.edges[atom2].is_double() or atom1.edges[atom2].order > 2) \             # <<<<<<<<<<<<<<
+ *                     and molecule.vertices.index(atom1) < molecule.vertices.index(atom2):
+ *                 double_bonds.append((atom1, atom2))
+ */
+      __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_atom1, __pyx_n_s_edges); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 261, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_9 = __Pyx_PyObject_GetItem(__pyx_t_8, __pyx_v_atom2); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 261, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_n_s_is_double); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 261, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_9 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
+        __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_8);
+        if (likely(__pyx_t_9)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+          __Pyx_INCREF(__pyx_t_9);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_8, function);
+        }
+      }
+      __pyx_t_3 = (__pyx_t_9) ? __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_t_9) : __Pyx_PyObject_CallNoArg(__pyx_t_8);
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 261, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_10 < 0)) __PYX_ERR(0, 261, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (!__pyx_t_10) {
+      } else {
+        goto __pyx_L9_next_and;
+      }
+      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_atom1, __pyx_n_s_edges); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 261, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_8 = __Pyx_PyObject_GetItem(__pyx_t_3, __pyx_v_atom2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 261, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_order); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 261, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_8 = PyObject_RichCompare(__pyx_t_3, __pyx_int_2, Py_GT); __Pyx_XGOTREF(__pyx_t_8); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 261, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely(__pyx_t_10 < 0)) __PYX_ERR(0, 261, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      if (__pyx_t_10) {
+      } else {
+        __pyx_t_7 = __pyx_t_10;
+        goto __pyx_L8_bool_binop_done;
+      }
+      __pyx_L9_next_and:;
+
+      /* "rmgpy/molecule/symmetry.py":262
+ *         for atom2 in atom1.edges:
+ *             if (atom1.edges[atom2].is_double() or atom1.edges[atom2].order > 2) \
+ *                     and molecule.vertices.index(atom1) < molecule.vertices.index(atom2):             # <<<<<<<<<<<<<<
+ *                 double_bonds.append((atom1, atom2))
+ * 
+ */
+      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_molecule->__pyx_base.vertices, __pyx_n_s_index); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 262, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_9 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+        __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_3);
+        if (likely(__pyx_t_9)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+          __Pyx_INCREF(__pyx_t_9);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_3, function);
+        }
+      }
+      __pyx_t_8 = (__pyx_t_9) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_9, __pyx_v_atom1) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_atom1);
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 262, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_molecule->__pyx_base.vertices, __pyx_n_s_index); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 262, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_11 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+        __pyx_t_11 = PyMethod_GET_SELF(__pyx_t_9);
+        if (likely(__pyx_t_11)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+          __Pyx_INCREF(__pyx_t_11);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_9, function);
+        }
+      }
+      __pyx_t_3 = (__pyx_t_11) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_11, __pyx_v_atom2) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_v_atom2);
+      __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 262, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_9 = PyObject_RichCompare(__pyx_t_8, __pyx_t_3, Py_LT); __Pyx_XGOTREF(__pyx_t_9); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 262, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_9); if (unlikely(__pyx_t_10 < 0)) __PYX_ERR(0, 262, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_7 = __pyx_t_10;
+      __pyx_L8_bool_binop_done:;
+
+      /* "rmgpy/molecule/symmetry.py":261
+ *     for atom1 in molecule.vertices:
+ *         for atom2 in atom1.edges:
+ *             if (atom1.edges[atom2].is_double() or atom1.edges[atom2].order > 2) \             # <<<<<<<<<<<<<<
+ *                     and molecule.vertices.index(atom1) < molecule.vertices.index(atom2):
+ *                 double_bonds.append((atom1, atom2))
+ */
+      if (__pyx_t_7) {
+
+        /* "rmgpy/molecule/symmetry.py":263
+ *             if (atom1.edges[atom2].is_double() or atom1.edges[atom2].order > 2) \
+ *                     and molecule.vertices.index(atom1) < molecule.vertices.index(atom2):
+ *                 double_bonds.append((atom1, atom2))             # <<<<<<<<<<<<<<
+ * 
+ *     # Search for adjacent double bonds
+ */
+        __pyx_t_9 = PyTuple_New(2); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 263, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_INCREF(__pyx_v_atom1);
+        __Pyx_GIVEREF(__pyx_v_atom1);
+        PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_v_atom1);
+        __Pyx_INCREF(__pyx_v_atom2);
+        __Pyx_GIVEREF(__pyx_v_atom2);
+        PyTuple_SET_ITEM(__pyx_t_9, 1, __pyx_v_atom2);
+        __pyx_t_12 = __Pyx_PyList_Append(__pyx_v_double_bonds, __pyx_t_9); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(0, 263, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":261
+ *     for atom1 in molecule.vertices:
+ *         for atom2 in atom1.edges:
+ *             if (atom1.edges[atom2].is_double() or atom1.edges[atom2].order > 2) \             # <<<<<<<<<<<<<<
+ *                     and molecule.vertices.index(atom1) < molecule.vertices.index(atom2):
+ *                 double_bonds.append((atom1, atom2))
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":260
+ *     double_bonds = []
+ *     for atom1 in molecule.vertices:
+ *         for atom2 in atom1.edges:             # <<<<<<<<<<<<<<
+ *             if (atom1.edges[atom2].is_double() or atom1.edges[atom2].order > 2) \
+ *                     and molecule.vertices.index(atom1) < molecule.vertices.index(atom2):
+ */
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":259
+ *     # List all double bonds in the structure
+ *     double_bonds = []
+ *     for atom1 in molecule.vertices:             # <<<<<<<<<<<<<<
+ *         for atom2 in atom1.edges:
+ *             if (atom1.edges[atom2].is_double() or atom1.edges[atom2].order > 2) \
+ */
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":266
+ * 
+ *     # Search for adjacent double bonds
+ *     cumulated_bonds = []             # <<<<<<<<<<<<<<
+ *     for i, bond1 in enumerate(double_bonds):
+ *         atom11, atom12 = bond1
+ */
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 266, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_cumulated_bonds = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":267
+ *     # Search for adjacent double bonds
+ *     cumulated_bonds = []
+ *     for i, bond1 in enumerate(double_bonds):             # <<<<<<<<<<<<<<
+ *         atom11, atom12 = bond1
+ *         for bond2 in double_bonds[i + 1:]:
+ */
+  __Pyx_INCREF(__pyx_int_0);
+  __pyx_t_1 = __pyx_int_0;
+  __pyx_t_4 = __pyx_v_double_bonds; __Pyx_INCREF(__pyx_t_4); __pyx_t_2 = 0;
+  for (;;) {
+    if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_4)) break;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    __pyx_t_9 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_2); __Pyx_INCREF(__pyx_t_9); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 267, __pyx_L1_error)
+    #else
+    __pyx_t_9 = PySequence_ITEM(__pyx_t_4, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 267, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    #endif
+    __Pyx_XDECREF_SET(__pyx_v_bond1, __pyx_t_9);
+    __pyx_t_9 = 0;
+    __Pyx_INCREF(__pyx_t_1);
+    __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_1);
+    __pyx_t_9 = __Pyx_PyInt_AddObjC(__pyx_t_1, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 267, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_1);
+    __pyx_t_1 = __pyx_t_9;
+    __pyx_t_9 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":268
+ *     cumulated_bonds = []
+ *     for i, bond1 in enumerate(double_bonds):
+ *         atom11, atom12 = bond1             # <<<<<<<<<<<<<<
+ *         for bond2 in double_bonds[i + 1:]:
+ *             atom21, atom22 = bond2
+ */
+    if ((likely(PyTuple_CheckExact(__pyx_v_bond1))) || (PyList_CheckExact(__pyx_v_bond1))) {
+      PyObject* sequence = __pyx_v_bond1;
+      Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+      if (unlikely(size != 2)) {
+        if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+        else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+        __PYX_ERR(0, 268, __pyx_L1_error)
+      }
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      if (likely(PyTuple_CheckExact(sequence))) {
+        __pyx_t_9 = PyTuple_GET_ITEM(sequence, 0); 
+        __pyx_t_3 = PyTuple_GET_ITEM(sequence, 1); 
+      } else {
+        __pyx_t_9 = PyList_GET_ITEM(sequence, 0); 
+        __pyx_t_3 = PyList_GET_ITEM(sequence, 1); 
+      }
+      __Pyx_INCREF(__pyx_t_9);
+      __Pyx_INCREF(__pyx_t_3);
+      #else
+      __pyx_t_9 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 268, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_3 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 268, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      #endif
+    } else {
+      Py_ssize_t index = -1;
+      __pyx_t_8 = PyObject_GetIter(__pyx_v_bond1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 268, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_13 = Py_TYPE(__pyx_t_8)->tp_iternext;
+      index = 0; __pyx_t_9 = __pyx_t_13(__pyx_t_8); if (unlikely(!__pyx_t_9)) goto __pyx_L13_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_9);
+      index = 1; __pyx_t_3 = __pyx_t_13(__pyx_t_8); if (unlikely(!__pyx_t_3)) goto __pyx_L13_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_3);
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_13(__pyx_t_8), 2) < 0) __PYX_ERR(0, 268, __pyx_L1_error)
+      __pyx_t_13 = NULL;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      goto __pyx_L14_unpacking_done;
+      __pyx_L13_unpacking_failed:;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_13 = NULL;
+      if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+      __PYX_ERR(0, 268, __pyx_L1_error)
+      __pyx_L14_unpacking_done:;
+    }
+    __Pyx_XDECREF_SET(__pyx_v_atom11, __pyx_t_9);
+    __pyx_t_9 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_atom12, __pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":269
+ *     for i, bond1 in enumerate(double_bonds):
+ *         atom11, atom12 = bond1
+ *         for bond2 in double_bonds[i + 1:]:             # <<<<<<<<<<<<<<
+ *             atom21, atom22 = bond2
+ *             if atom11 is atom21 or atom11 is atom22 or atom12 is atom21 or atom12 is atom22:
+ */
+    __pyx_t_3 = __Pyx_PyInt_AddObjC(__pyx_v_i, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 269, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_7 = (__pyx_t_3 == Py_None);
+    if (__pyx_t_7) {
+      __pyx_t_5 = 0;
+    } else {
+      __pyx_t_14 = __Pyx_PyIndex_AsSsize_t(__pyx_t_3); if (unlikely((__pyx_t_14 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 269, __pyx_L1_error)
+      __pyx_t_5 = __pyx_t_14;
+    }
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = __Pyx_PyList_GetSlice(__pyx_v_double_bonds, __pyx_t_5, PY_SSIZE_T_MAX); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 269, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_9 = __pyx_t_3; __Pyx_INCREF(__pyx_t_9); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    for (;;) {
+      if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_9)) break;
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      __pyx_t_3 = PyList_GET_ITEM(__pyx_t_9, __pyx_t_5); __Pyx_INCREF(__pyx_t_3); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 269, __pyx_L1_error)
+      #else
+      __pyx_t_3 = PySequence_ITEM(__pyx_t_9, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 269, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      #endif
+      __Pyx_XDECREF_SET(__pyx_v_bond2, __pyx_t_3);
+      __pyx_t_3 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":270
+ *         atom11, atom12 = bond1
+ *         for bond2 in double_bonds[i + 1:]:
+ *             atom21, atom22 = bond2             # <<<<<<<<<<<<<<
+ *             if atom11 is atom21 or atom11 is atom22 or atom12 is atom21 or atom12 is atom22:
+ *                 list_to_add_to = None
+ */
+      if ((likely(PyTuple_CheckExact(__pyx_v_bond2))) || (PyList_CheckExact(__pyx_v_bond2))) {
+        PyObject* sequence = __pyx_v_bond2;
+        Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+        if (unlikely(size != 2)) {
+          if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+          else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+          __PYX_ERR(0, 270, __pyx_L1_error)
+        }
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        if (likely(PyTuple_CheckExact(sequence))) {
+          __pyx_t_3 = PyTuple_GET_ITEM(sequence, 0); 
+          __pyx_t_8 = PyTuple_GET_ITEM(sequence, 1); 
+        } else {
+          __pyx_t_3 = PyList_GET_ITEM(sequence, 0); 
+          __pyx_t_8 = PyList_GET_ITEM(sequence, 1); 
+        }
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_8);
+        #else
+        __pyx_t_3 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 270, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_8 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 270, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        #endif
+      } else {
+        Py_ssize_t index = -1;
+        __pyx_t_11 = PyObject_GetIter(__pyx_v_bond2); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 270, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_11);
+        __pyx_t_13 = Py_TYPE(__pyx_t_11)->tp_iternext;
+        index = 0; __pyx_t_3 = __pyx_t_13(__pyx_t_11); if (unlikely(!__pyx_t_3)) goto __pyx_L17_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_3);
+        index = 1; __pyx_t_8 = __pyx_t_13(__pyx_t_11); if (unlikely(!__pyx_t_8)) goto __pyx_L17_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_8);
+        if (__Pyx_IternextUnpackEndCheck(__pyx_t_13(__pyx_t_11), 2) < 0) __PYX_ERR(0, 270, __pyx_L1_error)
+        __pyx_t_13 = NULL;
+        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+        goto __pyx_L18_unpacking_done;
+        __pyx_L17_unpacking_failed:;
+        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+        __pyx_t_13 = NULL;
+        if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+        __PYX_ERR(0, 270, __pyx_L1_error)
+        __pyx_L18_unpacking_done:;
+      }
+      __Pyx_XDECREF_SET(__pyx_v_atom21, __pyx_t_3);
+      __pyx_t_3 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_atom22, __pyx_t_8);
+      __pyx_t_8 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":271
+ *         for bond2 in double_bonds[i + 1:]:
+ *             atom21, atom22 = bond2
+ *             if atom11 is atom21 or atom11 is atom22 or atom12 is atom21 or atom12 is atom22:             # <<<<<<<<<<<<<<
+ *                 list_to_add_to = None
+ *                 for cumBonds in cumulated_bonds:
+ */
+      __pyx_t_10 = (__pyx_v_atom11 == __pyx_v_atom21);
+      __pyx_t_15 = (__pyx_t_10 != 0);
+      if (!__pyx_t_15) {
+      } else {
+        __pyx_t_7 = __pyx_t_15;
+        goto __pyx_L20_bool_binop_done;
+      }
+      __pyx_t_15 = (__pyx_v_atom11 == __pyx_v_atom22);
+      __pyx_t_10 = (__pyx_t_15 != 0);
+      if (!__pyx_t_10) {
+      } else {
+        __pyx_t_7 = __pyx_t_10;
+        goto __pyx_L20_bool_binop_done;
+      }
+      __pyx_t_10 = (__pyx_v_atom12 == __pyx_v_atom21);
+      __pyx_t_15 = (__pyx_t_10 != 0);
+      if (!__pyx_t_15) {
+      } else {
+        __pyx_t_7 = __pyx_t_15;
+        goto __pyx_L20_bool_binop_done;
+      }
+      __pyx_t_15 = (__pyx_v_atom12 == __pyx_v_atom22);
+      __pyx_t_10 = (__pyx_t_15 != 0);
+      __pyx_t_7 = __pyx_t_10;
+      __pyx_L20_bool_binop_done:;
+      if (__pyx_t_7) {
+
+        /* "rmgpy/molecule/symmetry.py":272
+ *             atom21, atom22 = bond2
+ *             if atom11 is atom21 or atom11 is atom22 or atom12 is atom21 or atom12 is atom22:
+ *                 list_to_add_to = None             # <<<<<<<<<<<<<<
+ *                 for cumBonds in cumulated_bonds:
+ *                     if (atom11, atom12) in cumBonds or (atom21, atom22) in cumBonds:
+ */
+        __Pyx_INCREF(Py_None);
+        __Pyx_XDECREF_SET(__pyx_v_list_to_add_to, Py_None);
+
+        /* "rmgpy/molecule/symmetry.py":273
+ *             if atom11 is atom21 or atom11 is atom22 or atom12 is atom21 or atom12 is atom22:
+ *                 list_to_add_to = None
+ *                 for cumBonds in cumulated_bonds:             # <<<<<<<<<<<<<<
+ *                     if (atom11, atom12) in cumBonds or (atom21, atom22) in cumBonds:
+ *                         list_to_add_to = cumBonds
+ */
+        __pyx_t_8 = __pyx_v_cumulated_bonds; __Pyx_INCREF(__pyx_t_8); __pyx_t_14 = 0;
+        for (;;) {
+          if (__pyx_t_14 >= PyList_GET_SIZE(__pyx_t_8)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_3 = PyList_GET_ITEM(__pyx_t_8, __pyx_t_14); __Pyx_INCREF(__pyx_t_3); __pyx_t_14++; if (unlikely(0 < 0)) __PYX_ERR(0, 273, __pyx_L1_error)
+          #else
+          __pyx_t_3 = PySequence_ITEM(__pyx_t_8, __pyx_t_14); __pyx_t_14++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 273, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          #endif
+          __Pyx_XDECREF_SET(__pyx_v_cumBonds, __pyx_t_3);
+          __pyx_t_3 = 0;
+
+          /* "rmgpy/molecule/symmetry.py":274
+ *                 list_to_add_to = None
+ *                 for cumBonds in cumulated_bonds:
+ *                     if (atom11, atom12) in cumBonds or (atom21, atom22) in cumBonds:             # <<<<<<<<<<<<<<
+ *                         list_to_add_to = cumBonds
+ *                 if list_to_add_to is not None:
+ */
+          __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 274, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __Pyx_INCREF(__pyx_v_atom11);
+          __Pyx_GIVEREF(__pyx_v_atom11);
+          PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_atom11);
+          __Pyx_INCREF(__pyx_v_atom12);
+          __Pyx_GIVEREF(__pyx_v_atom12);
+          PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_atom12);
+          __pyx_t_10 = (__Pyx_PySequence_ContainsTF(__pyx_t_3, __pyx_v_cumBonds, Py_EQ)); if (unlikely(__pyx_t_10 < 0)) __PYX_ERR(0, 274, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __pyx_t_15 = (__pyx_t_10 != 0);
+          if (!__pyx_t_15) {
+          } else {
+            __pyx_t_7 = __pyx_t_15;
+            goto __pyx_L27_bool_binop_done;
+          }
+          __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 274, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __Pyx_INCREF(__pyx_v_atom21);
+          __Pyx_GIVEREF(__pyx_v_atom21);
+          PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_atom21);
+          __Pyx_INCREF(__pyx_v_atom22);
+          __Pyx_GIVEREF(__pyx_v_atom22);
+          PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_atom22);
+          __pyx_t_15 = (__Pyx_PySequence_ContainsTF(__pyx_t_3, __pyx_v_cumBonds, Py_EQ)); if (unlikely(__pyx_t_15 < 0)) __PYX_ERR(0, 274, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __pyx_t_10 = (__pyx_t_15 != 0);
+          __pyx_t_7 = __pyx_t_10;
+          __pyx_L27_bool_binop_done:;
+          if (__pyx_t_7) {
+
+            /* "rmgpy/molecule/symmetry.py":275
+ *                 for cumBonds in cumulated_bonds:
+ *                     if (atom11, atom12) in cumBonds or (atom21, atom22) in cumBonds:
+ *                         list_to_add_to = cumBonds             # <<<<<<<<<<<<<<
+ *                 if list_to_add_to is not None:
+ *                     if (atom11, atom12) not in list_to_add_to:
+ */
+            __Pyx_INCREF(__pyx_v_cumBonds);
+            __Pyx_DECREF_SET(__pyx_v_list_to_add_to, __pyx_v_cumBonds);
+
+            /* "rmgpy/molecule/symmetry.py":274
+ *                 list_to_add_to = None
+ *                 for cumBonds in cumulated_bonds:
+ *                     if (atom11, atom12) in cumBonds or (atom21, atom22) in cumBonds:             # <<<<<<<<<<<<<<
+ *                         list_to_add_to = cumBonds
+ *                 if list_to_add_to is not None:
+ */
+          }
+
+          /* "rmgpy/molecule/symmetry.py":273
+ *             if atom11 is atom21 or atom11 is atom22 or atom12 is atom21 or atom12 is atom22:
+ *                 list_to_add_to = None
+ *                 for cumBonds in cumulated_bonds:             # <<<<<<<<<<<<<<
+ *                     if (atom11, atom12) in cumBonds or (atom21, atom22) in cumBonds:
+ *                         list_to_add_to = cumBonds
+ */
+        }
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":276
+ *                     if (atom11, atom12) in cumBonds or (atom21, atom22) in cumBonds:
+ *                         list_to_add_to = cumBonds
+ *                 if list_to_add_to is not None:             # <<<<<<<<<<<<<<
+ *                     if (atom11, atom12) not in list_to_add_to:
+ *                         list_to_add_to.append((atom11, atom12))
+ */
+        __pyx_t_7 = (__pyx_v_list_to_add_to != Py_None);
+        __pyx_t_10 = (__pyx_t_7 != 0);
+        if (__pyx_t_10) {
+
+          /* "rmgpy/molecule/symmetry.py":277
+ *                         list_to_add_to = cumBonds
+ *                 if list_to_add_to is not None:
+ *                     if (atom11, atom12) not in list_to_add_to:             # <<<<<<<<<<<<<<
+ *                         list_to_add_to.append((atom11, atom12))
+ *                     if (atom21, atom22) not in list_to_add_to:
+ */
+          __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 277, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_INCREF(__pyx_v_atom11);
+          __Pyx_GIVEREF(__pyx_v_atom11);
+          PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_v_atom11);
+          __Pyx_INCREF(__pyx_v_atom12);
+          __Pyx_GIVEREF(__pyx_v_atom12);
+          PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_v_atom12);
+          __pyx_t_10 = (__Pyx_PySequence_ContainsTF(__pyx_t_8, __pyx_v_list_to_add_to, Py_NE)); if (unlikely(__pyx_t_10 < 0)) __PYX_ERR(0, 277, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+          __pyx_t_7 = (__pyx_t_10 != 0);
+          if (__pyx_t_7) {
+
+            /* "rmgpy/molecule/symmetry.py":278
+ *                 if list_to_add_to is not None:
+ *                     if (atom11, atom12) not in list_to_add_to:
+ *                         list_to_add_to.append((atom11, atom12))             # <<<<<<<<<<<<<<
+ *                     if (atom21, atom22) not in list_to_add_to:
+ *                         list_to_add_to.append((atom21, atom22))
+ */
+            __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 278, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_8);
+            __Pyx_INCREF(__pyx_v_atom11);
+            __Pyx_GIVEREF(__pyx_v_atom11);
+            PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_v_atom11);
+            __Pyx_INCREF(__pyx_v_atom12);
+            __Pyx_GIVEREF(__pyx_v_atom12);
+            PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_v_atom12);
+            __pyx_t_12 = __Pyx_PyObject_Append(__pyx_v_list_to_add_to, __pyx_t_8); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(0, 278, __pyx_L1_error)
+            __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+            /* "rmgpy/molecule/symmetry.py":277
+ *                         list_to_add_to = cumBonds
+ *                 if list_to_add_to is not None:
+ *                     if (atom11, atom12) not in list_to_add_to:             # <<<<<<<<<<<<<<
+ *                         list_to_add_to.append((atom11, atom12))
+ *                     if (atom21, atom22) not in list_to_add_to:
+ */
+          }
+
+          /* "rmgpy/molecule/symmetry.py":279
+ *                     if (atom11, atom12) not in list_to_add_to:
+ *                         list_to_add_to.append((atom11, atom12))
+ *                     if (atom21, atom22) not in list_to_add_to:             # <<<<<<<<<<<<<<
+ *                         list_to_add_to.append((atom21, atom22))
+ *                 else:
+ */
+          __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 279, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_INCREF(__pyx_v_atom21);
+          __Pyx_GIVEREF(__pyx_v_atom21);
+          PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_v_atom21);
+          __Pyx_INCREF(__pyx_v_atom22);
+          __Pyx_GIVEREF(__pyx_v_atom22);
+          PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_v_atom22);
+          __pyx_t_7 = (__Pyx_PySequence_ContainsTF(__pyx_t_8, __pyx_v_list_to_add_to, Py_NE)); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 279, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+          __pyx_t_10 = (__pyx_t_7 != 0);
+          if (__pyx_t_10) {
+
+            /* "rmgpy/molecule/symmetry.py":280
+ *                         list_to_add_to.append((atom11, atom12))
+ *                     if (atom21, atom22) not in list_to_add_to:
+ *                         list_to_add_to.append((atom21, atom22))             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     cumulated_bonds.append([(atom11, atom12), (atom21, atom22)])
+ */
+            __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 280, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_8);
+            __Pyx_INCREF(__pyx_v_atom21);
+            __Pyx_GIVEREF(__pyx_v_atom21);
+            PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_v_atom21);
+            __Pyx_INCREF(__pyx_v_atom22);
+            __Pyx_GIVEREF(__pyx_v_atom22);
+            PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_v_atom22);
+            __pyx_t_12 = __Pyx_PyObject_Append(__pyx_v_list_to_add_to, __pyx_t_8); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(0, 280, __pyx_L1_error)
+            __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+            /* "rmgpy/molecule/symmetry.py":279
+ *                     if (atom11, atom12) not in list_to_add_to:
+ *                         list_to_add_to.append((atom11, atom12))
+ *                     if (atom21, atom22) not in list_to_add_to:             # <<<<<<<<<<<<<<
+ *                         list_to_add_to.append((atom21, atom22))
+ *                 else:
+ */
+          }
+
+          /* "rmgpy/molecule/symmetry.py":276
+ *                     if (atom11, atom12) in cumBonds or (atom21, atom22) in cumBonds:
+ *                         list_to_add_to = cumBonds
+ *                 if list_to_add_to is not None:             # <<<<<<<<<<<<<<
+ *                     if (atom11, atom12) not in list_to_add_to:
+ *                         list_to_add_to.append((atom11, atom12))
+ */
+          goto __pyx_L29;
+        }
+
+        /* "rmgpy/molecule/symmetry.py":282
+ *                         list_to_add_to.append((atom21, atom22))
+ *                 else:
+ *                     cumulated_bonds.append([(atom11, atom12), (atom21, atom22)])             # <<<<<<<<<<<<<<
+ * 
+ *     # Also keep isolated double bonds
+ */
+        /*else*/ {
+          __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 282, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_INCREF(__pyx_v_atom11);
+          __Pyx_GIVEREF(__pyx_v_atom11);
+          PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_v_atom11);
+          __Pyx_INCREF(__pyx_v_atom12);
+          __Pyx_GIVEREF(__pyx_v_atom12);
+          PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_v_atom12);
+          __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 282, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __Pyx_INCREF(__pyx_v_atom21);
+          __Pyx_GIVEREF(__pyx_v_atom21);
+          PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_atom21);
+          __Pyx_INCREF(__pyx_v_atom22);
+          __Pyx_GIVEREF(__pyx_v_atom22);
+          PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_atom22);
+          __pyx_t_11 = PyList_New(2); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 282, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_11);
+          __Pyx_GIVEREF(__pyx_t_8);
+          PyList_SET_ITEM(__pyx_t_11, 0, __pyx_t_8);
+          __Pyx_GIVEREF(__pyx_t_3);
+          PyList_SET_ITEM(__pyx_t_11, 1, __pyx_t_3);
+          __pyx_t_8 = 0;
+          __pyx_t_3 = 0;
+          __pyx_t_12 = __Pyx_PyList_Append(__pyx_v_cumulated_bonds, __pyx_t_11); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(0, 282, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+        }
+        __pyx_L29:;
+
+        /* "rmgpy/molecule/symmetry.py":271
+ *         for bond2 in double_bonds[i + 1:]:
+ *             atom21, atom22 = bond2
+ *             if atom11 is atom21 or atom11 is atom22 or atom12 is atom21 or atom12 is atom22:             # <<<<<<<<<<<<<<
+ *                 list_to_add_to = None
+ *                 for cumBonds in cumulated_bonds:
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":269
+ *     for i, bond1 in enumerate(double_bonds):
+ *         atom11, atom12 = bond1
+ *         for bond2 in double_bonds[i + 1:]:             # <<<<<<<<<<<<<<
+ *             atom21, atom22 = bond2
+ *             if atom11 is atom21 or atom11 is atom22 or atom12 is atom21 or atom12 is atom22:
+ */
+    }
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":267
+ *     # Search for adjacent double bonds
+ *     cumulated_bonds = []
+ *     for i, bond1 in enumerate(double_bonds):             # <<<<<<<<<<<<<<
+ *         atom11, atom12 = bond1
+ *         for bond2 in double_bonds[i + 1:]:
+ */
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":285
+ * 
+ *     # Also keep isolated double bonds
+ *     for bond1 in double_bonds:             # <<<<<<<<<<<<<<
+ *         for bonds in cumulated_bonds:
+ *             if bond1 in bonds:
+ */
+  __pyx_t_1 = __pyx_v_double_bonds; __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
+  for (;;) {
+    if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_1)) break;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 285, __pyx_L1_error)
+    #else
+    __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 285, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    #endif
+    __Pyx_XDECREF_SET(__pyx_v_bond1, __pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":286
+ *     # Also keep isolated double bonds
+ *     for bond1 in double_bonds:
+ *         for bonds in cumulated_bonds:             # <<<<<<<<<<<<<<
+ *             if bond1 in bonds:
+ *                 break
+ */
+    __pyx_t_4 = __pyx_v_cumulated_bonds; __Pyx_INCREF(__pyx_t_4); __pyx_t_5 = 0;
+    for (;;) {
+      if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_4)) break;
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      __pyx_t_9 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_9); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 286, __pyx_L1_error)
+      #else
+      __pyx_t_9 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 286, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      #endif
+      __Pyx_XDECREF_SET(__pyx_v_bonds, __pyx_t_9);
+      __pyx_t_9 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":287
+ *     for bond1 in double_bonds:
+ *         for bonds in cumulated_bonds:
+ *             if bond1 in bonds:             # <<<<<<<<<<<<<<
+ *                 break
+ *         else:
+ */
+      __pyx_t_10 = (__Pyx_PySequence_ContainsTF(__pyx_v_bond1, __pyx_v_bonds, Py_EQ)); if (unlikely(__pyx_t_10 < 0)) __PYX_ERR(0, 287, __pyx_L1_error)
+      __pyx_t_7 = (__pyx_t_10 != 0);
+      if (__pyx_t_7) {
+
+        /* "rmgpy/molecule/symmetry.py":288
+ *         for bonds in cumulated_bonds:
+ *             if bond1 in bonds:
+ *                 break             # <<<<<<<<<<<<<<
+ *         else:
+ *             cumulated_bonds.append([bond1])
+ */
+        goto __pyx_L35_break;
+
+        /* "rmgpy/molecule/symmetry.py":287
+ *     for bond1 in double_bonds:
+ *         for bonds in cumulated_bonds:
+ *             if bond1 in bonds:             # <<<<<<<<<<<<<<
+ *                 break
+ *         else:
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":286
+ *     # Also keep isolated double bonds
+ *     for bond1 in double_bonds:
+ *         for bonds in cumulated_bonds:             # <<<<<<<<<<<<<<
+ *             if bond1 in bonds:
+ *                 break
+ */
+    }
+    /*else*/ {
+
+      /* "rmgpy/molecule/symmetry.py":290
+ *                 break
+ *         else:
+ *             cumulated_bonds.append([bond1])             # <<<<<<<<<<<<<<
+ * 
+ *     # For each set of adjacent double bonds, check for axis symmetry
+ */
+      __pyx_t_9 = PyList_New(1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 290, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_INCREF(__pyx_v_bond1);
+      __Pyx_GIVEREF(__pyx_v_bond1);
+      PyList_SET_ITEM(__pyx_t_9, 0, __pyx_v_bond1);
+      __pyx_t_12 = __Pyx_PyList_Append(__pyx_v_cumulated_bonds, __pyx_t_9); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(0, 290, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    }
+
+    /* "rmgpy/molecule/symmetry.py":286
+ *     # Also keep isolated double bonds
+ *     for bond1 in double_bonds:
+ *         for bonds in cumulated_bonds:             # <<<<<<<<<<<<<<
+ *             if bond1 in bonds:
+ *                 break
+ */
+    __pyx_L35_break:;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":285
+ * 
+ *     # Also keep isolated double bonds
+ *     for bond1 in double_bonds:             # <<<<<<<<<<<<<<
+ *         for bonds in cumulated_bonds:
+ *             if bond1 in bonds:
+ */
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":293
+ * 
+ *     # For each set of adjacent double bonds, check for axis symmetry
+ *     for bonds in cumulated_bonds:             # <<<<<<<<<<<<<<
+ *         # Do nothing if axis is in cycle
+ *         found = False
+ */
+  __pyx_t_1 = __pyx_v_cumulated_bonds; __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
+  for (;;) {
+    if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_1)) break;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 293, __pyx_L1_error)
+    #else
+    __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 293, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    #endif
+    __Pyx_XDECREF_SET(__pyx_v_bonds, __pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":295
+ *     for bonds in cumulated_bonds:
+ *         # Do nothing if axis is in cycle
+ *         found = False             # <<<<<<<<<<<<<<
+ *         for atom1, atom2 in bonds:
+ *             if molecule.is_bond_in_cycle(atom1.edges[atom2]):
+ */
+    __pyx_v_found = 0;
+
+    /* "rmgpy/molecule/symmetry.py":296
+ *         # Do nothing if axis is in cycle
+ *         found = False
+ *         for atom1, atom2 in bonds:             # <<<<<<<<<<<<<<
+ *             if molecule.is_bond_in_cycle(atom1.edges[atom2]):
+ *                 found = True
+ */
+    if (likely(PyList_CheckExact(__pyx_v_bonds)) || PyTuple_CheckExact(__pyx_v_bonds)) {
+      __pyx_t_4 = __pyx_v_bonds; __Pyx_INCREF(__pyx_t_4); __pyx_t_5 = 0;
+      __pyx_t_6 = NULL;
+    } else {
+      __pyx_t_5 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_bonds); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 296, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_6 = Py_TYPE(__pyx_t_4)->tp_iternext; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 296, __pyx_L1_error)
+    }
+    for (;;) {
+      if (likely(!__pyx_t_6)) {
+        if (likely(PyList_CheckExact(__pyx_t_4))) {
+          if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_4)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_9 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_9); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 296, __pyx_L1_error)
+          #else
+          __pyx_t_9 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 296, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          #endif
+        } else {
+          if (__pyx_t_5 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_9 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_9); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 296, __pyx_L1_error)
+          #else
+          __pyx_t_9 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 296, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          #endif
+        }
+      } else {
+        __pyx_t_9 = __pyx_t_6(__pyx_t_4);
+        if (unlikely(!__pyx_t_9)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 296, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_9);
+      }
+      if ((likely(PyTuple_CheckExact(__pyx_t_9))) || (PyList_CheckExact(__pyx_t_9))) {
+        PyObject* sequence = __pyx_t_9;
+        Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+        if (unlikely(size != 2)) {
+          if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+          else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+          __PYX_ERR(0, 296, __pyx_L1_error)
+        }
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        if (likely(PyTuple_CheckExact(sequence))) {
+          __pyx_t_11 = PyTuple_GET_ITEM(sequence, 0); 
+          __pyx_t_3 = PyTuple_GET_ITEM(sequence, 1); 
+        } else {
+          __pyx_t_11 = PyList_GET_ITEM(sequence, 0); 
+          __pyx_t_3 = PyList_GET_ITEM(sequence, 1); 
+        }
+        __Pyx_INCREF(__pyx_t_11);
+        __Pyx_INCREF(__pyx_t_3);
+        #else
+        __pyx_t_11 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 296, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_11);
+        __pyx_t_3 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 296, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        #endif
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      } else {
+        Py_ssize_t index = -1;
+        __pyx_t_8 = PyObject_GetIter(__pyx_t_9); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 296, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_t_13 = Py_TYPE(__pyx_t_8)->tp_iternext;
+        index = 0; __pyx_t_11 = __pyx_t_13(__pyx_t_8); if (unlikely(!__pyx_t_11)) goto __pyx_L43_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_11);
+        index = 1; __pyx_t_3 = __pyx_t_13(__pyx_t_8); if (unlikely(!__pyx_t_3)) goto __pyx_L43_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_3);
+        if (__Pyx_IternextUnpackEndCheck(__pyx_t_13(__pyx_t_8), 2) < 0) __PYX_ERR(0, 296, __pyx_L1_error)
+        __pyx_t_13 = NULL;
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        goto __pyx_L44_unpacking_done;
+        __pyx_L43_unpacking_failed:;
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __pyx_t_13 = NULL;
+        if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+        __PYX_ERR(0, 296, __pyx_L1_error)
+        __pyx_L44_unpacking_done:;
+      }
+      __Pyx_XDECREF_SET(__pyx_v_atom1, __pyx_t_11);
+      __pyx_t_11 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_atom2, __pyx_t_3);
+      __pyx_t_3 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":297
+ *         found = False
+ *         for atom1, atom2 in bonds:
+ *             if molecule.is_bond_in_cycle(atom1.edges[atom2]):             # <<<<<<<<<<<<<<
+ *                 found = True
+ *         if found:
+ */
+      __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_atom1, __pyx_n_s_edges); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 297, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_3 = __Pyx_PyObject_GetItem(__pyx_t_9, __pyx_v_atom2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 297, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5rmgpy_8molecule_8molecule_Bond))))) __PYX_ERR(0, 297, __pyx_L1_error)
+      __pyx_t_7 = ((struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Molecule *)__pyx_v_molecule->__pyx_base.__pyx_vtab)->is_bond_in_cycle(__pyx_v_molecule, ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *)__pyx_t_3), 0); if (unlikely(__pyx_t_7 == ((int)-2))) __PYX_ERR(0, 297, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_10 = (__pyx_t_7 != 0);
+      if (__pyx_t_10) {
+
+        /* "rmgpy/molecule/symmetry.py":298
+ *         for atom1, atom2 in bonds:
+ *             if molecule.is_bond_in_cycle(atom1.edges[atom2]):
+ *                 found = True             # <<<<<<<<<<<<<<
+ *         if found:
+ *             continue
+ */
+        __pyx_v_found = 1;
+
+        /* "rmgpy/molecule/symmetry.py":297
+ *         found = False
+ *         for atom1, atom2 in bonds:
+ *             if molecule.is_bond_in_cycle(atom1.edges[atom2]):             # <<<<<<<<<<<<<<
+ *                 found = True
+ *         if found:
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":296
+ *         # Do nothing if axis is in cycle
+ *         found = False
+ *         for atom1, atom2 in bonds:             # <<<<<<<<<<<<<<
+ *             if molecule.is_bond_in_cycle(atom1.edges[atom2]):
+ *                 found = True
+ */
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":299
+ *             if molecule.is_bond_in_cycle(atom1.edges[atom2]):
+ *                 found = True
+ *         if found:             # <<<<<<<<<<<<<<
+ *             continue
+ * 
+ */
+    __pyx_t_10 = (__pyx_v_found != 0);
+    if (__pyx_t_10) {
+
+      /* "rmgpy/molecule/symmetry.py":300
+ *                 found = True
+ *         if found:
+ *             continue             # <<<<<<<<<<<<<<
+ * 
+ *         # Find terminal atoms in axis
+ */
+      goto __pyx_L39_continue;
+
+      /* "rmgpy/molecule/symmetry.py":299
+ *             if molecule.is_bond_in_cycle(atom1.edges[atom2]):
+ *                 found = True
+ *         if found:             # <<<<<<<<<<<<<<
+ *             continue
+ * 
+ */
+    }
+
+    /* "rmgpy/molecule/symmetry.py":304
+ *         # Find terminal atoms in axis
+ *         # Terminal atoms labelled T:  T=C=C=C=T
+ *         axis = []             # <<<<<<<<<<<<<<
+ *         for bond in bonds:
+ *             axis.extend(bond)
+ */
+    __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 304, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_XDECREF_SET(__pyx_v_axis, ((PyObject*)__pyx_t_4));
+    __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":305
+ *         # Terminal atoms labelled T:  T=C=C=C=T
+ *         axis = []
+ *         for bond in bonds:             # <<<<<<<<<<<<<<
+ *             axis.extend(bond)
+ *         terminal_atoms = []
+ */
+    if (likely(PyList_CheckExact(__pyx_v_bonds)) || PyTuple_CheckExact(__pyx_v_bonds)) {
+      __pyx_t_4 = __pyx_v_bonds; __Pyx_INCREF(__pyx_t_4); __pyx_t_5 = 0;
+      __pyx_t_6 = NULL;
+    } else {
+      __pyx_t_5 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_bonds); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 305, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_6 = Py_TYPE(__pyx_t_4)->tp_iternext; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 305, __pyx_L1_error)
+    }
+    for (;;) {
+      if (likely(!__pyx_t_6)) {
+        if (likely(PyList_CheckExact(__pyx_t_4))) {
+          if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_4)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_3 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_3); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 305, __pyx_L1_error)
+          #else
+          __pyx_t_3 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 305, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          #endif
+        } else {
+          if (__pyx_t_5 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_3); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 305, __pyx_L1_error)
+          #else
+          __pyx_t_3 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 305, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          #endif
+        }
+      } else {
+        __pyx_t_3 = __pyx_t_6(__pyx_t_4);
+        if (unlikely(!__pyx_t_3)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 305, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_3);
+      }
+      __Pyx_XDECREF_SET(__pyx_v_bond, __pyx_t_3);
+      __pyx_t_3 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":306
+ *         axis = []
+ *         for bond in bonds:
+ *             axis.extend(bond)             # <<<<<<<<<<<<<<
+ *         terminal_atoms = []
+ *         for atom in axis:
+ */
+      __pyx_t_12 = __Pyx_PyList_Extend(__pyx_v_axis, __pyx_v_bond); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(0, 306, __pyx_L1_error)
+
+      /* "rmgpy/molecule/symmetry.py":305
+ *         # Terminal atoms labelled T:  T=C=C=C=T
+ *         axis = []
+ *         for bond in bonds:             # <<<<<<<<<<<<<<
+ *             axis.extend(bond)
+ *         terminal_atoms = []
+ */
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":307
+ *         for bond in bonds:
+ *             axis.extend(bond)
+ *         terminal_atoms = []             # <<<<<<<<<<<<<<
+ *         for atom in axis:
+ *             if axis.count(atom) == 1:
+ */
+    __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 307, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_XDECREF_SET(__pyx_v_terminal_atoms, ((PyObject*)__pyx_t_4));
+    __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":308
+ *             axis.extend(bond)
+ *         terminal_atoms = []
+ *         for atom in axis:             # <<<<<<<<<<<<<<
+ *             if axis.count(atom) == 1:
+ *                 terminal_atoms.append(atom)
+ */
+    __pyx_t_4 = __pyx_v_axis; __Pyx_INCREF(__pyx_t_4); __pyx_t_5 = 0;
+    for (;;) {
+      if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_4)) break;
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      __pyx_t_3 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_3); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 308, __pyx_L1_error)
+      #else
+      __pyx_t_3 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 308, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      #endif
+      __Pyx_XDECREF_SET(__pyx_v_atom, __pyx_t_3);
+      __pyx_t_3 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":309
+ *         terminal_atoms = []
+ *         for atom in axis:
+ *             if axis.count(atom) == 1:             # <<<<<<<<<<<<<<
+ *                 terminal_atoms.append(atom)
+ *         if len(terminal_atoms) != 2:
+ */
+      __pyx_t_3 = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyList_Type_count, __pyx_v_axis, __pyx_v_atom); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 309, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_9 = __Pyx_PyInt_EqObjC(__pyx_t_3, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 309, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_9); if (unlikely(__pyx_t_10 < 0)) __PYX_ERR(0, 309, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      if (__pyx_t_10) {
+
+        /* "rmgpy/molecule/symmetry.py":310
+ *         for atom in axis:
+ *             if axis.count(atom) == 1:
+ *                 terminal_atoms.append(atom)             # <<<<<<<<<<<<<<
+ *         if len(terminal_atoms) != 2:
+ *             continue
+ */
+        __pyx_t_12 = __Pyx_PyList_Append(__pyx_v_terminal_atoms, __pyx_v_atom); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(0, 310, __pyx_L1_error)
+
+        /* "rmgpy/molecule/symmetry.py":309
+ *         terminal_atoms = []
+ *         for atom in axis:
+ *             if axis.count(atom) == 1:             # <<<<<<<<<<<<<<
+ *                 terminal_atoms.append(atom)
+ *         if len(terminal_atoms) != 2:
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":308
+ *             axis.extend(bond)
+ *         terminal_atoms = []
+ *         for atom in axis:             # <<<<<<<<<<<<<<
+ *             if axis.count(atom) == 1:
+ *                 terminal_atoms.append(atom)
+ */
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":311
+ *             if axis.count(atom) == 1:
+ *                 terminal_atoms.append(atom)
+ *         if len(terminal_atoms) != 2:             # <<<<<<<<<<<<<<
+ *             continue
+ * 
+ */
+    __pyx_t_5 = PyList_GET_SIZE(__pyx_v_terminal_atoms); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(0, 311, __pyx_L1_error)
+    __pyx_t_10 = ((__pyx_t_5 != 2) != 0);
+    if (__pyx_t_10) {
+
+      /* "rmgpy/molecule/symmetry.py":312
+ *                 terminal_atoms.append(atom)
+ *         if len(terminal_atoms) != 2:
+ *             continue             # <<<<<<<<<<<<<<
+ * 
+ *         # Remove axis from (copy of) structure
+ */
+      goto __pyx_L39_continue;
+
+      /* "rmgpy/molecule/symmetry.py":311
+ *             if axis.count(atom) == 1:
+ *                 terminal_atoms.append(atom)
+ *         if len(terminal_atoms) != 2:             # <<<<<<<<<<<<<<
+ *             continue
+ * 
+ */
+    }
+
+    /* "rmgpy/molecule/symmetry.py":315
+ * 
+ *         # Remove axis from (copy of) structure
+ *         bond_list = []             # <<<<<<<<<<<<<<
+ *         for atom1, atom2 in bonds:
+ *             bond = atom1.edges[atom2]
+ */
+    __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 315, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_XDECREF_SET(__pyx_v_bond_list, ((PyObject*)__pyx_t_4));
+    __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":316
+ *         # Remove axis from (copy of) structure
+ *         bond_list = []
+ *         for atom1, atom2 in bonds:             # <<<<<<<<<<<<<<
+ *             bond = atom1.edges[atom2]
+ *             bond_list.append(bond)
+ */
+    if (likely(PyList_CheckExact(__pyx_v_bonds)) || PyTuple_CheckExact(__pyx_v_bonds)) {
+      __pyx_t_4 = __pyx_v_bonds; __Pyx_INCREF(__pyx_t_4); __pyx_t_5 = 0;
+      __pyx_t_6 = NULL;
+    } else {
+      __pyx_t_5 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_bonds); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 316, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_6 = Py_TYPE(__pyx_t_4)->tp_iternext; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 316, __pyx_L1_error)
+    }
+    for (;;) {
+      if (likely(!__pyx_t_6)) {
+        if (likely(PyList_CheckExact(__pyx_t_4))) {
+          if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_4)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_9 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_9); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 316, __pyx_L1_error)
+          #else
+          __pyx_t_9 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 316, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          #endif
+        } else {
+          if (__pyx_t_5 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_9 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_9); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 316, __pyx_L1_error)
+          #else
+          __pyx_t_9 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 316, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          #endif
+        }
+      } else {
+        __pyx_t_9 = __pyx_t_6(__pyx_t_4);
+        if (unlikely(!__pyx_t_9)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 316, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_9);
+      }
+      if ((likely(PyTuple_CheckExact(__pyx_t_9))) || (PyList_CheckExact(__pyx_t_9))) {
+        PyObject* sequence = __pyx_t_9;
+        Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+        if (unlikely(size != 2)) {
+          if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+          else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+          __PYX_ERR(0, 316, __pyx_L1_error)
+        }
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        if (likely(PyTuple_CheckExact(sequence))) {
+          __pyx_t_3 = PyTuple_GET_ITEM(sequence, 0); 
+          __pyx_t_11 = PyTuple_GET_ITEM(sequence, 1); 
+        } else {
+          __pyx_t_3 = PyList_GET_ITEM(sequence, 0); 
+          __pyx_t_11 = PyList_GET_ITEM(sequence, 1); 
+        }
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_11);
+        #else
+        __pyx_t_3 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 316, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_11 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 316, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_11);
+        #endif
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      } else {
+        Py_ssize_t index = -1;
+        __pyx_t_8 = PyObject_GetIter(__pyx_t_9); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 316, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_t_13 = Py_TYPE(__pyx_t_8)->tp_iternext;
+        index = 0; __pyx_t_3 = __pyx_t_13(__pyx_t_8); if (unlikely(!__pyx_t_3)) goto __pyx_L55_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_3);
+        index = 1; __pyx_t_11 = __pyx_t_13(__pyx_t_8); if (unlikely(!__pyx_t_11)) goto __pyx_L55_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_11);
+        if (__Pyx_IternextUnpackEndCheck(__pyx_t_13(__pyx_t_8), 2) < 0) __PYX_ERR(0, 316, __pyx_L1_error)
+        __pyx_t_13 = NULL;
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        goto __pyx_L56_unpacking_done;
+        __pyx_L55_unpacking_failed:;
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __pyx_t_13 = NULL;
+        if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+        __PYX_ERR(0, 316, __pyx_L1_error)
+        __pyx_L56_unpacking_done:;
+      }
+      __Pyx_XDECREF_SET(__pyx_v_atom1, __pyx_t_3);
+      __pyx_t_3 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_atom2, __pyx_t_11);
+      __pyx_t_11 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":317
+ *         bond_list = []
+ *         for atom1, atom2 in bonds:
+ *             bond = atom1.edges[atom2]             # <<<<<<<<<<<<<<
+ *             bond_list.append(bond)
+ *             molecule.remove_bond(bond)
+ */
+      __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_atom1, __pyx_n_s_edges); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 317, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_11 = __Pyx_PyObject_GetItem(__pyx_t_9, __pyx_v_atom2); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 317, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_bond, __pyx_t_11);
+      __pyx_t_11 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":318
+ *         for atom1, atom2 in bonds:
+ *             bond = atom1.edges[atom2]
+ *             bond_list.append(bond)             # <<<<<<<<<<<<<<
+ *             molecule.remove_bond(bond)
+ *         structure = molecule.copy(True)
+ */
+      __pyx_t_12 = __Pyx_PyList_Append(__pyx_v_bond_list, __pyx_v_bond); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(0, 318, __pyx_L1_error)
+
+      /* "rmgpy/molecule/symmetry.py":319
+ *             bond = atom1.edges[atom2]
+ *             bond_list.append(bond)
+ *             molecule.remove_bond(bond)             # <<<<<<<<<<<<<<
+ *         structure = molecule.copy(True)
+ *         terminal_atoms = [structure.vertices[molecule.vertices.index(atom)] for atom in terminal_atoms]
+ */
+      if (!(likely(((__pyx_v_bond) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_bond, __pyx_ptype_5rmgpy_8molecule_8molecule_Bond))))) __PYX_ERR(0, 319, __pyx_L1_error)
+      __pyx_t_11 = ((struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Molecule *)__pyx_v_molecule->__pyx_base.__pyx_vtab)->remove_bond(__pyx_v_molecule, ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *)__pyx_v_bond), 0); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 319, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":316
+ *         # Remove axis from (copy of) structure
+ *         bond_list = []
+ *         for atom1, atom2 in bonds:             # <<<<<<<<<<<<<<
+ *             bond = atom1.edges[atom2]
+ *             bond_list.append(bond)
+ */
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":320
+ *             bond_list.append(bond)
+ *             molecule.remove_bond(bond)
+ *         structure = molecule.copy(True)             # <<<<<<<<<<<<<<
+ *         terminal_atoms = [structure.vertices[molecule.vertices.index(atom)] for atom in terminal_atoms]
+ *         for bond in bond_list:
+ */
+    __pyx_t_16.__pyx_n = 1;
+    __pyx_t_16.deep = 1;
+    __pyx_t_4 = ((PyObject *)((struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Molecule *)__pyx_v_molecule->__pyx_base.__pyx_vtab)->__pyx_base.copy(((struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *)__pyx_v_molecule), 0, &__pyx_t_16)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 320, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_XDECREF_SET(__pyx_v_structure, ((struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *)__pyx_t_4));
+    __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":321
+ *             molecule.remove_bond(bond)
+ *         structure = molecule.copy(True)
+ *         terminal_atoms = [structure.vertices[molecule.vertices.index(atom)] for atom in terminal_atoms]             # <<<<<<<<<<<<<<
+ *         for bond in bond_list:
+ *             molecule.add_bond(bond)
+ */
+    { /* enter inner scope */
+      __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 321, __pyx_L59_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_11 = __pyx_v_terminal_atoms; __Pyx_INCREF(__pyx_t_11); __pyx_t_5 = 0;
+      for (;;) {
+        if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_11)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_9 = PyList_GET_ITEM(__pyx_t_11, __pyx_t_5); __Pyx_INCREF(__pyx_t_9); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 321, __pyx_L59_error)
+        #else
+        __pyx_t_9 = PySequence_ITEM(__pyx_t_11, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 321, __pyx_L59_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        #endif
+        __Pyx_XDECREF_SET(__pyx_8genexpr3__pyx_v_atom, __pyx_t_9);
+        __pyx_t_9 = 0;
+        if (unlikely(__pyx_v_structure->vertices == Py_None)) {
+          PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+          __PYX_ERR(0, 321, __pyx_L59_error)
+        }
+        __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_molecule->__pyx_base.vertices, __pyx_n_s_index); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 321, __pyx_L59_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_8 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_8)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_8);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_9 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_8, __pyx_8genexpr3__pyx_v_atom) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_8genexpr3__pyx_v_atom);
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 321, __pyx_L59_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_t_3 = __Pyx_PyObject_GetItem(__pyx_v_structure->vertices, __pyx_t_9); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 321, __pyx_L59_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        if (unlikely(__Pyx_ListComp_Append(__pyx_t_4, (PyObject*)__pyx_t_3))) __PYX_ERR(0, 321, __pyx_L59_error)
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      }
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __Pyx_XDECREF(__pyx_8genexpr3__pyx_v_atom); __pyx_8genexpr3__pyx_v_atom = 0;
+      goto __pyx_L62_exit_scope;
+      __pyx_L59_error:;
+      __Pyx_XDECREF(__pyx_8genexpr3__pyx_v_atom); __pyx_8genexpr3__pyx_v_atom = 0;
+      goto __pyx_L1_error;
+      __pyx_L62_exit_scope:;
+    } /* exit inner scope */
+    __Pyx_DECREF_SET(__pyx_v_terminal_atoms, ((PyObject*)__pyx_t_4));
+    __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":322
+ *         structure = molecule.copy(True)
+ *         terminal_atoms = [structure.vertices[molecule.vertices.index(atom)] for atom in terminal_atoms]
+ *         for bond in bond_list:             # <<<<<<<<<<<<<<
+ *             molecule.add_bond(bond)
+ * 
+ */
+    __pyx_t_4 = __pyx_v_bond_list; __Pyx_INCREF(__pyx_t_4); __pyx_t_5 = 0;
+    for (;;) {
+      if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_4)) break;
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      __pyx_t_11 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_11); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 322, __pyx_L1_error)
+      #else
+      __pyx_t_11 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 322, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      #endif
+      __Pyx_XDECREF_SET(__pyx_v_bond, __pyx_t_11);
+      __pyx_t_11 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":323
+ *         terminal_atoms = [structure.vertices[molecule.vertices.index(atom)] for atom in terminal_atoms]
+ *         for bond in bond_list:
+ *             molecule.add_bond(bond)             # <<<<<<<<<<<<<<
+ * 
+ *         atoms_to_remove = []
+ */
+      if (!(likely(((__pyx_v_bond) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_bond, __pyx_ptype_5rmgpy_8molecule_8molecule_Bond))))) __PYX_ERR(0, 323, __pyx_L1_error)
+      __pyx_t_11 = ((struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Molecule *)__pyx_v_molecule->__pyx_base.__pyx_vtab)->add_bond(__pyx_v_molecule, ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *)__pyx_v_bond), 0); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 323, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":322
+ *         structure = molecule.copy(True)
+ *         terminal_atoms = [structure.vertices[molecule.vertices.index(atom)] for atom in terminal_atoms]
+ *         for bond in bond_list:             # <<<<<<<<<<<<<<
+ *             molecule.add_bond(bond)
+ * 
+ */
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":325
+ *             molecule.add_bond(bond)
+ * 
+ *         atoms_to_remove = []             # <<<<<<<<<<<<<<
+ *         for atom in structure.vertices:
+ *             if len(atom.edges) == 0 and atom not in terminal_atoms:  # it's not bonded to anything
+ */
+    __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 325, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_XDECREF_SET(__pyx_v_atoms_to_remove, ((PyObject*)__pyx_t_4));
+    __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":326
+ * 
+ *         atoms_to_remove = []
+ *         for atom in structure.vertices:             # <<<<<<<<<<<<<<
+ *             if len(atom.edges) == 0 and atom not in terminal_atoms:  # it's not bonded to anything
+ *                 atoms_to_remove.append(atom)
+ */
+    if (unlikely(__pyx_v_structure->vertices == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+      __PYX_ERR(0, 326, __pyx_L1_error)
+    }
+    __pyx_t_4 = __pyx_v_structure->vertices; __Pyx_INCREF(__pyx_t_4); __pyx_t_5 = 0;
+    for (;;) {
+      if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_4)) break;
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      __pyx_t_11 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_11); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 326, __pyx_L1_error)
+      #else
+      __pyx_t_11 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 326, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      #endif
+      __Pyx_XDECREF_SET(__pyx_v_atom, __pyx_t_11);
+      __pyx_t_11 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":327
+ *         atoms_to_remove = []
+ *         for atom in structure.vertices:
+ *             if len(atom.edges) == 0 and atom not in terminal_atoms:  # it's not bonded to anything             # <<<<<<<<<<<<<<
+ *                 atoms_to_remove.append(atom)
+ *         for atom in atoms_to_remove:
+ */
+      __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_v_atom, __pyx_n_s_edges); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 327, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __pyx_t_14 = PyObject_Length(__pyx_t_11); if (unlikely(__pyx_t_14 == ((Py_ssize_t)-1))) __PYX_ERR(0, 327, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __pyx_t_7 = ((__pyx_t_14 == 0) != 0);
+      if (__pyx_t_7) {
+      } else {
+        __pyx_t_10 = __pyx_t_7;
+        goto __pyx_L68_bool_binop_done;
+      }
+      __pyx_t_7 = (__Pyx_PySequence_ContainsTF(__pyx_v_atom, __pyx_v_terminal_atoms, Py_NE)); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 327, __pyx_L1_error)
+      __pyx_t_15 = (__pyx_t_7 != 0);
+      __pyx_t_10 = __pyx_t_15;
+      __pyx_L68_bool_binop_done:;
+      if (__pyx_t_10) {
+
+        /* "rmgpy/molecule/symmetry.py":328
+ *         for atom in structure.vertices:
+ *             if len(atom.edges) == 0 and atom not in terminal_atoms:  # it's not bonded to anything
+ *                 atoms_to_remove.append(atom)             # <<<<<<<<<<<<<<
+ *         for atom in atoms_to_remove:
+ *             structure.remove_atom(atom)
+ */
+        __pyx_t_12 = __Pyx_PyList_Append(__pyx_v_atoms_to_remove, __pyx_v_atom); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(0, 328, __pyx_L1_error)
+
+        /* "rmgpy/molecule/symmetry.py":327
+ *         atoms_to_remove = []
+ *         for atom in structure.vertices:
+ *             if len(atom.edges) == 0 and atom not in terminal_atoms:  # it's not bonded to anything             # <<<<<<<<<<<<<<
+ *                 atoms_to_remove.append(atom)
+ *         for atom in atoms_to_remove:
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":326
+ * 
+ *         atoms_to_remove = []
+ *         for atom in structure.vertices:             # <<<<<<<<<<<<<<
+ *             if len(atom.edges) == 0 and atom not in terminal_atoms:  # it's not bonded to anything
+ *                 atoms_to_remove.append(atom)
+ */
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":329
+ *             if len(atom.edges) == 0 and atom not in terminal_atoms:  # it's not bonded to anything
+ *                 atoms_to_remove.append(atom)
+ *         for atom in atoms_to_remove:             # <<<<<<<<<<<<<<
+ *             structure.remove_atom(atom)
+ * 
+ */
+    __pyx_t_4 = __pyx_v_atoms_to_remove; __Pyx_INCREF(__pyx_t_4); __pyx_t_5 = 0;
+    for (;;) {
+      if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_4)) break;
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      __pyx_t_11 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_11); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 329, __pyx_L1_error)
+      #else
+      __pyx_t_11 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 329, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      #endif
+      __Pyx_XDECREF_SET(__pyx_v_atom, __pyx_t_11);
+      __pyx_t_11 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":330
+ *                 atoms_to_remove.append(atom)
+ *         for atom in atoms_to_remove:
+ *             structure.remove_atom(atom)             # <<<<<<<<<<<<<<
+ * 
+ *         # Split remaining fragments of structure
+ */
+      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_structure), __pyx_n_s_remove_atom); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 330, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_9 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+        __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_3);
+        if (likely(__pyx_t_9)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+          __Pyx_INCREF(__pyx_t_9);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_3, function);
+        }
+      }
+      __pyx_t_11 = (__pyx_t_9) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_9, __pyx_v_atom) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_atom);
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 330, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":329
+ *             if len(atom.edges) == 0 and atom not in terminal_atoms:  # it's not bonded to anything
+ *                 atoms_to_remove.append(atom)
+ *         for atom in atoms_to_remove:             # <<<<<<<<<<<<<<
+ *             structure.remove_atom(atom)
+ * 
+ */
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":333
+ * 
+ *         # Split remaining fragments of structure
+ *         end_fragments = structure.split()             # <<<<<<<<<<<<<<
+ * 
+ *         #
+ */
+    __pyx_t_4 = ((struct __pyx_vtabstruct_5rmgpy_8molecule_5graph_Graph *)__pyx_v_structure->__pyx_vtab)->split(__pyx_v_structure, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 333, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_XDECREF_SET(__pyx_v_end_fragments, ((PyObject*)__pyx_t_4));
+    __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":341
+ * 
+ *         # to start with nothing has broken symmetry about the axis
+ *         symmetry_broken = False             # <<<<<<<<<<<<<<
+ *         end_fragments_to_remove = []
+ *         for fragment in end_fragments:  # a fragment is one end of the axis
+ */
+    __pyx_v_symmetry_broken = 0;
+
+    /* "rmgpy/molecule/symmetry.py":342
+ *         # to start with nothing has broken symmetry about the axis
+ *         symmetry_broken = False
+ *         end_fragments_to_remove = []             # <<<<<<<<<<<<<<
+ *         for fragment in end_fragments:  # a fragment is one end of the axis
+ *             # remove the atom that was at the end of the axis and split what's left into groups
+ */
+    __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 342, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_XDECREF_SET(__pyx_v_end_fragments_to_remove, ((PyObject*)__pyx_t_4));
+    __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":343
+ *         symmetry_broken = False
+ *         end_fragments_to_remove = []
+ *         for fragment in end_fragments:  # a fragment is one end of the axis             # <<<<<<<<<<<<<<
+ *             # remove the atom that was at the end of the axis and split what's left into groups
+ *             terminal_atom = None
+ */
+    if (unlikely(__pyx_v_end_fragments == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+      __PYX_ERR(0, 343, __pyx_L1_error)
+    }
+    __pyx_t_4 = __pyx_v_end_fragments; __Pyx_INCREF(__pyx_t_4); __pyx_t_5 = 0;
+    for (;;) {
+      if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_4)) break;
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      __pyx_t_11 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_11); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 343, __pyx_L1_error)
+      #else
+      __pyx_t_11 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 343, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      #endif
+      __Pyx_XDECREF_SET(__pyx_v_fragment, __pyx_t_11);
+      __pyx_t_11 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":345
+ *         for fragment in end_fragments:  # a fragment is one end of the axis
+ *             # remove the atom that was at the end of the axis and split what's left into groups
+ *             terminal_atom = None             # <<<<<<<<<<<<<<
+ *             for atom in terminal_atoms:
+ *                 if atom in fragment.atoms:
+ */
+      __Pyx_INCREF(Py_None);
+      __Pyx_XDECREF_SET(__pyx_v_terminal_atom, Py_None);
+
+      /* "rmgpy/molecule/symmetry.py":346
+ *             # remove the atom that was at the end of the axis and split what's left into groups
+ *             terminal_atom = None
+ *             for atom in terminal_atoms:             # <<<<<<<<<<<<<<
+ *                 if atom in fragment.atoms:
+ *                     terminal_atom = atom
+ */
+      __pyx_t_11 = __pyx_v_terminal_atoms; __Pyx_INCREF(__pyx_t_11); __pyx_t_14 = 0;
+      for (;;) {
+        if (__pyx_t_14 >= PyList_GET_SIZE(__pyx_t_11)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_3 = PyList_GET_ITEM(__pyx_t_11, __pyx_t_14); __Pyx_INCREF(__pyx_t_3); __pyx_t_14++; if (unlikely(0 < 0)) __PYX_ERR(0, 346, __pyx_L1_error)
+        #else
+        __pyx_t_3 = PySequence_ITEM(__pyx_t_11, __pyx_t_14); __pyx_t_14++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 346, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        #endif
+        __Pyx_XDECREF_SET(__pyx_v_atom, __pyx_t_3);
+        __pyx_t_3 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":347
+ *             terminal_atom = None
+ *             for atom in terminal_atoms:
+ *                 if atom in fragment.atoms:             # <<<<<<<<<<<<<<
+ *                     terminal_atom = atom
+ *                     fragment.remove_atom(atom)
+ */
+        __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_fragment, __pyx_n_s_atoms); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 347, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_10 = (__Pyx_PySequence_ContainsTF(__pyx_v_atom, __pyx_t_3, Py_EQ)); if (unlikely(__pyx_t_10 < 0)) __PYX_ERR(0, 347, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_t_15 = (__pyx_t_10 != 0);
+        if (__pyx_t_15) {
+
+          /* "rmgpy/molecule/symmetry.py":348
+ *             for atom in terminal_atoms:
+ *                 if atom in fragment.atoms:
+ *                     terminal_atom = atom             # <<<<<<<<<<<<<<
+ *                     fragment.remove_atom(atom)
+ *                     break
+ */
+          __Pyx_INCREF(__pyx_v_atom);
+          __Pyx_DECREF_SET(__pyx_v_terminal_atom, __pyx_v_atom);
+
+          /* "rmgpy/molecule/symmetry.py":349
+ *                 if atom in fragment.atoms:
+ *                     terminal_atom = atom
+ *                     fragment.remove_atom(atom)             # <<<<<<<<<<<<<<
+ *                     break
+ *             else:
+ */
+          __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_fragment, __pyx_n_s_remove_atom); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 349, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_8 = NULL;
+          if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+            __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_9);
+            if (likely(__pyx_t_8)) {
+              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+              __Pyx_INCREF(__pyx_t_8);
+              __Pyx_INCREF(function);
+              __Pyx_DECREF_SET(__pyx_t_9, function);
+            }
+          }
+          __pyx_t_3 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_8, __pyx_v_atom) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_v_atom);
+          __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+          if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 349, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+          /* "rmgpy/molecule/symmetry.py":350
+ *                     terminal_atom = atom
+ *                     fragment.remove_atom(atom)
+ *                     break             # <<<<<<<<<<<<<<
+ *             else:
+ *                 continue
+ */
+          goto __pyx_L75_break;
+
+          /* "rmgpy/molecule/symmetry.py":347
+ *             terminal_atom = None
+ *             for atom in terminal_atoms:
+ *                 if atom in fragment.atoms:             # <<<<<<<<<<<<<<
+ *                     terminal_atom = atom
+ *                     fragment.remove_atom(atom)
+ */
+        }
+
+        /* "rmgpy/molecule/symmetry.py":346
+ *             # remove the atom that was at the end of the axis and split what's left into groups
+ *             terminal_atom = None
+ *             for atom in terminal_atoms:             # <<<<<<<<<<<<<<
+ *                 if atom in fragment.atoms:
+ *                     terminal_atom = atom
+ */
+      }
+      /*else*/ {
+
+        /* "rmgpy/molecule/symmetry.py":352
+ *                     break
+ *             else:
+ *                 continue             # <<<<<<<<<<<<<<
+ * 
+ *             groups = []
+ */
+        goto __pyx_L77_outer_continue;
+      }
+
+      /* "rmgpy/molecule/symmetry.py":346
+ *             # remove the atom that was at the end of the axis and split what's left into groups
+ *             terminal_atom = None
+ *             for atom in terminal_atoms:             # <<<<<<<<<<<<<<
+ *                 if atom in fragment.atoms:
+ *                     terminal_atom = atom
+ */
+      __pyx_L77_outer_continue:;
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+      goto __pyx_L72_continue;
+      __pyx_L75_break:;
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":354
+ *                 continue
+ * 
+ *             groups = []             # <<<<<<<<<<<<<<
+ *             if len(fragment.atoms) > 0:
+ *                 groups = fragment.split()
+ */
+      __pyx_t_11 = PyList_New(0); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 354, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __Pyx_XDECREF_SET(__pyx_v_groups, __pyx_t_11);
+      __pyx_t_11 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":355
+ * 
+ *             groups = []
+ *             if len(fragment.atoms) > 0:             # <<<<<<<<<<<<<<
+ *                 groups = fragment.split()
+ * 
+ */
+      __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_v_fragment, __pyx_n_s_atoms); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 355, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __pyx_t_14 = PyObject_Length(__pyx_t_11); if (unlikely(__pyx_t_14 == ((Py_ssize_t)-1))) __PYX_ERR(0, 355, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __pyx_t_15 = ((__pyx_t_14 > 0) != 0);
+      if (__pyx_t_15) {
+
+        /* "rmgpy/molecule/symmetry.py":356
+ *             groups = []
+ *             if len(fragment.atoms) > 0:
+ *                 groups = fragment.split()             # <<<<<<<<<<<<<<
+ * 
+ *             # If end has only one group then it can't contribute to (nor break) axial symmetry
+ */
+        __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_fragment, __pyx_n_s_split); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 356, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_9 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_9)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_9);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_11 = (__pyx_t_9) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_9) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+        if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 356, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_11);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_DECREF_SET(__pyx_v_groups, __pyx_t_11);
+        __pyx_t_11 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":355
+ * 
+ *             groups = []
+ *             if len(fragment.atoms) > 0:             # <<<<<<<<<<<<<<
+ *                 groups = fragment.split()
+ * 
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":361
+ *             #   Eg. this has no axis symmetry:   A-T=C=C=C=T-A
+ *             # so we remove this end from the list of interesting end fragments
+ *             if len(groups) == 0:             # <<<<<<<<<<<<<<
+ *                 end_fragments_to_remove.append(fragment)
+ *                 continue  # next end fragment
+ */
+      __pyx_t_14 = PyObject_Length(__pyx_v_groups); if (unlikely(__pyx_t_14 == ((Py_ssize_t)-1))) __PYX_ERR(0, 361, __pyx_L1_error)
+      __pyx_t_15 = ((__pyx_t_14 == 0) != 0);
+      if (__pyx_t_15) {
+
+        /* "rmgpy/molecule/symmetry.py":362
+ *             # so we remove this end from the list of interesting end fragments
+ *             if len(groups) == 0:
+ *                 end_fragments_to_remove.append(fragment)             # <<<<<<<<<<<<<<
+ *                 continue  # next end fragment
+ *             elif len(groups) == 1 and terminal_atom.radical_electrons == 0:
+ */
+        __pyx_t_12 = __Pyx_PyList_Append(__pyx_v_end_fragments_to_remove, __pyx_v_fragment); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(0, 362, __pyx_L1_error)
+
+        /* "rmgpy/molecule/symmetry.py":363
+ *             if len(groups) == 0:
+ *                 end_fragments_to_remove.append(fragment)
+ *                 continue  # next end fragment             # <<<<<<<<<<<<<<
+ *             elif len(groups) == 1 and terminal_atom.radical_electrons == 0:
+ *                 if terminal_atom.atomtype.label == 'N3d':
+ */
+        goto __pyx_L72_continue;
+
+        /* "rmgpy/molecule/symmetry.py":361
+ *             #   Eg. this has no axis symmetry:   A-T=C=C=C=T-A
+ *             # so we remove this end from the list of interesting end fragments
+ *             if len(groups) == 0:             # <<<<<<<<<<<<<<
+ *                 end_fragments_to_remove.append(fragment)
+ *                 continue  # next end fragment
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":364
+ *                 end_fragments_to_remove.append(fragment)
+ *                 continue  # next end fragment
+ *             elif len(groups) == 1 and terminal_atom.radical_electrons == 0:             # <<<<<<<<<<<<<<
+ *                 if terminal_atom.atomtype.label == 'N3d':
+ *                     symmetry_broken = True
+ */
+      __pyx_t_14 = PyObject_Length(__pyx_v_groups); if (unlikely(__pyx_t_14 == ((Py_ssize_t)-1))) __PYX_ERR(0, 364, __pyx_L1_error)
+      __pyx_t_10 = ((__pyx_t_14 == 1) != 0);
+      if (__pyx_t_10) {
+      } else {
+        __pyx_t_15 = __pyx_t_10;
+        goto __pyx_L81_bool_binop_done;
+      }
+      __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_v_terminal_atom, __pyx_n_s_radical_electrons); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 364, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __pyx_t_3 = __Pyx_PyInt_EqObjC(__pyx_t_11, __pyx_int_0, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 364, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_10 < 0)) __PYX_ERR(0, 364, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_15 = __pyx_t_10;
+      __pyx_L81_bool_binop_done:;
+      if (__pyx_t_15) {
+
+        /* "rmgpy/molecule/symmetry.py":365
+ *                 continue  # next end fragment
+ *             elif len(groups) == 1 and terminal_atom.radical_electrons == 0:
+ *                 if terminal_atom.atomtype.label == 'N3d':             # <<<<<<<<<<<<<<
+ *                     symmetry_broken = True
+ *                 else:
+ */
+        __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_terminal_atom, __pyx_n_s_atomtype); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 365, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_label); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 365, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_11);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_t_15 = (__Pyx_PyUnicode_Equals(__pyx_t_11, __pyx_n_u_N3d, Py_EQ)); if (unlikely(__pyx_t_15 < 0)) __PYX_ERR(0, 365, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+        if (__pyx_t_15) {
+
+          /* "rmgpy/molecule/symmetry.py":366
+ *             elif len(groups) == 1 and terminal_atom.radical_electrons == 0:
+ *                 if terminal_atom.atomtype.label == 'N3d':
+ *                     symmetry_broken = True             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     end_fragments_to_remove.append(fragment)
+ */
+          __pyx_v_symmetry_broken = 1;
+
+          /* "rmgpy/molecule/symmetry.py":365
+ *                 continue  # next end fragment
+ *             elif len(groups) == 1 and terminal_atom.radical_electrons == 0:
+ *                 if terminal_atom.atomtype.label == 'N3d':             # <<<<<<<<<<<<<<
+ *                     symmetry_broken = True
+ *                 else:
+ */
+          goto __pyx_L83;
+        }
+
+        /* "rmgpy/molecule/symmetry.py":368
+ *                     symmetry_broken = True
+ *                 else:
+ *                     end_fragments_to_remove.append(fragment)             # <<<<<<<<<<<<<<
+ *                     continue  # next end fragment
+ *             elif len(groups) == 1 and terminal_atom.radical_electrons != 0:
+ */
+        /*else*/ {
+          __pyx_t_12 = __Pyx_PyList_Append(__pyx_v_end_fragments_to_remove, __pyx_v_fragment); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(0, 368, __pyx_L1_error)
+
+          /* "rmgpy/molecule/symmetry.py":369
+ *                 else:
+ *                     end_fragments_to_remove.append(fragment)
+ *                     continue  # next end fragment             # <<<<<<<<<<<<<<
+ *             elif len(groups) == 1 and terminal_atom.radical_electrons != 0:
+ *                 symmetry_broken = True
+ */
+          goto __pyx_L72_continue;
+        }
+        __pyx_L83:;
+
+        /* "rmgpy/molecule/symmetry.py":364
+ *                 end_fragments_to_remove.append(fragment)
+ *                 continue  # next end fragment
+ *             elif len(groups) == 1 and terminal_atom.radical_electrons == 0:             # <<<<<<<<<<<<<<
+ *                 if terminal_atom.atomtype.label == 'N3d':
+ *                     symmetry_broken = True
+ */
+        goto __pyx_L80;
+      }
+
+      /* "rmgpy/molecule/symmetry.py":370
+ *                     end_fragments_to_remove.append(fragment)
+ *                     continue  # next end fragment
+ *             elif len(groups) == 1 and terminal_atom.radical_electrons != 0:             # <<<<<<<<<<<<<<
+ *                 symmetry_broken = True
+ *             elif len(groups) == 2:
+ */
+      __pyx_t_14 = PyObject_Length(__pyx_v_groups); if (unlikely(__pyx_t_14 == ((Py_ssize_t)-1))) __PYX_ERR(0, 370, __pyx_L1_error)
+      __pyx_t_10 = ((__pyx_t_14 == 1) != 0);
+      if (__pyx_t_10) {
+      } else {
+        __pyx_t_15 = __pyx_t_10;
+        goto __pyx_L84_bool_binop_done;
+      }
+      __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_v_terminal_atom, __pyx_n_s_radical_electrons); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 370, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __pyx_t_3 = __Pyx_PyInt_NeObjC(__pyx_t_11, __pyx_int_0, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 370, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_10 < 0)) __PYX_ERR(0, 370, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_15 = __pyx_t_10;
+      __pyx_L84_bool_binop_done:;
+      if (__pyx_t_15) {
+
+        /* "rmgpy/molecule/symmetry.py":371
+ *                     continue  # next end fragment
+ *             elif len(groups) == 1 and terminal_atom.radical_electrons != 0:
+ *                 symmetry_broken = True             # <<<<<<<<<<<<<<
+ *             elif len(groups) == 2:
+ *                 if not groups[0].is_isomorphic(groups[1]):
+ */
+        __pyx_v_symmetry_broken = 1;
+
+        /* "rmgpy/molecule/symmetry.py":370
+ *                     end_fragments_to_remove.append(fragment)
+ *                     continue  # next end fragment
+ *             elif len(groups) == 1 and terminal_atom.radical_electrons != 0:             # <<<<<<<<<<<<<<
+ *                 symmetry_broken = True
+ *             elif len(groups) == 2:
+ */
+        goto __pyx_L80;
+      }
+
+      /* "rmgpy/molecule/symmetry.py":372
+ *             elif len(groups) == 1 and terminal_atom.radical_electrons != 0:
+ *                 symmetry_broken = True
+ *             elif len(groups) == 2:             # <<<<<<<<<<<<<<
+ *                 if not groups[0].is_isomorphic(groups[1]):
+ *                     # this end has broken the symmetry of the axis
+ */
+      __pyx_t_14 = PyObject_Length(__pyx_v_groups); if (unlikely(__pyx_t_14 == ((Py_ssize_t)-1))) __PYX_ERR(0, 372, __pyx_L1_error)
+      __pyx_t_15 = ((__pyx_t_14 == 2) != 0);
+      if (__pyx_t_15) {
+
+        /* "rmgpy/molecule/symmetry.py":373
+ *                 symmetry_broken = True
+ *             elif len(groups) == 2:
+ *                 if not groups[0].is_isomorphic(groups[1]):             # <<<<<<<<<<<<<<
+ *                     # this end has broken the symmetry of the axis
+ *                     symmetry_broken = True
+ */
+        __pyx_t_11 = __Pyx_GetItemInt(__pyx_v_groups, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 373, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_11);
+        __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_11, __pyx_n_s_is_isomorphic); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 373, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+        __pyx_t_11 = __Pyx_GetItemInt(__pyx_v_groups, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 373, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_11);
+        __pyx_t_8 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+          __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_9);
+          if (likely(__pyx_t_8)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+            __Pyx_INCREF(__pyx_t_8);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_9, function);
+          }
+        }
+        __pyx_t_3 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_8, __pyx_t_11) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_11);
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+        if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 373, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_t_15 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_15 < 0)) __PYX_ERR(0, 373, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_t_10 = ((!__pyx_t_15) != 0);
+        if (__pyx_t_10) {
+
+          /* "rmgpy/molecule/symmetry.py":375
+ *                 if not groups[0].is_isomorphic(groups[1]):
+ *                     # this end has broken the symmetry of the axis
+ *                     symmetry_broken = True             # <<<<<<<<<<<<<<
+ * 
+ *         for fragment in end_fragments_to_remove:
+ */
+          __pyx_v_symmetry_broken = 1;
+
+          /* "rmgpy/molecule/symmetry.py":373
+ *                 symmetry_broken = True
+ *             elif len(groups) == 2:
+ *                 if not groups[0].is_isomorphic(groups[1]):             # <<<<<<<<<<<<<<
+ *                     # this end has broken the symmetry of the axis
+ *                     symmetry_broken = True
+ */
+        }
+
+        /* "rmgpy/molecule/symmetry.py":372
+ *             elif len(groups) == 1 and terminal_atom.radical_electrons != 0:
+ *                 symmetry_broken = True
+ *             elif len(groups) == 2:             # <<<<<<<<<<<<<<
+ *                 if not groups[0].is_isomorphic(groups[1]):
+ *                     # this end has broken the symmetry of the axis
+ */
+      }
+      __pyx_L80:;
+
+      /* "rmgpy/molecule/symmetry.py":343
+ *         symmetry_broken = False
+ *         end_fragments_to_remove = []
+ *         for fragment in end_fragments:  # a fragment is one end of the axis             # <<<<<<<<<<<<<<
+ *             # remove the atom that was at the end of the axis and split what's left into groups
+ *             terminal_atom = None
+ */
+      __pyx_L72_continue:;
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":377
+ *                     symmetry_broken = True
+ * 
+ *         for fragment in end_fragments_to_remove:             # <<<<<<<<<<<<<<
+ *             end_fragments.remove(fragment)
+ * 
+ */
+    __pyx_t_4 = __pyx_v_end_fragments_to_remove; __Pyx_INCREF(__pyx_t_4); __pyx_t_5 = 0;
+    for (;;) {
+      if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_4)) break;
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      __pyx_t_3 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_3); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 377, __pyx_L1_error)
+      #else
+      __pyx_t_3 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 377, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      #endif
+      __Pyx_XDECREF_SET(__pyx_v_fragment, __pyx_t_3);
+      __pyx_t_3 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":378
+ * 
+ *         for fragment in end_fragments_to_remove:
+ *             end_fragments.remove(fragment)             # <<<<<<<<<<<<<<
+ * 
+ *         # If there are end fragments left that can contribute to symmetry,
+ */
+      __pyx_t_3 = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyList_Type_remove, __pyx_v_end_fragments, __pyx_v_fragment); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 378, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":377
+ *                     symmetry_broken = True
+ * 
+ *         for fragment in end_fragments_to_remove:             # <<<<<<<<<<<<<<
+ *             end_fragments.remove(fragment)
+ * 
+ */
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":387
+ *         #                                   \B
+ *         #      (for some T with coordination number 5).
+ *         if end_fragments and not symmetry_broken:             # <<<<<<<<<<<<<<
+ *             symmetry_number *= 2
+ * 
+ */
+    __pyx_t_15 = (__pyx_v_end_fragments != Py_None)&&(PyList_GET_SIZE(__pyx_v_end_fragments) != 0);
+    if (__pyx_t_15) {
+    } else {
+      __pyx_t_10 = __pyx_t_15;
+      goto __pyx_L90_bool_binop_done;
+    }
+    __pyx_t_15 = ((!(__pyx_v_symmetry_broken != 0)) != 0);
+    __pyx_t_10 = __pyx_t_15;
+    __pyx_L90_bool_binop_done:;
+    if (__pyx_t_10) {
+
+      /* "rmgpy/molecule/symmetry.py":388
+ *         #      (for some T with coordination number 5).
+ *         if end_fragments and not symmetry_broken:
+ *             symmetry_number *= 2             # <<<<<<<<<<<<<<
+ * 
+ *     return symmetry_number
+ */
+      __pyx_t_4 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 388, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_4);
+      __pyx_t_4 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":387
+ *         #                                   \B
+ *         #      (for some T with coordination number 5).
+ *         if end_fragments and not symmetry_broken:             # <<<<<<<<<<<<<<
+ *             symmetry_number *= 2
+ * 
+ */
+    }
+
+    /* "rmgpy/molecule/symmetry.py":293
+ * 
+ *     # For each set of adjacent double bonds, check for axis symmetry
+ *     for bonds in cumulated_bonds:             # <<<<<<<<<<<<<<
+ *         # Do nothing if axis is in cycle
+ *         found = False
+ */
+    __pyx_L39_continue:;
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":390
+ *             symmetry_number *= 2
+ * 
+ *     return symmetry_number             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_17 = __pyx_PyFloat_AsFloat(__pyx_v_symmetry_number); if (unlikely((__pyx_t_17 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 390, __pyx_L1_error)
+  __pyx_r = __pyx_t_17;
+  goto __pyx_L0;
+
+  /* "rmgpy/molecule/symmetry.py":224
+ * ################################################################################
+ * 
+ * def calculate_axis_symmetry_number(molecule):             # <<<<<<<<<<<<<<
+ *     r"""
+ *     Get the axis symmetry number correction. The "axis" refers to a series
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_AddTraceback("rmgpy.molecule.symmetry.calculate_axis_symmetry_number", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1.0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_symmetry_number);
+  __Pyx_XDECREF(__pyx_v_double_bonds);
+  __Pyx_XDECREF(__pyx_v_atom1);
+  __Pyx_XDECREF(__pyx_v_atom2);
+  __Pyx_XDECREF(__pyx_v_cumulated_bonds);
+  __Pyx_XDECREF(__pyx_v_i);
+  __Pyx_XDECREF(__pyx_v_bond1);
+  __Pyx_XDECREF(__pyx_v_atom11);
+  __Pyx_XDECREF(__pyx_v_atom12);
+  __Pyx_XDECREF(__pyx_v_bond2);
+  __Pyx_XDECREF(__pyx_v_atom21);
+  __Pyx_XDECREF(__pyx_v_atom22);
+  __Pyx_XDECREF(__pyx_v_list_to_add_to);
+  __Pyx_XDECREF(__pyx_v_cumBonds);
+  __Pyx_XDECREF(__pyx_v_bonds);
+  __Pyx_XDECREF(__pyx_v_axis);
+  __Pyx_XDECREF(__pyx_v_bond);
+  __Pyx_XDECREF(__pyx_v_terminal_atoms);
+  __Pyx_XDECREF(__pyx_v_atom);
+  __Pyx_XDECREF(__pyx_v_bond_list);
+  __Pyx_XDECREF((PyObject *)__pyx_v_structure);
+  __Pyx_XDECREF(__pyx_v_atoms_to_remove);
+  __Pyx_XDECREF(__pyx_v_end_fragments);
+  __Pyx_XDECREF(__pyx_v_end_fragments_to_remove);
+  __Pyx_XDECREF(__pyx_v_fragment);
+  __Pyx_XDECREF(__pyx_v_terminal_atom);
+  __Pyx_XDECREF(__pyx_v_groups);
+  __Pyx_XDECREF(__pyx_8genexpr3__pyx_v_atom);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8molecule_8symmetry_5calculate_axis_symmetry_number(PyObject *__pyx_self, PyObject *__pyx_v_molecule); /*proto*/
+static char __pyx_doc_5rmgpy_8molecule_8symmetry_4calculate_axis_symmetry_number[] = "\n    Get the axis symmetry number correction. The \"axis\" refers to a series\n    of two or more cumulated double bonds (e.g. C=C=C, etc.). Corrections\n    for single C=C bonds are handled in getBondSymmetryNumber().\n    \n    Each axis (C=C=C) has the potential to double the symmetry number.\n    If an end has 0 or 1 groups (eg. =C=CJJ or =C=C-R) then it cannot \n    alter the axis symmetry and is disregarded::\n    \n        A=C=C=C..        A-C=C=C=C-A\n        \n          s=1                s=1\n    \n    If an end has 2 groups that are different then it breaks the symmetry \n    and the symmetry for that axis is 1, no matter what's at the other end::\n    \n        A\\               A\\         /A\n          T=C=C=C=C-A      T=C=C=C=T\n        B/               A/         \\B\n              s=1             s=1\n    \n    If you have one or more ends with 2 groups, and neither end breaks the \n    symmetry, then you have an axis symmetry number of 2::\n    \n        A\\         /B      A\\         \n          C=C=C=C=C          C=C=C=C-B\n        A/         \\B      A/         \n              s=2                s=2\n    ";
+static PyMethodDef __pyx_mdef_5rmgpy_8molecule_8symmetry_5calculate_axis_symmetry_number = {"calculate_axis_symmetry_number", (PyCFunction)__pyx_pw_5rmgpy_8molecule_8symmetry_5calculate_axis_symmetry_number, METH_O, __pyx_doc_5rmgpy_8molecule_8symmetry_4calculate_axis_symmetry_number};
+static PyObject *__pyx_pw_5rmgpy_8molecule_8symmetry_5calculate_axis_symmetry_number(PyObject *__pyx_self, PyObject *__pyx_v_molecule) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("calculate_axis_symmetry_number (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_molecule), __pyx_ptype_5rmgpy_8molecule_8molecule_Molecule, 1, "molecule", 0))) __PYX_ERR(0, 224, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_8symmetry_4calculate_axis_symmetry_number(__pyx_self, ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *)__pyx_v_molecule));
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8molecule_8symmetry_4calculate_axis_symmetry_number(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *__pyx_v_molecule) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  float __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("calculate_axis_symmetry_number", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_5rmgpy_8molecule_8symmetry_calculate_axis_symmetry_number(__pyx_v_molecule, 0); if (unlikely(__pyx_t_1 == ((float)-1.0))) __PYX_ERR(0, 224, __pyx_L1_error)
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 224, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("rmgpy.molecule.symmetry.calculate_axis_symmetry_number", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/molecule/symmetry.py":395
+ * ################################################################################
+ * 
+ * def calculate_cyclic_symmetry_number(molecule):             # <<<<<<<<<<<<<<
+ *     """
+ *     Get the symmetry number correction for cyclic regions of a molecule.
+ */
+
+static PyObject *__pyx_pw_5rmgpy_8molecule_8symmetry_7calculate_cyclic_symmetry_number(PyObject *__pyx_self, PyObject *__pyx_v_molecule); /*proto*/
+static float __pyx_f_5rmgpy_8molecule_8symmetry_calculate_cyclic_symmetry_number(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *__pyx_v_molecule, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  PyObject *__pyx_v_symmetry_number = NULL;
+  PyObject *__pyx_v_single_rings = NULL;
+  PyObject *__pyx_v_polycyclic_rings = NULL;
+  PyObject *__pyx_v_ring = NULL;
+  PyObject *__pyx_v_size = NULL;
+  PyObject *__pyx_v_num_sections = NULL;
+  PyObject *__pyx_v_num_rotations = NULL;
+  int __pyx_v_all_the_same;
+  PyObject *__pyx_v_starting_index = NULL;
+  PyObject *__pyx_v_atom_index = NULL;
+  PyObject *__pyx_v_flipping_atom_indexes = NULL;
+  PyObject *__pyx_v_flipping_atom_index = NULL;
+  PyObject *__pyx_v_min_index = NULL;
+  PyObject *__pyx_v_max_index = NULL;
+  PyObject *__pyx_v_ringed_atom_ids = NULL;
+  PyObject *__pyx_v_atom1 = NULL;
+  PyObject *__pyx_v_atom2 = NULL;
+  PyObject *__pyx_v_non_ring_bonded_atoms = NULL;
+  int __pyx_v_identical;
+  int __pyx_v_identical2;
+  int __pyx_v_identical3;
+  int __pyx_v_same_sides;
+  int __pyx_v_atom0_matching;
+  int __pyx_v_atom1_matching;
+  PyObject *__pyx_v_atom = NULL;
+  PyObject *__pyx_8genexpr4__pyx_v__atom = NULL;
+  PyObject *__pyx_8genexpr5__pyx_v_bonded_atom = NULL;
+  PyObject *__pyx_8genexpr6__pyx_v_bonded_atom = NULL;
+  float __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  Py_ssize_t __pyx_t_4;
+  PyObject *(*__pyx_t_5)(PyObject *);
+  int __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  PyObject *(*__pyx_t_8)(PyObject *);
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  PyObject *(*__pyx_t_13)(PyObject *);
+  PyObject *__pyx_t_14 = NULL;
+  PyObject *__pyx_t_15 = NULL;
+  PyObject *__pyx_t_16 = NULL;
+  PyObject *__pyx_t_17 = NULL;
+  PyObject *__pyx_t_18 = NULL;
+  int __pyx_t_19;
+  int __pyx_t_20;
+  Py_ssize_t __pyx_t_21;
+  int __pyx_t_22;
+  float __pyx_t_23;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("calculate_cyclic_symmetry_number", 0);
+
+  /* "rmgpy/molecule/symmetry.py":400
+ *     For complicated fused rings the smallest set of smallest rings is used.
+ *     """
+ *     symmetry_number = 1             # <<<<<<<<<<<<<<
+ * 
+ *     # for polycyclics, We should be getting the largest ring, not the smallest
+ */
+  __Pyx_INCREF(__pyx_int_1);
+  __pyx_v_symmetry_number = __pyx_int_1;
+
+  /* "rmgpy/molecule/symmetry.py":403
+ * 
+ *     # for polycyclics, We should be getting the largest ring, not the smallest
+ *     single_rings, polycyclic_rings = molecule.get_disparate_cycles()             # <<<<<<<<<<<<<<
+ *     for ring in polycyclic_rings:
+ *         single_rings.append(molecule.get_largest_ring(ring[0]))
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Molecule *)__pyx_v_molecule->__pyx_base.__pyx_vtab)->__pyx_base.get_disparate_cycles(((struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *)__pyx_v_molecule), 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 403, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (likely(__pyx_t_1 != Py_None)) {
+    PyObject* sequence = __pyx_t_1;
+    Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+    if (unlikely(size != 2)) {
+      if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+      __PYX_ERR(0, 403, __pyx_L1_error)
+    }
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    __pyx_t_2 = PyTuple_GET_ITEM(sequence, 0); 
+    __pyx_t_3 = PyTuple_GET_ITEM(sequence, 1); 
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_t_3);
+    #else
+    __pyx_t_2 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 403, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 403, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    #endif
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  } else {
+    __Pyx_RaiseNoneNotIterableError(); __PYX_ERR(0, 403, __pyx_L1_error)
+  }
+  __pyx_v_single_rings = __pyx_t_2;
+  __pyx_t_2 = 0;
+  __pyx_v_polycyclic_rings = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":404
+ *     # for polycyclics, We should be getting the largest ring, not the smallest
+ *     single_rings, polycyclic_rings = molecule.get_disparate_cycles()
+ *     for ring in polycyclic_rings:             # <<<<<<<<<<<<<<
+ *         single_rings.append(molecule.get_largest_ring(ring[0]))
+ *     # Get symmetry number for each ring in structure & multiply
+ */
+  if (likely(PyList_CheckExact(__pyx_v_polycyclic_rings)) || PyTuple_CheckExact(__pyx_v_polycyclic_rings)) {
+    __pyx_t_1 = __pyx_v_polycyclic_rings; __Pyx_INCREF(__pyx_t_1); __pyx_t_4 = 0;
+    __pyx_t_5 = NULL;
+  } else {
+    __pyx_t_4 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_polycyclic_rings); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 404, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 404, __pyx_L1_error)
+  }
+  for (;;) {
+    if (likely(!__pyx_t_5)) {
+      if (likely(PyList_CheckExact(__pyx_t_1))) {
+        if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_3 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_4); __Pyx_INCREF(__pyx_t_3); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 404, __pyx_L1_error)
+        #else
+        __pyx_t_3 = PySequence_ITEM(__pyx_t_1, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 404, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        #endif
+      } else {
+        if (__pyx_t_4 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_4); __Pyx_INCREF(__pyx_t_3); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 404, __pyx_L1_error)
+        #else
+        __pyx_t_3 = PySequence_ITEM(__pyx_t_1, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 404, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        #endif
+      }
+    } else {
+      __pyx_t_3 = __pyx_t_5(__pyx_t_1);
+      if (unlikely(!__pyx_t_3)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 404, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_3);
+    }
+    __Pyx_XDECREF_SET(__pyx_v_ring, __pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":405
+ *     single_rings, polycyclic_rings = molecule.get_disparate_cycles()
+ *     for ring in polycyclic_rings:
+ *         single_rings.append(molecule.get_largest_ring(ring[0]))             # <<<<<<<<<<<<<<
+ *     # Get symmetry number for each ring in structure & multiply
+ *     for ring in single_rings:
+ */
+    __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_ring, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 405, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5rmgpy_8molecule_5graph_Vertex))))) __PYX_ERR(0, 405, __pyx_L1_error)
+    __pyx_t_2 = ((struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Molecule *)__pyx_v_molecule->__pyx_base.__pyx_vtab)->__pyx_base.get_largest_ring(((struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *)__pyx_v_molecule), ((struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *)__pyx_t_3), 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 405, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_6 = __Pyx_PyObject_Append(__pyx_v_single_rings, __pyx_t_2); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 405, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":404
+ *     # for polycyclics, We should be getting the largest ring, not the smallest
+ *     single_rings, polycyclic_rings = molecule.get_disparate_cycles()
+ *     for ring in polycyclic_rings:             # <<<<<<<<<<<<<<
+ *         single_rings.append(molecule.get_largest_ring(ring[0]))
+ *     # Get symmetry number for each ring in structure & multiply
+ */
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":407
+ *         single_rings.append(molecule.get_largest_ring(ring[0]))
+ *     # Get symmetry number for each ring in structure & multiply
+ *     for ring in single_rings:             # <<<<<<<<<<<<<<
+ *         ring = molecule.sort_cyclic_vertices(ring)
+ *         size = len(ring)
+ */
+  if (likely(PyList_CheckExact(__pyx_v_single_rings)) || PyTuple_CheckExact(__pyx_v_single_rings)) {
+    __pyx_t_1 = __pyx_v_single_rings; __Pyx_INCREF(__pyx_t_1); __pyx_t_4 = 0;
+    __pyx_t_5 = NULL;
+  } else {
+    __pyx_t_4 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_single_rings); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 407, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 407, __pyx_L1_error)
+  }
+  for (;;) {
+    if (likely(!__pyx_t_5)) {
+      if (likely(PyList_CheckExact(__pyx_t_1))) {
+        if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_2 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_4); __Pyx_INCREF(__pyx_t_2); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 407, __pyx_L1_error)
+        #else
+        __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 407, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        #endif
+      } else {
+        if (__pyx_t_4 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_4); __Pyx_INCREF(__pyx_t_2); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 407, __pyx_L1_error)
+        #else
+        __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 407, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        #endif
+      }
+    } else {
+      __pyx_t_2 = __pyx_t_5(__pyx_t_1);
+      if (unlikely(!__pyx_t_2)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 407, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_2);
+    }
+    __Pyx_XDECREF_SET(__pyx_v_ring, __pyx_t_2);
+    __pyx_t_2 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":408
+ *     # Get symmetry number for each ring in structure & multiply
+ *     for ring in single_rings:
+ *         ring = molecule.sort_cyclic_vertices(ring)             # <<<<<<<<<<<<<<
+ *         size = len(ring)
+ * 
+ */
+    if (!(likely(PyList_CheckExact(__pyx_v_ring))||((__pyx_v_ring) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_v_ring)->tp_name), 0))) __PYX_ERR(0, 408, __pyx_L1_error)
+    __pyx_t_2 = ((struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Molecule *)__pyx_v_molecule->__pyx_base.__pyx_vtab)->__pyx_base.sort_cyclic_vertices(((struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *)__pyx_v_molecule), ((PyObject*)__pyx_v_ring), 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 408, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF_SET(__pyx_v_ring, __pyx_t_2);
+    __pyx_t_2 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":409
+ *     for ring in single_rings:
+ *         ring = molecule.sort_cyclic_vertices(ring)
+ *         size = len(ring)             # <<<<<<<<<<<<<<
+ * 
+ *         # look for twisting rotation
+ */
+    __pyx_t_7 = PyObject_Length(__pyx_v_ring); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(0, 409, __pyx_L1_error)
+    __pyx_t_2 = PyInt_FromSsize_t(__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 409, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_XDECREF_SET(__pyx_v_size, __pyx_t_2);
+    __pyx_t_2 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":413
+ *         # look for twisting rotation
+ *         # go through each possible number of symmetrical sets
+ *         for num_sections in range(size, 0, -1):             # <<<<<<<<<<<<<<
+ *             # only go through if it can give symmetry (only factors of size)
+ *             if size % num_sections == 0:
+ */
+    __pyx_t_2 = PyTuple_New(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 413, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_v_size);
+    __Pyx_GIVEREF(__pyx_v_size);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_size);
+    __Pyx_INCREF(__pyx_int_0);
+    __Pyx_GIVEREF(__pyx_int_0);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_int_0);
+    __Pyx_INCREF(__pyx_int_neg_1);
+    __Pyx_GIVEREF(__pyx_int_neg_1);
+    PyTuple_SET_ITEM(__pyx_t_2, 2, __pyx_int_neg_1);
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 413, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (likely(PyList_CheckExact(__pyx_t_3)) || PyTuple_CheckExact(__pyx_t_3)) {
+      __pyx_t_2 = __pyx_t_3; __Pyx_INCREF(__pyx_t_2); __pyx_t_7 = 0;
+      __pyx_t_8 = NULL;
+    } else {
+      __pyx_t_7 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 413, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_8 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 413, __pyx_L1_error)
+    }
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    for (;;) {
+      if (likely(!__pyx_t_8)) {
+        if (likely(PyList_CheckExact(__pyx_t_2))) {
+          if (__pyx_t_7 >= PyList_GET_SIZE(__pyx_t_2)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_3 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_7); __Pyx_INCREF(__pyx_t_3); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(0, 413, __pyx_L1_error)
+          #else
+          __pyx_t_3 = PySequence_ITEM(__pyx_t_2, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 413, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          #endif
+        } else {
+          if (__pyx_t_7 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_7); __Pyx_INCREF(__pyx_t_3); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(0, 413, __pyx_L1_error)
+          #else
+          __pyx_t_3 = PySequence_ITEM(__pyx_t_2, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 413, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          #endif
+        }
+      } else {
+        __pyx_t_3 = __pyx_t_8(__pyx_t_2);
+        if (unlikely(!__pyx_t_3)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 413, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_3);
+      }
+      __Pyx_XDECREF_SET(__pyx_v_num_sections, __pyx_t_3);
+      __pyx_t_3 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":415
+ *         for num_sections in range(size, 0, -1):
+ *             # only go through if it can give symmetry (only factors of size)
+ *             if size % num_sections == 0:             # <<<<<<<<<<<<<<
+ *                 # only check the minimum number of sections necessary
+ *                 num_rotations = size // num_sections
+ */
+      __pyx_t_3 = PyNumber_Remainder(__pyx_v_size, __pyx_v_num_sections); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 415, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_9 = __Pyx_PyInt_EqObjC(__pyx_t_3, __pyx_int_0, 0, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 415, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_9); if (unlikely(__pyx_t_10 < 0)) __PYX_ERR(0, 415, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      if (__pyx_t_10) {
+
+        /* "rmgpy/molecule/symmetry.py":417
+ *             if size % num_sections == 0:
+ *                 # only check the minimum number of sections necessary
+ *                 num_rotations = size // num_sections             # <<<<<<<<<<<<<<
+ *                 # check rotation around the ring
+ *                 all_the_same = True
+ */
+        __pyx_t_9 = PyNumber_FloorDivide(__pyx_v_size, __pyx_v_num_sections); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 417, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_XDECREF_SET(__pyx_v_num_rotations, __pyx_t_9);
+        __pyx_t_9 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":419
+ *                 num_rotations = size // num_sections
+ *                 # check rotation around the ring
+ *                 all_the_same = True             # <<<<<<<<<<<<<<
+ *                 starting_index = 0
+ *                 while all_the_same and starting_index < size // 2:
+ */
+        __pyx_v_all_the_same = 1;
+
+        /* "rmgpy/molecule/symmetry.py":420
+ *                 # check rotation around the ring
+ *                 all_the_same = True
+ *                 starting_index = 0             # <<<<<<<<<<<<<<
+ *                 while all_the_same and starting_index < size // 2:
+ *                     for atom_index in range(num_rotations, size, num_rotations):
+ */
+        __Pyx_INCREF(__pyx_int_0);
+        __Pyx_XDECREF_SET(__pyx_v_starting_index, __pyx_int_0);
+
+        /* "rmgpy/molecule/symmetry.py":421
+ *                 all_the_same = True
+ *                 starting_index = 0
+ *                 while all_the_same and starting_index < size // 2:             # <<<<<<<<<<<<<<
+ *                     for atom_index in range(num_rotations, size, num_rotations):
+ *                         if not _indistinguishable(ring[starting_index], ring[(starting_index + atom_index) % size]):
+ */
+        while (1) {
+          __pyx_t_11 = (__pyx_v_all_the_same != 0);
+          if (__pyx_t_11) {
+          } else {
+            __pyx_t_10 = __pyx_t_11;
+            goto __pyx_L12_bool_binop_done;
+          }
+          __pyx_t_9 = __Pyx_PyInt_FloorDivideObjC(__pyx_v_size, __pyx_int_2, 2, 0, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 421, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_3 = PyObject_RichCompare(__pyx_v_starting_index, __pyx_t_9, Py_LT); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 421, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_11 < 0)) __PYX_ERR(0, 421, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __pyx_t_10 = __pyx_t_11;
+          __pyx_L12_bool_binop_done:;
+          if (!__pyx_t_10) break;
+
+          /* "rmgpy/molecule/symmetry.py":422
+ *                 starting_index = 0
+ *                 while all_the_same and starting_index < size // 2:
+ *                     for atom_index in range(num_rotations, size, num_rotations):             # <<<<<<<<<<<<<<
+ *                         if not _indistinguishable(ring[starting_index], ring[(starting_index + atom_index) % size]):
+ *                             all_the_same = False
+ */
+          __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 422, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __Pyx_INCREF(__pyx_v_num_rotations);
+          __Pyx_GIVEREF(__pyx_v_num_rotations);
+          PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_num_rotations);
+          __Pyx_INCREF(__pyx_v_size);
+          __Pyx_GIVEREF(__pyx_v_size);
+          PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_size);
+          __Pyx_INCREF(__pyx_v_num_rotations);
+          __Pyx_GIVEREF(__pyx_v_num_rotations);
+          PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_v_num_rotations);
+          __pyx_t_9 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_3, NULL); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 422, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          if (likely(PyList_CheckExact(__pyx_t_9)) || PyTuple_CheckExact(__pyx_t_9)) {
+            __pyx_t_3 = __pyx_t_9; __Pyx_INCREF(__pyx_t_3); __pyx_t_12 = 0;
+            __pyx_t_13 = NULL;
+          } else {
+            __pyx_t_12 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_9); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 422, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            __pyx_t_13 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 422, __pyx_L1_error)
+          }
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          for (;;) {
+            if (likely(!__pyx_t_13)) {
+              if (likely(PyList_CheckExact(__pyx_t_3))) {
+                if (__pyx_t_12 >= PyList_GET_SIZE(__pyx_t_3)) break;
+                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                __pyx_t_9 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_12); __Pyx_INCREF(__pyx_t_9); __pyx_t_12++; if (unlikely(0 < 0)) __PYX_ERR(0, 422, __pyx_L1_error)
+                #else
+                __pyx_t_9 = PySequence_ITEM(__pyx_t_3, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 422, __pyx_L1_error)
+                __Pyx_GOTREF(__pyx_t_9);
+                #endif
+              } else {
+                if (__pyx_t_12 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
+                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                __pyx_t_9 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_12); __Pyx_INCREF(__pyx_t_9); __pyx_t_12++; if (unlikely(0 < 0)) __PYX_ERR(0, 422, __pyx_L1_error)
+                #else
+                __pyx_t_9 = PySequence_ITEM(__pyx_t_3, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 422, __pyx_L1_error)
+                __Pyx_GOTREF(__pyx_t_9);
+                #endif
+              }
+            } else {
+              __pyx_t_9 = __pyx_t_13(__pyx_t_3);
+              if (unlikely(!__pyx_t_9)) {
+                PyObject* exc_type = PyErr_Occurred();
+                if (exc_type) {
+                  if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+                  else __PYX_ERR(0, 422, __pyx_L1_error)
+                }
+                break;
+              }
+              __Pyx_GOTREF(__pyx_t_9);
+            }
+            __Pyx_XDECREF_SET(__pyx_v_atom_index, __pyx_t_9);
+            __pyx_t_9 = 0;
+
+            /* "rmgpy/molecule/symmetry.py":423
+ *                 while all_the_same and starting_index < size // 2:
+ *                     for atom_index in range(num_rotations, size, num_rotations):
+ *                         if not _indistinguishable(ring[starting_index], ring[(starting_index + atom_index) % size]):             # <<<<<<<<<<<<<<
+ *                             all_the_same = False
+ *                             break
+ */
+            __pyx_t_9 = __Pyx_PyObject_GetItem(__pyx_v_ring, __pyx_v_starting_index); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 423, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_9);
+            if (!(likely(((__pyx_t_9) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_9, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 423, __pyx_L1_error)
+            __pyx_t_14 = PyNumber_Add(__pyx_v_starting_index, __pyx_v_atom_index); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 423, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_14);
+            __pyx_t_15 = PyNumber_Remainder(__pyx_t_14, __pyx_v_size); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 423, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_15);
+            __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+            __pyx_t_14 = __Pyx_PyObject_GetItem(__pyx_v_ring, __pyx_t_15); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 423, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_14);
+            __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+            if (!(likely(((__pyx_t_14) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_14, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 423, __pyx_L1_error)
+            __pyx_t_10 = __pyx_f_5rmgpy_8molecule_8symmetry__indistinguishable(((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_9), ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_14), 0); if (unlikely(__pyx_t_10 == ((int)-2))) __PYX_ERR(0, 423, __pyx_L1_error)
+            __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+            __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+            __pyx_t_11 = ((!(__pyx_t_10 != 0)) != 0);
+            if (__pyx_t_11) {
+
+              /* "rmgpy/molecule/symmetry.py":424
+ *                     for atom_index in range(num_rotations, size, num_rotations):
+ *                         if not _indistinguishable(ring[starting_index], ring[(starting_index + atom_index) % size]):
+ *                             all_the_same = False             # <<<<<<<<<<<<<<
+ *                             break
+ *                     starting_index += 1
+ */
+              __pyx_v_all_the_same = 0;
+
+              /* "rmgpy/molecule/symmetry.py":425
+ *                         if not _indistinguishable(ring[starting_index], ring[(starting_index + atom_index) % size]):
+ *                             all_the_same = False
+ *                             break             # <<<<<<<<<<<<<<
+ *                     starting_index += 1
+ *                 if all_the_same:
+ */
+              goto __pyx_L15_break;
+
+              /* "rmgpy/molecule/symmetry.py":423
+ *                 while all_the_same and starting_index < size // 2:
+ *                     for atom_index in range(num_rotations, size, num_rotations):
+ *                         if not _indistinguishable(ring[starting_index], ring[(starting_index + atom_index) % size]):             # <<<<<<<<<<<<<<
+ *                             all_the_same = False
+ *                             break
+ */
+            }
+
+            /* "rmgpy/molecule/symmetry.py":422
+ *                 starting_index = 0
+ *                 while all_the_same and starting_index < size // 2:
+ *                     for atom_index in range(num_rotations, size, num_rotations):             # <<<<<<<<<<<<<<
+ *                         if not _indistinguishable(ring[starting_index], ring[(starting_index + atom_index) % size]):
+ *                             all_the_same = False
+ */
+          }
+          __pyx_L15_break:;
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+          /* "rmgpy/molecule/symmetry.py":426
+ *                             all_the_same = False
+ *                             break
+ *                     starting_index += 1             # <<<<<<<<<<<<<<
+ *                 if all_the_same:
+ *                     symmetry_number *= num_sections
+ */
+          __pyx_t_3 = __Pyx_PyInt_AddObjC(__pyx_v_starting_index, __pyx_int_1, 1, 1, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 426, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __Pyx_DECREF_SET(__pyx_v_starting_index, __pyx_t_3);
+          __pyx_t_3 = 0;
+        }
+
+        /* "rmgpy/molecule/symmetry.py":427
+ *                             break
+ *                     starting_index += 1
+ *                 if all_the_same:             # <<<<<<<<<<<<<<
+ *                     symmetry_number *= num_sections
+ *                     break
+ */
+        __pyx_t_11 = (__pyx_v_all_the_same != 0);
+        if (__pyx_t_11) {
+
+          /* "rmgpy/molecule/symmetry.py":428
+ *                     starting_index += 1
+ *                 if all_the_same:
+ *                     symmetry_number *= num_sections             # <<<<<<<<<<<<<<
+ *                     break
+ * 
+ */
+          __pyx_t_3 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_v_num_sections); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 428, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_3);
+          __pyx_t_3 = 0;
+
+          /* "rmgpy/molecule/symmetry.py":429
+ *                 if all_the_same:
+ *                     symmetry_number *= num_sections
+ *                     break             # <<<<<<<<<<<<<<
+ * 
+ *         # look for flipping rotation.
+ */
+          goto __pyx_L8_break;
+
+          /* "rmgpy/molecule/symmetry.py":427
+ *                             break
+ *                     starting_index += 1
+ *                 if all_the_same:             # <<<<<<<<<<<<<<
+ *                     symmetry_number *= num_sections
+ *                     break
+ */
+        }
+
+        /* "rmgpy/molecule/symmetry.py":415
+ *         for num_sections in range(size, 0, -1):
+ *             # only go through if it can give symmetry (only factors of size)
+ *             if size % num_sections == 0:             # <<<<<<<<<<<<<<
+ *                 # only check the minimum number of sections necessary
+ *                 num_rotations = size // num_sections
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":413
+ *         # look for twisting rotation
+ *         # go through each possible number of symmetrical sets
+ *         for num_sections in range(size, 0, -1):             # <<<<<<<<<<<<<<
+ *             # only go through if it can give symmetry (only factors of size)
+ *             if size % num_sections == 0:
+ */
+    }
+    __pyx_L8_break:;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":432
+ * 
+ *         # look for flipping rotation.
+ *         if size % 2 == 0:  # even length only has to go through half             # <<<<<<<<<<<<<<
+ *             flipping_atom_indexes = list(range(size // 2))
+ *         else:
+ */
+    __pyx_t_2 = __Pyx_PyInt_RemainderObjC(__pyx_v_size, __pyx_int_2, 2, 0, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 432, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = __Pyx_PyInt_EqObjC(__pyx_t_2, __pyx_int_0, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 432, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_11 < 0)) __PYX_ERR(0, 432, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (__pyx_t_11) {
+
+      /* "rmgpy/molecule/symmetry.py":433
+ *         # look for flipping rotation.
+ *         if size % 2 == 0:  # even length only has to go through half
+ *             flipping_atom_indexes = list(range(size // 2))             # <<<<<<<<<<<<<<
+ *         else:
+ *             flipping_atom_indexes = list(range(size))
+ */
+      __pyx_t_3 = __Pyx_PyInt_FloorDivideObjC(__pyx_v_size, __pyx_int_2, 2, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 433, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 433, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_3 = PySequence_List(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 433, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_flipping_atom_indexes, ((PyObject*)__pyx_t_3));
+      __pyx_t_3 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":432
+ * 
+ *         # look for flipping rotation.
+ *         if size % 2 == 0:  # even length only has to go through half             # <<<<<<<<<<<<<<
+ *             flipping_atom_indexes = list(range(size // 2))
+ *         else:
+ */
+      goto __pyx_L18;
+    }
+
+    /* "rmgpy/molecule/symmetry.py":435
+ *             flipping_atom_indexes = list(range(size // 2))
+ *         else:
+ *             flipping_atom_indexes = list(range(size))             # <<<<<<<<<<<<<<
+ * 
+ *         for flipping_atom_index in flipping_atom_indexes:
+ */
+    /*else*/ {
+      __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_v_size); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 435, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_2 = PySequence_List(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 435, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_flipping_atom_indexes, ((PyObject*)__pyx_t_2));
+      __pyx_t_2 = 0;
+    }
+    __pyx_L18:;
+
+    /* "rmgpy/molecule/symmetry.py":437
+ *             flipping_atom_indexes = list(range(size))
+ * 
+ *         for flipping_atom_index in flipping_atom_indexes:             # <<<<<<<<<<<<<<
+ * 
+ *             # check for flipping with across an axis containing atoms
+ */
+    __pyx_t_2 = __pyx_v_flipping_atom_indexes; __Pyx_INCREF(__pyx_t_2); __pyx_t_7 = 0;
+    for (;;) {
+      if (__pyx_t_7 >= PyList_GET_SIZE(__pyx_t_2)) break;
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      __pyx_t_3 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_7); __Pyx_INCREF(__pyx_t_3); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(0, 437, __pyx_L1_error)
+      #else
+      __pyx_t_3 = PySequence_ITEM(__pyx_t_2, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 437, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      #endif
+      __Pyx_XDECREF_SET(__pyx_v_flipping_atom_index, __pyx_t_3);
+      __pyx_t_3 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":440
+ * 
+ *             # check for flipping with across an axis containing atoms
+ *             all_the_same = True             # <<<<<<<<<<<<<<
+ *             min_index = flipping_atom_index + 1
+ *             max_index = flipping_atom_index + size - 1
+ */
+      __pyx_v_all_the_same = 1;
+
+      /* "rmgpy/molecule/symmetry.py":441
+ *             # check for flipping with across an axis containing atoms
+ *             all_the_same = True
+ *             min_index = flipping_atom_index + 1             # <<<<<<<<<<<<<<
+ *             max_index = flipping_atom_index + size - 1
+ *             while min_index <= max_index:
+ */
+      __pyx_t_3 = __Pyx_PyInt_AddObjC(__pyx_v_flipping_atom_index, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 441, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_XDECREF_SET(__pyx_v_min_index, __pyx_t_3);
+      __pyx_t_3 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":442
+ *             all_the_same = True
+ *             min_index = flipping_atom_index + 1
+ *             max_index = flipping_atom_index + size - 1             # <<<<<<<<<<<<<<
+ *             while min_index <= max_index:
+ *                 # ensure the two atoms are different. use mod size to loop to the start
+ */
+      __pyx_t_3 = PyNumber_Add(__pyx_v_flipping_atom_index, __pyx_v_size); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 442, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_14 = __Pyx_PyInt_SubtractObjC(__pyx_t_3, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 442, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_14);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_max_index, __pyx_t_14);
+      __pyx_t_14 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":443
+ *             min_index = flipping_atom_index + 1
+ *             max_index = flipping_atom_index + size - 1
+ *             while min_index <= max_index:             # <<<<<<<<<<<<<<
+ *                 # ensure the two atoms are different. use mod size to loop to the start
+ *                 # of the list when index out of bounds
+ */
+      while (1) {
+        __pyx_t_14 = PyObject_RichCompare(__pyx_v_min_index, __pyx_v_max_index, Py_LE); __Pyx_XGOTREF(__pyx_t_14); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 443, __pyx_L1_error)
+        __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_t_14); if (unlikely(__pyx_t_11 < 0)) __PYX_ERR(0, 443, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+        if (!__pyx_t_11) break;
+
+        /* "rmgpy/molecule/symmetry.py":446
+ *                 # ensure the two atoms are different. use mod size to loop to the start
+ *                 # of the list when index out of bounds
+ *                 if not _indistinguishable(ring[min_index % size], ring[max_index % size]):             # <<<<<<<<<<<<<<
+ *                     all_the_same = False
+ *                     break
+ */
+        __pyx_t_14 = PyNumber_Remainder(__pyx_v_min_index, __pyx_v_size); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 446, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_14);
+        __pyx_t_3 = __Pyx_PyObject_GetItem(__pyx_v_ring, __pyx_t_14); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 446, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+        if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 446, __pyx_L1_error)
+        __pyx_t_14 = PyNumber_Remainder(__pyx_v_max_index, __pyx_v_size); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 446, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_14);
+        __pyx_t_9 = __Pyx_PyObject_GetItem(__pyx_v_ring, __pyx_t_14); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 446, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+        if (!(likely(((__pyx_t_9) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_9, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 446, __pyx_L1_error)
+        __pyx_t_11 = __pyx_f_5rmgpy_8molecule_8symmetry__indistinguishable(((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_3), ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_9), 0); if (unlikely(__pyx_t_11 == ((int)-2))) __PYX_ERR(0, 446, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_t_10 = ((!(__pyx_t_11 != 0)) != 0);
+        if (__pyx_t_10) {
+
+          /* "rmgpy/molecule/symmetry.py":447
+ *                 # of the list when index out of bounds
+ *                 if not _indistinguishable(ring[min_index % size], ring[max_index % size]):
+ *                     all_the_same = False             # <<<<<<<<<<<<<<
+ *                     break
+ *                 min_index += 1
+ */
+          __pyx_v_all_the_same = 0;
+
+          /* "rmgpy/molecule/symmetry.py":448
+ *                 if not _indistinguishable(ring[min_index % size], ring[max_index % size]):
+ *                     all_the_same = False
+ *                     break             # <<<<<<<<<<<<<<
+ *                 min_index += 1
+ *                 max_index += -1
+ */
+          goto __pyx_L22_break;
+
+          /* "rmgpy/molecule/symmetry.py":446
+ *                 # ensure the two atoms are different. use mod size to loop to the start
+ *                 # of the list when index out of bounds
+ *                 if not _indistinguishable(ring[min_index % size], ring[max_index % size]):             # <<<<<<<<<<<<<<
+ *                     all_the_same = False
+ *                     break
+ */
+        }
+
+        /* "rmgpy/molecule/symmetry.py":449
+ *                     all_the_same = False
+ *                     break
+ *                 min_index += 1             # <<<<<<<<<<<<<<
+ *                 max_index += -1
+ *             # check to make sure that the groups are identical on centers of flipping
+ */
+        __pyx_t_9 = __Pyx_PyInt_AddObjC(__pyx_v_min_index, __pyx_int_1, 1, 1, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 449, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF_SET(__pyx_v_min_index, __pyx_t_9);
+        __pyx_t_9 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":450
+ *                     break
+ *                 min_index += 1
+ *                 max_index += -1             # <<<<<<<<<<<<<<
+ *             # check to make sure that the groups are identical on centers of flipping
+ *             if all_the_same:
+ */
+        __pyx_t_9 = __Pyx_PyInt_AddObjC(__pyx_v_max_index, __pyx_int_neg_1, -1L, 1, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 450, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF_SET(__pyx_v_max_index, __pyx_t_9);
+        __pyx_t_9 = 0;
+      }
+      __pyx_L22_break:;
+
+      /* "rmgpy/molecule/symmetry.py":452
+ *                 max_index += -1
+ *             # check to make sure that the groups are identical on centers of flipping
+ *             if all_the_same:             # <<<<<<<<<<<<<<
+ *                 ringed_atom_ids = [id(_atom) for _atom in ring]
+ *                 if size % 2 == 0:  # look at two atoms
+ */
+      __pyx_t_10 = (__pyx_v_all_the_same != 0);
+      if (__pyx_t_10) {
+
+        /* "rmgpy/molecule/symmetry.py":453
+ *             # check to make sure that the groups are identical on centers of flipping
+ *             if all_the_same:
+ *                 ringed_atom_ids = [id(_atom) for _atom in ring]             # <<<<<<<<<<<<<<
+ *                 if size % 2 == 0:  # look at two atoms
+ *                     atom1 = ring[flipping_atom_index]
+ */
+        { /* enter inner scope */
+          __pyx_t_9 = PyList_New(0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 453, __pyx_L27_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          if (likely(PyList_CheckExact(__pyx_v_ring)) || PyTuple_CheckExact(__pyx_v_ring)) {
+            __pyx_t_3 = __pyx_v_ring; __Pyx_INCREF(__pyx_t_3); __pyx_t_12 = 0;
+            __pyx_t_8 = NULL;
+          } else {
+            __pyx_t_12 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_v_ring); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 453, __pyx_L27_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            __pyx_t_8 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 453, __pyx_L27_error)
+          }
+          for (;;) {
+            if (likely(!__pyx_t_8)) {
+              if (likely(PyList_CheckExact(__pyx_t_3))) {
+                if (__pyx_t_12 >= PyList_GET_SIZE(__pyx_t_3)) break;
+                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                __pyx_t_14 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_12); __Pyx_INCREF(__pyx_t_14); __pyx_t_12++; if (unlikely(0 < 0)) __PYX_ERR(0, 453, __pyx_L27_error)
+                #else
+                __pyx_t_14 = PySequence_ITEM(__pyx_t_3, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 453, __pyx_L27_error)
+                __Pyx_GOTREF(__pyx_t_14);
+                #endif
+              } else {
+                if (__pyx_t_12 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
+                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                __pyx_t_14 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_12); __Pyx_INCREF(__pyx_t_14); __pyx_t_12++; if (unlikely(0 < 0)) __PYX_ERR(0, 453, __pyx_L27_error)
+                #else
+                __pyx_t_14 = PySequence_ITEM(__pyx_t_3, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 453, __pyx_L27_error)
+                __Pyx_GOTREF(__pyx_t_14);
+                #endif
+              }
+            } else {
+              __pyx_t_14 = __pyx_t_8(__pyx_t_3);
+              if (unlikely(!__pyx_t_14)) {
+                PyObject* exc_type = PyErr_Occurred();
+                if (exc_type) {
+                  if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+                  else __PYX_ERR(0, 453, __pyx_L27_error)
+                }
+                break;
+              }
+              __Pyx_GOTREF(__pyx_t_14);
+            }
+            __Pyx_XDECREF_SET(__pyx_8genexpr4__pyx_v__atom, __pyx_t_14);
+            __pyx_t_14 = 0;
+            __pyx_t_14 = __Pyx_PyObject_CallOneArg(__pyx_builtin_id, __pyx_8genexpr4__pyx_v__atom); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 453, __pyx_L27_error)
+            __Pyx_GOTREF(__pyx_t_14);
+            if (unlikely(__Pyx_ListComp_Append(__pyx_t_9, (PyObject*)__pyx_t_14))) __PYX_ERR(0, 453, __pyx_L27_error)
+            __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+          }
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_XDECREF(__pyx_8genexpr4__pyx_v__atom); __pyx_8genexpr4__pyx_v__atom = 0;
+          goto __pyx_L30_exit_scope;
+          __pyx_L27_error:;
+          __Pyx_XDECREF(__pyx_8genexpr4__pyx_v__atom); __pyx_8genexpr4__pyx_v__atom = 0;
+          goto __pyx_L1_error;
+          __pyx_L30_exit_scope:;
+        } /* exit inner scope */
+        __Pyx_XDECREF_SET(__pyx_v_ringed_atom_ids, ((PyObject*)__pyx_t_9));
+        __pyx_t_9 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":454
+ *             if all_the_same:
+ *                 ringed_atom_ids = [id(_atom) for _atom in ring]
+ *                 if size % 2 == 0:  # look at two atoms             # <<<<<<<<<<<<<<
+ *                     atom1 = ring[flipping_atom_index]
+ *                     atom2 = ring[flipping_atom_index + size // 2]
+ */
+        __pyx_t_9 = __Pyx_PyInt_RemainderObjC(__pyx_v_size, __pyx_int_2, 2, 0, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 454, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_3 = __Pyx_PyInt_EqObjC(__pyx_t_9, __pyx_int_0, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 454, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_10 < 0)) __PYX_ERR(0, 454, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        if (__pyx_t_10) {
+
+          /* "rmgpy/molecule/symmetry.py":455
+ *                 ringed_atom_ids = [id(_atom) for _atom in ring]
+ *                 if size % 2 == 0:  # look at two atoms
+ *                     atom1 = ring[flipping_atom_index]             # <<<<<<<<<<<<<<
+ *                     atom2 = ring[flipping_atom_index + size // 2]
+ *                     non_ring_bonded_atoms = [bonded_atom for bonded_atom in itertools.chain(atom1.bonds.keys(), atom2.bonds.keys())
+ */
+          if (unlikely(__pyx_v_ring == Py_None)) {
+            PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+            __PYX_ERR(0, 455, __pyx_L1_error)
+          }
+          __pyx_t_3 = __Pyx_PyObject_GetItem(__pyx_v_ring, __pyx_v_flipping_atom_index); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 455, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __Pyx_XDECREF_SET(__pyx_v_atom1, __pyx_t_3);
+          __pyx_t_3 = 0;
+
+          /* "rmgpy/molecule/symmetry.py":456
+ *                 if size % 2 == 0:  # look at two atoms
+ *                     atom1 = ring[flipping_atom_index]
+ *                     atom2 = ring[flipping_atom_index + size // 2]             # <<<<<<<<<<<<<<
+ *                     non_ring_bonded_atoms = [bonded_atom for bonded_atom in itertools.chain(atom1.bonds.keys(), atom2.bonds.keys())
+ *                                              if id(bonded_atom) not in ringed_atom_ids]
+ */
+          if (unlikely(__pyx_v_ring == Py_None)) {
+            PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+            __PYX_ERR(0, 456, __pyx_L1_error)
+          }
+          __pyx_t_3 = __Pyx_PyInt_FloorDivideObjC(__pyx_v_size, __pyx_int_2, 2, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 456, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __pyx_t_9 = PyNumber_Add(__pyx_v_flipping_atom_index, __pyx_t_3); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 456, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __pyx_t_3 = __Pyx_PyObject_GetItem(__pyx_v_ring, __pyx_t_9); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 456, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __Pyx_XDECREF_SET(__pyx_v_atom2, __pyx_t_3);
+          __pyx_t_3 = 0;
+
+          /* "rmgpy/molecule/symmetry.py":457
+ *                     atom1 = ring[flipping_atom_index]
+ *                     atom2 = ring[flipping_atom_index + size // 2]
+ *                     non_ring_bonded_atoms = [bonded_atom for bonded_atom in itertools.chain(atom1.bonds.keys(), atom2.bonds.keys())             # <<<<<<<<<<<<<<
+ *                                              if id(bonded_atom) not in ringed_atom_ids]
+ *                     if len(non_ring_bonded_atoms) < 3:
+ */
+          { /* enter inner scope */
+            __pyx_t_3 = PyList_New(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 457, __pyx_L34_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            __Pyx_GetModuleGlobalName(__pyx_t_14, __pyx_n_s_itertools); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 457, __pyx_L34_error)
+            __Pyx_GOTREF(__pyx_t_14);
+            __pyx_t_15 = __Pyx_PyObject_GetAttrStr(__pyx_t_14, __pyx_n_s_chain); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 457, __pyx_L34_error)
+            __Pyx_GOTREF(__pyx_t_15);
+            __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+            __pyx_t_16 = __Pyx_PyObject_GetAttrStr(__pyx_v_atom1, __pyx_n_s_bonds); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 457, __pyx_L34_error)
+            __Pyx_GOTREF(__pyx_t_16);
+            __pyx_t_17 = __Pyx_PyObject_GetAttrStr(__pyx_t_16, __pyx_n_s_keys); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 457, __pyx_L34_error)
+            __Pyx_GOTREF(__pyx_t_17);
+            __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+            __pyx_t_16 = NULL;
+            if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_17))) {
+              __pyx_t_16 = PyMethod_GET_SELF(__pyx_t_17);
+              if (likely(__pyx_t_16)) {
+                PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_17);
+                __Pyx_INCREF(__pyx_t_16);
+                __Pyx_INCREF(function);
+                __Pyx_DECREF_SET(__pyx_t_17, function);
+              }
+            }
+            __pyx_t_14 = (__pyx_t_16) ? __Pyx_PyObject_CallOneArg(__pyx_t_17, __pyx_t_16) : __Pyx_PyObject_CallNoArg(__pyx_t_17);
+            __Pyx_XDECREF(__pyx_t_16); __pyx_t_16 = 0;
+            if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 457, __pyx_L34_error)
+            __Pyx_GOTREF(__pyx_t_14);
+            __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+            __pyx_t_16 = __Pyx_PyObject_GetAttrStr(__pyx_v_atom2, __pyx_n_s_bonds); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 457, __pyx_L34_error)
+            __Pyx_GOTREF(__pyx_t_16);
+            __pyx_t_18 = __Pyx_PyObject_GetAttrStr(__pyx_t_16, __pyx_n_s_keys); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 457, __pyx_L34_error)
+            __Pyx_GOTREF(__pyx_t_18);
+            __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+            __pyx_t_16 = NULL;
+            if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_18))) {
+              __pyx_t_16 = PyMethod_GET_SELF(__pyx_t_18);
+              if (likely(__pyx_t_16)) {
+                PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_18);
+                __Pyx_INCREF(__pyx_t_16);
+                __Pyx_INCREF(function);
+                __Pyx_DECREF_SET(__pyx_t_18, function);
+              }
+            }
+            __pyx_t_17 = (__pyx_t_16) ? __Pyx_PyObject_CallOneArg(__pyx_t_18, __pyx_t_16) : __Pyx_PyObject_CallNoArg(__pyx_t_18);
+            __Pyx_XDECREF(__pyx_t_16); __pyx_t_16 = 0;
+            if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 457, __pyx_L34_error)
+            __Pyx_GOTREF(__pyx_t_17);
+            __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
+            __pyx_t_18 = NULL;
+            __pyx_t_19 = 0;
+            if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_15))) {
+              __pyx_t_18 = PyMethod_GET_SELF(__pyx_t_15);
+              if (likely(__pyx_t_18)) {
+                PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_15);
+                __Pyx_INCREF(__pyx_t_18);
+                __Pyx_INCREF(function);
+                __Pyx_DECREF_SET(__pyx_t_15, function);
+                __pyx_t_19 = 1;
+              }
+            }
+            #if CYTHON_FAST_PYCALL
+            if (PyFunction_Check(__pyx_t_15)) {
+              PyObject *__pyx_temp[3] = {__pyx_t_18, __pyx_t_14, __pyx_t_17};
+              __pyx_t_9 = __Pyx_PyFunction_FastCall(__pyx_t_15, __pyx_temp+1-__pyx_t_19, 2+__pyx_t_19); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 457, __pyx_L34_error)
+              __Pyx_XDECREF(__pyx_t_18); __pyx_t_18 = 0;
+              __Pyx_GOTREF(__pyx_t_9);
+              __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+              __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+            } else
+            #endif
+            #if CYTHON_FAST_PYCCALL
+            if (__Pyx_PyFastCFunction_Check(__pyx_t_15)) {
+              PyObject *__pyx_temp[3] = {__pyx_t_18, __pyx_t_14, __pyx_t_17};
+              __pyx_t_9 = __Pyx_PyCFunction_FastCall(__pyx_t_15, __pyx_temp+1-__pyx_t_19, 2+__pyx_t_19); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 457, __pyx_L34_error)
+              __Pyx_XDECREF(__pyx_t_18); __pyx_t_18 = 0;
+              __Pyx_GOTREF(__pyx_t_9);
+              __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+              __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+            } else
+            #endif
+            {
+              __pyx_t_16 = PyTuple_New(2+__pyx_t_19); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 457, __pyx_L34_error)
+              __Pyx_GOTREF(__pyx_t_16);
+              if (__pyx_t_18) {
+                __Pyx_GIVEREF(__pyx_t_18); PyTuple_SET_ITEM(__pyx_t_16, 0, __pyx_t_18); __pyx_t_18 = NULL;
+              }
+              __Pyx_GIVEREF(__pyx_t_14);
+              PyTuple_SET_ITEM(__pyx_t_16, 0+__pyx_t_19, __pyx_t_14);
+              __Pyx_GIVEREF(__pyx_t_17);
+              PyTuple_SET_ITEM(__pyx_t_16, 1+__pyx_t_19, __pyx_t_17);
+              __pyx_t_14 = 0;
+              __pyx_t_17 = 0;
+              __pyx_t_9 = __Pyx_PyObject_Call(__pyx_t_15, __pyx_t_16, NULL); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 457, __pyx_L34_error)
+              __Pyx_GOTREF(__pyx_t_9);
+              __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+            }
+            __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+            if (likely(PyList_CheckExact(__pyx_t_9)) || PyTuple_CheckExact(__pyx_t_9)) {
+              __pyx_t_15 = __pyx_t_9; __Pyx_INCREF(__pyx_t_15); __pyx_t_12 = 0;
+              __pyx_t_8 = NULL;
+            } else {
+              __pyx_t_12 = -1; __pyx_t_15 = PyObject_GetIter(__pyx_t_9); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 457, __pyx_L34_error)
+              __Pyx_GOTREF(__pyx_t_15);
+              __pyx_t_8 = Py_TYPE(__pyx_t_15)->tp_iternext; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 457, __pyx_L34_error)
+            }
+            __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+            for (;;) {
+              if (likely(!__pyx_t_8)) {
+                if (likely(PyList_CheckExact(__pyx_t_15))) {
+                  if (__pyx_t_12 >= PyList_GET_SIZE(__pyx_t_15)) break;
+                  #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                  __pyx_t_9 = PyList_GET_ITEM(__pyx_t_15, __pyx_t_12); __Pyx_INCREF(__pyx_t_9); __pyx_t_12++; if (unlikely(0 < 0)) __PYX_ERR(0, 457, __pyx_L34_error)
+                  #else
+                  __pyx_t_9 = PySequence_ITEM(__pyx_t_15, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 457, __pyx_L34_error)
+                  __Pyx_GOTREF(__pyx_t_9);
+                  #endif
+                } else {
+                  if (__pyx_t_12 >= PyTuple_GET_SIZE(__pyx_t_15)) break;
+                  #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                  __pyx_t_9 = PyTuple_GET_ITEM(__pyx_t_15, __pyx_t_12); __Pyx_INCREF(__pyx_t_9); __pyx_t_12++; if (unlikely(0 < 0)) __PYX_ERR(0, 457, __pyx_L34_error)
+                  #else
+                  __pyx_t_9 = PySequence_ITEM(__pyx_t_15, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 457, __pyx_L34_error)
+                  __Pyx_GOTREF(__pyx_t_9);
+                  #endif
+                }
+              } else {
+                __pyx_t_9 = __pyx_t_8(__pyx_t_15);
+                if (unlikely(!__pyx_t_9)) {
+                  PyObject* exc_type = PyErr_Occurred();
+                  if (exc_type) {
+                    if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+                    else __PYX_ERR(0, 457, __pyx_L34_error)
+                  }
+                  break;
+                }
+                __Pyx_GOTREF(__pyx_t_9);
+              }
+              __Pyx_XDECREF_SET(__pyx_8genexpr5__pyx_v_bonded_atom, __pyx_t_9);
+              __pyx_t_9 = 0;
+
+              /* "rmgpy/molecule/symmetry.py":458
+ *                     atom2 = ring[flipping_atom_index + size // 2]
+ *                     non_ring_bonded_atoms = [bonded_atom for bonded_atom in itertools.chain(atom1.bonds.keys(), atom2.bonds.keys())
+ *                                              if id(bonded_atom) not in ringed_atom_ids]             # <<<<<<<<<<<<<<
+ *                     if len(non_ring_bonded_atoms) < 3:
+ *                         pass  # all_the_same still true
+ */
+              __pyx_t_9 = __Pyx_PyObject_CallOneArg(__pyx_builtin_id, __pyx_8genexpr5__pyx_v_bonded_atom); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 458, __pyx_L34_error)
+              __Pyx_GOTREF(__pyx_t_9);
+              __pyx_t_10 = (__Pyx_PySequence_ContainsTF(__pyx_t_9, __pyx_v_ringed_atom_ids, Py_NE)); if (unlikely(__pyx_t_10 < 0)) __PYX_ERR(0, 458, __pyx_L34_error)
+              __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+              __pyx_t_11 = (__pyx_t_10 != 0);
+              if (__pyx_t_11) {
+
+                /* "rmgpy/molecule/symmetry.py":457
+ *                     atom1 = ring[flipping_atom_index]
+ *                     atom2 = ring[flipping_atom_index + size // 2]
+ *                     non_ring_bonded_atoms = [bonded_atom for bonded_atom in itertools.chain(atom1.bonds.keys(), atom2.bonds.keys())             # <<<<<<<<<<<<<<
+ *                                              if id(bonded_atom) not in ringed_atom_ids]
+ *                     if len(non_ring_bonded_atoms) < 3:
+ */
+                if (unlikely(__Pyx_ListComp_Append(__pyx_t_3, (PyObject*)__pyx_8genexpr5__pyx_v_bonded_atom))) __PYX_ERR(0, 457, __pyx_L34_error)
+
+                /* "rmgpy/molecule/symmetry.py":458
+ *                     atom2 = ring[flipping_atom_index + size // 2]
+ *                     non_ring_bonded_atoms = [bonded_atom for bonded_atom in itertools.chain(atom1.bonds.keys(), atom2.bonds.keys())
+ *                                              if id(bonded_atom) not in ringed_atom_ids]             # <<<<<<<<<<<<<<
+ *                     if len(non_ring_bonded_atoms) < 3:
+ *                         pass  # all_the_same still true
+ */
+              }
+
+              /* "rmgpy/molecule/symmetry.py":457
+ *                     atom1 = ring[flipping_atom_index]
+ *                     atom2 = ring[flipping_atom_index + size // 2]
+ *                     non_ring_bonded_atoms = [bonded_atom for bonded_atom in itertools.chain(atom1.bonds.keys(), atom2.bonds.keys())             # <<<<<<<<<<<<<<
+ *                                              if id(bonded_atom) not in ringed_atom_ids]
+ *                     if len(non_ring_bonded_atoms) < 3:
+ */
+            }
+            __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+            __Pyx_XDECREF(__pyx_8genexpr5__pyx_v_bonded_atom); __pyx_8genexpr5__pyx_v_bonded_atom = 0;
+            goto __pyx_L38_exit_scope;
+            __pyx_L34_error:;
+            __Pyx_XDECREF(__pyx_8genexpr5__pyx_v_bonded_atom); __pyx_8genexpr5__pyx_v_bonded_atom = 0;
+            goto __pyx_L1_error;
+            __pyx_L38_exit_scope:;
+          } /* exit inner scope */
+          __Pyx_XDECREF_SET(__pyx_v_non_ring_bonded_atoms, ((PyObject*)__pyx_t_3));
+          __pyx_t_3 = 0;
+
+          /* "rmgpy/molecule/symmetry.py":459
+ *                     non_ring_bonded_atoms = [bonded_atom for bonded_atom in itertools.chain(atom1.bonds.keys(), atom2.bonds.keys())
+ *                                              if id(bonded_atom) not in ringed_atom_ids]
+ *                     if len(non_ring_bonded_atoms) < 3:             # <<<<<<<<<<<<<<
+ *                         pass  # all_the_same still true
+ *                     elif len(non_ring_bonded_atoms) == 3:
+ */
+          __pyx_t_12 = PyList_GET_SIZE(__pyx_v_non_ring_bonded_atoms); if (unlikely(__pyx_t_12 == ((Py_ssize_t)-1))) __PYX_ERR(0, 459, __pyx_L1_error)
+          __pyx_t_11 = ((__pyx_t_12 < 3) != 0);
+          if (__pyx_t_11) {
+            goto __pyx_L39;
+          }
+
+          /* "rmgpy/molecule/symmetry.py":461
+ *                     if len(non_ring_bonded_atoms) < 3:
+ *                         pass  # all_the_same still true
+ *                     elif len(non_ring_bonded_atoms) == 3:             # <<<<<<<<<<<<<<
+ *                         # at least one of these much be a match for flipping to happen
+ *                         identical = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[1])
+ */
+          __pyx_t_12 = PyList_GET_SIZE(__pyx_v_non_ring_bonded_atoms); if (unlikely(__pyx_t_12 == ((Py_ssize_t)-1))) __PYX_ERR(0, 461, __pyx_L1_error)
+          __pyx_t_11 = ((__pyx_t_12 == 3) != 0);
+          if (__pyx_t_11) {
+
+            /* "rmgpy/molecule/symmetry.py":463
+ *                     elif len(non_ring_bonded_atoms) == 3:
+ *                         # at least one of these much be a match for flipping to happen
+ *                         identical = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[1])             # <<<<<<<<<<<<<<
+ *                         identical2 = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[2])
+ *                         identical3 = _indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[2])
+ */
+            __pyx_t_3 = __Pyx_GetItemInt_List(__pyx_v_non_ring_bonded_atoms, 0, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 463, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 463, __pyx_L1_error)
+            __pyx_t_15 = __Pyx_GetItemInt_List(__pyx_v_non_ring_bonded_atoms, 1, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 463, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_15);
+            if (!(likely(((__pyx_t_15) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_15, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 463, __pyx_L1_error)
+            __pyx_t_11 = __pyx_f_5rmgpy_8molecule_8symmetry__indistinguishable(((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_3), ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_15), 0); if (unlikely(__pyx_t_11 == ((int)-2))) __PYX_ERR(0, 463, __pyx_L1_error)
+            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+            __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+            __pyx_v_identical = __pyx_t_11;
+
+            /* "rmgpy/molecule/symmetry.py":464
+ *                         # at least one of these much be a match for flipping to happen
+ *                         identical = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[1])
+ *                         identical2 = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[2])             # <<<<<<<<<<<<<<
+ *                         identical3 = _indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[2])
+ *                         if not (identical or identical2 or identical3):
+ */
+            __pyx_t_15 = __Pyx_GetItemInt_List(__pyx_v_non_ring_bonded_atoms, 0, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 464, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_15);
+            if (!(likely(((__pyx_t_15) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_15, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 464, __pyx_L1_error)
+            __pyx_t_3 = __Pyx_GetItemInt_List(__pyx_v_non_ring_bonded_atoms, 2, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 464, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 464, __pyx_L1_error)
+            __pyx_t_11 = __pyx_f_5rmgpy_8molecule_8symmetry__indistinguishable(((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_15), ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_3), 0); if (unlikely(__pyx_t_11 == ((int)-2))) __PYX_ERR(0, 464, __pyx_L1_error)
+            __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+            __pyx_v_identical2 = __pyx_t_11;
+
+            /* "rmgpy/molecule/symmetry.py":465
+ *                         identical = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[1])
+ *                         identical2 = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[2])
+ *                         identical3 = _indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[2])             # <<<<<<<<<<<<<<
+ *                         if not (identical or identical2 or identical3):
+ *                             all_the_same = False
+ */
+            __pyx_t_3 = __Pyx_GetItemInt_List(__pyx_v_non_ring_bonded_atoms, 1, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 465, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 465, __pyx_L1_error)
+            __pyx_t_15 = __Pyx_GetItemInt_List(__pyx_v_non_ring_bonded_atoms, 2, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 465, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_15);
+            if (!(likely(((__pyx_t_15) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_15, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 465, __pyx_L1_error)
+            __pyx_t_11 = __pyx_f_5rmgpy_8molecule_8symmetry__indistinguishable(((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_3), ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_15), 0); if (unlikely(__pyx_t_11 == ((int)-2))) __PYX_ERR(0, 465, __pyx_L1_error)
+            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+            __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+            __pyx_v_identical3 = __pyx_t_11;
+
+            /* "rmgpy/molecule/symmetry.py":466
+ *                         identical2 = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[2])
+ *                         identical3 = _indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[2])
+ *                         if not (identical or identical2 or identical3):             # <<<<<<<<<<<<<<
+ *                             all_the_same = False
+ *                     elif len(non_ring_bonded_atoms) == 4:
+ */
+            __pyx_t_10 = (__pyx_v_identical != 0);
+            if (!__pyx_t_10) {
+            } else {
+              __pyx_t_11 = __pyx_t_10;
+              goto __pyx_L41_bool_binop_done;
+            }
+            __pyx_t_10 = (__pyx_v_identical2 != 0);
+            if (!__pyx_t_10) {
+            } else {
+              __pyx_t_11 = __pyx_t_10;
+              goto __pyx_L41_bool_binop_done;
+            }
+            __pyx_t_10 = (__pyx_v_identical3 != 0);
+            __pyx_t_11 = __pyx_t_10;
+            __pyx_L41_bool_binop_done:;
+            __pyx_t_10 = ((!__pyx_t_11) != 0);
+            if (__pyx_t_10) {
+
+              /* "rmgpy/molecule/symmetry.py":467
+ *                         identical3 = _indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[2])
+ *                         if not (identical or identical2 or identical3):
+ *                             all_the_same = False             # <<<<<<<<<<<<<<
+ *                     elif len(non_ring_bonded_atoms) == 4:
+ *                         same_sides = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[1]) and \
+ */
+              __pyx_v_all_the_same = 0;
+
+              /* "rmgpy/molecule/symmetry.py":466
+ *                         identical2 = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[2])
+ *                         identical3 = _indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[2])
+ *                         if not (identical or identical2 or identical3):             # <<<<<<<<<<<<<<
+ *                             all_the_same = False
+ *                     elif len(non_ring_bonded_atoms) == 4:
+ */
+            }
+
+            /* "rmgpy/molecule/symmetry.py":461
+ *                     if len(non_ring_bonded_atoms) < 3:
+ *                         pass  # all_the_same still true
+ *                     elif len(non_ring_bonded_atoms) == 3:             # <<<<<<<<<<<<<<
+ *                         # at least one of these much be a match for flipping to happen
+ *                         identical = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[1])
+ */
+            goto __pyx_L39;
+          }
+
+          /* "rmgpy/molecule/symmetry.py":468
+ *                         if not (identical or identical2 or identical3):
+ *                             all_the_same = False
+ *                     elif len(non_ring_bonded_atoms) == 4:             # <<<<<<<<<<<<<<
+ *                         same_sides = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[1]) and \
+ *                                      _indistinguishable(non_ring_bonded_atoms[2], non_ring_bonded_atoms[3])
+ */
+          __pyx_t_12 = PyList_GET_SIZE(__pyx_v_non_ring_bonded_atoms); if (unlikely(__pyx_t_12 == ((Py_ssize_t)-1))) __PYX_ERR(0, 468, __pyx_L1_error)
+          __pyx_t_10 = ((__pyx_t_12 == 4) != 0);
+          if (__pyx_t_10) {
+
+            /* "rmgpy/molecule/symmetry.py":469
+ *                             all_the_same = False
+ *                     elif len(non_ring_bonded_atoms) == 4:
+ *                         same_sides = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[1]) and \             # <<<<<<<<<<<<<<
+ *                                      _indistinguishable(non_ring_bonded_atoms[2], non_ring_bonded_atoms[3])
+ *                         if not same_sides:
+ */
+            __pyx_t_15 = __Pyx_GetItemInt_List(__pyx_v_non_ring_bonded_atoms, 0, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 469, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_15);
+            if (!(likely(((__pyx_t_15) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_15, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 469, __pyx_L1_error)
+            __pyx_t_3 = __Pyx_GetItemInt_List(__pyx_v_non_ring_bonded_atoms, 1, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 469, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 469, __pyx_L1_error)
+            __pyx_t_11 = __pyx_f_5rmgpy_8molecule_8symmetry__indistinguishable(((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_15), ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_3), 0); if (unlikely(__pyx_t_11 == ((int)-2))) __PYX_ERR(0, 469, __pyx_L1_error)
+            __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+            __pyx_t_20 = (__pyx_t_11 != 0);
+            if (__pyx_t_20) {
+            } else {
+              __pyx_t_10 = __pyx_t_20;
+              goto __pyx_L44_bool_binop_done;
+            }
+
+            /* "rmgpy/molecule/symmetry.py":470
+ *                     elif len(non_ring_bonded_atoms) == 4:
+ *                         same_sides = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[1]) and \
+ *                                      _indistinguishable(non_ring_bonded_atoms[2], non_ring_bonded_atoms[3])             # <<<<<<<<<<<<<<
+ *                         if not same_sides:
+ *                             atom0_matching = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[2]) or \
+ */
+            __pyx_t_3 = __Pyx_GetItemInt_List(__pyx_v_non_ring_bonded_atoms, 2, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 470, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 470, __pyx_L1_error)
+            __pyx_t_15 = __Pyx_GetItemInt_List(__pyx_v_non_ring_bonded_atoms, 3, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 470, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_15);
+            if (!(likely(((__pyx_t_15) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_15, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 470, __pyx_L1_error)
+            __pyx_t_20 = __pyx_f_5rmgpy_8molecule_8symmetry__indistinguishable(((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_3), ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_15), 0); if (unlikely(__pyx_t_20 == ((int)-2))) __PYX_ERR(0, 470, __pyx_L1_error)
+            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+            __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+            __pyx_t_11 = (__pyx_t_20 != 0);
+            __pyx_t_10 = __pyx_t_11;
+            __pyx_L44_bool_binop_done:;
+            __pyx_v_same_sides = __pyx_t_10;
+
+            /* "rmgpy/molecule/symmetry.py":471
+ *                         same_sides = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[1]) and \
+ *                                      _indistinguishable(non_ring_bonded_atoms[2], non_ring_bonded_atoms[3])
+ *                         if not same_sides:             # <<<<<<<<<<<<<<
+ *                             atom0_matching = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[2]) or \
+ *                                              _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[3])
+ */
+            __pyx_t_10 = ((!(__pyx_v_same_sides != 0)) != 0);
+            if (__pyx_t_10) {
+
+              /* "rmgpy/molecule/symmetry.py":472
+ *                                      _indistinguishable(non_ring_bonded_atoms[2], non_ring_bonded_atoms[3])
+ *                         if not same_sides:
+ *                             atom0_matching = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[2]) or \             # <<<<<<<<<<<<<<
+ *                                              _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[3])
+ *                             atom1_matching = _indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[2]) or \
+ */
+              __pyx_t_15 = __Pyx_GetItemInt_List(__pyx_v_non_ring_bonded_atoms, 0, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 472, __pyx_L1_error)
+              __Pyx_GOTREF(__pyx_t_15);
+              if (!(likely(((__pyx_t_15) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_15, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 472, __pyx_L1_error)
+              __pyx_t_3 = __Pyx_GetItemInt_List(__pyx_v_non_ring_bonded_atoms, 2, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 472, __pyx_L1_error)
+              __Pyx_GOTREF(__pyx_t_3);
+              if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 472, __pyx_L1_error)
+              __pyx_t_11 = __pyx_f_5rmgpy_8molecule_8symmetry__indistinguishable(((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_15), ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_3), 0); if (unlikely(__pyx_t_11 == ((int)-2))) __PYX_ERR(0, 472, __pyx_L1_error)
+              __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+              __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+              __pyx_t_20 = (__pyx_t_11 != 0);
+              if (!__pyx_t_20) {
+              } else {
+                __pyx_t_10 = __pyx_t_20;
+                goto __pyx_L47_bool_binop_done;
+              }
+
+              /* "rmgpy/molecule/symmetry.py":473
+ *                         if not same_sides:
+ *                             atom0_matching = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[2]) or \
+ *                                              _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[3])             # <<<<<<<<<<<<<<
+ *                             atom1_matching = _indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[2]) or \
+ *                                              _indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[3])
+ */
+              __pyx_t_3 = __Pyx_GetItemInt_List(__pyx_v_non_ring_bonded_atoms, 0, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 473, __pyx_L1_error)
+              __Pyx_GOTREF(__pyx_t_3);
+              if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 473, __pyx_L1_error)
+              __pyx_t_15 = __Pyx_GetItemInt_List(__pyx_v_non_ring_bonded_atoms, 3, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 473, __pyx_L1_error)
+              __Pyx_GOTREF(__pyx_t_15);
+              if (!(likely(((__pyx_t_15) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_15, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 473, __pyx_L1_error)
+              __pyx_t_20 = __pyx_f_5rmgpy_8molecule_8symmetry__indistinguishable(((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_3), ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_15), 0); if (unlikely(__pyx_t_20 == ((int)-2))) __PYX_ERR(0, 473, __pyx_L1_error)
+              __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+              __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+              __pyx_t_11 = (__pyx_t_20 != 0);
+              __pyx_t_10 = __pyx_t_11;
+              __pyx_L47_bool_binop_done:;
+              __pyx_v_atom0_matching = __pyx_t_10;
+
+              /* "rmgpy/molecule/symmetry.py":474
+ *                             atom0_matching = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[2]) or \
+ *                                              _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[3])
+ *                             atom1_matching = _indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[2]) or \             # <<<<<<<<<<<<<<
+ *                                              _indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[3])
+ *                             if not (atom0_matching and atom1_matching):
+ */
+              __pyx_t_15 = __Pyx_GetItemInt_List(__pyx_v_non_ring_bonded_atoms, 1, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 474, __pyx_L1_error)
+              __Pyx_GOTREF(__pyx_t_15);
+              if (!(likely(((__pyx_t_15) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_15, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 474, __pyx_L1_error)
+              __pyx_t_3 = __Pyx_GetItemInt_List(__pyx_v_non_ring_bonded_atoms, 2, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 474, __pyx_L1_error)
+              __Pyx_GOTREF(__pyx_t_3);
+              if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 474, __pyx_L1_error)
+              __pyx_t_11 = __pyx_f_5rmgpy_8molecule_8symmetry__indistinguishable(((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_15), ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_3), 0); if (unlikely(__pyx_t_11 == ((int)-2))) __PYX_ERR(0, 474, __pyx_L1_error)
+              __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+              __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+              __pyx_t_20 = (__pyx_t_11 != 0);
+              if (!__pyx_t_20) {
+              } else {
+                __pyx_t_10 = __pyx_t_20;
+                goto __pyx_L49_bool_binop_done;
+              }
+
+              /* "rmgpy/molecule/symmetry.py":475
+ *                                              _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[3])
+ *                             atom1_matching = _indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[2]) or \
+ *                                              _indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[3])             # <<<<<<<<<<<<<<
+ *                             if not (atom0_matching and atom1_matching):
+ *                                 all_the_same = False
+ */
+              __pyx_t_3 = __Pyx_GetItemInt_List(__pyx_v_non_ring_bonded_atoms, 1, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 475, __pyx_L1_error)
+              __Pyx_GOTREF(__pyx_t_3);
+              if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 475, __pyx_L1_error)
+              __pyx_t_15 = __Pyx_GetItemInt_List(__pyx_v_non_ring_bonded_atoms, 3, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 475, __pyx_L1_error)
+              __Pyx_GOTREF(__pyx_t_15);
+              if (!(likely(((__pyx_t_15) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_15, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 475, __pyx_L1_error)
+              __pyx_t_20 = __pyx_f_5rmgpy_8molecule_8symmetry__indistinguishable(((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_3), ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_15), 0); if (unlikely(__pyx_t_20 == ((int)-2))) __PYX_ERR(0, 475, __pyx_L1_error)
+              __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+              __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+              __pyx_t_11 = (__pyx_t_20 != 0);
+              __pyx_t_10 = __pyx_t_11;
+              __pyx_L49_bool_binop_done:;
+              __pyx_v_atom1_matching = __pyx_t_10;
+
+              /* "rmgpy/molecule/symmetry.py":476
+ *                             atom1_matching = _indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[2]) or \
+ *                                              _indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[3])
+ *                             if not (atom0_matching and atom1_matching):             # <<<<<<<<<<<<<<
+ *                                 all_the_same = False
+ *                 else:
+ */
+              __pyx_t_11 = (__pyx_v_atom0_matching != 0);
+              if (__pyx_t_11) {
+              } else {
+                __pyx_t_10 = __pyx_t_11;
+                goto __pyx_L52_bool_binop_done;
+              }
+              __pyx_t_11 = (__pyx_v_atom1_matching != 0);
+              __pyx_t_10 = __pyx_t_11;
+              __pyx_L52_bool_binop_done:;
+              __pyx_t_11 = ((!__pyx_t_10) != 0);
+              if (__pyx_t_11) {
+
+                /* "rmgpy/molecule/symmetry.py":477
+ *                                              _indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[3])
+ *                             if not (atom0_matching and atom1_matching):
+ *                                 all_the_same = False             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     atom = ring[flipping_atom_index]
+ */
+                __pyx_v_all_the_same = 0;
+
+                /* "rmgpy/molecule/symmetry.py":476
+ *                             atom1_matching = _indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[2]) or \
+ *                                              _indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[3])
+ *                             if not (atom0_matching and atom1_matching):             # <<<<<<<<<<<<<<
+ *                                 all_the_same = False
+ *                 else:
+ */
+              }
+
+              /* "rmgpy/molecule/symmetry.py":471
+ *                         same_sides = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[1]) and \
+ *                                      _indistinguishable(non_ring_bonded_atoms[2], non_ring_bonded_atoms[3])
+ *                         if not same_sides:             # <<<<<<<<<<<<<<
+ *                             atom0_matching = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[2]) or \
+ *                                              _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[3])
+ */
+            }
+
+            /* "rmgpy/molecule/symmetry.py":468
+ *                         if not (identical or identical2 or identical3):
+ *                             all_the_same = False
+ *                     elif len(non_ring_bonded_atoms) == 4:             # <<<<<<<<<<<<<<
+ *                         same_sides = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[1]) and \
+ *                                      _indistinguishable(non_ring_bonded_atoms[2], non_ring_bonded_atoms[3])
+ */
+          }
+          __pyx_L39:;
+
+          /* "rmgpy/molecule/symmetry.py":454
+ *             if all_the_same:
+ *                 ringed_atom_ids = [id(_atom) for _atom in ring]
+ *                 if size % 2 == 0:  # look at two atoms             # <<<<<<<<<<<<<<
+ *                     atom1 = ring[flipping_atom_index]
+ *                     atom2 = ring[flipping_atom_index + size // 2]
+ */
+          goto __pyx_L31;
+        }
+
+        /* "rmgpy/molecule/symmetry.py":479
+ *                                 all_the_same = False
+ *                 else:
+ *                     atom = ring[flipping_atom_index]             # <<<<<<<<<<<<<<
+ *                     non_ring_bonded_atoms = [bonded_atom for bonded_atom in atom.bonds.keys()
+ *                                              if id(bonded_atom) not in ringed_atom_ids]
+ */
+        /*else*/ {
+          if (unlikely(__pyx_v_ring == Py_None)) {
+            PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+            __PYX_ERR(0, 479, __pyx_L1_error)
+          }
+          __pyx_t_15 = __Pyx_PyObject_GetItem(__pyx_v_ring, __pyx_v_flipping_atom_index); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 479, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_15);
+          __Pyx_XDECREF_SET(__pyx_v_atom, __pyx_t_15);
+          __pyx_t_15 = 0;
+
+          /* "rmgpy/molecule/symmetry.py":480
+ *                 else:
+ *                     atom = ring[flipping_atom_index]
+ *                     non_ring_bonded_atoms = [bonded_atom for bonded_atom in atom.bonds.keys()             # <<<<<<<<<<<<<<
+ *                                              if id(bonded_atom) not in ringed_atom_ids]
+ *                     if len(non_ring_bonded_atoms) < 2:
+ */
+          { /* enter inner scope */
+            __pyx_t_15 = PyList_New(0); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 480, __pyx_L56_error)
+            __Pyx_GOTREF(__pyx_t_15);
+            __pyx_t_12 = 0;
+            __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_atom, __pyx_n_s_bonds); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 480, __pyx_L56_error)
+            __Pyx_GOTREF(__pyx_t_9);
+            if (unlikely(__pyx_t_9 == Py_None)) {
+              PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "keys");
+              __PYX_ERR(0, 480, __pyx_L56_error)
+            }
+            __pyx_t_16 = __Pyx_dict_iterator(__pyx_t_9, 0, __pyx_n_s_keys, (&__pyx_t_21), (&__pyx_t_19)); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 480, __pyx_L56_error)
+            __Pyx_GOTREF(__pyx_t_16);
+            __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+            __Pyx_XDECREF(__pyx_t_3);
+            __pyx_t_3 = __pyx_t_16;
+            __pyx_t_16 = 0;
+            while (1) {
+              __pyx_t_22 = __Pyx_dict_iter_next(__pyx_t_3, __pyx_t_21, &__pyx_t_12, &__pyx_t_16, NULL, NULL, __pyx_t_19);
+              if (unlikely(__pyx_t_22 == 0)) break;
+              if (unlikely(__pyx_t_22 == -1)) __PYX_ERR(0, 480, __pyx_L56_error)
+              __Pyx_GOTREF(__pyx_t_16);
+              __Pyx_XDECREF_SET(__pyx_8genexpr6__pyx_v_bonded_atom, __pyx_t_16);
+              __pyx_t_16 = 0;
+
+              /* "rmgpy/molecule/symmetry.py":481
+ *                     atom = ring[flipping_atom_index]
+ *                     non_ring_bonded_atoms = [bonded_atom for bonded_atom in atom.bonds.keys()
+ *                                              if id(bonded_atom) not in ringed_atom_ids]             # <<<<<<<<<<<<<<
+ *                     if len(non_ring_bonded_atoms) < 2:
+ *                         pass  # all_the_same still true
+ */
+              __pyx_t_16 = __Pyx_PyObject_CallOneArg(__pyx_builtin_id, __pyx_8genexpr6__pyx_v_bonded_atom); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 481, __pyx_L56_error)
+              __Pyx_GOTREF(__pyx_t_16);
+              __pyx_t_11 = (__Pyx_PySequence_ContainsTF(__pyx_t_16, __pyx_v_ringed_atom_ids, Py_NE)); if (unlikely(__pyx_t_11 < 0)) __PYX_ERR(0, 481, __pyx_L56_error)
+              __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+              __pyx_t_10 = (__pyx_t_11 != 0);
+              if (__pyx_t_10) {
+
+                /* "rmgpy/molecule/symmetry.py":480
+ *                 else:
+ *                     atom = ring[flipping_atom_index]
+ *                     non_ring_bonded_atoms = [bonded_atom for bonded_atom in atom.bonds.keys()             # <<<<<<<<<<<<<<
+ *                                              if id(bonded_atom) not in ringed_atom_ids]
+ *                     if len(non_ring_bonded_atoms) < 2:
+ */
+                if (unlikely(__Pyx_ListComp_Append(__pyx_t_15, (PyObject*)__pyx_8genexpr6__pyx_v_bonded_atom))) __PYX_ERR(0, 480, __pyx_L56_error)
+
+                /* "rmgpy/molecule/symmetry.py":481
+ *                     atom = ring[flipping_atom_index]
+ *                     non_ring_bonded_atoms = [bonded_atom for bonded_atom in atom.bonds.keys()
+ *                                              if id(bonded_atom) not in ringed_atom_ids]             # <<<<<<<<<<<<<<
+ *                     if len(non_ring_bonded_atoms) < 2:
+ *                         pass  # all_the_same still true
+ */
+              }
+            }
+            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+            __Pyx_XDECREF(__pyx_8genexpr6__pyx_v_bonded_atom); __pyx_8genexpr6__pyx_v_bonded_atom = 0;
+            goto __pyx_L60_exit_scope;
+            __pyx_L56_error:;
+            __Pyx_XDECREF(__pyx_8genexpr6__pyx_v_bonded_atom); __pyx_8genexpr6__pyx_v_bonded_atom = 0;
+            goto __pyx_L1_error;
+            __pyx_L60_exit_scope:;
+          } /* exit inner scope */
+          __Pyx_XDECREF_SET(__pyx_v_non_ring_bonded_atoms, ((PyObject*)__pyx_t_15));
+          __pyx_t_15 = 0;
+
+          /* "rmgpy/molecule/symmetry.py":482
+ *                     non_ring_bonded_atoms = [bonded_atom for bonded_atom in atom.bonds.keys()
+ *                                              if id(bonded_atom) not in ringed_atom_ids]
+ *                     if len(non_ring_bonded_atoms) < 2:             # <<<<<<<<<<<<<<
+ *                         pass  # all_the_same still true
+ *                     elif len(non_ring_bonded_atoms) == 2:
+ */
+          __pyx_t_21 = PyList_GET_SIZE(__pyx_v_non_ring_bonded_atoms); if (unlikely(__pyx_t_21 == ((Py_ssize_t)-1))) __PYX_ERR(0, 482, __pyx_L1_error)
+          __pyx_t_10 = ((__pyx_t_21 < 2) != 0);
+          if (__pyx_t_10) {
+            goto __pyx_L61;
+          }
+
+          /* "rmgpy/molecule/symmetry.py":484
+ *                     if len(non_ring_bonded_atoms) < 2:
+ *                         pass  # all_the_same still true
+ *                     elif len(non_ring_bonded_atoms) == 2:             # <<<<<<<<<<<<<<
+ *                         identical = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[1])
+ *                         if not identical:
+ */
+          __pyx_t_21 = PyList_GET_SIZE(__pyx_v_non_ring_bonded_atoms); if (unlikely(__pyx_t_21 == ((Py_ssize_t)-1))) __PYX_ERR(0, 484, __pyx_L1_error)
+          __pyx_t_10 = ((__pyx_t_21 == 2) != 0);
+          if (__pyx_t_10) {
+
+            /* "rmgpy/molecule/symmetry.py":485
+ *                         pass  # all_the_same still true
+ *                     elif len(non_ring_bonded_atoms) == 2:
+ *                         identical = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[1])             # <<<<<<<<<<<<<<
+ *                         if not identical:
+ *                             # flipping a tetrahedral will not work
+ */
+            __pyx_t_15 = __Pyx_GetItemInt_List(__pyx_v_non_ring_bonded_atoms, 0, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 485, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_15);
+            if (!(likely(((__pyx_t_15) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_15, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 485, __pyx_L1_error)
+            __pyx_t_3 = __Pyx_GetItemInt_List(__pyx_v_non_ring_bonded_atoms, 1, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 485, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 485, __pyx_L1_error)
+            __pyx_t_10 = __pyx_f_5rmgpy_8molecule_8symmetry__indistinguishable(((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_15), ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_3), 0); if (unlikely(__pyx_t_10 == ((int)-2))) __PYX_ERR(0, 485, __pyx_L1_error)
+            __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+            __pyx_v_identical = __pyx_t_10;
+
+            /* "rmgpy/molecule/symmetry.py":486
+ *                     elif len(non_ring_bonded_atoms) == 2:
+ *                         identical = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[1])
+ *                         if not identical:             # <<<<<<<<<<<<<<
+ *                             # flipping a tetrahedral will not work
+ *                             all_the_same = False
+ */
+            __pyx_t_10 = ((!(__pyx_v_identical != 0)) != 0);
+            if (__pyx_t_10) {
+
+              /* "rmgpy/molecule/symmetry.py":488
+ *                         if not identical:
+ *                             # flipping a tetrahedral will not work
+ *                             all_the_same = False             # <<<<<<<<<<<<<<
+ *                         else:
+ *                             # having 5+ bonnds is not modeled here
+ */
+              __pyx_v_all_the_same = 0;
+
+              /* "rmgpy/molecule/symmetry.py":486
+ *                     elif len(non_ring_bonded_atoms) == 2:
+ *                         identical = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[1])
+ *                         if not identical:             # <<<<<<<<<<<<<<
+ *                             # flipping a tetrahedral will not work
+ *                             all_the_same = False
+ */
+              goto __pyx_L62;
+            }
+
+            /* "rmgpy/molecule/symmetry.py":491
+ *                         else:
+ *                             # having 5+ bonnds is not modeled here
+ *                             pass             # <<<<<<<<<<<<<<
+ *             # for even rings, check for flipping accross bonds too
+ *             if not all_the_same and size % 2 == 0:
+ */
+            /*else*/ {
+            }
+            __pyx_L62:;
+
+            /* "rmgpy/molecule/symmetry.py":484
+ *                     if len(non_ring_bonded_atoms) < 2:
+ *                         pass  # all_the_same still true
+ *                     elif len(non_ring_bonded_atoms) == 2:             # <<<<<<<<<<<<<<
+ *                         identical = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[1])
+ *                         if not identical:
+ */
+          }
+          __pyx_L61:;
+        }
+        __pyx_L31:;
+
+        /* "rmgpy/molecule/symmetry.py":452
+ *                 max_index += -1
+ *             # check to make sure that the groups are identical on centers of flipping
+ *             if all_the_same:             # <<<<<<<<<<<<<<
+ *                 ringed_atom_ids = [id(_atom) for _atom in ring]
+ *                 if size % 2 == 0:  # look at two atoms
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":493
+ *                             pass
+ *             # for even rings, check for flipping accross bonds too
+ *             if not all_the_same and size % 2 == 0:             # <<<<<<<<<<<<<<
+ *                 all_the_same = True
+ *                 min_index = flipping_atom_index
+ */
+      __pyx_t_11 = ((!(__pyx_v_all_the_same != 0)) != 0);
+      if (__pyx_t_11) {
+      } else {
+        __pyx_t_10 = __pyx_t_11;
+        goto __pyx_L64_bool_binop_done;
+      }
+      __pyx_t_3 = __Pyx_PyInt_RemainderObjC(__pyx_v_size, __pyx_int_2, 2, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 493, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_15 = __Pyx_PyInt_EqObjC(__pyx_t_3, __pyx_int_0, 0, 0); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 493, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_15);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_t_15); if (unlikely(__pyx_t_11 < 0)) __PYX_ERR(0, 493, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+      __pyx_t_10 = __pyx_t_11;
+      __pyx_L64_bool_binop_done:;
+      if (__pyx_t_10) {
+
+        /* "rmgpy/molecule/symmetry.py":494
+ *             # for even rings, check for flipping accross bonds too
+ *             if not all_the_same and size % 2 == 0:
+ *                 all_the_same = True             # <<<<<<<<<<<<<<
+ *                 min_index = flipping_atom_index
+ *                 max_index = flipping_atom_index + size - 1
+ */
+        __pyx_v_all_the_same = 1;
+
+        /* "rmgpy/molecule/symmetry.py":495
+ *             if not all_the_same and size % 2 == 0:
+ *                 all_the_same = True
+ *                 min_index = flipping_atom_index             # <<<<<<<<<<<<<<
+ *                 max_index = flipping_atom_index + size - 1
+ *                 while min_index < max_index:
+ */
+        __Pyx_INCREF(__pyx_v_flipping_atom_index);
+        __Pyx_DECREF_SET(__pyx_v_min_index, __pyx_v_flipping_atom_index);
+
+        /* "rmgpy/molecule/symmetry.py":496
+ *                 all_the_same = True
+ *                 min_index = flipping_atom_index
+ *                 max_index = flipping_atom_index + size - 1             # <<<<<<<<<<<<<<
+ *                 while min_index < max_index:
+ *                     # ensure the two atoms are different. use mod size to loop to the start
+ */
+        __pyx_t_15 = PyNumber_Add(__pyx_v_flipping_atom_index, __pyx_v_size); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 496, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_15);
+        __pyx_t_3 = __Pyx_PyInt_SubtractObjC(__pyx_t_15, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 496, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+        __Pyx_DECREF_SET(__pyx_v_max_index, __pyx_t_3);
+        __pyx_t_3 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":497
+ *                 min_index = flipping_atom_index
+ *                 max_index = flipping_atom_index + size - 1
+ *                 while min_index < max_index:             # <<<<<<<<<<<<<<
+ *                     # ensure the two atoms are different. use mod size to loop to the start
+ *                     # of the list when index out of bounds
+ */
+        while (1) {
+          __pyx_t_3 = PyObject_RichCompare(__pyx_v_min_index, __pyx_v_max_index, Py_LT); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 497, __pyx_L1_error)
+          __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_10 < 0)) __PYX_ERR(0, 497, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          if (!__pyx_t_10) break;
+
+          /* "rmgpy/molecule/symmetry.py":500
+ *                     # ensure the two atoms are different. use mod size to loop to the start
+ *                     # of the list when index out of bounds
+ *                     if not _indistinguishable(ring[min_index % size], ring[max_index % size]):             # <<<<<<<<<<<<<<
+ *                         all_the_same = False
+ *                         break
+ */
+          __pyx_t_3 = PyNumber_Remainder(__pyx_v_min_index, __pyx_v_size); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 500, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __pyx_t_15 = __Pyx_PyObject_GetItem(__pyx_v_ring, __pyx_t_3); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 500, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_15);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          if (!(likely(((__pyx_t_15) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_15, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 500, __pyx_L1_error)
+          __pyx_t_3 = PyNumber_Remainder(__pyx_v_max_index, __pyx_v_size); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 500, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __pyx_t_16 = __Pyx_PyObject_GetItem(__pyx_v_ring, __pyx_t_3); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 500, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_16);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          if (!(likely(((__pyx_t_16) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_16, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 500, __pyx_L1_error)
+          __pyx_t_10 = __pyx_f_5rmgpy_8molecule_8symmetry__indistinguishable(((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_15), ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_t_16), 0); if (unlikely(__pyx_t_10 == ((int)-2))) __PYX_ERR(0, 500, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+          __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+          __pyx_t_11 = ((!(__pyx_t_10 != 0)) != 0);
+          if (__pyx_t_11) {
+
+            /* "rmgpy/molecule/symmetry.py":501
+ *                     # of the list when index out of bounds
+ *                     if not _indistinguishable(ring[min_index % size], ring[max_index % size]):
+ *                         all_the_same = False             # <<<<<<<<<<<<<<
+ *                         break
+ *                     min_index += 1
+ */
+            __pyx_v_all_the_same = 0;
+
+            /* "rmgpy/molecule/symmetry.py":502
+ *                     if not _indistinguishable(ring[min_index % size], ring[max_index % size]):
+ *                         all_the_same = False
+ *                         break             # <<<<<<<<<<<<<<
+ *                     min_index += 1
+ *                     max_index += -1
+ */
+            goto __pyx_L67_break;
+
+            /* "rmgpy/molecule/symmetry.py":500
+ *                     # ensure the two atoms are different. use mod size to loop to the start
+ *                     # of the list when index out of bounds
+ *                     if not _indistinguishable(ring[min_index % size], ring[max_index % size]):             # <<<<<<<<<<<<<<
+ *                         all_the_same = False
+ *                         break
+ */
+          }
+
+          /* "rmgpy/molecule/symmetry.py":503
+ *                         all_the_same = False
+ *                         break
+ *                     min_index += 1             # <<<<<<<<<<<<<<
+ *                     max_index += -1
+ * 
+ */
+          __pyx_t_16 = __Pyx_PyInt_AddObjC(__pyx_v_min_index, __pyx_int_1, 1, 1, 0); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 503, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_16);
+          __Pyx_DECREF_SET(__pyx_v_min_index, __pyx_t_16);
+          __pyx_t_16 = 0;
+
+          /* "rmgpy/molecule/symmetry.py":504
+ *                         break
+ *                     min_index += 1
+ *                     max_index += -1             # <<<<<<<<<<<<<<
+ * 
+ *             if all_the_same:
+ */
+          __pyx_t_16 = __Pyx_PyInt_AddObjC(__pyx_v_max_index, __pyx_int_neg_1, -1L, 1, 0); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 504, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_16);
+          __Pyx_DECREF_SET(__pyx_v_max_index, __pyx_t_16);
+          __pyx_t_16 = 0;
+        }
+        __pyx_L67_break:;
+
+        /* "rmgpy/molecule/symmetry.py":493
+ *                             pass
+ *             # for even rings, check for flipping accross bonds too
+ *             if not all_the_same and size % 2 == 0:             # <<<<<<<<<<<<<<
+ *                 all_the_same = True
+ *                 min_index = flipping_atom_index
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":506
+ *                     max_index += -1
+ * 
+ *             if all_the_same:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 2
+ *                 break
+ */
+      __pyx_t_11 = (__pyx_v_all_the_same != 0);
+      if (__pyx_t_11) {
+
+        /* "rmgpy/molecule/symmetry.py":507
+ * 
+ *             if all_the_same:
+ *                 symmetry_number *= 2             # <<<<<<<<<<<<<<
+ *                 break
+ *     return symmetry_number
+ */
+        __pyx_t_16 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_int_2); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 507, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_16);
+        __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_16);
+        __pyx_t_16 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":508
+ *             if all_the_same:
+ *                 symmetry_number *= 2
+ *                 break             # <<<<<<<<<<<<<<
+ *     return symmetry_number
+ * 
+ */
+        goto __pyx_L20_break;
+
+        /* "rmgpy/molecule/symmetry.py":506
+ *                     max_index += -1
+ * 
+ *             if all_the_same:             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= 2
+ *                 break
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":437
+ *             flipping_atom_indexes = list(range(size))
+ * 
+ *         for flipping_atom_index in flipping_atom_indexes:             # <<<<<<<<<<<<<<
+ * 
+ *             # check for flipping with across an axis containing atoms
+ */
+    }
+    __pyx_L20_break:;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":407
+ *         single_rings.append(molecule.get_largest_ring(ring[0]))
+ *     # Get symmetry number for each ring in structure & multiply
+ *     for ring in single_rings:             # <<<<<<<<<<<<<<
+ *         ring = molecule.sort_cyclic_vertices(ring)
+ *         size = len(ring)
+ */
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":509
+ *                 symmetry_number *= 2
+ *                 break
+ *     return symmetry_number             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_23 = __pyx_PyFloat_AsFloat(__pyx_v_symmetry_number); if (unlikely((__pyx_t_23 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 509, __pyx_L1_error)
+  __pyx_r = __pyx_t_23;
+  goto __pyx_L0;
+
+  /* "rmgpy/molecule/symmetry.py":395
+ * ################################################################################
+ * 
+ * def calculate_cyclic_symmetry_number(molecule):             # <<<<<<<<<<<<<<
+ *     """
+ *     Get the symmetry number correction for cyclic regions of a molecule.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_14);
+  __Pyx_XDECREF(__pyx_t_15);
+  __Pyx_XDECREF(__pyx_t_16);
+  __Pyx_XDECREF(__pyx_t_17);
+  __Pyx_XDECREF(__pyx_t_18);
+  __Pyx_AddTraceback("rmgpy.molecule.symmetry.calculate_cyclic_symmetry_number", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1.0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_symmetry_number);
+  __Pyx_XDECREF(__pyx_v_single_rings);
+  __Pyx_XDECREF(__pyx_v_polycyclic_rings);
+  __Pyx_XDECREF(__pyx_v_ring);
+  __Pyx_XDECREF(__pyx_v_size);
+  __Pyx_XDECREF(__pyx_v_num_sections);
+  __Pyx_XDECREF(__pyx_v_num_rotations);
+  __Pyx_XDECREF(__pyx_v_starting_index);
+  __Pyx_XDECREF(__pyx_v_atom_index);
+  __Pyx_XDECREF(__pyx_v_flipping_atom_indexes);
+  __Pyx_XDECREF(__pyx_v_flipping_atom_index);
+  __Pyx_XDECREF(__pyx_v_min_index);
+  __Pyx_XDECREF(__pyx_v_max_index);
+  __Pyx_XDECREF(__pyx_v_ringed_atom_ids);
+  __Pyx_XDECREF(__pyx_v_atom1);
+  __Pyx_XDECREF(__pyx_v_atom2);
+  __Pyx_XDECREF(__pyx_v_non_ring_bonded_atoms);
+  __Pyx_XDECREF(__pyx_v_atom);
+  __Pyx_XDECREF(__pyx_8genexpr4__pyx_v__atom);
+  __Pyx_XDECREF(__pyx_8genexpr5__pyx_v_bonded_atom);
+  __Pyx_XDECREF(__pyx_8genexpr6__pyx_v_bonded_atom);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8molecule_8symmetry_7calculate_cyclic_symmetry_number(PyObject *__pyx_self, PyObject *__pyx_v_molecule); /*proto*/
+static char __pyx_doc_5rmgpy_8molecule_8symmetry_6calculate_cyclic_symmetry_number[] = "\n    Get the symmetry number correction for cyclic regions of a molecule.\n    For complicated fused rings the smallest set of smallest rings is used.\n    ";
+static PyMethodDef __pyx_mdef_5rmgpy_8molecule_8symmetry_7calculate_cyclic_symmetry_number = {"calculate_cyclic_symmetry_number", (PyCFunction)__pyx_pw_5rmgpy_8molecule_8symmetry_7calculate_cyclic_symmetry_number, METH_O, __pyx_doc_5rmgpy_8molecule_8symmetry_6calculate_cyclic_symmetry_number};
+static PyObject *__pyx_pw_5rmgpy_8molecule_8symmetry_7calculate_cyclic_symmetry_number(PyObject *__pyx_self, PyObject *__pyx_v_molecule) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("calculate_cyclic_symmetry_number (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_molecule), __pyx_ptype_5rmgpy_8molecule_8molecule_Molecule, 1, "molecule", 0))) __PYX_ERR(0, 395, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_8symmetry_6calculate_cyclic_symmetry_number(__pyx_self, ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *)__pyx_v_molecule));
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8molecule_8symmetry_6calculate_cyclic_symmetry_number(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *__pyx_v_molecule) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  float __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("calculate_cyclic_symmetry_number", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_5rmgpy_8molecule_8symmetry_calculate_cyclic_symmetry_number(__pyx_v_molecule, 0); if (unlikely(__pyx_t_1 == ((float)-1.0))) __PYX_ERR(0, 395, __pyx_L1_error)
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 395, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("rmgpy.molecule.symmetry.calculate_cyclic_symmetry_number", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/molecule/symmetry.py":515
+ * 
+ * 
+ * def _indistinguishable(atom1, atom2):             # <<<<<<<<<<<<<<
+ *     """
+ *     Determine if two atoms are feasibly indistinguishable based on connections
+ */
+
+static PyObject *__pyx_pw_5rmgpy_8molecule_8symmetry_9_indistinguishable(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_f_5rmgpy_8molecule_8symmetry__indistinguishable(struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *__pyx_v_atom1, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *__pyx_v_atom2, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  PyObject *__pyx_v_bond_orders_1 = NULL;
+  PyObject *__pyx_v_bond_orders_2 = NULL;
+  PyObject *__pyx_v_bonds_1 = NULL;
+  PyObject *__pyx_v_bonds_2 = NULL;
+  CYTHON_UNUSED PyObject *__pyx_v_i = NULL;
+  PyObject *__pyx_v_neighbor1 = NULL;
+  PyObject *__pyx_v_bond1 = NULL;
+  PyObject *__pyx_v_j = NULL;
+  PyObject *__pyx_v_neighbor2 = NULL;
+  PyObject *__pyx_v_bond2 = NULL;
+  PyObject *__pyx_8genexpr7__pyx_v_bond = NULL;
+  PyObject *__pyx_8genexpr8__pyx_v_bond = NULL;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  Py_ssize_t __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  int __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  int __pyx_t_11;
+  int __pyx_t_12;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  PyObject *(*__pyx_t_15)(PyObject *);
+  PyObject *__pyx_t_16 = NULL;
+  PyObject *__pyx_t_17 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_indistinguishable", 0);
+
+  /* "rmgpy/molecule/symmetry.py":520
+ *     to nearest neighbors.
+ *     """
+ *     if (not atom1.equivalent(atom2)             # <<<<<<<<<<<<<<
+ *             or atom1.connectivity1 != atom2.connectivity1
+ *             or atom1.connectivity2 != atom2.connectivity2
+ */
+  __pyx_t_2 = ((struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Atom *)__pyx_v_atom1->__pyx_base.__pyx_vtab)->__pyx_base.equivalent(((struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *)__pyx_v_atom1), ((struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex *)__pyx_v_atom2), 0, NULL); if (unlikely(__pyx_t_2 == ((int)-2))) __PYX_ERR(0, 520, __pyx_L1_error)
+  __pyx_t_3 = ((!(__pyx_t_2 != 0)) != 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "rmgpy/molecule/symmetry.py":521
+ *     """
+ *     if (not atom1.equivalent(atom2)
+ *             or atom1.connectivity1 != atom2.connectivity1             # <<<<<<<<<<<<<<
+ *             or atom1.connectivity2 != atom2.connectivity2
+ *             or atom1.connectivity3 != atom2.connectivity3):
+ */
+  __pyx_t_3 = ((__pyx_v_atom1->__pyx_base.connectivity1 != __pyx_v_atom2->__pyx_base.connectivity1) != 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "rmgpy/molecule/symmetry.py":522
+ *     if (not atom1.equivalent(atom2)
+ *             or atom1.connectivity1 != atom2.connectivity1
+ *             or atom1.connectivity2 != atom2.connectivity2             # <<<<<<<<<<<<<<
+ *             or atom1.connectivity3 != atom2.connectivity3):
+ *         return False
+ */
+  __pyx_t_3 = ((__pyx_v_atom1->__pyx_base.connectivity2 != __pyx_v_atom2->__pyx_base.connectivity2) != 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "rmgpy/molecule/symmetry.py":523
+ *             or atom1.connectivity1 != atom2.connectivity1
+ *             or atom1.connectivity2 != atom2.connectivity2
+ *             or atom1.connectivity3 != atom2.connectivity3):             # <<<<<<<<<<<<<<
+ *         return False
+ * 
+ */
+  __pyx_t_3 = ((__pyx_v_atom1->__pyx_base.connectivity3 != __pyx_v_atom2->__pyx_base.connectivity3) != 0);
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+
+  /* "rmgpy/molecule/symmetry.py":520
+ *     to nearest neighbors.
+ *     """
+ *     if (not atom1.equivalent(atom2)             # <<<<<<<<<<<<<<
+ *             or atom1.connectivity1 != atom2.connectivity1
+ *             or atom1.connectivity2 != atom2.connectivity2
+ */
+  if (__pyx_t_1) {
+
+    /* "rmgpy/molecule/symmetry.py":524
+ *             or atom1.connectivity2 != atom2.connectivity2
+ *             or atom1.connectivity3 != atom2.connectivity3):
+ *         return False             # <<<<<<<<<<<<<<
+ * 
+ *     bond_orders_1 = [bond.order for bond in atom1.bonds.values()].sort()
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "rmgpy/molecule/symmetry.py":520
+ *     to nearest neighbors.
+ *     """
+ *     if (not atom1.equivalent(atom2)             # <<<<<<<<<<<<<<
+ *             or atom1.connectivity1 != atom2.connectivity1
+ *             or atom1.connectivity2 != atom2.connectivity2
+ */
+  }
+
+  /* "rmgpy/molecule/symmetry.py":526
+ *         return False
+ * 
+ *     bond_orders_1 = [bond.order for bond in atom1.bonds.values()].sort()             # <<<<<<<<<<<<<<
+ *     bond_orders_2 = [bond.order for bond in atom2.bonds.values()].sort()
+ * 
+ */
+  { /* enter inner scope */
+    __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 526, __pyx_L10_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_6 = 0;
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_atom1), __pyx_n_s_bonds); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 526, __pyx_L10_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    if (unlikely(__pyx_t_9 == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "values");
+      __PYX_ERR(0, 526, __pyx_L10_error)
+    }
+    __pyx_t_10 = __Pyx_dict_iterator(__pyx_t_9, 0, __pyx_n_s_values, (&__pyx_t_7), (&__pyx_t_8)); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 526, __pyx_L10_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_XDECREF(__pyx_t_5);
+    __pyx_t_5 = __pyx_t_10;
+    __pyx_t_10 = 0;
+    while (1) {
+      __pyx_t_11 = __Pyx_dict_iter_next(__pyx_t_5, __pyx_t_7, &__pyx_t_6, NULL, &__pyx_t_10, NULL, __pyx_t_8);
+      if (unlikely(__pyx_t_11 == 0)) break;
+      if (unlikely(__pyx_t_11 == -1)) __PYX_ERR(0, 526, __pyx_L10_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      __Pyx_XDECREF_SET(__pyx_8genexpr7__pyx_v_bond, __pyx_t_10);
+      __pyx_t_10 = 0;
+      __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_8genexpr7__pyx_v_bond, __pyx_n_s_order); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 526, __pyx_L10_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_4, (PyObject*)__pyx_t_10))) __PYX_ERR(0, 526, __pyx_L10_error)
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_XDECREF(__pyx_8genexpr7__pyx_v_bond); __pyx_8genexpr7__pyx_v_bond = 0;
+    goto __pyx_L13_exit_scope;
+    __pyx_L10_error:;
+    __Pyx_XDECREF(__pyx_8genexpr7__pyx_v_bond); __pyx_8genexpr7__pyx_v_bond = 0;
+    goto __pyx_L1_error;
+    __pyx_L13_exit_scope:;
+  } /* exit inner scope */
+  __pyx_t_12 = PyList_Sort(__pyx_t_4); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(0, 526, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_Owned_Py_None(__pyx_t_12); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 526, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_bond_orders_1 = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":527
+ * 
+ *     bond_orders_1 = [bond.order for bond in atom1.bonds.values()].sort()
+ *     bond_orders_2 = [bond.order for bond in atom2.bonds.values()].sort()             # <<<<<<<<<<<<<<
+ * 
+ *     if bond_orders_1 != bond_orders_2:
+ */
+  { /* enter inner scope */
+    __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 527, __pyx_L16_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_7 = 0;
+    __pyx_t_10 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_atom2), __pyx_n_s_bonds); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 527, __pyx_L16_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    if (unlikely(__pyx_t_10 == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "values");
+      __PYX_ERR(0, 527, __pyx_L16_error)
+    }
+    __pyx_t_9 = __Pyx_dict_iterator(__pyx_t_10, 0, __pyx_n_s_values, (&__pyx_t_6), (&__pyx_t_8)); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 527, __pyx_L16_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __Pyx_XDECREF(__pyx_t_5);
+    __pyx_t_5 = __pyx_t_9;
+    __pyx_t_9 = 0;
+    while (1) {
+      __pyx_t_11 = __Pyx_dict_iter_next(__pyx_t_5, __pyx_t_6, &__pyx_t_7, NULL, &__pyx_t_9, NULL, __pyx_t_8);
+      if (unlikely(__pyx_t_11 == 0)) break;
+      if (unlikely(__pyx_t_11 == -1)) __PYX_ERR(0, 527, __pyx_L16_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_XDECREF_SET(__pyx_8genexpr8__pyx_v_bond, __pyx_t_9);
+      __pyx_t_9 = 0;
+      __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_8genexpr8__pyx_v_bond, __pyx_n_s_order); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 527, __pyx_L16_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_4, (PyObject*)__pyx_t_9))) __PYX_ERR(0, 527, __pyx_L16_error)
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_XDECREF(__pyx_8genexpr8__pyx_v_bond); __pyx_8genexpr8__pyx_v_bond = 0;
+    goto __pyx_L19_exit_scope;
+    __pyx_L16_error:;
+    __Pyx_XDECREF(__pyx_8genexpr8__pyx_v_bond); __pyx_8genexpr8__pyx_v_bond = 0;
+    goto __pyx_L1_error;
+    __pyx_L19_exit_scope:;
+  } /* exit inner scope */
+  __pyx_t_12 = PyList_Sort(__pyx_t_4); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(0, 527, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_Owned_Py_None(__pyx_t_12); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 527, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_bond_orders_2 = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":529
+ *     bond_orders_2 = [bond.order for bond in atom2.bonds.values()].sort()
+ * 
+ *     if bond_orders_1 != bond_orders_2:             # <<<<<<<<<<<<<<
+ *         return False
+ * 
+ */
+  __pyx_t_4 = PyObject_RichCompare(__pyx_v_bond_orders_1, __pyx_v_bond_orders_2, Py_NE); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 529, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(0, 529, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__pyx_t_1) {
+
+    /* "rmgpy/molecule/symmetry.py":530
+ * 
+ *     if bond_orders_1 != bond_orders_2:
+ *         return False             # <<<<<<<<<<<<<<
+ * 
+ *     bonds_1 = list(atom1.bonds.items())
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "rmgpy/molecule/symmetry.py":529
+ *     bond_orders_2 = [bond.order for bond in atom2.bonds.values()].sort()
+ * 
+ *     if bond_orders_1 != bond_orders_2:             # <<<<<<<<<<<<<<
+ *         return False
+ * 
+ */
+  }
+
+  /* "rmgpy/molecule/symmetry.py":532
+ *         return False
+ * 
+ *     bonds_1 = list(atom1.bonds.items())             # <<<<<<<<<<<<<<
+ *     bonds_2 = list(atom2.bonds.items())
+ * 
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_atom1), __pyx_n_s_bonds); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 532, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_items); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 532, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_9);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_9, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 532, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_9 = PySequence_List(__pyx_t_4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 532, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_bonds_1 = ((PyObject*)__pyx_t_9);
+  __pyx_t_9 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":533
+ * 
+ *     bonds_1 = list(atom1.bonds.items())
+ *     bonds_2 = list(atom2.bonds.items())             # <<<<<<<<<<<<<<
+ * 
+ *     for i, (neighbor1, bond1) in enumerate(bonds_1):
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_atom2), __pyx_n_s_bonds); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_items); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  __pyx_t_9 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = PySequence_List(__pyx_t_9); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_v_bonds_2 = ((PyObject*)__pyx_t_5);
+  __pyx_t_5 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":535
+ *     bonds_2 = list(atom2.bonds.items())
+ * 
+ *     for i, (neighbor1, bond1) in enumerate(bonds_1):             # <<<<<<<<<<<<<<
+ *         for j, (neighbor2, bond2) in enumerate(bonds_2):
+ *             if bond1.equivalent(bond2) and neighbor1.equivalent(neighbor2):
+ */
+  __Pyx_INCREF(__pyx_int_0);
+  __pyx_t_5 = __pyx_int_0;
+  __pyx_t_9 = __pyx_v_bonds_1; __Pyx_INCREF(__pyx_t_9); __pyx_t_6 = 0;
+  for (;;) {
+    if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_9)) break;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    __pyx_t_4 = PyList_GET_ITEM(__pyx_t_9, __pyx_t_6); __Pyx_INCREF(__pyx_t_4); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(0, 535, __pyx_L1_error)
+    #else
+    __pyx_t_4 = PySequence_ITEM(__pyx_t_9, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 535, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    #endif
+    if ((likely(PyTuple_CheckExact(__pyx_t_4))) || (PyList_CheckExact(__pyx_t_4))) {
+      PyObject* sequence = __pyx_t_4;
+      Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+      if (unlikely(size != 2)) {
+        if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+        else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+        __PYX_ERR(0, 535, __pyx_L1_error)
+      }
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      if (likely(PyTuple_CheckExact(sequence))) {
+        __pyx_t_10 = PyTuple_GET_ITEM(sequence, 0); 
+        __pyx_t_13 = PyTuple_GET_ITEM(sequence, 1); 
+      } else {
+        __pyx_t_10 = PyList_GET_ITEM(sequence, 0); 
+        __pyx_t_13 = PyList_GET_ITEM(sequence, 1); 
+      }
+      __Pyx_INCREF(__pyx_t_10);
+      __Pyx_INCREF(__pyx_t_13);
+      #else
+      __pyx_t_10 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 535, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      __pyx_t_13 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 535, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      #endif
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    } else {
+      Py_ssize_t index = -1;
+      __pyx_t_14 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 535, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_14);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_15 = Py_TYPE(__pyx_t_14)->tp_iternext;
+      index = 0; __pyx_t_10 = __pyx_t_15(__pyx_t_14); if (unlikely(!__pyx_t_10)) goto __pyx_L23_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_10);
+      index = 1; __pyx_t_13 = __pyx_t_15(__pyx_t_14); if (unlikely(!__pyx_t_13)) goto __pyx_L23_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_13);
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_15(__pyx_t_14), 2) < 0) __PYX_ERR(0, 535, __pyx_L1_error)
+      __pyx_t_15 = NULL;
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      goto __pyx_L24_unpacking_done;
+      __pyx_L23_unpacking_failed:;
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      __pyx_t_15 = NULL;
+      if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+      __PYX_ERR(0, 535, __pyx_L1_error)
+      __pyx_L24_unpacking_done:;
+    }
+    __Pyx_XDECREF_SET(__pyx_v_neighbor1, __pyx_t_10);
+    __pyx_t_10 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_bond1, __pyx_t_13);
+    __pyx_t_13 = 0;
+    __Pyx_INCREF(__pyx_t_5);
+    __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_5);
+    __pyx_t_4 = __Pyx_PyInt_AddObjC(__pyx_t_5, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 535, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5);
+    __pyx_t_5 = __pyx_t_4;
+    __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":536
+ * 
+ *     for i, (neighbor1, bond1) in enumerate(bonds_1):
+ *         for j, (neighbor2, bond2) in enumerate(bonds_2):             # <<<<<<<<<<<<<<
+ *             if bond1.equivalent(bond2) and neighbor1.equivalent(neighbor2):
+ *                 del bonds_2[j]
+ */
+    __Pyx_INCREF(__pyx_int_0);
+    __pyx_t_4 = __pyx_int_0;
+    __pyx_t_13 = __pyx_v_bonds_2; __Pyx_INCREF(__pyx_t_13); __pyx_t_7 = 0;
+    for (;;) {
+      if (__pyx_t_7 >= PyList_GET_SIZE(__pyx_t_13)) break;
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      __pyx_t_10 = PyList_GET_ITEM(__pyx_t_13, __pyx_t_7); __Pyx_INCREF(__pyx_t_10); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(0, 536, __pyx_L1_error)
+      #else
+      __pyx_t_10 = PySequence_ITEM(__pyx_t_13, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 536, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      #endif
+      if ((likely(PyTuple_CheckExact(__pyx_t_10))) || (PyList_CheckExact(__pyx_t_10))) {
+        PyObject* sequence = __pyx_t_10;
+        Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+        if (unlikely(size != 2)) {
+          if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+          else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+          __PYX_ERR(0, 536, __pyx_L1_error)
+        }
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        if (likely(PyTuple_CheckExact(sequence))) {
+          __pyx_t_14 = PyTuple_GET_ITEM(sequence, 0); 
+          __pyx_t_16 = PyTuple_GET_ITEM(sequence, 1); 
+        } else {
+          __pyx_t_14 = PyList_GET_ITEM(sequence, 0); 
+          __pyx_t_16 = PyList_GET_ITEM(sequence, 1); 
+        }
+        __Pyx_INCREF(__pyx_t_14);
+        __Pyx_INCREF(__pyx_t_16);
+        #else
+        __pyx_t_14 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 536, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_14);
+        __pyx_t_16 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 536, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_16);
+        #endif
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      } else {
+        Py_ssize_t index = -1;
+        __pyx_t_17 = PyObject_GetIter(__pyx_t_10); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 536, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_17);
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __pyx_t_15 = Py_TYPE(__pyx_t_17)->tp_iternext;
+        index = 0; __pyx_t_14 = __pyx_t_15(__pyx_t_17); if (unlikely(!__pyx_t_14)) goto __pyx_L27_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_14);
+        index = 1; __pyx_t_16 = __pyx_t_15(__pyx_t_17); if (unlikely(!__pyx_t_16)) goto __pyx_L27_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_16);
+        if (__Pyx_IternextUnpackEndCheck(__pyx_t_15(__pyx_t_17), 2) < 0) __PYX_ERR(0, 536, __pyx_L1_error)
+        __pyx_t_15 = NULL;
+        __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+        goto __pyx_L28_unpacking_done;
+        __pyx_L27_unpacking_failed:;
+        __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+        __pyx_t_15 = NULL;
+        if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+        __PYX_ERR(0, 536, __pyx_L1_error)
+        __pyx_L28_unpacking_done:;
+      }
+      __Pyx_XDECREF_SET(__pyx_v_neighbor2, __pyx_t_14);
+      __pyx_t_14 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_bond2, __pyx_t_16);
+      __pyx_t_16 = 0;
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_XDECREF_SET(__pyx_v_j, __pyx_t_4);
+      __pyx_t_10 = __Pyx_PyInt_AddObjC(__pyx_t_4, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 536, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      __Pyx_DECREF(__pyx_t_4);
+      __pyx_t_4 = __pyx_t_10;
+      __pyx_t_10 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":537
+ *     for i, (neighbor1, bond1) in enumerate(bonds_1):
+ *         for j, (neighbor2, bond2) in enumerate(bonds_2):
+ *             if bond1.equivalent(bond2) and neighbor1.equivalent(neighbor2):             # <<<<<<<<<<<<<<
+ *                 del bonds_2[j]
+ *                 break
+ */
+      __pyx_t_16 = __Pyx_PyObject_GetAttrStr(__pyx_v_bond1, __pyx_n_s_equivalent); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 537, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_16);
+      __pyx_t_14 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_16))) {
+        __pyx_t_14 = PyMethod_GET_SELF(__pyx_t_16);
+        if (likely(__pyx_t_14)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_16);
+          __Pyx_INCREF(__pyx_t_14);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_16, function);
+        }
+      }
+      __pyx_t_10 = (__pyx_t_14) ? __Pyx_PyObject_Call2Args(__pyx_t_16, __pyx_t_14, __pyx_v_bond2) : __Pyx_PyObject_CallOneArg(__pyx_t_16, __pyx_v_bond2);
+      __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
+      if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 537, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+      __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_10); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 537, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      if (__pyx_t_3) {
+      } else {
+        __pyx_t_1 = __pyx_t_3;
+        goto __pyx_L30_bool_binop_done;
+      }
+      __pyx_t_16 = __Pyx_PyObject_GetAttrStr(__pyx_v_neighbor1, __pyx_n_s_equivalent); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 537, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_16);
+      __pyx_t_14 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_16))) {
+        __pyx_t_14 = PyMethod_GET_SELF(__pyx_t_16);
+        if (likely(__pyx_t_14)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_16);
+          __Pyx_INCREF(__pyx_t_14);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_16, function);
+        }
+      }
+      __pyx_t_10 = (__pyx_t_14) ? __Pyx_PyObject_Call2Args(__pyx_t_16, __pyx_t_14, __pyx_v_neighbor2) : __Pyx_PyObject_CallOneArg(__pyx_t_16, __pyx_v_neighbor2);
+      __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
+      if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 537, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+      __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_10); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 537, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      __pyx_t_1 = __pyx_t_3;
+      __pyx_L30_bool_binop_done:;
+      if (__pyx_t_1) {
+
+        /* "rmgpy/molecule/symmetry.py":538
+ *         for j, (neighbor2, bond2) in enumerate(bonds_2):
+ *             if bond1.equivalent(bond2) and neighbor1.equivalent(neighbor2):
+ *                 del bonds_2[j]             # <<<<<<<<<<<<<<
+ *                 break
+ *         else:
+ */
+        if (unlikely(PyObject_DelItem(__pyx_v_bonds_2, __pyx_v_j) < 0)) __PYX_ERR(0, 538, __pyx_L1_error)
+
+        /* "rmgpy/molecule/symmetry.py":539
+ *             if bond1.equivalent(bond2) and neighbor1.equivalent(neighbor2):
+ *                 del bonds_2[j]
+ *                 break             # <<<<<<<<<<<<<<
+ *         else:
+ *             return False
+ */
+        goto __pyx_L26_break;
+
+        /* "rmgpy/molecule/symmetry.py":537
+ *     for i, (neighbor1, bond1) in enumerate(bonds_1):
+ *         for j, (neighbor2, bond2) in enumerate(bonds_2):
+ *             if bond1.equivalent(bond2) and neighbor1.equivalent(neighbor2):             # <<<<<<<<<<<<<<
+ *                 del bonds_2[j]
+ *                 break
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":536
+ * 
+ *     for i, (neighbor1, bond1) in enumerate(bonds_1):
+ *         for j, (neighbor2, bond2) in enumerate(bonds_2):             # <<<<<<<<<<<<<<
+ *             if bond1.equivalent(bond2) and neighbor1.equivalent(neighbor2):
+ *                 del bonds_2[j]
+ */
+    }
+    /*else*/ {
+
+      /* "rmgpy/molecule/symmetry.py":541
+ *                 break
+ *         else:
+ *             return False             # <<<<<<<<<<<<<<
+ * 
+ *     # We were able to match up all neighbors
+ */
+      __pyx_r = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      goto __pyx_L0;
+    }
+
+    /* "rmgpy/molecule/symmetry.py":536
+ * 
+ *     for i, (neighbor1, bond1) in enumerate(bonds_1):
+ *         for j, (neighbor2, bond2) in enumerate(bonds_2):             # <<<<<<<<<<<<<<
+ *             if bond1.equivalent(bond2) and neighbor1.equivalent(neighbor2):
+ *                 del bonds_2[j]
+ */
+    __pyx_L26_break:;
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":535
+ *     bonds_2 = list(atom2.bonds.items())
+ * 
+ *     for i, (neighbor1, bond1) in enumerate(bonds_1):             # <<<<<<<<<<<<<<
+ *         for j, (neighbor2, bond2) in enumerate(bonds_2):
+ *             if bond1.equivalent(bond2) and neighbor1.equivalent(neighbor2):
+ */
+  }
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":544
+ * 
+ *     # We were able to match up all neighbors
+ *     return True             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "rmgpy/molecule/symmetry.py":515
+ * 
+ * 
+ * def _indistinguishable(atom1, atom2):             # <<<<<<<<<<<<<<
+ *     """
+ *     Determine if two atoms are feasibly indistinguishable based on connections
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_14);
+  __Pyx_XDECREF(__pyx_t_16);
+  __Pyx_XDECREF(__pyx_t_17);
+  __Pyx_AddTraceback("rmgpy.molecule.symmetry._indistinguishable", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -2;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_bond_orders_1);
+  __Pyx_XDECREF(__pyx_v_bond_orders_2);
+  __Pyx_XDECREF(__pyx_v_bonds_1);
+  __Pyx_XDECREF(__pyx_v_bonds_2);
+  __Pyx_XDECREF(__pyx_v_i);
+  __Pyx_XDECREF(__pyx_v_neighbor1);
+  __Pyx_XDECREF(__pyx_v_bond1);
+  __Pyx_XDECREF(__pyx_v_j);
+  __Pyx_XDECREF(__pyx_v_neighbor2);
+  __Pyx_XDECREF(__pyx_v_bond2);
+  __Pyx_XDECREF(__pyx_8genexpr7__pyx_v_bond);
+  __Pyx_XDECREF(__pyx_8genexpr8__pyx_v_bond);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8molecule_8symmetry_9_indistinguishable(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5rmgpy_8molecule_8symmetry_8_indistinguishable[] = "\n    Determine if two atoms are feasibly indistinguishable based on connections\n    to nearest neighbors.\n    ";
+static PyMethodDef __pyx_mdef_5rmgpy_8molecule_8symmetry_9_indistinguishable = {"_indistinguishable", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5rmgpy_8molecule_8symmetry_9_indistinguishable, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5rmgpy_8molecule_8symmetry_8_indistinguishable};
+static PyObject *__pyx_pw_5rmgpy_8molecule_8symmetry_9_indistinguishable(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *__pyx_v_atom1 = 0;
+  struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *__pyx_v_atom2 = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_indistinguishable (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_atom1,&__pyx_n_s_atom2,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_atom1)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_atom2)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("_indistinguishable", 1, 2, 2, 1); __PYX_ERR(0, 515, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "_indistinguishable") < 0)) __PYX_ERR(0, 515, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_atom1 = ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)values[0]);
+    __pyx_v_atom2 = ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)values[1]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("_indistinguishable", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 515, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("rmgpy.molecule.symmetry._indistinguishable", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_atom1), __pyx_ptype_5rmgpy_8molecule_8molecule_Atom, 1, "atom1", 0))) __PYX_ERR(0, 515, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_atom2), __pyx_ptype_5rmgpy_8molecule_8molecule_Atom, 1, "atom2", 0))) __PYX_ERR(0, 515, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_8symmetry_8_indistinguishable(__pyx_self, __pyx_v_atom1, __pyx_v_atom2);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8molecule_8symmetry_8_indistinguishable(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *__pyx_v_atom1, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *__pyx_v_atom2) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_indistinguishable", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_5rmgpy_8molecule_8symmetry__indistinguishable(__pyx_v_atom1, __pyx_v_atom2, 0); if (unlikely(__pyx_t_1 == ((int)-2))) __PYX_ERR(0, 515, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 515, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("rmgpy.molecule.symmetry._indistinguishable", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "rmgpy/molecule/symmetry.py":547
+ * 
+ * 
+ * def calculate_symmetry_number(molecule):             # <<<<<<<<<<<<<<
+ *     """
+ *     Return the symmetry number for the structure. The symmetry number
+ */
+
+static PyObject *__pyx_pw_5rmgpy_8molecule_8symmetry_11calculate_symmetry_number(PyObject *__pyx_self, PyObject *__pyx_v_molecule); /*proto*/
+static float __pyx_f_5rmgpy_8molecule_8symmetry_calculate_symmetry_number(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *__pyx_v_molecule, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  PyObject *__pyx_v_symmetry_number = NULL;
+  PyObject *__pyx_v_atom = NULL;
+  PyObject *__pyx_v_atom1 = NULL;
+  PyObject *__pyx_v_atom2 = NULL;
+  float __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  float __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  Py_ssize_t __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  int __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("calculate_symmetry_number", 0);
+
+  /* "rmgpy/molecule/symmetry.py":552
+ *     includes both external and internal modes.
+ *     """
+ *     symmetry_number = 1             # <<<<<<<<<<<<<<
+ * 
+ *     for atom in molecule.vertices:
+ */
+  __Pyx_INCREF(__pyx_int_1);
+  __pyx_v_symmetry_number = __pyx_int_1;
+
+  /* "rmgpy/molecule/symmetry.py":554
+ *     symmetry_number = 1
+ * 
+ *     for atom in molecule.vertices:             # <<<<<<<<<<<<<<
+ *         if not molecule.is_atom_in_cycle(atom):
+ *             symmetry_number *= calculate_atom_symmetry_number(molecule, atom)
+ */
+  if (unlikely(__pyx_v_molecule->__pyx_base.vertices == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+    __PYX_ERR(0, 554, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_v_molecule->__pyx_base.vertices; __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
+  for (;;) {
+    if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_1)) break;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    __pyx_t_3 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 554, __pyx_L1_error)
+    #else
+    __pyx_t_3 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 554, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    #endif
+    __Pyx_XDECREF_SET(__pyx_v_atom, __pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":555
+ * 
+ *     for atom in molecule.vertices:
+ *         if not molecule.is_atom_in_cycle(atom):             # <<<<<<<<<<<<<<
+ *             symmetry_number *= calculate_atom_symmetry_number(molecule, atom)
+ * 
+ */
+    if (!(likely(((__pyx_v_atom) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_atom, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 555, __pyx_L1_error)
+    __pyx_t_4 = ((struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Molecule *)__pyx_v_molecule->__pyx_base.__pyx_vtab)->is_atom_in_cycle(__pyx_v_molecule, ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_v_atom), 0); if (unlikely(__pyx_t_4 == ((int)-2))) __PYX_ERR(0, 555, __pyx_L1_error)
+    __pyx_t_5 = ((!(__pyx_t_4 != 0)) != 0);
+    if (__pyx_t_5) {
+
+      /* "rmgpy/molecule/symmetry.py":556
+ *     for atom in molecule.vertices:
+ *         if not molecule.is_atom_in_cycle(atom):
+ *             symmetry_number *= calculate_atom_symmetry_number(molecule, atom)             # <<<<<<<<<<<<<<
+ * 
+ *     for atom1 in molecule.vertices:
+ */
+      if (!(likely(((__pyx_v_atom) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_atom, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 556, __pyx_L1_error)
+      __pyx_t_6 = __pyx_f_5rmgpy_8molecule_8symmetry_calculate_atom_symmetry_number(__pyx_v_molecule, ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_v_atom), 0); if (unlikely(__pyx_t_6 == ((float)-1.0))) __PYX_ERR(0, 556, __pyx_L1_error)
+      __pyx_t_3 = PyFloat_FromDouble(__pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 556, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_7 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_t_3); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 556, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_7);
+      __pyx_t_7 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":555
+ * 
+ *     for atom in molecule.vertices:
+ *         if not molecule.is_atom_in_cycle(atom):             # <<<<<<<<<<<<<<
+ *             symmetry_number *= calculate_atom_symmetry_number(molecule, atom)
+ * 
+ */
+    }
+
+    /* "rmgpy/molecule/symmetry.py":554
+ *     symmetry_number = 1
+ * 
+ *     for atom in molecule.vertices:             # <<<<<<<<<<<<<<
+ *         if not molecule.is_atom_in_cycle(atom):
+ *             symmetry_number *= calculate_atom_symmetry_number(molecule, atom)
+ */
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":558
+ *             symmetry_number *= calculate_atom_symmetry_number(molecule, atom)
+ * 
+ *     for atom1 in molecule.vertices:             # <<<<<<<<<<<<<<
+ *         for atom2 in list(atom1.edges):  # Make a copy of the list of neighbors since we modify the dictionary
+ *             if (molecule.vertices.index(atom1) < molecule.vertices.index(atom2) and
+ */
+  if (unlikely(__pyx_v_molecule->__pyx_base.vertices == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+    __PYX_ERR(0, 558, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_v_molecule->__pyx_base.vertices; __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
+  for (;;) {
+    if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_1)) break;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    __pyx_t_7 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_7); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 558, __pyx_L1_error)
+    #else
+    __pyx_t_7 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 558, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    #endif
+    __Pyx_XDECREF_SET(__pyx_v_atom1, __pyx_t_7);
+    __pyx_t_7 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":559
+ * 
+ *     for atom1 in molecule.vertices:
+ *         for atom2 in list(atom1.edges):  # Make a copy of the list of neighbors since we modify the dictionary             # <<<<<<<<<<<<<<
+ *             if (molecule.vertices.index(atom1) < molecule.vertices.index(atom2) and
+ *                     not molecule.is_bond_in_cycle(atom1.edges[atom2])):
+ */
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_atom1, __pyx_n_s_edges); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 559, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_3 = PySequence_List(__pyx_t_7); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 559, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_7 = __pyx_t_3; __Pyx_INCREF(__pyx_t_7); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    for (;;) {
+      if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_7)) break;
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      __pyx_t_3 = PyList_GET_ITEM(__pyx_t_7, __pyx_t_8); __Pyx_INCREF(__pyx_t_3); __pyx_t_8++; if (unlikely(0 < 0)) __PYX_ERR(0, 559, __pyx_L1_error)
+      #else
+      __pyx_t_3 = PySequence_ITEM(__pyx_t_7, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 559, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      #endif
+      __Pyx_XDECREF_SET(__pyx_v_atom2, __pyx_t_3);
+      __pyx_t_3 = 0;
+
+      /* "rmgpy/molecule/symmetry.py":560
+ *     for atom1 in molecule.vertices:
+ *         for atom2 in list(atom1.edges):  # Make a copy of the list of neighbors since we modify the dictionary
+ *             if (molecule.vertices.index(atom1) < molecule.vertices.index(atom2) and             # <<<<<<<<<<<<<<
+ *                     not molecule.is_bond_in_cycle(atom1.edges[atom2])):
+ *                 symmetry_number *= calculate_bond_symmetry_number(molecule, atom1, atom2)
+ */
+      __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_molecule->__pyx_base.vertices, __pyx_n_s_index); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 560, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_10 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+        __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_9);
+        if (likely(__pyx_t_10)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+          __Pyx_INCREF(__pyx_t_10);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_9, function);
+        }
+      }
+      __pyx_t_3 = (__pyx_t_10) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_10, __pyx_v_atom1) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_v_atom1);
+      __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 560, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_v_molecule->__pyx_base.vertices, __pyx_n_s_index); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 560, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      __pyx_t_11 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_10))) {
+        __pyx_t_11 = PyMethod_GET_SELF(__pyx_t_10);
+        if (likely(__pyx_t_11)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_10);
+          __Pyx_INCREF(__pyx_t_11);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_10, function);
+        }
+      }
+      __pyx_t_9 = (__pyx_t_11) ? __Pyx_PyObject_Call2Args(__pyx_t_10, __pyx_t_11, __pyx_v_atom2) : __Pyx_PyObject_CallOneArg(__pyx_t_10, __pyx_v_atom2);
+      __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+      if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 560, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      __pyx_t_10 = PyObject_RichCompare(__pyx_t_3, __pyx_t_9, Py_LT); __Pyx_XGOTREF(__pyx_t_10); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 560, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_10); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 560, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      if (__pyx_t_4) {
+      } else {
+        __pyx_t_5 = __pyx_t_4;
+        goto __pyx_L11_bool_binop_done;
+      }
+
+      /* "rmgpy/molecule/symmetry.py":561
+ *         for atom2 in list(atom1.edges):  # Make a copy of the list of neighbors since we modify the dictionary
+ *             if (molecule.vertices.index(atom1) < molecule.vertices.index(atom2) and
+ *                     not molecule.is_bond_in_cycle(atom1.edges[atom2])):             # <<<<<<<<<<<<<<
+ *                 symmetry_number *= calculate_bond_symmetry_number(molecule, atom1, atom2)
+ * 
+ */
+      __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_v_atom1, __pyx_n_s_edges); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 561, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      __pyx_t_9 = __Pyx_PyObject_GetItem(__pyx_t_10, __pyx_v_atom2); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 561, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      if (!(likely(((__pyx_t_9) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_9, __pyx_ptype_5rmgpy_8molecule_8molecule_Bond))))) __PYX_ERR(0, 561, __pyx_L1_error)
+      __pyx_t_4 = ((struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Molecule *)__pyx_v_molecule->__pyx_base.__pyx_vtab)->is_bond_in_cycle(__pyx_v_molecule, ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond *)__pyx_t_9), 0); if (unlikely(__pyx_t_4 == ((int)-2))) __PYX_ERR(0, 561, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_12 = ((!(__pyx_t_4 != 0)) != 0);
+      __pyx_t_5 = __pyx_t_12;
+      __pyx_L11_bool_binop_done:;
+
+      /* "rmgpy/molecule/symmetry.py":560
+ *     for atom1 in molecule.vertices:
+ *         for atom2 in list(atom1.edges):  # Make a copy of the list of neighbors since we modify the dictionary
+ *             if (molecule.vertices.index(atom1) < molecule.vertices.index(atom2) and             # <<<<<<<<<<<<<<
+ *                     not molecule.is_bond_in_cycle(atom1.edges[atom2])):
+ *                 symmetry_number *= calculate_bond_symmetry_number(molecule, atom1, atom2)
+ */
+      if (__pyx_t_5) {
+
+        /* "rmgpy/molecule/symmetry.py":562
+ *             if (molecule.vertices.index(atom1) < molecule.vertices.index(atom2) and
+ *                     not molecule.is_bond_in_cycle(atom1.edges[atom2])):
+ *                 symmetry_number *= calculate_bond_symmetry_number(molecule, atom1, atom2)             # <<<<<<<<<<<<<<
+ * 
+ *     symmetry_number *= calculate_axis_symmetry_number(molecule)
+ */
+        if (!(likely(((__pyx_v_atom1) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_atom1, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 562, __pyx_L1_error)
+        if (!(likely(((__pyx_v_atom2) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_atom2, __pyx_ptype_5rmgpy_8molecule_8molecule_Atom))))) __PYX_ERR(0, 562, __pyx_L1_error)
+        __pyx_t_6 = __pyx_f_5rmgpy_8molecule_8symmetry_calculate_bond_symmetry_number(__pyx_v_molecule, ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_v_atom1), ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *)__pyx_v_atom2), 0); if (unlikely(__pyx_t_6 == ((float)-1.0))) __PYX_ERR(0, 562, __pyx_L1_error)
+        __pyx_t_9 = PyFloat_FromDouble(__pyx_t_6); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 562, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_10 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_t_9); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 562, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_10);
+        __pyx_t_10 = 0;
+
+        /* "rmgpy/molecule/symmetry.py":560
+ *     for atom1 in molecule.vertices:
+ *         for atom2 in list(atom1.edges):  # Make a copy of the list of neighbors since we modify the dictionary
+ *             if (molecule.vertices.index(atom1) < molecule.vertices.index(atom2) and             # <<<<<<<<<<<<<<
+ *                     not molecule.is_bond_in_cycle(atom1.edges[atom2])):
+ *                 symmetry_number *= calculate_bond_symmetry_number(molecule, atom1, atom2)
+ */
+      }
+
+      /* "rmgpy/molecule/symmetry.py":559
+ * 
+ *     for atom1 in molecule.vertices:
+ *         for atom2 in list(atom1.edges):  # Make a copy of the list of neighbors since we modify the dictionary             # <<<<<<<<<<<<<<
+ *             if (molecule.vertices.index(atom1) < molecule.vertices.index(atom2) and
+ *                     not molecule.is_bond_in_cycle(atom1.edges[atom2])):
+ */
+    }
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":558
+ *             symmetry_number *= calculate_atom_symmetry_number(molecule, atom)
+ * 
+ *     for atom1 in molecule.vertices:             # <<<<<<<<<<<<<<
+ *         for atom2 in list(atom1.edges):  # Make a copy of the list of neighbors since we modify the dictionary
+ *             if (molecule.vertices.index(atom1) < molecule.vertices.index(atom2) and
+ */
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":564
+ *                 symmetry_number *= calculate_bond_symmetry_number(molecule, atom1, atom2)
+ * 
+ *     symmetry_number *= calculate_axis_symmetry_number(molecule)             # <<<<<<<<<<<<<<
+ * 
+ *     if molecule.is_cyclic():
+ */
+  __pyx_t_6 = __pyx_f_5rmgpy_8molecule_8symmetry_calculate_axis_symmetry_number(__pyx_v_molecule, 0); if (unlikely(__pyx_t_6 == ((float)-1.0))) __PYX_ERR(0, 564, __pyx_L1_error)
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 564, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_7 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_t_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 564, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_7);
+  __pyx_t_7 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":566
+ *     symmetry_number *= calculate_axis_symmetry_number(molecule)
+ * 
+ *     if molecule.is_cyclic():             # <<<<<<<<<<<<<<
+ *         symmetry_number *= calculate_cyclic_symmetry_number(molecule)
+ * 
+ */
+  __pyx_t_5 = ((struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Molecule *)__pyx_v_molecule->__pyx_base.__pyx_vtab)->__pyx_base.is_cyclic(((struct __pyx_obj_5rmgpy_8molecule_5graph_Graph *)__pyx_v_molecule), 0); if (unlikely(__pyx_t_5 == ((int)-2))) __PYX_ERR(0, 566, __pyx_L1_error)
+  __pyx_t_12 = (__pyx_t_5 != 0);
+  if (__pyx_t_12) {
+
+    /* "rmgpy/molecule/symmetry.py":567
+ * 
+ *     if molecule.is_cyclic():
+ *         symmetry_number *= calculate_cyclic_symmetry_number(molecule)             # <<<<<<<<<<<<<<
+ * 
+ *     return symmetry_number
+ */
+    __pyx_t_6 = __pyx_f_5rmgpy_8molecule_8symmetry_calculate_cyclic_symmetry_number(__pyx_v_molecule, 0); if (unlikely(__pyx_t_6 == ((float)-1.0))) __PYX_ERR(0, 567, __pyx_L1_error)
+    __pyx_t_7 = PyFloat_FromDouble(__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 567, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_1 = PyNumber_InPlaceMultiply(__pyx_v_symmetry_number, __pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 567, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF_SET(__pyx_v_symmetry_number, __pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "rmgpy/molecule/symmetry.py":566
+ *     symmetry_number *= calculate_axis_symmetry_number(molecule)
+ * 
+ *     if molecule.is_cyclic():             # <<<<<<<<<<<<<<
+ *         symmetry_number *= calculate_cyclic_symmetry_number(molecule)
+ * 
+ */
+  }
+
+  /* "rmgpy/molecule/symmetry.py":569
+ *         symmetry_number *= calculate_cyclic_symmetry_number(molecule)
+ * 
+ *     return symmetry_number             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_6 = __pyx_PyFloat_AsFloat(__pyx_v_symmetry_number); if (unlikely((__pyx_t_6 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 569, __pyx_L1_error)
+  __pyx_r = __pyx_t_6;
+  goto __pyx_L0;
+
+  /* "rmgpy/molecule/symmetry.py":547
+ * 
+ * 
+ * def calculate_symmetry_number(molecule):             # <<<<<<<<<<<<<<
+ *     """
+ *     Return the symmetry number for the structure. The symmetry number
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_AddTraceback("rmgpy.molecule.symmetry.calculate_symmetry_number", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1.0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_symmetry_number);
+  __Pyx_XDECREF(__pyx_v_atom);
+  __Pyx_XDECREF(__pyx_v_atom1);
+  __Pyx_XDECREF(__pyx_v_atom2);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5rmgpy_8molecule_8symmetry_11calculate_symmetry_number(PyObject *__pyx_self, PyObject *__pyx_v_molecule); /*proto*/
+static char __pyx_doc_5rmgpy_8molecule_8symmetry_10calculate_symmetry_number[] = "\n    Return the symmetry number for the structure. The symmetry number\n    includes both external and internal modes.\n    ";
+static PyMethodDef __pyx_mdef_5rmgpy_8molecule_8symmetry_11calculate_symmetry_number = {"calculate_symmetry_number", (PyCFunction)__pyx_pw_5rmgpy_8molecule_8symmetry_11calculate_symmetry_number, METH_O, __pyx_doc_5rmgpy_8molecule_8symmetry_10calculate_symmetry_number};
+static PyObject *__pyx_pw_5rmgpy_8molecule_8symmetry_11calculate_symmetry_number(PyObject *__pyx_self, PyObject *__pyx_v_molecule) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("calculate_symmetry_number (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_molecule), __pyx_ptype_5rmgpy_8molecule_8molecule_Molecule, 1, "molecule", 0))) __PYX_ERR(0, 547, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5rmgpy_8molecule_8symmetry_10calculate_symmetry_number(__pyx_self, ((struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *)__pyx_v_molecule));
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5rmgpy_8molecule_8symmetry_10calculate_symmetry_number(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *__pyx_v_molecule) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  float __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("calculate_symmetry_number", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_5rmgpy_8molecule_8symmetry_calculate_symmetry_number(__pyx_v_molecule, 0); if (unlikely(__pyx_t_1 == ((float)-1.0))) __PYX_ERR(0, 547, __pyx_L1_error)
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 547, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("rmgpy.molecule.symmetry.calculate_symmetry_number", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":731
+ * ctypedef npy_cdouble     complex_t
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__pyx_v_a) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew1", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":732
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):
+ *     return PyArray_MultiIterNew(1, <void*>a)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(1, ((void *)__pyx_v_a)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 732, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":731
+ * ctypedef npy_cdouble     complex_t
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew1", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":734
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__pyx_v_a, PyObject *__pyx_v_b) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew2", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":735
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(2, ((void *)__pyx_v_a), ((void *)__pyx_v_b)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":734
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew2", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":737
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew3", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":738
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(3, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 738, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":737
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew3", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":740
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c, PyObject *__pyx_v_d) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew4", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":741
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(4, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 741, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":740
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew4", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":743
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c, PyObject *__pyx_v_d, PyObject *__pyx_v_e) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew5", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":744
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(5, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d), ((void *)__pyx_v_e)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 744, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":743
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew5", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":746
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
+ *     if PyDataType_HASSUBARRAY(d):
+ *         return <tuple>d.subarray.shape
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__pyx_v_d) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("PyDataType_SHAPE", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":747
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
+ *         return <tuple>d.subarray.shape
+ *     else:
+ */
+  __pyx_t_1 = (PyDataType_HASSUBARRAY(__pyx_v_d) != 0);
+  if (__pyx_t_1) {
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":748
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ *     if PyDataType_HASSUBARRAY(d):
+ *         return <tuple>d.subarray.shape             # <<<<<<<<<<<<<<
+ *     else:
+ *         return ()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(((PyObject*)__pyx_v_d->subarray->shape));
+    __pyx_r = ((PyObject*)__pyx_v_d->subarray->shape);
+    goto __pyx_L0;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":747
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
+ *         return <tuple>d.subarray.shape
+ *     else:
+ */
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":750
+ *         return <tuple>d.subarray.shape
+ *     else:
+ *         return ()             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_empty_tuple);
+    __pyx_r = __pyx_empty_tuple;
+    goto __pyx_L0;
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":746
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
+ *     if PyDataType_HASSUBARRAY(d):
+ *         return <tuple>d.subarray.shape
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":926
+ *     int _import_umath() except -1
+ * 
+ * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
+ *     Py_INCREF(base) # important to do this before stealing the reference below!
+ *     PyArray_SetBaseObject(arr, base)
+ */
+
+static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_arr, PyObject *__pyx_v_base) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("set_array_base", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":927
+ * 
+ * cdef inline void set_array_base(ndarray arr, object base):
+ *     Py_INCREF(base) # important to do this before stealing the reference below!             # <<<<<<<<<<<<<<
+ *     PyArray_SetBaseObject(arr, base)
+ * 
+ */
+  Py_INCREF(__pyx_v_base);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":928
+ * cdef inline void set_array_base(ndarray arr, object base):
+ *     Py_INCREF(base) # important to do this before stealing the reference below!
+ *     PyArray_SetBaseObject(arr, base)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object get_array_base(ndarray arr):
+ */
+  __pyx_t_1 = PyArray_SetBaseObject(__pyx_v_arr, __pyx_v_base); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(1, 928, __pyx_L1_error)
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":926
+ *     int _import_umath() except -1
+ * 
+ * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
+ *     Py_INCREF(base) # important to do this before stealing the reference below!
+ *     PyArray_SetBaseObject(arr, base)
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("numpy.set_array_base", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":930
+ *     PyArray_SetBaseObject(arr, base)
+ * 
+ * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__pyx_v_arr) {
+  PyObject *__pyx_v_base;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("get_array_base", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":931
+ * 
+ * cdef inline object get_array_base(ndarray arr):
+ *     base = PyArray_BASE(arr)             # <<<<<<<<<<<<<<
+ *     if base is NULL:
+ *         return None
+ */
+  __pyx_v_base = PyArray_BASE(__pyx_v_arr);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":932
+ * cdef inline object get_array_base(ndarray arr):
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:             # <<<<<<<<<<<<<<
+ *         return None
+ *     return <object>base
+ */
+  __pyx_t_1 = ((__pyx_v_base == NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":933
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:
+ *         return None             # <<<<<<<<<<<<<<
+ *     return <object>base
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":932
+ * cdef inline object get_array_base(ndarray arr):
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:             # <<<<<<<<<<<<<<
+ *         return None
+ *     return <object>base
+ */
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":934
+ *     if base is NULL:
+ *         return None
+ *     return <object>base             # <<<<<<<<<<<<<<
+ * 
+ * # Versions of the import_* functions which are more suitable for
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_base));
+  __pyx_r = ((PyObject *)__pyx_v_base);
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":930
+ *     PyArray_SetBaseObject(arr, base)
+ * 
+ * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":938
+ * # Versions of the import_* functions which are more suitable for
+ * # Cython code.
+ * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         __pyx_import_array()
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("import_array", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":939
+ * # Cython code.
+ * cdef inline int import_array() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         __pyx_import_array()
+ *     except Exception:
+ */
+  {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
+    __Pyx_XGOTREF(__pyx_t_1);
+    __Pyx_XGOTREF(__pyx_t_2);
+    __Pyx_XGOTREF(__pyx_t_3);
+    /*try:*/ {
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":940
+ * cdef inline int import_array() except -1:
+ *     try:
+ *         __pyx_import_array()             # <<<<<<<<<<<<<<
+ *     except Exception:
+ *         raise ImportError("numpy.core.multiarray failed to import")
+ */
+      __pyx_t_4 = _import_array(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(1, 940, __pyx_L3_error)
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":939
+ * # Cython code.
+ * cdef inline int import_array() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         __pyx_import_array()
+ *     except Exception:
+ */
+    }
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L8_try_end;
+    __pyx_L3_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":941
+ *     try:
+ *         __pyx_import_array()
+ *     except Exception:             # <<<<<<<<<<<<<<
+ *         raise ImportError("numpy.core.multiarray failed to import")
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
+    if (__pyx_t_4) {
+      __Pyx_AddTraceback("numpy.import_array", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(1, 941, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GOTREF(__pyx_t_7);
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":942
+ *         __pyx_import_array()
+ *     except Exception:
+ *         raise ImportError("numpy.core.multiarray failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int import_umath() except -1:
+ */
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 942, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_Raise(__pyx_t_8, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __PYX_ERR(1, 942, __pyx_L5_except_error)
+    }
+    goto __pyx_L5_except_error;
+    __pyx_L5_except_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":939
+ * # Cython code.
+ * cdef inline int import_array() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         __pyx_import_array()
+ *     except Exception:
+ */
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L1_error;
+    __pyx_L8_try_end:;
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":938
+ * # Versions of the import_* functions which are more suitable for
+ * # Cython code.
+ * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         __pyx_import_array()
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("numpy.import_array", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":944
+ *         raise ImportError("numpy.core.multiarray failed to import")
+ * 
+ * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         _import_umath()
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("import_umath", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":945
+ * 
+ * cdef inline int import_umath() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+  {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
+    __Pyx_XGOTREF(__pyx_t_1);
+    __Pyx_XGOTREF(__pyx_t_2);
+    __Pyx_XGOTREF(__pyx_t_3);
+    /*try:*/ {
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":946
+ * cdef inline int import_umath() except -1:
+ *     try:
+ *         _import_umath()             # <<<<<<<<<<<<<<
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")
+ */
+      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(1, 946, __pyx_L3_error)
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":945
+ * 
+ * cdef inline int import_umath() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+    }
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L8_try_end;
+    __pyx_L3_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":947
+ *     try:
+ *         _import_umath()
+ *     except Exception:             # <<<<<<<<<<<<<<
+ *         raise ImportError("numpy.core.umath failed to import")
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
+    if (__pyx_t_4) {
+      __Pyx_AddTraceback("numpy.import_umath", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(1, 947, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GOTREF(__pyx_t_7);
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":948
+ *         _import_umath()
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int import_ufunc() except -1:
+ */
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 948, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_Raise(__pyx_t_8, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __PYX_ERR(1, 948, __pyx_L5_except_error)
+    }
+    goto __pyx_L5_except_error;
+    __pyx_L5_except_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":945
+ * 
+ * cdef inline int import_umath() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L1_error;
+    __pyx_L8_try_end:;
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":944
+ *         raise ImportError("numpy.core.multiarray failed to import")
+ * 
+ * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         _import_umath()
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("numpy.import_umath", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":950
+ *         raise ImportError("numpy.core.umath failed to import")
+ * 
+ * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         _import_umath()
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("import_ufunc", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":951
+ * 
+ * cdef inline int import_ufunc() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+  {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
+    __Pyx_XGOTREF(__pyx_t_1);
+    __Pyx_XGOTREF(__pyx_t_2);
+    __Pyx_XGOTREF(__pyx_t_3);
+    /*try:*/ {
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":952
+ * cdef inline int import_ufunc() except -1:
+ *     try:
+ *         _import_umath()             # <<<<<<<<<<<<<<
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")
+ */
+      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(1, 952, __pyx_L3_error)
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":951
+ * 
+ * cdef inline int import_ufunc() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+    }
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L8_try_end;
+    __pyx_L3_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":953
+ *     try:
+ *         _import_umath()
+ *     except Exception:             # <<<<<<<<<<<<<<
+ *         raise ImportError("numpy.core.umath failed to import")
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
+    if (__pyx_t_4) {
+      __Pyx_AddTraceback("numpy.import_ufunc", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(1, 953, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GOTREF(__pyx_t_7);
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":954
+ *         _import_umath()
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef extern from *:
+ */
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 954, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_Raise(__pyx_t_8, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __PYX_ERR(1, 954, __pyx_L5_except_error)
+    }
+    goto __pyx_L5_except_error;
+    __pyx_L5_except_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":951
+ * 
+ * cdef inline int import_ufunc() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L1_error;
+    __pyx_L8_try_end:;
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":950
+ *         raise ImportError("numpy.core.umath failed to import")
+ * 
+ * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         _import_umath()
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("numpy.import_ufunc", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":964
+ * 
+ * 
+ * cdef inline bint is_timedelta64_object(object obj):             # <<<<<<<<<<<<<<
+ *     """
+ *     Cython equivalent of `isinstance(obj, np.timedelta64)`
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_is_timedelta64_object(PyObject *__pyx_v_obj) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("is_timedelta64_object", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":976
+ *     bool
+ *     """
+ *     return PyObject_TypeCheck(obj, &PyTimedeltaArrType_Type)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = PyObject_TypeCheck(__pyx_v_obj, (&PyTimedeltaArrType_Type));
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":964
+ * 
+ * 
+ * cdef inline bint is_timedelta64_object(object obj):             # <<<<<<<<<<<<<<
+ *     """
+ *     Cython equivalent of `isinstance(obj, np.timedelta64)`
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":979
+ * 
+ * 
+ * cdef inline bint is_datetime64_object(object obj):             # <<<<<<<<<<<<<<
+ *     """
+ *     Cython equivalent of `isinstance(obj, np.datetime64)`
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_is_datetime64_object(PyObject *__pyx_v_obj) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("is_datetime64_object", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":991
+ *     bool
+ *     """
+ *     return PyObject_TypeCheck(obj, &PyDatetimeArrType_Type)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = PyObject_TypeCheck(__pyx_v_obj, (&PyDatetimeArrType_Type));
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":979
+ * 
+ * 
+ * cdef inline bint is_datetime64_object(object obj):             # <<<<<<<<<<<<<<
+ *     """
+ *     Cython equivalent of `isinstance(obj, np.datetime64)`
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":994
+ * 
+ * 
+ * cdef inline npy_datetime get_datetime64_value(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the int64 value underlying scalar numpy datetime64 object
+ */
+
+static CYTHON_INLINE npy_datetime __pyx_f_5numpy_get_datetime64_value(PyObject *__pyx_v_obj) {
+  npy_datetime __pyx_r;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1001
+ *     also needed.  That can be found using `get_datetime64_unit`.
+ *     """
+ *     return (<PyDatetimeScalarObject*>obj).obval             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = ((PyDatetimeScalarObject *)__pyx_v_obj)->obval;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":994
+ * 
+ * 
+ * cdef inline npy_datetime get_datetime64_value(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the int64 value underlying scalar numpy datetime64 object
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1004
+ * 
+ * 
+ * cdef inline npy_timedelta get_timedelta64_value(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the int64 value underlying scalar numpy timedelta64 object
+ */
+
+static CYTHON_INLINE npy_timedelta __pyx_f_5numpy_get_timedelta64_value(PyObject *__pyx_v_obj) {
+  npy_timedelta __pyx_r;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1008
+ *     returns the int64 value underlying scalar numpy timedelta64 object
+ *     """
+ *     return (<PyTimedeltaScalarObject*>obj).obval             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = ((PyTimedeltaScalarObject *)__pyx_v_obj)->obval;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1004
+ * 
+ * 
+ * cdef inline npy_timedelta get_timedelta64_value(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the int64 value underlying scalar numpy timedelta64 object
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1011
+ * 
+ * 
+ * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the unit part of the dtype for a numpy datetime64 object.
+ */
+
+static CYTHON_INLINE NPY_DATETIMEUNIT __pyx_f_5numpy_get_datetime64_unit(PyObject *__pyx_v_obj) {
+  NPY_DATETIMEUNIT __pyx_r;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1015
+ *     returns the unit part of the dtype for a numpy datetime64 object.
+ *     """
+ *     return <NPY_DATETIMEUNIT>(<PyDatetimeScalarObject*>obj).obmeta.base             # <<<<<<<<<<<<<<
+ */
+  __pyx_r = ((NPY_DATETIMEUNIT)((PyDatetimeScalarObject *)__pyx_v_obj)->obmeta.base);
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1011
+ * 
+ * 
+ * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the unit part of the dtype for a numpy datetime64 object.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec_symmetry(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec_symmetry},
+  {0, NULL}
+};
+#endif
+
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "symmetry",
+    __pyx_k_This_module_provides_functional, /* m_doc */
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    0, /* m_size */
+  #else
+    -1, /* m_size */
+  #endif
+    __pyx_methods /* m_methods */,
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    __pyx_moduledef_slots, /* m_slots */
+  #else
+    NULL, /* m_reload */
+  #endif
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_n_s_ImportError, __pyx_k_ImportError, sizeof(__pyx_k_ImportError), 0, 0, 1, 1},
+  {&__pyx_n_u_N3d, __pyx_k_N3d, sizeof(__pyx_k_N3d), 0, 1, 0, 1},
+  {&__pyx_n_u_O2s, __pyx_k_O2s, sizeof(__pyx_k_O2s), 0, 1, 0, 1},
+  {&__pyx_n_s_append, __pyx_k_append, sizeof(__pyx_k_append), 0, 0, 1, 1},
+  {&__pyx_n_s_atom, __pyx_k_atom, sizeof(__pyx_k_atom), 0, 0, 1, 1},
+  {&__pyx_n_s_atom1, __pyx_k_atom1, sizeof(__pyx_k_atom1), 0, 0, 1, 1},
+  {&__pyx_n_s_atom2, __pyx_k_atom2, sizeof(__pyx_k_atom2), 0, 0, 1, 1},
+  {&__pyx_n_s_atoms, __pyx_k_atoms, sizeof(__pyx_k_atoms), 0, 0, 1, 1},
+  {&__pyx_n_s_atomtype, __pyx_k_atomtype, sizeof(__pyx_k_atomtype), 0, 0, 1, 1},
+  {&__pyx_n_s_bonds, __pyx_k_bonds, sizeof(__pyx_k_bonds), 0, 0, 1, 1},
+  {&__pyx_n_s_calculate_atom_symmetry_number, __pyx_k_calculate_atom_symmetry_number, sizeof(__pyx_k_calculate_atom_symmetry_number), 0, 0, 1, 1},
+  {&__pyx_n_s_calculate_axis_symmetry_number, __pyx_k_calculate_axis_symmetry_number, sizeof(__pyx_k_calculate_axis_symmetry_number), 0, 0, 1, 1},
+  {&__pyx_n_s_calculate_bond_symmetry_number, __pyx_k_calculate_bond_symmetry_number, sizeof(__pyx_k_calculate_bond_symmetry_number), 0, 0, 1, 1},
+  {&__pyx_n_s_calculate_cyclic_symmetry_number, __pyx_k_calculate_cyclic_symmetry_number, sizeof(__pyx_k_calculate_cyclic_symmetry_number), 0, 0, 1, 1},
+  {&__pyx_n_s_calculate_symmetry_number, __pyx_k_calculate_symmetry_number, sizeof(__pyx_k_calculate_symmetry_number), 0, 0, 1, 1},
+  {&__pyx_n_s_chain, __pyx_k_chain, sizeof(__pyx_k_chain), 0, 0, 1, 1},
+  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_count, __pyx_k_count, sizeof(__pyx_k_count), 0, 0, 1, 1},
+  {&__pyx_n_s_edges, __pyx_k_edges, sizeof(__pyx_k_edges), 0, 0, 1, 1},
+  {&__pyx_n_s_enumerate, __pyx_k_enumerate, sizeof(__pyx_k_enumerate), 0, 0, 1, 1},
+  {&__pyx_n_s_equivalent, __pyx_k_equivalent, sizeof(__pyx_k_equivalent), 0, 0, 1, 1},
+  {&__pyx_n_s_id, __pyx_k_id, sizeof(__pyx_k_id), 0, 0, 1, 1},
+  {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_index, __pyx_k_index, sizeof(__pyx_k_index), 0, 0, 1, 1},
+  {&__pyx_n_s_indistinguishable, __pyx_k_indistinguishable, sizeof(__pyx_k_indistinguishable), 0, 0, 1, 1},
+  {&__pyx_n_s_is_benzene, __pyx_k_is_benzene, sizeof(__pyx_k_is_benzene), 0, 0, 1, 1},
+  {&__pyx_n_s_is_double, __pyx_k_is_double, sizeof(__pyx_k_is_double), 0, 0, 1, 1},
+  {&__pyx_n_s_is_isomorphic, __pyx_k_is_isomorphic, sizeof(__pyx_k_is_isomorphic), 0, 0, 1, 1},
+  {&__pyx_n_s_is_single, __pyx_k_is_single, sizeof(__pyx_k_is_single), 0, 0, 1, 1},
+  {&__pyx_n_s_is_triple, __pyx_k_is_triple, sizeof(__pyx_k_is_triple), 0, 0, 1, 1},
+  {&__pyx_n_s_items, __pyx_k_items, sizeof(__pyx_k_items), 0, 0, 1, 1},
+  {&__pyx_n_s_itertools, __pyx_k_itertools, sizeof(__pyx_k_itertools), 0, 0, 1, 1},
+  {&__pyx_n_s_keys, __pyx_k_keys, sizeof(__pyx_k_keys), 0, 0, 1, 1},
+  {&__pyx_n_s_label, __pyx_k_label, sizeof(__pyx_k_label), 0, 0, 1, 1},
+  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_molecule, __pyx_k_molecule, sizeof(__pyx_k_molecule), 0, 0, 1, 1},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_kp_u_numpy_core_multiarray_failed_to, __pyx_k_numpy_core_multiarray_failed_to, sizeof(__pyx_k_numpy_core_multiarray_failed_to), 0, 1, 0, 0},
+  {&__pyx_kp_u_numpy_core_umath_failed_to_impor, __pyx_k_numpy_core_umath_failed_to_impor, sizeof(__pyx_k_numpy_core_umath_failed_to_impor), 0, 1, 0, 0},
+  {&__pyx_n_s_order, __pyx_k_order, sizeof(__pyx_k_order), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
+  {&__pyx_n_s_radical_electrons, __pyx_k_radical_electrons, sizeof(__pyx_k_radical_electrons), 0, 0, 1, 1},
+  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_s_remove, __pyx_k_remove, sizeof(__pyx_k_remove), 0, 0, 1, 1},
+  {&__pyx_n_s_remove_atom, __pyx_k_remove_atom, sizeof(__pyx_k_remove_atom), 0, 0, 1, 1},
+  {&__pyx_n_s_rmgpy_molecule_symmetry, __pyx_k_rmgpy_molecule_symmetry, sizeof(__pyx_k_rmgpy_molecule_symmetry), 0, 0, 1, 1},
+  {&__pyx_kp_s_rmgpy_molecule_symmetry_py, __pyx_k_rmgpy_molecule_symmetry_py, sizeof(__pyx_k_rmgpy_molecule_symmetry_py), 0, 0, 1, 0},
+  {&__pyx_n_s_split, __pyx_k_split, sizeof(__pyx_k_split), 0, 0, 1, 1},
+  {&__pyx_n_s_sum, __pyx_k_sum, sizeof(__pyx_k_sum), 0, 0, 1, 1},
+  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_n_s_values, __pyx_k_values, sizeof(__pyx_k_values), 0, 0, 1, 1},
+  {0, 0, 0, 0, 0, 0, 0}
+};
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 78, __pyx_L1_error)
+  __pyx_builtin_sum = __Pyx_GetBuiltinName(__pyx_n_s_sum); if (!__pyx_builtin_sum) __PYX_ERR(0, 77, __pyx_L1_error)
+  __pyx_builtin_enumerate = __Pyx_GetBuiltinName(__pyx_n_s_enumerate); if (!__pyx_builtin_enumerate) __PYX_ERR(0, 267, __pyx_L1_error)
+  __pyx_builtin_id = __Pyx_GetBuiltinName(__pyx_n_s_id); if (!__pyx_builtin_id) __PYX_ERR(0, 453, __pyx_L1_error)
+  __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(1, 942, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":942
+ *         __pyx_import_array()
+ *     except Exception:
+ *         raise ImportError("numpy.core.multiarray failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int import_umath() except -1:
+ */
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_u_numpy_core_multiarray_failed_to); if (unlikely(!__pyx_tuple_)) __PYX_ERR(1, 942, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_tuple_);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":948
+ *         _import_umath()
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int import_ufunc() except -1:
+ */
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_u_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(1, 948, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
+
+  /* "rmgpy/molecule/symmetry.py":38
+ * 
+ * 
+ * def calculate_atom_symmetry_number(molecule, atom):             # <<<<<<<<<<<<<<
+ *     """
+ *     Return the symmetry number centered at `atom` in the structure. The
+ */
+  __pyx_tuple__3 = PyTuple_Pack(2, __pyx_n_s_molecule, __pyx_n_s_atom); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+  __pyx_codeobj__4 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__3, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rmgpy_molecule_symmetry_py, __pyx_n_s_calculate_atom_symmetry_number, 38, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__4)) __PYX_ERR(0, 38, __pyx_L1_error)
+
+  /* "rmgpy/molecule/symmetry.py":152
+ * ################################################################################
+ * 
+ * def calculate_bond_symmetry_number(molecule, atom1, atom2):             # <<<<<<<<<<<<<<
+ *     """
+ *     Return the symmetry number centered at `bond` in the structure.
+ */
+  __pyx_tuple__5 = PyTuple_Pack(3, __pyx_n_s_molecule, __pyx_n_s_atom1, __pyx_n_s_atom2); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 152, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+  __pyx_codeobj__6 = (PyObject*)__Pyx_PyCode_New(3, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__5, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rmgpy_molecule_symmetry_py, __pyx_n_s_calculate_bond_symmetry_number, 152, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__6)) __PYX_ERR(0, 152, __pyx_L1_error)
+
+  /* "rmgpy/molecule/symmetry.py":224
+ * ################################################################################
+ * 
+ * def calculate_axis_symmetry_number(molecule):             # <<<<<<<<<<<<<<
+ *     r"""
+ *     Get the axis symmetry number correction. The "axis" refers to a series
+ */
+  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_n_s_molecule); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 224, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
+  __pyx_codeobj__8 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rmgpy_molecule_symmetry_py, __pyx_n_s_calculate_axis_symmetry_number, 224, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__8)) __PYX_ERR(0, 224, __pyx_L1_error)
+
+  /* "rmgpy/molecule/symmetry.py":395
+ * ################################################################################
+ * 
+ * def calculate_cyclic_symmetry_number(molecule):             # <<<<<<<<<<<<<<
+ *     """
+ *     Get the symmetry number correction for cyclic regions of a molecule.
+ */
+  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_n_s_molecule); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(0, 395, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
+  __pyx_codeobj__10 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__9, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rmgpy_molecule_symmetry_py, __pyx_n_s_calculate_cyclic_symmetry_number, 395, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__10)) __PYX_ERR(0, 395, __pyx_L1_error)
+
+  /* "rmgpy/molecule/symmetry.py":515
+ * 
+ * 
+ * def _indistinguishable(atom1, atom2):             # <<<<<<<<<<<<<<
+ *     """
+ *     Determine if two atoms are feasibly indistinguishable based on connections
+ */
+  __pyx_tuple__11 = PyTuple_Pack(2, __pyx_n_s_atom1, __pyx_n_s_atom2); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 515, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
+  __pyx_codeobj__12 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__11, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rmgpy_molecule_symmetry_py, __pyx_n_s_indistinguishable, 515, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__12)) __PYX_ERR(0, 515, __pyx_L1_error)
+
+  /* "rmgpy/molecule/symmetry.py":547
+ * 
+ * 
+ * def calculate_symmetry_number(molecule):             # <<<<<<<<<<<<<<
+ *     """
+ *     Return the symmetry number for the structure. The symmetry number
+ */
+  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_n_s_molecule); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 547, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
+  __pyx_codeobj__14 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_rmgpy_molecule_symmetry_py, __pyx_n_s_calculate_symmetry_number, 547, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__14)) __PYX_ERR(0, 547, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  __pyx_umethod_PyList_Type_count.type = (PyObject*)&PyList_Type;
+  __pyx_umethod_PyList_Type_remove.type = (PyObject*)&PyList_Type;
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_5 = PyFloat_FromDouble(0.5); if (unlikely(!__pyx_float_0_5)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_3 = PyInt_FromLong(3); if (unlikely(!__pyx_int_3)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_4 = PyInt_FromLong(4); if (unlikely(!__pyx_int_4)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_6 = PyInt_FromLong(6); if (unlikely(!__pyx_int_6)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_12 = PyInt_FromLong(12); if (unlikely(!__pyx_int_12)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_neg_1 = PyInt_FromLong(-1); if (unlikely(!__pyx_int_neg_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  if (__Pyx_ExportFunction("calculate_atom_symmetry_number", (void (*)(void))__pyx_f_5rmgpy_8molecule_8symmetry_calculate_atom_symmetry_number, "float (struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ExportFunction("calculate_bond_symmetry_number", (void (*)(void))__pyx_f_5rmgpy_8molecule_8symmetry_calculate_bond_symmetry_number, "float (struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ExportFunction("calculate_axis_symmetry_number", (void (*)(void))__pyx_f_5rmgpy_8molecule_8symmetry_calculate_axis_symmetry_number, "float (struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ExportFunction("calculate_cyclic_symmetry_number", (void (*)(void))__pyx_f_5rmgpy_8molecule_8symmetry_calculate_cyclic_symmetry_number, "float (struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ExportFunction("_indistinguishable", (void (*)(void))__pyx_f_5rmgpy_8molecule_8symmetry__indistinguishable, "int (struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom *, int __pyx_skip_dispatch)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ExportFunction("calculate_symmetry_number", (void (*)(void))__pyx_f_5rmgpy_8molecule_8symmetry_calculate_symmetry_number, "float (struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule *, int __pyx_skip_dispatch)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_7cpython_4type_type = __Pyx_ImportType_0_29_37(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type", 
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyTypeObject),
+  #else
+  sizeof(PyHeapTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyHeapTypeObject),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_7cpython_4type_type) __PYX_ERR(2, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 8, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_7cpython_4bool_bool = __Pyx_ImportType_0_29_37(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "bool", sizeof(PyBoolObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyBoolObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_7cpython_4bool_bool) __PYX_ERR(3, 8, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(4, 15, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_7cpython_7complex_complex = __Pyx_ImportType_0_29_37(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "complex", sizeof(PyComplexObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyComplexObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_7cpython_7complex_complex) __PYX_ERR(4, 15, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("numpy"); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 199, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_5numpy_dtype = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "dtype", sizeof(PyArray_Descr), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyArray_Descr),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_dtype) __PYX_ERR(1, 199, __pyx_L1_error)
+  __pyx_ptype_5numpy_flatiter = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "flatiter", sizeof(PyArrayIterObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyArrayIterObject),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_flatiter) __PYX_ERR(1, 222, __pyx_L1_error)
+  __pyx_ptype_5numpy_broadcast = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "broadcast", sizeof(PyArrayMultiIterObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyArrayMultiIterObject),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_broadcast) __PYX_ERR(1, 226, __pyx_L1_error)
+  __pyx_ptype_5numpy_ndarray = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "ndarray", sizeof(PyArrayObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyArrayObject),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_ndarray) __PYX_ERR(1, 238, __pyx_L1_error)
+  __pyx_ptype_5numpy_generic = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "generic", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_generic) __PYX_ERR(1, 767, __pyx_L1_error)
+  __pyx_ptype_5numpy_number = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "number", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_number) __PYX_ERR(1, 769, __pyx_L1_error)
+  __pyx_ptype_5numpy_integer = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "integer", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_integer) __PYX_ERR(1, 771, __pyx_L1_error)
+  __pyx_ptype_5numpy_signedinteger = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "signedinteger", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_signedinteger) __PYX_ERR(1, 773, __pyx_L1_error)
+  __pyx_ptype_5numpy_unsignedinteger = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "unsignedinteger", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_unsignedinteger) __PYX_ERR(1, 775, __pyx_L1_error)
+  __pyx_ptype_5numpy_inexact = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "inexact", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_inexact) __PYX_ERR(1, 777, __pyx_L1_error)
+  __pyx_ptype_5numpy_floating = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "floating", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_floating) __PYX_ERR(1, 779, __pyx_L1_error)
+  __pyx_ptype_5numpy_complexfloating = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "complexfloating", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_complexfloating) __PYX_ERR(1, 781, __pyx_L1_error)
+  __pyx_ptype_5numpy_flexible = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "flexible", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_flexible) __PYX_ERR(1, 783, __pyx_L1_error)
+  __pyx_ptype_5numpy_character = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "character", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_character) __PYX_ERR(1, 785, __pyx_L1_error)
+  __pyx_ptype_5numpy_ufunc = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "ufunc", sizeof(PyUFuncObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyUFuncObject),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_ufunc) __PYX_ERR(1, 824, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("rmgpy.molecule.graph"); if (unlikely(!__pyx_t_1)) __PYX_ERR(5, 28, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_5rmgpy_8molecule_5graph_Vertex = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.molecule.graph", "Vertex", sizeof(struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8molecule_5graph_Vertex),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8molecule_5graph_Vertex) __PYX_ERR(5, 28, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8molecule_5graph_Vertex = (struct __pyx_vtabstruct_5rmgpy_8molecule_5graph_Vertex*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_8molecule_5graph_Vertex->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_8molecule_5graph_Vertex)) __PYX_ERR(5, 28, __pyx_L1_error)
+  __pyx_ptype_5rmgpy_8molecule_5graph_Edge = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.molecule.graph", "Edge", sizeof(struct __pyx_obj_5rmgpy_8molecule_5graph_Edge), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8molecule_5graph_Edge),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8molecule_5graph_Edge) __PYX_ERR(5, 55, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8molecule_5graph_Edge = (struct __pyx_vtabstruct_5rmgpy_8molecule_5graph_Edge*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_8molecule_5graph_Edge->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_8molecule_5graph_Edge)) __PYX_ERR(5, 55, __pyx_L1_error)
+  __pyx_ptype_5rmgpy_8molecule_5graph_Graph = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.molecule.graph", "Graph", sizeof(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8molecule_5graph_Graph),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8molecule_5graph_Graph) __PYX_ERR(5, 73, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8molecule_5graph_Graph = (struct __pyx_vtabstruct_5rmgpy_8molecule_5graph_Graph*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_8molecule_5graph_Graph->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_8molecule_5graph_Graph)) __PYX_ERR(5, 73, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("rmgpy.molecule.atomtype"); if (unlikely(!__pyx_t_1)) __PYX_ERR(6, 28, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_5rmgpy_8molecule_8atomtype_AtomType = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.molecule.atomtype", "AtomType", sizeof(struct __pyx_obj_5rmgpy_8molecule_8atomtype_AtomType), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8molecule_8atomtype_AtomType),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8molecule_8atomtype_AtomType) __PYX_ERR(6, 28, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8molecule_8atomtype_AtomType = (struct __pyx_vtabstruct_5rmgpy_8molecule_8atomtype_AtomType*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_8molecule_8atomtype_AtomType->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_8molecule_8atomtype_AtomType)) __PYX_ERR(6, 28, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("rmgpy.molecule.group"); if (unlikely(!__pyx_t_1)) __PYX_ERR(7, 34, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_5rmgpy_8molecule_5group_GroupAtom = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.molecule.group", "GroupAtom", sizeof(struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8molecule_5group_GroupAtom),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8molecule_5group_GroupAtom) __PYX_ERR(7, 34, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8molecule_5group_GroupAtom = (struct __pyx_vtabstruct_5rmgpy_8molecule_5group_GroupAtom*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_8molecule_5group_GroupAtom->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_8molecule_5group_GroupAtom)) __PYX_ERR(7, 34, __pyx_L1_error)
+  __pyx_ptype_5rmgpy_8molecule_5group_GroupBond = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.molecule.group", "GroupBond", sizeof(struct __pyx_obj_5rmgpy_8molecule_5group_GroupBond), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8molecule_5group_GroupBond),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8molecule_5group_GroupBond) __PYX_ERR(7, 88, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8molecule_5group_GroupBond = (struct __pyx_vtabstruct_5rmgpy_8molecule_5group_GroupBond*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_8molecule_5group_GroupBond->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_8molecule_5group_GroupBond)) __PYX_ERR(7, 88, __pyx_L1_error)
+  __pyx_ptype_5rmgpy_8molecule_5group_Group = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.molecule.group", "Group", sizeof(struct __pyx_obj_5rmgpy_8molecule_5group_Group), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8molecule_5group_Group),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8molecule_5group_Group) __PYX_ERR(7, 123, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8molecule_5group_Group = (struct __pyx_vtabstruct_5rmgpy_8molecule_5group_Group*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_8molecule_5group_Group->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_8molecule_5group_Group)) __PYX_ERR(7, 123, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("rmgpy.molecule.element"); if (unlikely(!__pyx_t_1)) __PYX_ERR(8, 28, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_5rmgpy_8molecule_7element_Element = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.molecule.element", "Element", sizeof(struct __pyx_obj_5rmgpy_8molecule_7element_Element), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8molecule_7element_Element),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8molecule_7element_Element) __PYX_ERR(8, 28, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("rmgpy.molecule.molecule"); if (unlikely(!__pyx_t_1)) __PYX_ERR(9, 39, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_5rmgpy_8molecule_8molecule_Atom = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.molecule.molecule", "Atom", sizeof(struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8molecule_8molecule_Atom),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8molecule_8molecule_Atom) __PYX_ERR(9, 39, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8molecule_8molecule_Atom = (struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Atom*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_8molecule_8molecule_Atom->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_8molecule_8molecule_Atom)) __PYX_ERR(9, 39, __pyx_L1_error)
+  __pyx_ptype_5rmgpy_8molecule_8molecule_Bond = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.molecule.molecule", "Bond", sizeof(struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8molecule_8molecule_Bond),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8molecule_8molecule_Bond) __PYX_ERR(9, 95, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8molecule_8molecule_Bond = (struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Bond*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_8molecule_8molecule_Bond->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_8molecule_8molecule_Bond)) __PYX_ERR(9, 95, __pyx_L1_error)
+  __pyx_ptype_5rmgpy_8molecule_8molecule_Molecule = __Pyx_ImportType_0_29_37(__pyx_t_1, "rmgpy.molecule.molecule", "Molecule", sizeof(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5rmgpy_8molecule_8molecule_Molecule),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5rmgpy_8molecule_8molecule_Molecule) __PYX_ERR(9, 135, __pyx_L1_error)
+  __pyx_vtabptr_5rmgpy_8molecule_8molecule_Molecule = (struct __pyx_vtabstruct_5rmgpy_8molecule_8molecule_Molecule*)__Pyx_GetVtable(__pyx_ptype_5rmgpy_8molecule_8molecule_Molecule->tp_dict); if (unlikely(!__pyx_vtabptr_5rmgpy_8molecule_8molecule_Molecule)) __PYX_ERR(9, 135, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __pyx_t_1 = PyImport_ImportModule("rmgpy.constants"); if (!__pyx_t_1) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "pi", (void **)&__pyx_vp_5rmgpy_9constants_pi, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "Na", (void **)&__pyx_vp_5rmgpy_9constants_Na, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "kB", (void **)&__pyx_vp_5rmgpy_9constants_kB, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "R", (void **)&__pyx_vp_5rmgpy_9constants_R, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "h", (void **)&__pyx_vp_5rmgpy_9constants_h, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "hbar", (void **)&__pyx_vp_5rmgpy_9constants_hbar, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "c", (void **)&__pyx_vp_5rmgpy_9constants_c, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "e", (void **)&__pyx_vp_5rmgpy_9constants_e, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "m_e", (void **)&__pyx_vp_5rmgpy_9constants_m_e, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "m_p", (void **)&__pyx_vp_5rmgpy_9constants_m_p, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "m_n", (void **)&__pyx_vp_5rmgpy_9constants_m_n, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "amu", (void **)&__pyx_vp_5rmgpy_9constants_amu, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "a0", (void **)&__pyx_vp_5rmgpy_9constants_a0, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "E_h", (void **)&__pyx_vp_5rmgpy_9constants_E_h, "double") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("rmgpy.molecule.molecule"); if (!__pyx_t_1) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "bond_orders", (void **)&__pyx_vp_5rmgpy_8molecule_8molecule_bond_orders, "PyObject *") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "atom_id_counter", (void **)&__pyx_vp_5rmgpy_8molecule_8molecule_atom_id_counter, "PyObject *") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC initsymmetry(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC initsymmetry(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit_symmetry(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit_symmetry(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec_symmetry(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module 'symmetry' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit_symmetry(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("symmetry", __pyx_methods, __pyx_k_This_module_provides_functional, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_b);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_rmgpy__molecule__symmetry) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "rmgpy.molecule.symmetry")) {
+      if (unlikely(PyDict_SetItemString(modules, "rmgpy.molecule.symmetry", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  if (unlikely(__Pyx_modinit_function_export_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_type_init_code();
+  if (unlikely(__Pyx_modinit_type_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely(__Pyx_modinit_variable_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_function_import_code();
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+
+  /* "rmgpy/molecule/symmetry.py":35
+ * molecule from its chemical graph representation.
+ * """
+ * import itertools             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_itertools, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 35, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_itertools, __pyx_t_1) < 0) __PYX_ERR(0, 35, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":38
+ * 
+ * 
+ * def calculate_atom_symmetry_number(molecule, atom):             # <<<<<<<<<<<<<<
+ *     """
+ *     Return the symmetry number centered at `atom` in the structure. The
+ */
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_5rmgpy_8molecule_8symmetry_1calculate_atom_symmetry_number, 0, __pyx_n_s_calculate_atom_symmetry_number, NULL, __pyx_n_s_rmgpy_molecule_symmetry, __pyx_d, ((PyObject *)__pyx_codeobj__4)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_calculate_atom_symmetry_number, __pyx_t_1) < 0) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":152
+ * ################################################################################
+ * 
+ * def calculate_bond_symmetry_number(molecule, atom1, atom2):             # <<<<<<<<<<<<<<
+ *     """
+ *     Return the symmetry number centered at `bond` in the structure.
+ */
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_5rmgpy_8molecule_8symmetry_3calculate_bond_symmetry_number, 0, __pyx_n_s_calculate_bond_symmetry_number, NULL, __pyx_n_s_rmgpy_molecule_symmetry, __pyx_d, ((PyObject *)__pyx_codeobj__6)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 152, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_calculate_bond_symmetry_number, __pyx_t_1) < 0) __PYX_ERR(0, 152, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":224
+ * ################################################################################
+ * 
+ * def calculate_axis_symmetry_number(molecule):             # <<<<<<<<<<<<<<
+ *     r"""
+ *     Get the axis symmetry number correction. The "axis" refers to a series
+ */
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_5rmgpy_8molecule_8symmetry_5calculate_axis_symmetry_number, 0, __pyx_n_s_calculate_axis_symmetry_number, NULL, __pyx_n_s_rmgpy_molecule_symmetry, __pyx_d, ((PyObject *)__pyx_codeobj__8)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 224, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_calculate_axis_symmetry_number, __pyx_t_1) < 0) __PYX_ERR(0, 224, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":395
+ * ################################################################################
+ * 
+ * def calculate_cyclic_symmetry_number(molecule):             # <<<<<<<<<<<<<<
+ *     """
+ *     Get the symmetry number correction for cyclic regions of a molecule.
+ */
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_5rmgpy_8molecule_8symmetry_7calculate_cyclic_symmetry_number, 0, __pyx_n_s_calculate_cyclic_symmetry_number, NULL, __pyx_n_s_rmgpy_molecule_symmetry, __pyx_d, ((PyObject *)__pyx_codeobj__10)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 395, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_calculate_cyclic_symmetry_number, __pyx_t_1) < 0) __PYX_ERR(0, 395, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":515
+ * 
+ * 
+ * def _indistinguishable(atom1, atom2):             # <<<<<<<<<<<<<<
+ *     """
+ *     Determine if two atoms are feasibly indistinguishable based on connections
+ */
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_5rmgpy_8molecule_8symmetry_9_indistinguishable, 0, __pyx_n_s_indistinguishable, NULL, __pyx_n_s_rmgpy_molecule_symmetry, __pyx_d, ((PyObject *)__pyx_codeobj__12)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 515, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_indistinguishable, __pyx_t_1) < 0) __PYX_ERR(0, 515, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":547
+ * 
+ * 
+ * def calculate_symmetry_number(molecule):             # <<<<<<<<<<<<<<
+ *     """
+ *     Return the symmetry number for the structure. The symmetry number
+ */
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_5rmgpy_8molecule_8symmetry_11calculate_symmetry_number, 0, __pyx_n_s_calculate_symmetry_number, NULL, __pyx_n_s_rmgpy_molecule_symmetry, __pyx_d, ((PyObject *)__pyx_codeobj__14)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 547, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_calculate_symmetry_number, __pyx_t_1) < 0) __PYX_ERR(0, 547, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "rmgpy/molecule/symmetry.py":1
+ * #!/usr/bin/env python             # <<<<<<<<<<<<<<
+ * # -*- coding: utf-8 -*-
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1011
+ * 
+ * 
+ * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the unit part of the dtype for a numpy datetime64 object.
+ */
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  if (__pyx_m) {
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init rmgpy.molecule.symmetry", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    Py_CLEAR(__pyx_m);
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init rmgpy.molecule.symmetry");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* IterFinish */
+static CYTHON_INLINE int __Pyx_IterFinish(void) {
+#if CYTHON_FAST_THREAD_STATE
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject* exc_type = tstate->curexc_type;
+    if (unlikely(exc_type)) {
+        if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) {
+            PyObject *exc_value, *exc_tb;
+            exc_value = tstate->curexc_value;
+            exc_tb = tstate->curexc_traceback;
+            tstate->curexc_type = 0;
+            tstate->curexc_value = 0;
+            tstate->curexc_traceback = 0;
+            Py_DECREF(exc_type);
+            Py_XDECREF(exc_value);
+            Py_XDECREF(exc_tb);
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#else
+    if (unlikely(PyErr_Occurred())) {
+        if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) {
+            PyErr_Clear();
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#endif
+}
+
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallNoArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* PyObjectGetMethod */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method) {
+    PyObject *attr;
+#if CYTHON_UNPACK_METHODS && CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_PYTYPE_LOOKUP
+    PyTypeObject *tp = Py_TYPE(obj);
+    PyObject *descr;
+    descrgetfunc f = NULL;
+    PyObject **dictptr, *dict;
+    int meth_found = 0;
+    assert (*method == NULL);
+    if (unlikely(tp->tp_getattro != PyObject_GenericGetAttr)) {
+        attr = __Pyx_PyObject_GetAttrStr(obj, name);
+        goto try_unpack;
+    }
+    if (unlikely(tp->tp_dict == NULL) && unlikely(PyType_Ready(tp) < 0)) {
+        return 0;
+    }
+    descr = _PyType_Lookup(tp, name);
+    if (likely(descr != NULL)) {
+        Py_INCREF(descr);
+#if PY_MAJOR_VERSION >= 3
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type)))
+        #endif
+#else
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr)))
+        #endif
+#endif
+        {
+            meth_found = 1;
+        } else {
+            f = Py_TYPE(descr)->tp_descr_get;
+            if (f != NULL && PyDescr_IsData(descr)) {
+                attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+                Py_DECREF(descr);
+                goto try_unpack;
+            }
+        }
+    }
+    dictptr = _PyObject_GetDictPtr(obj);
+    if (dictptr != NULL && (dict = *dictptr) != NULL) {
+        Py_INCREF(dict);
+        attr = __Pyx_PyDict_GetItemStr(dict, name);
+        if (attr != NULL) {
+            Py_INCREF(attr);
+            Py_DECREF(dict);
+            Py_XDECREF(descr);
+            goto try_unpack;
+        }
+        Py_DECREF(dict);
+    }
+    if (meth_found) {
+        *method = descr;
+        return 1;
+    }
+    if (f != NULL) {
+        attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+        Py_DECREF(descr);
+        goto try_unpack;
+    }
+    if (descr != NULL) {
+        *method = descr;
+        return 0;
+    }
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(name));
+#endif
+    return 0;
+#else
+    attr = __Pyx_PyObject_GetAttrStr(obj, name);
+    goto try_unpack;
+#endif
+try_unpack:
+#if CYTHON_UNPACK_METHODS
+    if (likely(attr) && PyMethod_Check(attr) && likely(PyMethod_GET_SELF(attr) == obj)) {
+        PyObject *function = PyMethod_GET_FUNCTION(attr);
+        Py_INCREF(function);
+        Py_DECREF(attr);
+        *method = function;
+        return 1;
+    }
+#endif
+    *method = attr;
+    return 0;
+}
+
+/* PyObjectCallMethod0 */
+static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name) {
+    PyObject *method = NULL, *result = NULL;
+    int is_method = __Pyx_PyObject_GetMethod(obj, method_name, &method);
+    if (likely(is_method)) {
+        result = __Pyx_PyObject_CallOneArg(method, obj);
+        Py_DECREF(method);
+        return result;
+    }
+    if (unlikely(!method)) goto bad;
+    result = __Pyx_PyObject_CallNoArg(method);
+    Py_DECREF(method);
+bad:
+    return result;
+}
+
+/* RaiseNeedMoreValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+    PyErr_Format(PyExc_ValueError,
+                 "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
+                 index, (index == 1) ? "" : "s");
+}
+
+/* RaiseTooManyValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
+    PyErr_Format(PyExc_ValueError,
+                 "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
+}
+
+/* UnpackItemEndCheck */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
+    if (unlikely(retval)) {
+        Py_DECREF(retval);
+        __Pyx_RaiseTooManyValuesError(expected);
+        return -1;
+    }
+    return __Pyx_IterFinish();
+}
+
+/* RaiseNoneIterError */
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+}
+
+/* UnpackTupleError */
+static void __Pyx_UnpackTupleError(PyObject *t, Py_ssize_t index) {
+    if (t == Py_None) {
+      __Pyx_RaiseNoneNotIterableError();
+    } else if (PyTuple_GET_SIZE(t) < index) {
+      __Pyx_RaiseNeedMoreValuesError(PyTuple_GET_SIZE(t));
+    } else {
+      __Pyx_RaiseTooManyValuesError(index);
+    }
+}
+
+/* UnpackTuple2 */
+static CYTHON_INLINE int __Pyx_unpack_tuple2_exact(
+        PyObject* tuple, PyObject** pvalue1, PyObject** pvalue2, int decref_tuple) {
+    PyObject *value1 = NULL, *value2 = NULL;
+#if CYTHON_COMPILING_IN_PYPY
+    value1 = PySequence_ITEM(tuple, 0);  if (unlikely(!value1)) goto bad;
+    value2 = PySequence_ITEM(tuple, 1);  if (unlikely(!value2)) goto bad;
+#else
+    value1 = PyTuple_GET_ITEM(tuple, 0);  Py_INCREF(value1);
+    value2 = PyTuple_GET_ITEM(tuple, 1);  Py_INCREF(value2);
+#endif
+    if (decref_tuple) {
+        Py_DECREF(tuple);
+    }
+    *pvalue1 = value1;
+    *pvalue2 = value2;
+    return 0;
+#if CYTHON_COMPILING_IN_PYPY
+bad:
+    Py_XDECREF(value1);
+    Py_XDECREF(value2);
+    if (decref_tuple) { Py_XDECREF(tuple); }
+    return -1;
+#endif
+}
+static int __Pyx_unpack_tuple2_generic(PyObject* tuple, PyObject** pvalue1, PyObject** pvalue2,
+                                       int has_known_size, int decref_tuple) {
+    Py_ssize_t index;
+    PyObject *value1 = NULL, *value2 = NULL, *iter = NULL;
+    iternextfunc iternext;
+    iter = PyObject_GetIter(tuple);
+    if (unlikely(!iter)) goto bad;
+    if (decref_tuple) { Py_DECREF(tuple); tuple = NULL; }
+    iternext = Py_TYPE(iter)->tp_iternext;
+    value1 = iternext(iter); if (unlikely(!value1)) { index = 0; goto unpacking_failed; }
+    value2 = iternext(iter); if (unlikely(!value2)) { index = 1; goto unpacking_failed; }
+    if (!has_known_size && unlikely(__Pyx_IternextUnpackEndCheck(iternext(iter), 2))) goto bad;
+    Py_DECREF(iter);
+    *pvalue1 = value1;
+    *pvalue2 = value2;
+    return 0;
+unpacking_failed:
+    if (!has_known_size && __Pyx_IterFinish() == 0)
+        __Pyx_RaiseNeedMoreValuesError(index);
+bad:
+    Py_XDECREF(iter);
+    Py_XDECREF(value1);
+    Py_XDECREF(value2);
+    if (decref_tuple) { Py_XDECREF(tuple); }
+    return -1;
+}
+
+/* dict_iter */
+static CYTHON_INLINE PyObject* __Pyx_dict_iterator(PyObject* iterable, int is_dict, PyObject* method_name,
+                                                   Py_ssize_t* p_orig_length, int* p_source_is_dict) {
+    is_dict = is_dict || likely(PyDict_CheckExact(iterable));
+    *p_source_is_dict = is_dict;
+    if (is_dict) {
+#if !CYTHON_COMPILING_IN_PYPY
+        *p_orig_length = PyDict_Size(iterable);
+        Py_INCREF(iterable);
+        return iterable;
+#elif PY_MAJOR_VERSION >= 3
+        static PyObject *py_items = NULL, *py_keys = NULL, *py_values = NULL;
+        PyObject **pp = NULL;
+        if (method_name) {
+            const char *name = PyUnicode_AsUTF8(method_name);
+            if (strcmp(name, "iteritems") == 0) pp = &py_items;
+            else if (strcmp(name, "iterkeys") == 0) pp = &py_keys;
+            else if (strcmp(name, "itervalues") == 0) pp = &py_values;
+            if (pp) {
+                if (!*pp) {
+                    *pp = PyUnicode_FromString(name + 4);
+                    if (!*pp)
+                        return NULL;
+                }
+                method_name = *pp;
+            }
+        }
+#endif
+    }
+    *p_orig_length = 0;
+    if (method_name) {
+        PyObject* iter;
+        iterable = __Pyx_PyObject_CallMethod0(iterable, method_name);
+        if (!iterable)
+            return NULL;
+#if !CYTHON_COMPILING_IN_PYPY
+        if (PyTuple_CheckExact(iterable) || PyList_CheckExact(iterable))
+            return iterable;
+#endif
+        iter = PyObject_GetIter(iterable);
+        Py_DECREF(iterable);
+        return iter;
+    }
+    return PyObject_GetIter(iterable);
+}
+static CYTHON_INLINE int __Pyx_dict_iter_next(
+        PyObject* iter_obj, CYTHON_NCP_UNUSED Py_ssize_t orig_length, CYTHON_NCP_UNUSED Py_ssize_t* ppos,
+        PyObject** pkey, PyObject** pvalue, PyObject** pitem, int source_is_dict) {
+    PyObject* next_item;
+#if !CYTHON_COMPILING_IN_PYPY
+    if (source_is_dict) {
+        PyObject *key, *value;
+        if (unlikely(orig_length != PyDict_Size(iter_obj))) {
+            PyErr_SetString(PyExc_RuntimeError, "dictionary changed size during iteration");
+            return -1;
+        }
+        if (unlikely(!PyDict_Next(iter_obj, ppos, &key, &value))) {
+            return 0;
+        }
+        if (pitem) {
+            PyObject* tuple = PyTuple_New(2);
+            if (unlikely(!tuple)) {
+                return -1;
+            }
+            Py_INCREF(key);
+            Py_INCREF(value);
+            PyTuple_SET_ITEM(tuple, 0, key);
+            PyTuple_SET_ITEM(tuple, 1, value);
+            *pitem = tuple;
+        } else {
+            if (pkey) {
+                Py_INCREF(key);
+                *pkey = key;
+            }
+            if (pvalue) {
+                Py_INCREF(value);
+                *pvalue = value;
+            }
+        }
+        return 1;
+    } else if (PyTuple_CheckExact(iter_obj)) {
+        Py_ssize_t pos = *ppos;
+        if (unlikely(pos >= PyTuple_GET_SIZE(iter_obj))) return 0;
+        *ppos = pos + 1;
+        next_item = PyTuple_GET_ITEM(iter_obj, pos);
+        Py_INCREF(next_item);
+    } else if (PyList_CheckExact(iter_obj)) {
+        Py_ssize_t pos = *ppos;
+        if (unlikely(pos >= PyList_GET_SIZE(iter_obj))) return 0;
+        *ppos = pos + 1;
+        next_item = PyList_GET_ITEM(iter_obj, pos);
+        Py_INCREF(next_item);
+    } else
+#endif
+    {
+        next_item = PyIter_Next(iter_obj);
+        if (unlikely(!next_item)) {
+            return __Pyx_IterFinish();
+        }
+    }
+    if (pitem) {
+        *pitem = next_item;
+    } else if (pkey && pvalue) {
+        if (__Pyx_unpack_tuple2(next_item, pkey, pvalue, source_is_dict, source_is_dict, 1))
+            return -1;
+    } else if (pkey) {
+        *pkey = next_item;
+    } else {
+        *pvalue = next_item;
+    }
+    return 1;
+}
+
+/* PyIntBinop */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, int inplace, int zerodivision_check) {
+    (void)inplace;
+    (void)zerodivision_check;
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        const long b = intval;
+        long x;
+        long a = PyInt_AS_LONG(op1);
+            x = (long)((unsigned long)a + b);
+            if (likely((x^a) >= 0 || (x^b) >= 0))
+                return PyInt_FromLong(x);
+            return PyLong_Type.tp_as_number->nb_add(op1, op2);
+    }
+    #endif
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        const long b = intval;
+        long a, x;
+#ifdef HAVE_LONG_LONG
+        const PY_LONG_LONG llb = intval;
+        PY_LONG_LONG lla, llx;
+#endif
+        const digit* digits = ((PyLongObject*)op1)->ob_digit;
+        const Py_ssize_t size = Py_SIZE(op1);
+        if (likely(__Pyx_sst_abs(size) <= 1)) {
+            a = likely(size) ? digits[0] : 0;
+            if (size == -1) a = -a;
+        } else {
+            switch (size) {
+                case -2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                default: return PyLong_Type.tp_as_number->nb_add(op1, op2);
+            }
+        }
+                x = a + b;
+            return PyLong_FromLong(x);
+#ifdef HAVE_LONG_LONG
+        long_long:
+                llx = lla + llb;
+            return PyLong_FromLongLong(llx);
+#endif
+        
+        
+    }
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        const long b = intval;
+        double a = PyFloat_AS_DOUBLE(op1);
+            double result;
+            PyFPE_START_PROTECT("add", return NULL)
+            result = ((double)a) + (double)b;
+            PyFPE_END_PROTECT(result)
+            return PyFloat_FromDouble(result);
+    }
+    return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
+}
+#endif
+
+/* ExtTypeTest */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    if (likely(__Pyx_TypeCheck(obj, type)))
+        return 1;
+    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
+                 Py_TYPE(obj)->tp_name, type->tp_name);
+    return 0;
+}
+
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
+
+/* GetItemInt */
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return m->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+}
+
+/* ObjectGetItem */
+#if CYTHON_USE_TYPE_SLOTS
+static PyObject *__Pyx_PyObject_GetIndex(PyObject *obj, PyObject* index) {
+    PyObject *runerr = NULL;
+    Py_ssize_t key_value;
+    PySequenceMethods *m = Py_TYPE(obj)->tp_as_sequence;
+    if (unlikely(!(m && m->sq_item))) {
+        PyErr_Format(PyExc_TypeError, "'%.200s' object is not subscriptable", Py_TYPE(obj)->tp_name);
+        return NULL;
+    }
+    key_value = __Pyx_PyIndex_AsSsize_t(index);
+    if (likely(key_value != -1 || !(runerr = PyErr_Occurred()))) {
+        return __Pyx_GetItemInt_Fast(obj, key_value, 0, 1, 1);
+    }
+    if (PyErr_GivenExceptionMatches(runerr, PyExc_OverflowError)) {
+        PyErr_Clear();
+        PyErr_Format(PyExc_IndexError, "cannot fit '%.200s' into an index-sized integer", Py_TYPE(index)->tp_name);
+    }
+    return NULL;
+}
+static PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject* key) {
+    PyMappingMethods *m = Py_TYPE(obj)->tp_as_mapping;
+    if (likely(m && m->mp_subscript)) {
+        return m->mp_subscript(obj, key);
+    }
+    return __Pyx_PyObject_GetIndex(obj, key);
+}
+#endif
+
+/* DictGetItem */
+#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
+static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
+    PyObject *value;
+    value = PyDict_GetItemWithError(d, key);
+    if (unlikely(!value)) {
+        if (!PyErr_Occurred()) {
+            if (unlikely(PyTuple_Check(key))) {
+                PyObject* args = PyTuple_Pack(1, key);
+                if (likely(args)) {
+                    PyErr_SetObject(PyExc_KeyError, args);
+                    Py_DECREF(args);
+                }
+            } else {
+                PyErr_SetObject(PyExc_KeyError, key);
+            }
+        }
+        return NULL;
+    }
+    Py_INCREF(value);
+    return value;
+}
+#endif
+
+/* PyIntBinop */
+#if !CYTHON_COMPILING_IN_PYPY
+#if PY_MAJOR_VERSION < 3 || CYTHON_USE_PYLONG_INTERNALS
+#define __Pyx_PyInt_FloorDivideObjC_ZeroDivisionError(operand)\
+    if (unlikely(zerodivision_check && ((operand) == 0))) {\
+        PyErr_SetString(PyExc_ZeroDivisionError, "integer division by zero");\
+        return NULL;\
+    }
+#endif
+static PyObject* __Pyx_PyInt_FloorDivideObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, int inplace, int zerodivision_check) {
+    (void)inplace;
+    (void)zerodivision_check;
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        const long b = intval;
+        long x;
+        long a = PyInt_AS_LONG(op1);
+            __Pyx_PyInt_FloorDivideObjC_ZeroDivisionError(b)
+            if (unlikely(b == -1 && ((unsigned long)a) == 0-(unsigned long)a))
+                return PyInt_Type.tp_as_number->nb_floor_divide(op1, op2);
+            else {
+                long q, r;
+                q = a / b;
+                r = a - q*b;
+                q -= ((r != 0) & ((r ^ b) < 0));
+                x = q;
+            }
+            return PyInt_FromLong(x);
+    }
+    #endif
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        const long b = intval;
+        long a, x;
+#ifdef HAVE_LONG_LONG
+        const PY_LONG_LONG llb = intval;
+        PY_LONG_LONG lla, llx;
+#endif
+        const digit* digits = ((PyLongObject*)op1)->ob_digit;
+        const Py_ssize_t size = Py_SIZE(op1);
+        if (likely(__Pyx_sst_abs(size) <= 1)) {
+            a = likely(size) ? digits[0] : 0;
+            if (size == -1) a = -a;
+        } else {
+            switch (size) {
+                case -2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                default: return PyLong_Type.tp_as_number->nb_floor_divide(op1, op2);
+            }
+        }
+                __Pyx_PyInt_FloorDivideObjC_ZeroDivisionError(b)
+                {
+                    long q, r;
+                    q = a / b;
+                    r = a - q*b;
+                    q -= ((r != 0) & ((r ^ b) < 0));
+                    x = q;
+                }
+            return PyLong_FromLong(x);
+#ifdef HAVE_LONG_LONG
+        long_long:
+                {
+                    PY_LONG_LONG q, r;
+                    q = lla / llb;
+                    r = lla - q*llb;
+                    q -= ((r != 0) & ((r ^ llb) < 0));
+                    llx = q;
+                }
+            return PyLong_FromLongLong(llx);
+#endif
+        
+        
+    }
+    #endif
+    return (inplace ? PyNumber_InPlaceFloorDivide : PyNumber_FloorDivide)(op1, op2);
+}
+#endif
+
+/* UnpackUnboundCMethod */
+static int __Pyx_TryUnpackUnboundCMethod(__Pyx_CachedCFunction* target) {
+    PyObject *method;
+    method = __Pyx_PyObject_GetAttrStr(target->type, *target->method_name);
+    if (unlikely(!method))
+        return -1;
+    target->method = method;
+#if CYTHON_COMPILING_IN_CPYTHON
+    #if PY_MAJOR_VERSION >= 3
+    if (likely(__Pyx_TypeCheck(method, &PyMethodDescr_Type)))
+    #endif
+    {
+        PyMethodDescrObject *descr = (PyMethodDescrObject*) method;
+        target->func = descr->d_method->ml_meth;
+        target->flag = descr->d_method->ml_flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_STACKLESS);
+    }
+#endif
+    return 0;
+}
+
+/* CallUnboundCMethod1 */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg) {
+    if (likely(cfunc->func)) {
+        int flag = cfunc->flag;
+        if (flag == METH_O) {
+            return (*(cfunc->func))(self, arg);
+        } else if (PY_VERSION_HEX >= 0x030600B1 && flag == METH_FASTCALL) {
+            #if PY_VERSION_HEX >= 0x030700A0
+                return (*(__Pyx_PyCFunctionFast)(void*)(PyCFunction)cfunc->func)(self, &arg, 1);
+            #else
+                return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, &arg, 1, NULL);
+            #endif
+        } else if (PY_VERSION_HEX >= 0x030700A0 && flag == (METH_FASTCALL | METH_KEYWORDS)) {
+            return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, &arg, 1, NULL);
+        }
+    }
+    return __Pyx__CallUnboundCMethod1(cfunc, self, arg);
+}
+#endif
+static PyObject* __Pyx__CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg){
+    PyObject *args, *result = NULL;
+    if (unlikely(!cfunc->func && !cfunc->method) && unlikely(__Pyx_TryUnpackUnboundCMethod(cfunc) < 0)) return NULL;
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (cfunc->func && (cfunc->flag & METH_VARARGS)) {
+        args = PyTuple_New(1);
+        if (unlikely(!args)) goto bad;
+        Py_INCREF(arg);
+        PyTuple_SET_ITEM(args, 0, arg);
+        if (cfunc->flag & METH_KEYWORDS)
+            result = (*(PyCFunctionWithKeywords)(void*)(PyCFunction)cfunc->func)(self, args, NULL);
+        else
+            result = (*cfunc->func)(self, args);
+    } else {
+        args = PyTuple_New(2);
+        if (unlikely(!args)) goto bad;
+        Py_INCREF(self);
+        PyTuple_SET_ITEM(args, 0, self);
+        Py_INCREF(arg);
+        PyTuple_SET_ITEM(args, 1, arg);
+        result = __Pyx_PyObject_Call(cfunc->method, args, NULL);
+    }
+#else
+    args = PyTuple_Pack(2, self, arg);
+    if (unlikely(!args)) goto bad;
+    result = __Pyx_PyObject_Call(cfunc->method, args, NULL);
+#endif
+bad:
+    Py_XDECREF(args);
+    return result;
+}
+
+/* PyIntCompare */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_EqObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, CYTHON_UNUSED long inplace) {
+    if (op1 == op2) {
+        Py_RETURN_TRUE;
+    }
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        const long b = intval;
+        long a = PyInt_AS_LONG(op1);
+        if (a == b) Py_RETURN_TRUE; else Py_RETURN_FALSE;
+    }
+    #endif
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        int unequal;
+        unsigned long uintval;
+        Py_ssize_t size = Py_SIZE(op1);
+        const digit* digits = ((PyLongObject*)op1)->ob_digit;
+        if (intval == 0) {
+            if (size == 0) Py_RETURN_TRUE; else Py_RETURN_FALSE;
+        } else if (intval < 0) {
+            if (size >= 0)
+                Py_RETURN_FALSE;
+            intval = -intval;
+            size = -size;
+        } else {
+            if (size <= 0)
+                Py_RETURN_FALSE;
+        }
+        uintval = (unsigned long) intval;
+#if PyLong_SHIFT * 4 < SIZEOF_LONG*8
+        if (uintval >> (PyLong_SHIFT * 4)) {
+            unequal = (size != 5) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
+                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[2] != ((uintval >> (2 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[3] != ((uintval >> (3 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[4] != ((uintval >> (4 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
+        } else
+#endif
+#if PyLong_SHIFT * 3 < SIZEOF_LONG*8
+        if (uintval >> (PyLong_SHIFT * 3)) {
+            unequal = (size != 4) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
+                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[2] != ((uintval >> (2 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[3] != ((uintval >> (3 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
+        } else
+#endif
+#if PyLong_SHIFT * 2 < SIZEOF_LONG*8
+        if (uintval >> (PyLong_SHIFT * 2)) {
+            unequal = (size != 3) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
+                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[2] != ((uintval >> (2 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
+        } else
+#endif
+#if PyLong_SHIFT * 1 < SIZEOF_LONG*8
+        if (uintval >> (PyLong_SHIFT * 1)) {
+            unequal = (size != 2) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
+                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
+        } else
+#endif
+            unequal = (size != 1) || (((unsigned long) digits[0]) != (uintval & (unsigned long) PyLong_MASK));
+        if (unequal == 0) Py_RETURN_TRUE; else Py_RETURN_FALSE;
+    }
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        const long b = intval;
+        double a = PyFloat_AS_DOUBLE(op1);
+        if ((double)a == (double)b) Py_RETURN_TRUE; else Py_RETURN_FALSE;
+    }
+    return (
+        PyObject_RichCompare(op1, op2, Py_EQ));
+}
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+            continue;
+        }
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (**name == key) ? 0 :
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key);
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* ArgTypeTest */
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
+{
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    else if (exact) {
+        #if PY_MAJOR_VERSION == 2
+        if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
+        #endif
+    }
+    else {
+        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%.200s' has incorrect type (expected %.200s, got %.200s)",
+        name, type->tp_name, Py_TYPE(obj)->tp_name);
+    return 0;
+}
+
+/* BytesEquals */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+    if (s1 == s2) {
+        return (equals == Py_EQ);
+    } else if (PyBytes_CheckExact(s1) & PyBytes_CheckExact(s2)) {
+        const char *ps1, *ps2;
+        Py_ssize_t length = PyBytes_GET_SIZE(s1);
+        if (length != PyBytes_GET_SIZE(s2))
+            return (equals == Py_NE);
+        ps1 = PyBytes_AS_STRING(s1);
+        ps2 = PyBytes_AS_STRING(s2);
+        if (ps1[0] != ps2[0]) {
+            return (equals == Py_NE);
+        } else if (length == 1) {
+            return (equals == Py_EQ);
+        } else {
+            int result;
+#if CYTHON_USE_UNICODE_INTERNALS && (PY_VERSION_HEX < 0x030B0000)
+            Py_hash_t hash1, hash2;
+            hash1 = ((PyBytesObject*)s1)->ob_shash;
+            hash2 = ((PyBytesObject*)s2)->ob_shash;
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                return (equals == Py_NE);
+            }
+#endif
+            result = memcmp(ps1, ps2, (size_t)length);
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & PyBytes_CheckExact(s2)) {
+        return (equals == Py_NE);
+    } else if ((s2 == Py_None) & PyBytes_CheckExact(s1)) {
+        return (equals == Py_NE);
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+#endif
+}
+
+/* UnicodeEquals */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+#if PY_MAJOR_VERSION < 3
+    PyObject* owned_ref = NULL;
+#endif
+    int s1_is_unicode, s2_is_unicode;
+    if (s1 == s2) {
+        goto return_eq;
+    }
+    s1_is_unicode = PyUnicode_CheckExact(s1);
+    s2_is_unicode = PyUnicode_CheckExact(s2);
+#if PY_MAJOR_VERSION < 3
+    if ((s1_is_unicode & (!s2_is_unicode)) && PyString_CheckExact(s2)) {
+        owned_ref = PyUnicode_FromObject(s2);
+        if (unlikely(!owned_ref))
+            return -1;
+        s2 = owned_ref;
+        s2_is_unicode = 1;
+    } else if ((s2_is_unicode & (!s1_is_unicode)) && PyString_CheckExact(s1)) {
+        owned_ref = PyUnicode_FromObject(s1);
+        if (unlikely(!owned_ref))
+            return -1;
+        s1 = owned_ref;
+        s1_is_unicode = 1;
+    } else if (((!s2_is_unicode) & (!s1_is_unicode))) {
+        return __Pyx_PyBytes_Equals(s1, s2, equals);
+    }
+#endif
+    if (s1_is_unicode & s2_is_unicode) {
+        Py_ssize_t length;
+        int kind;
+        void *data1, *data2;
+        if (unlikely(__Pyx_PyUnicode_READY(s1) < 0) || unlikely(__Pyx_PyUnicode_READY(s2) < 0))
+            return -1;
+        length = __Pyx_PyUnicode_GET_LENGTH(s1);
+        if (length != __Pyx_PyUnicode_GET_LENGTH(s2)) {
+            goto return_ne;
+        }
+#if CYTHON_USE_UNICODE_INTERNALS
+        {
+            Py_hash_t hash1, hash2;
+        #if CYTHON_PEP393_ENABLED
+            hash1 = ((PyASCIIObject*)s1)->hash;
+            hash2 = ((PyASCIIObject*)s2)->hash;
+        #else
+            hash1 = ((PyUnicodeObject*)s1)->hash;
+            hash2 = ((PyUnicodeObject*)s2)->hash;
+        #endif
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                goto return_ne;
+            }
+        }
+#endif
+        kind = __Pyx_PyUnicode_KIND(s1);
+        if (kind != __Pyx_PyUnicode_KIND(s2)) {
+            goto return_ne;
+        }
+        data1 = __Pyx_PyUnicode_DATA(s1);
+        data2 = __Pyx_PyUnicode_DATA(s2);
+        if (__Pyx_PyUnicode_READ(kind, data1, 0) != __Pyx_PyUnicode_READ(kind, data2, 0)) {
+            goto return_ne;
+        } else if (length == 1) {
+            goto return_eq;
+        } else {
+            int result = memcmp(data1, data2, (size_t)(length * kind));
+            #if PY_MAJOR_VERSION < 3
+            Py_XDECREF(owned_ref);
+            #endif
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & s2_is_unicode) {
+        goto return_ne;
+    } else if ((s2 == Py_None) & s1_is_unicode) {
+        goto return_ne;
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        #if PY_MAJOR_VERSION < 3
+        Py_XDECREF(owned_ref);
+        #endif
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+return_eq:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_EQ);
+return_ne:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_NE);
+#endif
+}
+
+/* SliceTupleAndList */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE void __Pyx_crop_slice(Py_ssize_t* _start, Py_ssize_t* _stop, Py_ssize_t* _length) {
+    Py_ssize_t start = *_start, stop = *_stop, length = *_length;
+    if (start < 0) {
+        start += length;
+        if (start < 0)
+            start = 0;
+    }
+    if (stop < 0)
+        stop += length;
+    else if (stop > length)
+        stop = length;
+    *_length = stop - start;
+    *_start = start;
+    *_stop = stop;
+}
+static CYTHON_INLINE void __Pyx_copy_object_array(PyObject** CYTHON_RESTRICT src, PyObject** CYTHON_RESTRICT dest, Py_ssize_t length) {
+    PyObject *v;
+    Py_ssize_t i;
+    for (i = 0; i < length; i++) {
+        v = dest[i] = src[i];
+        Py_INCREF(v);
+    }
+}
+static CYTHON_INLINE PyObject* __Pyx_PyList_GetSlice(
+            PyObject* src, Py_ssize_t start, Py_ssize_t stop) {
+    PyObject* dest;
+    Py_ssize_t length = PyList_GET_SIZE(src);
+    __Pyx_crop_slice(&start, &stop, &length);
+    if (unlikely(length <= 0))
+        return PyList_New(0);
+    dest = PyList_New(length);
+    if (unlikely(!dest))
+        return NULL;
+    __Pyx_copy_object_array(
+        ((PyListObject*)src)->ob_item + start,
+        ((PyListObject*)dest)->ob_item,
+        length);
+    return dest;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyTuple_GetSlice(
+            PyObject* src, Py_ssize_t start, Py_ssize_t stop) {
+    PyObject* dest;
+    Py_ssize_t length = PyTuple_GET_SIZE(src);
+    __Pyx_crop_slice(&start, &stop, &length);
+    if (unlikely(length <= 0))
+        return PyTuple_New(0);
+    dest = PyTuple_New(length);
+    if (unlikely(!dest))
+        return NULL;
+    __Pyx_copy_object_array(
+        ((PyTupleObject*)src)->ob_item + start,
+        ((PyTupleObject*)dest)->ob_item,
+        length);
+    return dest;
+}
+#endif
+
+/* PyObjectCallMethod1 */
+static PyObject* __Pyx__PyObject_CallMethod1(PyObject* method, PyObject* arg) {
+    PyObject *result = __Pyx_PyObject_CallOneArg(method, arg);
+    Py_DECREF(method);
+    return result;
+}
+static PyObject* __Pyx_PyObject_CallMethod1(PyObject* obj, PyObject* method_name, PyObject* arg) {
+    PyObject *method = NULL, *result;
+    int is_method = __Pyx_PyObject_GetMethod(obj, method_name, &method);
+    if (likely(is_method)) {
+        result = __Pyx_PyObject_Call2Args(method, obj, arg);
+        Py_DECREF(method);
+        return result;
+    }
+    if (unlikely(!method)) return NULL;
+    return __Pyx__PyObject_CallMethod1(method, arg);
+}
+
+/* append */
+static CYTHON_INLINE int __Pyx_PyObject_Append(PyObject* L, PyObject* x) {
+    if (likely(PyList_CheckExact(L))) {
+        if (unlikely(__Pyx_PyList_Append(L, x) < 0)) return -1;
+    } else {
+        PyObject* retval = __Pyx_PyObject_CallMethod1(L, __pyx_n_s_append, x);
+        if (unlikely(!retval))
+            return -1;
+        Py_DECREF(retval);
+    }
+    return 0;
+}
+
+/* PyIntCompare */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_NeObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, CYTHON_UNUSED long inplace) {
+    if (op1 == op2) {
+        Py_RETURN_FALSE;
+    }
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        const long b = intval;
+        long a = PyInt_AS_LONG(op1);
+        if (a != b) Py_RETURN_TRUE; else Py_RETURN_FALSE;
+    }
+    #endif
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        int unequal;
+        unsigned long uintval;
+        Py_ssize_t size = Py_SIZE(op1);
+        const digit* digits = ((PyLongObject*)op1)->ob_digit;
+        if (intval == 0) {
+            if (size != 0) Py_RETURN_TRUE; else Py_RETURN_FALSE;
+        } else if (intval < 0) {
+            if (size >= 0)
+                Py_RETURN_TRUE;
+            intval = -intval;
+            size = -size;
+        } else {
+            if (size <= 0)
+                Py_RETURN_TRUE;
+        }
+        uintval = (unsigned long) intval;
+#if PyLong_SHIFT * 4 < SIZEOF_LONG*8
+        if (uintval >> (PyLong_SHIFT * 4)) {
+            unequal = (size != 5) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
+                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[2] != ((uintval >> (2 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[3] != ((uintval >> (3 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[4] != ((uintval >> (4 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
+        } else
+#endif
+#if PyLong_SHIFT * 3 < SIZEOF_LONG*8
+        if (uintval >> (PyLong_SHIFT * 3)) {
+            unequal = (size != 4) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
+                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[2] != ((uintval >> (2 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[3] != ((uintval >> (3 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
+        } else
+#endif
+#if PyLong_SHIFT * 2 < SIZEOF_LONG*8
+        if (uintval >> (PyLong_SHIFT * 2)) {
+            unequal = (size != 3) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
+                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[2] != ((uintval >> (2 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
+        } else
+#endif
+#if PyLong_SHIFT * 1 < SIZEOF_LONG*8
+        if (uintval >> (PyLong_SHIFT * 1)) {
+            unequal = (size != 2) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
+                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
+        } else
+#endif
+            unequal = (size != 1) || (((unsigned long) digits[0]) != (uintval & (unsigned long) PyLong_MASK));
+        if (unequal != 0) Py_RETURN_TRUE; else Py_RETURN_FALSE;
+    }
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        const long b = intval;
+        double a = PyFloat_AS_DOUBLE(op1);
+        if ((double)a != (double)b) Py_RETURN_TRUE; else Py_RETURN_FALSE;
+    }
+    return (
+        PyObject_RichCompare(op1, op2, Py_NE));
+}
+
+/* PyIntBinop */
+#if !CYTHON_COMPILING_IN_PYPY
+#if PY_MAJOR_VERSION < 3 || CYTHON_USE_PYLONG_INTERNALS
+#define __Pyx_PyInt_RemainderObjC_ZeroDivisionError(operand)\
+    if (unlikely(zerodivision_check && ((operand) == 0))) {\
+        PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");\
+        return NULL;\
+    }
+#endif
+static PyObject* __Pyx_PyInt_RemainderObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, int inplace, int zerodivision_check) {
+    (void)inplace;
+    (void)zerodivision_check;
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        const long b = intval;
+        long x;
+        long a = PyInt_AS_LONG(op1);
+            __Pyx_PyInt_RemainderObjC_ZeroDivisionError(b)
+            x = a % b;
+            x += ((x != 0) & ((x ^ b) < 0)) * b;
+            return PyInt_FromLong(x);
+    }
+    #endif
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        const long b = intval;
+        long a, x;
+#ifdef HAVE_LONG_LONG
+        const PY_LONG_LONG llb = intval;
+        PY_LONG_LONG lla, llx;
+#endif
+        const digit* digits = ((PyLongObject*)op1)->ob_digit;
+        const Py_ssize_t size = Py_SIZE(op1);
+        if (likely(__Pyx_sst_abs(size) <= 1)) {
+            a = likely(size) ? digits[0] : 0;
+            if (size == -1) a = -a;
+        } else {
+            switch (size) {
+                case -2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                default: return PyLong_Type.tp_as_number->nb_remainder(op1, op2);
+            }
+        }
+                __Pyx_PyInt_RemainderObjC_ZeroDivisionError(b)
+                x = a % b;
+                x += ((x != 0) & ((x ^ b) < 0)) * b;
+            return PyLong_FromLong(x);
+#ifdef HAVE_LONG_LONG
+        long_long:
+                llx = lla % llb;
+                llx += ((llx != 0) & ((llx ^ llb) < 0)) * llb;
+            return PyLong_FromLongLong(llx);
+#endif
+        
+        
+    }
+    #endif
+    return (inplace ? PyNumber_InPlaceRemainder : PyNumber_Remainder)(op1, op2);
+}
+#endif
+
+/* PyIntBinop */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_SubtractObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, int inplace, int zerodivision_check) {
+    (void)inplace;
+    (void)zerodivision_check;
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        const long b = intval;
+        long x;
+        long a = PyInt_AS_LONG(op1);
+            x = (long)((unsigned long)a - b);
+            if (likely((x^a) >= 0 || (x^~b) >= 0))
+                return PyInt_FromLong(x);
+            return PyLong_Type.tp_as_number->nb_subtract(op1, op2);
+    }
+    #endif
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        const long b = intval;
+        long a, x;
+#ifdef HAVE_LONG_LONG
+        const PY_LONG_LONG llb = intval;
+        PY_LONG_LONG lla, llx;
+#endif
+        const digit* digits = ((PyLongObject*)op1)->ob_digit;
+        const Py_ssize_t size = Py_SIZE(op1);
+        if (likely(__Pyx_sst_abs(size) <= 1)) {
+            a = likely(size) ? digits[0] : 0;
+            if (size == -1) a = -a;
+        } else {
+            switch (size) {
+                case -2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                default: return PyLong_Type.tp_as_number->nb_subtract(op1, op2);
+            }
+        }
+                x = a - b;
+            return PyLong_FromLong(x);
+#ifdef HAVE_LONG_LONG
+        long_long:
+                llx = lla - llb;
+            return PyLong_FromLongLong(llx);
+#endif
+        
+        
+    }
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        const long b = intval;
+        double a = PyFloat_AS_DOUBLE(op1);
+            double result;
+            PyFPE_START_PROTECT("subtract", return NULL)
+            result = ((double)a) - (double)b;
+            PyFPE_END_PROTECT(result)
+            return PyFloat_FromDouble(result);
+    }
+    return (inplace ? PyNumber_InPlaceSubtract : PyNumber_Subtract)(op1, op2);
+}
+#endif
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* WriteUnraisableException */
+static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
+                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
+                                  int full_traceback, CYTHON_UNUSED int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+    __Pyx_PyThreadState_declare
+#ifdef WITH_THREAD
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+    else state = (PyGILState_STATE)0;
+#endif
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(1);
+    }
+    #if PY_MAJOR_VERSION < 3
+    ctx = PyString_FromString(name);
+    #else
+    ctx = PyUnicode_FromString(name);
+    #endif
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+#ifdef WITH_THREAD
+    if (nogil)
+        PyGILState_Release(state);
+#endif
+}
+
+/* GetTopmostException */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem *
+__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
+{
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    while ((exc_info->exc_type == NULL || exc_info->exc_type == Py_None) &&
+           exc_info->previous_item != NULL)
+    {
+        exc_info = exc_info->previous_item;
+    }
+    return exc_info;
+}
+#endif
+
+/* SaveResetException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    *type = exc_info->exc_type;
+    *value = exc_info->exc_value;
+    *tb = exc_info->exc_traceback;
+    #else
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    #endif
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+}
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = type;
+    exc_info->exc_value = value;
+    exc_info->exc_traceback = tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+#endif
+
+/* PyErrExceptionMatches */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    PyObject *exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+    if (unlikely(PyTuple_Check(err)))
+        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+}
+#endif
+
+/* GetException */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
+#endif
+{
+    PyObject *local_type, *local_value, *local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    local_type = tstate->curexc_type;
+    local_value = tstate->curexc_value;
+    local_tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#else
+    PyErr_Fetch(&local_type, &local_value, &local_tb);
+#endif
+    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+#if CYTHON_FAST_THREAD_STATE
+    if (unlikely(tstate->curexc_type))
+#else
+    if (unlikely(PyErr_Occurred()))
+#endif
+        goto bad;
+    #if PY_MAJOR_VERSION >= 3
+    if (local_tb) {
+        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+            goto bad;
+    }
+    #endif
+    Py_XINCREF(local_tb);
+    Py_XINCREF(local_type);
+    Py_XINCREF(local_value);
+    *type = local_type;
+    *value = local_value;
+    *tb = local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_USE_EXC_INFO_STACK
+    {
+        _PyErr_StackItem *exc_info = tstate->exc_info;
+        tmp_type = exc_info->exc_type;
+        tmp_value = exc_info->exc_value;
+        tmp_tb = exc_info->exc_traceback;
+        exc_info->exc_type = local_type;
+        exc_info->exc_value = local_value;
+        exc_info->exc_traceback = local_tb;
+    }
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = local_type;
+    tstate->exc_value = local_value;
+    tstate->exc_traceback = local_tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#else
+    PyErr_SetExcInfo(local_type, local_value, local_tb);
+#endif
+    return 0;
+bad:
+    *type = 0;
+    *value = 0;
+    *tb = 0;
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_tb);
+    return -1;
+}
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
+                        CYTHON_UNUSED PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+#endif
+
+/* TypeImport */
+#ifndef __PYX_HAVE_RT_ImportType_0_29_37
+#define __PYX_HAVE_RT_ImportType_0_29_37
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size)
+{
+    PyObject *result = 0;
+    char warning[200];
+    Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
+#ifdef Py_LIMITED_API
+    PyObject *py_basicsize;
+    PyObject *py_itemsize;
+#endif
+    result = PyObject_GetAttrString(module, class_name);
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s.%.200s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+#ifndef Py_LIMITED_API
+    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
+#else
+    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
+    if (!py_basicsize)
+        goto bad;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = 0;
+    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+#endif
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    if (check_size == __Pyx_ImportType_CheckSize_Error_0_29_37 && (size_t)basicsize != size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn_0_29_37 && (size_t)basicsize > size) {
+        PyOS_snprintf(warning, sizeof(warning),
+            "%s.%s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(result);
+    return NULL;
+}
+#endif
+
+/* GetVTable */
+static void* __Pyx_GetVtable(PyObject *dict) {
+    void* ptr;
+    PyObject *ob = PyObject_GetItem(dict, __pyx_n_s_pyx_vtable);
+    if (!ob)
+        goto bad;
+#if PY_VERSION_HEX >= 0x02070000
+    ptr = PyCapsule_GetPointer(ob, 0);
+#else
+    ptr = PyCObject_AsVoidPtr(ob);
+#endif
+    if (!ptr && !PyErr_Occurred())
+        PyErr_SetString(PyExc_RuntimeError, "invalid vtable found for imported type");
+    Py_DECREF(ob);
+    return ptr;
+bad:
+    Py_XDECREF(ob);
+    return NULL;
+}
+
+/* Import */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+    PyObject *empty_list = 0;
+    PyObject *module = 0;
+    PyObject *global_dict = 0;
+    PyObject *empty_dict = 0;
+    PyObject *list;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_import;
+    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
+    if (!py_import)
+        goto bad;
+    #endif
+    if (from_list)
+        list = from_list;
+    else {
+        empty_list = PyList_New(0);
+        if (!empty_list)
+            goto bad;
+        list = empty_list;
+    }
+    global_dict = PyModule_GetDict(__pyx_m);
+    if (!global_dict)
+        goto bad;
+    empty_dict = PyDict_New();
+    if (!empty_dict)
+        goto bad;
+    {
+        #if PY_MAJOR_VERSION >= 3
+        if (level == -1) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
+                module = PyImport_ImportModuleLevelObject(
+                    name, global_dict, empty_dict, list, 1);
+                if (!module) {
+                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
+                        goto bad;
+                    PyErr_Clear();
+                }
+            }
+            level = 0;
+        }
+        #endif
+        if (!module) {
+            #if PY_MAJOR_VERSION < 3
+            PyObject *py_level = PyInt_FromLong(level);
+            if (!py_level)
+                goto bad;
+            module = PyObject_CallFunctionObjArgs(py_import,
+                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
+            Py_DECREF(py_level);
+            #else
+            module = PyImport_ImportModuleLevelObject(
+                name, global_dict, empty_dict, list, level);
+            #endif
+        }
+    }
+bad:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_import);
+    #endif
+    Py_XDECREF(empty_list);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+/* FetchCommonType */
+static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type) {
+    PyObject* fake_module;
+    PyTypeObject* cached_type = NULL;
+    fake_module = PyImport_AddModule((char*) "_cython_" CYTHON_ABI);
+    if (!fake_module) return NULL;
+    Py_INCREF(fake_module);
+    cached_type = (PyTypeObject*) PyObject_GetAttrString(fake_module, type->tp_name);
+    if (cached_type) {
+        if (!PyType_Check((PyObject*)cached_type)) {
+            PyErr_Format(PyExc_TypeError,
+                "Shared Cython type %.200s is not a type object",
+                type->tp_name);
+            goto bad;
+        }
+        if (cached_type->tp_basicsize != type->tp_basicsize) {
+            PyErr_Format(PyExc_TypeError,
+                "Shared Cython type %.200s has the wrong size, try recompiling",
+                type->tp_name);
+            goto bad;
+        }
+    } else {
+        if (!PyErr_ExceptionMatches(PyExc_AttributeError)) goto bad;
+        PyErr_Clear();
+        if (PyType_Ready(type) < 0) goto bad;
+        if (PyObject_SetAttrString(fake_module, type->tp_name, (PyObject*) type) < 0)
+            goto bad;
+        Py_INCREF(type);
+        cached_type = type;
+    }
+done:
+    Py_DECREF(fake_module);
+    return cached_type;
+bad:
+    Py_XDECREF(cached_type);
+    cached_type = NULL;
+    goto done;
+}
+
+/* CythonFunctionShared */
+#include <structmember.h>
+static PyObject *
+__Pyx_CyFunction_get_doc(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *closure)
+{
+    if (unlikely(op->func_doc == NULL)) {
+        if (op->func.m_ml->ml_doc) {
+#if PY_MAJOR_VERSION >= 3
+            op->func_doc = PyUnicode_FromString(op->func.m_ml->ml_doc);
+#else
+            op->func_doc = PyString_FromString(op->func.m_ml->ml_doc);
+#endif
+            if (unlikely(op->func_doc == NULL))
+                return NULL;
+        } else {
+            Py_INCREF(Py_None);
+            return Py_None;
+        }
+    }
+    Py_INCREF(op->func_doc);
+    return op->func_doc;
+}
+static int
+__Pyx_CyFunction_set_doc(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp = op->func_doc;
+    if (value == NULL) {
+        value = Py_None;
+    }
+    Py_INCREF(value);
+    op->func_doc = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_name(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    if (unlikely(op->func_name == NULL)) {
+#if PY_MAJOR_VERSION >= 3
+        op->func_name = PyUnicode_InternFromString(op->func.m_ml->ml_name);
+#else
+        op->func_name = PyString_InternFromString(op->func.m_ml->ml_name);
+#endif
+        if (unlikely(op->func_name == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_name);
+    return op->func_name;
+}
+static int
+__Pyx_CyFunction_set_name(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp;
+#if PY_MAJOR_VERSION >= 3
+    if (unlikely(value == NULL || !PyUnicode_Check(value)))
+#else
+    if (unlikely(value == NULL || !PyString_Check(value)))
+#endif
+    {
+        PyErr_SetString(PyExc_TypeError,
+                        "__name__ must be set to a string object");
+        return -1;
+    }
+    tmp = op->func_name;
+    Py_INCREF(value);
+    op->func_name = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_qualname(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    Py_INCREF(op->func_qualname);
+    return op->func_qualname;
+}
+static int
+__Pyx_CyFunction_set_qualname(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp;
+#if PY_MAJOR_VERSION >= 3
+    if (unlikely(value == NULL || !PyUnicode_Check(value)))
+#else
+    if (unlikely(value == NULL || !PyString_Check(value)))
+#endif
+    {
+        PyErr_SetString(PyExc_TypeError,
+                        "__qualname__ must be set to a string object");
+        return -1;
+    }
+    tmp = op->func_qualname;
+    Py_INCREF(value);
+    op->func_qualname = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_self(__pyx_CyFunctionObject *m, CYTHON_UNUSED void *closure)
+{
+    PyObject *self;
+    self = m->func_closure;
+    if (self == NULL)
+        self = Py_None;
+    Py_INCREF(self);
+    return self;
+}
+static PyObject *
+__Pyx_CyFunction_get_dict(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    if (unlikely(op->func_dict == NULL)) {
+        op->func_dict = PyDict_New();
+        if (unlikely(op->func_dict == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_dict);
+    return op->func_dict;
+}
+static int
+__Pyx_CyFunction_set_dict(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp;
+    if (unlikely(value == NULL)) {
+        PyErr_SetString(PyExc_TypeError,
+               "function's dictionary may not be deleted");
+        return -1;
+    }
+    if (unlikely(!PyDict_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+               "setting function's dictionary to a non-dict");
+        return -1;
+    }
+    tmp = op->func_dict;
+    Py_INCREF(value);
+    op->func_dict = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_globals(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    Py_INCREF(op->func_globals);
+    return op->func_globals;
+}
+static PyObject *
+__Pyx_CyFunction_get_closure(CYTHON_UNUSED __pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+static PyObject *
+__Pyx_CyFunction_get_code(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    PyObject* result = (op->func_code) ? op->func_code : Py_None;
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_init_defaults(__pyx_CyFunctionObject *op) {
+    int result = 0;
+    PyObject *res = op->defaults_getter((PyObject *) op);
+    if (unlikely(!res))
+        return -1;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    op->defaults_tuple = PyTuple_GET_ITEM(res, 0);
+    Py_INCREF(op->defaults_tuple);
+    op->defaults_kwdict = PyTuple_GET_ITEM(res, 1);
+    Py_INCREF(op->defaults_kwdict);
+    #else
+    op->defaults_tuple = PySequence_ITEM(res, 0);
+    if (unlikely(!op->defaults_tuple)) result = -1;
+    else {
+        op->defaults_kwdict = PySequence_ITEM(res, 1);
+        if (unlikely(!op->defaults_kwdict)) result = -1;
+    }
+    #endif
+    Py_DECREF(res);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_defaults(__pyx_CyFunctionObject *op, PyObject* value, CYTHON_UNUSED void *context) {
+    PyObject* tmp;
+    if (!value) {
+        value = Py_None;
+    } else if (value != Py_None && !PyTuple_Check(value)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__defaults__ must be set to a tuple object");
+        return -1;
+    }
+    Py_INCREF(value);
+    tmp = op->defaults_tuple;
+    op->defaults_tuple = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_defaults(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context) {
+    PyObject* result = op->defaults_tuple;
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (__Pyx_CyFunction_init_defaults(op) < 0) return NULL;
+            result = op->defaults_tuple;
+        } else {
+            result = Py_None;
+        }
+    }
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_kwdefaults(__pyx_CyFunctionObject *op, PyObject* value, CYTHON_UNUSED void *context) {
+    PyObject* tmp;
+    if (!value) {
+        value = Py_None;
+    } else if (value != Py_None && !PyDict_Check(value)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__kwdefaults__ must be set to a dict object");
+        return -1;
+    }
+    Py_INCREF(value);
+    tmp = op->defaults_kwdict;
+    op->defaults_kwdict = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_kwdefaults(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context) {
+    PyObject* result = op->defaults_kwdict;
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (__Pyx_CyFunction_init_defaults(op) < 0) return NULL;
+            result = op->defaults_kwdict;
+        } else {
+            result = Py_None;
+        }
+    }
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_annotations(__pyx_CyFunctionObject *op, PyObject* value, CYTHON_UNUSED void *context) {
+    PyObject* tmp;
+    if (!value || value == Py_None) {
+        value = NULL;
+    } else if (!PyDict_Check(value)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__annotations__ must be set to a dict object");
+        return -1;
+    }
+    Py_XINCREF(value);
+    tmp = op->func_annotations;
+    op->func_annotations = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_annotations(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context) {
+    PyObject* result = op->func_annotations;
+    if (unlikely(!result)) {
+        result = PyDict_New();
+        if (unlikely(!result)) return NULL;
+        op->func_annotations = result;
+    }
+    Py_INCREF(result);
+    return result;
+}
+static PyGetSetDef __pyx_CyFunction_getsets[] = {
+    {(char *) "func_doc", (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {(char *) "__doc__",  (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {(char *) "func_name", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {(char *) "__name__", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {(char *) "__qualname__", (getter)__Pyx_CyFunction_get_qualname, (setter)__Pyx_CyFunction_set_qualname, 0, 0},
+    {(char *) "__self__", (getter)__Pyx_CyFunction_get_self, 0, 0, 0},
+    {(char *) "func_dict", (getter)__Pyx_CyFunction_get_dict, (setter)__Pyx_CyFunction_set_dict, 0, 0},
+    {(char *) "__dict__", (getter)__Pyx_CyFunction_get_dict, (setter)__Pyx_CyFunction_set_dict, 0, 0},
+    {(char *) "func_globals", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {(char *) "__globals__", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {(char *) "func_closure", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {(char *) "__closure__", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {(char *) "func_code", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {(char *) "__code__", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {(char *) "func_defaults", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {(char *) "__defaults__", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {(char *) "__kwdefaults__", (getter)__Pyx_CyFunction_get_kwdefaults, (setter)__Pyx_CyFunction_set_kwdefaults, 0, 0},
+    {(char *) "__annotations__", (getter)__Pyx_CyFunction_get_annotations, (setter)__Pyx_CyFunction_set_annotations, 0, 0},
+    {0, 0, 0, 0, 0}
+};
+static PyMemberDef __pyx_CyFunction_members[] = {
+    {(char *) "__module__", T_OBJECT, offsetof(PyCFunctionObject, m_module), PY_WRITE_RESTRICTED, 0},
+    {0, 0, 0,  0, 0}
+};
+static PyObject *
+__Pyx_CyFunction_reduce(__pyx_CyFunctionObject *m, CYTHON_UNUSED PyObject *args)
+{
+#if PY_MAJOR_VERSION >= 3
+    Py_INCREF(m->func_qualname);
+    return m->func_qualname;
+#else
+    return PyString_FromString(m->func.m_ml->ml_name);
+#endif
+}
+static PyMethodDef __pyx_CyFunction_methods[] = {
+    {"__reduce__", (PyCFunction)__Pyx_CyFunction_reduce, METH_VARARGS, 0},
+    {0, 0, 0, 0}
+};
+#if PY_VERSION_HEX < 0x030500A0
+#define __Pyx_CyFunction_weakreflist(cyfunc) ((cyfunc)->func_weakreflist)
+#else
+#define __Pyx_CyFunction_weakreflist(cyfunc) ((cyfunc)->func.m_weakreflist)
+#endif
+static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject *op, PyMethodDef *ml, int flags, PyObject* qualname,
+                                       PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    if (unlikely(op == NULL))
+        return NULL;
+    op->flags = flags;
+    __Pyx_CyFunction_weakreflist(op) = NULL;
+    op->func.m_ml = ml;
+    op->func.m_self = (PyObject *) op;
+    Py_XINCREF(closure);
+    op->func_closure = closure;
+    Py_XINCREF(module);
+    op->func.m_module = module;
+    op->func_dict = NULL;
+    op->func_name = NULL;
+    Py_INCREF(qualname);
+    op->func_qualname = qualname;
+    op->func_doc = NULL;
+    op->func_classobj = NULL;
+    op->func_globals = globals;
+    Py_INCREF(op->func_globals);
+    Py_XINCREF(code);
+    op->func_code = code;
+    op->defaults_pyobjects = 0;
+    op->defaults_size = 0;
+    op->defaults = NULL;
+    op->defaults_tuple = NULL;
+    op->defaults_kwdict = NULL;
+    op->defaults_getter = NULL;
+    op->func_annotations = NULL;
+    return (PyObject *) op;
+}
+static int
+__Pyx_CyFunction_clear(__pyx_CyFunctionObject *m)
+{
+    Py_CLEAR(m->func_closure);
+    Py_CLEAR(m->func.m_module);
+    Py_CLEAR(m->func_dict);
+    Py_CLEAR(m->func_name);
+    Py_CLEAR(m->func_qualname);
+    Py_CLEAR(m->func_doc);
+    Py_CLEAR(m->func_globals);
+    Py_CLEAR(m->func_code);
+    Py_CLEAR(m->func_classobj);
+    Py_CLEAR(m->defaults_tuple);
+    Py_CLEAR(m->defaults_kwdict);
+    Py_CLEAR(m->func_annotations);
+    if (m->defaults) {
+        PyObject **pydefaults = __Pyx_CyFunction_Defaults(PyObject *, m);
+        int i;
+        for (i = 0; i < m->defaults_pyobjects; i++)
+            Py_XDECREF(pydefaults[i]);
+        PyObject_Free(m->defaults);
+        m->defaults = NULL;
+    }
+    return 0;
+}
+static void __Pyx__CyFunction_dealloc(__pyx_CyFunctionObject *m)
+{
+    if (__Pyx_CyFunction_weakreflist(m) != NULL)
+        PyObject_ClearWeakRefs((PyObject *) m);
+    __Pyx_CyFunction_clear(m);
+    PyObject_GC_Del(m);
+}
+static void __Pyx_CyFunction_dealloc(__pyx_CyFunctionObject *m)
+{
+    PyObject_GC_UnTrack(m);
+    __Pyx__CyFunction_dealloc(m);
+}
+static int __Pyx_CyFunction_traverse(__pyx_CyFunctionObject *m, visitproc visit, void *arg)
+{
+    Py_VISIT(m->func_closure);
+    Py_VISIT(m->func.m_module);
+    Py_VISIT(m->func_dict);
+    Py_VISIT(m->func_name);
+    Py_VISIT(m->func_qualname);
+    Py_VISIT(m->func_doc);
+    Py_VISIT(m->func_globals);
+    Py_VISIT(m->func_code);
+    Py_VISIT(m->func_classobj);
+    Py_VISIT(m->defaults_tuple);
+    Py_VISIT(m->defaults_kwdict);
+    if (m->defaults) {
+        PyObject **pydefaults = __Pyx_CyFunction_Defaults(PyObject *, m);
+        int i;
+        for (i = 0; i < m->defaults_pyobjects; i++)
+            Py_VISIT(pydefaults[i]);
+    }
+    return 0;
+}
+static PyObject *__Pyx_CyFunction_descr_get(PyObject *func, PyObject *obj, PyObject *type)
+{
+#if PY_MAJOR_VERSION < 3
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    if (m->flags & __Pyx_CYFUNCTION_STATICMETHOD) {
+        Py_INCREF(func);
+        return func;
+    }
+    if (m->flags & __Pyx_CYFUNCTION_CLASSMETHOD) {
+        if (type == NULL)
+            type = (PyObject *)(Py_TYPE(obj));
+        return __Pyx_PyMethod_New(func, type, (PyObject *)(Py_TYPE(type)));
+    }
+    if (obj == Py_None)
+        obj = NULL;
+#endif
+    return __Pyx_PyMethod_New(func, obj, type);
+}
+static PyObject*
+__Pyx_CyFunction_repr(__pyx_CyFunctionObject *op)
+{
+#if PY_MAJOR_VERSION >= 3
+    return PyUnicode_FromFormat("<cyfunction %U at %p>",
+                                op->func_qualname, (void *)op);
+#else
+    return PyString_FromFormat("<cyfunction %s at %p>",
+                               PyString_AsString(op->func_qualname), (void *)op);
+#endif
+}
+static PyObject * __Pyx_CyFunction_CallMethod(PyObject *func, PyObject *self, PyObject *arg, PyObject *kw) {
+    PyCFunctionObject* f = (PyCFunctionObject*)func;
+    PyCFunction meth = f->m_ml->ml_meth;
+    Py_ssize_t size;
+    switch (f->m_ml->ml_flags & (METH_VARARGS | METH_KEYWORDS | METH_NOARGS | METH_O)) {
+    case METH_VARARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0))
+            return (*meth)(self, arg);
+        break;
+    case METH_VARARGS | METH_KEYWORDS:
+        return (*(PyCFunctionWithKeywords)(void*)meth)(self, arg, kw);
+    case METH_NOARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+            size = PyTuple_GET_SIZE(arg);
+            if (likely(size == 0))
+                return (*meth)(self, NULL);
+            PyErr_Format(PyExc_TypeError,
+                "%.200s() takes no arguments (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                f->m_ml->ml_name, size);
+            return NULL;
+        }
+        break;
+    case METH_O:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+            size = PyTuple_GET_SIZE(arg);
+            if (likely(size == 1)) {
+                PyObject *result, *arg0;
+                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                arg0 = PyTuple_GET_ITEM(arg, 0);
+                #else
+                arg0 = PySequence_ITEM(arg, 0); if (unlikely(!arg0)) return NULL;
+                #endif
+                result = (*meth)(self, arg0);
+                #if !(CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS)
+                Py_DECREF(arg0);
+                #endif
+                return result;
+            }
+            PyErr_Format(PyExc_TypeError,
+                "%.200s() takes exactly one argument (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                f->m_ml->ml_name, size);
+            return NULL;
+        }
+        break;
+    default:
+        PyErr_SetString(PyExc_SystemError, "Bad call flags in "
+                        "__Pyx_CyFunction_Call. METH_OLDARGS is no "
+                        "longer supported!");
+        return NULL;
+    }
+    PyErr_Format(PyExc_TypeError, "%.200s() takes no keyword arguments",
+                 f->m_ml->ml_name);
+    return NULL;
+}
+static CYTHON_INLINE PyObject *__Pyx_CyFunction_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    return __Pyx_CyFunction_CallMethod(func, ((PyCFunctionObject*)func)->m_self, arg, kw);
+}
+static PyObject *__Pyx_CyFunction_CallAsMethod(PyObject *func, PyObject *args, PyObject *kw) {
+    PyObject *result;
+    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *) func;
+    if ((cyfunc->flags & __Pyx_CYFUNCTION_CCLASS) && !(cyfunc->flags & __Pyx_CYFUNCTION_STATICMETHOD)) {
+        Py_ssize_t argc;
+        PyObject *new_args;
+        PyObject *self;
+        argc = PyTuple_GET_SIZE(args);
+        new_args = PyTuple_GetSlice(args, 1, argc);
+        if (unlikely(!new_args))
+            return NULL;
+        self = PyTuple_GetItem(args, 0);
+        if (unlikely(!self)) {
+            Py_DECREF(new_args);
+#if PY_MAJOR_VERSION > 2
+            PyErr_Format(PyExc_TypeError,
+                         "unbound method %.200S() needs an argument",
+                         cyfunc->func_qualname);
+#else
+            PyErr_SetString(PyExc_TypeError,
+                            "unbound method needs an argument");
+#endif
+            return NULL;
+        }
+        result = __Pyx_CyFunction_CallMethod(func, self, new_args, kw);
+        Py_DECREF(new_args);
+    } else {
+        result = __Pyx_CyFunction_Call(func, args, kw);
+    }
+    return result;
+}
+static PyTypeObject __pyx_CyFunctionType_type = {
+    PyVarObject_HEAD_INIT(0, 0)
+    "cython_function_or_method",
+    sizeof(__pyx_CyFunctionObject),
+    0,
+    (destructor) __Pyx_CyFunction_dealloc,
+    0,
+    0,
+    0,
+#if PY_MAJOR_VERSION < 3
+    0,
+#else
+    0,
+#endif
+    (reprfunc) __Pyx_CyFunction_repr,
+    0,
+    0,
+    0,
+    0,
+    __Pyx_CyFunction_CallAsMethod,
+    0,
+    0,
+    0,
+    0,
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,
+    0,
+    (traverseproc) __Pyx_CyFunction_traverse,
+    (inquiry) __Pyx_CyFunction_clear,
+    0,
+#if PY_VERSION_HEX < 0x030500A0
+    offsetof(__pyx_CyFunctionObject, func_weakreflist),
+#else
+    offsetof(PyCFunctionObject, m_weakreflist),
+#endif
+    0,
+    0,
+    __pyx_CyFunction_methods,
+    __pyx_CyFunction_members,
+    __pyx_CyFunction_getsets,
+    0,
+    0,
+    __Pyx_CyFunction_descr_get,
+    0,
+    offsetof(__pyx_CyFunctionObject, func_dict),
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+#if PY_VERSION_HEX >= 0x030400a1
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030C0000
+    0,
+#endif
+#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+    0,
+#endif
+};
+static int __pyx_CyFunction_init(void) {
+    __pyx_CyFunctionType = __Pyx_FetchCommonType(&__pyx_CyFunctionType_type);
+    if (unlikely(__pyx_CyFunctionType == NULL)) {
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_INLINE void *__Pyx_CyFunction_InitDefaults(PyObject *func, size_t size, int pyobjects) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults = PyObject_Malloc(size);
+    if (unlikely(!m->defaults))
+        return PyErr_NoMemory();
+    memset(m->defaults, 0, size);
+    m->defaults_pyobjects = pyobjects;
+    m->defaults_size = size;
+    return m->defaults;
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *func, PyObject *tuple) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults_tuple = tuple;
+    Py_INCREF(tuple);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults_kwdict = dict;
+    Py_INCREF(dict);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->func_annotations = dict;
+    Py_INCREF(dict);
+}
+
+/* CythonFunction */
+static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml, int flags, PyObject* qualname,
+                                      PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    PyObject *op = __Pyx_CyFunction_Init(
+        PyObject_GC_New(__pyx_CyFunctionObject, __pyx_CyFunctionType),
+        ml, flags, qualname, closure, module, globals, code
+    );
+    if (likely(op)) {
+        PyObject_GC_Track(op);
+    }
+    return op;
+}
+
+/* CLineInTraceback */
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
+    }
+    if (!use_cline) {
+        c_line = 0;
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+    }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
+    }
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
+    }
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
+}
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
+    py_srcfile = PyString_FromString(filename);
+    if (!py_srcfile) goto bad;
+    #endif
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        if (!py_funcname) goto bad;
+        #endif
+    }
+    #if PY_MAJOR_VERSION < 3
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+
+/* Declarations */
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
+      return ::std::complex< float >(x, y);
+    }
+  #else
+    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
+      return x + y*(__pyx_t_float_complex)_Complex_I;
+    }
+  #endif
+#else
+    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
+      __pyx_t_float_complex z;
+      z.real = x;
+      z.imag = y;
+      return z;
+    }
+#endif
+
+/* Arithmetic */
+#if CYTHON_CCOMPLEX
+#else
+    static CYTHON_INLINE int __Pyx_c_eq_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+       return (a.real == b.real) && (a.imag == b.imag);
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_sum_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        __pyx_t_float_complex z;
+        z.real = a.real + b.real;
+        z.imag = a.imag + b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_diff_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        __pyx_t_float_complex z;
+        z.real = a.real - b.real;
+        z.imag = a.imag - b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_prod_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        __pyx_t_float_complex z;
+        z.real = a.real * b.real - a.imag * b.imag;
+        z.imag = a.real * b.imag + a.imag * b.real;
+        return z;
+    }
+    #if 1
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_quot_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        if (b.imag == 0) {
+            return __pyx_t_float_complex_from_parts(a.real / b.real, a.imag / b.real);
+        } else if (fabsf(b.real) >= fabsf(b.imag)) {
+            if (b.real == 0 && b.imag == 0) {
+                return __pyx_t_float_complex_from_parts(a.real / b.real, a.imag / b.imag);
+            } else {
+                float r = b.imag / b.real;
+                float s = (float)(1.0) / (b.real + b.imag * r);
+                return __pyx_t_float_complex_from_parts(
+                    (a.real + a.imag * r) * s, (a.imag - a.real * r) * s);
+            }
+        } else {
+            float r = b.real / b.imag;
+            float s = (float)(1.0) / (b.imag + b.real * r);
+            return __pyx_t_float_complex_from_parts(
+                (a.real * r + a.imag) * s, (a.imag * r - a.real) * s);
+        }
+    }
+    #else
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_quot_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        if (b.imag == 0) {
+            return __pyx_t_float_complex_from_parts(a.real / b.real, a.imag / b.real);
+        } else {
+            float denom = b.real * b.real + b.imag * b.imag;
+            return __pyx_t_float_complex_from_parts(
+                (a.real * b.real + a.imag * b.imag) / denom,
+                (a.imag * b.real - a.real * b.imag) / denom);
+        }
+    }
+    #endif
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_neg_float(__pyx_t_float_complex a) {
+        __pyx_t_float_complex z;
+        z.real = -a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    static CYTHON_INLINE int __Pyx_c_is_zero_float(__pyx_t_float_complex a) {
+       return (a.real == 0) && (a.imag == 0);
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_conj_float(__pyx_t_float_complex a) {
+        __pyx_t_float_complex z;
+        z.real =  a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    #if 1
+        static CYTHON_INLINE float __Pyx_c_abs_float(__pyx_t_float_complex z) {
+          #if !defined(HAVE_HYPOT) || defined(_MSC_VER)
+            return sqrtf(z.real*z.real + z.imag*z.imag);
+          #else
+            return hypotf(z.real, z.imag);
+          #endif
+        }
+        static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_pow_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+            __pyx_t_float_complex z;
+            float r, lnr, theta, z_r, z_theta;
+            if (b.imag == 0 && b.real == (int)b.real) {
+                if (b.real < 0) {
+                    float denom = a.real * a.real + a.imag * a.imag;
+                    a.real = a.real / denom;
+                    a.imag = -a.imag / denom;
+                    b.real = -b.real;
+                }
+                switch ((int)b.real) {
+                    case 0:
+                        z.real = 1;
+                        z.imag = 0;
+                        return z;
+                    case 1:
+                        return a;
+                    case 2:
+                        return __Pyx_c_prod_float(a, a);
+                    case 3:
+                        z = __Pyx_c_prod_float(a, a);
+                        return __Pyx_c_prod_float(z, a);
+                    case 4:
+                        z = __Pyx_c_prod_float(a, a);
+                        return __Pyx_c_prod_float(z, z);
+                }
+            }
+            if (a.imag == 0) {
+                if (a.real == 0) {
+                    return a;
+                } else if ((b.imag == 0) && (a.real >= 0)) {
+                    z.real = powf(a.real, b.real);
+                    z.imag = 0;
+                    return z;
+                } else if (a.real > 0) {
+                    r = a.real;
+                    theta = 0;
+                } else {
+                    r = -a.real;
+                    theta = atan2f(0.0, -1.0);
+                }
+            } else {
+                r = __Pyx_c_abs_float(a);
+                theta = atan2f(a.imag, a.real);
+            }
+            lnr = logf(r);
+            z_r = expf(lnr * b.real - theta * b.imag);
+            z_theta = theta * b.real + lnr * b.imag;
+            z.real = z_r * cosf(z_theta);
+            z.imag = z_r * sinf(z_theta);
+            return z;
+        }
+    #endif
+#endif
+
+/* Declarations */
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
+      return ::std::complex< double >(x, y);
+    }
+  #else
+    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
+      return x + y*(__pyx_t_double_complex)_Complex_I;
+    }
+  #endif
+#else
+    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
+      __pyx_t_double_complex z;
+      z.real = x;
+      z.imag = y;
+      return z;
+    }
+#endif
+
+/* Arithmetic */
+#if CYTHON_CCOMPLEX
+#else
+    static CYTHON_INLINE int __Pyx_c_eq_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+       return (a.real == b.real) && (a.imag == b.imag);
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_sum_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        __pyx_t_double_complex z;
+        z.real = a.real + b.real;
+        z.imag = a.imag + b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_diff_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        __pyx_t_double_complex z;
+        z.real = a.real - b.real;
+        z.imag = a.imag - b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_prod_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        __pyx_t_double_complex z;
+        z.real = a.real * b.real - a.imag * b.imag;
+        z.imag = a.real * b.imag + a.imag * b.real;
+        return z;
+    }
+    #if 1
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_quot_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        if (b.imag == 0) {
+            return __pyx_t_double_complex_from_parts(a.real / b.real, a.imag / b.real);
+        } else if (fabs(b.real) >= fabs(b.imag)) {
+            if (b.real == 0 && b.imag == 0) {
+                return __pyx_t_double_complex_from_parts(a.real / b.real, a.imag / b.imag);
+            } else {
+                double r = b.imag / b.real;
+                double s = (double)(1.0) / (b.real + b.imag * r);
+                return __pyx_t_double_complex_from_parts(
+                    (a.real + a.imag * r) * s, (a.imag - a.real * r) * s);
+            }
+        } else {
+            double r = b.real / b.imag;
+            double s = (double)(1.0) / (b.imag + b.real * r);
+            return __pyx_t_double_complex_from_parts(
+                (a.real * r + a.imag) * s, (a.imag * r - a.real) * s);
+        }
+    }
+    #else
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_quot_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        if (b.imag == 0) {
+            return __pyx_t_double_complex_from_parts(a.real / b.real, a.imag / b.real);
+        } else {
+            double denom = b.real * b.real + b.imag * b.imag;
+            return __pyx_t_double_complex_from_parts(
+                (a.real * b.real + a.imag * b.imag) / denom,
+                (a.imag * b.real - a.real * b.imag) / denom);
+        }
+    }
+    #endif
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_neg_double(__pyx_t_double_complex a) {
+        __pyx_t_double_complex z;
+        z.real = -a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    static CYTHON_INLINE int __Pyx_c_is_zero_double(__pyx_t_double_complex a) {
+       return (a.real == 0) && (a.imag == 0);
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_conj_double(__pyx_t_double_complex a) {
+        __pyx_t_double_complex z;
+        z.real =  a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    #if 1
+        static CYTHON_INLINE double __Pyx_c_abs_double(__pyx_t_double_complex z) {
+          #if !defined(HAVE_HYPOT) || defined(_MSC_VER)
+            return sqrt(z.real*z.real + z.imag*z.imag);
+          #else
+            return hypot(z.real, z.imag);
+          #endif
+        }
+        static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_pow_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+            __pyx_t_double_complex z;
+            double r, lnr, theta, z_r, z_theta;
+            if (b.imag == 0 && b.real == (int)b.real) {
+                if (b.real < 0) {
+                    double denom = a.real * a.real + a.imag * a.imag;
+                    a.real = a.real / denom;
+                    a.imag = -a.imag / denom;
+                    b.real = -b.real;
+                }
+                switch ((int)b.real) {
+                    case 0:
+                        z.real = 1;
+                        z.imag = 0;
+                        return z;
+                    case 1:
+                        return a;
+                    case 2:
+                        return __Pyx_c_prod_double(a, a);
+                    case 3:
+                        z = __Pyx_c_prod_double(a, a);
+                        return __Pyx_c_prod_double(z, a);
+                    case 4:
+                        z = __Pyx_c_prod_double(a, a);
+                        return __Pyx_c_prod_double(z, z);
+                }
+            }
+            if (a.imag == 0) {
+                if (a.real == 0) {
+                    return a;
+                } else if ((b.imag == 0) && (a.real >= 0)) {
+                    z.real = pow(a.real, b.real);
+                    z.imag = 0;
+                    return z;
+                } else if (a.real > 0) {
+                    r = a.real;
+                    theta = 0;
+                } else {
+                    r = -a.real;
+                    theta = atan2(0.0, -1.0);
+                }
+            } else {
+                r = __Pyx_c_abs_double(a);
+                theta = atan2(a.imag, a.real);
+            }
+            lnr = log(r);
+            z_r = exp(lnr * b.real - theta * b.imag);
+            z_theta = theta * b.real + lnr * b.imag;
+            z.real = z_r * cos(z_theta);
+            z.imag = z_r * sin(z_theta);
+            return z;
+        }
+    #endif
+#endif
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            long val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (long) -1;
+        }
+    } else {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = a->tp_base;
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
+        }
+    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
+}
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    int res = exc_type1 ? __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type1) : 0;
+    if (!res) {
+        res = __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+    return res;
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
+        char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
+        PyOS_snprintf(message, sizeof(message),
+                      "compiletime version %s of module '%.100s' "
+                      "does not match runtime version %s",
+                      ctversion, __Pyx_MODULE_NAME, rtversion);
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+    return 0;
+}
+
+/* FunctionExport */
+static int __Pyx_ExportFunction(const char *name, void (*f)(void), const char *sig) {
+    PyObject *d = 0;
+    PyObject *cobj = 0;
+    union {
+        void (*fp)(void);
+        void *p;
+    } tmp;
+    d = PyObject_GetAttrString(__pyx_m, (char *)"__pyx_capi__");
+    if (!d) {
+        PyErr_Clear();
+        d = PyDict_New();
+        if (!d)
+            goto bad;
+        Py_INCREF(d);
+        if (PyModule_AddObject(__pyx_m, (char *)"__pyx_capi__", d) < 0)
+            goto bad;
+    }
+    tmp.fp = f;
+#if PY_VERSION_HEX >= 0x02070000
+    cobj = PyCapsule_New(tmp.p, sig, 0);
+#else
+    cobj = PyCObject_FromVoidPtrAndDesc(tmp.p, (void *)sig, 0);
+#endif
+    if (!cobj)
+        goto bad;
+    if (PyDict_SetItemString(d, name, cobj) < 0)
+        goto bad;
+    Py_DECREF(cobj);
+    Py_DECREF(d);
+    return 0;
+bad:
+    Py_XDECREF(cobj);
+    Py_XDECREF(d);
+    return -1;
+}
+
+/* VoidPtrImport */
+#ifndef __PYX_HAVE_RT_ImportVoidPtr_0_29_37
+#define __PYX_HAVE_RT_ImportVoidPtr_0_29_37
+static int __Pyx_ImportVoidPtr_0_29_37(PyObject *module, const char *name, void **p, const char *sig) {
+    PyObject *d = 0;
+    PyObject *cobj = 0;
+    d = PyObject_GetAttrString(module, (char *)"__pyx_capi__");
+    if (!d)
+        goto bad;
+    cobj = PyDict_GetItemString(d, name);
+    if (!cobj) {
+        PyErr_Format(PyExc_ImportError,
+            "%.200s does not export expected C variable %.200s",
+                PyModule_GetName(module), name);
+        goto bad;
+    }
+#if PY_VERSION_HEX >= 0x02070000
+    if (!PyCapsule_IsValid(cobj, sig)) {
+        PyErr_Format(PyExc_TypeError,
+            "C variable %.200s.%.200s has wrong signature (expected %.500s, got %.500s)",
+             PyModule_GetName(module), name, sig, PyCapsule_GetName(cobj));
+        goto bad;
+    }
+    *p = PyCapsule_GetPointer(cobj, sig);
+#else
+    {const char *desc, *s1, *s2;
+    desc = (const char *)PyCObject_GetDesc(cobj);
+    if (!desc)
+        goto bad;
+    s1 = desc; s2 = sig;
+    while (*s1 != '\0' && *s1 == *s2) { s1++; s2++; }
+    if (*s1 != *s2) {
+        PyErr_Format(PyExc_TypeError,
+            "C variable %.200s.%.200s has wrong signature (expected %.500s, got %.500s)",
+             PyModule_GetName(module), name, sig, desc);
+        goto bad;
+    }
+    *p = PyCObject_AsVoidPtr(cobj);}
+#endif
+    if (!(*p))
+        goto bad;
+    Py_DECREF(d);
+    return 0;
+bad:
+    Py_XDECREF(d);
+    return -1;
+}
+#endif
+
+/* InitStrings */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+    while (t->p) {
+        #if PY_MAJOR_VERSION < 3
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        #else
+        if (t->is_unicode | t->is_str) {
+            if (t->intern) {
+                *t->p = PyUnicode_InternFromString(t->s);
+            } else if (t->encoding) {
+                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
+            } else {
+                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
+            }
+        } else {
+            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
+        }
+        #endif
+        if (!*t->p)
+            return -1;
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
+        ++t;
+    }
+    return 0;
+}
+
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
+            }
+        }
+    }
+#endif
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
+#else
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
+#endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    if (PyByteArray_Check(o)) {
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+    } else
+#endif
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type %.200s).  "
+                "The ability to return an instance of a strict subclass of int "
+                "is deprecated, and may be removed in a future version of Python.",
+                Py_TYPE(result)->tp_name)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type %.200s)",
+                 type_name, type_name, Py_TYPE(result)->tp_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
+#else
+  if (likely(PyLong_Check(x)))
+#endif
+    return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  #if PY_MAJOR_VERSION < 3
+  if (m && m->nb_int) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = m->nb_long(x);
+  }
+  #else
+  if (likely(m && m->nb_int)) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
+  }
+#endif
+  if (likely(res)) {
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
+#else
+    if (unlikely(!PyLong_CheckExact(res))) {
+#endif
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(b);
+  }
+#endif
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    const digit* digits = ((PyLongObject*)b)->ob_digit;
+    const Py_ssize_t size = Py_SIZE(b);
+    if (likely(__Pyx_sst_abs(size) <= 1)) {
+        ival = likely(size) ? digits[0] : 0;
+        if (size == -1) ival = -ival;
+        return ival;
+    } else {
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+    return PyInt_FromSize_t(ival);
+}
+
+
+#endif /* Py_PYTHON_H */